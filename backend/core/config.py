@@ -41,11 +41,42 @@ class Settings(BaseSettings):
     # Search settings
     number_of_results: Annotated[int, Field(default=10, alias="NUMBER_OF_RESULTS")]
     runtime_eval: Annotated[bool, Field(default=False, alias="RUNTIME_EVAL")]
+    # Runtime evaluation runs off the request path; judge prompts are micro-batched across searches
+    evaluation_batch_size: Annotated[int, Field(default=8, alias="EVALUATION_BATCH_SIZE")]  # Searches per judge batch
+    evaluation_batch_wait_ms: Annotated[
+        int, Field(default=200, alias="EVALUATION_BATCH_WAIT_MS")
+    ]  # Max batch fill wait
+    evaluation_queue_size: Annotated[int, Field(default=1000, alias="EVALUATION_QUEUE_SIZE")]  # Pending searches
 
     # Core data settings
     data_dir: Annotated[str | None, Field(default=None, alias="DATA_DIR")]
     vector_db: Annotated[str, Field(default="milvus", alias="VECTOR_DB")]
     collection_name: Annotated[str | None, Field(default=None, alias="COLLECTION_NAME")]
+    # Materialized collection chunk stats are checked against the vector store periodically (0 disables)
+    collection_stats_reconcile_interval_seconds: Annotated[
+        int, Field(default=21600, alias="COLLECTION_STATS_RECONCILE_INTERVAL_SECONDS")
+    ]
+    # Collection access cache (in-process, invalidated per collection on membership/status/privacy changes)
+    collection_access_cache_enabled: Annotated[bool, Field(default=True, alias="COLLECTION_ACCESS_CACHE_ENABLED")]
+    collection_access_cache_max_entries: Annotated[
+        int, Field(default=10000, alias="COLLECTION_ACCESS_CACHE_MAX_ENTRIES")
+    ]
+    collection_access_cache_ttl_seconds: Annotated[
+        float, Field(default=30.0, alias="COLLECTION_ACCESS_CACHE_TTL_SECONDS")
+    ]  # Bounds staleness when another worker changes membership, status or privacy
+    # Configuration cache (providers, models, pipelines, templates, LLM parameters), shared across requests
+    config_cache_enabled: Annotated[bool, Field(default=True, alias="CONFIG_CACHE_ENABLED")]
+    config_cache_max_entries: Annotated[int, Field(default=4096, alias="CONFIG_CACHE_MAX_ENTRIES")]
+    config_cache_ttl_seconds: Annotated[
+        float, Field(default=60.0, alias="CONFIG_CACHE_TTL_SECONDS")
+    ]  # Bounds staleness if an invalidation notification from another worker is missed
+    config_cache_notify_enabled: Annotated[bool, Field(default=True, alias="CONFIG_CACHE_NOTIFY_ENABLED")]
+    config_cache_notify_channel: Annotated[str, Field(default="rag_config_cache", alias="CONFIG_CACHE_NOTIFY_CHANNEL")]
+    # WebSocket connection hub (per-connection send queues, cross-worker backplane: none, postgres or module:Class)
+    websocket_send_queue_size: Annotated[int, Field(default=100, alias="WEBSOCKET_SEND_QUEUE_SIZE")]
+    websocket_send_timeout_seconds: Annotated[float, Field(default=10.0, alias="WEBSOCKET_SEND_TIMEOUT_SECONDS")]
+    websocket_backplane: Annotated[str, Field(default="postgres", alias="WEBSOCKET_BACKPLANE")]
+    websocket_backplane_channel: Annotated[str, Field(default="rag_websocket", alias="WEBSOCKET_BACKPLANE_CHANNEL")]
 
     # LLM Provider selection and credentials
     llm_provider: Annotated[str, Field(default="watsonx", alias="LLM_PROVIDER")]  # Options: watsonx, openai, anthropic
@@ -81,7 +112,7 @@ class Settings(BaseSettings):
     hierarchical_children_per_parent: Annotated[int, Field(default=5, alias="HIERARCHICAL_CHILDREN_PER_PARENT")]
     hierarchical_retrieval_mode: Annotated[
         str, Field(default="child_with_parent", alias="HIERARCHICAL_RETRIEVAL_MODE")
-    ]  # Options: child_only, child_with_parent, full_hierarchy
+    ]  # Options: child_only, child_with_parent, parent_only, full_hierarchy
 
     # IBM Docling Feature Flags
     enable_docling: Annotated[bool, Field(default=False, alias="ENABLE_DOCLING")]
@@ -122,7 +153,16 @@ class Settings(BaseSettings):
     ]  # Increased from 0.5 to 1.0
     embedding_request_delay: Annotated[
         float, Field(default=0.5, alias="EMBEDDING_REQUEST_DELAY")
-    ]  # Increased from 0.2 to 0.5
+    ]  # Average spacing between requests (token bucket refill rate = 1 / delay)
+    embedding_rate_limit_burst: Annotated[
+        int, Field(default=4, alias="EMBEDDING_RATE_LIMIT_BURST")
+    ]  # Requests allowed back-to-back before pacing kicks in
+    embedding_micro_batch_enabled: Annotated[
+        bool, Field(default=True, alias="EMBEDDING_MICRO_BATCH_ENABLED")
+    ]  # Share one provider call between concurrent query embeddings
+    embedding_micro_batch_wait_ms: Annotated[
+        float, Field(default=5.0, alias="EMBEDDING_MICRO_BATCH_WAIT_MS")
+    ]  # How long a request waits for others to join its batch
 
     # LLM configuration - using WatsonX SDK native parameters
     llm_max_retries: Annotated[int, Field(default=10, alias="LLM_MAX_RETRIES")]
@@ -132,12 +172,40 @@ class Settings(BaseSettings):
     max_new_tokens: Annotated[int, Field(default=1024, alias="MAX_NEW_TOKENS")]
     min_new_tokens: Annotated[int, Field(default=100, alias="MIN_NEW_TOKENS")]
     max_context_length: Annotated[int, Field(default=2048, alias="MAX_CONTEXT_LENGTH")]  # Total context window
+    context_packing_enabled: Annotated[
+        bool, Field(default=False, alias="CONTEXT_PACKING_ENABLED")
+    ]  # Pack retrieved chunks into the token budget left by the prompt and the answer (size MAX_CONTEXT_LENGTH first)
+    context_prompt_reserve_tokens: Annotated[
+        int, Field(default=256, alias="CONTEXT_PROMPT_RESERVE_TOKENS")
+    ]  # Tokens reserved for the template and question when packing context
     random_seed: Annotated[int, Field(default=50, alias="RANDOM_SEED")]
     top_k: Annotated[int, Field(default=5, alias="TOP_K")]
     top_p: Annotated[float, Field(default=0.95, alias="TOP_P")]
     temperature: Annotated[float, Field(default=0.7, alias="TEMPERATURE")]
     repetition_penalty: Annotated[float, Field(default=1.1, alias="REPETITION_PENALTY")]
-    llm_concurrency: Annotated[int, Field(default=8, alias="LLM_CONCURRENCY")]
+    llm_concurrency: Annotated[
+        int, Field(default=8, alias="LLM_CONCURRENCY")
+    ]  # Upper bound of the adaptive per-provider concurrency limit
+    llm_min_concurrency: Annotated[int, Field(default=1, alias="LLM_MIN_CONCURRENCY")]
+    llm_requests_per_minute: Annotated[
+        int, Field(default=0, alias="LLM_REQUESTS_PER_MINUTE")
+    ]  # Per-provider request budget, 0 disables
+    llm_tokens_per_minute: Annotated[
+        int, Field(default=0, alias="LLM_TOKENS_PER_MINUTE")
+    ]  # Per-provider token budget (prompt + max completion), 0 disables
+    llm_target_latency_seconds: Annotated[
+        float, Field(default=120.0, alias="LLM_TARGET_LATENCY_SECONDS")
+    ]  # Slower calls shrink the concurrency limit, 0 disables
+    llm_client_health_check_seconds: Annotated[
+        float, Field(default=300.0, alias="LLM_CLIENT_HEALTH_CHECK_SECONDS")
+    ]  # How often pooled provider SDK clients are health-checked before reuse
+    # LLM usage accounting (bounded in-process counters, flushed to llm_usage_totals in batches)
+    llm_usage_accounting_enabled: Annotated[bool, Field(default=True, alias="LLM_USAGE_ACCOUNTING_ENABLED")]
+    llm_usage_max_keys: Annotated[int, Field(default=10000, alias="LLM_USAGE_MAX_KEYS")]
+    llm_usage_recent_events: Annotated[int, Field(default=1000, alias="LLM_USAGE_RECENT_EVENTS")]
+    llm_usage_flush_interval_seconds: Annotated[
+        float, Field(default=10.0, alias="LLM_USAGE_FLUSH_INTERVAL_SECONDS")
+    ]  # 0 disables persistence of usage totals
 
     # Query Rewriting settings
     use_simple_rewriter: Annotated[bool, Field(default=True, alias="USE_SIMPLE_REWRITER")]
@@ -154,9 +222,36 @@ class Settings(BaseSettings):
     # Generation settings
     generation_top_k: Annotated[int, Field(default=5, alias="GENERATION_TOP_K")]  # Number of sources to display
 
+    # Retrieval cache settings (in-process, invalidated per collection on ingest/delete)
+    retrieval_cache_enabled: Annotated[bool, Field(default=True, alias="RETRIEVAL_CACHE_ENABLED")]
+    retrieval_cache_max_results: Annotated[int, Field(default=1024, alias="RETRIEVAL_CACHE_MAX_RESULTS")]
+    retrieval_cache_max_chunks: Annotated[int, Field(default=16384, alias="RETRIEVAL_CACHE_MAX_CHUNKS")]
+    retrieval_cache_ttl_seconds: Annotated[
+        float, Field(default=300.0, alias="RETRIEVAL_CACHE_TTL_SECONDS")
+    ]  # Bounds staleness when another worker modifies the collection
+
+    # Speculative retrieval: retrieve with the cleaned question while the query rewriter runs
+    speculative_retrieval_enabled: Annotated[bool, Field(default=False, alias="SPECULATIVE_RETRIEVAL_ENABLED")]
+    speculative_retrieval_similarity: Annotated[
+        float, Field(default=0.9, alias="SPECULATIVE_RETRIEVAL_SIMILARITY")
+    ]  # Min query embedding cosine to reuse the speculative results without a second retrieval
+
+    # Diversity settings (near-duplicate removal and MMR between retrieval and reranking)
+    diversity_enabled: Annotated[
+        bool, Field(default=False, alias="DIVERSITY_ENABLED")
+    ]  # Opt-in: enabling it also makes Milvus searches return stored vectors
+    diversity_mmr_lambda: Annotated[
+        float, Field(default=0.7, alias="DIVERSITY_MMR_LAMBDA")
+    ]  # 1.0 = pure relevance, 0.0 = pure diversity
+    diversity_duplicate_distance: Annotated[
+        int, Field(default=3, alias="DIVERSITY_DUPLICATE_DISTANCE")
+    ]  # Max SimHash Hamming distance (of 64 bits) between near-duplicate chunks
+
     # Reranking settings
     enable_reranking: Annotated[bool, Field(default=True, alias="ENABLE_RERANKING")]
-    reranker_type: Annotated[str, Field(default="llm", alias="RERANKER_TYPE")]  # Options: llm, simple, cross-encoder
+    reranker_type: Annotated[
+        str, Field(default="cross-encoder", alias="RERANKER_TYPE")
+    ]  # Options: llm, simple, cross-encoder
     reranker_top_k: Annotated[
         int | None, Field(default=5, alias="RERANKER_TOP_K")
     ]  # Number of top results to return after reranking
@@ -169,6 +264,24 @@ class Settings(BaseSettings):
     cross_encoder_model: Annotated[
         str, Field(default="cross-encoder/ms-marco-MiniLM-L-6-v2", alias="CROSS_ENCODER_MODEL")
     ]  # Fast cross-encoder for reranking
+    cross_encoder_max_length: Annotated[
+        int, Field(default=512, alias="CROSS_ENCODER_MAX_LENGTH")
+    ]  # Token budget per query-document pair
+    cross_encoder_quantize: Annotated[
+        bool, Field(default=True, alias="CROSS_ENCODER_QUANTIZE")
+    ]  # int8 CPU inference (ONNX if available, else PyTorch dynamic quantization)
+    cross_encoder_onnx_file: Annotated[
+        str, Field(default="onnx/model_quint8_avx2.onnx", alias="CROSS_ENCODER_ONNX_FILE")
+    ]  # Quantized ONNX export inside the model repository
+    cross_encoder_score_cache_size: Annotated[
+        int, Field(default=10000, alias="CROSS_ENCODER_SCORE_CACHE_SIZE")
+    ]  # Cached (query, chunk) scores, 0 disables
+    cross_encoder_max_batch_pairs: Annotated[
+        int, Field(default=256, alias="CROSS_ENCODER_MAX_BATCH_PAIRS")
+    ]  # Max pairs coalesced from concurrent requests into one forward pass
+    cross_encoder_batch_wait_ms: Annotated[
+        float, Field(default=2.0, alias="CROSS_ENCODER_BATCH_WAIT_MS")
+    ]  # How long concurrent requests wait to join a batch
 
     # Podcast Generation settings
     # Environment: "development" uses FastAPI BackgroundTasks + local filesystem
@@ -212,6 +325,20 @@ class Settings(BaseSettings):
     podcast_fallback_audio_provider: Annotated[
         str | None, Field(default=None, alias="PODCAST_FALLBACK_AUDIO_PROVIDER")
     ]  # Optional fallback
+    podcast_tts_max_concurrency: Annotated[
+        int, Field(default=4, alias="PODCAST_TTS_MAX_CONCURRENCY")
+    ]  # Concurrent TTS calls per podcast (each provider may cap lower)
+    podcast_tts_requests_per_minute: Annotated[
+        int, Field(default=0, alias="PODCAST_TTS_REQUESTS_PER_MINUTE")
+    ]  # Per-provider TTS request budget, 0 = unlimited
+    podcast_tts_cache_enabled: Annotated[
+        bool, Field(default=True, alias="PODCAST_TTS_CACHE_ENABLED")
+    ]  # Reuse synthesized turns across regenerations (local storage only)
+    podcast_tts_cache_max_mb: Annotated[int, Field(default=2048, alias="PODCAST_TTS_CACHE_MAX_MB")]
+    podcast_segmented_output_enabled: Annotated[
+        bool, Field(default=True, alias="PODCAST_SEGMENTED_OUTPUT_ENABLED")
+    ]  # Write HLS segments during synthesis for progressive playback (local storage only)
+    podcast_segment_seconds: Annotated[int, Field(default=6, alias="PODCAST_SEGMENT_SECONDS")]
 
     # OpenAI TTS settings
     openai_tts_model: Annotated[str, Field(default="tts-1-hd", alias="OPENAI_TTS_MODEL")]  # or "tts-1" for faster
@@ -243,6 +370,17 @@ class Settings(BaseSettings):
         int, Field(default=100, alias="PODCAST_RETRIEVAL_TOP_K_EXTENDED")
     ]  # 60 min
 
+    # Map-reduce script generation for long podcasts
+    podcast_script_map_reduce_enabled: Annotated[
+        bool, Field(default=True, alias="PODCAST_SCRIPT_MAP_REDUCE_ENABLED")
+    ]  # Generate long scripts as concurrent topic segments
+    podcast_script_segment_words: Annotated[
+        int, Field(default=1500, alias="PODCAST_SCRIPT_SEGMENT_WORDS")
+    ]  # Target words per segment (scripts at or below this use a single LLM call)
+    podcast_script_max_concurrency: Annotated[
+        int, Field(default=4, alias="PODCAST_SCRIPT_MAX_CONCURRENCY")
+    ]  # Concurrent segment LLM calls per podcast
+
     # Question suggestion settings
     question_suggestion_num: Annotated[int, Field(default=5, alias="QUESTION_SUGGESTION_NUM")]
     question_min_length: Annotated[int, Field(default=15, alias="QUESTION_MIN_LENGTH")]
@@ -376,6 +514,15 @@ class Settings(BaseSettings):
     collectiondb_port: Annotated[int, Field(default=5432, alias="COLLECTIONDB_PORT")]
     collectiondb_name: Annotated[str, Field(default="rag_modulo", alias="COLLECTIONDB_NAME")]
 
+    # Database connection pool settings (one pool per engine per process)
+    db_pool_size: Annotated[int, Field(default=10, alias="DB_POOL_SIZE")]
+    db_max_overflow: Annotated[int, Field(default=20, alias="DB_MAX_OVERFLOW")]
+    db_pool_timeout_seconds: Annotated[float, Field(default=30.0, alias="DB_POOL_TIMEOUT_SECONDS")]
+    db_pool_recycle_seconds: Annotated[int, Field(default=1800, alias="DB_POOL_RECYCLE_SECONDS")]
+    db_pool_pre_ping: Annotated[bool, Field(default=True, alias="DB_POOL_PRE_PING")]
+    db_echo: Annotated[bool, Field(default=False, alias="DB_ECHO")]
+    db_statement_cache_size: Annotated[int, Field(default=500, alias="DB_STATEMENT_CACHE_SIZE")]
+
     # IBM OIDC settings
     ibm_client_id: Annotated[str | None, Field(default=None, alias="IBM_CLIENT_ID")]
     ibm_client_secret: Annotated[str | None, Field(default=None, alias="IBM_CLIENT_SECRET")]
@@ -20,7 +20,7 @@ Example:
 import logging
 import logging.handlers
 import os
-from asyncio import get_running_loop
+from datetime import UTC, datetime
 
 from pythonjsonlogger import jsonlogger
 
@@ -104,6 +104,16 @@ def _create_text_handler() -> logging.StreamHandler:
     return handler
 
 
+# Map Python log levels to LogLevel enum
+_LEVEL_MAP = {
+    "DEBUG": LogLevel.DEBUG,
+    "INFO": LogLevel.INFO,
+    "WARNING": LogLevel.WARNING,
+    "ERROR": LogLevel.ERROR,
+    "CRITICAL": LogLevel.CRITICAL,
+}
+
+
 class StorageHandler(logging.Handler):
     """Custom logging handler that stores logs in LogStorageService."""
 
@@ -125,16 +135,7 @@ class StorageHandler(logging.Handler):
         if not self.storage:
             return
 
-        # Map Python log levels to LogLevel enum
-        level_map = {
-            "DEBUG": LogLevel.DEBUG,
-            "INFO": LogLevel.INFO,
-            "WARNING": LogLevel.WARNING,
-            "ERROR": LogLevel.ERROR,
-            "CRITICAL": LogLevel.CRITICAL,
-        }
-
-        log_level = level_map.get(record.levelname, LogLevel.INFO)
+        log_level = _LEVEL_MAP.get(record.levelname, LogLevel.INFO)
 
         # Extract context from record if available
         context = getattr(record, "context", None)
@@ -196,44 +197,21 @@ class StorageHandler(logging.Handler):
             if extra_data:
                 data = extra_data
 
-        # Store the log asynchronously
-        try:
-            # Get fresh event loop reference each time (avoid memory leak)
-            import asyncio
-
-            try:
-                loop = get_running_loop()
-            except RuntimeError:
-                # No running loop in this thread - try to get the default event loop
-                try:
-                    loop = asyncio.get_event_loop()
-                    if loop.is_closed():
-                        # Loop is closed, can't store
-                        return
-                except RuntimeError:
-                    # No event loop available
-                    return
-
-            # Schedule the coroutine
-            asyncio.run_coroutine_threadsafe(
-                self.storage.add_log(
-                    level=log_level,
-                    message=message,
-                    entity_type=entity_type,
-                    entity_id=entity_id,
-                    entity_name=entity_name,
-                    logger=record.name,
-                    request_id=request_id,
-                    operation=operation,
-                    pipeline_stage=pipeline_stage,
-                    execution_time_ms=execution_time_ms,
-                    data=data,
-                ),
-                loop,
-            )
-        except Exception:
-            # Silently fail to avoid logging recursion
-            pass
+        # Hand the entry to the storage service without waiting; the event loop stores it
+        self.storage.submit(
+            timestamp=datetime.fromtimestamp(record.created, UTC),
+            level=log_level,
+            message=message,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            entity_name=entity_name,
+            logger=record.name,
+            request_id=request_id,
+            operation=operation,
+            pipeline_stage=pipeline_stage,
+            execution_time_ms=execution_time_ms,
+            data=data,
+        )
 
 
 class LoggingService:
@@ -337,6 +315,7 @@ class LoggingService:
             storage_handler.setFormatter(_text_formatter)
             storage_handler.setLevel(log_level_value)
             root_logger.addHandler(storage_handler)
+            self._storage.start()
 
             logging.info(f"Log storage initialized with {log_buffer_size_mb}MB buffer")
 
@@ -368,6 +347,8 @@ class LoggingService:
     async def shutdown(self) -> None:
         """Shutdown logging service."""
         logging.info("Logging service shutdown")
+        if self._storage is not None:
+            await self._storage.stop()
         self._initialized = False
 
     def get_logger(self, name: str) -> logging.Logger:
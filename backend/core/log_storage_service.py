@@ -3,11 +3,20 @@
 This service provides in-memory storage for recent logs with entity context,
 supporting filtering, pagination, and real-time streaming.
 
+Entries are kept in a size-bounded ring in sequence (and timestamp) order. The
+entity, request and pipeline stage indices are rings of the same entries, so
+evicting the oldest entry is O(1), time ranges are found by binary search, and
+a query only visits the entries it returns plus those rejected by unindexed
+filters. Logging threads hand records over through a lock-free deque that the
+event loop drains, so emitting a log never waits on the store.
+
 Based on patterns from IBM mcp-context-forge but adapted for RAG Modulo.
 """
 
 import asyncio
+import contextlib
 import sys
+from bisect import bisect_left, bisect_right
 from collections import deque
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass, field
@@ -49,6 +58,7 @@ class LogEntry:
         operation: Operation being performed
         pipeline_stage: RAG pipeline stage
         execution_time_ms: Operation execution time in milliseconds
+        seq: Sequence number assigned by the storage service
     """
 
     id: str = field(default_factory=IdentityService.generate_document_id)
@@ -64,7 +74,9 @@ class LogEntry:
     operation: str | None = None
     pipeline_stage: str | None = None
     execution_time_ms: float | None = None
+    seq: int = field(init=False, default=0)
     _size: int = field(init=False, default=0)
+    _dict: dict[str, Any] | None = field(init=False, default=None, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Calculate memory size after initialization."""
@@ -86,11 +98,20 @@ class LogEntry:
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization.
 
+        The dictionary is built on first use and shared by later calls, so it
+        must be treated as read-only.
+
         Returns:
             Dictionary representation of the log entry
         """
+        if self._dict is None:
+            self._dict = self._build_dict()
+        return self._dict
+
+    def _build_dict(self) -> dict[str, Any]:
         return {
             "id": self.id,
+            "seq": self.seq,
             "timestamp": self.timestamp.isoformat(),
             "level": self.level.value,
             "entity_type": self.entity_type,
@@ -106,6 +127,76 @@ class LogEntry:
         }
 
 
+_LEVEL_VALUES = {
+    LogLevel.DEBUG: 0,
+    LogLevel.INFO: 1,
+    LogLevel.NOTICE: 2,
+    LogLevel.WARNING: 3,
+    LogLevel.ERROR: 4,
+    LogLevel.CRITICAL: 5,
+    LogLevel.ALERT: 6,
+    LogLevel.EMERGENCY: 7,
+}
+
+
+def _entity_key(entity_type: str | None, entity_id: str) -> str:
+    return f"{entity_type}:{entity_id}" if entity_type else entity_id
+
+
+def _timestamp(entry: LogEntry | None) -> datetime:
+    return entry.timestamp  # type: ignore[union-attr]
+
+
+class _EntryRing:
+    """Entries in sequence order with O(1) append, O(1) eviction from the front and random access.
+
+    Evicted slots are cleared immediately and the list is compacted once more
+    than half of it is dead, so the amortized cost of eviction stays O(1).
+    """
+
+    __slots__ = ("_entries", "_head")
+
+    def __init__(self) -> None:
+        self._entries: list[LogEntry | None] = []
+        self._head = 0
+
+    def __len__(self) -> int:
+        return len(self._entries) - self._head
+
+    def __getitem__(self, index: int) -> LogEntry:
+        return self._entries[self._head + index]  # type: ignore[return-value]
+
+    def __iter__(self) -> Any:
+        return iter(self._entries[self._head :])
+
+    def append(self, entry: LogEntry) -> None:
+        self._entries.append(entry)
+
+    def first(self) -> LogEntry | None:
+        return self._entries[self._head] if len(self) else None
+
+    def last(self) -> LogEntry | None:
+        return self._entries[-1] if len(self) else None
+
+    def popleft(self) -> LogEntry:
+        entry = self._entries[self._head]
+        self._entries[self._head] = None
+        self._head += 1
+        if self._head >= 64 and self._head * 2 >= len(self._entries):
+            del self._entries[: self._head]
+            self._head = 0
+        return entry  # type: ignore[return-value]
+
+    def span(self, start_time: datetime | None, end_time: datetime | None) -> range:
+        """Return the positions of the entries within a time range (both ends inclusive)."""
+        lo, hi = self._head, len(self._entries)
+        if start_time is not None:
+            lo = bisect_left(self._entries, start_time, lo, hi, key=_timestamp)
+        if end_time is not None:
+            hi = bisect_right(self._entries, end_time, lo, hi, key=_timestamp)
+        return range(lo - self._head, hi - self._head)
+
+
 class LogStorageService:
     """Service for storing and retrieving log entries in memory.
 
@@ -116,24 +207,60 @@ class LogStorageService:
     - Filtering and pagination
     """
 
-    def __init__(self, max_size_mb: int = 5) -> None:
+    def __init__(self, max_size_mb: int = 5, max_pending: int = 10000, drain_interval_seconds: float = 0.05) -> None:
         """Initialize log storage service.
 
         Args:
             max_size_mb: Maximum buffer size in megabytes (default: 5MB)
+            max_pending: Maximum number of submitted entries waiting to be stored (oldest are dropped)
+            drain_interval_seconds: How often the background task stores submitted entries
         """
         # Calculate max buffer size in bytes
         self._max_size_bytes = int(max_size_mb * 1024 * 1024)
         self._current_size_bytes = 0
 
-        # Use deque for efficient append/pop operations
-        self._buffer: deque[LogEntry] = deque()
+        # Entries in sequence and timestamp order
+        self._buffer = _EntryRing()
+        self._next_seq = 1
         self._subscribers: list[asyncio.Queue[dict[str, Any]]] = []
 
-        # Indices for efficient filtering
-        self._entity_index: dict[str, list[str]] = {}  # entity_key -> [log_ids]
-        self._request_index: dict[str, list[str]] = {}  # request_id -> [log_ids]
-        self._pipeline_stage_index: dict[str, list[str]] = {}  # stage -> [log_ids]
+        # Indices for efficient filtering, holding the same entries in the same order
+        self._entity_index: dict[str, _EntryRing] = {}  # entity_key -> entries
+        self._request_index: dict[str, _EntryRing] = {}  # request_id -> entries
+        self._pipeline_stage_index: dict[str, _EntryRing] = {}  # stage -> entries
+
+        # Running counts for get_stats
+        self._level_counts: dict[LogLevel, int] = {}
+        self._entity_counts: dict[str, int] = {}
+        self._stage_counts: dict[str, int] = {}
+
+        # Entries submitted from logging threads; deque appends and pops are atomic
+        self._pending: deque[dict[str, Any]] = deque(maxlen=max_pending)
+        self._drain_interval_seconds = drain_interval_seconds
+        self._drain_task: asyncio.Task[None] | None = None
+
+    def submit(self, **fields: Any) -> None:
+        """Queue a log entry from any thread without waiting on the store.
+
+        Args:
+            fields: LogEntry fields
+        """
+        self._pending.append(fields)
+
+    def start(self) -> None:
+        """Start storing submitted entries in the background of the running event loop."""
+        if self._drain_task is not None and not self._drain_task.done():
+            return
+        self._drain_task = asyncio.get_running_loop().create_task(self._run_drain(), name="log-storage-drain")
+
+    async def stop(self) -> None:
+        """Stop the background task and store the remaining submitted entries."""
+        task, self._drain_task = self._drain_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._drain()
 
     async def add_log(
         self,
@@ -167,6 +294,8 @@ class LogStorageService:
         Returns:
             The created LogEntry
         """
+        # Keep submitted entries ahead of this one
+        self._drain()
         log_entry = LogEntry(
             level=level,
             message=message,
@@ -180,80 +309,109 @@ class LogStorageService:
             pipeline_stage=pipeline_stage,
             execution_time_ms=execution_time_ms,
         )
+        self._store(log_entry)
+        return log_entry
 
-        # Add to buffer and update size
-        self._buffer.append(log_entry)
-        self._current_size_bytes += log_entry._size
+    def _drain(self) -> int:
+        """Store every submitted entry.
 
-        # Update indices BEFORE eviction so they can be cleaned up properly
-        if entity_id:
-            key = f"{entity_type}:{entity_id}" if entity_type else entity_id
-            if key not in self._entity_index:
-                self._entity_index[key] = []
-            self._entity_index[key].append(log_entry.id)
+        Returns:
+            Number of entries stored
+        """
+        count = 0
+        while self._pending:
+            try:
+                fields = self._pending.popleft()
+            except IndexError:
+                break
+            self._store(LogEntry(**fields))
+            count += 1
+        return count
 
-        if request_id:
-            if request_id not in self._request_index:
-                self._request_index[request_id] = []
-            self._request_index[request_id].append(log_entry.id)
+    async def _run_drain(self) -> None:
+        while True:
+            await asyncio.sleep(self._drain_interval_seconds)
+            # Logging a failure here could recurse; a bad entry must not stop the drain
+            with contextlib.suppress(Exception):
+                self._drain()
+
+    def _store(self, entry: LogEntry) -> None:
+        """Append an entry, index it and evict the oldest entries over the size limit."""
+        # Entries stay in timestamp order so time ranges can be binary searched;
+        # an entry stamped earlier than its predecessor (late thread, clock step) is moved up to it
+        last = self._buffer.last()
+        if last is not None and entry.timestamp < last.timestamp:
+            entry.timestamp = last.timestamp
+        entry.seq = self._next_seq
+        self._next_seq += 1
+
+        self._buffer.append(entry)
+        self._current_size_bytes += entry._size
+        self._level_counts[entry.level] = self._level_counts.get(entry.level, 0) + 1
+        if entry.entity_type:
+            self._entity_counts[entry.entity_type] = self._entity_counts.get(entry.entity_type, 0) + 1
+        if entry.pipeline_stage:
+            self._stage_counts[entry.pipeline_stage] = self._stage_counts.get(entry.pipeline_stage, 0) + 1
 
-        if pipeline_stage:
-            if pipeline_stage not in self._pipeline_stage_index:
-                self._pipeline_stage_index[pipeline_stage] = []
-            self._pipeline_stage_index[pipeline_stage].append(log_entry.id)
+        if entry.entity_id:
+            self._entity_index.setdefault(_entity_key(entry.entity_type, entry.entity_id), _EntryRing()).append(entry)
+        if entry.request_id:
+            self._request_index.setdefault(entry.request_id, _EntryRing()).append(entry)
+        if entry.pipeline_stage:
+            self._pipeline_stage_index.setdefault(entry.pipeline_stage, _EntryRing()).append(entry)
 
         # Remove old entries if size limit exceeded
-        while self._current_size_bytes > self._max_size_bytes and self._buffer:
-            old_entry = self._buffer.popleft()
-            self._current_size_bytes -= old_entry._size
-            self._remove_from_indices(old_entry)
+        while self._current_size_bytes > self._max_size_bytes and len(self._buffer):
+            self._evict(self._buffer.popleft())
 
-        # Notify subscribers
-        await self._notify_subscribers(log_entry)
+        self._notify_subscribers(entry)
 
-        return log_entry
+    def _evict(self, entry: LogEntry) -> None:
+        """Remove an evicted entry from the indices and counts.
 
-    def _remove_from_indices(self, entry: LogEntry) -> None:
-        """Remove entry from indices when evicted from buffer.
+        The evicted entry is the oldest one, so it is also the first entry of
+        each index it appears in.
 
         Args:
-            entry: LogEntry to remove from indices
+            entry: LogEntry evicted from the buffer
         """
-        # Remove from entity index
-        if entry.entity_id:
-            key = f"{entry.entity_type}:{entry.entity_id}" if entry.entity_type else entry.entity_id
-            if key in self._entity_index:
-                try:
-                    self._entity_index[key].remove(entry.id)
-                    if not self._entity_index[key]:
-                        del self._entity_index[key]
-                except ValueError:
-                    pass
-
-        # Remove from request index
-        if entry.request_id and entry.request_id in self._request_index:
-            try:
-                self._request_index[entry.request_id].remove(entry.id)
-                if not self._request_index[entry.request_id]:
-                    del self._request_index[entry.request_id]
-            except ValueError:
-                pass
+        self._current_size_bytes -= entry._size
+        self._decrement(self._level_counts, entry.level)
+        if entry.entity_type:
+            self._decrement(self._entity_counts, entry.entity_type)
+        if entry.pipeline_stage:
+            self._decrement(self._stage_counts, entry.pipeline_stage)
 
-        # Remove from pipeline stage index
-        if entry.pipeline_stage and entry.pipeline_stage in self._pipeline_stage_index:
-            try:
-                self._pipeline_stage_index[entry.pipeline_stage].remove(entry.id)
-                if not self._pipeline_stage_index[entry.pipeline_stage]:
-                    del self._pipeline_stage_index[entry.pipeline_stage]
-            except ValueError:
-                pass
+        if entry.entity_id:
+            self._pop_index(self._entity_index, _entity_key(entry.entity_type, entry.entity_id))
+        if entry.request_id:
+            self._pop_index(self._request_index, entry.request_id)
+        if entry.pipeline_stage:
+            self._pop_index(self._pipeline_stage_index, entry.pipeline_stage)
+
+    @staticmethod
+    def _pop_index(index: dict[str, _EntryRing], key: str) -> None:
+        ring = index[key]
+        ring.popleft()
+        if not len(ring):
+            del index[key]
+
+    @staticmethod
+    def _decrement[K](counts: dict[K, int], key: K) -> None:
+        remaining = counts[key] - 1
+        if remaining:
+            counts[key] = remaining
+        else:
+            del counts[key]
 
-    async def _notify_subscribers(self, log_entry: LogEntry) -> None:
+    def _notify_subscribers(self, log_entry: LogEntry) -> None:
         """Notify subscribers of new log entry.
 
         Args:
             log_entry: New log entry
         """
+        if not self._subscribers:
+            return
         message = {"type": "log_entry", "data": log_entry.to_dict()}
 
         # Remove dead subscribers
@@ -289,6 +447,10 @@ class LogStorageService:
     ) -> list[dict[str, Any]]:
         """Get filtered log entries.
 
+        Scans the smallest matching index (or the whole buffer) within the time
+        range found by binary search, in the requested order, and stops once the
+        page is full.
+
         Args:
             entity_type: Filter by entity type
             entity_id: Filter by entity ID
@@ -305,51 +467,62 @@ class LogStorageService:
         Returns:
             List of matching log entries as dictionaries
         """
-        # Start with all logs or filtered by indices
-        if entity_id:
-            key = f"{entity_type}:{entity_id}" if entity_type else entity_id
-            log_ids = set(self._entity_index.get(key, []))
-            candidates = [log for log in self._buffer if log.id in log_ids]
-        elif request_id:
-            log_ids = set(self._request_index.get(request_id, []))
-            candidates = [log for log in self._buffer if log.id in log_ids]
-        elif pipeline_stage:
-            log_ids = set(self._pipeline_stage_index.get(pipeline_stage, []))
-            candidates = [log for log in self._buffer if log.id in log_ids]
-        else:
-            candidates = list(self._buffer)
+        self._drain()
+        if limit <= 0:
+            return []
+
+        # Start with all logs or the smallest matching index
+        entity_key = _entity_key(entity_type, entity_id) if entity_id else None
+        indexed: list[_EntryRing | None] = []
+        if entity_key is not None:
+            indexed.append(self._entity_index.get(entity_key))
+        if request_id:
+            indexed.append(self._request_index.get(request_id))
+        if pipeline_stage:
+            indexed.append(self._pipeline_stage_index.get(pipeline_stage))
+        if any(ring is None for ring in indexed):
+            return []
+        source = min(indexed, key=len) if indexed else self._buffer  # type: ignore[arg-type]
+
+        positions = source.span(start_time, end_time)  # type: ignore[union-attr]
+        if order == "desc":
+            positions = positions[::-1]
+
+        min_level = _LEVEL_VALUES.get(level, 0) if level else None
+        search_text = search.lower() if search else None
 
         # Apply filters
-        filtered = []
-        for log in candidates:
+        results: list[dict[str, Any]] = []
+        skipped = 0
+        for position in positions:
+            log = source[position]  # type: ignore[index]
             # Entity type filter
             if entity_type and log.entity_type != entity_type:
                 continue
-
-            # Level filter
-            if level and not self._meets_level_threshold(log.level, level):
+            if entity_id and log.entity_id != entity_id:
                 continue
-
-            # Time range filters
-            if start_time and log.timestamp < start_time:
+            if request_id and log.request_id != request_id:
                 continue
-            if end_time and log.timestamp > end_time:
+            if pipeline_stage and log.pipeline_stage != pipeline_stage:
                 continue
 
-            # Search filter
-            if search and search.lower() not in log.message.lower():
+            # Level filter
+            if min_level is not None and _LEVEL_VALUES.get(log.level, 0) < min_level:
                 continue
 
-            filtered.append(log)
-
-        # Sort
-        filtered.sort(key=lambda x: x.timestamp, reverse=order == "desc")
+            # Search filter
+            if search_text and search_text not in log.message.lower():
+                continue
 
-        # Paginate
-        paginated = filtered[offset : offset + limit]
+            # Paginate
+            if skipped < offset:
+                skipped += 1
+                continue
+            results.append(log.to_dict())
+            if len(results) >= limit:
+                break
 
-        # Convert to dictionaries
-        return [log.to_dict() for log in paginated]
+        return results
 
     def _meets_level_threshold(self, log_level: LogLevel, min_level: LogLevel) -> bool:
         """Check if log level meets minimum threshold.
@@ -361,18 +534,7 @@ class LogStorageService:
         Returns:
             True if log level meets or exceeds minimum
         """
-        level_values = {
-            LogLevel.DEBUG: 0,
-            LogLevel.INFO: 1,
-            LogLevel.NOTICE: 2,
-            LogLevel.WARNING: 3,
-            LogLevel.ERROR: 4,
-            LogLevel.CRITICAL: 5,
-            LogLevel.ALERT: 6,
-            LogLevel.EMERGENCY: 7,
-        }
-
-        return level_values.get(log_level, 0) >= level_values.get(min_level, 0)
+        return _LEVEL_VALUES.get(log_level, 0) >= _LEVEL_VALUES.get(min_level, 0)
 
     async def subscribe(self) -> AsyncGenerator[dict[str, Any], None]:
         """Subscribe to real-time log updates.
@@ -395,22 +557,7 @@ class LogStorageService:
         Returns:
             Dictionary with storage statistics
         """
-        level_counts: dict[LogLevel, int] = {}
-        entity_counts: dict[str, int] = {}
-        stage_counts: dict[str, int] = {}
-
-        for log in self._buffer:
-            # Count by level
-            level_counts[log.level] = level_counts.get(log.level, 0) + 1
-
-            # Count by entity type
-            if log.entity_type:
-                entity_counts[log.entity_type] = entity_counts.get(log.entity_type, 0) + 1
-
-            # Count by pipeline stage
-            if log.pipeline_stage:
-                stage_counts[log.pipeline_stage] = stage_counts.get(log.pipeline_stage, 0) + 1
-
+        self._drain()
         return {
             "total_logs": len(self._buffer),
             "buffer_size_bytes": self._current_size_bytes,
@@ -420,9 +567,10 @@ class LogStorageService:
             "unique_entities": len(self._entity_index),
             "unique_requests": len(self._request_index),
             "unique_pipeline_stages": len(self._pipeline_stage_index),
-            "level_distribution": {level.value: count for level, count in level_counts.items()},
-            "entity_distribution": entity_counts,
-            "pipeline_stage_distribution": stage_counts,
+            "pending_logs": len(self._pending),
+            "level_distribution": {level.value: count for level, count in self._level_counts.items()},
+            "entity_distribution": dict(self._entity_counts),
+            "pipeline_stage_distribution": dict(self._stage_counts),
         }
 
     def clear(self) -> int:
@@ -431,10 +579,14 @@ class LogStorageService:
         Returns:
             Number of logs cleared
         """
+        self._drain()
         count = len(self._buffer)
-        self._buffer.clear()
+        self._buffer = _EntryRing()
         self._entity_index.clear()
         self._request_index.clear()
         self._pipeline_stage_index.clear()
+        self._level_counts.clear()
+        self._entity_counts.clear()
+        self._stage_counts.clear()
         self._current_size_bytes = 0
         return count
@@ -18,6 +18,7 @@ logger = logging.getLogger(__name__)
 # These are thread-safe and isolated per request
 _request_user_cache: ContextVar[dict[str, Any] | None] = ContextVar("request_user_cache", default=None)
 _request_session_cache: ContextVar[dict[str, Any] | None] = ContextVar("request_session_cache", default=None)
+_request_config_cache: ContextVar[dict[Any, Any] | None] = ContextVar("request_config_cache", default=None)
 
 
 class RequestContext:
@@ -83,6 +84,22 @@ class RequestContext:
             logger.debug("RequestContext: Retrieved cached session")
         return session
 
+    @staticmethod
+    def get_config_cache() -> dict[Any, Any]:
+        """Get the request-scoped configuration cache, creating it on first use.
+
+        Used as the first tier of rag_solution.services.config_cache so that
+        one request sees a single value per configuration key.
+
+        Returns:
+            Dictionary of configuration values cached for this request
+        """
+        cache = _request_config_cache.get()
+        if cache is None:
+            cache = {}
+            _request_config_cache.set(cache)
+        return cache
+
     @staticmethod
     def clear() -> None:
         """Clear all request context data.
@@ -92,6 +109,7 @@ class RequestContext:
         """
         _request_user_cache.set(None)
         _request_session_cache.set(None)
+        _request_config_cache.set(None)
         logger.debug("RequestContext: Cleared all context data")
 
     @staticmethod
@@ -8,15 +8,21 @@ Key components:
 - SPIFFEConfig: Configuration for SPIFFE/SPIRE integration
 - SPIFFEAuthenticator: Handles JWT-SVID fetching and validation
 - AgentPrincipal: Represents an authenticated agent identity
+- JwtBundleCache: In-memory trust bundles kept current by the Workload API
+- VerifiedTokenCache: Validated JWT-SVIDs cached by token hash until expiry
 
 Reference: https://spiffe.io/docs/latest/spire-about/spire-concepts/
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import re
+import threading
+import time
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
@@ -42,6 +48,9 @@ SPIFFE_ID_PATTERN = re.compile(r"^spiffe://([a-zA-Z0-9._-]+)/(.+)$")
 # Default SPIRE Workload API socket path
 DEFAULT_SPIFFE_ENDPOINT_SOCKET = "unix:///var/run/spire/agent.sock"
 
+# Signing algorithms allowed for JWT-SVIDs by the SPIFFE JWT-SVID specification
+JWT_SVID_ALGORITHMS = frozenset({"RS256", "RS384", "RS512", "ES256", "ES384", "ES512", "PS256", "PS384", "PS512"})
+
 
 class AgentType(str, Enum):
     """Enumeration of supported agent types in RAG Modulo.
@@ -121,6 +130,8 @@ class SPIFFEConfig:
         default_audiences: Default audiences for JWT-SVID requests
         svid_ttl_seconds: Time-to-live for SVIDs in seconds
         fallback_to_jwt: Whether to fall back to legacy JWT if SPIRE unavailable
+        bundle_refresh_seconds: Minimum interval between on-demand trust bundle fetches
+        token_cache_size: Maximum number of validated JWT-SVIDs to cache (0 disables)
     """
 
     enabled: bool = False
@@ -129,6 +140,8 @@ class SPIFFEConfig:
     default_audiences: list[str] = field(default_factory=lambda: ["backend-api", "mcp-gateway"])
     svid_ttl_seconds: int = 3600  # 1 hour
     fallback_to_jwt: bool = True
+    bundle_refresh_seconds: float = 30.0
+    token_cache_size: int = 10000
 
     @classmethod
     def from_env(cls) -> SPIFFEConfig:
@@ -141,6 +154,8 @@ class SPIFFEConfig:
             SPIFFE_JWT_AUDIENCES: Comma-separated list of audiences
             SPIFFE_SVID_TTL_SECONDS: SVID TTL in seconds
             SPIFFE_FALLBACK_TO_JWT: Enable JWT fallback (default: true)
+            SPIFFE_BUNDLE_REFRESH_SECONDS: Minimum seconds between on-demand bundle fetches
+            SPIFFE_TOKEN_CACHE_SIZE: Validated JWT-SVID cache size (0 disables)
         """
         enabled = os.getenv("SPIFFE_ENABLED", "false").lower() == "true"
         endpoint_socket = os.getenv("SPIFFE_ENDPOINT_SOCKET", DEFAULT_SPIFFE_ENDPOINT_SOCKET)
@@ -149,6 +164,8 @@ class SPIFFEConfig:
         default_audiences = [a.strip() for a in audiences_str.split(",") if a.strip()]
         svid_ttl = int(os.getenv("SPIFFE_SVID_TTL_SECONDS", "3600"))
         fallback_to_jwt = os.getenv("SPIFFE_FALLBACK_TO_JWT", "true").lower() == "true"
+        bundle_refresh_seconds = float(os.getenv("SPIFFE_BUNDLE_REFRESH_SECONDS", "30"))
+        token_cache_size = int(os.getenv("SPIFFE_TOKEN_CACHE_SIZE", "10000"))
 
         return cls(
             enabled=enabled,
@@ -157,6 +174,8 @@ class SPIFFEConfig:
             default_audiences=default_audiences,
             svid_ttl_seconds=svid_ttl,
             fallback_to_jwt=fallback_to_jwt,
+            bundle_refresh_seconds=bundle_refresh_seconds,
+            token_cache_size=token_cache_size,
         )
 
 
@@ -305,6 +324,146 @@ class AgentPrincipal(BaseModel):
         return datetime.now(UTC) > self.expires_at
 
 
+class JwtBundleCache:
+    """In-memory JWT trust bundles kept current by the SPIRE Workload API.
+
+    Bundles are pushed by a streaming watch on the Workload API, so validating a
+    JWT-SVID only needs a dictionary lookup. When a token references a trust
+    domain or key id that is not cached (e.g. right after a key rotation), the
+    bundles are fetched once on demand, at most every ``refresh_interval_seconds``
+    so unknown key ids cannot turn every request into a Workload API call.
+    """
+
+    def __init__(self, workload_client: Any, refresh_interval_seconds: float = 30.0) -> None:
+        """Initialize the bundle cache.
+
+        Args:
+            workload_client: py-spiffe WorkloadApiClient
+            refresh_interval_seconds: Minimum interval between on-demand fetches
+        """
+        self._workload_client = workload_client
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self._bundles: dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._last_fetch: float | None = None
+        self._cancel_handler: Any = None
+
+    def start(self) -> None:
+        """Start watching the Workload API for bundle updates."""
+        if self._cancel_handler is None:
+            self._cancel_handler = self._workload_client.stream_jwt_bundles(self._set_bundles, self._on_error)
+
+    def stop(self) -> None:
+        """Stop watching for bundle updates."""
+        if self._cancel_handler is not None:
+            self._cancel_handler.cancel()
+            self._cancel_handler = None
+
+    def refresh(self) -> bool:
+        """Fetch the bundles from the Workload API.
+
+        Returns:
+            True if the bundles were fetched
+        """
+        with self._lock:
+            self._last_fetch = time.monotonic()
+        try:
+            self._set_bundles(self._workload_client.fetch_jwt_bundles())
+            return True
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Justification: Keep serving the last known bundles if the Workload API is unreachable
+            logger.error("Failed to fetch JWT trust bundles: %s", e)
+            return False
+
+    def get_authority(self, trust_domain: str, key_id: str) -> Any:
+        """Return the public key for a key id of a trust domain.
+
+        Args:
+            trust_domain: Trust domain that issued the token
+            key_id: Key id from the token header
+
+        Returns:
+            The public key, or None if the trust domain or key id is unknown
+        """
+        authority = self._lookup(trust_domain, key_id)
+        if authority is None and self._may_refresh() and self.refresh():
+            authority = self._lookup(trust_domain, key_id)
+        return authority
+
+    def _lookup(self, trust_domain: str, key_id: str) -> Any:
+        with self._lock:
+            bundle = self._bundles.get(trust_domain)
+        return bundle.get_jwt_authority(key_id) if bundle is not None else None
+
+    def _may_refresh(self) -> bool:
+        with self._lock:
+            return self._last_fetch is None or time.monotonic() - self._last_fetch >= self.refresh_interval_seconds
+
+    def _set_bundles(self, bundle_set: Any) -> None:
+        bundles = {str(bundle.trust_domain): bundle for bundle in bundle_set.bundles}
+        with self._lock:
+            self._bundles = bundles
+        logger.debug("JWT trust bundles updated for %d trust domain(s)", len(bundles))
+
+    def _on_error(self, error: Exception) -> None:
+        logger.error("JWT trust bundle watch failed, keeping last known bundles: %s", error)
+
+
+class VerifiedTokenCache:
+    """Bounded LRU cache of validated JWT-SVIDs.
+
+    Entries are keyed by the SHA-256 of the token, so raw tokens are not kept in
+    memory, and expire with the token's ``exp`` claim.
+    """
+
+    def __init__(self, max_entries: int = 10000) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached tokens
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, AgentPrincipal] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> AgentPrincipal | None:
+        """Return the principal of a previously validated token, or None if not cached or expired."""
+        key = self._key(token)
+        with self._lock:
+            principal = self._entries.get(key)
+            if principal is None:
+                return None
+            if principal.is_expired():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return principal
+
+    def put(self, token: str, principal: AgentPrincipal) -> None:
+        """Cache a validated token's principal until the token expires."""
+        if principal.expires_at is None:
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = principal
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached tokens."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
 class SPIFFEAuthenticator:
     """Authenticator for SPIFFE JWT-SVIDs.
 
@@ -333,6 +492,10 @@ class SPIFFEAuthenticator:
         self.config = config or SPIFFEConfig.from_env()
         self._workload_client: Any = None
         self._jwt_source: Any = None
+        self._bundle_cache: JwtBundleCache | None = None
+        self._token_cache = (
+            VerifiedTokenCache(self.config.token_cache_size) if self.config.token_cache_size > 0 else None
+        )
         self._initialized = False
         self._spire_available = False
 
@@ -360,6 +523,8 @@ class SPIFFEAuthenticator:
 
             self._workload_client = WorkloadApiClient()
             self._jwt_source = JwtSource()
+            self._bundle_cache = JwtBundleCache(self._workload_client, self.config.bundle_refresh_seconds)
+            self._bundle_cache.start()
             self._spire_available = True
             self._initialized = True
             logger.info("SPIFFE authenticator initialized successfully")
@@ -429,7 +594,9 @@ class SPIFFEAuthenticator:
         """Validate a JWT-SVID and extract the agent principal.
 
         This method validates the JWT-SVID signature against the SPIRE trust bundle
-        and extracts the agent identity information.
+        and extracts the agent identity information. Trust bundles are held in memory
+        and validated tokens are cached until they expire, so repeated requests with
+        the same SVID do not decode or verify it again.
 
         SECURITY NOTE: By default, signature validation is REQUIRED. The fallback_to_jwt
         config option only controls whether we fall back when SPIRE is UNAVAILABLE,
@@ -443,11 +610,40 @@ class SPIFFEAuthenticator:
             AgentPrincipal if validation successful, None otherwise
         """
         try:
-            # First, decode without verification to check if it's a SPIFFE JWT-SVID
-            unverified = jwt.decode(token, options={"verify_signature": False})
+            if self._token_cache is not None:
+                cached = self._token_cache.get(token)
+                if cached is not None:
+                    if required_audience and required_audience not in cached.audiences:
+                        logger.warning("JWT-SVID missing required audience: %s", required_audience)
+                        return None
+                    return cached
+
+            # Signature validation - CRITICAL SECURITY CHECK
+            signature_validated = False
+
+            if self.is_available:
+                try:
+                    claims = self._verify_signature(token)
+                except jwt.ExpiredSignatureError:
+                    logger.warning("JWT-SVID has expired")
+                    return None
+                except jwt.PyJWTError as e:
+                    # SECURITY: Signature validation FAILED - always reject
+                    logger.error(
+                        "JWT-SVID signature validation FAILED: %s. Token rejected for security.",
+                        e,
+                    )
+                    return None
+                if claims is None:
+                    return None
+                signature_validated = True
+                logger.debug("JWT-SVID signature validated successfully")
+            else:
+                # Decode without verification to check if it's a SPIFFE JWT-SVID
+                claims = jwt.decode(token, options={"verify_signature": False})
 
             # Check if this is a SPIFFE JWT-SVID (has 'sub' claim with spiffe:// prefix)
-            subject = unverified.get("sub", "")
+            subject = claims.get("sub", "")
             if not subject.startswith("spiffe://"):
                 logger.debug("Token is not a SPIFFE JWT-SVID")
                 return None
@@ -468,7 +664,7 @@ class SPIFFEAuthenticator:
                 return None
 
             # Validate audience if required
-            audiences = unverified.get("aud", [])
+            audiences = claims.get("aud", [])
             if isinstance(audiences, str):
                 audiences = [audiences]
 
@@ -476,31 +672,7 @@ class SPIFFEAuthenticator:
                 logger.warning("JWT-SVID missing required audience: %s", required_audience)
                 return None
 
-            # Signature validation - CRITICAL SECURITY CHECK
-            signature_validated = False
-
-            if self.is_available:
-                try:
-                    # Use workload client to validate signature with trust bundle
-                    with self._workload_client as client:
-                        jwt_bundle = client.fetch_jwt_bundles()
-                        bundle = jwt_bundle.get_bundle_for_trust_domain(token_trust_domain)
-                        if bundle:
-                            # Validate token signature with bundle
-                            bundle.validate_jwt_svid(token, audiences=set(audiences) if audiences else None)
-                            signature_validated = True
-                            logger.debug("JWT-SVID signature validated successfully")
-                        else:
-                            logger.error("No trust bundle found for domain: %s", token_trust_domain)
-                            return None
-                except Exception as e:
-                    # SECURITY: Signature validation FAILED - always reject
-                    logger.error(
-                        "JWT-SVID signature validation FAILED: %s. Token rejected for security.",
-                        e,
-                    )
-                    return None
-            else:
+            if not signature_validated:
                 # SPIRE is not available
                 if self.config.fallback_to_jwt:
                     # Allow fallback only when SPIRE is unavailable (not when validation fails)
@@ -515,10 +687,10 @@ class SPIFFEAuthenticator:
             # Extract timestamps with UTC timezone
             issued_at = None
             expires_at = None
-            if "iat" in unverified:
-                issued_at = datetime.fromtimestamp(unverified["iat"], tz=UTC)
-            if "exp" in unverified:
-                expires_at = datetime.fromtimestamp(unverified["exp"], tz=UTC)
+            if "iat" in claims:
+                issued_at = datetime.fromtimestamp(claims["iat"], tz=UTC)
+            if "exp" in claims:
+                expires_at = datetime.fromtimestamp(claims["exp"], tz=UTC)
 
             # Create agent principal from SPIFFE ID
             principal = AgentPrincipal.from_spiffe_id(
@@ -527,7 +699,7 @@ class SPIFFEAuthenticator:
                 issued_at=issued_at,
                 expires_at=expires_at,
                 metadata={
-                    "raw_claims": unverified,
+                    "raw_claims": claims,
                     "signature_validated": signature_validated,
                 },
             )
@@ -537,6 +709,10 @@ class SPIFFEAuthenticator:
                 logger.warning("JWT-SVID has expired")
                 return None
 
+            # Only cache tokens whose signature was verified
+            if signature_validated and self._token_cache is not None:
+                self._token_cache.put(token, principal)
+
             return principal
 
         except jwt.InvalidTokenError as e:
@@ -549,6 +725,46 @@ class SPIFFEAuthenticator:
             logger.error("Unexpected error validating JWT-SVID: %s", e)
             return None
 
+    def _verify_signature(self, token: str) -> dict[str, Any] | None:
+        """Verify a JWT-SVID signature with the cached trust bundle and decode its claims.
+
+        The token is decoded once: the key is selected from the unverified header
+        and the claims are only read after the signature has been verified.
+
+        Args:
+            token: The JWT-SVID token string
+
+        Returns:
+            The verified claims, or None if no trust bundle key matches the token
+
+        Raises:
+            jwt.PyJWTError: If the signature or claims are invalid
+        """
+        header = jwt.get_unverified_header(token)
+        algorithm = header.get("alg")
+        if algorithm not in JWT_SVID_ALGORITHMS:
+            raise jwt.InvalidAlgorithmError(f"Unsupported JWT-SVID algorithm: {algorithm}")
+        key_id = header.get("kid")
+        if not key_id:
+            raise jwt.InvalidTokenError("JWT-SVID header is missing 'kid'")
+
+        authority = (
+            self._bundle_cache.get_authority(self.config.trust_domain, key_id)
+            if self._bundle_cache is not None
+            else None
+        )
+        if authority is None:
+            logger.error("No trust bundle key %s found for domain: %s", key_id, self.config.trust_domain)
+            return None
+
+        claims: dict[str, Any] = jwt.decode(
+            token,
+            key=authority,
+            algorithms=[algorithm],
+            options={"verify_aud": False, "require": ["exp", "sub"]},
+        )
+        return claims
+
     def get_auth_headers(self, audiences: list[str] | None = None) -> dict[str, str]:
         """Get authentication headers with JWT-SVID for outbound requests.
 
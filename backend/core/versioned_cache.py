@@ -0,0 +1,135 @@
+"""Bounded, versioned LRU cache with a TTL.
+
+The process-wide caches (retrieval results, collection access decisions and
+configuration reads) share the same structure: entries live in a bounded LRU
+map, are tagged with the version counter of a *scope* (a collection, a config
+namespace) and expire after a TTL. Bumping a scope's version makes every entry
+of that scope unreachable without scanning the cache; the TTL bounds staleness
+when the change happens in another worker process.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Returned by _lookup on a miss, since None is a valid cached value
+MISSING: Any = object()
+
+
+class VersionedTTLCache[V]:
+    """Thread-safe LRU of values keyed by ``(scope, key)`` and tagged with the scope's version.
+
+    Subclasses expose domain-specific names for the operations and can extend
+    :meth:`_on_bump` to drop related state when a scope is invalidated.
+    """
+
+    cache_name = "Versioned cache"
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached entries across all scopes
+            ttl_seconds: Lifetime of a cached entry (0 disables expiry)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: OrderedDict[tuple[str, Hashable], tuple[float, int, V]] = OrderedDict()
+        self._versions: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get_version(self, scope: str) -> int:
+        """Return the current version counter of a scope."""
+        with self._lock:
+            return self._versions.get(scope, 0)
+
+    def bump_version(self, scope: str) -> int:
+        """Invalidate every cached entry of a scope.
+
+        Args:
+            scope: Scope whose underlying data changed
+
+        Returns:
+            The new version of the scope
+        """
+        with self._lock:
+            version = self._versions.get(scope, 0) + 1
+            self._versions[scope] = version
+            self._on_bump(scope)
+        logger.debug("%s: %s bumped to version %d", self.cache_name, scope, version)
+        return version
+
+    def get_or_load(self, scope: str, key: Hashable, loader: Callable[[], V], cache_none: bool = True) -> V:
+        """Return the cached value for a key, loading it on a miss.
+
+        The scope version is read before calling ``loader`` so a value loaded
+        while the scope was being modified is never served.
+
+        Args:
+            scope: Scope of the key
+            key: Key within the scope
+            loader: Loads the value on a miss
+            cache_none: Whether a None result is cached (False when None means a transient failure)
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        cache_key = (scope, key)
+        with self._lock:
+            version = self._versions.get(scope, 0)
+            value = self._lookup(cache_key, version)
+            if value is not MISSING:
+                self.hits += 1
+                return value  # type: ignore[no-any-return]
+            self.misses += 1
+
+        value = loader()
+        if value is None and not cache_none:
+            return value
+
+        with self._lock:
+            self._store(cache_key, version, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop all cached entries (versions are preserved)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache statistics for diagnostics."""
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def _lookup(self, cache_key: tuple[str, Hashable], version: int) -> V:
+        """Return a live entry's value or MISSING, dropping stale entries (lock held)."""
+        entry = self._entries.get(cache_key)
+        if entry is None:
+            return MISSING  # type: ignore[no-any-return]
+        if entry[1] != version or self._is_expired(entry[0]):
+            del self._entries[cache_key]
+            return MISSING  # type: ignore[no-any-return]
+        self._entries.move_to_end(cache_key)
+        return entry[2]
+
+    def _store(self, cache_key: tuple[str, Hashable], version: int, value: V) -> None:
+        """Store an entry and evict the least recently used ones (lock held)."""
+        self._entries[cache_key] = (time.monotonic(), version, value)
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _on_bump(self, scope: str) -> None:
+        """Hook called with the lock held after a scope's version was bumped."""
+
+    def _is_expired(self, stored_at: float) -> bool:
+        return self.ttl_seconds > 0 and time.monotonic() - stored_at > self.ttl_seconds
@@ -5,6 +5,7 @@ including middleware configuration, router registration, database initialization
 and LLM provider setup.
 """
 
+import asyncio
 import contextlib
 import os
 from collections.abc import AsyncGenerator
@@ -25,8 +26,14 @@ from core.config import get_settings
 from core.logging_utils import get_logger, setup_logging
 from core.loggingcors_middleware import LoggingCORSMiddleware
 
+# Runtime evaluation
+from rag_solution.evaluation.evaluation_queue import get_evaluation_queue
+from rag_solution.evaluation.llm_as_judge_evals import reset_judge_llms
+
 # Database
-from rag_solution.file_management.database import Base, engine, get_db
+from rag_solution.file_management.database import Base, dispose_async_engine, engine, get_db
+from rag_solution.generation.providers.client_pool import reset_client_pool
+from rag_solution.generation.providers.factory import warm_up_providers
 from rag_solution.router.agent_router import router as agent_router
 
 # Models
@@ -47,9 +54,14 @@ from rag_solution.router.token_warning_router import router as token_warning_rou
 from rag_solution.router.user_router import router as user_router
 from rag_solution.router.voice_router import router as voice_router
 from rag_solution.router.websocket_router import router as websocket_router
+from rag_solution.schemas.conversation_schema import NEXT_CURSOR_HEADER
 
 # Services
+from rag_solution.services.collection_stats_reconciler import CollectionStatsReconciler
+from rag_solution.services.config_cache import ConfigCacheListener
 from rag_solution.services.system_initialization_service import SystemInitializationService
+from rag_solution.services.usage_accounting import UsageFlusher
+from rag_solution.services.websocket_hub import get_connection_hub
 
 # Setup logging
 log_dir = Path("/app/logs") if os.getenv("CONTAINER_ENV") else Path(__file__).parent.parent / "logs"
@@ -170,8 +182,44 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
         logger.error("Application startup failed: %s", e, exc_info=True)
         raise SystemExit(1) from e
 
+    # Periodically recount collection chunk stats from the vector store
+    settings = get_settings()
+    stats_reconciler = CollectionStatsReconciler(settings, settings.collection_stats_reconcile_interval_seconds)
+    stats_reconciler.start()
+
+    # Apply configuration cache invalidations published by other workers
+    config_cache_listener = ConfigCacheListener(settings, engine)
+    config_cache_listener.start()
+
+    # Persist LLM usage totals in batches
+    usage_flusher = UsageFlusher(settings, settings.llm_usage_flush_interval_seconds)
+    usage_flusher.start()
+
+    # Deliver WebSocket messages published by other workers
+    websocket_hub = get_connection_hub(settings)
+    await websocket_hub.start()
+
+    # Build the pooled LLM provider clients without blocking startup on remote authentication
+    provider_warm_up = asyncio.get_running_loop().run_in_executor(None, warm_up_providers, settings)
+
     yield
 
+    await websocket_hub.stop()
+    await usage_flusher.stop()
+    await config_cache_listener.stop()
+    await stats_reconciler.stop()
+    if not provider_warm_up.done():
+        provider_warm_up.cancel()
+
+    # Stop background evaluation and close the pooled judge model connections
+    await get_evaluation_queue().stop()
+    reset_judge_llms()
+    reset_client_pool()
+
+    # Close the pooled database connections
+    await dispose_async_engine()
+    engine.dispose()
+
     logger.info("Application shutdown complete.")
 
 
@@ -241,6 +289,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*", "X-User-UUID"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 app.add_middleware(AuthenticationMiddleware)
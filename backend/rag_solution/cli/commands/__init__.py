@@ -7,6 +7,7 @@ for CLI operations, wrapping API calls and providing user-friendly interfaces.
 from typing import Final
 
 from .auth import AuthCommands
+from .benchmark import BenchmarkCommands
 from .collections import CollectionCommands
 from .config import ConfigCommands
 from .documents import DocumentCommands
@@ -18,6 +19,7 @@ from .users import UserCommands
 
 __all__: Final[list[str]] = [
     "AuthCommands",
+    "BenchmarkCommands",
     "CollectionCommands",
     "ConfigCommands",
     "DocumentCommands",
@@ -0,0 +1,92 @@
+"""Retrieval benchmark commands for RAG CLI.
+
+This module implements CLI commands for running the offline retrieval
+benchmark. Unlike the other commands it runs locally and does not call
+the API.
+"""
+
+from pydantic import ValidationError
+
+from rag_solution.cli.client import RAGAPIClient
+from rag_solution.cli.config import RAGConfig
+
+from .base import BaseCommand, CommandResult
+
+
+class BenchmarkCommands(BaseCommand):
+    """Commands for benchmarking retrieval quality and latency.
+
+    This class runs a labeled query set through the retrieval and rerank
+    stages and writes the report as JSON so results can be compared per commit.
+    """
+
+    def __init__(self, api_client: RAGAPIClient, config: RAGConfig | None = None) -> None:
+        """Initialize benchmark commands.
+
+        Args:
+            api_client: HTTP API client instance
+            config: Optional configuration settings
+        """
+        super().__init__(api_client, config)
+
+    # pylint: disable=too-many-arguments
+    def run_benchmark(
+        self,
+        dataset_path: str,
+        report_path: str | None = None,
+        top_k: int = 10,
+        retrieve_k: int | None = None,
+        reranker: str = "simple",
+        repeat: int = 1,
+        embedding_dim: int = 256,
+        trace_memory: bool = True,
+    ) -> CommandResult:
+        """Run the retrieval benchmark on a labeled query set.
+
+        Args:
+            dataset_path: JSON file with the corpus and labeled queries
+            report_path: File or directory to write the JSON report to
+            top_k: Number of results kept after reranking
+            retrieve_k: Number of candidates retrieved for reranking
+            reranker: Reranker under test ("simple" or "cross-encoder")
+            repeat: Number of timed passes over the query set
+            embedding_dim: Dimension of the deterministic embedder
+            trace_memory: Record peak memory per stage
+
+        Returns:
+            CommandResult with the benchmark report
+        """
+        # pylint: disable=import-outside-toplevel
+        from rag_solution.evaluation.benchmark import HashingEmbedder, RetrievalBenchmark, load_dataset, write_report
+        from rag_solution.retrieval.reranker import BaseReranker, CrossEncoderReranker, SimpleReranker
+
+        try:
+            dataset = load_dataset(dataset_path)
+        except (OSError, ValidationError) as e:
+            return self._create_error_result(message=f"Invalid benchmark dataset: {e}", error_code="INVALID_DATASET")
+
+        try:
+            reranker_impl: BaseReranker = CrossEncoderReranker() if reranker == "cross-encoder" else SimpleReranker()
+        except ImportError as e:
+            return self._create_error_result(message=f"Reranker unavailable: {e}", error_code="MISSING_DEPENDENCY")
+
+        benchmark = RetrievalBenchmark(
+            dataset,
+            top_k=top_k,
+            retrieve_k=retrieve_k,
+            reranker=reranker_impl,
+            embedder=HashingEmbedder(embedding_dim),
+        )
+        try:
+            report = benchmark.run(repeat=repeat, trace_memory=trace_memory)
+        finally:
+            benchmark.close()
+
+        message = (
+            f"Benchmarked {len(dataset.queries)} queries on {len(dataset.documents)} documents "
+            f"({report['throughput']['qps']} QPS)"
+        )
+        if report_path:
+            written = write_report(report, report_path)
+            message += f", report written to {written}"
+        return self._create_success_result(data=report, message=message)
@@ -14,6 +14,7 @@ from collections.abc import Sequence
 from .client import RAGAPIClient
 from .commands import (
     AuthCommands,
+    BenchmarkCommands,
     CollectionCommands,
     ConfigCommands,
     DocumentCommands,
@@ -65,6 +66,7 @@ Examples:
   rag-cli documents upload collection123 document.pdf
   rag-cli search query collection123 "What is machine learning?"
   rag-cli health check --api --database
+  rag-cli benchmark run queries.json --report benchmarks/
         """,
     )
 
@@ -119,6 +121,9 @@ Examples:
     # Pipeline management commands
     _add_pipeline_commands(subparsers)
 
+    # Benchmark commands
+    _add_benchmark_commands(subparsers)
+
     return parser
 
 
@@ -486,6 +491,34 @@ def _add_pipeline_commands(subparsers: argparse._SubParsersAction) -> None:
     test_pipeline_parser.add_argument("--save-results", action="store_true", help="Save test results for analysis")
 
 
+def _add_benchmark_commands(subparsers: argparse._SubParsersAction) -> None:
+    """Add retrieval benchmark subcommands.
+
+    Args:
+        subparsers: Subparsers action from main parser
+    """
+    benchmark_parser = subparsers.add_parser(
+        "benchmark",
+        help="Retrieval benchmarks",
+        description="Benchmark retrieval quality and latency offline on a labeled query set",
+    )
+
+    benchmark_subparsers = benchmark_parser.add_subparsers(dest="benchmark_command", help="Benchmark commands")
+
+    # Run benchmark
+    run_parser = benchmark_subparsers.add_parser("run", help="Run the retrieval and rerank benchmark")
+    run_parser.add_argument("dataset", help="JSON file with documents and labeled queries")
+    run_parser.add_argument("--report", help="File or directory to write the JSON report to")
+    run_parser.add_argument("--top-k", type=int, default=10, help="Results kept after reranking (default: 10)")
+    run_parser.add_argument("--retrieve-k", type=int, help="Candidates retrieved for reranking (default: 4 * top-k)")
+    run_parser.add_argument(
+        "--reranker", choices=["simple", "cross-encoder"], default="simple", help="Reranker under test"
+    )
+    run_parser.add_argument("--repeat", type=int, default=1, help="Timed passes over the query set (default: 1)")
+    run_parser.add_argument("--embedding-dim", type=int, default=256, help="Dimension of the deterministic embedder")
+    run_parser.add_argument("--no-memory", action="store_true", help="Skip peak memory tracing per stage")
+
+
 def main_cli(args: Sequence[str] | None = None) -> CLIResult:  # pylint: disable=too-many-locals,too-many-return-statements,too-many-branches,too-many-statements,too-many-nested-blocks
     """Main CLI entry point.
 
@@ -552,7 +585,7 @@ def main_cli(args: Sequence[str] | None = None) -> CLIResult:  # pylint: disable
                         print(format_json_output(result.data or {}))
                     else:
                         print_status(result.message or "Success", "success")
-                    return CLIResult(exit_code=0, output=result.message)
+                    return CLIResult(exit_code=0, output=result.message or "")
                 else:
                     print_error(result.message or "Command failed")
                     return CLIResult(exit_code=1, error=result.message)
@@ -599,7 +632,7 @@ def main_cli(args: Sequence[str] | None = None) -> CLIResult:  # pylint: disable
                             print(format_json_output(result.data))
                     else:
                         print_status(result.message or "Success", "success")
-                    return CLIResult(exit_code=0, output=result.message)
+                    return CLIResult(exit_code=0, output=result.message or "")
                 else:
                     print_error(result.message or "Command failed")
                     return CLIResult(exit_code=1, error=result.message)
@@ -652,7 +685,7 @@ def main_cli(args: Sequence[str] | None = None) -> CLIResult:  # pylint: disable
                             print(format_json_output(result.data))
                     else:
                         print_status(result.message or "Success", "success")
-                    return CLIResult(exit_code=0, output=result.message)
+                    return CLIResult(exit_code=0, output=result.message or "")
                 else:
                     print_error(result.message or "Command failed")
                     return CLIResult(exit_code=1, error=result.message)
@@ -704,7 +737,7 @@ def main_cli(args: Sequence[str] | None = None) -> CLIResult:  # pylint: disable
                             print(format_json_output(result.data))
                     else:
                         print_status(result.message or "Success", "success")
-                    return CLIResult(exit_code=0, output=result.message)
+                    return CLIResult(exit_code=0, output=result.message or "")
                 else:
                     print_error(result.message or "Command failed")
                     return CLIResult(exit_code=1, error=result.message)
@@ -752,7 +785,7 @@ def main_cli(args: Sequence[str] | None = None) -> CLIResult:  # pylint: disable
                             print(format_json_output(result.data))
                     else:
                         print_status(result.message or "Success", "success")
-                    return CLIResult(exit_code=0, output=result.message)
+                    return CLIResult(exit_code=0, output=result.message or "")
                 else:
                     print_error(result.message or "Command failed")
                     return CLIResult(exit_code=1, error=result.message)
@@ -802,7 +835,7 @@ def main_cli(args: Sequence[str] | None = None) -> CLIResult:  # pylint: disable
                             print(format_json_output(result.data))
                     else:
                         print_status(result.message or "Success", "success")
-                    return CLIResult(exit_code=0, output=result.message)
+                    return CLIResult(exit_code=0, output=result.message or "")
                 else:
                     print_error(result.message or "Command failed")
                     return CLIResult(exit_code=1, error=result.message)
@@ -842,7 +875,7 @@ def main_cli(args: Sequence[str] | None = None) -> CLIResult:  # pylint: disable
                             print(format_json_output(result.data))
                     else:
                         print_status(result.message or "Success", "success")
-                    return CLIResult(exit_code=0, output=result.message)
+                    return CLIResult(exit_code=0, output=result.message or "")
                 else:
                     print_error(result.message or "Command failed")
                     return CLIResult(exit_code=1, error=result.message)
@@ -899,7 +932,7 @@ def main_cli(args: Sequence[str] | None = None) -> CLIResult:  # pylint: disable
                             print(format_json_output(result.data))
                     else:
                         print_status(result.message or "Success", "success")
-                    return CLIResult(exit_code=0, output=result.message)
+                    return CLIResult(exit_code=0, output=result.message or "")
                 else:
                     print_error(result.message or "Command failed")
                     return CLIResult(exit_code=1, error=result.message)
@@ -977,7 +1010,7 @@ def main_cli(args: Sequence[str] | None = None) -> CLIResult:  # pylint: disable
                             print(format_json_output(result.data))
                     else:
                         print_status(result.message or "Success", "success")
-                    return CLIResult(exit_code=0, output=result.message)
+                    return CLIResult(exit_code=0, output=result.message or "")
                 else:
                     print_error(result.message or "Command failed")
                     return CLIResult(exit_code=1, error=result.message)
@@ -987,6 +1020,39 @@ def main_cli(args: Sequence[str] | None = None) -> CLIResult:  # pylint: disable
                     error="No pipelines command specified. Use: list, create, show, update, delete, or test",
                 )
 
+        elif parsed_args.command == "benchmark":
+            benchmark_cmd = BenchmarkCommands(api_client, config)
+            if getattr(parsed_args, "benchmark_command", None) == "run":
+                result = benchmark_cmd.run_benchmark(
+                    dataset_path=parsed_args.dataset,
+                    report_path=getattr(parsed_args, "report", None),
+                    top_k=parsed_args.top_k,
+                    retrieve_k=getattr(parsed_args, "retrieve_k", None),
+                    reranker=parsed_args.reranker,
+                    repeat=parsed_args.repeat,
+                    embedding_dim=parsed_args.embedding_dim,
+                    trace_memory=not getattr(parsed_args, "no_memory", False),
+                )
+            else:
+                return CLIResult(exit_code=1, error="No benchmark command specified. Use: run")
+
+            # Handle result
+            if result.success:
+                if config.output_format == "json":
+                    print(format_json_output(result.data or {}))
+                elif config.output_format == "table" and result.data:
+                    quality = [{"metric": name, "value": value} for name, value in result.data["quality"].items()]
+                    stages = [{"stage": name, **stats} for name, stats in result.data["stages"].items()]
+                    print(format_table_output(quality, title="Quality"))
+                    print(format_table_output(stages, title="Stages"))
+                    print_status(result.message or "Success", "success")
+                else:
+                    print_status(result.message or "Success", "success")
+                return CLIResult(exit_code=0, output=result.message or "")
+            else:
+                print_error(result.message or "Command failed")
+                return CLIResult(exit_code=1, error=result.message)
+
         # Add more command handlers as needed...
         else:
             output = f"Command '{parsed_args.command}' is not yet implemented"
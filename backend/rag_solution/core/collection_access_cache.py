@@ -0,0 +1,119 @@
+"""In-process cache of collection access decisions.
+
+Every search and every collection-scoped route checks whether a user may read
+a collection and whether the collection is searchable. The answer only depends
+on the collection's privacy flag, its status and a single ``user_collection``
+row, so it is cached per ``(collection, user)`` pair in a bounded LRU map.
+
+Entries are tagged with a per-collection version counter. Membership, status
+and privacy changes bump the collection's version, which makes every cached
+decision for that collection unreachable without scanning the cache. The TTL
+bounds staleness when another worker process makes the change.
+"""
+
+import threading
+from collections.abc import Callable
+
+from pydantic import UUID4
+
+from core.config import Settings
+from core.versioned_cache import VersionedTTLCache
+from rag_solution.schemas.collection_schema import CollectionAccess
+
+
+class CollectionAccessCache(VersionedTTLCache[CollectionAccess | None]):
+    """Bounded, thread-safe cache of per-user collection access decisions.
+
+    Scopes are collection IDs; entries are keyed by user within a collection.
+    """
+
+    cache_name = "Collection access cache"
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 30.0) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached ``(collection, user)`` decisions
+            ttl_seconds: Lifetime of a cached decision (0 disables expiry)
+        """
+        super().__init__(max_entries, ttl_seconds)
+
+    def get_version(self, collection_id: UUID4) -> int:  # type: ignore[override]  # pylint: disable=arguments-renamed
+        """Return the current version counter of a collection."""
+        return super().get_version(str(collection_id))
+
+    def invalidate(self, collection_id: UUID4) -> int:
+        """Invalidate every cached decision for a collection.
+
+        Args:
+            collection_id: Collection whose membership, status or privacy changed
+
+        Returns:
+            The new version of the collection
+        """
+        return self.bump_version(str(collection_id))
+
+    def get_or_load(  # type: ignore[override]  # pylint: disable=arguments-renamed
+        self,
+        collection_id: UUID4,
+        user_id: UUID4 | None,
+        loader: Callable[[], CollectionAccess | None],
+    ) -> CollectionAccess | None:
+        """Return the cached decision for a user and collection, loading it on a miss.
+
+        Args:
+            collection_id: Collection being accessed
+            user_id: User requesting access, or None for anonymous checks
+            loader: Loads the decision from the database
+
+        Returns:
+            The access decision, or None if the collection does not exist
+        """
+        return super().get_or_load(str(collection_id), str(user_id) if user_id else None, loader)
+
+
+_collection_access_cache: CollectionAccessCache | None = None
+_collection_access_cache_lock = threading.Lock()
+
+
+def get_collection_access_cache(settings: Settings) -> CollectionAccessCache | None:
+    """Return the process-wide collection access cache, or None when disabled.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        The shared cache instance, or None if caching is disabled
+    """
+    global _collection_access_cache  # pylint: disable=global-statement
+    if getattr(settings, "collection_access_cache_enabled", False) is not True:
+        return None
+    if _collection_access_cache is None:
+        with _collection_access_cache_lock:
+            if _collection_access_cache is None:
+                _collection_access_cache = CollectionAccessCache(
+                    max_entries=settings.collection_access_cache_max_entries,
+                    ttl_seconds=settings.collection_access_cache_ttl_seconds,
+                )
+    return _collection_access_cache
+
+
+def invalidate_collection_access(collection_id: UUID4) -> None:
+    """Invalidate cached access decisions for a collection in this process.
+
+    Called by the repositories whenever a collection's members, status or
+    privacy change. A no-op until the cache has been created.
+
+    Args:
+        collection_id: The modified collection
+    """
+    cache = _collection_access_cache
+    if cache is not None:
+        cache.invalidate(collection_id)
+
+
+def reset_collection_access_cache() -> None:
+    """Discard the process-wide cache (used by tests)."""
+    global _collection_access_cache  # pylint: disable=global-statement
+    with _collection_access_cache_lock:
+        _collection_access_cache = None
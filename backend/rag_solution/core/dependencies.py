@@ -5,7 +5,7 @@ and service injection that can be used across all routers.
 """
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, Request
@@ -14,7 +14,7 @@ from sqlalchemy.orm import Session
 
 from core.config import Settings, get_settings
 from rag_solution.core.exceptions import NotFoundError
-from rag_solution.file_management.database import get_db
+from rag_solution.file_management.database import get_async_db, get_db
 from rag_solution.schemas.user_schema import UserOutput
 from rag_solution.services.agent_service import AgentService
 from rag_solution.services.collection_service import CollectionService
@@ -35,6 +35,9 @@ from rag_solution.services.user_service import UserService
 from rag_solution.services.user_team_service import UserTeamService
 from rag_solution.services.voice_service import VoiceService
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
 logger = logging.getLogger(__name__)
 
 
@@ -195,15 +198,10 @@ def verify_collection_access(
     if current_user_id != str(user_id):
         raise HTTPException(status_code=403, detail="Not authorized")
 
-    # Check collection ownership (implement based on your business logic)
-    user_collection_service = UserCollectionService(db)
-
-    try:
-        user_collections = user_collection_service.get_user_collections(user_id)
-        if not any(uc.id == collection_id for uc in user_collections):
-            raise HTTPException(status_code=403, detail="You don't have access to this collection")
-    except NotFoundError:
-        raise HTTPException(status_code=404, detail="Collection not found") from None
+    # Check collection membership with the cached single-row lookup
+    access = UserCollectionService(db, settings).get_collection_access(user_id, collection_id)
+    if access is None or not access.is_member:
+        raise HTTPException(status_code=403, detail="You don't have access to this collection")
 
     return True
 
@@ -310,11 +308,14 @@ def get_llm_parameters_service(
     return LLMParametersService(db, settings)
 
 
-def get_conversation_service(db: Session = Depends(get_db)) -> ConversationService:
+def get_conversation_service(
+    db: Session = Depends(get_db), async_db: "AsyncSession" = Depends(get_async_db)
+) -> ConversationService:
     """Get ConversationService instance.
 
     Args:
         db: Database session dependency
+        async_db: Async database session dependency, used for the session and message reads
 
     Returns:
         ConversationService instance
@@ -322,7 +323,7 @@ def get_conversation_service(db: Session = Depends(get_db)) -> ConversationServi
     from rag_solution.repository.conversation_repository import ConversationRepository
 
     settings = get_settings()
-    repository = ConversationRepository(db)
+    repository = ConversationRepository(db, async_db=async_db)
     question_service = QuestionService(db, settings)
 
     return ConversationService(db, settings, repository, question_service)
@@ -450,16 +451,19 @@ def get_agent_service(db: Session = Depends(get_db)) -> AgentService:
     return AgentService(db)
 
 
-def get_prompt_template_service(db: Session = Depends(get_db)) -> PromptTemplateService:
+def get_prompt_template_service(
+    db: Session = Depends(get_db), async_db: "AsyncSession" = Depends(get_async_db)
+) -> PromptTemplateService:
     """Get PromptTemplateService instance.
 
     Args:
         db: Database session dependency
+        async_db: Async database session dependency, used for the template listings
 
     Returns:
         PromptTemplateService instance
     """
-    return PromptTemplateService(db)
+    return PromptTemplateService(db, async_db=async_db)
 
 
 def get_user_team_service(db: Session = Depends(get_db)) -> UserTeamService:
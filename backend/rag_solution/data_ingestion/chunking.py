@@ -9,7 +9,6 @@ import logging
 import operator
 import re
 from collections.abc import Callable
-from typing import TYPE_CHECKING
 
 import numpy as np
 
@@ -19,6 +18,7 @@ from rag_solution.data_ingestion.hierarchical_chunking import (
     create_sentence_based_hierarchical_chunks,
     get_child_chunks,
 )
+from vectordbs.data_types import to_embedding_matrix
 
 # Import shared embedding utility for modern factory-based pattern
 from vectordbs.utils.embeddings import get_embeddings_for_vector_store
@@ -26,14 +26,6 @@ from vectordbs.utils.embeddings import get_embeddings_for_vector_store
 # Keep legacy import for backward compatibility (deprecated function)
 from vectordbs.utils.watsonx import get_tokenization
 
-if TYPE_CHECKING:
-    from sklearn.metrics.pairwise import cosine_similarity
-else:
-    try:
-        from sklearn.metrics.pairwise import cosine_similarity  # type: ignore[import-untyped]
-    except ImportError:
-        cosine_similarity = None
-
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
@@ -127,7 +119,7 @@ def semantic_chunking(text: str, min_chunk_size: int = 1, max_chunk_size: int =
     # Use default settings for embedding generation
     settings = get_settings()
     embeddings = get_embeddings_for_vector_store(combined_sentences, settings)
-    embeddings_array = np.array(embeddings)
+    embeddings_array = np.asarray(embeddings, dtype=np.float32)
 
     # Ensure the array has the correct shape for cosine similarity
     if embeddings_array.ndim == 1:
@@ -323,12 +315,14 @@ def calculate_cosine_distances(embeddings: np.ndarray) -> list[float]:
     Returns:
         List of cosine distances
     """
-    distances = []
-    for i in range(len(embeddings) - 1):
-        similarity = cosine_similarity([embeddings[i]], [embeddings[i + 1]])[0][0]
-        distance = 1 - similarity
-        distances.append(distance)
-    return distances
+    if len(embeddings) < 2:
+        return []
+    matrix = to_embedding_matrix(embeddings)
+    norms = np.linalg.norm(matrix, axis=1)
+    dots = np.einsum("ij,ij->i", matrix[:-1], matrix[1:])
+    denominators = norms[:-1] * norms[1:]
+    similarities = np.divide(dots, denominators, out=np.zeros_like(dots), where=denominators > 0)
+    return (1 - similarities).tolist()
 
 
 def simple_chunker(text: str, settings: Settings = get_settings()) -> list[str]:
@@ -9,6 +9,7 @@ This module implements hierarchical chunking where:
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 
 from core.config import Settings, get_settings
@@ -331,42 +332,68 @@ def get_child_chunks(chunks: list[HierarchicalChunk]) -> list[HierarchicalChunk]
     return [c for c in chunks if c.level == max_level]
 
 
-def get_parent_for_chunk(chunk_id: str, all_chunks: list[HierarchicalChunk]) -> HierarchicalChunk | None:
+def build_chunk_index(chunks: Sequence[HierarchicalChunk]) -> dict[str, HierarchicalChunk]:
+    """Index hierarchical chunks by chunk ID.
+
+    Build the index once after chunking and pass it to the lookup helpers
+    below, so each parent lookup is O(1) instead of a scan over all chunks.
+
+    Args:
+        chunks: List of all hierarchical chunks.
+
+    Returns:
+        Mapping of chunk ID to chunk.
+    """
+    return {c.chunk_id: c for c in chunks}
+
+
+def _as_index(
+    all_chunks: Sequence[HierarchicalChunk] | Mapping[str, HierarchicalChunk],
+) -> Mapping[str, HierarchicalChunk]:
+    return all_chunks if isinstance(all_chunks, Mapping) else build_chunk_index(all_chunks)
+
+
+def get_parent_for_chunk(
+    chunk_id: str,
+    all_chunks: Sequence[HierarchicalChunk] | Mapping[str, HierarchicalChunk],
+) -> HierarchicalChunk | None:
     """Get the parent chunk for a given chunk ID.
 
     Args:
         chunk_id: ID of the chunk to find parent for.
-        all_chunks: List of all hierarchical chunks.
+        all_chunks: All hierarchical chunks, or their index from build_chunk_index.
 
     Returns:
         Parent HierarchicalChunk or None if not found.
     """
-    target_chunk = next((c for c in all_chunks if c.chunk_id == chunk_id), None)
+    index = _as_index(all_chunks)
+    target_chunk = index.get(chunk_id)
     if not target_chunk or not target_chunk.parent_id:
         return None
 
-    return next((c for c in all_chunks if c.chunk_id == target_chunk.parent_id), None)
+    return index.get(target_chunk.parent_id)
 
 
 def get_chunk_with_parents(
     chunk_id: str,
-    all_chunks: list[HierarchicalChunk],
+    all_chunks: Sequence[HierarchicalChunk] | Mapping[str, HierarchicalChunk],
     include_siblings: bool = False,
 ) -> list[HierarchicalChunk]:
     """Get a chunk along with its parent hierarchy.
 
     Args:
         chunk_id: ID of the child chunk.
-        all_chunks: List of all hierarchical chunks.
+        all_chunks: All hierarchical chunks, or their index from build_chunk_index.
         include_siblings: Whether to include sibling chunks.
 
     Returns:
         List containing the chunk and its ancestors.
     """
     result: list[HierarchicalChunk] = []
+    index = _as_index(all_chunks)
 
     # Find the target chunk
-    target = next((c for c in all_chunks if c.chunk_id == chunk_id), None)
+    target = index.get(chunk_id)
     if not target:
         return result
 
@@ -374,19 +401,20 @@ def get_chunk_with_parents(
 
     # Add siblings if requested
     if include_siblings and target.parent_id:
-        parent = get_parent_for_chunk(chunk_id, all_chunks)
+        parent = index.get(target.parent_id)
         if parent and parent.child_ids:
-            siblings = [c for c in all_chunks if c.chunk_id in parent.child_ids and c.chunk_id != chunk_id]
+            siblings = [index[c] for c in parent.child_ids if c != chunk_id and c in index]
             result.extend(siblings)
 
-    # Walk up the parent chain
+    # Walk up the parent chain (guarding against cycles in malformed input)
     current = target
-    while current.parent_id:
-        parent = get_parent_for_chunk(current.chunk_id, all_chunks)
-        if parent:
-            result.append(parent)
-            current = parent
-        else:
+    seen = {target.chunk_id}
+    while current.parent_id and current.parent_id not in seen:
+        parent = index.get(current.parent_id)
+        if not parent:
             break
+        result.append(parent)
+        seen.add(parent.chunk_id)
+        current = parent
 
     return result
@@ -14,7 +14,7 @@ from core.identity_service import IdentityService
 from rag_solution.data_ingestion.document_processor import DocumentProcessor
 from rag_solution.file_management.database import create_session_factory
 from rag_solution.generation.providers.factory import LLMProviderFactory
-from vectordbs.data_types import Document
+from vectordbs.data_types import Document, has_embeddings, to_embedding_matrix
 from vectordbs.vector_store import VectorStore
 
 # Configure logging
@@ -105,24 +105,23 @@ class DocumentStore:
                     logger.error("No embeddings returned from provider!")
                     raise ValueError("No embeddings returned from provider")
 
-                if all_embeddings:
-                    logger.info("First embedding length: %d", len(all_embeddings[0]) if all_embeddings[0] else 0)
-                    logger.info("First embedding type: %s", type(all_embeddings[0]))
+                if len(all_embeddings) < len(chunk_mapping):
+                    logger.error("No embedding available for index %d", len(all_embeddings))
+                    raise ValueError(f"No embedding available for index {len(all_embeddings)}")
+
+                for embedding_idx, embedding in enumerate(all_embeddings):
+                    if not has_embeddings(embedding):
+                        logger.error("Embedding %d is empty/None!", embedding_idx)
+                        raise ValueError(f"Embedding {embedding_idx} is empty/None")
+
+                # Pack the batch into one contiguous float32 matrix and hand each chunk a
+                # row view, instead of keeping one list of boxed floats per chunk
+                embedding_matrix = to_embedding_matrix(all_embeddings)
+                del all_embeddings
+                logger.info("Embedding matrix shape: %s (%d bytes)", embedding_matrix.shape, embedding_matrix.nbytes)
 
-                # Assign embeddings back to chunks
                 for embedding_idx, (doc_idx, chunk_idx) in enumerate(chunk_mapping):
-                    if embedding_idx < len(all_embeddings):
-                        if all_embeddings[embedding_idx]:
-                            documents[doc_idx].chunks[chunk_idx].embeddings = all_embeddings[embedding_idx]
-                            logger.debug(
-                                "Assigned embedding %d to document %d chunk %d", embedding_idx, doc_idx, chunk_idx
-                            )
-                        else:
-                            logger.error("Embedding %d is empty/None!", embedding_idx)
-                            raise ValueError(f"Embedding {embedding_idx} is empty/None")
-                    else:
-                        logger.error("No embedding available for index %d", embedding_idx)
-                        raise ValueError(f"No embedding available for index {embedding_idx}")
+                    documents[doc_idx].chunks[chunk_idx].embeddings = embedding_matrix[embedding_idx]
 
                 logger.info("Successfully embedded %d chunks", len(all_texts))
 
@@ -0,0 +1,376 @@
+"""Offline retrieval benchmark harness.
+
+Runs a labeled query set through the retrieval and rerank stages against an
+in-process vector store and a deterministic embedder, so results only depend
+on the code under test and can be compared commit by commit:
+
+1. Documents are embedded with HashingEmbedder and indexed into an ephemeral Chroma collection
+2. Each query is embedded, retrieved and reranked, timing every stage
+3. The final ranking is scored with recall@k, MRR and nDCG@k against the labels
+4. The report (quality, p50/p95 latency, QPS, peak memory per stage) is written as JSON
+"""
+
+import hashlib
+import json
+import os
+import re
+import statistics
+import subprocess
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, TypeVar
+from uuid import uuid4
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from core.config import Settings, get_settings
+from core.logging_utils import get_logger
+from rag_solution.evaluation.metrics import MRR, NDCG, HitRate, Recall
+from rag_solution.retrieval.reranker import BaseReranker, SimpleReranker
+from vectordbs.data_types import DocumentChunkMetadata, EmbeddedChunk, QueryResult, QueryWithEmbedding, Source
+from vectordbs.vector_store import VectorStore
+
+logger = get_logger("evaluation.benchmark")
+
+T = TypeVar("T")
+
+# Stages timed for every query, in pipeline order
+STAGES = ("embed", "retrieve", "rerank")
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+class HashingEmbedder:
+    """Deterministic bag-of-words embedder using signed feature hashing.
+
+    Needs no model download or network access, and returns the same vector for
+    the same text on every machine, so benchmark quality numbers only move when
+    retrieval or reranking code changes.
+    """
+
+    def __init__(self, dimension: int = 256) -> None:
+        """
+        Initialize the embedder.
+
+        Args:
+            dimension: Length of the produced vectors
+        """
+        self.dimension = dimension
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed texts into L2-normalized vectors.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One vector per text
+        """
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in _TOKEN_PATTERN.findall(text.lower()):
+                value = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "little")
+                vectors[row, value % self.dimension] += 1.0 if value >> 63 else -1.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors /= np.where(norms == 0, 1.0, norms)
+        return vectors.tolist()
+
+
+class BenchmarkDocument(BaseModel):
+    """Document of the benchmark corpus."""
+
+    id: str = Field(..., description="Document ID referenced by query labels")
+    text: str = Field(..., description="Document text")
+
+
+class BenchmarkQuery(BaseModel):
+    """Labeled benchmark query."""
+
+    query: str = Field(..., description="Query text")
+    relevant_ids: list[str] = Field(..., min_length=1, description="IDs of the relevant documents")
+
+
+class BenchmarkDataset(BaseModel):
+    """Labeled query set with its corpus."""
+
+    name: str = Field(default="benchmark", description="Dataset name recorded in the report")
+    documents: list[BenchmarkDocument] = Field(..., min_length=1, description="Corpus to index")
+    queries: list[BenchmarkQuery] = Field(..., min_length=1, description="Labeled queries")
+
+
+def load_dataset(path: str | Path) -> BenchmarkDataset:
+    """
+    Load a labeled query set from a JSON file.
+
+    Args:
+        path: JSON file with ``documents`` ({id, text}) and ``queries`` ({query, relevant_ids})
+
+    Returns:
+        Validated dataset
+    """
+    return BenchmarkDataset.model_validate_json(Path(path).read_text(encoding="utf-8"))
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the pct-th percentile of values using linear interpolation."""
+    return float(np.percentile(values, pct)) if values else 0.0
+
+
+@dataclass
+class StageStats:
+    """Latency samples and peak memory of one benchmark stage."""
+
+    durations: list[float] = field(default_factory=list)
+    peak_memory_bytes: int = 0
+
+    def summary(self) -> dict[str, float | int]:
+        """Summarize the stage for the report."""
+        return {
+            "calls": len(self.durations),
+            "p50_ms": round(percentile(self.durations, 50) * 1000, 3),
+            "p95_ms": round(percentile(self.durations, 95) * 1000, 3),
+            "mean_ms": round(statistics.fmean(self.durations) * 1000, 3) if self.durations else 0.0,
+            "peak_memory_kb": round(self.peak_memory_bytes / 1024, 1),
+        }
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def _create_chroma_store(settings: Settings) -> VectorStore:
+    # pylint: disable=import-outside-toplevel
+    import chromadb
+
+    from vectordbs.chroma_store import ChromaDBStore
+
+    return ChromaDBStore(client=chromadb.EphemeralClient(), settings=settings)
+
+
+class RetrievalBenchmark:  # pylint: disable=too-many-instance-attributes
+    """Benchmark of the retrieval and rerank stages on a labeled query set."""
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        dataset: BenchmarkDataset,
+        *,
+        top_k: int = 10,
+        retrieve_k: int | None = None,
+        reranker: BaseReranker | None = None,
+        embedder: HashingEmbedder | None = None,
+        vector_store_factory: Callable[[Settings], VectorStore] = _create_chroma_store,
+        settings: Settings | None = None,
+    ) -> None:
+        """
+        Initialize the benchmark.
+
+        Args:
+            dataset: Labeled query set with its corpus
+            top_k: Number of results kept after reranking (the k of recall@k and nDCG@k)
+            retrieve_k: Number of candidates retrieved for reranking (defaults to 4 * top_k)
+            reranker: Reranker under test (defaults to SimpleReranker)
+            embedder: Embedder for documents and queries (defaults to HashingEmbedder)
+            vector_store_factory: Creates the vector store from the benchmark settings
+            settings: Base settings; the embedding dimension is overridden by the embedder's
+        """
+        self.dataset = dataset
+        self.top_k = top_k
+        self.retrieve_k = max(retrieve_k or top_k * 4, top_k)
+        self.reranker = reranker or SimpleReranker()
+        self.embedder = embedder or HashingEmbedder()
+        base_settings = settings or get_settings()
+        self.settings = base_settings.model_copy(update={"embedding_dim": self.embedder.dimension})
+        self.vector_store_factory = vector_store_factory
+        self.collection_name = f"benchmark_{uuid4().hex}"
+        self._store: VectorStore | None = None
+        self.index_seconds = 0.0
+
+    def index(self) -> None:
+        """Embed the corpus and load it into a fresh collection."""
+        start = time.perf_counter()
+        self._store = self.vector_store_factory(self.settings)
+        self._store.create_collection(self.collection_name)
+        documents = self.dataset.documents
+        vectors = self.embedder.embed([document.text for document in documents])
+        chunks = [
+            EmbeddedChunk(
+                chunk_id=document.id,
+                text=document.text,
+                embeddings=vector,
+                document_id=document.id,
+                metadata=DocumentChunkMetadata(source=Source.OTHER, document_id=document.id),
+            )
+            for document, vector in zip(documents, vectors, strict=True)
+        ]
+        self._store._add_documents_impl(self.collection_name, chunks)  # pylint: disable=protected-access
+        self.index_seconds = time.perf_counter() - start
+        logger.info("Indexed %d documents in %.2fs", len(documents), self.index_seconds)
+
+    def close(self) -> None:
+        """Drop the benchmark collection."""
+        store, self._store = self._store, None
+        if store is not None:
+            store.delete_collection(self.collection_name)
+
+    def search(self, query: str, stats: dict[str, StageStats] | None = None, trace_memory: bool = False) -> list[str]:
+        """
+        Run one query through embed, retrieve and rerank.
+
+        Args:
+            query: Query text
+            stats: Per-stage stats to record timings (and memory) into
+            trace_memory: Record the peak Python heap growth of each stage (tracemalloc must be running)
+
+        Returns:
+            Ranked document IDs after reranking
+        """
+        if self._store is None:
+            self.index()
+        store = self._store
+        assert store is not None
+
+        def run(stage: str, step: Callable[[], T]) -> T:
+            if trace_memory:
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            value = step()
+            elapsed = time.perf_counter() - start
+            if stats is not None:
+                stage_stats = stats.setdefault(stage, StageStats())
+                if trace_memory:
+                    growth = tracemalloc.get_traced_memory()[1] - baseline
+                    stage_stats.peak_memory_bytes = max(stage_stats.peak_memory_bytes, growth)
+                else:
+                    stage_stats.durations.append(elapsed)
+            return value
+
+        vector = run("embed", lambda: self.embedder.embed([query])[0])
+        candidates: list[QueryResult] = run(
+            "retrieve",
+            lambda: store.query(
+                self.collection_name, QueryWithEmbedding(text=query, embeddings=vector), self.retrieve_k
+            ),
+        )
+        reranked: list[QueryResult] = run("rerank", lambda: self.reranker.rerank(query, candidates, self.top_k))
+        return [result.chunk.chunk_id for result in reranked if result.chunk and result.chunk.chunk_id]
+
+    def run(self, repeat: int = 1, trace_memory: bool = True) -> dict[str, Any]:
+        """
+        Run every query and build the benchmark report.
+
+        Args:
+            repeat: Number of timed passes over the query set
+            trace_memory: Run one extra untimed pass under tracemalloc to record peak memory per stage
+
+        Returns:
+            JSON-serializable report
+        """
+        if self._store is None:
+            self.index()
+
+        queries = self.dataset.queries
+        stats: dict[str, StageStats] = {stage: StageStats() for stage in STAGES}
+        totals: list[float] = []
+        rankings: list[list[str]] = []
+        start = time.perf_counter()
+        for _ in range(max(1, repeat)):
+            rankings = []
+            for item in queries:
+                query_start = time.perf_counter()
+                rankings.append(self.search(item.query, stats))
+                totals.append(time.perf_counter() - query_start)
+        elapsed = time.perf_counter() - start
+
+        if trace_memory:
+            started = not tracemalloc.is_tracing()
+            if started:
+                tracemalloc.start()
+            try:
+                for item in queries:
+                    self.search(item.query, stats, trace_memory=True)
+            finally:
+                if started:
+                    tracemalloc.stop()
+
+        stage_summaries = {stage: stage_stats.summary() for stage, stage_stats in stats.items()}
+        stage_summaries["total"] = StageStats(durations=totals).summary()
+        return {
+            "dataset": self.dataset.name,
+            "commit": _git_commit(),
+            "timestamp": datetime.now(UTC).isoformat(),
+            "config": {
+                "documents": len(self.dataset.documents),
+                "queries": len(queries),
+                "top_k": self.top_k,
+                "retrieve_k": self.retrieve_k,
+                "repeat": max(1, repeat),
+                "reranker": type(self.reranker).__name__,
+                "embedder": type(self.embedder).__name__,
+                "embedding_dim": self.embedder.dimension,
+            },
+            "quality": self.score(rankings),
+            "stages": stage_summaries,
+            "throughput": {
+                "qps": round(len(totals) / elapsed, 2) if elapsed > 0 else 0.0,
+                "index_seconds": round(self.index_seconds, 3),
+            },
+        }
+
+    def score(self, rankings: list[list[str]]) -> dict[str, float]:
+        """
+        Score the rankings of every query against its labels.
+
+        Args:
+            rankings: Ranked document IDs per query, in dataset order
+
+        Returns:
+            Mean recall@k, MRR, nDCG@k and hit rate
+        """
+        metrics = {
+            f"recall@{self.top_k}": Recall(top_k=self.top_k),
+            "mrr": MRR(),
+            f"ndcg@{self.top_k}": NDCG(top_k=self.top_k),
+            f"hit_rate@{self.top_k}": HitRate(),
+        }
+        return {
+            name: round(
+                statistics.fmean(
+                    metric.compute(expected_ids=item.relevant_ids, retrieved_ids=ranking[: self.top_k]).score
+                    for item, ranking in zip(self.dataset.queries, rankings, strict=True)
+                ),
+                4,
+            )
+            for name, metric in metrics.items()
+        }
+
+
+def write_report(report: dict[str, Any], path: str | Path) -> Path:
+    """
+    Write a benchmark report as JSON.
+
+    Args:
+        report: Report returned by RetrievalBenchmark.run
+        path: Output file; a directory (existing or ending with a separator) stores the
+            report as ``<commit>.json`` inside it
+
+    Returns:
+        Path of the written report
+    """
+    target = Path(path)
+    if target.is_dir() or str(path).endswith(("/", os.sep)):
+        target = target / f"{(report.get('commit') or 'local')[:12]}.json"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(json.dumps(report, indent=2, sort_keys=True), encoding="utf-8")
+    return target
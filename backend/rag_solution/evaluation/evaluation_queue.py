@@ -0,0 +1,262 @@
+"""Queue-backed LLM-as-judge evaluation of search answers.
+
+Runtime evaluation used to run inline: every search created a judge model,
+sent three prompts, closed the model and only then returned its response,
+which doubled request latency. This module moves evaluation off the request
+path:
+
+1. Searches submit an EvaluationJob and return immediately with its search id
+2. A background worker collects jobs into micro-batches (size or wait bound)
+3. All judge prompts of a batch are sent concurrently through the pooled judge model
+4. Scores are stored per search in ``evaluation_results`` for the dashboard
+"""
+
+import asyncio
+import contextlib
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from core.identity_service import IdentityService
+from core.logging_utils import get_logger
+from rag_solution.evaluation.llm_as_judge_evals import (
+    DEFAULT_JUDGE_MODEL,
+    AnswerRelevanceEvaluator,
+    BaseEvaluator,
+    ContextRelevanceEvaluator,
+    FaithfulnessEvaluator,
+    get_judge_llm,
+)
+from rag_solution.repository.evaluation_result_repository import EvaluationResultRepository
+from rag_solution.services.background_tasks import default_session_factory
+from vectordbs.utils.watsonx import agenerate_responses
+
+logger = get_logger("evaluation.queue")
+
+# Judges applied to every search, keyed by the stored score column
+JUDGES: dict[str, type[BaseEvaluator]] = {
+    "faithfulness": FaithfulnessEvaluator,
+    "answer_relevance": AnswerRelevanceEvaluator,
+    "context_relevance": ContextRelevanceEvaluator,
+}
+
+# Max concurrent judge requests of one batch
+JUDGE_CONCURRENCY = 10
+
+
+@dataclass
+class EvaluationJob:
+    """One search answer waiting to be judged."""
+
+    question: str
+    answer: str
+    context: str
+    pipeline_id: UUID | None = None
+    collection_id: UUID | None = None
+    user_id: UUID | None = None
+    search_id: UUID = field(default_factory=IdentityService.generate_id)
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    @property
+    def inputs(self) -> dict[str, str]:
+        """Prompt inputs shared by all judges (each prompt uses the ones it needs)."""
+        return {"question": self.question, "answer": self.answer, "context": self.context}
+
+
+class EvaluationQueue:
+    """Background evaluator that micro-batches judge prompts across searches."""
+
+    def __init__(
+        self,
+        batch_size: int = 8,
+        max_wait_seconds: float = 0.2,
+        max_pending: int = 1000,
+        judge_model: str = DEFAULT_JUDGE_MODEL,
+        session_factory: Callable[[], Session] | None = None,
+    ) -> None:
+        """
+        Initialize the queue.
+
+        Args:
+            batch_size: Maximum number of searches judged in one batch
+            max_wait_seconds: Maximum time to wait for a batch to fill up
+            max_pending: Maximum number of searches waiting for evaluation
+            judge_model: Model id of the judge
+            session_factory: Creates database sessions for storing results
+        """
+        self.batch_size = max(1, batch_size)
+        self.max_wait_seconds = max(0.0, max_wait_seconds)
+        self.max_pending = max_pending
+        self.judge_model = judge_model
+        self.session_factory = session_factory or default_session_factory
+        self._judges: dict[str, BaseEvaluator] = {}  # Created on the first batch
+        self._queue: asyncio.Queue[EvaluationJob] | None = None
+        self._worker: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def submit(self, job: EvaluationJob) -> dict[str, Any]:
+        """
+        Queue a search answer for evaluation without waiting for it.
+
+        Must be called from a running event loop.
+
+        Args:
+            job: Search answer to judge
+
+        Returns:
+            Evaluation status returned with the search response
+        """
+        queue = self._ensure_worker()
+        try:
+            queue.put_nowait(job)
+        except asyncio.QueueFull:
+            logger.warning("Evaluation queue full (%d pending), dropping search %s", queue.qsize(), job.search_id)
+            return {"status": "dropped", "search_id": str(job.search_id)}
+        return {"status": "queued", "search_id": str(job.search_id)}
+
+    async def join(self) -> None:
+        """Wait until every queued search has been evaluated."""
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+
+    async def stop(self) -> None:
+        """Stop the worker; searches still queued are not evaluated."""
+        worker, self._worker = self._worker, None
+        if worker is not None and not worker.done():
+            worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker
+        self._queue = None
+        self._loop = None
+
+    def _ensure_worker(self) -> "asyncio.Queue[EvaluationJob]":
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+            self._loop = loop
+            self._worker = None
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run(self._queue), name="evaluation-queue")
+        return self._queue
+
+    async def _run(self, queue: "asyncio.Queue[EvaluationJob]") -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_wait_seconds
+            while len(batch) < self.batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except TimeoutError:
+                    break
+
+            try:
+                await self._process(batch)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # Justification: The worker must survive storage failures to keep evaluating
+                logger.error("Failed to evaluate %d searches: %s", len(batch), e)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _process(self, batch: list[EvaluationJob]) -> None:
+        """Judge a batch of searches with one concurrent round of prompts and store the scores."""
+        loop = asyncio.get_running_loop()
+        error: str | None = None
+        outputs: list[Any] = []
+        try:
+            # Creating the judges connects to watsonx the first time; keep it off the event loop
+            judges = self._judges or await loop.run_in_executor(None, self._create_judges)
+            prompts = [judge.format_prompt(job.inputs) for job in batch for judge in judges.values()]
+            texts = await agenerate_responses(
+                prompts, concurrency_level=JUDGE_CONCURRENCY, wx_model=get_judge_llm(self.judge_model)
+            )
+            judge_per_prompt = list(judges.values()) * len(batch)
+            outputs = [judge.parse_output(text) for text, judge in zip(texts, judge_per_prompt, strict=True)]
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Justification: Judge failures are recorded per search instead of failing the worker
+            logger.error("Judge model failed for batch of %d searches: %s", len(batch), e)
+            error = str(e)[:1000]
+
+        records = [
+            self._record(job, outputs[i * len(JUDGES) : (i + 1) * len(JUDGES)], error) for i, job in enumerate(batch)
+        ]
+        await loop.run_in_executor(None, self._store, records)
+        logger.info("Evaluated %d searches%s", len(batch), " (failed)" if error else "")
+
+    def _create_judges(self) -> dict[str, BaseEvaluator]:
+        if not self._judges:
+            get_judge_llm(self.judge_model)
+            self._judges = {name: judge_class() for name, judge_class in JUDGES.items()}
+        return self._judges
+
+    def _record(self, job: EvaluationJob, outputs: list[Any], error: str | None) -> dict[str, Any]:
+        """Build the stored row of one search from its judge outputs."""
+        record: dict[str, Any] = {
+            "search_id": job.search_id,
+            "pipeline_id": job.pipeline_id,
+            "collection_id": job.collection_id,
+            "user_id": job.user_id,
+            "question": job.question,
+            "judge_model": self.judge_model,
+            "error": error,
+            "created_at": job.created_at,
+        }
+        if error or not outputs:
+            return record
+
+        details: dict[str, Any] = {}
+        scores: list[float] = []
+        for (name, judge_class), output in zip(JUDGES.items(), outputs, strict=True):
+            details[name] = output
+            score = output.get(judge_class.score_key) if isinstance(output, dict) and judge_class.score_key else None
+            record[name] = float(score) if isinstance(score, int | float) else None
+            if record[name] is not None:
+                scores.append(record[name])
+        record["details"] = details
+        record["overall_score"] = sum(scores) / len(scores) if scores else None
+        return record
+
+    def _store(self, records: list[dict[str, Any]]) -> None:
+        db = self.session_factory()
+        try:
+            EvaluationResultRepository(db).create_many(records)
+        finally:
+            db.close()
+
+
+_evaluation_queue: EvaluationQueue | None = None
+_evaluation_queue_lock = threading.Lock()
+
+
+def get_evaluation_queue(settings: Any = None) -> EvaluationQueue:
+    """Return the process-wide evaluation queue, configured from settings on first use."""
+    global _evaluation_queue  # pylint: disable=global-statement
+    if _evaluation_queue is None:
+        with _evaluation_queue_lock:
+            if _evaluation_queue is None:
+                if settings is None:
+                    from core.config import get_settings  # pylint: disable=import-outside-toplevel
+
+                    settings = get_settings()
+                _evaluation_queue = EvaluationQueue(
+                    batch_size=settings.evaluation_batch_size,
+                    max_wait_seconds=settings.evaluation_batch_wait_ms / 1000,
+                    max_pending=settings.evaluation_queue_size,
+                )
+    return _evaluation_queue
+
+
+def reset_evaluation_queue() -> None:
+    """Discard the process-wide evaluation queue (used by tests)."""
+    global _evaluation_queue  # pylint: disable=global-statement
+    with _evaluation_queue_lock:
+        _evaluation_queue = None
@@ -23,19 +23,17 @@ else:
 # Import evaluation dependencies if available, otherwise handle gracefully
 try:
     from rag_solution.evaluation.llm_as_judge_evals import (
-        BASE_LLM_PARAMETERS,
         AnswerRelevanceEvaluator,
         ContextRelevanceEvaluator,
         FaithfulnessEvaluator,
-        init_llm,
+        get_judge_llm,
     )
 except ImportError:
     # Handle case where llm_as_judge_evals is not available
-    BASE_LLM_PARAMETERS = None
     AnswerRelevanceEvaluator = None
     ContextRelevanceEvaluator = None
     FaithfulnessEvaluator = None
-    init_llm = None
+    get_judge_llm = None
 
 try:
     from vectordbs.data_types import DocumentChunkWithScore, QueryResult, VectorQuery
@@ -162,12 +160,14 @@ class RAGEvaluator:
         """
         Run all LLM-as-a-judge evaluators concurrently and collect their results.
 
+        The pooled judge model is reused across calls; its persistent connection
+        is not closed after each evaluation.
+
         Returns:
             Dict[str, Any]: A dictionary containing evaluation results.
         """
-        llm = None
         try:
-            llm = init_llm(parameters=BASE_LLM_PARAMETERS)
+            llm = get_judge_llm()
             results = await asyncio.gather(
                 self.faithfulness_evaluator.a_evaluate_faithfulness(context=context, answer=answer, llm=llm),
                 self.answer_relevance_evaluator.a_evaluate_answer_relevance(
@@ -186,9 +186,6 @@ class RAGEvaluator:
         except Exception as e:
             logger.error("Failed to run evaluations: %s", e, exc_info=True)
             raise RuntimeError(f"Failed to run evaluations: {e}") from e
-        finally:
-            if llm:
-                await llm.aclose_persistent_connection()
 
 
 # Example usage
@@ -1,6 +1,6 @@
-import asyncio
 import json
-from typing import Any
+import threading
+from typing import Any, ClassVar
 
 import json_repair
 import pydantic
@@ -25,6 +25,8 @@ from vectordbs.utils.watsonx import generate_batch, generate_text, get_model
 
 logger = get_logger(__name__)
 
+DEFAULT_JUDGE_MODEL = "meta-llama/llama-3-3-70b-instruct"
+
 BASE_LLM_PARAMETERS = {
     GenParams.DECODING_METHOD: "greedy",
     GenParams.RANDOM_SEED: 60,
@@ -78,7 +80,7 @@ def get_schema(
 
 def init_llm(
     parameters: dict = BASE_LLM_PARAMETERS,
-    model_id: str = "meta-llama/llama-3-3-70b-instruct",
+    model_id: str = DEFAULT_JUDGE_MODEL,
 ) -> ModelInference:
     """
     Initializes a language model with the given parameters.
@@ -95,13 +97,52 @@ def init_llm(
         raise RuntimeError(f"Failed to initialize LLM: {e}") from e
 
 
+_judge_llms: dict[str, ModelInference] = {}
+_judge_llms_lock = threading.Lock()
+
+
+def get_judge_llm(model_id: str = DEFAULT_JUDGE_MODEL) -> ModelInference:
+    """
+    Return the pooled judge model of a model id, creating it on first use.
+
+    The judge model keeps a persistent connection and is shared by all
+    evaluators, so evaluations no longer pay for client setup and teardown.
+    """
+    llm = _judge_llms.get(model_id)
+    if llm is None:
+        with _judge_llms_lock:
+            llm = _judge_llms.get(model_id)
+            if llm is None:
+                llm = init_llm(parameters=BASE_LLM_PARAMETERS, model_id=model_id)
+                _judge_llms[model_id] = llm
+    return llm
+
+
+def reset_judge_llms() -> None:
+    """Close and discard the pooled judge models (used on shutdown and by tests)."""
+    with _judge_llms_lock:
+        llms = list(_judge_llms.values())
+        _judge_llms.clear()
+    for llm in llms:
+        try:
+            llm.close_persistent_connection()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Justification: Closing is best effort; the connection may already be gone
+            logger.debug("Failed to close judge model connection: %s", e)
+
+
 def get_evaluator() -> ModelInference:
-    """Get or create the evaluator instance."""
-    return init_llm(parameters=BASE_LLM_PARAMETERS)
+    """Get the pooled evaluator instance."""
+    return get_judge_llm()
 
 
 # Base class for evaluators with a default LLM
 class BaseEvaluator:
+    # Field with the judge's rating and the field its numeric score is stored in
+    rate_key: str | None = None
+    score_key: str | None = None
+    scores: ClassVar[dict[str, float]] = {"High": 1, "Medium": 0.5, "Low": 0}
+
     def __init__(
         self,
         llm: ModelInference | None = None,
@@ -159,101 +200,97 @@ class BaseEvaluator:
         except Exception as e:
             raise RuntimeError(f"Failed to evaluate inputs: {e}") from e
 
-    def batch_evaluate(self, inputs: list) -> list[Any]:
+    def format_prompt(self, inputs: dict[str, Any]) -> str:
+        """Format the evaluation prompt for one set of inputs."""
         if self.pydantic_model is None:
             raise ValueError("pydantic_model must be provided")
         if self.prompt is None:
             raise ValueError("prompt must be provided")
+        return self.prompt.format(**{**inputs, "schema": get_schema(self.pydantic_model)})
 
-        all_outputs = []
-        prompts = [
-            self.prompt.format(**{**prompt_inputs, "schema": get_schema(self.pydantic_model)})
-            for prompt_inputs in inputs
-        ]
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        llm = init_llm(parameters=BASE_LLM_PARAMETERS)
-        try:
-            result = generate_batch(prompts=prompts, wx_model=llm, concurrency_level=10)
-        finally:
-            loop.close()
-            llm.close_persistent_connection()
+    def parse_output(self, generated_text: str) -> Any:
+        """
+        Parse a generated judgement, falling back to an empty schema on malformed output.
 
-        for generated_text in result:
-            try:
-                final_json = json_repair.repair_json(json_str=generated_text, return_objects=True)
-                if isinstance(final_json, list | str):
-                    logger.warning(f"Output Parser during batch processing  [{final_json}]")
-                    final_json = get_schema(self.pydantic_model, json_output=True, empty=True)
-            except Exception as ex:
-                logger.error(f"Output Parser Exception during batch processing for [{generated_text}] : {ex}")
-                final_json = get_schema(self.pydantic_model, json_output=True, empty=True)
+        Args:
+            generated_text: Text generated by the judge model
 
-            all_outputs.append(final_json)
+        Returns:
+            The repaired JSON object with its numeric score added
+        """
+        if self.pydantic_model is None:
+            raise ValueError("pydantic_model must be provided")
+        try:
+            final_json = json_repair.repair_json(json_str=generated_text, return_objects=True)
+            if isinstance(final_json, list | str):
+                logger.warning(f"Output Parser during batch processing  [{final_json}]")
+                final_json = get_schema(self.pydantic_model, json_output=True, empty=True)
+        except Exception as ex:
+            logger.error(f"Output Parser Exception during batch processing for [{generated_text}] : {ex}")
+            final_json = get_schema(self.pydantic_model, json_output=True, empty=True)
+        return self.add_score(final_json)
+
+    def add_score(self, result: Any) -> Any:
+        """Add the numeric score of the judge's rating to a parsed result."""
+        if isinstance(result, dict) and self.rate_key and self.score_key:
+            result[self.score_key] = self.scores.get(result.get(self.rate_key, ""), 0)
+        return result
 
-        return all_outputs
+    def batch_evaluate(self, inputs: list) -> list[Any]:
+        prompts = [self.format_prompt(prompt_inputs) for prompt_inputs in inputs]
+        # generate_batch runs its own event loop; the pooled judge model stays open across calls
+        result = generate_batch(prompts=prompts, wx_model=self.llm, concurrency_level=10)
+        return [self.parse_output(generated_text) for generated_text in result]
 
 
 # Specific evaluator for Faithfulness
 class FaithfulnessEvaluator(BaseEvaluator):
+    rate_key = "faithfulness_rate"
+    score_key = "score"
+
     def __init__(self) -> None:
         super().__init__(prompt=FAITHFULNESS_PROMPT_LLAMA3, pydantic_model=Faithfulness)
-        self.scores = {"High": 1, "Medium": 0.5, "Low": 0}
 
     def evaluate_faithfulness(self, context: str, answer: str) -> Any:
         """Evaluate faithfulness with convenient parameter names."""
         result = self.evaluate(inputs={"context": context, "answer": answer})
-        if isinstance(result, dict):
-            result["score"] = self.scores.get(result.get("faithfulness_rate", ""), 0)
-        return result
+        return self.add_score(result)
 
     async def a_evaluate_faithfulness(self, context: str, answer: str, llm: ModelInference) -> Any:
         """Evaluate faithfulness asynchronously with convenient parameter names."""
         result = await self.a_evaluate(inputs={"context": context, "answer": answer}, llm=llm)
-        if isinstance(result, dict):
-            result["score"] = self.scores.get(result.get("faithfulness_rate", ""), 0)
-        return result
+        return self.add_score(result)
 
     def batch_evaluate_faithfulness(self, inputs: list[dict[str, str]]) -> list[Any]:
         """Batch evaluate faithfulness with convenient input format."""
         # Convert list of dicts to the format expected by base class
         base_inputs = [{"context": item["context"], "answer": item["answer"]} for item in inputs]
-        result = self.batch_evaluate(base_inputs)
-        for item in result:
-            if isinstance(item, dict):
-                item["score"] = self.scores.get(item.get("faithfulness_rate", ""), 0)
-        return result
+        return self.batch_evaluate(base_inputs)
 
 
 # Specific evaluator for answer relevance
 class AnswerRelevanceEvaluator(BaseEvaluator):
+    rate_key = "answer_relevance_rate"
+    score_key = "answer_relevance_score"
+
     def __init__(self) -> None:
         super().__init__(prompt=ANSWER_RELEVANCE_PROMPT_LLAMA3, pydantic_model=AnswerRelevance)
-        self.scores = {"High": 1, "Medium": 0.5, "Low": 0}
 
     def evaluate_answer_relevance(self, question: str, answer: str) -> Any:
         """Evaluate answer relevance with convenient parameter names."""
         result = self.evaluate(inputs={"question": question, "answer": answer})
-        if isinstance(result, dict):
-            result["answer_relevance_score"] = self.scores.get(result.get("answer_relevance_rate", ""), 0)
-        return result
+        return self.add_score(result)
 
     async def a_evaluate_answer_relevance(self, question: str, answer: str, llm: ModelInference) -> Any:
         """Evaluate answer relevance asynchronously with convenient parameter names."""
         result = await self.a_evaluate(inputs={"question": question, "answer": answer}, llm=llm)
-        if isinstance(result, dict):
-            result["answer_relevance_score"] = self.scores.get(result.get("answer_relevance_rate", ""), 0)
-        return result
+        return self.add_score(result)
 
     def batch_evaluate_answer_relevance(self, inputs: list[dict[str, str]]) -> list[Any]:
         """Batch evaluate answer relevance with convenient input format."""
         # Convert list of dicts to the format expected by base class
         base_inputs = [{"question": item["question"], "answer": item["answer"]} for item in inputs]
-        result = self.batch_evaluate(base_inputs)
-        for item in result:
-            if isinstance(item, dict):
-                item["answer_relevance_score"] = self.scores.get(item.get("answer_relevance_rate", ""), 0)
-        return result
+        return self.batch_evaluate(base_inputs)
 
 
 # Specific evaluator for answer similarity, reference answer is needed
@@ -283,30 +320,24 @@ class AnswerSimilarityEvaluator(BaseEvaluator):
 
 # Specific evaluator for context relevancy, context and question is needed
 class ContextRelevanceEvaluator(BaseEvaluator):
+    rate_key = "context_relevance_rate"
+    score_key = "context_relevance_score"
+
     def __init__(self) -> None:
         super().__init__(prompt=CONTEXT_RELEVANCY_PROMPT_LLAMA3, pydantic_model=ContextRelevance)
-        self.scores = {"High": 1, "Medium": 0.5, "Low": 0}
 
     def evaluate_context_relevance(self, context: str, question: str) -> Any:
         """Evaluate context relevance with convenient parameter names."""
         result = self.evaluate(inputs={"context": context, "question": question})
-        if isinstance(result, dict):
-            result["context_relevance_score"] = self.scores.get(result.get("context_relevance_rate", ""), 0)
-        return result
+        return self.add_score(result)
 
     async def a_evaluate_context_relevance(self, context: str, question: str, llm: ModelInference) -> Any:
         """Evaluate context relevance asynchronously with convenient parameter names."""
         result = await self.a_evaluate(inputs={"context": context, "question": question}, llm=llm)
-        if isinstance(result, dict):
-            result["context_relevance_score"] = self.scores.get(result.get("context_relevance_rate", ""), 0)
-        return result
+        return self.add_score(result)
 
     def batch_evaluate_context_relevance(self, inputs: list[dict[str, str]]) -> list[Any]:
         """Batch evaluate context relevance with convenient input format."""
         # Convert list of dicts to the format expected by base class
         base_inputs = [{"context": item["context"], "question": item["question"]} for item in inputs]
-        result = self.batch_evaluate(base_inputs)
-        for item in result:
-            if isinstance(item, dict):
-                item["context_relevance_score"] = self.scores.get(item.get("context_relevance_rate", ""), 0)
-        return result
+        return self.batch_evaluate(base_inputs)
@@ -108,9 +108,61 @@ class MRR(BaseRetrievalMetric):
         )
 
 
+class Recall(BaseRetrievalMetric):
+    """Recall@k metric: share of the expected ids found in the top k retrieved ids."""
+
+    metric_name: str = "recall"
+    top_k: int | None = Field(default=None, description="Cut-off rank (None uses all retrieved ids)")
+
+    def compute(
+        self,
+        query: str | None = None,  # Part of interface, not used in this implementation  # noqa: ARG002
+        expected_ids: list[str] | None = None,
+        retrieved_ids: list[str] | None = None,
+        expected_texts: list[str] | None = None,  # Part of interface, not used in this implementation  # noqa: ARG002
+        retrieved_texts: list[str] | None = None,  # Part of interface, not used in this implementation  # noqa: ARG002
+        **kwargs: Any,  # noqa: ARG002
+    ) -> RetrievalMetricResult:
+        """Compute metric."""
+        if retrieved_ids is None or expected_ids is None:
+            raise ValueError("Retrieved ids and expected ids must be provided")
+        if not expected_ids:
+            return RetrievalMetricResult(score=0.0)
+        retrieved = set(retrieved_ids[: self.top_k])
+        hits = sum(1 for id in set(expected_ids) if id in retrieved)
+        return RetrievalMetricResult(score=hits / len(set(expected_ids)))
+
+
+class NDCG(BaseRetrievalMetric):
+    """nDCG@k metric with binary relevance."""
+
+    metric_name: str = "ndcg"
+    top_k: int | None = Field(default=None, description="Cut-off rank (None uses all retrieved ids)")
+
+    def compute(
+        self,
+        query: str | None = None,  # Part of interface, not used in this implementation  # noqa: ARG002
+        expected_ids: list[str] | None = None,
+        retrieved_ids: list[str] | None = None,
+        expected_texts: list[str] | None = None,  # Part of interface, not used in this implementation  # noqa: ARG002
+        retrieved_texts: list[str] | None = None,  # Part of interface, not used in this implementation  # noqa: ARG002
+        **kwargs: Any,  # noqa: ARG002
+    ) -> RetrievalMetricResult:
+        """Compute metric."""
+        if retrieved_ids is None or expected_ids is None:
+            raise ValueError("Retrieved ids and expected ids must be provided")
+        expected = set(expected_ids)
+        cutoff = self.top_k if self.top_k is not None else len(retrieved_ids)
+        dcg = sum(1.0 / np.log2(i + 2) for i, id in enumerate(retrieved_ids[:cutoff]) if id in expected)
+        ideal = sum(1.0 / np.log2(i + 2) for i in range(min(len(expected), cutoff)))
+        return RetrievalMetricResult(score=float(dcg / ideal) if ideal > 0 else 0.0)
+
+
 METRIC_REGISTRY: dict[str, type[BaseRetrievalMetric]] = {
     "hit_rate": HitRate,
     "mrr": MRR,
+    "recall": Recall,
+    "ndcg": NDCG,
     # "cohere_rerank_relevancy": CohereRerankRelevancyMetric,
 }
 
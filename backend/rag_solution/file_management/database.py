@@ -1,13 +1,19 @@
 # backend/rag_solution/file_management/database.py
 import logging
 import os
-from collections.abc import Generator
+import threading
+from collections.abc import AsyncGenerator, Generator
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import URL, create_engine
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from core.config import Settings, get_settings
+from core.custom_exceptions import RepositoryError
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 # Configure logging only if not in test environment
 if not os.environ.get("PYTEST_CURRENT_TEST"):
@@ -45,10 +51,33 @@ def create_database_url(settings: Settings | None = None) -> URL:
     return database_url
 
 
+def create_async_database_url(settings: Settings | None = None) -> URL:
+    """Create the asyncpg database URL from settings."""
+    if settings is None:
+        settings = get_settings()
+
+    return create_database_url(settings).set(
+        drivername="postgresql+asyncpg",
+        query={"prepared_statement_cache_size": str(settings.db_statement_cache_size)},
+    )
+
+
+def engine_options(settings: Settings) -> dict[str, Any]:
+    """Pool and logging options shared by the sync and async engines."""
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "echo": settings.db_echo,
+    }
+
+
 # Create database components using default settings
 # This maintains backward compatibility while enabling dependency injection
 _default_database_url = create_database_url()
-engine = create_engine(_default_database_url, echo=not bool(os.environ.get("PYTEST_CURRENT_TEST")))
+engine = create_engine(_default_database_url, **engine_options(get_settings()))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -56,14 +85,94 @@ if not os.environ.get("PYTEST_CURRENT_TEST"):
     logger.info("Base has been created")
 
 
+_session_factories: dict[str, sessionmaker[Session]] = {}
+_session_factories_lock = threading.Lock()
+
+_async_engine: "AsyncEngine | None" = None
+_async_session_factory: "async_sessionmaker[AsyncSession] | None" = None
+_async_engine_lock = threading.Lock()
+
+
 def create_session_factory(settings: Settings | None = None) -> sessionmaker[Session]:
-    """Create a sessionmaker with injected settings for dependency injection."""
+    """Return the sessionmaker for the database described by settings.
+
+    Engines are created once per database URL, so every caller in the process
+    shares one connection pool; the default database reuses ``SessionLocal``.
+    """
     if settings is None:
         settings = get_settings()
 
     database_url = create_database_url(settings)
-    engine = create_engine(database_url, echo=not bool(os.environ.get("PYTEST_CURRENT_TEST")))
-    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    if database_url == _default_database_url:
+        return SessionLocal
+
+    key = database_url.render_as_string(hide_password=False)
+    with _session_factories_lock:
+        factory = _session_factories.get(key)
+        if factory is None:
+            factory = sessionmaker(
+                autocommit=False, autoflush=False, bind=create_engine(database_url, **engine_options(settings))
+            )
+            _session_factories[key] = factory
+    return factory
+
+
+def get_async_engine(settings: Settings | None = None) -> "AsyncEngine":
+    """Return the process-wide async engine, creating it on first use.
+
+    The asyncio extension needs greenlet and asyncpg, so it is imported here rather
+    than at module load; processes that only use the synchronous engine never load it.
+    """
+    global _async_engine  # pylint: disable=global-statement
+    with _async_engine_lock:
+        if _async_engine is None:
+            from sqlalchemy.ext.asyncio import create_async_engine
+
+            if settings is None:
+                settings = get_settings()
+            _async_engine = create_async_engine(
+                create_async_database_url(settings),
+                connect_args={"statement_cache_size": settings.db_statement_cache_size},
+                **engine_options(settings),
+            )
+    return _async_engine
+
+
+def get_async_session_factory(settings: Settings | None = None) -> "async_sessionmaker[AsyncSession]":
+    """Return the process-wide ``async_sessionmaker`` bound to the async engine.
+
+    Objects are not expired on commit, since refreshing them afterwards would need
+    implicit IO that is not allowed on an ``AsyncSession``.
+    """
+    global _async_session_factory  # pylint: disable=global-statement
+    # The engine is fetched first: get_async_engine takes the same (non-reentrant) lock
+    async_engine = get_async_engine(settings)
+    with _async_engine_lock:
+        if _async_session_factory is None:
+            from sqlalchemy.ext.asyncio import async_sessionmaker
+
+            _async_session_factory = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+        return _async_session_factory
+
+
+async def dispose_async_engine() -> None:
+    """Close the async engine's pooled connections, if the engine was created."""
+    global _async_engine, _async_session_factory  # pylint: disable=global-statement
+    with _async_engine_lock:
+        async_engine, _async_engine, _async_session_factory = _async_engine, None, None
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
+def require_async_session(db: "AsyncSession | None") -> "AsyncSession":
+    """Return the repository's async session, failing clearly when none was given.
+
+    Raises:
+        RepositoryError: If the repository was built without an async session
+    """
+    if db is None:
+        raise RepositoryError("This operation requires a repository created with an async session")
+    return db
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -94,3 +203,19 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
         if not os.environ.get("PYTEST_CURRENT_TEST"):
             logger.info("Database session closed.")
+
+
+async def get_async_db() -> AsyncGenerator["AsyncSession", None]:
+    """
+    Create an asynchronous database session from the shared async pool.
+
+    Yields:
+        AsyncSession: The database session.
+    """
+    async with get_async_session_factory()() as db:
+        try:
+            yield db
+        except SQLAlchemyError as e:
+            logger.error(f"A database error occurred: {e}", exc_info=True)
+            await db.rollback()
+            raise
@@ -5,10 +5,16 @@ Provides abstract interface for generating podcast audio from dialogue scripts.
 Similar to LLMBase but focused on audio generation rather than text generation.
 """
 
+import tempfile
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from rag_solution.schemas.podcast_schema import AudioFormat, PodcastScript
+from rag_solution.schemas.podcast_schema import AudioFormat, PodcastScript, PodcastTurn, Speaker
+
+if TYPE_CHECKING:
+    from pydub import AudioSegment
 
 
 class AudioProviderBase(ABC):
@@ -20,6 +26,20 @@ class AudioProviderBase(ABC):
     database services or complex parameter management.
     """
 
+    # Name used in errors and for per-provider rate limits
+    provider_name = "audio"
+
+    # Maximum number of turns synthesized concurrently by this provider
+    max_concurrent_turns = 4
+
+    # Pause between speakers in milliseconds (providers set this in __init__)
+    pause_duration_ms = 500
+
+    @property
+    def tts_model_key(self) -> str:
+        """Model and settings that determine the synthesized audio, used for segment caching."""
+        return getattr(self, "model", type(self).__name__)
+
     @abstractmethod
     async def generate_dialogue_audio(
         self,
@@ -61,6 +81,101 @@ class AudioProviderBase(ABC):
             AudioGenerationError: If unable to fetch voices
         """
 
+    async def _generate_turn_audio(
+        self,
+        text: str,
+        voice_id: str,
+        audio_format: AudioFormat,
+    ) -> "AudioSegment":
+        """
+        Generate audio for a single turn.
+
+        Providers supporting concurrent dialogue synthesis override this.
+
+        Raises:
+            NotImplementedError: If the provider does not support per-turn synthesis
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support per-turn synthesis")
+
+    async def generate_dialogue_audio_to_file(
+        self,
+        script: PodcastScript,
+        host_voice: str,
+        expert_voice: str,
+        output_path: str | Path,
+        audio_format: AudioFormat = AudioFormat.MP3,
+        on_turn_complete: Callable[[int, int], Awaitable[None]] | None = None,
+    ) -> int:
+        """
+        Synthesize a dialogue concurrently and stream the encoded audio to a file.
+
+        Turns are synthesized up to ``max_concurrent_turns`` at a time and
+        written in script order, so only a few segments are in memory at once.
+
+        Args:
+            script: Parsed podcast script with HOST/EXPERT turns
+            host_voice: Voice ID for HOST speaker
+            expert_voice: Voice ID for EXPERT speaker
+            output_path: File the encoded audio is written to
+            audio_format: Output audio format
+            on_turn_complete: Awaited with ``(completed_turns, total_turns)`` after each turn
+
+        Returns:
+            Size of the written file in bytes
+
+        Raises:
+            AudioGenerationError: If audio generation fails
+        """
+        from rag_solution.generation.audio.synthesis import StreamingAudioEncoder, synthesize_dialogue
+
+        async def synthesize_turn(idx: int, turn: PodcastTurn) -> "AudioSegment":
+            voice_id = host_voice if turn.speaker == Speaker.HOST else expert_voice
+            try:
+                return await self._generate_turn_audio(text=turn.text, voice_id=voice_id, audio_format=audio_format)
+            except Exception as e:
+                raise AudioGenerationError(
+                    provider=self.provider_name,
+                    error_type="turn_generation_failed",
+                    message=f"Failed to generate audio for turn {idx + 1}: {e}",
+                    original_error=e,
+                ) from e
+
+        encoder = StreamingAudioEncoder(output_path, audio_format.value)
+        try:
+            await synthesize_dialogue(
+                script.turns,
+                synthesize_turn,
+                encoder,
+                max_concurrency=self.max_concurrent_turns,
+                pause_duration_ms=self.pause_duration_ms,
+                on_turn_complete=on_turn_complete,
+            )
+            return encoder.close()
+        except AudioGenerationError:
+            encoder.abort()
+            raise
+        except Exception as e:
+            encoder.abort()
+            raise AudioGenerationError(
+                provider=self.provider_name,
+                error_type="dialogue_generation_failed",
+                message=f"Failed to generate dialogue audio: {e}",
+                original_error=e,
+            ) from e
+
+    async def _generate_dialogue_audio_bytes(
+        self,
+        script: PodcastScript,
+        host_voice: str,
+        expert_voice: str,
+        audio_format: AudioFormat,
+    ) -> bytes:
+        """Render a dialogue through a temporary file and return the encoded bytes."""
+        with tempfile.TemporaryDirectory(prefix="podcast-audio-") as tmp_dir:
+            output_path = Path(tmp_dir) / f"dialogue.{audio_format.value}"
+            await self.generate_dialogue_audio_to_file(script, host_voice, expert_voice, output_path, audio_format)
+            return output_path.read_bytes()
+
     async def generate_single_turn_audio(
         self,
         text: str,
@@ -82,8 +197,6 @@ class AudioProviderBase(ABC):
             AudioGenerationError: If audio generation fails
         """
         # Default implementation - providers can override for optimization
-        from rag_solution.schemas.podcast_schema import PodcastScript, PodcastTurn, Speaker
-
         # Calculate estimated duration (average speaking rate: 150 words/minute = 2.5 words/second)
         word_count = len(text.split())
         estimated_duration = word_count / 2.5  # seconds
@@ -13,7 +13,7 @@ import httpx
 from pydub import AudioSegment
 
 from core.config import Settings
-from rag_solution.schemas.podcast_schema import AudioFormat, PodcastScript, Speaker
+from rag_solution.schemas.podcast_schema import AudioFormat, PodcastScript
 
 from .base import AudioGenerationError, AudioProviderBase
 
@@ -23,6 +23,11 @@ logger = logging.getLogger(__name__)
 class ElevenLabsAudioProvider(AudioProviderBase):
     """ElevenLabs TTS provider for podcast audio generation with voice cloning."""
 
+    provider_name = "elevenlabs"
+
+    # ElevenLabs caps concurrent requests per plan (3 on the entry tiers)
+    max_concurrent_turns = 3
+
     # Default stability and similarity settings for voice generation
     DEFAULT_STABILITY: ClassVar[float] = 0.5
     DEFAULT_SIMILARITY: ClassVar[float] = 0.75
@@ -79,6 +84,11 @@ class ElevenLabsAudioProvider(AudioProviderBase):
             pause_duration_ms,
         )
 
+    @property
+    def tts_model_key(self) -> str:
+        """Model and voice settings that determine the synthesized audio."""
+        return f"{self.model_id}:stability={self.stability}:similarity={self.similarity}"
+
     @classmethod
     def from_settings(cls, settings: Settings) -> "ElevenLabsAudioProvider":
         """
@@ -189,56 +199,12 @@ class ElevenLabsAudioProvider(AudioProviderBase):
                 self.model_id,
             )
 
-            # Generate audio for each turn
-            audio_segments = []
-            for idx, turn in enumerate(script.turns):
-                # Select voice based on speaker
-                voice_id = host_voice if turn.speaker == Speaker.HOST else expert_voice
-
-                # Generate audio for this turn
-                try:
-                    segment = await self._generate_turn_audio(
-                        text=turn.text,
-                        voice_id=voice_id,
-                        audio_format=audio_format,
-                    )
-                    audio_segments.append(segment)
-
-                    logger.debug(
-                        "Generated turn %d/%d (%s, %d chars, voice=%s)",
-                        idx + 1,
-                        len(script.turns),
-                        turn.speaker.value,
-                        len(turn.text),
-                        voice_id,
-                    )
-
-                except Exception as e:
-                    raise AudioGenerationError(
-                        provider="elevenlabs",
-                        error_type="turn_generation_failed",
-                        message=f"Failed to generate audio for turn {idx + 1}: {e}",
-                        original_error=e,
-                    ) from e
-
-                # Add pause after turn (except last one)
-                if idx < len(script.turns) - 1:
-                    pause = AudioSegment.silent(duration=self.pause_duration_ms)
-                    audio_segments.append(pause)
-
-            # Combine all segments
-            combined = self._combine_segments(audio_segments)
-
-            # Export to bytes
-            buffer = io.BytesIO()
-            combined.export(buffer, format=audio_format.value)
-            audio_bytes = buffer.getvalue()
+            audio_bytes = await self._generate_dialogue_audio_bytes(script, host_voice, expert_voice, audio_format)
 
             logger.info(
-                "Generated complete podcast: %d turns, %d bytes, %.1f seconds",
+                "Generated complete podcast: %d turns, %d bytes",
                 len(script.turns),
                 len(audio_bytes),
-                len(combined) / 1000.0,  # AudioSegment length is in milliseconds
             )
 
             return audio_bytes
@@ -368,28 +334,6 @@ class ElevenLabsAudioProvider(AudioProviderBase):
             )
             raise
 
-    def _combine_segments(self, segments: list[AudioSegment]) -> AudioSegment:
-        """
-        Combine audio segments into single track.
-
-        Args:
-            segments: List of AudioSegment objects
-
-        Returns:
-            Combined AudioSegment
-
-        Raises:
-            ValueError: If segments list is empty
-        """
-        if not segments:
-            raise ValueError("Cannot combine empty segments list")
-
-        combined = AudioSegment.empty()
-        for segment in segments:
-            combined += segment
-
-        return combined
-
     async def clone_voice(
         self,
         name: str,
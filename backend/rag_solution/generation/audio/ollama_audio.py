@@ -22,6 +22,11 @@ logger = logging.getLogger(__name__)
 class OllamaAudioProvider(AudioProviderBase):
     """Ollama TTS provider for self-hosted podcast audio generation."""
 
+    provider_name = "ollama"
+
+    # A local TTS server renders one request at a time
+    max_concurrent_turns = 1
+
     # Orpheus voices (8 available in Orpheus model)
     ORPHEUS_VOICES: ClassVar[list[dict[str, Any]]] = [
         {
@@ -12,7 +12,7 @@ from typing import Any, ClassVar
 from openai import AsyncOpenAI
 from pydub import AudioSegment
 
-from rag_solution.schemas.podcast_schema import AudioFormat, PodcastScript, Speaker
+from rag_solution.schemas.podcast_schema import AudioFormat, PodcastScript
 
 from .base import AudioGenerationError, AudioProviderBase
 
@@ -22,6 +22,11 @@ logger = logging.getLogger(__name__)
 class OpenAIAudioProvider(AudioProviderBase):
     """OpenAI TTS provider for podcast audio generation."""
 
+    provider_name = "openai"
+
+    # OpenAI TTS handles parallel requests well within the default rate limits
+    max_concurrent_turns = 4
+
     # Available OpenAI voices with metadata
     AVAILABLE_VOICES: ClassVar[list[dict[str, Any]]] = [
         {
@@ -131,55 +136,12 @@ class OpenAIAudioProvider(AudioProviderBase):
             )
             logger.info("OpenAI client configured: %s", self.client is not None)
 
-            # Generate audio for each turn
-            audio_segments = []
-            for idx, turn in enumerate(script.turns):
-                # Select voice based on speaker
-                voice_id = host_voice if turn.speaker == Speaker.HOST else expert_voice
-
-                # Generate audio for this turn
-                try:
-                    segment = await self._generate_turn_audio(
-                        text=turn.text,
-                        voice_id=voice_id,
-                        audio_format=audio_format,
-                    )
-                    audio_segments.append(segment)
-
-                    logger.debug(
-                        "Generated turn %d/%d (%s, %d chars)",
-                        idx + 1,
-                        len(script.turns),
-                        turn.speaker.value,
-                        len(turn.text),
-                    )
-
-                except Exception as e:
-                    raise AudioGenerationError(
-                        provider="openai",
-                        error_type="turn_generation_failed",
-                        message=f"Failed to generate audio for turn {idx + 1}: {e}",
-                        original_error=e,
-                    ) from e
-
-                # Add pause after turn (except last one)
-                if idx < len(script.turns) - 1:
-                    pause = AudioSegment.silent(duration=self.pause_duration_ms)
-                    audio_segments.append(pause)
-
-            # Combine all segments
-            combined = self._combine_segments(audio_segments)
-
-            # Export to bytes
-            buffer = io.BytesIO()
-            combined.export(buffer, format=audio_format.value)
-            audio_bytes = buffer.getvalue()
+            audio_bytes = await self._generate_dialogue_audio_bytes(script, host_voice, expert_voice, audio_format)
 
             logger.info(
-                "Generated complete podcast: %d turns, %d bytes, %.1f seconds",
+                "Generated complete podcast: %d turns, %d bytes",
                 len(script.turns),
                 len(audio_bytes),
-                len(combined) / 1000.0,  # AudioSegment length is in milliseconds
             )
 
             return audio_bytes
@@ -365,25 +327,3 @@ class OpenAIAudioProvider(AudioProviderBase):
                 e,
             )
             raise
-
-    def _combine_segments(self, segments: list[AudioSegment]) -> AudioSegment:
-        """
-        Combine audio segments into single track.
-
-        Args:
-            segments: List of AudioSegment objects
-
-        Returns:
-            Combined AudioSegment
-
-        Raises:
-            ValueError: If segments list is empty
-        """
-        if not segments:
-            raise ValueError("Cannot combine empty segments list")
-
-        combined = AudioSegment.empty()
-        for segment in segments:
-            combined += segment
-
-        return combined
@@ -0,0 +1,161 @@
+"""
+Segmented audio output with an HLS-style playlist for progressive playback.
+
+While a podcast is synthesized, ``SegmentedAudioWriter`` receives the same
+ordered audio as the full-file encoder and cuts it into fixed-length segments.
+Each segment is encoded as its own file and appended to ``playlist.m3u8`` as
+soon as it is complete, so players can start listening within seconds of
+generation starting. ``#EXT-X-ENDLIST`` is written when synthesis finishes.
+
+Segments are MP3 (HLS "packed audio") regardless of the podcast's final format,
+which also allows the segments to be concatenated into one progressive stream.
+"""
+
+import logging
+import math
+import os
+import re
+import shutil
+import tempfile
+from pathlib import Path
+
+from pydub import AudioSegment
+
+logger = logging.getLogger(__name__)
+
+PLAYLIST_NAME = "playlist.m3u8"
+PLAYLIST_MEDIA_TYPE = "application/vnd.apple.mpegurl"
+ENDLIST_TAG = "#EXT-X-ENDLIST"
+SEGMENT_NAME_PATTERN = re.compile(r"^segment_\d{5}\.(mp3|wav)$")
+
+
+def read_playlist(playlist_path: Path) -> tuple[list[str], bool]:
+    """
+    Read the segment names of a playlist.
+
+    Args:
+        playlist_path: Path of the playlist file
+
+    Returns:
+        Tuple of (segment file names in order, whether the playlist is complete).
+        A missing playlist is reported as empty and complete.
+    """
+    try:
+        lines = playlist_path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return [], True
+    segments = [line.rsplit("/", 1)[-1] for line in lines if line and not line.startswith("#")]
+    return segments, ENDLIST_TAG in lines
+
+
+class SegmentedAudioWriter:
+    """Cut an ordered audio stream into fixed-length segments plus a live playlist."""
+
+    def __init__(self, output_dir: str | Path, segment_seconds: float = 6.0, segment_format: str = "mp3") -> None:
+        """
+        Initialize the writer.
+
+        Args:
+            output_dir: Directory receiving the segments and the playlist
+            segment_seconds: Target duration of each segment
+            segment_format: Encoding of the segment files
+        """
+        self.output_dir = Path(output_dir)
+        self.segment_ms = max(int(segment_seconds * 1000), 1000)
+        self.segment_format = segment_format
+
+        self._pending = AudioSegment.empty()
+        self._segments: list[tuple[str, float]] = []
+        self._closed = False
+
+        # Remove segments of a previous attempt before players can pick them up
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def playlist_path(self) -> Path:
+        """Path of the playlist file."""
+        return self.output_dir / PLAYLIST_NAME
+
+    @property
+    def segment_count(self) -> int:
+        """Number of segments written so far."""
+        return len(self._segments)
+
+    def write(self, segment: AudioSegment) -> None:
+        """Append audio, flushing every complete segment to disk."""
+        if self._closed:
+            raise RuntimeError("Cannot write to a closed segment writer")
+        if len(self._pending) == 0:
+            self._pending = segment
+        else:
+            self._pending += segment
+        while len(self._pending) >= self.segment_ms:
+            self._flush(self._pending[: self.segment_ms])
+            self._pending = self._pending[self.segment_ms :]
+
+    def write_silence(self, duration_ms: int) -> None:
+        """Append silence, matching the format of previously written audio."""
+        if duration_ms > 0:
+            frame_rate = self._pending.frame_rate if len(self._pending) else 24000
+            self.write(AudioSegment.silent(duration=duration_ms, frame_rate=frame_rate))
+
+    def close(self) -> int:
+        """
+        Flush the last partial segment and mark the playlist complete.
+
+        Returns:
+            Number of segments written
+        """
+        if self._closed:
+            return self.segment_count
+        if len(self._pending) > 0:
+            self._flush(self._pending)
+            self._pending = AudioSegment.empty()
+        self._closed = True
+        self._write_playlist()
+        return self.segment_count
+
+    def abort(self) -> None:
+        """Stop writing and remove all segments so players stop waiting."""
+        self._closed = True
+        self._pending = AudioSegment.empty()
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def _flush(self, audio: AudioSegment) -> None:
+        name = f"segment_{len(self._segments):05d}.{self.segment_format}"
+        self._export_atomic(audio, self.output_dir / name)
+        self._segments.append((name, len(audio) / 1000.0))
+        self._write_playlist()
+        logger.debug("Wrote segment %s (%.1f sec)", name, len(audio) / 1000.0)
+
+    def _export_atomic(self, audio: AudioSegment, path: Path) -> None:
+        fd, tmp_name = tempfile.mkstemp(dir=self.output_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                # No Xing/ID3 headers so that segments can also be concatenated into one stream
+                parameters = ["-write_xing", "0", "-id3v2_version", "0"] if self.segment_format == "mp3" else None
+                audio.export(f, format=self.segment_format, parameters=parameters)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _write_playlist(self) -> None:
+        lines = [
+            "#EXTM3U",
+            "#EXT-X-VERSION:3",
+            f"#EXT-X-TARGETDURATION:{math.ceil(self.segment_ms / 1000)}",
+            "#EXT-X-MEDIA-SEQUENCE:0",
+            "#EXT-X-PLAYLIST-TYPE:EVENT",
+        ]
+        for name, duration in self._segments:
+            lines.append(f"#EXTINF:{duration:.3f},")
+            lines.append(f"segments/{name}")
+        if self._closed:
+            lines.append(ENDLIST_TAG)
+
+        fd, tmp_name = tempfile.mkstemp(dir=self.output_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp_name, self.playlist_path)
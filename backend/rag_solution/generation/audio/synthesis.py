@@ -0,0 +1,232 @@
+"""
+Concurrent, order-preserving dialogue synthesis with streaming encoding.
+
+Podcast audio used to be produced by calling the TTS provider once per turn in
+sequence, keeping every segment in memory, concatenating them and exporting the
+whole track to a ``BytesIO``. For long podcasts that means hundreds of serial
+TTS round trips and a buffer of several hundred megabytes.
+
+``synthesize_dialogue`` runs turns concurrently (bounded by ``max_concurrency``)
+and hands finished segments to a ``StreamingAudioEncoder`` strictly in script
+order. Only a small window of synthesized-but-unwritten turns is ever held in
+memory. The encoder writes PCM straight to the output file (WAV) or pipes it
+through a single ffmpeg process that encodes to the target format on the fly.
+"""
+
+import asyncio
+import logging
+import subprocess
+import wave
+from collections.abc import Awaitable, Callable, Sequence
+from pathlib import Path
+from typing import IO
+
+from pydub import AudioSegment
+
+from rag_solution.generation.audio.segmented_output import SegmentedAudioWriter
+
+logger = logging.getLogger(__name__)
+
+# Output sample width in bytes (16-bit PCM)
+SAMPLE_WIDTH = 2
+
+# How many synthesized turns may wait for earlier turns, per concurrent slot
+WINDOW_FACTOR = 2
+
+
+class StreamingAudioEncoder:
+    """Incrementally encode audio segments to a file.
+
+    The sample rate and channel count are taken from the first segment; later
+    segments are converted to match. WAV output is written directly, every other
+    format is encoded by an ffmpeg subprocess reading raw PCM from stdin.
+    """
+
+    def __init__(self, output_path: str | Path, audio_format: str) -> None:
+        """
+        Initialize the encoder.
+
+        Args:
+            output_path: File the encoded audio is written to
+            audio_format: Output format (mp3, wav, ogg, flac)
+        """
+        self.output_path = Path(output_path)
+        self.audio_format = audio_format
+        self.frame_rate: int | None = None
+        self.channels: int | None = None
+        self.duration_ms = 0
+
+        self._wave: wave.Wave_write | None = None
+        self._process: subprocess.Popen[bytes] | None = None
+        self._closed = False
+
+    def build_ffmpeg_command(self, frame_rate: int, channels: int) -> list[str]:
+        """Return the ffmpeg command encoding raw PCM from stdin to the output file."""
+        return [
+            AudioSegment.converter,
+            "-y",
+            "-loglevel",
+            "error",
+            "-f",
+            "s16le",
+            "-ar",
+            str(frame_rate),
+            "-ac",
+            str(channels),
+            "-i",
+            "pipe:0",
+            "-f",
+            self.audio_format,
+            str(self.output_path),
+        ]
+
+    def _open(self, frame_rate: int, channels: int) -> None:
+        self.frame_rate = frame_rate
+        self.channels = channels
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self.audio_format == "wav":
+            self._wave = wave.open(str(self.output_path), "wb")  # noqa: SIM115  # pylint: disable=consider-using-with
+            self._wave.setnchannels(channels)
+            self._wave.setsampwidth(SAMPLE_WIDTH)
+            self._wave.setframerate(frame_rate)
+        else:
+            self._process = subprocess.Popen(  # pylint: disable=consider-using-with
+                self.build_ffmpeg_command(frame_rate, channels),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            )
+
+    def write(self, segment: AudioSegment) -> None:
+        """
+        Append a segment to the output.
+
+        Args:
+            segment: Audio segment to append
+
+        Raises:
+            RuntimeError: If the encoder has already been closed
+        """
+        if self._closed:
+            raise RuntimeError("Cannot write to a closed encoder")
+        if self.frame_rate is None:
+            self._open(segment.frame_rate, segment.channels)
+
+        segment = segment.set_frame_rate(self.frame_rate).set_channels(self.channels).set_sample_width(SAMPLE_WIDTH)
+        if self._wave is not None:
+            self._wave.writeframes(segment.raw_data)
+        elif self._process is not None:
+            stdin: IO[bytes] = self._process.stdin  # type: ignore[assignment]
+            stdin.write(segment.raw_data)
+        self.duration_ms += len(segment)
+
+    def write_silence(self, duration_ms: int) -> None:
+        """Append silence, matching the format of previously written audio."""
+        if duration_ms > 0:
+            self.write(AudioSegment.silent(duration=duration_ms, frame_rate=self.frame_rate or 24000))
+
+    def close(self) -> int:
+        """
+        Finish encoding and return the size of the output file in bytes.
+
+        Raises:
+            ValueError: If no audio was written
+            RuntimeError: If ffmpeg failed to encode the stream
+        """
+        if self._closed:
+            return self.output_path.stat().st_size
+        self._closed = True
+
+        if self._wave is not None:
+            self._wave.close()
+        elif self._process is not None:
+            _, stderr = self._process.communicate()
+            if self._process.returncode != 0:
+                raise RuntimeError(f"ffmpeg exited with code {self._process.returncode}: {stderr.decode().strip()}")
+        else:
+            raise ValueError("No audio segments were written")
+
+        return self.output_path.stat().st_size
+
+    def abort(self) -> None:
+        """Stop encoding and remove the partial output file."""
+        self._closed = True
+        try:
+            if self._wave is not None:
+                self._wave.close()
+            elif self._process is not None:
+                self._process.kill()
+                self._process.communicate()
+        finally:
+            self.output_path.unlink(missing_ok=True)
+
+
+async def synthesize_dialogue[T](
+    turns: Sequence[T],
+    synthesize_turn: Callable[[int, T], Awaitable[AudioSegment]],
+    encoder: StreamingAudioEncoder,
+    *,
+    max_concurrency: int = 4,
+    pause_duration_ms: int = 500,
+    on_turn_complete: Callable[[int, int], Awaitable[None]] | None = None,
+    segment_writer: SegmentedAudioWriter | None = None,
+) -> None:
+    """
+    Synthesize dialogue turns concurrently and encode them in script order.
+
+    At most ``max_concurrency`` TTS calls run at once and at most
+    ``WINDOW_FACTOR * max_concurrency`` turns are in flight or buffered, so
+    memory stays bounded even if an early turn is slow. The first failing turn
+    cancels all outstanding work and its exception is propagated.
+
+    Args:
+        turns: Dialogue turns in script order
+        synthesize_turn: Coroutine function producing the audio of turn ``idx``
+        encoder: Encoder receiving the segments in order
+        max_concurrency: Maximum number of concurrent TTS calls
+        pause_duration_ms: Silence inserted between turns
+        on_turn_complete: Awaited with ``(completed_turns, total_turns)`` after each turn is encoded
+        segment_writer: Optional writer producing progressive playback segments from the same audio
+
+    Raises:
+        Exception: Whatever ``synthesize_turn`` or the encoder raised
+    """
+    total = len(turns)
+    max_concurrency = max(max_concurrency, 1)
+    window = max_concurrency * WINDOW_FACTOR
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(idx: int) -> AudioSegment:
+        async with semaphore:
+            return await synthesize_turn(idx, turns[idx])
+
+    sinks: list[StreamingAudioEncoder | SegmentedAudioWriter] = [encoder]
+    if segment_writer is not None:
+        sinks.append(segment_writer)
+
+    def write_turn(segment: AudioSegment, pause_ms: int) -> None:
+        for sink in sinks:
+            sink.write(segment)
+            if pause_ms > 0:
+                sink.write_silence(pause_ms)
+
+    pending: dict[int, asyncio.Task[AudioSegment]] = {}
+    next_to_start = 0
+    try:
+        for idx in range(total):
+            while next_to_start < total and next_to_start < idx + window:
+                pending[next_to_start] = asyncio.create_task(run(next_to_start))
+                next_to_start += 1
+
+            segment = await pending.pop(idx)
+            await asyncio.to_thread(write_turn, segment, pause_duration_ms if idx < total - 1 else 0)
+
+            logger.debug("Encoded turn %d/%d (%.1f sec)", idx + 1, total, len(segment) / 1000.0)
+            if on_turn_complete is not None:
+                await on_turn_complete(idx + 1, total)
+    finally:
+        for task in pending.values():
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending.values(), return_exceptions=True)
@@ -19,6 +19,8 @@ from rag_solution.schemas.structured_output_schema import (
 )
 
 from .base import LLMBase
+from .client_pool import credentials_version, get_client_pool
+from .rate_limiting import estimate_tokens
 
 if TYPE_CHECKING:
     from collections.abc import Generator, Sequence
@@ -41,7 +43,14 @@ class AnthropicLLM(LLMBase):
             provider = self._get_provider_config("anthropic")
             self._provider = provider
 
-            self.client = anthropic.Anthropic(api_key=str(provider.api_key), base_url=provider.base_url)
+            # The SDK client owns an HTTP connection pool, so it is shared by every provider instance
+            self.client = get_client_pool().get(
+                "anthropic",
+                "sync",
+                credentials_version(provider),
+                lambda: anthropic.Anthropic(api_key=str(provider.api_key), base_url=provider.base_url),
+                close=lambda client: client.close(),
+            )
 
             self._models = self.llm_model_service.get_models_by_provider(provider.id)
             self._initialize_default_model()
@@ -98,9 +107,11 @@ class AnthropicLLM(LLMBase):
                 return result
             else:
                 formatted_prompt = self._format_prompt(str(prompt), template, variables)
-                response = self.client.messages.create(  # type: ignore[union-attr]
-                    model=model_id, messages=[{"role": "user", "content": formatted_prompt}], **generation_params
-                )
+                tokens = estimate_tokens(formatted_prompt) + int(generation_params.get("max_tokens", 0))
+                with self.admission_controller.admit(tokens=tokens):
+                    response = self.client.messages.create(  # type: ignore[union-attr]
+                        model=model_id, messages=[{"role": "user", "content": formatted_prompt}], **generation_params
+                    )
                 content: str | None = response.content[0].text
                 if content is None:
                     raise LLMProviderError(
@@ -147,11 +158,12 @@ class AnthropicLLM(LLMBase):
                     )
                 return content.strip()
 
-        # Process prompts concurrently with a semaphore to limit concurrency
-        semaphore = asyncio.Semaphore(10)  # Limit concurrent requests
+        # Process prompts concurrently, bounded by the provider's shared admission controller
+        controller = self.admission_controller
+        max_tokens = int(generation_params.get("max_tokens", 0))
 
         async def bounded_generate(prompt: str) -> str:
-            async with semaphore:
+            async with controller.admit_async(tokens=estimate_tokens(prompt) + max_tokens):
                 return await generate_single(prompt)
 
         tasks = [bounded_generate(prompt) for prompt in prompts]
@@ -228,9 +240,11 @@ class AnthropicLLM(LLMBase):
             # For single prompt, get actual usage from API response
             if not isinstance(prompt, list):
                 formatted_prompt = self._format_prompt(str(prompt), template, variables)
-                response = self.client.messages.create(  # type: ignore[union-attr]
-                    model=model_id, messages=[{"role": "user", "content": formatted_prompt}], **generation_params
-                )
+                tokens = estimate_tokens(formatted_prompt) + int(generation_params.get("max_tokens", 0))
+                with self.admission_controller.admit(tokens=tokens):
+                    response = self.client.messages.create(  # type: ignore[union-attr]
+                        model=model_id, messages=[{"role": "user", "content": formatted_prompt}], **generation_params
+                    )
                 content: str | None = response.content[0].text
                 if content is None:
                     raise LLMProviderError(
@@ -512,9 +526,3 @@ class AnthropicLLM(LLMBase):
             }
 
         return tool
-
-    def close(self) -> None:
-        """Clean up provider resources."""
-        if hasattr(self, "client") and self.client:
-            self.client.close()
-        super().close()
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections import deque
 from collections.abc import Generator, Sequence
 from datetime import datetime
 from pathlib import Path
@@ -6,8 +7,10 @@ from typing import Any
 
 from pydantic import UUID4
 
+from core.config import get_settings
 from core.custom_exceptions import LLMProviderError
 from core.logging_utils import get_logger, setup_logging
+from rag_solution.generation.providers.rate_limiting import AdmissionController, get_admission_controller
 from rag_solution.schemas.llm_parameters_schema import LLMParametersInput
 from rag_solution.schemas.llm_provider_schema import LLMProviderConfig
 from rag_solution.schemas.llm_usage_schema import LLMUsage, ServiceType, TokenUsageStats
@@ -17,11 +20,21 @@ from rag_solution.services.llm_model_service import LLMModelService
 from rag_solution.services.llm_parameters_service import LLMParametersService
 from rag_solution.services.llm_provider_service import LLMProviderService
 from rag_solution.services.prompt_template_service import PromptTemplateService
+from rag_solution.services.usage_accounting import (
+    UsageBucket,
+    UsageCounter,
+    get_usage_accountant,
+    usage_bucket,
+    usage_stats,
+)
 from vectordbs.data_types import EmbeddingsList
 
 setup_logging(Path("logs"))
 logger = get_logger("llm.providers")
 
+# Usage records kept per provider instance; totals are kept as running counters
+RECENT_USAGE_LIMIT = 100
+
 
 class LLMBase(ABC):
     """
@@ -50,8 +63,9 @@ class LLMBase(ABC):
         self._provider_name: str = self.__class__.__name__.lower()
         self.client: Any | None = None
 
-        # Token tracking storage
-        self._usage_history: list[LLMUsage] = []
+        # Token tracking: running counters per (model, service type) and the most recent records
+        self._usage_counters: dict[UsageBucket, UsageCounter] = {}
+        self._recent_usage: deque[LLMUsage] = deque(maxlen=RECENT_USAGE_LIMIT)
 
         # Initialize client during provider creation
         self.initialize_client()
@@ -80,6 +94,11 @@ class LLMBase(ABC):
             )
         return provider
 
+    @property
+    def admission_controller(self) -> AdmissionController:
+        """Admission controller shared by every caller of this provider in the process."""
+        return get_admission_controller(self._provider_name, get_settings())
+
     @property
     def model_id(self) -> str | None:
         """Get current model ID."""
@@ -127,52 +146,32 @@ class LLMBase(ABC):
         user_id: UUID4 | None = None,
         session_id: str | None = None,
     ) -> None:
-        """Track token usage for this provider instance."""
+        """Track token usage for this provider instance and the process-wide accountant."""
         # Update user_id and session_id if provided
         if user_id is not None:
             usage.user_id = str(user_id)
         if session_id is not None:
             usage.session_id = session_id
 
-        self._usage_history.append(usage)
+        self._recent_usage.append(usage)
+        bucket = usage_bucket(usage)
+        counter = self._usage_counters.get(bucket)
+        if counter is None:
+            counter = self._usage_counters[bucket] = UsageCounter()
+        counter.add(usage)
+
+        accountant = get_usage_accountant()
+        if accountant is not None:
+            accountant.record(usage)
         self.logger.debug(f"Tracked usage: {usage.total_tokens} tokens for model {usage.model_name}")
 
     def get_recent_usage(self, limit: int = 10) -> list[LLMUsage]:
         """Get recent token usage records."""
-        return self._usage_history[-limit:] if self._usage_history else []
+        return list(self._recent_usage)[-limit:] if limit > 0 else []
 
     def get_total_usage(self) -> TokenUsageStats:
         """Get aggregated token usage statistics."""
-        if not self._usage_history:
-            return TokenUsageStats()
-
-        total_prompt = sum(usage.prompt_tokens for usage in self._usage_history)
-        total_completion = sum(usage.completion_tokens for usage in self._usage_history)
-        total_tokens = sum(usage.total_tokens for usage in self._usage_history)
-        total_calls = len(self._usage_history)
-        avg_tokens = total_tokens / total_calls if total_calls > 0 else 0.0
-
-        # Group by service type
-        by_service: dict[ServiceType | str, int] = {}
-        for usage in self._usage_history:
-            service_key = usage.service_type
-            by_service[service_key] = by_service.get(service_key, 0) + usage.total_tokens
-
-        # Group by model
-        by_model: dict[str, int] = {}
-        for usage in self._usage_history:
-            model_key = usage.model_name
-            by_model[model_key] = by_model.get(model_key, 0) + usage.total_tokens
-
-        return TokenUsageStats(
-            total_prompt_tokens=total_prompt,
-            total_completion_tokens=total_completion,
-            total_tokens=total_tokens,
-            total_calls=total_calls,
-            average_tokens_per_call=avg_tokens,
-            by_service=by_service,
-            by_model=by_model,
-        )
+        return usage_stats(self._usage_counters)
 
     @abstractmethod
     def generate_text(
@@ -0,0 +1,226 @@
+"""Process-wide pool of LLM provider SDK clients.
+
+Provider objects are cheap, but the SDK clients behind them are not: creating a
+WatsonX ``APIClient`` authenticates against IAM, and every OpenAI or Anthropic
+client owns its own HTTP connection pool. Factories are created per request and
+per service, so clients are pooled here instead and live as long as the process.
+
+Clients are keyed by ``(provider, kind, credentials version)``. The credentials
+version is a hash of the provider's endpoint and credentials, so rotating an API
+key or changing the base URL builds a new client and retires the old one. A
+client that fails its periodic health check, or is evicted after a failed
+validation, is rebuilt on next use.
+
+Retired clients are only dropped from the pool, never closed: provider instances
+keep references to the clients they were built with, and in-flight calls may
+still use them. They are released once the last reference goes away; only
+clear() at shutdown closes clients.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from core.config import get_settings
+from core.logging_utils import get_logger
+
+if TYPE_CHECKING:
+    from rag_solution.schemas.llm_provider_schema import LLMProviderConfig
+
+logger = get_logger("llm.providers.client_pool")
+
+ClientKey = tuple[str, str, str]
+
+
+def credentials_version(provider: LLMProviderConfig) -> str:
+    """Return a short fingerprint of a provider's endpoint and credentials.
+
+    Args:
+        provider: Provider configuration including credentials
+
+    Returns:
+        Hex digest that changes whenever the credentials or endpoint change
+    """
+    fields = (
+        provider.name,
+        provider.base_url,
+        provider.api_key.get_secret_value(),
+        provider.project_id,
+        provider.org_id,
+    )
+    material = "\x1f".join(str(value or "") for value in fields)
+    return hashlib.sha256(material.encode()).hexdigest()[:16]
+
+
+@dataclass
+class _PooledClient:
+    client: Any
+    close: Callable[[Any], None] | None
+    health_check: Callable[[Any], Any] | None
+    checked_at: float = field(default_factory=time.monotonic)
+
+
+class ProviderClientPool:
+    """Thread-safe pool of SDK clients shared by every provider instance in the process."""
+
+    def __init__(self, health_check_seconds: float = 300.0) -> None:
+        """Initialize the pool.
+
+        Args:
+            health_check_seconds: Minimum time between health checks of a client (0 checks on every use)
+        """
+        self.health_check_seconds = health_check_seconds
+        self._clients: dict[ClientKey, _PooledClient] = {}
+        self._build_locks: dict[ClientKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(
+        self,
+        provider_name: str,
+        kind: str,
+        version: str,
+        create: Callable[[], Any],
+        health_check: Callable[[Any], Any] | None = None,
+        close: Callable[[Any], None] | None = None,
+    ) -> Any:
+        """Return the pooled client for a key, building it on first use.
+
+        Only one thread builds a given client; concurrent callers wait for it
+        instead of authenticating in parallel.
+
+        Args:
+            provider_name: Provider name (e.g. ``"watsonx"``)
+            kind: Client kind within the provider (e.g. ``"api"`` or ``"embeddings:<model>"``)
+            version: Credentials version from credentials_version()
+            create: Builds a new client
+            health_check: Raises if a pooled client is no longer usable
+            close: Releases a client's resources when the pool is cleared
+
+        Returns:
+            The shared client
+        """
+        key: ClientKey = (provider_name.lower(), kind, version)
+        with self._lock:
+            entry = self._clients.get(key)
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+        if entry is not None and self._is_healthy(key, entry):
+            with self._lock:
+                self.hits += 1
+            return entry.client
+
+        with build_lock:
+            # Another thread may have rebuilt the client while we waited
+            with self._lock:
+                entry = self._clients.get(key)
+            if entry is not None and self._is_healthy(key, entry):
+                with self._lock:
+                    self.hits += 1
+                return entry.client
+
+            client = create()
+            logger.info("Created pooled %s client %s", provider_name, kind)
+            with self._lock:
+                self.misses += 1
+                self._clients[key] = _PooledClient(client, close, health_check)
+                # Drop clients built with rotated credentials
+                for stale in [k for k in self._clients if k[:2] == key[:2] and k != key]:
+                    del self._clients[stale]
+            return client
+
+    def evict(self, provider_name: str, kind: str | None = None) -> int:
+        """Remove the pooled clients of a provider so the next use rebuilds them.
+
+        Evicted clients are not closed, since live provider instances may still share them.
+
+        Args:
+            provider_name: Provider whose clients are evicted
+            kind: Only evict clients of this kind
+
+        Returns:
+            Number of evicted clients
+        """
+        provider_name = provider_name.lower()
+        with self._lock:
+            keys = [k for k in self._clients if k[0] == provider_name and (kind is None or k[1] == kind)]
+            for k in keys:
+                del self._clients[k]
+            self.evictions += len(keys)
+        if keys:
+            logger.info("Evicted %d pooled %s client(s)", len(keys), provider_name)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Close and remove every pooled client."""
+        with self._lock:
+            entries = list(self._clients.values())
+            self._clients.clear()
+        for entry in entries:
+            self._close(entry)
+
+    def stats(self) -> dict[str, Any]:
+        """Return pool statistics for diagnostics."""
+        with self._lock:
+            return {
+                "clients": len(self._clients),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _is_healthy(self, key: ClientKey, entry: _PooledClient) -> bool:
+        if entry.health_check is None or time.monotonic() - entry.checked_at < self.health_check_seconds:
+            return True
+        try:
+            entry.health_check(entry.client)
+            entry.checked_at = time.monotonic()
+            return True
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Justification: Any failure means the client must be rebuilt
+            logger.warning("Pooled %s client %s failed its health check: %s", key[0], key[1], e)
+            with self._lock:
+                if self._clients.get(key) is entry:
+                    del self._clients[key]
+                    self.evictions += 1
+            return False
+
+    @staticmethod
+    def _close(entry: _PooledClient) -> None:
+        if entry.close is None:
+            return
+        try:
+            entry.close(entry.client)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Justification: A client that fails to close must not break eviction
+            logger.debug("Failed to close pooled client: %s", e)
+
+
+_client_pool: ProviderClientPool | None = None
+_client_pool_lock = threading.Lock()
+
+
+def get_client_pool() -> ProviderClientPool:
+    """Return the process-wide provider client pool."""
+    global _client_pool  # pylint: disable=global-statement
+    if _client_pool is None:
+        with _client_pool_lock:
+            if _client_pool is None:
+                _client_pool = ProviderClientPool(get_settings().llm_client_health_check_seconds)
+    return _client_pool
+
+
+def reset_client_pool() -> None:
+    """Close every pooled client and discard the pool (used at shutdown and by tests)."""
+    global _client_pool  # pylint: disable=global-statement
+    with _client_pool_lock:
+        pool, _client_pool = _client_pool, None
+    if pool is not None:
+        pool.clear()
@@ -1,4 +1,9 @@
-"""Factory for creating and managing LLM provider instances."""
+"""Factory for creating and managing LLM provider instances.
+
+Provider instances are bound to the factory's database session, so they are
+cached per factory. The expensive SDK clients behind them are shared process
+wide through the client pool (see client_pool.py).
+"""
 
 from __future__ import annotations
 
@@ -8,12 +13,16 @@ from typing import TYPE_CHECKING, ClassVar
 from core.config import Settings
 from core.custom_exceptions import LLMProviderError
 from core.logging_utils import get_logger
+from rag_solution.generation.providers.client_pool import get_client_pool
+from rag_solution.services.background_tasks import default_session_factory
 from rag_solution.services.llm_model_service import LLMModelService
 from rag_solution.services.llm_parameters_service import LLMParametersService
 from rag_solution.services.llm_provider_service import LLMProviderService
 from rag_solution.services.prompt_template_service import PromptTemplateService
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from sqlalchemy.orm import Session
 
     from .base import LLMBase
@@ -125,9 +134,10 @@ class LLMProviderFactory:
                     logger.debug(f"Returning validated cached provider instance for {cache_key}")
                     return provider
                 except LLMProviderError:
-                    # Remove invalid instance from cache
+                    # Remove invalid instance and its pooled clients so both are rebuilt
                     logger.warning(f"Cached provider {cache_key} validation failed, reinitializing")
                     self.cleanup_provider(provider_name, model_id)
+                    get_client_pool().evict(provider_name)
 
             # Validate provider type exists
             if provider_name not in self._providers:
@@ -150,8 +160,12 @@ class LLMProviderFactory:
             if model_id:
                 provider.model_id = model_id
 
-            # Validate new instance
-            self._validate_provider_instance(provider, provider_name)
+            # Validate new instance; a pooled client that fails validation is not reused
+            try:
+                self._validate_provider_instance(provider, provider_name)
+            except LLMProviderError:
+                get_client_pool().evict(provider_name)
+                raise
 
             # Cache validated instance
             self._instances[cache_key] = provider
@@ -188,6 +202,24 @@ class LLMProviderFactory:
             logger.debug(f"Cleaned up provider instance for {cache_key}")
         self._instances.clear()
 
+    def warm_up(self) -> list[str]:
+        """Create every active registered provider so its pooled clients are ready.
+
+        Returns:
+            Names of the providers that were warmed up
+        """
+        warmed: list[str] = []
+        for provider in self._llm_provider_service.get_all_providers(is_active=True):
+            name = provider.name.lower()
+            if name not in self._providers:
+                continue
+            try:
+                self.get_provider(name)
+                warmed.append(name)
+            except LLMProviderError as e:
+                logger.warning(f"Provider {name} warm-up failed, it will be created on first use: {e}")
+        return warmed
+
     @classmethod
     def register_provider(cls, name: str, provider_class: type[LLMBase]) -> None:
         """
@@ -223,3 +255,29 @@ class LLMProviderFactory:
         with cls._lock:
             logger.debug(f"Listing providers: {cls._providers}")
             return cls._providers.copy()  # Return a copy to prevent modification
+
+
+def warm_up_providers(settings: Settings, session_factory: Callable[[], Session] | None = None) -> list[str]:
+    """Build the pooled clients of all active providers (blocking).
+
+    Called in the background at startup so the first requests do not pay for
+    client creation and authentication.
+
+    Args:
+        settings: Application settings
+        session_factory: Creates the database session used for the warm-up
+
+    Returns:
+        Names of the providers that were warmed up
+    """
+    db = (session_factory or default_session_factory)()
+    try:
+        warmed = LLMProviderFactory(db, settings).warm_up()
+        logger.info(f"Warmed up LLM providers: {', '.join(warmed) or 'none'}")
+        return warmed
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        # Justification: Warm-up is an optimization; providers are still created on first use
+        logger.warning(f"LLM provider warm-up failed: {e}")
+        return []
+    finally:
+        db.close()
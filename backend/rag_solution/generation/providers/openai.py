@@ -20,6 +20,8 @@ from rag_solution.schemas.structured_output_schema import (
 )
 
 from .base import LLMBase
+from .client_pool import credentials_version, get_client_pool
+from .rate_limiting import estimate_tokens
 
 if TYPE_CHECKING:
     from collections.abc import Generator, Sequence
@@ -42,11 +44,22 @@ class OpenAILLM(LLMBase):
             provider = self._get_provider_config("openai")
             self._provider = provider
 
-            self.client = OpenAI(
-                api_key=str(provider.api_key), organization=provider.org_id, base_url=provider.base_url
+            # SDK clients own HTTP connection pools, so they are shared by every provider instance
+            version = credentials_version(provider)
+            self.client = get_client_pool().get(
+                "openai",
+                "sync",
+                version,
+                lambda: OpenAI(api_key=str(provider.api_key), organization=provider.org_id, base_url=provider.base_url),
+                close=lambda client: client.close(),
             )
-            self.async_client = AsyncOpenAI(
-                api_key=str(provider.api_key), organization=provider.org_id, base_url=provider.base_url
+            self.async_client = get_client_pool().get(
+                "openai",
+                "async",
+                version,
+                lambda: AsyncOpenAI(
+                    api_key=str(provider.api_key), organization=provider.org_id, base_url=provider.base_url
+                ),
             )
 
             self._models = self.llm_model_service.get_models_by_provider(provider.id)
@@ -112,9 +125,11 @@ class OpenAILLM(LLMBase):
                 return result
             else:
                 formatted_prompt = self._format_prompt(str(prompt), template, variables)
-                response = self.client.chat.completions.create(  # type: ignore[union-attr]
-                    model=model_id, messages=[{"role": "user", "content": formatted_prompt}], **generation_params
-                )
+                tokens = estimate_tokens(formatted_prompt) + int(generation_params.get("max_tokens", 0))
+                with self.admission_controller.admit(tokens=tokens):
+                    response = self.client.chat.completions.create(  # type: ignore[union-attr]
+                        model=model_id, messages=[{"role": "user", "content": formatted_prompt}], **generation_params
+                    )
                 content: str | None = response.choices[0].message.content
                 if content is None:
                     raise LLMProviderError(
@@ -157,11 +172,12 @@ class OpenAILLM(LLMBase):
                 )
             return content.strip()
 
-        # Process prompts concurrently with a semaphore to limit concurrency
-        semaphore = asyncio.Semaphore(10)  # Limit concurrent requests
+        # Process prompts concurrently, bounded by the provider's shared admission controller
+        controller = self.admission_controller
+        max_tokens = int(generation_params.get("max_tokens", 0))
 
         async def bounded_generate(prompt: str) -> str:
-            async with semaphore:
+            async with controller.admit_async(tokens=estimate_tokens(prompt) + max_tokens):
                 return await generate_single(prompt)
 
         tasks = [bounded_generate(prompt) for prompt in prompts]
@@ -246,9 +262,11 @@ class OpenAILLM(LLMBase):
             # For single prompt, get actual usage from API response
             if not isinstance(prompt, list):
                 formatted_prompt = self._format_prompt(str(prompt), template, variables)
-                response = self.client.chat.completions.create(  # type: ignore[union-attr]
-                    model=model_id, messages=[{"role": "user", "content": formatted_prompt}], **generation_params
-                )
+                tokens = estimate_tokens(formatted_prompt) + int(generation_params.get("max_tokens", 0))
+                with self.admission_controller.admit(tokens=tokens):
+                    response = self.client.chat.completions.create(  # type: ignore[union-attr]
+                        model=model_id, messages=[{"role": "user", "content": formatted_prompt}], **generation_params
+                    )
                 content: str | None = response.choices[0].message.content
                 if content is None:
                     raise LLMProviderError(
@@ -541,11 +559,6 @@ class OpenAILLM(LLMBase):
         return schema
 
     def close(self) -> None:
-        """Clean up provider resources."""
-        if hasattr(self, "client") and self.client:
-            self.client.close()
-        if hasattr(self, "async_client") and self.async_client:
-            # Note: async_client.close() returns a coroutine, but we can't await in sync method
-            # The async client will be cleaned up when the event loop is closed
-            pass
+        """Release this instance's references; pooled clients stay open for other instances."""
+        self.async_client = None
         super().close()
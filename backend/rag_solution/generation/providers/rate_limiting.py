@@ -0,0 +1,499 @@
+"""Rate limiting and admission control shared by LLM providers.
+
+Providers used to pace remote calls with a fixed ``time.sleep`` before every
+request, which caps throughput at one request per delay even when the remote
+API has plenty of headroom. A token bucket allows bursts up to its capacity and
+then refills at a steady rate, so the long-run request rate stays within the
+limit while idle capacity is not wasted.
+
+``AdmissionController`` builds on this for text generation: every call to a
+provider in the process passes through one controller per provider, which
+enforces requests-per-minute and tokens-per-minute budgets, adapts the number
+of concurrent calls with AIMD (additive increase on success, multiplicative
+decrease on HTTP 429 or slow responses) and admits waiting callers by priority
+so interactive search is served before background podcast or question generation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import heapq
+import inspect
+import itertools
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+
+if TYPE_CHECKING:
+    from core.config import Settings
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Callers reserve tokens before a request and sleep only as long as needed
+    for the reservation to be covered.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second (0 or less disables limiting)
+            capacity: Maximum number of tokens, i.e. the allowed burst size
+        """
+        self.rate = rate
+        self.capacity = max(float(capacity), 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _reserve(self, amount: float) -> float:
+        """Take tokens and return how long the caller has to wait before using them."""
+        with self._lock:
+            self._refill()
+            self._tokens -= amount
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def try_acquire(self, amount: float = 1.0) -> bool:
+        """Take tokens only if they are available right now."""
+        if self.rate <= 0:
+            return True
+        with self._lock:
+            self._refill()
+            if self._tokens < amount:
+                return False
+            self._tokens -= amount
+            return True
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """Block until ``amount`` tokens are available.
+
+        Args:
+            amount: Number of tokens to take (e.g. 1 per request, or a token count)
+
+        Returns:
+            Seconds spent waiting
+        """
+        if self.rate <= 0:
+            return 0.0
+        wait = self._reserve(amount)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, amount: float = 1.0) -> float:
+        """Async version of acquire that does not block the event loop."""
+        if self.rate <= 0:
+            return 0.0
+        wait = self._reserve(amount)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+_buckets: dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_token_bucket(name: str, rate: float, capacity: float) -> TokenBucket:
+    """Return the process-wide token bucket registered under ``name``.
+
+    All provider instances in the process share one bucket per name, so the
+    limit holds no matter how many provider objects are created. The bucket is
+    replaced if its configuration changes.
+
+    Args:
+        name: Bucket name, e.g. ``"watsonx:embeddings"``
+        rate: Tokens added per second
+        capacity: Maximum burst size
+
+    Returns:
+        Shared TokenBucket instance
+    """
+    with _buckets_lock:
+        bucket = _buckets.get(name)
+        if bucket is None or bucket.rate != rate or bucket.capacity != max(float(capacity), 1.0):
+            bucket = TokenBucket(rate, capacity)
+            _buckets[name] = bucket
+        return bucket
+
+
+def reset_token_buckets() -> None:
+    """Discard all shared token buckets (used by tests)."""
+    with _buckets_lock:
+        _buckets.clear()
+
+
+class LLMPriority(IntEnum):
+    """Admission priority classes, lower values are admitted first."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BACKGROUND = 2
+
+
+_current_priority: ContextVar[LLMPriority | None] = ContextVar("llm_priority", default=None)
+
+
+@contextmanager
+def llm_priority(priority: LLMPriority, *, override: bool = True) -> Iterator[None]:
+    """Run LLM calls made in this context with the given admission priority.
+
+    Args:
+        priority: Priority class for calls made in the context
+        override: If False, keep a priority already chosen by an outer context
+            (e.g. a search run on behalf of background podcast generation)
+
+    Example:
+        >>> with llm_priority(LLMPriority.BACKGROUND):
+        >>>     provider.generate_text(...)
+    """
+    if not override and _current_priority.get() is not None:
+        yield
+        return
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def with_llm_priority(priority: LLMPriority, *, override: bool = True) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorator running a sync or async function under ``llm_priority(priority)``."""
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+                with llm_priority(priority, override=override):
+                    return await func(*args, **kwargs)  # type: ignore[misc]
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with llm_priority(priority, override=override):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def get_llm_priority() -> LLMPriority:
+    """Return the admission priority of the current context."""
+    priority = _current_priority.get()
+    return LLMPriority.NORMAL if priority is None else priority
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token) for rate budgeting."""
+    return len(text) // 4 + 1
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Return True if an exception signals that the provider is rate limiting us."""
+    if getattr(error, "status_code", None) == 429:
+        return True
+    message = str(error).lower()
+    return "429" in message or "rate_limit" in message or "rate limit" in message
+
+
+class _Waiter:
+    """A caller queued for admission, woken either via an Event or an asyncio Future."""
+
+    __slots__ = ("cancelled", "event", "future", "granted", "loop", "slots")
+
+    def __init__(
+        self,
+        slots: int,
+        event: threading.Event | None = None,
+        loop: asyncio.AbstractEventLoop | None = None,
+        future: asyncio.Future[None] | None = None,
+    ) -> None:
+        self.slots = slots
+        self.event = event
+        self.loop = loop
+        self.future = future
+        self.granted = False
+        self.cancelled = False
+
+    def wake(self) -> None:
+        if self.event is not None:
+            self.event.set()
+        elif self.loop is not None and self.future is not None:
+            self.loop.call_soon_threadsafe(_resolve, self.future)
+
+
+def _resolve(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class AdmissionController:
+    """Process-wide admission control for one LLM provider.
+
+    Callers hold one or more concurrency *slots* for the duration of a provider
+    call. The number of available slots adapts between ``min_concurrency`` and
+    ``max_concurrency``: each successful call adds ``1 / limit`` (roughly +1 per
+    round trip of the whole window), while a rate limit error or a call slower
+    than ``target_latency_seconds`` halves it. When no slot is free, callers queue
+    and are admitted strictly by priority, then arrival order.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-instance-attributes
+    def __init__(
+        self,
+        name: str,
+        *,
+        requests_per_minute: float = 0,
+        tokens_per_minute: float = 0,
+        min_concurrency: int = 1,
+        max_concurrency: int = 8,
+        target_latency_seconds: float = 0,
+        decrease_factor: float = 0.5,
+    ) -> None:
+        """Initialize the controller.
+
+        Args:
+            name: Provider name, used for diagnostics
+            requests_per_minute: Request budget (0 disables the limit)
+            tokens_per_minute: Token budget (0 disables the limit)
+            min_concurrency: Lower bound of the adaptive concurrency limit
+            max_concurrency: Upper bound and initial value of the concurrency limit
+            target_latency_seconds: Calls slower than this shrink the limit (0 disables)
+            decrease_factor: Multiplier applied to the limit on congestion
+        """
+        self.name = name
+        self.min_concurrency = max(1, min_concurrency)
+        self.max_concurrency = max(self.min_concurrency, max_concurrency)
+        self.target_latency_seconds = target_latency_seconds
+        self.decrease_factor = decrease_factor
+
+        # Budgets allow a burst of up to ten seconds worth of traffic
+        self.requests = TokenBucket(requests_per_minute / 60, max(1.0, requests_per_minute / 6))
+        self.tokens = TokenBucket(tokens_per_minute / 60, max(1.0, tokens_per_minute / 6))
+
+        self._limit = float(self.max_concurrency)
+        self._in_flight = 0
+        self._waiters: list[tuple[int, int, _Waiter]] = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+        self.rate_limited = 0
+
+    @property
+    def concurrency_limit(self) -> int:
+        """Current adaptive concurrency limit."""
+        return max(self.min_concurrency, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        """Number of slots currently held."""
+        return self._in_flight
+
+    # Slots
+
+    def _try_acquire_locked(self, slots: int) -> bool:
+        if not self._waiters and (self._in_flight == 0 or self._in_flight + slots <= self.concurrency_limit):
+            self._in_flight += slots
+            return True
+        return False
+
+    def _dispatch_locked(self) -> None:
+        """Admit queued callers while slots are available (caller holds the lock)."""
+        while self._waiters:
+            waiter = self._waiters[0][2]
+            if waiter.cancelled:
+                heapq.heappop(self._waiters)
+                continue
+            if self._in_flight and self._in_flight + waiter.slots > self.concurrency_limit:
+                return
+            heapq.heappop(self._waiters)
+            self._in_flight += waiter.slots
+            waiter.granted = True
+            waiter.wake()
+
+    def _enqueue_locked(self, waiter: _Waiter, priority: LLMPriority) -> None:
+        heapq.heappush(self._waiters, (int(priority), next(self._sequence), waiter))
+
+    def _acquire_slots(self, slots: int, priority: LLMPriority) -> None:
+        with self._lock:
+            if self._try_acquire_locked(slots):
+                return
+            waiter = _Waiter(slots, event=threading.Event())
+            self._enqueue_locked(waiter, priority)
+        waiter.event.wait()  # type: ignore[union-attr]
+
+    async def _acquire_slots_async(self, slots: int, priority: LLMPriority) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._try_acquire_locked(slots):
+                return
+            waiter = _Waiter(slots, loop=loop, future=loop.create_future())
+            self._enqueue_locked(waiter, priority)
+        try:
+            await waiter.future  # type: ignore[misc]
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter.granted:
+                    self._in_flight -= slots
+                    self._dispatch_locked()
+                else:
+                    waiter.cancelled = True
+            raise
+
+    def _release_slots(self, slots: int) -> None:
+        with self._lock:
+            self._in_flight -= slots
+            self._dispatch_locked()
+
+    # AIMD feedback
+
+    def record_success(self, latency: float) -> None:
+        """Grow the concurrency limit after a call, or shrink it if the call was slow."""
+        with self._lock:
+            if self.target_latency_seconds > 0 and latency > self.target_latency_seconds:
+                self._limit = max(float(self.min_concurrency), self._limit * self.decrease_factor)
+            else:
+                self._limit = min(float(self.max_concurrency), self._limit + 1 / self._limit)
+            self._dispatch_locked()
+
+    def record_rate_limited(self) -> None:
+        """Shrink the concurrency limit after the provider rejected a call with 429."""
+        with self._lock:
+            self.rate_limited += 1
+            self._limit = max(float(self.min_concurrency), self._limit * self.decrease_factor)
+
+    def _record_outcome(self, error: BaseException | None, start: float) -> None:
+        if error is None:
+            self.record_success(time.monotonic() - start)
+        elif is_rate_limit_error(error):
+            self.record_rate_limited()
+
+    # Admission
+
+    @contextmanager
+    def admit(
+        self,
+        tokens: int = 0,
+        *,
+        requests: int = 1,
+        slots: int = 1,
+        priority: LLMPriority | None = None,
+    ) -> Iterator[int]:
+        """Hold admission for the duration of a provider call.
+
+        Args:
+            tokens: Estimated prompt plus completion tokens of the call
+            requests: Number of remote requests the call makes (e.g. batch size)
+            slots: Concurrency slots the call occupies, capped at the current limit
+            priority: Admission priority (defaults to the context's priority)
+
+        Yields:
+            Number of slots granted; batch APIs can use it as their own concurrency
+        """
+        priority = get_llm_priority() if priority is None else priority
+        slots = max(1, min(slots, self.concurrency_limit))
+        self._acquire_slots(slots, priority)
+        try:
+            self.requests.acquire(requests)
+            if tokens:
+                self.tokens.acquire(tokens)
+            start = time.monotonic()
+            try:
+                yield slots
+            except BaseException as e:
+                self._record_outcome(e, start)
+                raise
+            self._record_outcome(None, start)
+        finally:
+            self._release_slots(slots)
+
+    @asynccontextmanager
+    async def admit_async(
+        self,
+        tokens: int = 0,
+        *,
+        requests: int = 1,
+        slots: int = 1,
+        priority: LLMPriority | None = None,
+    ) -> AsyncIterator[int]:
+        """Async version of admit that does not block the event loop."""
+        priority = get_llm_priority() if priority is None else priority
+        slots = max(1, min(slots, self.concurrency_limit))
+        await self._acquire_slots_async(slots, priority)
+        try:
+            await self.requests.acquire_async(requests)
+            if tokens:
+                await self.tokens.acquire_async(tokens)
+            start = time.monotonic()
+            try:
+                yield slots
+            except BaseException as e:
+                self._record_outcome(e, start)
+                raise
+            self._record_outcome(None, start)
+        finally:
+            self._release_slots(slots)
+
+
+_controllers: dict[str, tuple[tuple[float, ...], AdmissionController]] = {}
+_controllers_lock = threading.Lock()
+
+
+def get_admission_controller(name: str, settings: Settings) -> AdmissionController:
+    """Return the process-wide admission controller of a provider.
+
+    Args:
+        name: Provider name (e.g. ``"watsonx"``)
+        settings: Application settings providing the limits
+
+    Returns:
+        Shared AdmissionController instance, replaced if the limits changed
+    """
+    config = (
+        float(settings.llm_requests_per_minute),
+        float(settings.llm_tokens_per_minute),
+        float(settings.llm_min_concurrency),
+        float(settings.llm_concurrency),
+        float(settings.llm_target_latency_seconds),
+    )
+    with _controllers_lock:
+        entry = _controllers.get(name)
+        if entry is None or entry[0] != config:
+            controller = AdmissionController(
+                name,
+                requests_per_minute=settings.llm_requests_per_minute,
+                tokens_per_minute=settings.llm_tokens_per_minute,
+                min_concurrency=settings.llm_min_concurrency,
+                max_concurrency=settings.llm_concurrency,
+                target_latency_seconds=settings.llm_target_latency_seconds,
+            )
+            entry = (config, controller)
+            _controllers[name] = entry
+        return entry[1]
+
+
+def reset_admission_controllers() -> None:
+    """Discard all shared admission controllers (used by tests)."""
+    with _controllers_lock:
+        _controllers.clear()
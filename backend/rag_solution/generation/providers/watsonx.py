@@ -29,21 +29,15 @@ from rag_solution.schemas.structured_output_schema import (
     StructuredAnswer,
     StructuredOutputConfig,
 )
+from rag_solution.services.tokenizer_service import get_tokenizer_service
 from vectordbs.data_types import EmbeddingsList
 
 from .base import LLMBase
+from .client_pool import credentials_version, get_client_pool
+from .rate_limiting import estimate_tokens, get_token_bucket
 
 logger = get_logger("llm.providers.watsonx")
 
-# Try to import tiktoken for accurate token counting
-try:
-    import tiktoken
-
-    TIKTOKEN_AVAILABLE = True
-except ImportError:
-    TIKTOKEN_AVAILABLE = False
-    logger.warning("tiktoken not available, using fallback token estimation")
-
 
 class WatsonXLLM(LLMBase):
     """WatsonX provider implementation using IBM watsonx.ai API."""
@@ -72,8 +66,15 @@ class WatsonXLLM(LLMBase):
                 credentials = Credentials(api_key=api_key_value, url=str(self._provider.base_url))
                 logger.debug("Created IBM credentials")
 
-                self.client = APIClient(project_id=str(self._provider.project_id), credentials=credentials)
-                logger.debug("Created IBM API client")
+                # Authenticating is expensive, so the API client is shared by every provider instance
+                self.client = get_client_pool().get(
+                    "watsonx",
+                    "api",
+                    credentials_version(self._provider),
+                    lambda: APIClient(project_id=str(self._provider.project_id), credentials=credentials),
+                    health_check=lambda client: client.token,
+                )
+                logger.debug("Using pooled IBM API client")
             except Exception as e:
                 logger.error("Error creating IBM client: %s", e)
                 raise
@@ -107,14 +108,18 @@ class WatsonXLLM(LLMBase):
                 concurrency_limit,
             )
 
-            self.embeddings_client = wx_Embeddings(
-                model_id=str(embedding_model.model_id),
-                project_id=str(self._provider.project_id),
-                credentials=Credentials(
-                    api_key=self._provider.api_key.get_secret_value(),
-                    url=str(self._provider.base_url),
+            api_client = self.client
+            # The embeddings client wraps the API client, so it is keyed on that client too:
+            # rebuilding the pooled API client also rebuilds the embeddings client
+            self.embeddings_client = get_client_pool().get(
+                "watsonx",
+                f"embeddings:{embedding_model.model_id}",
+                f"{credentials_version(self._provider)}:{id(api_client)}",
+                lambda: wx_Embeddings(
+                    model_id=str(embedding_model.model_id),
+                    api_client=api_client,
+                    params={EmbedParams.RETURN_OPTIONS: {"input_text": True}},
                 ),
-                params={EmbedParams.RETURN_OPTIONS: {"input_text": True}},
             )
             logger.debug("Embeddings client: %s", self.embeddings_client)
         else:
@@ -139,21 +144,24 @@ class WatsonXLLM(LLMBase):
             delay_time,
         )
 
+        # Reuse the pooled, already authenticated API client instead of authenticating per call
         model = ModelInference(
             model_id=str(model_id),
-            project_id=str(self._provider.project_id),
-            credentials=Credentials(
-                api_key=self._provider.api_key.get_secret_value(),
-                url=str(self._provider.base_url),
-            ),
+            api_client=self.client,
             params=params,  # Pass params during initialization like direct test
+            validate=False,
         )
-        model.set_api_client(api_client=self.client)
 
         logger.info("Model ID: %s", model_id)
         logger.info("Model parameters: %s", model.params)
         return model
 
+    @staticmethod
+    def _max_new_tokens(model: ModelInference) -> int:
+        """Return the completion token limit configured on a model, for rate budgeting."""
+        params = model.params if isinstance(model.params, dict) else {}
+        return int(params.get(GenParams.MAX_NEW_TOKENS) or 0)
+
     def _get_default_model_id(self) -> str:
         """
         Get default model from configuration.
@@ -247,10 +255,16 @@ class WatsonXLLM(LLMBase):
                         formatted_prompts.append(formatted)
                         logger.debug("Formatted prompt: %s...", formatted[:200])  # Log first 200 chars
 
-                response = model.generate_text(
-                    prompt=formatted_prompts,
-                    concurrency_limit=8,  # Max concurrency limit
-                )
+                # The batch holds as many admission slots as the SDK runs requests in parallel
+                max_new_tokens = self._max_new_tokens(model)
+                tokens = sum(estimate_tokens(p) + max_new_tokens for p in formatted_prompts)
+                with self.admission_controller.admit(
+                    tokens=tokens, requests=len(formatted_prompts), slots=len(formatted_prompts)
+                ) as concurrency_limit:
+                    response = model.generate_text(
+                        prompt=formatted_prompts,
+                        concurrency_limit=concurrency_limit,
+                    )
 
                 logger.debug("Response from IBM watsonx: %s", response)
                 if isinstance(response, dict) and "results" in response:
@@ -307,7 +321,9 @@ class WatsonXLLM(LLMBase):
                 except Exception as e:
                     logger.warning("Failed to save prompt to file: %s", e)
 
-                response = model.generate_text(prompt=formatted_prompt)
+                tokens = estimate_tokens(formatted_prompt) + self._max_new_tokens(model)
+                with self.admission_controller.admit(tokens=tokens):
+                    response = model.generate_text(prompt=formatted_prompt)
                 logger.debug("Response from model: %s", response)
 
                 result: str
@@ -411,13 +427,22 @@ class WatsonXLLM(LLMBase):
                 if len(texts) > 5:
                     logger.debug("... and %d more texts", len(texts) - 5)
 
-            # Add a configurable delay to prevent rate limiting
+            # Pace requests with a process-wide token bucket to prevent rate limiting.
+            # embedding_request_delay is the average spacing between requests; bursts
+            # up to embedding_rate_limit_burst go out without waiting.
             settings = get_settings()
             request_delay = getattr(settings, "embedding_request_delay", 0.2)
             max_retries = getattr(settings, "embedding_max_retries", 10)
             delay_time = getattr(settings, "embedding_delay_time", 0.5)
 
-            time.sleep(request_delay)
+            rate_limiter = get_token_bucket(
+                f"{self._provider_name}:embeddings",
+                rate=1.0 / request_delay if request_delay > 0 else 0.0,
+                capacity=getattr(settings, "embedding_rate_limit_burst", 4),
+            )
+            waited = rate_limiter.acquire()
+            if waited > 0:
+                logger.debug("Embedding request rate limited for %.3fs", waited)
 
             # Implement our own retry mechanism with exponential backoff
             last_exception = None
@@ -522,29 +547,15 @@ class WatsonXLLM(LLMBase):
             ) from e
 
     def _estimate_tokens(self, text: str) -> int:
-        """Estimate token count for text using tiktoken if available.
+        """Count tokens of text with the shared, cached tokenizer.
 
         Args:
-            text: Text to estimate tokens for
+            text: Text to count tokens for
 
         Returns:
-            Estimated token count
-
-        Note:
-            Uses tiktoken with cl100k_base encoding if available,
-            otherwise falls back to character-based estimation.
-            Average English: ~4.7 chars/word, ~1.3 tokens/word = ~3.6 chars/token
+            Token count (character-based estimate if no tokenizer is available)
         """
-        if TIKTOKEN_AVAILABLE:
-            try:
-                encoder = tiktoken.get_encoding("cl100k_base")
-                return len(encoder.encode(text))
-            except Exception as e:
-                logger.warning(f"tiktoken encoding failed, using fallback: {e}")
-
-        # Fallback: improved character-based estimation
-        # 3.6 chars/token is more accurate than 4 chars/token
-        return int(len(text) / 3.6)
+        return get_tokenizer_service().count_tokens(text, model_id=self.model_id)
 
     def _extract_json_from_text(self, text: str) -> dict[str, Any]:
         """Extract JSON from text with multiple fallback strategies.
@@ -709,7 +720,9 @@ Provide a detailed answer with citations from the context documents."""
 
             # Generate with chat API
             logger.info("Generating structured output with guided_json schema enforcement")
-            response = model.chat(messages=messages, params=chat_params)
+            tokens = estimate_tokens(system_message + user_message) + int(chat_params.max_tokens or 0)
+            with self.admission_controller.admit(tokens=tokens):
+                response = model.chat(messages=messages, params=chat_params)
 
             # Extract response text
             if isinstance(response, dict) and "choices" in response:
@@ -914,7 +927,7 @@ Provide a detailed answer with citations from the context documents."""
         return "\n".join(prompt_parts)
 
     def close(self) -> None:
-        """Clean up provider resources."""
+        """Release this instance's references; pooled clients stay open for other instances."""
         if hasattr(self, "embeddings_client"):
             self.embeddings_client = None
         super().close()
@@ -10,10 +10,12 @@ from rag_solution.models.collection import Collection
 
 # Conversation models (unified in conversation.py)
 from rag_solution.models.conversation import ConversationMessage, ConversationSession, ConversationSummary
+from rag_solution.models.evaluation_result import EvaluationResult
 
 # Then File since it's referenced by Collection
 from rag_solution.models.file import File
 from rag_solution.models.llm_parameters import LLMParameters
+from rag_solution.models.llm_usage_total import LLMUsageTotal
 from rag_solution.models.podcast import Podcast
 from rag_solution.models.prompt_template import PromptTemplate
 from rag_solution.models.question import SuggestedQuestion
@@ -37,8 +39,10 @@ __all__ = [
     "ConversationMessage",
     "ConversationSession",
     "ConversationSummary",
+    "EvaluationResult",
     "File",
     "LLMParameters",
+    "LLMUsageTotal",
     "Podcast",
     "PromptTemplate",
     "RuntimeConfig",
@@ -14,7 +14,7 @@ import uuid
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, ClassVar
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -49,7 +49,11 @@ class ConversationSession(Base):
     """
 
     __tablename__ = "conversation_sessions"
-    __table_args__: ClassVar[dict] = {"extend_existing": True}
+    __table_args__: ClassVar[tuple] = (
+        # Keyset pagination of a user's sessions by (created_at, id)
+        Index("ix_conversation_sessions_user_created_id", "user_id", "created_at", "id"),
+        {"extend_existing": True},
+    )
 
     # Primary key
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=IdentityService.generate_id)
@@ -123,7 +127,11 @@ class ConversationMessage(Base):
     """
 
     __tablename__ = "conversation_messages"
-    __table_args__: ClassVar[dict] = {"extend_existing": True}
+    __table_args__: ClassVar[tuple] = (
+        # Keyset pagination of a session's messages; also answers message counts from the index alone
+        Index("ix_conversation_messages_session_created_id", "session_id", "created_at", "id"),
+        {"extend_existing": True},
+    )
 
     # Primary key
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=IdentityService.generate_id)
@@ -0,0 +1,47 @@
+"""Evaluation result model for persisting LLM-as-judge scores of searches."""
+
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy import JSON, DateTime, Float, Index, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.identity_service import IdentityService
+from rag_solution.file_management.database import Base
+
+
+class EvaluationResult(Base):
+    """Model for storing the judge scores of one search answer.
+
+    Rows are written asynchronously by the evaluation queue after the search
+    response has been returned, and are aggregated per pipeline for the
+    dashboard quality metrics.
+    """
+
+    __tablename__ = "evaluation_results"
+    __table_args__ = (Index("ix_evaluation_results_pipeline_created", "pipeline_id", "created_at"),)
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=IdentityService.generate_id)
+    search_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False, unique=True)
+    pipeline_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    collection_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True, index=True)
+    user_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True, index=True)
+    question: Mapped[str] = mapped_column(Text, nullable=False)
+    faithfulness: Mapped[float | None] = mapped_column(Float, nullable=True)
+    answer_relevance: Mapped[float | None] = mapped_column(Float, nullable=True)
+    context_relevance: Mapped[float | None] = mapped_column(Float, nullable=True)
+    overall_score: Mapped[float | None] = mapped_column(Float, nullable=True)
+    details: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    judge_model: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    error: Mapped[str | None] = mapped_column(String(1000), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=lambda: datetime.now(UTC), index=True
+    )
+
+    def __repr__(self) -> str:
+        """String representation of EvaluationResult."""
+        return (
+            f"<EvaluationResult(search_id={self.search_id}, pipeline_id={self.pipeline_id}, "
+            f"overall_score={self.overall_score})>"
+        )
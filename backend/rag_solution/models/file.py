@@ -3,7 +3,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import JSON, DateTime, ForeignKey, String
+from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -23,6 +23,8 @@ class File(Base):
     file_path: Mapped[str] = mapped_column(String, index=True)
     file_type: Mapped[str] = mapped_column(String)
     document_id: Mapped[str] = mapped_column(String, nullable=True)  # Add this line
+    # Number of chunks stored in the vector store, written at ingest time (see CollectionRepository)
+    chunk_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     file_metadata: Mapped[JSON] = mapped_column(JSON, nullable=False, default=dict)  # Provide a default empty dict
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, onupdate=datetime.now)
@@ -0,0 +1,38 @@
+"""Model for running LLM token usage totals."""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, String, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from rag_solution.file_management.database import Base
+
+
+class LLMUsageTotal(Base):
+    """Running token usage totals per user, model and service type.
+
+    One row per (user, model, service type), incremented in batches by
+    UsageAccountant.flush() rather than one row per LLM call.
+    """
+
+    __tablename__ = "llm_usage_totals"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    model_name: Mapped[str] = mapped_column(String(255), primary_key=True)
+    service_type: Mapped[str] = mapped_column(String(50), primary_key=True)
+    prompt_tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    completion_tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    total_tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    calls: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    def __repr__(self) -> str:
+        """String representation of LLMUsageTotal."""
+        return (
+            f"<LLMUsageTotal(user_id={self.user_id}, model='{self.model_name}', "
+            f"service='{self.service_type}', tokens={self.total_tokens}, calls={self.calls})>"
+        )
@@ -3,17 +3,24 @@
 import builtins
 import logging
 import os
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from pydantic import UUID4
+from sqlalchemy import case, func, select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 
+from rag_solution.core.collection_access_cache import invalidate_collection_access
 from rag_solution.core.exceptions import AlreadyExistsError, NotFoundError, ValidationError
+from rag_solution.file_management.database import require_async_session
 from rag_solution.models.collection import Collection
+from rag_solution.models.file import File
 from rag_solution.models.user_collection import UserCollection
-from rag_solution.schemas.collection_schema import CollectionInput, CollectionOutput, FileInfo
+from rag_solution.schemas.collection_schema import CollectionInput, CollectionOutput, CollectionSummary, FileInfo
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
@@ -21,14 +28,16 @@ logger = logging.getLogger(__name__)
 class CollectionRepository:
     """Repository for managing Collection entities in the database."""
 
-    def __init__(self: Any, db: Session) -> None:
+    def __init__(self: Any, db: Session, async_db: "AsyncSession | None" = None) -> None:
         """
         Initialize the CollectionRepository.
 
         Args:
             db (Session): The database session.
+            async_db (AsyncSession | None): Optional async session for the ``*_async`` methods.
         """
         self.db = db
+        self.async_db = async_db
 
     def create(self, collection: CollectionInput, vector_db_name: str) -> CollectionOutput:
         """
@@ -118,6 +127,95 @@ class CollectionRepository:
         """Get collection without loading relationships. For pipeline use."""
         return self.db.query(Collection).filter(Collection.id == collection_id).first()
 
+    def get_summary(self, collection_id: UUID4) -> CollectionSummary:
+        """
+        Retrieve the collection row with its materialized chunk stats.
+
+        Unlike get(), files and users are not loaded.
+
+        Args:
+            collection_id (UUID): The ID of the collection to retrieve.
+
+        Returns:
+            CollectionSummary: The collection summary.
+
+        Raises:
+            NotFoundError: If the collection does not exist.
+            SQLAlchemyError: If there's a database error.
+        """
+        try:
+            collection = self.db.query(Collection).filter(Collection.id == collection_id).first()
+            if not collection:
+                raise NotFoundError(resource_type="Collection", resource_id=str(collection_id))
+            return CollectionSummary.model_validate(collection)
+        except SQLAlchemyError as e:
+            logger.error("Error getting collection summary %s: %s", str(collection_id), str(e))
+            raise
+
+    def record_chunk_counts(
+        self,
+        collection_id: UUID4,
+        chunk_counts: dict[str, int],
+        *,
+        replace: bool = False,
+        reconciled: bool = False,
+    ) -> None:
+        """
+        Store per-document chunk counts and refresh the collection stats in one transaction.
+
+        Args:
+            collection_id (UUID): The ID of the collection.
+            chunk_counts (dict): Number of chunks stored in the vector store per document ID.
+            replace (bool): Reset documents missing from chunk_counts to zero chunks.
+            reconciled (bool): The counts were read back from the vector store.
+
+        Raises:
+            SQLAlchemyError: If there's a database error.
+        """
+        try:
+            files = self.db.query(File).filter(File.collection_id == collection_id)
+            if replace:
+                files.update({File.chunk_count: 0}, synchronize_session=False)
+            if chunk_counts:
+                files.filter(File.document_id.in_(list(chunk_counts))).update(
+                    {File.chunk_count: case(chunk_counts, value=File.document_id, else_=File.chunk_count)},
+                    synchronize_session=False,
+                )
+            self.refresh_stats(collection_id, reconciled=reconciled)
+            self.db.commit()
+        except SQLAlchemyError as e:
+            logger.error("Error recording chunk counts for collection %s: %s", str(collection_id), str(e))
+            self.db.rollback()
+            raise
+
+    def refresh_stats(self, collection_id: UUID4, *, reconciled: bool = False) -> None:
+        """
+        Recompute the collection's document and chunk counts from its files.
+
+        Does not commit, so callers can include it in the transaction that changed the files.
+
+        Args:
+            collection_id (UUID): The ID of the collection.
+            reconciled (bool): Also stamp the stats as reconciled against the vector store.
+        """
+        document_count, chunk_count = (
+            self.db.query(
+                func.count(File.id).filter(File.chunk_count > 0),
+                func.coalesce(func.sum(File.chunk_count), 0),
+            )
+            .filter(File.collection_id == collection_id)
+            .one()
+        )
+        now = func.now()
+        values: dict[Any, Any] = {
+            Collection.document_count: document_count,
+            Collection.chunk_count: chunk_count,
+            Collection.stats_updated_at: now,
+        }
+        if reconciled:
+            values[Collection.stats_reconciled_at] = now
+        self.db.query(Collection).filter(Collection.id == collection_id).update(values, synchronize_session=False)
+
     def get_user_collections(self, user_id: UUID4) -> list[CollectionOutput]:
         """Get all collections for a specific user.
 
@@ -146,6 +244,25 @@ class CollectionRepository:
             logger.error("Error getting collections for user %s: %s", str(user_id), str(e))
             raise
 
+    async def get_user_collections_async(self, user_id: UUID4) -> list[CollectionOutput]:
+        """Async variant of :meth:`get_user_collections` using ``async_db``.
+
+        Raises:
+            SQLAlchemyError: If there's a database error
+        """
+        db = require_async_session(self.async_db)
+        try:
+            result = await db.execute(
+                select(Collection)
+                .options(selectinload(Collection.users), selectinload(Collection.files))
+                .join(UserCollection)
+                .where(UserCollection.user_id == user_id)
+            )
+            return [self._collection_to_output(collection) for collection in result.scalars().all()]
+        except SQLAlchemyError as e:
+            logger.error("Error getting collections for user %s: %s", str(user_id), str(e))
+            raise
+
     def get_by_name(self, name: str) -> CollectionOutput | None:
         """Get a collection by name.
 
@@ -196,6 +313,7 @@ class CollectionRepository:
             for key, value in collection_update.items():
                 setattr(collection, key, value)
             self.db.commit()
+            invalidate_collection_access(collection_id)
             # Refresh with relationships loaded
             collection = (
                 self.db.query(Collection)
@@ -232,6 +350,7 @@ class CollectionRepository:
             if collection:
                 self.db.delete(collection)
                 self.db.commit()
+                invalidate_collection_access(collection_id)
                 return True
             return False
         except (NotFoundError, AlreadyExistsError, ValidationError):
@@ -322,7 +441,8 @@ class CollectionRepository:
                     id=file.id,
                     filename=file.filename,
                     file_size_bytes=CollectionRepository._get_file_size(file.file_path),
-                    document_id=file.document_id,  # Include document_id for chunk counting
+                    chunk_count=file.chunk_count or 0,
+                    document_id=file.document_id,
                 )
                 for file in collection.files or []
             ],
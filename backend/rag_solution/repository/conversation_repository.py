@@ -14,16 +14,18 @@ Performance Benefits:
 - Response time: 156ms → 3ms (98% improvement)
 """
 
-from typing import Any
+from collections.abc import AsyncIterator, Iterator
+from typing import TYPE_CHECKING, Any
 
 from pydantic import UUID4
-from sqlalchemy import func, select
+from sqlalchemy import ScalarSelect, Select, func, select, tuple_
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
 
 from core.custom_exceptions import RepositoryError
 from core.logging_utils import get_logger
 from rag_solution.core.exceptions import AlreadyExistsError, NotFoundError
+from rag_solution.file_management.database import require_async_session
 from rag_solution.models.conversation import ConversationMessage, ConversationSession, ConversationSummary
 from rag_solution.schemas.conversation_schema import (
     ConversationMessageInput,
@@ -31,12 +33,68 @@ from rag_solution.schemas.conversation_schema import (
     ConversationSessionOutput,
     ConversationSummaryInput,
     ConversationSummaryOutput,
+    PageCursor,
     SummarizationStrategy,
 )
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
 logger = get_logger(__name__)
 
 
+def _message_count() -> ScalarSelect[int]:
+    """Correlated subquery counting a session's messages without loading them."""
+    return (
+        select(func.count(ConversationMessage.id))
+        .where(ConversationMessage.session_id == ConversationSession.id)
+        .correlate(ConversationSession)
+        .scalar_subquery()
+    )
+
+
+# Columns read for message list views; message_metadata (sources, CoT output) is left out
+_MESSAGE_LIST_COLUMNS = (
+    ConversationMessage.id,
+    ConversationMessage.session_id,
+    ConversationMessage.content,
+    ConversationMessage.role,
+    ConversationMessage.message_type,
+    ConversationMessage.created_at,
+    ConversationMessage.token_count,
+    ConversationMessage.execution_time,
+)
+
+
+def _sessions_by_user_statement(
+    user_id: UUID4, limit: int, offset: int, after: PageCursor | None, collection_id: UUID4 | None
+) -> Select[ConversationSession, int]:
+    """Newest-first page of a user's sessions with their message counts."""
+    statement = select(ConversationSession, _message_count()).where(ConversationSession.user_id == user_id)
+    if collection_id is not None:
+        statement = statement.where(ConversationSession.collection_id == collection_id)
+    if after is not None:
+        statement = statement.where(
+            tuple_(ConversationSession.created_at, ConversationSession.id) < tuple_(after.created_at, after.id)
+        )
+    statement = statement.order_by(ConversationSession.created_at.desc(), ConversationSession.id.desc()).limit(limit)
+    return statement.offset(offset) if offset else statement
+
+
+def _messages_by_session_statement(
+    session_id: UUID4, limit: int, offset: int, after: PageCursor | None, include_metadata: bool
+) -> Select:
+    """Oldest-first page of a session's messages, as models or as list-view rows."""
+    statement = select(ConversationMessage) if include_metadata else select(*_MESSAGE_LIST_COLUMNS)
+    statement = statement.where(ConversationMessage.session_id == session_id)
+    if after is not None:
+        statement = statement.where(
+            tuple_(ConversationMessage.created_at, ConversationMessage.id) > tuple_(after.created_at, after.id)
+        )
+    statement = statement.order_by(ConversationMessage.created_at.asc(), ConversationMessage.id.asc()).limit(limit)
+    return statement.offset(offset) if offset else statement
+
+
 class ConversationRepository:
     """Unified repository for all conversation-related database operations.
 
@@ -44,13 +102,15 @@ class ConversationRepository:
     messages, and summaries with optimized eager loading to prevent N+1 queries.
     """
 
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: Session, async_db: "AsyncSession | None" = None) -> None:
         """Initialize with database session.
 
         Args:
             db: SQLAlchemy database session
+            async_db: Optional async session for the non-blocking ``*_async`` reads
         """
         self.db = db
+        self.async_db = async_db
 
     # ============================================================================
     # SESSION OPERATIONS
@@ -113,92 +173,73 @@ class ConversationRepository:
             raise RepositoryError(f"Failed to create conversation session: {e}") from e
 
     def get_session_by_id(self, session_id: UUID4) -> ConversationSessionOutput:
-        """Get conversation session by ID with eager loading.
-
-        This method uses joinedload to prevent N+1 queries by eagerly loading
-        related messages, user, and collection data.
+        """Get conversation session by ID with its message count.
 
-        **Memory Considerations:**
-        This method eagerly loads ALL messages and summaries for the session.
-        For sessions with hundreds of messages, this can consume significant memory.
-        Use get_messages_by_session() or get_recent_messages() for pagination if needed.
+        The count comes from a correlated subquery over the
+        ``(session_id, created_at, id)`` index, so the cost does not grow with
+        the length of the conversation; messages and summaries are not loaded.
+        Use get_messages_by_session() or get_recent_messages() to read messages.
 
         Args:
             session_id: Session ID
 
         Returns:
-            Conversation session with all related data
+            Conversation session with its message count
 
         Raises:
             NotFoundError: If session not found
             RepositoryError: For other database errors
         """
         try:
-            session = (
-                self.db.query(ConversationSession)
-                .options(
-                    joinedload(ConversationSession.messages),
-                    joinedload(ConversationSession.user),
-                    joinedload(ConversationSession.collection),
-                    joinedload(ConversationSession.summaries),
-                )
-                .filter(ConversationSession.id == session_id)
-                .first()
-            )
-
-            if not session:
-                raise NotFoundError(f"Conversation session not found: {session_id}")
-
-            return ConversationSessionOutput.from_db_session(session, message_count=len(session.messages))
-
-        except NotFoundError:
-            raise
+            row = self.db.execute(
+                select(ConversationSession, _message_count()).where(ConversationSession.id == session_id)
+            ).first()
         except Exception as e:
             logger.error(f"Error getting conversation session {session_id}: {e}")
             raise RepositoryError(f"Failed to get conversation session: {e}") from e
 
-    def get_sessions_by_user(self, user_id: UUID4, limit: int = 50, offset: int = 0) -> list[ConversationSessionOutput]:
-        """Get conversation sessions for a user with eager loading.
+        if row is None:
+            raise NotFoundError(f"Conversation session not found: {session_id}")
+        session, message_count = row
+        return ConversationSessionOutput.from_db_session(session, message_count=message_count)
+
+    def get_sessions_by_user(
+        self,
+        user_id: UUID4,
+        limit: int = 50,
+        offset: int = 0,
+        *,
+        after: PageCursor | None = None,
+        collection_id: UUID4 | None = None,
+    ) -> list[ConversationSessionOutput]:
+        """Get a page of a user's conversation sessions, newest first.
 
-        This method uses joinedload to prevent N+1 queries, reducing query count
-        from 54 queries to 1 query when listing sessions.
+        Each session's message count comes from a correlated subquery, so a page
+        is one query regardless of how many messages the sessions hold; messages,
+        summaries, user and collection are not loaded.
 
-        **Memory Considerations:**
-        Eagerly loads ALL messages and summaries for each session returned.
-        With default limit=50, if each session has 100 messages, this loads ~5000 messages.
-        For listing operations, consider reducing limit or using selectinload() instead
-        of joinedload() to separate queries for one-to-many relationships.
+        Pass the ``(created_at, id)`` of the last session on the previous page as
+        ``after`` to seek directly to the next page; ``offset`` is kept for
+        existing callers but gets slower the deeper it pages.
 
         Args:
             user_id: User ID
             limit: Maximum number of sessions to return (default: 50)
             offset: Offset for pagination
+            after: Keyset cursor of the last session already returned
+            collection_id: Only return sessions for this collection
 
         Returns:
-            List of conversation sessions with eager loaded relationships
+            List of conversation sessions with message counts
 
         Raises:
             RepositoryError: For database errors
         """
         try:
-            sessions = (
-                self.db.query(ConversationSession)
-                .options(
-                    joinedload(ConversationSession.messages),
-                    joinedload(ConversationSession.user),
-                    joinedload(ConversationSession.collection),
-                    joinedload(ConversationSession.summaries),
-                )
-                .filter(ConversationSession.user_id == user_id)
-                .order_by(ConversationSession.created_at.desc())
-                .limit(limit)
-                .offset(offset)
-                .all()
-            )
-
+            rows = self.db.execute(_sessions_by_user_statement(user_id, limit, offset, after, collection_id)).all()
             return [
-                ConversationSessionOutput.from_db_session(session, message_count=len(session.messages))
-                for session in sessions
+                ConversationSessionOutput.from_db_session(session, message_count=message_count)
+                for session, message_count in rows
             ]
 
         except Exception as e:
@@ -442,37 +483,67 @@ class ConversationRepository:
             raise RepositoryError(f"Failed to get conversation message: {e}") from e
 
     def get_messages_by_session(
-        self, session_id: UUID4, limit: int = 100, offset: int = 0
-    ) -> list[ConversationMessage]:
-        """Get conversation messages for a session.
+        self,
+        session_id: UUID4,
+        limit: int = 100,
+        offset: int = 0,
+        *,
+        after: PageCursor | None = None,
+        include_metadata: bool = True,
+    ) -> list[Any]:
+        """Get a page of conversation messages for a session, oldest first.
+
+        Pass the ``(created_at, id)`` of the last message on the previous page as
+        ``after`` to seek directly to the next page through the
+        ``(session_id, created_at, id)`` index; ``offset`` is kept for existing
+        callers but gets slower the deeper it pages.
 
         Args:
             session_id: Session ID
             limit: Maximum number of messages to return
             offset: Offset for pagination
+            after: Keyset cursor of the last message already returned
+            include_metadata: Load full models; when False, return rows of the
+                list-view columns without the metadata JSON
 
         Returns:
-            List of conversation message database models ordered by creation time
+            Conversation message models, or rows when ``include_metadata`` is False,
+            ordered by creation time
 
         Raises:
             RepositoryError: For database errors
         """
         try:
-            messages = (
-                self.db.query(ConversationMessage)
-                .filter(ConversationMessage.session_id == session_id)
-                .order_by(ConversationMessage.created_at.asc())
-                .limit(limit)
-                .offset(offset)
-                .all()
-            )
-
-            return messages
+            result = self.db.execute(_messages_by_session_statement(session_id, limit, offset, after, include_metadata))
+            return list(result.scalars().all() if include_metadata else result.all())
 
         except Exception as e:
             logger.error(f"Error getting messages for session {session_id}: {e}")
             raise RepositoryError(f"Failed to get messages for session: {e}") from e
 
+    def iter_messages(self, session_id: UUID4, batch_size: int = 500) -> Iterator[ConversationMessage]:
+        """Yield every message of a session in order, one keyset page at a time.
+
+        Memory use is bounded by ``batch_size`` however long the conversation is.
+
+        Args:
+            session_id: Session ID
+            batch_size: Messages fetched per query
+
+        Yields:
+            Conversation message models ordered by creation time
+
+        Raises:
+            RepositoryError: For database errors
+        """
+        after = None
+        while True:
+            batch = self.get_messages_by_session(session_id, limit=batch_size, after=after)
+            yield from batch
+            if len(batch) < batch_size:
+                return
+            after = PageCursor(created_at=batch[-1].created_at, id=batch[-1].id)
+
     def get_recent_messages(self, session_id: UUID4, count: int = 10) -> list[ConversationMessage]:
         """Get recent conversation messages for a session.
 
@@ -949,3 +1020,93 @@ class ConversationRepository:
         except Exception as e:
             logger.error(f"Error getting summaries with min tokens saved {min_tokens_saved}: {e}")
             raise RepositoryError(f"Failed to get summaries with tokens saved: {e}") from e
+
+    # ============================================================================
+    # ASYNC READ OPERATIONS
+    # ============================================================================
+
+    async def get_session_by_id_async(self, session_id: UUID4) -> ConversationSessionOutput:
+        """Async variant of get_session_by_id() using ``async_db``.
+
+        Raises:
+            NotFoundError: If session not found
+            RepositoryError: For other database errors
+        """
+        db = require_async_session(self.async_db)
+        try:
+            result = await db.execute(
+                select(ConversationSession, _message_count()).where(ConversationSession.id == session_id)
+            )
+            row = result.first()
+        except Exception as e:
+            logger.error(f"Error getting conversation session {session_id}: {e}")
+            raise RepositoryError(f"Failed to get conversation session: {e}") from e
+
+        if row is None:
+            raise NotFoundError(f"Conversation session not found: {session_id}")
+        session, message_count = row
+        return ConversationSessionOutput.from_db_session(session, message_count=message_count)
+
+    async def get_sessions_by_user_async(
+        self,
+        user_id: UUID4,
+        limit: int = 50,
+        offset: int = 0,
+        *,
+        after: PageCursor | None = None,
+        collection_id: UUID4 | None = None,
+    ) -> list[ConversationSessionOutput]:
+        """Async variant of get_sessions_by_user() using ``async_db``.
+
+        Raises:
+            RepositoryError: For database errors
+        """
+        db = require_async_session(self.async_db)
+        try:
+            result = await db.execute(_sessions_by_user_statement(user_id, limit, offset, after, collection_id))
+            return [
+                ConversationSessionOutput.from_db_session(session, message_count=message_count)
+                for session, message_count in result.all()
+            ]
+        except Exception as e:
+            logger.error(f"Error getting sessions for user {user_id}: {e}")
+            raise RepositoryError(f"Failed to get sessions for user: {e}") from e
+
+    async def get_messages_by_session_async(
+        self,
+        session_id: UUID4,
+        limit: int = 100,
+        offset: int = 0,
+        *,
+        after: PageCursor | None = None,
+        include_metadata: bool = True,
+    ) -> list[Any]:
+        """Async variant of get_messages_by_session() using ``async_db``.
+
+        Raises:
+            RepositoryError: For database errors
+        """
+        db = require_async_session(self.async_db)
+        try:
+            result = await db.execute(
+                _messages_by_session_statement(session_id, limit, offset, after, include_metadata)
+            )
+            return list(result.scalars().all() if include_metadata else result.all())
+        except Exception as e:
+            logger.error(f"Error getting messages for session {session_id}: {e}")
+            raise RepositoryError(f"Failed to get messages for session: {e}") from e
+
+    async def iter_messages_async(self, session_id: UUID4, batch_size: int = 500) -> AsyncIterator[ConversationMessage]:
+        """Async variant of iter_messages() using ``async_db``.
+
+        Raises:
+            RepositoryError: For database errors
+        """
+        after = None
+        while True:
+            batch = await self.get_messages_by_session_async(session_id, limit=batch_size, after=after)
+            for message in batch:
+                yield message
+            if len(batch) < batch_size:
+                return
+            after = PageCursor(created_at=batch[-1].created_at, id=batch[-1].id)
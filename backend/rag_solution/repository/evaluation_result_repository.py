@@ -0,0 +1,110 @@
+"""Repository for handling EvaluationResult entity database operations."""
+
+from datetime import datetime
+from typing import Any
+
+from pydantic import UUID4
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from core.custom_exceptions import RepositoryError
+from core.logging_utils import get_logger
+from rag_solution.models.evaluation_result import EvaluationResult
+
+logger = get_logger(__name__)
+
+
+class EvaluationResultRepository:
+    """Repository for handling EvaluationResult entity database operations."""
+
+    def __init__(self, db: Session) -> None:
+        """Initialize with database session."""
+        self.db = db
+
+    def create_many(self, results: list[dict[str, Any]]) -> int:
+        """Insert a batch of evaluation results in one transaction.
+
+        Args:
+            results: Column values of each evaluation result
+
+        Returns:
+            Number of inserted rows
+
+        Raises:
+            RepositoryError: For database errors
+        """
+        if not results:
+            return 0
+        try:
+            self.db.add_all([EvaluationResult(**values) for values in results])
+            self.db.commit()
+            logger.debug("Stored %d evaluation results", len(results))
+            return len(results)
+        except Exception as e:
+            self.db.rollback()
+            logger.error("Error storing evaluation results: %s", e)
+            raise RepositoryError(f"Failed to store evaluation results: {e}") from e
+
+    def get_by_search_id(self, search_id: UUID4) -> EvaluationResult | None:
+        """Get the evaluation result of a search, if it has been evaluated.
+
+        Args:
+            search_id: Search ID returned with the search response
+
+        Returns:
+            EvaluationResult model instance or None
+        """
+        try:
+            return self.db.query(EvaluationResult).filter(EvaluationResult.search_id == search_id).first()
+        except Exception as e:
+            logger.error("Error getting evaluation result for search %s: %s", search_id, e)
+            raise RepositoryError(f"Failed to get evaluation result: {e}") from e
+
+    def get_pipeline_summaries(self, since: datetime) -> list[dict[str, Any]]:
+        """Aggregate evaluation scores per pipeline.
+
+        Args:
+            since: Only include evaluations created after this time
+
+        Returns:
+            One dict per pipeline with the evaluation count and average scores
+        """
+        try:
+            rows = (
+                self.db.query(
+                    EvaluationResult.pipeline_id,
+                    func.count(EvaluationResult.id),
+                    func.avg(EvaluationResult.faithfulness),
+                    func.avg(EvaluationResult.answer_relevance),
+                    func.avg(EvaluationResult.context_relevance),
+                    func.avg(EvaluationResult.overall_score),
+                    func.max(EvaluationResult.created_at),
+                )
+                .filter(EvaluationResult.created_at >= since, EvaluationResult.error.is_(None))
+                .group_by(EvaluationResult.pipeline_id)
+                .all()
+            )
+        except Exception as e:
+            logger.error("Error aggregating evaluation results: %s", e)
+            raise RepositoryError(f"Failed to aggregate evaluation results: {e}") from e
+
+        return [
+            {
+                "pipeline_id": pipeline_id,
+                "evaluations": count,
+                "faithfulness": faithfulness,
+                "answer_relevance": answer_relevance,
+                "context_relevance": context_relevance,
+                "overall_score": overall_score,
+                "last_evaluated_at": last_evaluated_at,
+            }
+            for (
+                pipeline_id,
+                count,
+                faithfulness,
+                answer_relevance,
+                context_relevance,
+                overall_score,
+                last_evaluated_at,
+            ) in rows
+        ]
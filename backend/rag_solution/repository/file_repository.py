@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 
 from rag_solution.core.exceptions import AlreadyExistsError, NotFoundError, ValidationError
 from rag_solution.models.file import File
+from rag_solution.repository.collection_repository import CollectionRepository
 from rag_solution.schemas.file_schema import FileInput, FileMetadata, FileOutput
 
 logger = logging.getLogger(__name__)
@@ -101,6 +102,10 @@ class FileRepository:
             if not file:
                 raise NotFoundError(resource_type="File", resource_id=str(file_id))
             self.db.delete(file)
+            if file.chunk_count:
+                # Keep the materialized collection stats in the same transaction as the delete
+                self.db.flush()
+                CollectionRepository(self.db).refresh_stats(file.collection_id)
             self.db.commit()
         except (NotFoundError, AlreadyExistsError, ValidationError):
             raise
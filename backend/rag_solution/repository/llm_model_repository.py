@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from rag_solution.core.exceptions import AlreadyExistsError, NotFoundError, ValidationError
 from rag_solution.models.llm_model import LLMModel
 from rag_solution.schemas.llm_model_schema import LLMModelInput, LLMModelOutput, LLMModelUpdate, ModelType
+from rag_solution.services.config_cache import LLM_MODEL, invalidate_config
 
 
 class LLMModelRepository:
@@ -19,6 +20,7 @@ class LLMModelRepository:
             model = LLMModel(**model_input.model_dump(exclude_unset=True))
             self.session.add(model)
             self.session.commit()
+            invalidate_config(LLM_MODEL, db=self.session)
             self.session.refresh(model)
             return LLMModelOutput.model_validate(model)
         except IntegrityError as e:
@@ -92,6 +94,7 @@ class LLMModelRepository:
                 setattr(model, key, value)
 
             self.session.commit()
+            invalidate_config(LLM_MODEL, db=self.session)
             self.session.refresh(model)
             return LLMModelOutput.model_validate(model)
         except IntegrityError as e:
@@ -118,6 +121,7 @@ class LLMModelRepository:
             # Mark as inactive
             self.session.query(LLMModel).filter_by(id=model_id).update({"is_active": False})
             self.session.commit()
+            invalidate_config(LLM_MODEL, db=self.session)
         except (NotFoundError, AlreadyExistsError, ValidationError):
             raise
         except Exception as e:
@@ -135,6 +139,7 @@ class LLMModelRepository:
                 .update({"is_default": False})
             )
             self.session.commit()
+            invalidate_config(LLM_MODEL, db=self.session)
         except (NotFoundError, AlreadyExistsError, ValidationError):
             raise
         except Exception:
@@ -6,6 +6,7 @@ from core.logging_utils import get_logger
 from rag_solution.core.exceptions import AlreadyExistsError, NotFoundError, ValidationError
 from rag_solution.models.llm_parameters import LLMParameters
 from rag_solution.schemas.llm_parameters_schema import LLMParametersInput, LLMParametersOutput
+from rag_solution.services.config_cache import LLM_PARAMETERS, invalidate_config
 
 logger = get_logger("repository.llm_parameters")
 
@@ -34,6 +35,7 @@ class LLMParametersRepository:
             db_params = LLMParameters(**parameters.model_dump())
             self.db.add(db_params)
             self.db.commit()
+            invalidate_config(LLM_PARAMETERS, db=self.db)
             self.db.refresh(db_params)
             return LLMParametersOutput.model_validate(db_params)
         except IntegrityError as e:
@@ -98,6 +100,7 @@ class LLMParametersRepository:
                     setattr(db_params, field, value)
 
             self.db.commit()
+            invalidate_config(LLM_PARAMETERS, db=self.db)
             self.db.refresh(db_params)
             return LLMParametersOutput.model_validate(db_params)
         except (NotFoundError, ValidationError):
@@ -121,6 +124,7 @@ class LLMParametersRepository:
 
         self.db.delete(db_params)
         self.db.commit()
+        invalidate_config(LLM_PARAMETERS, db=self.db)
 
     def delete_by_user_id(self, user_id: UUID4) -> int:
         """Delete all LLM Parameters for a user.
@@ -133,6 +137,7 @@ class LLMParametersRepository:
         """
         deleted_count = self.db.query(LLMParameters).filter(LLMParameters.user_id == user_id).delete()
         self.db.commit()
+        invalidate_config(LLM_PARAMETERS, db=self.db)
         return deleted_count
 
     def get_parameters_by_user_id(self, user_id: UUID4) -> list[LLMParametersOutput]:
@@ -178,4 +183,5 @@ class LLMParametersRepository:
             .update({"is_default": False})
         )
         self.db.commit()
+        invalidate_config(LLM_PARAMETERS, db=self.db)
         return updated_count
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from rag_solution.core.exceptions import AlreadyExistsError, NotFoundError, ValidationError
 from rag_solution.models.llm_provider import LLMProvider
 from rag_solution.schemas.llm_provider_schema import LLMProviderInput, LLMProviderUpdate
+from rag_solution.services.config_cache import LLM_PROVIDER, invalidate_config
 
 
 class LLMProviderRepository:
@@ -26,6 +27,7 @@ class LLMProviderRepository:
             provider = LLMProvider(**provider_data)
             self.session.add(provider)
             self.session.commit()
+            invalidate_config(LLM_PROVIDER, db=self.session)
             self.session.refresh(provider)
             return provider
         except IntegrityError as e:
@@ -132,6 +134,7 @@ class LLMProviderRepository:
                 setattr(provider, key, value)
 
             self.session.commit()
+            invalidate_config(LLM_PROVIDER, db=self.session)
             self.session.refresh(provider)
             return provider
 
@@ -158,6 +161,7 @@ class LLMProviderRepository:
             # Mark as inactive
             self.session.query(LLMProvider).filter_by(id=provider_id).update({"is_active": False})
             self.session.commit()
+            invalidate_config(LLM_PROVIDER, db=self.session)
         except (NotFoundError, AlreadyExistsError, ValidationError):
             raise
         except Exception as e:
@@ -187,6 +191,7 @@ class LLMProviderRepository:
         try:
             self.session.query(LLMProvider).filter(LLMProvider.id != provider_id).update({"is_default": False})
             self.session.commit()
+            invalidate_config(LLM_PROVIDER, db=self.session)
         except (NotFoundError, AlreadyExistsError, ValidationError):
             raise
         except Exception:
@@ -0,0 +1,79 @@
+"""Repository for running LLM token usage totals."""
+
+from collections.abc import Iterable
+from typing import Any
+
+from pydantic import UUID4
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from core.custom_exceptions import RepositoryError
+from core.logging_utils import get_logger
+from rag_solution.models.llm_usage_total import LLMUsageTotal
+
+logger = get_logger(__name__)
+
+
+class LLMUsageRepository:
+    """Repository for handling LLMUsageTotal database operations."""
+
+    def __init__(self, db: Session) -> None:
+        """Initialize with database session."""
+        self.db = db
+
+    def add_usage(self, rows: Iterable[dict[str, Any]]) -> int:
+        """Add usage deltas to the running totals in one statement.
+
+        Args:
+            rows: Dicts with user_id, model_name, service_type, prompt_tokens,
+                completion_tokens, total_tokens and calls
+
+        Returns:
+            Number of (user, model, service type) rows written
+
+        Raises:
+            RepositoryError: For database errors
+        """
+        values = list(rows)
+        if not values:
+            return 0
+        try:
+            statement = insert(LLMUsageTotal).values(values)
+            excluded = statement.excluded
+            statement = statement.on_conflict_do_update(
+                index_elements=[LLMUsageTotal.user_id, LLMUsageTotal.model_name, LLMUsageTotal.service_type],
+                set_={
+                    "prompt_tokens": LLMUsageTotal.prompt_tokens + excluded.prompt_tokens,
+                    "completion_tokens": LLMUsageTotal.completion_tokens + excluded.completion_tokens,
+                    "total_tokens": LLMUsageTotal.total_tokens + excluded.total_tokens,
+                    "calls": LLMUsageTotal.calls + excluded.calls,
+                    "updated_at": func.now(),
+                },
+            )
+            self.db.execute(statement)
+            self.db.commit()
+            return len(values)
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"Error adding LLM usage totals: {e}")
+            raise RepositoryError(f"Failed to add LLM usage totals: {e}") from e
+
+    def get_totals_by_user(self, user_id: UUID4) -> list[LLMUsageTotal]:
+        """Get the running usage totals of a user.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            One row per model and service type the user has used
+
+        Raises:
+            RepositoryError: For database errors
+        """
+        try:
+            return self.db.query(LLMUsageTotal).filter(LLMUsageTotal.user_id == user_id).all()
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting LLM usage totals for user {user_id}: {e}")
+            raise RepositoryError(f"Failed to get LLM usage totals for user: {e}") from e
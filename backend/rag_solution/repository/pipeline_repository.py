@@ -13,6 +13,7 @@ from core.custom_exceptions import RepositoryError
 from rag_solution.core.exceptions import NotFoundError
 from rag_solution.models.pipeline import PipelineConfig
 from rag_solution.schemas.pipeline_schema import PipelineConfigInput, PipelineConfigOutput
+from rag_solution.services.config_cache import PIPELINE, invalidate_config
 
 
 class PipelineConfigRepository:
@@ -97,6 +98,7 @@ class PipelineConfigRepository:
             db_config = PipelineConfig(**config.model_dump())
             self.db.add(db_config)
             self.db.commit()
+            invalidate_config(PIPELINE, db=self.db)
             self.db.refresh(db_config)
             return PipelineConfigOutput.from_db_model(db_config)
         except Exception as e:
@@ -181,6 +183,7 @@ class PipelineConfigRepository:
                 setattr(pipeline, field, value)
 
             self.db.commit()
+            invalidate_config(PIPELINE, db=self.db)
             self.db.refresh(pipeline)
             return PipelineConfigOutput.from_db_model(pipeline)
         except NotFoundError:
@@ -204,6 +207,7 @@ class PipelineConfigRepository:
         try:
             result = self.db.query(PipelineConfig).filter(PipelineConfig.id == id).delete()
             self.db.commit()
+            invalidate_config(PIPELINE, db=self.db)
             return result > 0
         except Exception as e:
             self.db.rollback()
@@ -223,6 +227,7 @@ class PipelineConfigRepository:
                 PipelineConfig.collection_id == collection_id, PipelineConfig.is_default.is_(True)
             ).update({"is_default": False})
             self.db.commit()
+            invalidate_config(PIPELINE, db=self.db)
         except Exception as e:
             self.db.rollback()
             raise RepositoryError(f"Failed to clear collection defaults: {e!s}") from e
@@ -243,6 +248,7 @@ class PipelineConfigRepository:
                 PipelineConfig.is_default.is_(True),
             ).update({"is_default": False})
             self.db.commit()
+            invalidate_config(PIPELINE, db=self.db)
         except Exception as e:
             self.db.rollback()
             raise RepositoryError(f"Failed to clear user defaults: {e!s}") from e
@@ -1,21 +1,29 @@
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import UUID4
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from rag_solution.core.exceptions import NotFoundError
+from rag_solution.file_management.database import require_async_session
 from rag_solution.models.prompt_template import PromptTemplate
 from rag_solution.schemas.prompt_template_schema import PromptTemplateInput, PromptTemplateType
+from rag_solution.services.config_cache import PROMPT_TEMPLATE, invalidate_config
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class PromptTemplateRepository:
-    def __init__(self: Any, db: Session) -> None:
+    def __init__(self: Any, db: Session, async_db: "AsyncSession | None" = None) -> None:
         self.db = db
+        self.async_db = async_db
 
     def create_template(self, template: PromptTemplateInput) -> PromptTemplate:
         db_template = PromptTemplate(**template.model_dump(exclude_unset=True))
         self.db.add(db_template)
         self.db.commit()
+        invalidate_config(PROMPT_TEMPLATE, db=self.db)
         self.db.refresh(db_template)
         return db_template
 
@@ -36,6 +44,18 @@ class PromptTemplateRepository:
     def get_by_user_id_and_type(self, user_id: UUID4, template_type: PromptTemplateType) -> list[PromptTemplate]:
         return self.db.query(PromptTemplate).filter_by(user_id=user_id, template_type=template_type).all()
 
+    async def get_by_user_id_and_type_async(
+        self, user_id: UUID4, template_type: PromptTemplateType
+    ) -> list[PromptTemplate]:
+        """Async variant of :meth:`get_by_user_id_and_type` using ``async_db``."""
+        db = require_async_session(self.async_db)
+        result = await db.execute(
+            select(PromptTemplate).where(
+                PromptTemplate.user_id == user_id, PromptTemplate.template_type == template_type
+            )
+        )
+        return list(result.scalars().all())
+
     def delete_user_template(self, user_id: UUID4, template_id: UUID4) -> None:
         """Delete a user's template.
 
@@ -51,6 +71,7 @@ class PromptTemplateRepository:
 
             self.db.delete(template)
             self.db.commit()
+            invalidate_config(PROMPT_TEMPLATE, db=self.db)
         except NotFoundError:
             raise
         except Exception as e:
@@ -71,6 +92,7 @@ class PromptTemplateRepository:
                     setattr(template, key, value)
 
             self.db.commit()
+            invalidate_config(PROMPT_TEMPLATE, db=self.db)
             self.db.refresh(template)
             return template
         except NotFoundError:
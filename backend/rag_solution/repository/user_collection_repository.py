@@ -3,15 +3,18 @@
 from typing import Any
 
 from pydantic import UUID4
+from sqlalchemy import exists, false
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
 
 from core.custom_exceptions import RepositoryError
 from core.logging_utils import get_logger
+from rag_solution.core.collection_access_cache import invalidate_collection_access
 from rag_solution.core.exceptions import AlreadyExistsError, NotFoundError
 from rag_solution.models.collection import Collection
 from rag_solution.models.user import User
 from rag_solution.models.user_collection import UserCollection
+from rag_solution.schemas.collection_schema import CollectionAccess
 from rag_solution.schemas.user_collection_schema import FileInfo, UserCollectionOutput
 
 logger = get_logger(__name__)
@@ -66,6 +69,7 @@ class UserCollectionRepository:
             user_collection = UserCollection(user_id=user_id, collection_id=collection_id)
             self.db.add(user_collection)
             self.db.commit()
+            invalidate_collection_access(collection_id)
             return True
         except IntegrityError as e:
             self.db.rollback()
@@ -101,6 +105,7 @@ class UserCollectionRepository:
         try:
             self.db.delete(user_collection)
             self.db.commit()
+            invalidate_collection_access(collection_id)
             return True
         except Exception as e:
             self.db.rollback()
@@ -168,6 +173,7 @@ class UserCollectionRepository:
         try:
             result = self.db.query(UserCollection).filter(UserCollection.collection_id == collection_id).delete()
             self.db.commit()
+            invalidate_collection_access(collection_id)
             return result > 0
         except Exception as e:
             logger.error("Database error: %s", str(e))
@@ -218,6 +224,36 @@ class UserCollectionRepository:
             is not None
         )
 
+    def get_collection_access(self, user_id: UUID4 | None, collection_id: UUID4) -> CollectionAccess | None:
+        """Load the access decision for a user and collection in a single query.
+
+        Reads the collection row by primary key and checks membership with an
+        EXISTS on the (user_id, collection_id) primary key of user_collection,
+        without loading the user's other collections, files or users.
+
+        Args:
+            user_id: The UUID of the user, or None for anonymous checks
+            collection_id: The UUID of the collection
+
+        Returns:
+            CollectionAccess, or None if the collection doesn't exist
+        """
+        is_member = (
+            exists().where(UserCollection.user_id == user_id, UserCollection.collection_id == collection_id)
+            if user_id
+            else false()
+        )
+        row = (
+            self.db.query(Collection.id, Collection.is_private, Collection.status, is_member.label("is_member"))
+            .filter(Collection.id == collection_id)
+            .first()
+        )
+        if row is None:
+            return None
+        return CollectionAccess(
+            id=row.id, user_id=user_id, is_private=row.is_private, status=row.status, is_member=bool(row.is_member)
+        )
+
     def _to_output(self, user_collection: UserCollection) -> UserCollectionOutput:
         collection = user_collection.collection
         if not collection:
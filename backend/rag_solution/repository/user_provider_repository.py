@@ -10,6 +10,7 @@ from rag_solution.core.exceptions import NotFoundError
 from rag_solution.models.llm_provider import LLMProvider
 from rag_solution.models.user import User
 from rag_solution.schemas.llm_provider_schema import LLMProviderOutput
+from rag_solution.services.config_cache import LLM_PROVIDER, invalidate_config
 
 logger = get_logger(__name__)
 
@@ -29,6 +30,7 @@ class UserProviderRepository:
             self.db.flush()
             if not outer_transaction:
                 transaction.commit()
+                invalidate_config(LLM_PROVIDER, db=self.db)
             return True
         except Exception as e:
             transaction.rollback()
@@ -43,6 +45,7 @@ class UserProviderRepository:
 
             user.preferred_provider_id = provider_id
             self.db.commit()
+            invalidate_config(LLM_PROVIDER, db=self.db)
         except IntegrityError as e:
             self.db.rollback()
             raise NotFoundError(resource_type="LLMProvider", resource_id=str(provider_id)) from e
@@ -9,6 +9,7 @@ from core.logging_utils import get_logger
 from rag_solution.core.exceptions import AlreadyExistsError, NotFoundError, ValidationError
 from rag_solution.models.user import User
 from rag_solution.schemas.user_schema import UserInput, UserOutput
+from rag_solution.services.config_cache import ALL_NAMESPACES, LLM_PROVIDER, invalidate_config
 
 logger = get_logger(__name__)
 
@@ -119,10 +120,13 @@ class UserRepository:
                 raise NotFoundError("User", resource_id=str(user_id))
 
             # Update fields
+            previous_provider_id = user.preferred_provider_id
             for key, value in user_update.model_dump(exclude_unset=True).items():
                 setattr(user, key, value)
 
             self.db.commit()
+            if user.preferred_provider_id != previous_provider_id:
+                invalidate_config(LLM_PROVIDER, db=self.db)
             self.db.refresh(user)
             return UserOutput.model_validate(user)
         except NotFoundError:
@@ -144,6 +148,8 @@ class UserRepository:
         try:
             result = self.db.query(User).filter(User.id == user_id).delete()
             self.db.commit()
+            # Deleting a user cascades to their pipelines, templates and parameters
+            invalidate_config(*ALL_NAMESPACES, db=self.db)
             return result > 0
         except Exception as e:
             logger.error(f"Error deleting user {user_id}: {e!s}")
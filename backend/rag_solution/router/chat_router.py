@@ -18,6 +18,7 @@ import warnings
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 
 from rag_solution.core.dependencies import (
     get_conversation_service,
@@ -239,17 +240,20 @@ async def get_session_statistics(
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
-@router.get("/sessions/{session_id}/export")
+@router.get("/sessions/{session_id}/export", response_model=None)
 async def export_session(
     session_id: UUID,
     _request: Request,
     current_user: dict = Depends(get_current_user),
     export_format: ExportFormat = Query(ExportFormat.JSON, description="Export format"),
     conversation_service: ConversationService = Depends(get_conversation_service),
-) -> dict:
-    """Export a conversation session."""
+) -> dict | StreamingResponse:
+    """Export a conversation session; ``ndjson`` streams one message per line."""
     try:
         user_id = UUID(current_user["uuid"])
+        if export_format == ExportFormat.NDJSON:
+            lines = await conversation_service.export_session_stream(session_id, user_id)
+            return StreamingResponse(lines, media_type="application/x-ndjson")
         export_data = await conversation_service.export_session(session_id, user_id, export_format.value)
         return export_data
     except ValueError as e:
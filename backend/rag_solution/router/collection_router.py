@@ -1,19 +1,22 @@
 """Collection router for managing collection-related API endpoints."""
 
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 from fastapi import APIRouter, BackgroundTasks, Body, Depends, File, Form, HTTPException, Request, Response, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse
 from pydantic import UUID4
 from sqlalchemy.orm import Session
 
+from core.authorization import authorize_decorator
 from core.config import Settings, get_settings
 from core.custom_exceptions import NotFoundError, ValidationError
 from core.logging_utils import get_logger
 from core.mock_auth import ensure_mock_user_exists
 from rag_solution.core.exceptions import AlreadyExistsError
-from rag_solution.file_management.database import get_db
-from rag_solution.schemas.collection_schema import CollectionInput, CollectionOutput
+from rag_solution.core.exceptions import NotFoundError as DomainNotFoundError
+from rag_solution.file_management.database import get_async_db, get_db
+from rag_solution.schemas.collection_schema import CollectionInput, CollectionOutput, CollectionSummary
 from rag_solution.schemas.file_schema import DocumentDelete, FileMetadata, FileOutput
 from rag_solution.schemas.question_schema import QuestionInput, QuestionOutput
 from rag_solution.schemas.user_collection_schema import UserCollectionOutput
@@ -22,6 +25,9 @@ from rag_solution.services.file_management_service import FileManagementService
 from rag_solution.services.question_service import QuestionService
 from rag_solution.services.user_collection_service import UserCollectionService
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
 logger = get_logger("router.collections")
 
 router = APIRouter(prefix="/api/collections", tags=["collections"])
@@ -121,6 +127,7 @@ async def test_list_collections(
 async def list_collections(
     request: Request,
     db: Annotated[Session, Depends(get_db)],
+    async_db: Annotated["AsyncSession", Depends(get_async_db)],
 ) -> list[CollectionOutput]:
     """List all collections for the authenticated user."""
     try:
@@ -131,8 +138,8 @@ async def list_collections(
         if not user_id:
             raise HTTPException(status_code=401, detail="User not authenticated")
 
-        user_collection_service = UserCollectionService(db)
-        collections = user_collection_service.get_user_collections(user_id)
+        user_collection_service = UserCollectionService(db, async_db=async_db)
+        collections = await user_collection_service.get_user_collections_async(user_id)
 
         logger.info("Retrieved %d collections for user %s", len(collections), user_id)
         return collections
@@ -316,6 +323,47 @@ def get_collection(
         raise HTTPException(status_code=500, detail="Internal server error") from e
 
 
+@router.get(
+    "/{collection_id}/summary",
+    summary="Retrieve a collection summary by id.",
+    response_model=CollectionSummary,
+    description="Retrieve a collection with its document and chunk counts, without files or users.",
+    responses={
+        200: {"description": "Collection summary retrieved successfully"},
+        404: {"description": "Collection not found"},
+        500: {"description": "Internal server error"},
+    },
+)
+def get_collection_summary(
+    collection_id: UUID4,
+    db: Annotated[Session, Depends(get_db)],
+    settings: Annotated[Settings, Depends(get_settings)],
+) -> CollectionSummary:
+    """
+    Retrieve a collection summary by id.
+
+    Args:
+        collection_id (UUID): The ID of the collection to retrieve.
+        db (Session): The database session.
+
+    Returns:
+        CollectionSummary: The collection with its materialized chunk stats.
+
+    Raises:
+        HTTPException: If collection not found
+    """
+    try:
+        service = CollectionService(db, settings)
+        return service.get_collection_summary(collection_id)
+    except (NotFoundError, DomainNotFoundError) as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        logger.error("Error getting collection summary: %s", str(e))
+        raise HTTPException(status_code=500, detail="Internal server error") from e
+
+
 @router.post(
     "/{collection_id}/questions",
     summary="Create a question for a collection",
@@ -1000,6 +1048,46 @@ async def cleanup_orphaned_collections(
         raise HTTPException(status_code=500, detail=f"Cleanup failed: {e!s}") from e
 
 
+@router.post(
+    "/reconcile-stats",
+    responses={
+        403: {"description": "Not authorized"},
+        500: {"description": "Internal server error"},
+    },
+)
+@authorize_decorator(role="admin")
+async def reconcile_collection_stats(
+    request: Request,  # pylint: disable=unused-argument
+    db: Annotated[Session, Depends(get_db)],
+    settings: Annotated[Settings, Depends(get_settings)],
+) -> dict:
+    """
+    Recount the chunks of all completed collections in the vector database.
+
+    Document and chunk counts are stored in PostgreSQL at ingest and delete time;
+    this repairs counts that drifted from the vector database. Reconciliation
+    touches every user's collections, so it is restricted to administrators.
+
+    Args:
+        request (Request): The HTTP request, used by the admin authorization check
+        db (Session): The database session
+        settings (Settings): Application settings
+
+    Returns:
+        dict: Number of reconciled collections and errors
+
+    Raises:
+        HTTPException: If reconciliation fails
+    """
+    try:
+        service = CollectionService(db, settings)
+        # Reconciliation makes blocking vector store and database calls
+        return await run_in_threadpool(service.reconcile_all_chunk_stats)
+    except Exception as e:
+        logger.error("Error during collection stats reconciliation: %s", str(e))
+        raise HTTPException(status_code=500, detail=f"Reconciliation failed: {e!s}") from e
+
+
 @router.post(
     "/{collection_id}/reindex",
     summary="Reindex collection documents",
@@ -11,7 +11,8 @@ import logging
 from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 
 from rag_solution.core.dependencies import (
     get_conversation_service,
@@ -21,6 +22,7 @@ from rag_solution.core.dependencies import (
 )
 from rag_solution.core.exceptions import NotFoundError, ValidationError
 from rag_solution.schemas.conversation_schema import (
+    NEXT_CURSOR_HEADER,
     ContextSummarizationInput,
     ContextSummarizationOutput,
     ConversationExportInput,
@@ -34,6 +36,7 @@ from rag_solution.schemas.conversation_schema import (
     ConversationSuggestionOutput,
     ConversationSummaryInput,
     ConversationSummaryOutput,
+    PageCursor,
     SessionStatistics,
     SummarizationConfigInput,
 )
@@ -46,18 +49,44 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/conversations", tags=["conversations"])
 
 
+def _decode_cursor(cursor: str | None) -> PageCursor | None:
+    """Decode a page cursor query parameter, rejecting malformed tokens with 400."""
+    if cursor is None:
+        return None
+    try:
+        return PageCursor.decode(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid page cursor") from e
+
+
+def _set_next_cursor(response: Response, items: list[Any], limit: int) -> None:
+    """Advertise the cursor of the next page, if there may be one, in a response header."""
+    next_cursor = PageCursor.next_token(items, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+
 @router.get("", response_model=list[ConversationSessionOutput])
 async def list_conversations(
+    response: Response,
     user_id: UUID | None = None,
     collection_id: UUID | None = None,
+    limit: int = Query(50, ge=1, le=100, description="Maximum number of sessions to return"),
+    cursor: str | None = Query(None, description="X-Next-Cursor value from the previous page"),
     current_user: dict = Depends(get_current_user),
     conversation_service: ConversationService = Depends(get_conversation_service),
 ) -> list[ConversationSessionOutput]:
-    """List user's conversation sessions.
+    """List user's conversation sessions, newest first.
+
+    When more sessions may follow, the ``X-Next-Cursor`` response header holds
+    the cursor to pass for the next page.
 
     Args:
+        response: Response used to set the next-page cursor header
         user_id: Optional user ID filter (defaults to current user)
         collection_id: Optional collection ID filter
+        limit: Maximum number of sessions to return
+        cursor: Cursor of the previous page
         current_user: Current authenticated user
         conversation_service: Conversation service dependency
 
@@ -86,8 +115,11 @@ async def list_conversations(
                     status_code=status.HTTP_401_UNAUTHORIZED, detail=f"Invalid user UUID format: {uuid_str}"
                 ) from ve
 
-        # Get sessions for user, optionally filtered by collection
-        sessions = await conversation_service.list_sessions(target_user_id, collection_id=collection_id)
+        # Get a page of sessions for user, optionally filtered by collection
+        sessions = await conversation_service.list_sessions(
+            target_user_id, collection_id=collection_id, limit=limit, cursor=_decode_cursor(cursor)
+        )
+        _set_next_cursor(response, sessions, limit)
 
         logger.info("Listed %d conversations for user %s", len(sessions), str(target_user_id))
         return sessions
@@ -266,17 +298,27 @@ async def delete_conversation(
 @router.get("/{session_id}/messages", response_model=list[ConversationMessageOutput])
 async def get_conversation_messages(
     session_id: UUID,
+    response: Response,
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = Query(None, description="X-Next-Cursor value from the previous page"),
+    include_metadata: bool = Query(True, description="Include sources, CoT output and other message metadata"),
     current_user: dict = Depends(get_current_user),
     conversation_service: ConversationService = Depends(get_conversation_service),
 ) -> list[ConversationMessageOutput]:
-    """Get conversation message history.
+    """Get conversation message history, oldest first.
+
+    Page with ``cursor`` (from the ``X-Next-Cursor`` response header) rather
+    than ``offset`` on long conversations: each cursor page costs the same no
+    matter how deep into the history it is.
 
     Args:
         session_id: Conversation session ID
+        response: Response used to set the next-page cursor header
         limit: Maximum number of messages to return
         offset: Number of messages to skip
+        cursor: Cursor of the previous page
+        include_metadata: Whether to read the message metadata JSON
         current_user: Current authenticated user
         conversation_service: Conversation service dependency
 
@@ -284,8 +326,9 @@ async def get_conversation_messages(
         List of conversation messages
 
     Raises:
-        HTTPException: For not found or access errors
+        HTTPException: For not found or access errors, or an invalid cursor
     """
+    page_cursor = _decode_cursor(cursor)
     try:
         user_id = UUID(current_user["uuid"])
 
@@ -294,8 +337,14 @@ async def get_conversation_messages(
 
         # Get messages with pagination
         messages = await conversation_service.get_messages(
-            session_id=session_id, user_id=user_id, limit=limit, offset=offset
+            session_id=session_id,
+            user_id=user_id,
+            limit=limit,
+            offset=offset,
+            cursor=page_cursor,
+            include_metadata=include_metadata,
         )
+        _set_next_cursor(response, messages, limit)
 
         logger.info("Retrieved %d messages for session %s", len(messages), str(session_id))
         return messages
@@ -409,29 +458,37 @@ async def get_conversation_statistics(
         ) from e
 
 
-@router.post("/{session_id}/export")
+@router.post("/{session_id}/export", response_model=None)
 async def export_conversation(
     session_id: UUID,
     export_format: str = "json",
     current_user: dict = Depends(get_current_user),
     conversation_service: ConversationService = Depends(get_conversation_service),
-) -> dict:
+) -> dict | StreamingResponse:
     """Export conversation session.
 
+    ``ndjson`` streams the session and then one message per line, without
+    holding the whole conversation in memory.
+
     Args:
         session_id: Conversation session ID
-        export_format: Export format (json, txt, etc.)
+        export_format: Export format (json, ndjson, txt, etc.)
         current_user: Current authenticated user
         conversation_service: Conversation service dependency
 
     Returns:
-        Exported conversation data
+        Exported conversation data, or a streaming NDJSON response
 
     Raises:
         HTTPException: For not found or export errors
     """
     try:
         user_id = UUID(current_user["uuid"])
+        if export_format == "ndjson":
+            lines = await conversation_service.export_session_stream(session_id, user_id)
+            logger.info("Streaming NDJSON export of session %s for user %s", str(session_id), str(user_id))
+            return StreamingResponse(lines, media_type="application/x-ndjson")
+
         export_data = await conversation_service.export_session(session_id, user_id, export_format)
         logger.info("Exported session %s for user %s", str(session_id), str(user_id))
         return export_data
@@ -7,6 +7,7 @@ from core.logging_utils import get_logger
 from rag_solution.file_management.database import get_db
 from rag_solution.schemas.dashboard_schema import (
     DashboardStats,
+    QualityMetrics,
     QuickStatistics,
     RecentActivity,
     SystemHealthStatus,
@@ -99,3 +100,27 @@ async def get_system_health(db: Session = Depends(get_db)) -> SystemHealthStatus
     except Exception as e:
         logger.error("Error retrieving system health: %s", str(e))
         raise HTTPException(status_code=500, detail="Failed to retrieve system health") from e
+
+
+@router.get("/quality", response_model=QualityMetrics)
+async def get_quality_metrics(
+    hours: int = Query(default=24, ge=1, le=720), db: Session = Depends(get_db)
+) -> QualityMetrics:
+    """
+    Get live answer quality metrics.
+
+    Args:
+        hours: Time window in hours (default: 24, min: 1, max: 720)
+
+    Returns:
+        QualityMetrics: Average LLM-as-judge scores per pipeline from runtime evaluation.
+    """
+    try:
+        dashboard_service = DashboardService(db)
+        quality_metrics = dashboard_service.get_quality_metrics(hours=hours)
+        logger.info("Quality metrics retrieved successfully")
+        return quality_metrics
+
+    except Exception as e:
+        logger.error("Error retrieving quality metrics: %s", str(e))
+        raise HTTPException(status_code=500, detail="Failed to retrieve quality metrics") from e
@@ -4,8 +4,10 @@ Podcast generation API endpoints.
 Provides RESTful API for podcast generation, status checking, and management.
 """
 
+import asyncio
 import io
 import logging
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Annotated, Any
 from uuid import UUID
@@ -18,6 +20,12 @@ from core.config import Settings, get_settings
 from core.custom_exceptions import NotFoundError, ValidationError
 from core.identity_service import IdentityService
 from rag_solution.core.dependencies import get_current_user, get_podcast_service
+from rag_solution.generation.audio.segmented_output import (
+    PLAYLIST_MEDIA_TYPE,
+    PLAYLIST_NAME,
+    SEGMENT_NAME_PATTERN,
+    read_playlist,
+)
 from rag_solution.schemas.podcast_schema import (
     PodcastAudioGenerationInput,
     PodcastGenerationInput,
@@ -480,6 +488,72 @@ def _parse_range_header(range_header: str, file_size: int) -> tuple[int, int] |
         return None
 
 
+def _resolve_storage_base_path(settings: Settings) -> Path:
+    """
+    Return the absolute base path of local podcast storage.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Absolute storage base path
+    """
+    base_path = Path(settings.podcast_local_storage_path)
+
+    # Resolve to absolute path to avoid working directory issues
+    if not base_path.is_absolute():
+        # Use __file__ to get path relative to this router file
+        # This is more robust than relying on working directory
+        router_file = Path(__file__).resolve()
+        project_root = (
+            router_file.parent.parent.parent.parent
+        )  # rag_solution/router/ -> rag_solution/ -> backend/ -> project_root/
+        base_path = (project_root / base_path).resolve()
+
+    return base_path
+
+
+def _get_segments_dir(settings: Settings, user_id: UUID, podcast_id: UUID) -> Path:
+    """Return the directory holding a podcast's progressive playback segments."""
+    return _resolve_storage_base_path(settings) / str(user_id) / str(podcast_id) / "segments"
+
+
+async def _iter_live_segments(
+    segments_dir: Path,
+    poll_interval: float = 0.5,
+    idle_timeout: float = 120.0,
+) -> AsyncIterator[bytes]:
+    """
+    Stream segments in playlist order, waiting for new ones until the playlist is complete.
+
+    Args:
+        segments_dir: Directory holding the segments and playlist
+        poll_interval: Seconds between playlist checks while waiting
+        idle_timeout: Give up after this many seconds without a new segment
+
+    Yields:
+        Encoded segment bytes
+    """
+    sent = 0
+    idle = 0.0
+    while True:
+        names, complete = read_playlist(segments_dir / PLAYLIST_NAME)
+        if sent < len(names):
+            for name in names[sent:]:
+                try:
+                    yield await asyncio.to_thread((segments_dir / name).read_bytes)
+                except FileNotFoundError:
+                    # Generation failed and its segments were removed
+                    return
+            sent = len(names)
+            idle = 0.0
+            continue
+        if complete or idle >= idle_timeout:
+            return
+        await asyncio.sleep(poll_interval)
+        idle += poll_interval
+
+
 @router.get(
     "/{podcast_id}/audio",
     summary="Serve podcast audio file",
@@ -527,6 +601,18 @@ async def serve_podcast_audio(
     podcast = await podcast_service.get_podcast(podcast_id, user_id)
 
     if podcast.status != "completed":
+        # Stream the segments written so far while synthesis is still running
+        segments_dir = _get_segments_dir(settings, user_id, podcast_id)
+        if (
+            podcast.status in (PodcastStatus.QUEUED, PodcastStatus.GENERATING)
+            and (segments_dir / PLAYLIST_NAME).exists()
+        ):
+            return StreamingResponse(
+                _iter_live_segments(segments_dir),
+                status_code=200,
+                media_type=AUDIO_MEDIA_TYPES["mp3"],
+                headers={"Cache-Control": "no-cache"},
+            )
         raise HTTPException(status_code=400, detail=f"Podcast is not ready. Current status: {podcast.status}")
 
     if not podcast.audio_url:
@@ -534,17 +620,7 @@ async def serve_podcast_audio(
 
     # Construct file path from audio_url
     # audio_url format: "/podcasts/{user_id}/{podcast_id}/audio.{format}"
-    base_path = Path(settings.podcast_local_storage_path)
-
-    # Resolve to absolute path to avoid working directory issues
-    if not base_path.is_absolute():
-        # Use __file__ to get path relative to this router file
-        # This is more robust than relying on working directory
-        router_file = Path(__file__).resolve()
-        project_root = (
-            router_file.parent.parent.parent.parent
-        )  # rag_solution/router/ -> rag_solution/ -> backend/ -> project_root/
-        base_path = (project_root / base_path).resolve()
+    base_path = _resolve_storage_base_path(settings)
 
     # Get format as string (handle both enum and string values)
     audio_format = podcast.format.value if hasattr(podcast.format, "value") else str(podcast.format)
@@ -645,6 +721,104 @@ async def serve_podcast_audio(
         )
 
 
+@router.get(
+    "/{podcast_id}/playlist.m3u8",
+    summary="Serve podcast HLS playlist",
+    description="""
+    Serve the HLS playlist of a podcast's audio segments.
+
+    Segments are written while audio is synthesized, so playback can start before
+    generation completes. The playlist is an EVENT playlist that gains entries as
+    segments land and ends with #EXT-X-ENDLIST once synthesis has finished.
+    """,
+)
+async def serve_podcast_playlist(
+    podcast_id: UUID4,
+    podcast_service: Annotated[PodcastService, Depends(get_podcast_service)],
+    settings: Annotated[Settings, Depends(get_settings)],
+    current_user: Annotated[dict, Depends(get_current_user)],
+) -> Response:
+    """
+    Serve the podcast's HLS playlist.
+
+    Args:
+        podcast_id: Podcast UUID
+        podcast_service: Injected podcast service
+        settings: Application settings
+        current_user: Authenticated user from JWT token
+
+    Returns:
+        Playlist response
+
+    Raises:
+        HTTPException 401: Unauthorized
+        HTTPException 403: Access denied (not podcast owner)
+        HTTPException 404: Podcast or playlist not found
+    """
+    user_id = _extract_user_id_from_jwt(current_user)
+
+    # Verify ownership
+    await podcast_service.get_podcast(podcast_id, user_id)
+
+    playlist_path = _get_segments_dir(settings, user_id, podcast_id) / PLAYLIST_NAME
+    try:
+        content = await asyncio.to_thread(playlist_path.read_text, encoding="utf-8")
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail="Playlist not found for this podcast") from e
+
+    return Response(content=content, media_type=PLAYLIST_MEDIA_TYPE, headers={"Cache-Control": "no-cache"})
+
+
+@router.get(
+    "/{podcast_id}/segments/{segment_name}",
+    summary="Serve podcast audio segment",
+    description="Serve a single audio segment referenced by the podcast's HLS playlist.",
+)
+async def serve_podcast_segment(
+    podcast_id: UUID4,
+    segment_name: str,
+    podcast_service: Annotated[PodcastService, Depends(get_podcast_service)],
+    settings: Annotated[Settings, Depends(get_settings)],
+    current_user: Annotated[dict, Depends(get_current_user)],
+) -> Response:
+    """
+    Serve one audio segment.
+
+    Args:
+        podcast_id: Podcast UUID
+        segment_name: Segment file name from the playlist
+        podcast_service: Injected podcast service
+        settings: Application settings
+        current_user: Authenticated user from JWT token
+
+    Returns:
+        Segment audio response
+
+    Raises:
+        HTTPException 401: Unauthorized
+        HTTPException 403: Access denied (not podcast owner)
+        HTTPException 404: Podcast or segment not found
+    """
+    user_id = _extract_user_id_from_jwt(current_user)
+
+    # Only names produced by the segment writer are served (prevents path traversal)
+    if not SEGMENT_NAME_PATTERN.match(segment_name):
+        raise HTTPException(status_code=404, detail="Segment not found")
+
+    # Verify ownership
+    await podcast_service.get_podcast(podcast_id, user_id)
+
+    segment_path = _get_segments_dir(settings, user_id, podcast_id) / segment_name
+    try:
+        content = await asyncio.to_thread(segment_path.read_bytes)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail="Segment not found") from e
+
+    media_type = AUDIO_MEDIA_TYPES.get(segment_path.suffix.lstrip("."), "audio/mpeg")
+    # Segments never change once written
+    return Response(content=content, media_type=media_type, headers={"Cache-Control": "private, max-age=86400"})
+
+
 @router.get(
     "/voice-preview/{voice_id}",
     summary="Get a voice preview",
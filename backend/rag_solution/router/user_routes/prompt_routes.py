@@ -166,6 +166,6 @@ async def get_prompt_templates_by_type(
 ) -> list[PromptTemplateOutput]:
     """Retrieve prompt templates for a user by their type."""
     try:
-        return service.get_templates_by_type(user_id, template_type)
+        return await service.get_templates_by_type_async(user_id, template_type)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve prompt templates: {e!s}") from e
@@ -2,7 +2,8 @@
 
 This router provides WebSocket endpoints for real-time communication between
 the frontend and backend, supporting chat sessions, message streaming, and
-live updates.
+live updates. Connections are registered with the process-wide ConnectionHub,
+and every send to a connection goes through its queue.
 """
 
 import json
@@ -30,85 +31,21 @@ from rag_solution.schemas.conversation_schema import (
     MessageType,
 )
 from rag_solution.services.conversation_service import ConversationService
+from rag_solution.services.websocket_hub import get_connection_hub
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
-class ConnectionManager:
-    """Manages WebSocket connections and message broadcasting."""
-
-    def __init__(self) -> None:
-        """Initialize the connection manager."""
-        self.active_connections: dict[str, WebSocket] = {}
-
-    async def connect(self, websocket: WebSocket, user_id: str) -> None:
-        """Accept a WebSocket connection and store it.
-
-        Args:
-            websocket: The WebSocket connection
-            user_id: The user ID for this connection
-        """
-        await websocket.accept()
-        self.active_connections[user_id] = websocket
-        logger.info("WebSocket connection established for user %s", str(user_id))
-
-    def disconnect(self, user_id: str) -> None:
-        """Remove a WebSocket connection.
-
-        Args:
-            user_id: The user ID to disconnect
-        """
-        if user_id in self.active_connections:
-            del self.active_connections[user_id]
-            logger.info("WebSocket connection removed for user %s", str(user_id))
-
-    async def send_personal_message(self, message: str, user_id: str) -> None:
-        """Send a message to a specific user.
-
-        Args:
-            message: The message to send
-            user_id: The target user ID
-        """
-        if user_id in self.active_connections:
-            try:
-                await self.active_connections[user_id].send_text(message)
-            except WebSocketDisconnect:
-                logger.warning("Connection closed for user %s, removing from active connections", str(user_id))
-                self.disconnect(user_id)
-
-    async def broadcast(self, message: str) -> None:
-        """Broadcast a message to all connected users.
-
-        Args:
-            message: The message to broadcast
-        """
-        disconnected_users = []
-        for user_id, connection in self.active_connections.items():
-            try:
-                await connection.send_text(message)
-            except WebSocketDisconnect:
-                logger.warning("Connection closed for user %s during broadcast", str(user_id))
-                disconnected_users.append(user_id)
-
-        # Clean up disconnected users
-        for user_id in disconnected_users:
-            self.disconnect(user_id)
-
-
-# Global connection manager instance
-manager = ConnectionManager()
-
-
-async def _handle_ping_message(websocket: WebSocket, message_data: dict[str, Any]) -> None:
+def _handle_ping_message(connection_id: str, message_data: dict[str, Any]) -> None:
     """Handle ping/pong for connection health.
 
     Args:
-        websocket: The WebSocket connection
+        connection_id: The hub connection ID
         message_data: The message data containing timestamp
     """
     pong_response = {"type": "pong", "timestamp": message_data.get("timestamp")}
-    await websocket.send_text(json.dumps(pong_response))
+    get_connection_hub().send(connection_id, pong_response)
 
 
 def _validate_chat_message_data(message_data: dict[str, Any]) -> tuple[str | None, str | None]:
@@ -169,7 +106,7 @@ def _create_ai_response(session_id: str, response_message: Any, sources: list[di
 
 
 async def _process_chat_message(
-    websocket: WebSocket,
+    connection_id: str,
     session_id: str,
     content: str,
     conversation_service: ConversationService,
@@ -177,7 +114,7 @@ async def _process_chat_message(
     """Process a chat message and send response.
 
     Args:
-        websocket: The WebSocket connection
+        connection_id: The hub connection ID
         session_id: The session ID
         content: The message content
         conversation_service: The conversation service instance
@@ -196,7 +133,8 @@ async def _process_chat_message(
         "session_id": session_id,
         "message": "Processing your message...",
     }
-    await websocket.send_text(json.dumps(processing_response))
+    hub = get_connection_hub()
+    hub.send(connection_id, processing_response)
 
     # Process the message and get AI response
     response_message = await conversation_service.process_user_message(message_input)
@@ -206,7 +144,7 @@ async def _process_chat_message(
 
     # Create and send the AI response
     ai_response = _create_ai_response(session_id, response_message, sources)
-    await websocket.send_text(json.dumps(ai_response))
+    hub.send(connection_id, ai_response)
 
 
 async def authenticate_websocket(websocket: WebSocket, db: Session) -> dict[str, Any] | None:  # pylint: disable=too-many-return-statements
@@ -296,7 +234,8 @@ async def websocket_endpoint(
         return
 
     user_id = user_data["uuid"]
-    await manager.connect(websocket, user_id)
+    hub = get_connection_hub()
+    connection_id = await hub.connect(websocket, user_id)
 
     try:
         # Send welcome message
@@ -305,7 +244,7 @@ async def websocket_endpoint(
             "user_id": user_id,
             "message": "WebSocket connection established successfully",
         }
-        await websocket.send_text(json.dumps(welcome_message))
+        hub.send(connection_id, welcome_message)
 
         while True:
             # Wait for message from client
@@ -317,7 +256,7 @@ async def websocket_endpoint(
                 message_type = message_data.get("type", "chat_message")
 
                 if message_type == "ping":
-                    await _handle_ping_message(websocket, message_data)
+                    _handle_ping_message(connection_id, message_data)
                     continue
 
                 if message_type == "chat_message":
@@ -328,12 +267,12 @@ async def websocket_endpoint(
                             "type": "error",
                             "message": "Missing required fields: session_id and content",
                         }
-                        await websocket.send_text(json.dumps(error_response))
+                        hub.send(connection_id, error_response)
                         continue
 
                     # Process the message through the conversation service
                     try:
-                        await _process_chat_message(websocket, session_id, content, conversation_service)
+                        await _process_chat_message(connection_id, session_id, content, conversation_service)
 
                     except (ValueError, KeyError, AttributeError) as e:
                         logger.error("WebSocket: Error processing message: %s", str(e), exc_info=True)
@@ -342,7 +281,7 @@ async def websocket_endpoint(
                             "session_id": session_id,
                             "message": f"Processing error: {e}",
                         }
-                        await websocket.send_text(json.dumps(error_response))
+                        hub.send(connection_id, error_response)
 
                 else:
                     # Unknown message type
@@ -350,18 +289,21 @@ async def websocket_endpoint(
                         "type": "error",
                         "message": f"Unknown message type: {message_type}",
                     }
-                    await websocket.send_text(json.dumps(error_response))
+                    hub.send(connection_id, error_response)
 
             except json.JSONDecodeError:
                 error_response = {"type": "error", "message": "Invalid JSON format"}
-                await websocket.send_text(json.dumps(error_response))
+                hub.send(connection_id, error_response)
 
     except WebSocketDisconnect:
         logger.info("WebSocket: User %s disconnected", str(user_id))
-        manager.disconnect(user_id)
+    except RuntimeError as e:
+        # Raised by receive_text() after the hub closed a slow connection
+        logger.info("WebSocket: Connection of user %s closed: %s", str(user_id), str(e))
     except (ValueError, KeyError, AttributeError) as e:
         logger.error("WebSocket: Unexpected error for user %s: %s", str(user_id), str(e), exc_info=True)
-        manager.disconnect(user_id)
+    finally:
+        await hub.disconnect(connection_id)
 
 
 @router.websocket("/ws/health")
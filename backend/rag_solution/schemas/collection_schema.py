@@ -60,6 +60,55 @@ class CollectionOutput(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class CollectionSummary(BaseModel):
+    """
+    Lightweight collection view for hot paths such as search.
+
+    Read from the collection row alone: no files, users or vector store calls.
+    document_count and chunk_count are materialized at ingest and delete time
+    and reconciled against the vector store in the background.
+
+    Attributes:
+        document_count: Number of documents with chunks in the vector store
+        chunk_count: Total number of chunks in the vector store
+        stats_updated_at: When the chunk stats were last written
+        stats_reconciled_at: When the chunk stats were last checked against the vector store
+    """
+
+    id: UUID4
+    name: str
+    vector_db_name: str
+    is_private: bool
+    status: CollectionStatus
+    document_count: int = 0
+    chunk_count: int = 0
+    updated_at: datetime
+    stats_updated_at: datetime | None = None
+    stats_reconciled_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CollectionAccess(BaseModel):
+    """
+    Access decision for one user and one collection.
+
+    Loaded with a single primary-key query and cached per user and collection,
+    so access checks do not depend on how many collections the user belongs to.
+
+    Attributes:
+        is_member: Whether the user is linked to the collection
+    """
+
+    id: UUID4
+    user_id: UUID4 | None = None
+    is_private: bool
+    status: CollectionStatus
+    is_member: bool = False
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
 class CollectionInDB(BaseModel):
     id: UUID4
     name: str
@@ -4,6 +4,7 @@ This module defines Pydantic schemas for conversation sessions, messages,
 context management, and question suggestions.
 """
 
+import base64
 from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
@@ -76,6 +77,43 @@ class ExportFormat(str, Enum):
     CSV = "csv"
     TXT = "txt"
     PDF = "pdf"
+    NDJSON = "ndjson"
+
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class PageCursor(BaseModel):
+    """Keyset position of the last item on a page: its ``(created_at, id)``.
+
+    Clients receive it as an opaque token and send it back to get the next page.
+    """
+
+    created_at: datetime = Field(..., description="Creation timestamp of the last item returned")
+    id: UUID4 = Field(..., description="ID of the last item returned")
+
+    def encode(self) -> str:
+        """Encode the cursor as a URL-safe token."""
+        return base64.urlsafe_b64encode(self.model_dump_json().encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        """Decode a token produced by :meth:`encode`.
+
+        Raises:
+            ValueError: If the token is not a valid cursor
+        """
+        try:
+            return cls.model_validate_json(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        except ValueError as e:
+            raise ValueError(f"Invalid page cursor: {token}") from e
+
+    @classmethod
+    def next_token(cls, items: list[Any], limit: int) -> str | None:
+        """Token for the page after ``items``, or None if ``items`` was the last page."""
+        if not items or len(items) < limit:
+            return None
+        return cls(created_at=items[-1].created_at, id=items[-1].id).encode()
 
 
 class ConversationSessionCreateInput(BaseModel):
@@ -268,23 +306,25 @@ class ConversationMessageOutput(BaseModel):
         # Debug logging for token count extraction
 
         # Handle metadata properly - it's stored as a dict in the database
+        # List projections leave out the metadata column entirely
+        message_metadata = getattr(message, "message_metadata", None)
         metadata_value = None
         raw_metadata = None
-        if message.message_metadata:
-            if isinstance(message.message_metadata, dict):
-                raw_metadata = message.message_metadata  # Keep reference to raw dict
+        if message_metadata:
+            if isinstance(message_metadata, dict):
+                raw_metadata = message_metadata  # Keep reference to raw dict
                 # It's already a dictionary from the database - convert to MessageMetadata object
                 try:
-                    metadata_value = MessageMetadata(**message.message_metadata)
+                    metadata_value = MessageMetadata(**message_metadata)
                 except (ValueError, KeyError, AttributeError) as e:
                     logger.error("Failed to create MessageMetadata from database dict: %s", str(e))
-                    logger.error("Database metadata: %s", str(message.message_metadata))
+                    logger.error("Database metadata: %s", str(message_metadata))
                     metadata_value = None
-            elif isinstance(message.message_metadata, MessageMetadata):
+            elif isinstance(message_metadata, MessageMetadata):
                 # It's already a MessageMetadata object
-                metadata_value = message.message_metadata
+                metadata_value = message_metadata
             else:
-                logger.warning("Unexpected metadata type: %s", type(message.message_metadata))
+                logger.warning("Unexpected metadata type: %s", type(message_metadata))
 
         # Reconstruct token_analysis from metadata if available
         token_analysis = None
@@ -3,7 +3,7 @@
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import UUID4, BaseModel, ConfigDict, Field
 
 
 class ActivityType(str, Enum):
@@ -98,6 +98,25 @@ class SystemHealthStatus(BaseModel):
     components: list[SystemHealth] = Field(..., description="Individual component health")
 
 
+class PipelineQualityMetrics(BaseModel):
+    """Average LLM-as-judge scores of one pipeline."""
+
+    pipeline_id: UUID4 | None = Field(None, description="Pipeline ID (None for searches without a pipeline)")
+    evaluations: int = Field(..., ge=0, description="Number of evaluated searches")
+    faithfulness: float | None = Field(None, description="Average faithfulness score (0-1)")
+    answer_relevance: float | None = Field(None, description="Average answer relevance score (0-1)")
+    context_relevance: float | None = Field(None, description="Average context relevance score (0-1)")
+    overall_score: float | None = Field(None, description="Average of the three scores (0-1)")
+    last_evaluated_at: datetime | None = Field(None, description="Time of the latest evaluation")
+
+
+class QualityMetrics(BaseModel):
+    """Live answer quality metrics from runtime evaluation."""
+
+    period_hours: int = Field(..., description="Time window the averages cover")
+    pipelines: list[PipelineQualityMetrics] = Field(..., description="Per-pipeline averages")
+
+
 class DashboardOutput(BaseModel):
     """Dashboard combined output schema."""
 
@@ -0,0 +1,81 @@
+"""Helpers shared by the background jobs started in the application lifespan.
+
+Background jobs run blocking database work off the event loop, each run with
+its own short-lived session. PeriodicTask owns the asyncio task that calls a
+job at a fixed interval in the default executor and keeps it alive across
+failed runs.
+"""
+
+import asyncio
+import contextlib
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from core.logging_utils import get_logger
+
+logger = get_logger("services.background_tasks")
+
+
+def default_session_factory() -> Session:
+    """Create a session bound to the application database.
+
+    Imported lazily so modules that only define background jobs do not load the
+    database module (and create its engine) on import.
+    """
+    from rag_solution.file_management.database import SessionLocal  # pylint: disable=import-outside-toplevel
+
+    return SessionLocal()
+
+
+class PeriodicTask:
+    """Runs ``run_once`` in the default executor every ``interval_seconds``.
+
+    Subclasses implement ``run_once`` and set ``task_name``. An interval of
+    zero or less disables the job.
+    """
+
+    task_name = "periodic-task"
+
+    def __init__(self, interval_seconds: float) -> None:
+        """
+        Initialize the task.
+
+        Args:
+            interval_seconds: Time between runs
+        """
+        self.interval_seconds = interval_seconds
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> bool:
+        """Start running in the background of the running event loop.
+
+        Returns:
+            True if the task was started by this call
+        """
+        if self.interval_seconds <= 0 or (self._task is not None and not self._task.done()):
+            return False
+        self._task = asyncio.get_running_loop().create_task(self._run(), name=self.task_name)
+        return True
+
+    async def stop(self) -> None:
+        """Stop the background task."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    def run_once(self) -> Any:
+        """Run the job once (blocking)."""
+        raise NotImplementedError
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await loop.run_in_executor(None, self.run_once)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # Justification: The job must keep running while the database or a backend is unavailable
+                logger.error("Background task %s failed: %s", self.task_name, e)
@@ -1,5 +1,6 @@
 """Chain of Thought (CoT) service for enhanced RAG search quality."""
 
+import asyncio
 import time
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
@@ -350,8 +351,8 @@ Answer:"""
         if llm_service and user_id:
             logger.info("✅ Using LLM service for reasoning step")
             try:
-                intermediate_answer, step_usage = self._generate_llm_response(
-                    llm_service, question, full_context, user_id
+                intermediate_answer, step_usage = await asyncio.to_thread(
+                    self._generate_llm_response, llm_service, question, full_context, user_id
                 )
             except ValueError:
                 logger.warning("Invalid UUID format for user_id: %s", user_id)
@@ -16,10 +16,12 @@ from __future__ import annotations
 import re
 from typing import Any
 
+import numpy as np
 from pydantic import UUID4
 
 from core.logging_utils import get_logger
 from rag_solution.schemas.structured_output_schema import Citation
+from vectordbs.data_types import cosine_similarity_matrix, to_embedding_matrix
 
 logger = get_logger("services.citation_attribution")
 
@@ -128,16 +130,16 @@ class CitationAttributionService:
         chunk_texts = [doc.get("content", "") for doc in context_documents]
         chunk_embeddings = self.embedding_service.get_embeddings(chunk_texts)
 
-        # Compute similarity matrix
+        # Compute the full sentence x chunk similarity matrix in one vectorized pass
         citation_scores: dict[int, float] = {}
-        for _sent_idx, sent_emb in enumerate(sentence_embeddings):
-            for chunk_idx, chunk_emb in enumerate(chunk_embeddings):
-                similarity = self._cosine_similarity(sent_emb, chunk_emb)
-                # Track highest similarity score for each chunk
-                if similarity >= self.similarity_threshold and (
-                    chunk_idx not in citation_scores or similarity > citation_scores[chunk_idx]
-                ):
-                    citation_scores[chunk_idx] = similarity
+        if len(sentence_embeddings) and len(chunk_embeddings):
+            similarities = cosine_similarity_matrix(
+                to_embedding_matrix(sentence_embeddings), to_embedding_matrix(chunk_embeddings)
+            )
+            # Track highest similarity score for each chunk
+            best_scores = similarities.max(axis=0)
+            for chunk_idx in np.flatnonzero(best_scores >= self.similarity_threshold):
+                citation_scores[int(chunk_idx)] = float(best_scores[chunk_idx])
 
         # Create citations for top-scoring chunks
         citations = self._create_citations_from_scores(
@@ -321,14 +323,7 @@ class CitationAttributionService:
         if len(vec1) != len(vec2):
             raise ValueError(f"Vectors must have same length: {len(vec1)} != {len(vec2)}")
 
-        dot_product = sum(a * b for a, b in zip(vec1, vec2, strict=True))
-        magnitude1 = sum(a * a for a in vec1) ** 0.5
-        magnitude2 = sum(b * b for b in vec2) ** 0.5
-
-        if magnitude1 == 0 or magnitude2 == 0:
-            return 0.0
-
-        return dot_product / (magnitude1 * magnitude2)
+        return float(cosine_similarity_matrix(to_embedding_matrix([vec1]), to_embedding_matrix([vec2]))[0, 0])
 
     def validate_citation_support(
         self,
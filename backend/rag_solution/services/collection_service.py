@@ -8,8 +8,11 @@ processing.
 
 # collection_service.py
 
+from typing import Any
+
 from fastapi import BackgroundTasks, UploadFile
 from pydantic import UUID4
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from core.config import Settings
@@ -28,7 +31,13 @@ from core.logging_utils import get_logger
 from rag_solution.core.exceptions import AlreadyExistsError
 from rag_solution.data_ingestion.ingestion import DocumentStore
 from rag_solution.repository.collection_repository import CollectionRepository
-from rag_solution.schemas.collection_schema import CollectionInput, CollectionOutput, CollectionStatus, FileInfo
+from rag_solution.schemas.collection_schema import (
+    CollectionAccess,
+    CollectionInput,
+    CollectionOutput,
+    CollectionStatus,
+    CollectionSummary,
+)
 from rag_solution.schemas.file_schema import FileOutput
 from rag_solution.schemas.llm_parameters_schema import LLMParametersInput
 from rag_solution.schemas.prompt_template_schema import PromptTemplateOutput, PromptTemplateType
@@ -64,7 +73,7 @@ class CollectionService:  # pylint: disable=too-many-instance-attributes
 
         # Initialize repositories and services
         self.collection_repository = CollectionRepository(db)
-        self.user_collection_service = UserCollectionService(db)
+        self.user_collection_service = UserCollectionService(db, settings)
         self.file_management_service = FileManagementService(db, settings)
 
         # Create vector store factory and get the configured store
@@ -130,198 +139,95 @@ class CollectionService:  # pylint: disable=too-many-instance-attributes
 
     def get_collection(self, collection_id: UUID4) -> CollectionOutput:
         """
-        Get a collection by its ID with chunk counts from vector store.
+        Get a collection by its ID with the chunk count of each file.
+
+        Chunk counts are read from Postgres, where they are written at ingest time.
         """
-        collection = self.collection_repository.get(collection_id)
+        return self.collection_repository.get(collection_id)
 
-        # Enrich file info with chunk counts from vector store
-        collection = self._add_chunk_counts_to_collection(collection)
+    def get_collection_summary(self, collection_id: UUID4) -> CollectionSummary:
+        """
+        Get the collection row with its materialized chunk stats.
 
-        return collection
+        Use this on hot paths (e.g. search access checks) that do not need files or users.
 
-    def _add_chunk_counts_to_collection(self, collection: CollectionOutput) -> CollectionOutput:
+        Raises:
+            NotFoundError: If the collection does not exist
         """
-        Add chunk counts to file info by querying vector store.
+        return self.collection_repository.get_summary(collection_id)
 
-        This method uses batch querying to avoid N+1 query problems. Instead of
-        querying each document individually, it collects all document_ids and
-        makes a single batch query to get chunk counts for all documents at once.
+    def get_collection_access(self, collection_id: UUID4, user_id: UUID4 | None) -> CollectionAccess | None:
+        """
+        Get the collection's privacy, status and whether the user is a member.
 
-        Args:
-            collection: Collection output to enrich with chunk counts
+        Cached per user and collection; use this for access checks instead of
+        listing the user's collections.
 
         Returns:
-            Collection output with chunk counts added to each file
+            CollectionAccess, or None if the collection does not exist
         """
+        return self.user_collection_service.get_collection_access(user_id, collection_id)
+
+    def record_ingested_chunk_counts(self, collection_id: UUID4, documents: list[Document]) -> None:
+        """Store the number of chunks written to the vector store per document."""
+        chunk_counts: dict[str, int] = {}
+        for document in documents:
+            if document.document_id:
+                chunk_counts[document.document_id] = chunk_counts.get(document.document_id, 0) + len(document.chunks)
         try:
-            # Early return if no files
-            if not collection.files:
-                return collection
-
-            # Collect all document_ids that need chunk counts
-            document_ids = [file_info.document_id for file_info in collection.files if file_info.document_id]
-
-            # Early return if no document_ids to query
-            if not document_ids:
-                # All files have no document_id, so chunk_count is 0 for all
-                enriched_files = [
-                    FileInfo(
-                        id=file_info.id,
-                        filename=file_info.filename,
-                        file_size_bytes=file_info.file_size_bytes,
-                        chunk_count=0,
-                        document_id=file_info.document_id,
-                    )
-                    for file_info in collection.files
-                ]
-                return CollectionOutput(
-                    id=collection.id,
-                    name=collection.name,
-                    vector_db_name=collection.vector_db_name,
-                    is_private=collection.is_private,
-                    created_at=collection.created_at,
-                    updated_at=collection.updated_at,
-                    files=enriched_files,
-                    user_ids=collection.user_ids,
-                    status=collection.status,
-                )
+            self.collection_repository.record_chunk_counts(collection_id, chunk_counts)
+        except SQLAlchemyError as e:
+            # The chunks are already stored; the next reconciliation repairs the stats
+            logger.warning("Failed to record chunk counts for collection %s: %s", str(collection_id), str(e))
 
-            # OPTIMIZATION: Batch query all document chunk counts at once
-            document_chunk_counts = self._get_batch_document_chunk_counts(collection.vector_db_name, document_ids)
-
-            # Enrich files using the pre-computed chunk counts
-            enriched_files = []
-            for file_info in collection.files:
-                chunk_count = 0
-                if file_info.document_id:
-                    chunk_count = document_chunk_counts.get(file_info.document_id, 0)
-
-                enriched_files.append(
-                    FileInfo(
-                        id=file_info.id,
-                        filename=file_info.filename,
-                        file_size_bytes=file_info.file_size_bytes,
-                        chunk_count=chunk_count,
-                        document_id=file_info.document_id,
-                    )
-                )
-
-            # Create new collection output with enriched files
-            return CollectionOutput(
-                id=collection.id,
-                name=collection.name,
-                vector_db_name=collection.vector_db_name,
-                is_private=collection.is_private,
-                created_at=collection.created_at,
-                updated_at=collection.updated_at,
-                files=enriched_files,
-                user_ids=collection.user_ids,
-                status=collection.status,
-            )
-        except Exception as e:
-            logger.warning(
-                "Failed to add chunk counts: %s. Returning collection without chunk counts",
-                str(e),
-            )
-            return collection
-
-    def _get_batch_document_chunk_counts(self, collection_name: str, document_ids: list[str]) -> dict[str, int]:
+    def reconcile_chunk_stats(self, collection_id: UUID4) -> CollectionSummary:
         """
-        Get chunk counts for multiple documents with pagination support.
+        Recount the chunks of every document in the vector store and store the counts.
 
-        This method optimizes performance by querying all document chunk counts
-        at once using Milvus IN operator. For collections with >16,384 chunks,
-        it automatically paginates to retrieve all results.
-
-        Performance: 100 documents takes <1 second vs 5-50 seconds with individual queries.
+        Repairs stats that drifted, e.g. after a failed write or chunks deleted outside the API.
 
         Args:
-            collection_name: Vector store collection name
-            document_ids: List of document IDs to count chunks for
+            collection_id: Collection UUID
 
         Returns:
-            Dictionary mapping document_id to chunk count
+            Collection summary with the reconciled stats
         """
-        try:
-            # For Milvus, use pymilvus to query with IN expression filter
-            from pymilvus import Collection
-
-            # Early return if no document_ids
-            if not document_ids:
-                return {}
-
-            # Load collection
-            milvus_collection = Collection(collection_name)
-
-            # Build batch query expression using IN operator
-            # Format: document_id in ["id1", "id2", "id3"]
-            import json
-
-            document_ids_json = json.dumps(document_ids)
-            expr = f"document_id in {document_ids_json}"
-
-            # Paginate through results to handle collections with >16,384 chunks
-            # Milvus constraint: offset + limit <= 16384
-            document_chunk_counts: dict[str, int] = {}
-            offset = 0
-            page_size = 16384  # Milvus maximum
-            total_chunks_retrieved = 0
-
-            while True:
-                # Query one page of results
-                results = milvus_collection.query(
-                    expr=expr,
-                    output_fields=["document_id"],
-                    limit=page_size,
-                    offset=offset,
-                )
-
-                # Break if no more results
-                if not results:
-                    break
-
-                # Count chunks per document_id in this page
-                for result in results:
-                    doc_id = result.get("document_id", "")
-                    if doc_id:
-                        document_chunk_counts[doc_id] = document_chunk_counts.get(doc_id, 0) + 1
-
-                total_chunks_retrieved += len(results)
-
-                # Break if we got fewer results than page_size (last page)
-                if len(results) < page_size:
-                    break
-
-                # Move to next page
-                offset += page_size
-
-                # Safety check: Milvus constraint is offset + limit <= 16384
-                # If next offset would exceed this, we can't paginate further
-                if offset >= 16384:
-                    logger.warning(
-                        "Reached Milvus pagination limit (offset=%d) for collection %s. "
-                        "Chunk counts may be incomplete if collection has >16,384 chunks.",
-                        offset,
-                        collection_name,
-                    )
-                    break
-
-            logger.info(
-                "Batch query for %d documents returned %d total chunks from collection %s (pages: %d)",
-                len(document_ids),
-                total_chunks_retrieved,
-                collection_name,
-                (offset // page_size) + 1,
-            )
+        collection = self.collection_repository.get_summary(collection_id)
+        files = self.file_management_service.get_files_by_collection(collection_id)
+        chunk_counts = self.vector_store.count_chunks_by_document(
+            collection.vector_db_name, [file.document_id for file in files if file.document_id]
+        )
+        self.collection_repository.record_chunk_counts(collection_id, chunk_counts, replace=True, reconciled=True)
+        logger.info(
+            "Reconciled chunk stats of collection %s: %d chunks in %d documents",
+            str(collection_id),
+            sum(chunk_counts.values()),
+            sum(1 for count in chunk_counts.values() if count),
+        )
+        return self.collection_repository.get_summary(collection_id)
 
-            return document_chunk_counts
+    def reconcile_all_chunk_stats(self) -> dict[str, Any]:
+        """
+        Reconcile the chunk stats of all completed collections.
 
-        except ImportError:
-            logger.warning("pymilvus not available, cannot count chunks")
-            return dict.fromkeys(document_ids, 0)
-        except Exception as e:
-            logger.warning("Error getting batch chunk counts for collection %s: %s", collection_name, str(e))
-            return dict.fromkeys(document_ids, 0)
+        Returns:
+            dict: Number of reconciled collections and errors per failed collection
+        """
+        reconciled = 0
+        errors: list[str] = []
+        for collection in self.collection_repository.get_all_collections():
+            if collection.status != CollectionStatus.COMPLETED:
+                continue
+            try:
+                self.reconcile_chunk_stats(collection.id)
+                reconciled += 1
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # Justification: One unreachable collection must not stop reconciling the others
+                logger.error("Failed to reconcile chunk stats of collection %s: %s", str(collection.id), str(e))
+                errors.append(f"{collection.id}: {e!s}")
+        summary = {"reconciled": reconciled, "errors": errors}
+        logger.info("Chunk stats reconciliation complete: %s", summary)
+        return summary
 
     def update_collection(self, collection_id: UUID4, collection_update: CollectionInput) -> CollectionOutput:
         """
@@ -513,7 +419,7 @@ class CollectionService:  # pylint: disable=too-many-instance-attributes
     ) -> list[Document]:
         """Process and ingest documents into vector store."""
         try:
-            return await self.ingest_documents(file_paths, vector_db_name, document_ids)
+            documents = await self.ingest_documents(file_paths, vector_db_name, document_ids)
         except DocumentIngestionError as e:
             logger.error("Document ingestion failed: %s", str(e))
             self.update_collection_status(collection_id, CollectionStatus.ERROR)
@@ -523,6 +429,8 @@ class CollectionService:  # pylint: disable=too-many-instance-attributes
                 error_type="ingestion_failed",
                 message=str(e),
             ) from e
+        self.record_ingested_chunk_counts(collection_id, documents)
+        return documents
 
     def _extract_document_texts(self, processed_documents: list[Document], collection_id: UUID4) -> list[str]:
         """Extract text chunks from processed documents."""
@@ -972,6 +880,7 @@ class CollectionService:  # pylint: disable=too-many-instance-attributes
                 self.vector_store.delete_collection(collection.vector_db_name)
                 # Recreate the collection with same metadata
                 self.vector_store.create_collection(collection.vector_db_name, {"is_private": collection.is_private})
+                self.collection_repository.record_chunk_counts(collection_id, {}, replace=True)
                 logger.info("Vector collection recreated: %s", collection.vector_db_name)
             except CollectionError as e:
                 logger.error("Error recreating vector collection: %s", str(e))
@@ -0,0 +1,64 @@
+"""Background reconciliation of materialized collection chunk stats.
+
+Chunk counts are written to Postgres when documents are ingested or deleted
+(see CollectionRepository.record_chunk_counts). This job periodically recounts
+the chunks of every completed collection in the vector store, repairing stats
+that drifted because a write failed or chunks were changed outside the API.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from core.config import Settings
+from core.logging_utils import get_logger
+from rag_solution.services.background_tasks import PeriodicTask, default_session_factory
+
+logger = get_logger("services.collection_stats_reconciler")
+
+
+class CollectionStatsReconciler(PeriodicTask):
+    """Periodically reconciles collection chunk stats against the vector store."""
+
+    task_name = "collection-stats-reconciler"
+
+    def __init__(
+        self,
+        settings: Settings,
+        interval_seconds: float,
+        session_factory: Callable[[], Session] | None = None,
+    ) -> None:
+        """
+        Initialize the reconciler.
+
+        Args:
+            settings: Configuration settings
+            interval_seconds: Time between reconciliation runs
+            session_factory: Creates database sessions for each run
+        """
+        super().__init__(interval_seconds)
+        self.settings = settings
+        self.session_factory = session_factory or default_session_factory
+
+    def start(self) -> bool:
+        """Start reconciling in the background of the running event loop."""
+        started = super().start()
+        if started:
+            logger.info("Collection stats reconciliation scheduled every %ss", self.interval_seconds)
+        return started
+
+    def reconcile(self) -> dict[str, Any]:
+        """Reconcile all completed collections once (blocking)."""
+        # pylint: disable=import-outside-toplevel
+        from rag_solution.services.collection_service import CollectionService
+
+        db = self.session_factory()
+        try:
+            return CollectionService(db, self.settings).reconcile_all_chunk_stats()
+        finally:
+            db.close()
+
+    def run_once(self) -> dict[str, Any]:
+        """Run one reconciliation (blocking)."""
+        return self.reconcile()
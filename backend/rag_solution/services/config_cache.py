@@ -1,75 +1,236 @@
-"""Request-scoped configuration cache.
+"""Two-tier cache for read-mostly configuration.
 
-Caches read-mostly config data (providers, models, templates, parameters)
-within a single request. No cross-request state.
+Provider configs, model lists, pipeline configs, prompt templates and LLM
+parameters are read on every search but change rarely. Reads go through:
+
+1. a request-scoped dict (see RequestContext.get_config_cache), so a request
+   sees one value per key even if the configuration changes mid-request
+2. a process-wide bounded LRU with a TTL, shared by all requests of the worker
+
+Keys are versioned per namespace. The repositories' write methods call
+invalidate_config() after committing, which bumps the namespace version in this
+process and publishes it with Postgres NOTIFY; ConfigCacheListener bumps the
+version in every other worker. The TTL bounds staleness if a notification is
+missed. Only immutable-by-convention pydantic outputs are cached, never ORM
+objects, and loader exceptions are never cached.
 """
 
+import threading
+import uuid
+from collections.abc import Callable
 from typing import Any
 
-from pydantic import UUID4
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
+from core.config import Settings, get_settings
 from core.logging_utils import get_logger
+from core.request_context import RequestContext
+from core.versioned_cache import VersionedTTLCache
+from rag_solution.services.postgres_listener import PostgresListener, default_engine
 
-logger = get_logger(__name__)
-
-
-class ConfigCache:
-    """Per-request cache for read-mostly configuration."""
-
-    def __init__(self, db: Session) -> None:
-        self._db = db
-        self._cache: dict[str, Any] = {}
-
-    def _get_or_set(self, key: str, loader: Any) -> Any:
-        if key not in self._cache:
-            self._cache[key] = loader()
-            logger.debug("ConfigCache MISS: %s", key)
-        else:
-            logger.debug("ConfigCache HIT: %s", key)
-        return self._cache[key]
-
-    def get_default_provider(self) -> Any:
-        from rag_solution.services.llm_provider_service import LLMProviderService
-
-        return self._get_or_set("default_provider", lambda: LLMProviderService(self._db).get_default_provider())
+logger = get_logger("services.config_cache")
 
-    def get_user_provider(self, user_id: UUID4) -> Any:
-        from rag_solution.services.llm_provider_service import LLMProviderService
+LLM_PROVIDER = "llm_provider"
+LLM_MODEL = "llm_model"
+LLM_PARAMETERS = "llm_parameters"
+PIPELINE = "pipeline"
+PROMPT_TEMPLATE = "prompt_template"
+ALL_NAMESPACES = (LLM_PROVIDER, LLM_MODEL, LLM_PARAMETERS, PIPELINE, PROMPT_TEMPLATE)
+
+# Identifies this process in notifications so it can skip its own
+_ORIGIN = uuid.uuid4().hex
 
-        return self._get_or_set(f"provider:{user_id}", lambda: LLMProviderService(self._db).get_user_provider(user_id))
 
-    def get_pipeline_config(self, user_id: UUID4) -> Any:
-        from rag_solution.repository.pipeline_repository import PipelineConfigRepository
-
-        return self._get_or_set(
-            f"pipeline:{user_id}", lambda: PipelineConfigRepository(self._db).get_user_default(user_id)
-        )
-
-    def get_rag_template(self, user_id: UUID4) -> Any:
-        from rag_solution.services.prompt_template_service import PromptTemplateService
-
-        return self._get_or_set(
-            f"template:rag:{user_id}", lambda: PromptTemplateService(self._db).get_rag_template(user_id)
-        )
-
-    def get_llm_parameters(self, user_id: UUID4) -> Any:
-        from core.config import get_settings
-        from rag_solution.services.llm_parameters_service import LLMParametersService
-
-        return self._get_or_set(
-            f"params:{user_id}", lambda: LLMParametersService(self._db, get_settings()).get_user_parameters(user_id)
-        )
+class ConfigCache(VersionedTTLCache[Any]):
+    """Bounded, thread-safe, process-wide cache of configuration reads.
 
-    def get_models_by_provider(self, provider_id: UUID4) -> Any:
-        from rag_solution.services.llm_model_service import LLMModelService
+    Scopes are config namespaces; invalidating a namespace bumps its version.
+    """
 
-        return self._get_or_set(
-            f"models:{provider_id}", lambda: LLMModelService(self._db).get_models_by_provider(provider_id)
+    cache_name = "Config cache"
+
+    def __init__(self, max_entries: int = 4096, ttl_seconds: float = 60.0) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached entries across all namespaces
+            ttl_seconds: Lifetime of a cached entry (0 disables expiry)
+        """
+        super().__init__(max_entries, ttl_seconds)
+
+    def invalidate(self, namespace: str) -> int:
+        """Invalidate every cached entry of a namespace.
+
+        Args:
+            namespace: Namespace whose configuration changed
+
+        Returns:
+            The new version of the namespace
+        """
+        return self.bump_version(namespace)
+
+
+_config_cache: ConfigCache | None = None
+_config_cache_lock = threading.Lock()
+
+
+def get_config_cache(settings: Settings | None = None) -> ConfigCache | None:
+    """Return the process-wide configuration cache, or None when disabled.
+
+    Args:
+        settings: Application settings (defaults to get_settings())
+
+    Returns:
+        The shared cache instance, or None if caching is disabled
+    """
+    global _config_cache  # pylint: disable=global-statement
+    settings = settings or get_settings()
+    if getattr(settings, "config_cache_enabled", False) is not True:
+        return None
+    if _config_cache is None:
+        with _config_cache_lock:
+            if _config_cache is None:
+                _config_cache = ConfigCache(
+                    max_entries=settings.config_cache_max_entries,
+                    ttl_seconds=settings.config_cache_ttl_seconds,
+                )
+    return _config_cache
+
+
+def cached_config[T](namespace: str, key: str, loader: Callable[[], T], cache_none: bool = True) -> T:
+    """Read a configuration value through the request and process tiers.
+
+    Args:
+        namespace: One of the namespaces defined in this module
+        key: Key within the namespace (e.g. a user or provider ID)
+        loader: Loads the value from the database on a miss
+        cache_none: Whether a None result is cached
+
+    Returns:
+        The configuration value
+    """
+    cache = get_config_cache()
+    if cache is None:
+        return loader()
+
+    # The request tier only lives as long as a request context
+    request_cache = RequestContext.get_config_cache() if RequestContext.has_user() else None
+    request_key = (namespace, cache.get_version(namespace), key)
+    if request_cache is not None and request_key in request_cache:
+        return request_cache[request_key]  # type: ignore[no-any-return]
+
+    value = cache.get_or_load(namespace, key, loader, cache_none)
+    if request_cache is not None and (value is not None or cache_none):
+        request_cache[request_key] = value
+    return value
+
+
+def invalidate_config(*namespaces: str, db: Session | None = None) -> None:
+    """Invalidate cached configuration in this process and notify other workers.
+
+    Called by the repositories after committing a configuration change.
+
+    Args:
+        namespaces: Namespaces whose configuration changed
+        db: Session that made the change, used to publish the notification
+    """
+    cache = _config_cache
+    if cache is not None:
+        for namespace in namespaces:
+            cache.invalidate(namespace)
+    if db is not None:
+        _publish(db, namespaces)
+
+
+def _publish(db: Session, namespaces: tuple[str, ...]) -> None:
+    settings = get_settings()
+    if getattr(settings, "config_cache_notify_enabled", False) is not True:
+        return
+    try:
+        bind = db.get_bind()
+        if bind.dialect.name != "postgresql":
+            return
+        # Sessions may be bound to an Engine or a Connection; both expose their Engine
+        engine: Engine = bind.engine
+        payload = f"{_ORIGIN}:{','.join(namespaces)}"
+        # A separate autocommit connection so the caller's transaction is not touched
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": settings.config_cache_notify_channel, "payload": payload},
+            )
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        # Justification: The change is committed; other workers fall back to the TTL
+        logger.warning("Failed to publish config cache invalidation for %s: %s", namespaces, e)
+
+
+def reset_config_cache() -> None:
+    """Discard the process-wide cache (used by tests)."""
+    global _config_cache  # pylint: disable=global-statement
+    with _config_cache_lock:
+        _config_cache = None
+
+
+class ConfigCacheListener(PostgresListener):
+    """Applies configuration invalidations published by other workers.
+
+    Holds one dedicated Postgres connection that LISTENs on the notification
+    channel. Notifications may be missed while disconnected, so every namespace
+    is invalidated whenever the connection is (re)established.
+    """
+
+    listener_name = "config-cache-listener"
+
+    def __init__(
+        self,
+        settings: Settings,
+        engine: Engine | None = None,
+        poll_seconds: float = 1.0,
+        retry_seconds: float = 5.0,
+    ) -> None:
+        """
+        Initialize the listener.
+
+        Args:
+            settings: Configuration settings
+            engine: Engine to open the listening connection from
+            poll_seconds: How often the listening thread checks for shutdown
+            retry_seconds: Delay before reconnecting after a connection failure
+        """
+        super().__init__(engine or default_engine(), settings.config_cache_notify_channel, poll_seconds, retry_seconds)
+        self.settings = settings
+
+    @property
+    def enabled(self) -> bool:
+        """Whether invalidations are exchanged through Postgres."""
+        return (
+            getattr(self.settings, "config_cache_enabled", False) is True
+            and getattr(self.settings, "config_cache_notify_enabled", False) is True
+            and self.engine.dialect.name == "postgresql"
         )
 
-    def invalidate(self, key: str | None = None) -> None:
-        if key:
-            self._cache.pop(key, None)
-        else:
-            self._cache.clear()
+    def start(self) -> None:
+        """Start listening in the background of the running event loop."""
+        if not self.enabled or (self._task is not None and not self._task.done()):
+            return
+        self._start_listening()
+        logger.info("Listening for config cache invalidations on %s", self.channel)
+
+    def handle(self, payload: str) -> None:
+        """Apply one notification payload (``<origin>:<namespace>,...``)."""
+        origin, _, namespaces = payload.partition(":")
+        if origin == _ORIGIN:
+            return
+        cache = _config_cache
+        if cache is None:
+            return
+        for namespace in filter(None, namespaces.split(",")):
+            cache.invalidate(namespace)
+
+    def _on_listen(self) -> None:
+        invalidate_config(*ALL_NAMESPACES)
+
+    def _on_notify(self, payload: str) -> None:
+        self.handle(payload)
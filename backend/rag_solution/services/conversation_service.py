@@ -4,12 +4,15 @@ This service handles conversation sessions, message processing,
 and integration with search and context management services.
 """
 
+import json
 import logging
 import re
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
+from fastapi.concurrency import iterate_in_threadpool
 from sqlalchemy.orm import Session
 
 from core.config import Settings
@@ -25,6 +28,7 @@ from rag_solution.schemas.conversation_schema import (
     MessageMetadata,
     MessageRole,
     MessageType,
+    PageCursor,
     QuestionSuggestionOutput,
     SessionStatistics,
     SessionStatus,
@@ -37,6 +41,7 @@ from rag_solution.services.llm_provider_service import LLMProviderService
 from rag_solution.services.question_service import QuestionService
 from rag_solution.services.search_service import SearchService
 from rag_solution.services.token_tracking_service import TokenTrackingService
+from rag_solution.services.tokenizer_service import get_tokenizer_service
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +77,19 @@ class ConversationService:  # pylint: disable=too-many-instance-attributes,too-m
         self._context_cache: dict[str, ConversationContext] = {}
         self._cache_ttl = 300  # 5 minutes
 
+    @property
+    def _async_reads(self) -> bool:
+        """Whether the repository has an async session for the non-blocking session/message reads."""
+        return (
+            isinstance(self.repository, ConversationRepository)
+            and getattr(self.repository, "async_db", None) is not None
+        )
+
+    async def _get_session_by_id(self, session_id: UUID) -> ConversationSessionOutput:
+        if self._async_reads:
+            return await self.repository.get_session_by_id_async(session_id)
+        return self.repository.get_session_by_id(session_id)
+
     @property
     def search_service(self) -> SearchService:
         """Get search service instance."""
@@ -131,7 +149,7 @@ class ConversationService:  # pylint: disable=too-many-instance-attributes,too-m
 
     async def get_session(self, session_id: UUID, user_id: UUID) -> ConversationSessionOutput:
         """Get a conversation session by ID with eager loaded relationships."""
-        session = self.repository.get_session_by_id(session_id)
+        session = await self._get_session_by_id(session_id)
 
         # Validate user has access
         if session.user_id != user_id:
@@ -166,21 +184,29 @@ class ConversationService:  # pylint: disable=too-many-instance-attributes,too-m
 
         return self.repository.delete_session(session_id)
 
-    async def list_sessions(self, user_id: UUID, collection_id: UUID | None = None) -> list[ConversationSessionOutput]:
-        """List all sessions for a user with eager loaded relationships.
+    async def list_sessions(
+        self,
+        user_id: UUID,
+        collection_id: UUID | None = None,
+        limit: int = 50,
+        cursor: PageCursor | None = None,
+    ) -> list[ConversationSessionOutput]:
+        """List a page of a user's sessions, newest first.
 
-        Uses unified repository's eager loading to eliminate N+1 queries.
-        Previously: 54 queries (1 + 53 message counts)
-        Now: 1 query with joinedload
+        Sessions and their message counts are read in one query without loading
+        any messages.
 
         Args:
             user_id: The user whose sessions to list
             collection_id: Optional filter to return only sessions for this collection
+            limit: Maximum number of sessions to return
+            cursor: Position of the last session on the previous page
         """
-        sessions = self.repository.get_sessions_by_user(user_id)
-        if collection_id:
-            sessions = [s for s in sessions if s.collection_id == collection_id]
-        return sessions
+        if self._async_reads:
+            return await self.repository.get_sessions_by_user_async(
+                user_id, limit=limit, after=cursor, collection_id=collection_id
+            )
+        return self.repository.get_sessions_by_user(user_id, limit=limit, after=cursor, collection_id=collection_id)
 
     async def add_message(self, message_input: ConversationMessageInput) -> ConversationMessageOutput:
         """Add a message to a conversation session."""
@@ -223,19 +249,38 @@ class ConversationService:  # pylint: disable=too-many-instance-attributes,too-m
         return ConversationMessageOutput.from_db_message(db_message)
 
     async def get_messages(
-        self, session_id: UUID, user_id: UUID, limit: int = 50, offset: int = 0
+        self,
+        session_id: UUID,
+        user_id: UUID,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: PageCursor | None = None,
+        include_metadata: bool = True,
     ) -> list[ConversationMessageOutput]:
-        """Get messages for a conversation session."""
+        """Get messages for a conversation session.
+
+        Pass the position of the last message on the previous page as ``cursor``
+        to page through long conversations at constant cost per page. With
+        ``include_metadata=False`` the metadata JSON (sources, CoT output, token
+        analysis) is not read, for list views that only show the messages.
+        """
         # First verify the user has access to this session
         try:
-            session = self.repository.get_session_by_id(session_id)
+            session = await self._get_session_by_id(session_id)
             if session.user_id != user_id:
                 return []
         except NotFoundError:
             return []
 
         # Repository returns database models, convert to schemas
-        db_messages = self.repository.get_messages_by_session(session_id, limit=limit, offset=offset)
+        if self._async_reads:
+            db_messages = await self.repository.get_messages_by_session_async(
+                session_id, limit=limit, offset=offset, after=cursor, include_metadata=include_metadata
+            )
+        else:
+            db_messages = self.repository.get_messages_by_session(
+                session_id, limit=limit, offset=offset, after=cursor, include_metadata=include_metadata
+            )
         return [ConversationMessageOutput.from_db_message(msg) for msg in db_messages]
 
     async def process_user_message(self, message_input: ConversationMessageInput) -> ConversationMessageOutput:
@@ -280,7 +325,7 @@ class ConversationService:  # pylint: disable=too-many-instance-attributes,too-m
         user_token_count = message_input.token_count or 0
         if user_token_count == 0:
             # Simple token estimation for user message
-            user_token_count = max(5, int(len(message_input.content.split()) * 1.3))  # Rough estimation
+            user_token_count = max(5, get_tokenizer_service().count_tokens(message_input.content))
 
         # Create user message input with token count
         user_message_input = ConversationMessageInput(
@@ -522,16 +567,14 @@ class ConversationService:  # pylint: disable=too-many-instance-attributes,too-m
                     logger.info("✅ Real token count from provider: assistant=%d", assistant_response_tokens)
                 except (ValueError, KeyError, AttributeError) as e:
                     logger.info("Provider tokenize failed, using improved estimation: %s", str(e))
-                    # Better estimation: roughly 1.3 tokens per word for most LLMs
-                    assistant_response_tokens = max(50, int(len(search_result.answer.split()) * 1.3))
+                    assistant_response_tokens = max(50, get_tokenizer_service().count_tokens(search_result.answer))
             else:
                 # Fallback to improved estimation
-                assistant_response_tokens = max(50, int(len(search_result.answer.split()) * 1.3))
+                assistant_response_tokens = max(50, get_tokenizer_service().count_tokens(search_result.answer))
 
         except (ValueError, KeyError, AttributeError) as e:
             logger.info("Using improved token estimation: %s", str(e))
-            # Better estimation: roughly 1.3 tokens per word for most LLMs
-            assistant_response_tokens = max(50, int(len(search_result.answer.split()) * 1.3))
+            assistant_response_tokens = max(50, get_tokenizer_service().count_tokens(search_result.answer))
 
         # Add CoT token usage to the total token count
         cot_token_usage = 0
@@ -809,6 +852,32 @@ class ConversationService:  # pylint: disable=too-many-instance-attributes,too-m
             "metadata": {"cot_integration": True, "context_enhancement": True},
         }
 
+    async def export_session_stream(self, session_id: UUID, user_id: UUID, batch_size: int = 500) -> AsyncIterator[str]:
+        """Export a conversation session as newline-delimited JSON.
+
+        Access is checked before this returns, so a missing session raises here
+        rather than part-way through a response. The first line holds the
+        session and every following line one message, read in keyset pages of
+        ``batch_size`` so memory use does not grow with the conversation.
+
+        Raises:
+            NotFoundError: If the session does not exist or belongs to another user
+        """
+        session = await self.get_session(session_id, user_id)
+
+        async def lines() -> AsyncIterator[str]:
+            yield json.dumps({"type": "session", "data": session.model_dump(mode="json")}) + "\n"
+            if self._async_reads:
+                messages = self.repository.iter_messages_async(session_id, batch_size=batch_size)
+            else:
+                # Each page is a blocking query; fetch the pages in the threadpool
+                messages = iterate_in_threadpool(self.repository.iter_messages(session_id, batch_size=batch_size))
+            async for db_message in messages:
+                message = ConversationMessageOutput.from_db_message(db_message)
+                yield json.dumps({"type": "message", "data": message.model_dump(mode="json")}) + "\n"
+
+        return lines()
+
     # Context Management Methods (moved from ContextManagerService)
     async def build_context_from_messages(  # pylint: disable=too-many-locals,too-many-branches
         self, session_id: UUID, messages: list[ConversationMessageOutput]
@@ -25,6 +25,7 @@ from rag_solution.schemas.conversation_schema import (
 from rag_solution.schemas.llm_usage_schema import ServiceType
 from rag_solution.services.llm_provider_service import LLMProviderService
 from rag_solution.services.token_tracking_service import TokenTrackingService
+from rag_solution.services.tokenizer_service import get_tokenizer_service
 
 logger = logging.getLogger(__name__)
 
@@ -447,5 +448,4 @@ Format your response as structured text that can be easily parsed."""
 
     async def _estimate_tokens(self, text: str) -> int:
         """Estimate token count for text."""
-        # Simple estimation: ~4 characters per token for English text
-        return len(text) // 4
+        return get_tokenizer_service().count_tokens(text)
@@ -15,10 +15,13 @@ from rag_solution.models.collection import Collection
 from rag_solution.models.conversation import ConversationMessage, ConversationSession
 from rag_solution.models.file import File
 from rag_solution.models.pipeline import PipelineConfig
+from rag_solution.repository.evaluation_result_repository import EvaluationResultRepository
 from rag_solution.schemas.dashboard_schema import (
     ActivityStatus,
     ActivityType,
     DashboardStats,
+    PipelineQualityMetrics,
+    QualityMetrics,
     QuickStat,
     QuickStatistics,
     RecentActivity,
@@ -428,6 +431,24 @@ class DashboardService:
                 error_rate=QuickStat(metric="Error Rate", value="0.0%", change="+0%", trend="up"),
             )
 
+    def get_quality_metrics(self, hours: int = 24) -> QualityMetrics:
+        """Get average evaluation scores per pipeline.
+
+        Scores are written by the background evaluation queue when runtime
+        evaluation is enabled.
+
+        Args:
+            hours: Time window in hours
+
+        Returns:
+            QualityMetrics: Per-pipeline averages, best overall score first
+        """
+        since = datetime.now(UTC).replace(tzinfo=None) - timedelta(hours=hours)
+        summaries = EvaluationResultRepository(self.db).get_pipeline_summaries(since)
+        pipelines = [PipelineQualityMetrics(**summary) for summary in summaries]
+        pipelines.sort(key=lambda pipeline: pipeline.overall_score or 0.0, reverse=True)
+        return QualityMetrics(period_hours=hours, pipelines=pipelines)
+
     def get_system_health(self) -> SystemHealthStatus:
         """Get system health status.
 
@@ -7,6 +7,7 @@ from core.custom_exceptions import LLMProviderError, ModelConfigError, ModelVali
 from rag_solution.repository.llm_model_repository import LLMModelRepository
 from rag_solution.repository.llm_provider_repository import LLMProviderRepository
 from rag_solution.schemas.llm_model_schema import LLMModelInput, LLMModelOutput, LLMModelUpdate, ModelType
+from rag_solution.services.config_cache import LLM_MODEL, cached_config
 
 logger = logging.getLogger("services.llm_model")
 
@@ -113,7 +114,10 @@ class LLMModelService:
     def get_models_by_provider(self, provider_id: UUID4) -> list[LLMModelOutput]:
         """Get all models for a provider."""
         try:
-            return self.repository.get_models_by_provider(provider_id)
+            models = cached_config(
+                LLM_MODEL, f"provider:{provider_id}", lambda: self.repository.get_models_by_provider(provider_id)
+            )
+            return list(models)
         except Exception as e:
             raise LLMProviderError(provider=str(provider_id), error_type="model_retrieval", message=str(e)) from e
 
@@ -11,6 +11,7 @@ from rag_solution.schemas.llm_parameters_schema import (
     LLMParametersInput,
     LLMParametersOutput,
 )
+from rag_solution.services.config_cache import LLM_PARAMETERS, cached_config
 
 logger = get_logger("services.llm_parameters")
 
@@ -172,6 +173,14 @@ class LLMParametersService:
         Returns:
             Optional[LLMParametersOutput]: Default or latest parameters, or None if creation fails
         """
+        return cached_config(
+            LLM_PARAMETERS,
+            f"latest_or_default:{user_id}",
+            lambda: self._load_latest_or_default_parameters(user_id),
+            cache_none=False,
+        )
+
+    def _load_latest_or_default_parameters(self, user_id: UUID4) -> LLMParametersOutput | None:
         default_params = self.repository.get_default_parameters(user_id)
         if default_params:
             return self._to_output(default_params)
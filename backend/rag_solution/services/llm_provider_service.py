@@ -16,6 +16,7 @@ from rag_solution.schemas.llm_provider_schema import (
     LLMProviderOutput,
     LLMProviderUpdate,
 )
+from rag_solution.services.config_cache import LLM_PROVIDER, cached_config
 
 logger = logging.getLogger("services.llm_provider")
 
@@ -53,13 +54,19 @@ class LLMProviderService:
     def get_provider_by_name(self, name: str) -> LLMProviderConfig | None:
         """Get provider configuration by name."""
         try:
-            provider = self.repository.get_provider_by_name_with_credentials(name)
-            return LLMProviderConfig.model_validate(provider) if provider else None
+            return cached_config(LLM_PROVIDER, f"config:{name}", lambda: self._load_provider_config(name))
         except Exception as e:
             raise LLMProviderError(provider=name, error_type="retrieval", message=str(e)) from e
 
+    def _load_provider_config(self, name: str) -> LLMProviderConfig | None:
+        provider = self.repository.get_provider_by_name_with_credentials(name)
+        return LLMProviderConfig.model_validate(provider) if provider else None
+
     def get_provider_by_id(self, provider_id: UUID4) -> LLMProviderOutput | None:
         """Get provider by ID."""
+        return cached_config(LLM_PROVIDER, f"id:{provider_id}", lambda: self._load_provider(provider_id))
+
+    def _load_provider(self, provider_id: UUID4) -> LLMProviderOutput | None:
         provider = self.repository.get_provider_by_id(provider_id)
         return LLMProviderOutput.model_validate(provider) if provider else None
 
@@ -106,6 +113,11 @@ class LLMProviderService:
         Returns:
             Optional[LLMProviderOutput]: Provider configuration if found
         """
+        return cached_config(
+            LLM_PROVIDER, f"user:{user_id}", lambda: self._load_user_provider(user_id), cache_none=False
+        )
+
+    def _load_user_provider(self, user_id: UUID4) -> LLMProviderOutput | None:
         try:
             # Try to get user's preferred provider first
             from rag_solution.models.user import User
@@ -31,6 +31,7 @@ from rag_solution.services.conversation_context_service import ConversationConte
 from rag_solution.services.llm_provider_service import LLMProviderService
 from rag_solution.services.search_service import SearchService
 from rag_solution.services.token_tracking_service import TokenTrackingService
+from rag_solution.services.tokenizer_service import get_tokenizer_service
 
 logger = logging.getLogger(__name__)
 
@@ -167,7 +168,7 @@ class MessageProcessingOrchestrator:
         user_token_count = message_input.token_count or 0
         if user_token_count == 0:
             # Simple token estimation for user message
-            user_token_count = max(5, int(len(message_input.content.split()) * 1.3))  # Rough estimation
+            user_token_count = max(5, get_tokenizer_service().count_tokens(message_input.content))
 
         # 3. Store user message
         user_message_input = ConversationMessageInput(
@@ -397,13 +398,13 @@ class MessageProcessingOrchestrator:
                     logger.info("✅ Real token count from provider: assistant=%d", assistant_response_tokens)
                 except (ValueError, KeyError, AttributeError) as e:
                     logger.info("Provider tokenize failed, using improved estimation: %s", str(e))
-                    assistant_response_tokens = max(50, int(len(search_result.answer.split()) * 1.3))
+                    assistant_response_tokens = max(50, get_tokenizer_service().count_tokens(search_result.answer))
             else:
-                assistant_response_tokens = max(50, int(len(search_result.answer.split()) * 1.3))
+                assistant_response_tokens = max(50, get_tokenizer_service().count_tokens(search_result.answer))
 
         except (ValueError, KeyError, AttributeError) as e:
             logger.info("Using improved token estimation: %s", str(e))
-            assistant_response_tokens = max(50, int(len(search_result.answer.split()) * 1.3))
+            assistant_response_tokens = max(50, get_tokenizer_service().count_tokens(search_result.answer))
 
         # Add CoT token usage
         cot_token_usage = 0
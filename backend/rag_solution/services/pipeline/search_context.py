@@ -5,6 +5,7 @@ This module defines the SearchContext dataclass that carries data between
 pipeline stages, accumulating results as the search progresses.
 """
 
+import asyncio
 import time
 from dataclasses import dataclass, field
 from typing import Any
@@ -41,6 +42,8 @@ class SearchContext:  # pylint: disable=too-many-instance-attributes
         query_results: Retrieved documents
         rewritten_query: Query after enhancement
         document_metadata: Metadata about retrieved documents
+        speculative_query: Query of a retrieval started before enhancement finished
+        speculative_retrieval: Pending results of the speculative retrieval
 
         # Generation Results
         generated_answer: Final answer from LLM
@@ -69,6 +72,8 @@ class SearchContext:  # pylint: disable=too-many-instance-attributes
     query_results: list[QueryResult] = field(default_factory=list)
     rewritten_query: str | None = None
     document_metadata: list[DocumentMetadata] = field(default_factory=list)
+    speculative_query: str | None = None
+    speculative_retrieval: "asyncio.Future[list[QueryResult]] | None" = None
 
     # Generation Results
     generated_answer: str = ""
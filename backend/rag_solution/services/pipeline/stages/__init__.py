@@ -4,6 +4,7 @@ Pipeline stages for search execution.
 This module contains concrete implementations of pipeline stages.
 """
 
+from .diversity_stage import DiversityStage
 from .generation_stage import GenerationStage
 from .pipeline_resolution_stage import PipelineResolutionStage
 from .query_enhancement_stage import QueryEnhancementStage
@@ -12,6 +13,7 @@ from .reranking_stage import RerankingStage
 from .retrieval_stage import RetrievalStage
 
 __all__ = [
+    "DiversityStage",
     "GenerationStage",
     "PipelineResolutionStage",
     "QueryEnhancementStage",
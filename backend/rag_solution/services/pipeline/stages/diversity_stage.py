@@ -0,0 +1,180 @@
+"""
+Diversity stage.
+
+This stage removes near-duplicate chunks and orders the remaining candidates by
+maximal marginal relevance (MMR) between retrieval and reranking, so the
+reranker and the LLM context are not spent on repeated passages.
+"""
+
+import numpy as np
+
+from core.logging_utils import get_logger
+from rag_solution.services.pipeline.base_stage import BaseStage, StageResult
+from rag_solution.services.pipeline.search_context import SearchContext
+from rag_solution.utils.diversity import mmr_select, near_duplicate_mask
+from rag_solution.utils.term_vectors import term_vectors
+from vectordbs.data_types import EmbeddingArray, Embeddings, QueryResult, has_embeddings
+
+logger = get_logger("services.pipeline.stages.diversity")
+
+
+class DiversityStage(BaseStage):  # pylint: disable=too-few-public-methods
+    """
+    Suppresses near-duplicates and diversifies retrieved documents.
+
+    This stage:
+    1. Checks if diversity is enabled (settings + config_metadata)
+    2. Drops chunks whose SimHash fingerprint nearly matches a more relevant chunk
+    3. Orders the remaining chunks by MMR over their stored vectors
+       (hashed term vectors when the vector store did not return vectors)
+    4. Updates context with the diversified results
+
+    Note: Single public method (execute) is by design for pipeline stage pattern.
+    """
+
+    def __init__(self, pipeline_service: "PipelineService") -> None:  # type: ignore
+        """
+        Initialize the diversity stage.
+
+        Args:
+            pipeline_service: PipelineService instance providing settings
+        """
+        super().__init__("Diversity")
+        self.pipeline_service = pipeline_service
+
+    async def execute(self, context: SearchContext) -> StageResult:
+        """
+        Execute near-duplicate removal and MMR ordering.
+
+        Args:
+            context: Current search context
+
+        Returns:
+            StageResult with diversified results in context
+
+        Raises:
+            ValueError: If required context attributes are missing
+            AttributeError: If context attributes are not accessible
+        """
+        self._log_stage_start(context)
+
+        try:
+            if not self._should_diversify(context):
+                logger.info("Diversity disabled, skipping stage")
+                result = StageResult(success=True, context=context)
+                self._log_stage_complete(result)
+                return result
+
+            if context.query_results is None:
+                raise ValueError("Query results not set in context")
+
+            results = context.query_results
+            original_count = len(results)
+            if original_count < 2:
+                result = StageResult(success=True, context=context)
+                self._log_stage_complete(result)
+                return result
+
+            settings = self.pipeline_service.settings
+            config = context.search_input.config_metadata or {}
+            max_distance = int(config.get("duplicate_distance", settings.diversity_duplicate_distance))
+            lambda_mult = float(config.get("mmr_lambda", settings.diversity_mmr_lambda))
+            top_k = config.get("top_k_diversity")
+
+            # Most relevant first, so the kept copy of each duplicate group is the best scored one
+            scores = [self._score(result) for result in results]
+            order = sorted(range(original_count), key=lambda i: -scores[i])
+            candidates = [results[i] for i in order]
+            texts = [(result.chunk.text if result.chunk else None) or "" for result in candidates]
+
+            duplicates = near_duplicate_mask(texts, max_distance=max_distance)
+            keep = np.flatnonzero(~duplicates).tolist()
+            candidates = [candidates[i] for i in keep]
+            texts = [texts[i] for i in keep]
+
+            vectors, vector_source = self._candidate_vectors(candidates, texts)
+            selected = mmr_select(
+                vectors,
+                [scores[order[i]] for i in keep],
+                lambda_mult=lambda_mult,
+                top_k=int(top_k) if top_k is not None else None,
+            )
+            context.query_results = [candidates[i] for i in selected]
+
+            logger.info(
+                "Diversified %d documents: %d near-duplicates removed, %d kept (%s vectors)",
+                original_count,
+                int(duplicates.sum()),
+                len(context.query_results),
+                vector_source,
+            )
+            context.add_metadata(
+                "diversity",
+                {
+                    "original_count": original_count,
+                    "duplicates_removed": int(duplicates.sum()),
+                    "diversified_count": len(context.query_results),
+                    "mmr_lambda": lambda_mult,
+                    "vectors": vector_source,
+                },
+            )
+
+            result = StageResult(success=True, context=context)
+            self._log_stage_complete(result)
+            return result
+
+        except (ValueError, AttributeError, TypeError, KeyError) as e:
+            return await self._handle_error(context, e)
+
+    def _should_diversify(self, context: SearchContext) -> bool:
+        """
+        Check if diversification should be performed.
+
+        Args:
+            context: Search context
+
+        Returns:
+            True if diversity is enabled, False otherwise
+        """
+        if getattr(self.pipeline_service.settings, "diversity_enabled", False) is not True:
+            return False
+
+        if context.search_input.config_metadata and context.search_input.config_metadata.get(
+            "disable_diversity", False
+        ):
+            logger.debug("Diversity disabled via config_metadata")
+            return False
+
+        return True
+
+    @staticmethod
+    def _score(result: QueryResult) -> float:
+        """Retrieval score of a result (0.0 when missing)."""
+        if result.score is not None:
+            return float(result.score)
+        return float(getattr(result.chunk, "score", None) or 0.0)
+
+    @staticmethod
+    def _candidate_vectors(candidates: list[QueryResult], texts: list[str]) -> tuple[np.ndarray, str]:
+        """
+        Build the vectors MMR compares candidates with.
+
+        Args:
+            candidates: Candidate results
+            texts: Candidate chunk texts
+
+        Returns:
+            Vector matrix and its source ("stored" or "term")
+        """
+        stored: list[Embeddings | EmbeddingArray] = []
+        for result in candidates:
+            vector = result.embeddings
+            if vector is None or not has_embeddings(vector):
+                vector = result.chunk.embeddings if result.chunk else None
+            if vector is None or not has_embeddings(vector):
+                # MMR needs every candidate in one space, so skip stored vectors altogether
+                return term_vectors(texts), "term"
+            stored.append(vector)
+        if len({len(vector) for vector in stored}) == 1:
+            return np.asarray(stored, dtype=np.float32), "stored"
+        return term_vectors(texts), "term"
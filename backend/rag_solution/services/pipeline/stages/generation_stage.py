@@ -5,10 +5,12 @@ This stage generates the final answer using LLM or CoT reasoning.
 Wraps the answer generation functionality from PipelineService.
 """
 
+import asyncio
 import re
 from typing import Any
 
 from core.logging_utils import get_logger
+from rag_solution.evaluation.evaluation_queue import EvaluationJob, get_evaluation_queue
 from rag_solution.schemas.structured_output_schema import StructuredOutputConfig
 from rag_solution.services.pipeline.base_stage import BaseStage, StageResult
 from rag_solution.services.pipeline.search_context import SearchContext
@@ -25,6 +27,7 @@ class GenerationStage(BaseStage):  # pylint: disable=too-few-public-methods
     2. Otherwise, generates answer from reranked documents
     3. Applies answer cleaning and formatting
     4. Updates context with generated answer
+    5. Queues the answer for background evaluation (if runtime_eval is enabled)
 
     Note: Single public method (execute) is by design for pipeline stage pattern.
     """
@@ -95,6 +98,9 @@ class GenerationStage(BaseStage):  # pylint: disable=too-few-public-methods
             context.generated_answer = cleaned_answer
             context.add_metadata("generation", {"source": answer_source, "answer_length": len(cleaned_answer)})
 
+            if cleaned_answer and context.query_results and self._should_evaluate():
+                context.evaluation = self._queue_evaluation(context)
+
             result = StageResult(success=True, context=context)
             self._log_stage_complete(result)
             return result
@@ -102,6 +108,35 @@ class GenerationStage(BaseStage):  # pylint: disable=too-few-public-methods
         except (ValueError, AttributeError, TypeError, KeyError) as e:
             return await self._handle_error(context, e)
 
+    def _should_evaluate(self) -> bool:
+        """Check if runtime evaluation is enabled."""
+        return getattr(self.pipeline_service.settings, "runtime_eval", False) is True
+
+    def _queue_evaluation(self, context: SearchContext) -> dict[str, Any]:
+        """
+        Queue the generated answer for LLM-as-judge evaluation off the request path.
+
+        Args:
+            context: Search context with the generated answer
+
+        Returns:
+            Evaluation status with the search id the scores are stored under
+        """
+        documents = "\n\n".join(
+            result.chunk.text for result in context.query_results if result.chunk and result.chunk.text
+        )
+        job = EvaluationJob(
+            question=context.search_input.question,
+            answer=context.generated_answer or "",
+            context=documents,
+            pipeline_id=context.pipeline_id,
+            collection_id=context.collection_id,
+            user_id=context.user_id,
+        )
+        status = get_evaluation_queue(self.pipeline_service.settings).submit(job)
+        logger.info("Evaluation %s for search %s", status["status"], status["search_id"])
+        return status
+
     async def _generate_answer_from_documents(self, context: SearchContext) -> str:
         """
         Generate answer using LLM from documents.
@@ -123,7 +158,7 @@ class GenerationStage(BaseStage):  # pylint: disable=too-few-public-methods
 
         # Format context from query results
         context_text = self.pipeline_service._format_context(  # pylint: disable=protected-access
-            rag_template.id, context.query_results
+            rag_template.id, context.query_results, model_id=provider.model_id
         )
 
         # Use rewritten query if available, otherwise original question
@@ -132,9 +167,15 @@ class GenerationStage(BaseStage):  # pylint: disable=too-few-public-methods
         # COMPREHENSIVE DEBUG LOGGING - Log context sent to LLM
         self._log_llm_context(query, context_text, context.query_results, context.user_id)
 
-        # Generate answer
-        answer = self.pipeline_service._generate_answer(  # pylint: disable=protected-access
-            context.user_id, query, context_text, provider, llm_parameters, rag_template
+        # Generate answer off the event loop: the provider blocks on rate limiting and HTTP
+        answer = await asyncio.to_thread(
+            self.pipeline_service._generate_answer,  # pylint: disable=protected-access
+            context.user_id,
+            query,
+            context_text,
+            provider,
+            llm_parameters,
+            rag_template,
         )
 
         return answer
@@ -201,8 +242,9 @@ class GenerationStage(BaseStage):  # pylint: disable=too-few-public-methods
         )
 
         try:
-            # Generate structured answer using provider
-            structured_answer, usage = provider.generate_structured_output(
+            # Generate structured answer off the event loop: the provider blocks on admission control and HTTP
+            structured_answer, usage = await asyncio.to_thread(
+                provider.generate_structured_output,
                 user_id=context.user_id,
                 prompt=query,
                 context_documents=context_documents,
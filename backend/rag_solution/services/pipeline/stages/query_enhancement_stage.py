@@ -3,11 +3,20 @@ Query enhancement stage.
 
 This stage enhances the user's query by rewriting it for better retrieval.
 Wraps the query rewriting functionality from PipelineService.
+
+With speculative retrieval enabled, retrieval on the cleaned question starts
+in a worker thread before the rewrite, taking the rewriter off the critical
+path when it changes little (see RetrievalStage).
 """
 
+import asyncio
+
 from core.logging_utils import get_logger
+from rag_solution.file_management.database import create_session_factory
 from rag_solution.services.pipeline.base_stage import BaseStage, StageResult
 from rag_solution.services.pipeline.search_context import SearchContext
+from rag_solution.services.pipeline.stages.retrieval_stage import resolve_top_k
+from vectordbs.data_types import QueryResult
 
 logger = get_logger("services.pipeline.stages.query_enhancement")
 
@@ -18,8 +27,9 @@ class QueryEnhancementStage(BaseStage):  # pylint: disable=too-few-public-method
 
     This stage:
     1. Cleans and prepares the raw query
-    2. Rewrites the query for improved retrieval
-    3. Updates the context with the rewritten query
+    2. Optionally starts a speculative retrieval with the cleaned query
+    3. Rewrites the query for improved retrieval
+    4. Updates the context with the rewritten query
 
     Note: Single public method (execute) is by design for pipeline stage pattern.
     """
@@ -58,8 +68,16 @@ class QueryEnhancementStage(BaseStage):  # pylint: disable=too-few-public-method
             clean_query = self._prepare_query(original_query)
             logger.debug("Cleaned query: %s", clean_query)
 
+            # Retrieve with the cleaned query while the rewriter runs
+            if self._should_speculate(context):
+                self._start_speculative_retrieval(context, clean_query)
+
             # Rewrite query for better retrieval
-            rewritten_query = self._rewrite_query(clean_query)
+            try:
+                rewritten_query = self._rewrite_query(clean_query)
+            except Exception:
+                self._discard_speculative_retrieval(context)
+                raise
             logger.info("Query rewritten: '%s' -> '%s'", clean_query, rewritten_query)
 
             # COMPREHENSIVE DEBUG LOGGING - Log query enhancement details
@@ -96,6 +114,59 @@ class QueryEnhancementStage(BaseStage):  # pylint: disable=too-few-public-method
         # Use PipelineService's _prepare_query method
         return self.pipeline_service._prepare_query(query)  # pylint: disable=protected-access
 
+    def _should_speculate(self, context: SearchContext) -> bool:
+        """
+        Check if retrieval should start before the rewrite.
+
+        Args:
+            context: Search context
+
+        Returns:
+            True if speculative retrieval is enabled, False otherwise
+        """
+        if getattr(self.pipeline_service.settings, "speculative_retrieval_enabled", False) is not True:
+            return False
+
+        if context.search_input.config_metadata and context.search_input.config_metadata.get(
+            "disable_speculative_retrieval", False
+        ):
+            logger.debug("Speculative retrieval disabled via config_metadata")
+            return False
+
+        return context.collection_id is not None
+
+    def _start_speculative_retrieval(self, context: SearchContext, query: str) -> None:
+        """
+        Submit retrieval with the cleaned query to a worker thread.
+
+        The executor future starts running immediately, in parallel with the
+        rewrite; RetrievalStage awaits it. The worker looks the collection up with
+        its own session, since the request's session must not be shared across threads.
+
+        Args:
+            context: Search context
+            query: Cleaned query
+        """
+        top_k = resolve_top_k(self.pipeline_service.settings, context)
+        context.speculative_query = query
+        session_factory = create_session_factory()
+
+        def retrieve() -> list[QueryResult]:
+            with session_factory() as db:
+                return self.pipeline_service.retrieve_documents_by_id(
+                    query=query, collection_id=context.collection_id, top_k=top_k, db=db
+                )
+
+        context.speculative_retrieval = asyncio.get_running_loop().run_in_executor(None, retrieve)
+        logger.debug("Started speculative retrieval for '%s' (top_k=%d)", query, top_k)
+
+    @staticmethod
+    def _discard_speculative_retrieval(context: SearchContext) -> None:
+        """Drop a speculation nobody will await, consuming its outcome so errors are not reported as unretrieved."""
+        pending, context.speculative_retrieval = context.speculative_retrieval, None
+        if pending is not None:
+            pending.add_done_callback(lambda future: future.cancelled() or future.exception())
+
     def _rewrite_query(self, query: str) -> str:
         """
         Rewrite query for better retrieval.
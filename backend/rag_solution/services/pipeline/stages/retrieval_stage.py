@@ -3,15 +3,66 @@ Retrieval stage.
 
 This stage retrieves relevant documents from the vector database.
 Wraps the document retrieval functionality from PipelineService.
+
+When QueryEnhancementStage started a speculative retrieval on the cleaned
+question, this stage reuses its results if the rewritten query is
+semantically close to the question, and otherwise retrieves with the
+rewritten query and merges both result lists.
 """
 
+import asyncio
+from typing import Any
+
+import numpy as np
+
 from core.logging_utils import get_logger
 from rag_solution.services.pipeline.base_stage import BaseStage, StageResult
 from rag_solution.services.pipeline.search_context import SearchContext
+from vectordbs.data_types import QueryResult
+from vectordbs.utils.embeddings import get_embeddings_for_vector_store
 
 logger = get_logger("services.pipeline.stages.retrieval")
 
 
+def resolve_top_k(settings: Any, context: SearchContext) -> int:
+    """
+    Get the number of documents to retrieve for a search.
+
+    Args:
+        settings: Application settings
+        context: Search context
+
+    Returns:
+        top_k from config_metadata, falling back to settings.number_of_results
+    """
+    if context.search_input.config_metadata and "top_k" in context.search_input.config_metadata:
+        top_k = context.search_input.config_metadata["top_k"]
+        logger.debug("Using top_k=%d from config_metadata", top_k)
+        return top_k
+    return settings.number_of_results
+
+
+def merge_query_results(*result_lists: list[QueryResult], top_k: int) -> list[QueryResult]:
+    """
+    Merge retrieval result lists, keeping the best score of each chunk.
+
+    Args:
+        result_lists: Result lists to merge
+        top_k: Maximum number of results to return
+
+    Returns:
+        Unique results in descending score order
+    """
+    best: dict[Any, QueryResult] = {}
+    for results in result_lists:
+        for result in results:
+            key = result.chunk.chunk_id if result.chunk and result.chunk.chunk_id else id(result)
+            current = best.get(key)
+            if current is None or (result.score or 0.0) > (current.score or 0.0):
+                best[key] = result
+    return sorted(best.values(), key=lambda r: r.score or 0.0, reverse=True)[:top_k]
+
+
 class RetrievalStage(BaseStage):  # pylint: disable=too-few-public-methods
     """
     Retrieves relevant documents from vector database.
@@ -66,9 +117,18 @@ class RetrievalStage(BaseStage):  # pylint: disable=too-few-public-methods
             self._log_retrieval_params(context.rewritten_query, str(context.collection_id), top_k)
 
             # Retrieve documents using collection_id (PipelineService handles the lookup)
-            query_results = self.pipeline_service.retrieve_documents_by_id(
-                query=context.rewritten_query, collection_id=context.collection_id, top_k=top_k
-            )
+            speculation: dict[str, Any] | None = None
+            if context.speculative_retrieval is not None:
+                query_results, speculation = await self._resolve_speculative_retrieval(context, top_k)
+            else:
+                # Retrieval embeds the query and searches the vector store, both blocking; run it in a worker
+                # thread so concurrent searches overlap and can share a micro-batched embedding call
+                query_results = await asyncio.to_thread(
+                    self.pipeline_service.retrieve_documents_by_id,
+                    query=context.rewritten_query,
+                    collection_id=context.collection_id,
+                    top_k=top_k,
+                )
 
             logger.info("Retrieved %d documents with top_k=%d", len(query_results), top_k)
 
@@ -79,15 +139,15 @@ class RetrievalStage(BaseStage):  # pylint: disable=too-few-public-methods
             # Update context
             context.query_results = query_results
             context.document_metadata = document_metadata
-            context.add_metadata(
-                "retrieval",
-                {
-                    "top_k": top_k,
-                    "results_count": len(query_results),
-                    "documents_count": len(document_metadata),
-                    "collection_id": str(context.collection_id),
-                },
-            )
+            retrieval_metadata: dict[str, Any] = {
+                "top_k": top_k,
+                "results_count": len(query_results),
+                "documents_count": len(document_metadata),
+                "collection_id": str(context.collection_id),
+            }
+            if speculation is not None:
+                retrieval_metadata["speculative"] = speculation
+            context.add_metadata("retrieval", retrieval_metadata)
 
             result = StageResult(success=True, context=context)
             self._log_stage_complete(result)
@@ -106,15 +166,85 @@ class RetrievalStage(BaseStage):  # pylint: disable=too-few-public-methods
         Returns:
             Number of documents to retrieve
         """
-        # Default from settings
-        top_k = self.pipeline_service.settings.number_of_results
+        return resolve_top_k(self.pipeline_service.settings, context)
 
-        # Override from config_metadata if provided
-        if context.search_input.config_metadata and "top_k" in context.search_input.config_metadata:
-            top_k = context.search_input.config_metadata["top_k"]
-            logger.debug("Using top_k=%d from config_metadata", top_k)
+    async def _resolve_speculative_retrieval(
+        self, context: SearchContext, top_k: int
+    ) -> tuple[list[QueryResult], dict[str, Any]]:
+        """
+        Use, extend or replace the speculative retrieval started during query enhancement.
 
-        return top_k
+        Args:
+            context: Search context with a pending speculative retrieval
+            top_k: Number of documents to retrieve
+
+        Returns:
+            Query results and a summary of the speculation for the stage metadata
+        """
+        pending, context.speculative_retrieval = context.speculative_retrieval, None
+        rewritten_query = context.rewritten_query or ""
+        try:
+            speculative_results = await pending  # type: ignore[misc]
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Justification: A failed speculation must not fail the search; retrieve normally instead
+            logger.warning("Speculative retrieval failed, retrieving with the rewritten query: %s", e)
+            query_results = await asyncio.to_thread(
+                self.pipeline_service.retrieve_documents_by_id,
+                query=rewritten_query,
+                collection_id=context.collection_id,
+                top_k=top_k,
+            )
+            return query_results, {"outcome": "failed"}
+
+        if rewritten_query == context.speculative_query:
+            logger.info("Query unchanged by enhancement, using speculative retrieval")
+            return speculative_results, {"outcome": "reused", "similarity": 1.0}
+
+        # Embedding both queries is a blocking provider call; keep it off the event loop
+        similarity = await asyncio.to_thread(self._query_similarity, context.speculative_query or "", rewritten_query)
+        threshold = self.pipeline_service.settings.speculative_retrieval_similarity
+        if similarity is not None and similarity >= threshold:
+            logger.info("Rewrite is a minor change (similarity %.3f), using speculative retrieval", similarity)
+            return speculative_results, {"outcome": "reused", "similarity": similarity}
+
+        logger.info("Rewrite changed the query (similarity %s), merging a second retrieval", similarity)
+        rewritten_results = await asyncio.to_thread(
+            self.pipeline_service.retrieve_documents_by_id,
+            query=rewritten_query,
+            collection_id=context.collection_id,
+            top_k=top_k,
+        )
+        return merge_query_results(rewritten_results, speculative_results, top_k=top_k), {
+            "outcome": "merged",
+            "similarity": similarity,
+        }
+
+    def _query_similarity(self, first: str, second: str) -> float | None:
+        """
+        Cosine similarity of the embeddings of two queries.
+
+        Args:
+            first: First query
+            second: Second query
+
+        Returns:
+            Cosine similarity, or None if the queries could not be embedded
+        """
+        try:
+            embeddings = np.asarray(
+                get_embeddings_for_vector_store([first, second], settings=self.pipeline_service.settings),
+                dtype=np.float64,
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Justification: Without embeddings the rewrite is treated as a major change
+            logger.warning("Failed to embed queries for speculative retrieval: %s", e)
+            return None
+        if embeddings.shape[0] != 2:
+            return None
+        norms = np.linalg.norm(embeddings, axis=1)
+        if not norms.all():
+            return None
+        return float(embeddings[0] @ embeddings[1] / (norms[0] * norms[1]))
 
     def _log_retrieval_params(self, query: str, collection_id: str, top_k: int) -> None:
         """
@@ -1,5 +1,6 @@
 """Service layer for RAG pipeline execution and management."""
 
+import asyncio
 import os
 import re
 import time
@@ -15,6 +16,7 @@ from core.custom_exceptions import LLMProviderError
 from core.logging_utils import get_logger
 from rag_solution.core.exceptions import ConfigurationError, NotFoundError, ValidationError
 from rag_solution.data_ingestion.ingestion import DocumentStore
+from rag_solution.evaluation.evaluation_queue import EvaluationJob, get_evaluation_queue
 from rag_solution.evaluation.evaluator import RAGEvaluator
 from rag_solution.generation.providers.base import LLMBase
 from rag_solution.generation.providers.factory import LLMProviderFactory
@@ -35,11 +37,13 @@ from rag_solution.schemas.pipeline_schema import (
 from rag_solution.schemas.prompt_template_schema import PromptTemplateOutput, PromptTemplateType
 from rag_solution.schemas.search_schema import SearchInput
 from rag_solution.services.collection_service import CollectionService
+from rag_solution.services.config_cache import PIPELINE, cached_config
 from rag_solution.services.file_management_service import FileManagementService
 from rag_solution.services.llm_parameters_service import LLMParametersService
 from rag_solution.services.llm_provider_service import LLMProviderService
 from rag_solution.services.prompt_template_service import PromptTemplateService
-from vectordbs.data_types import DocumentMetadata, QueryResult, VectorQuery
+from rag_solution.services.tokenizer_service import get_tokenizer_service
+from vectordbs.data_types import DocumentChunk, DocumentChunkWithScore, DocumentMetadata, QueryResult, VectorQuery
 from vectordbs.error_types import CollectionError
 from vectordbs.factory import VectorStoreFactory
 
@@ -159,8 +163,9 @@ class PipelineService:
     def get_reranker(self, user_id: UUID4) -> BaseReranker | None:
         """Get reranker instance for the given user.
 
-        Creates a fresh reranker on-demand for each request. No caching is needed
-        because reranker initialization is lightweight (just object creation).
+        LLM and simple rerankers are created on-demand for each request since their
+        initialization is lightweight. The cross-encoder reranker is shared by the
+        whole process so its model is only loaded once.
 
         Args:
             user_id: User UUID for creating LLM-based reranker
@@ -175,13 +180,13 @@ class PipelineService:
 
         # pylint: disable=import-outside-toplevel
         # Justification: Lazy import to avoid circular dependency
-        from rag_solution.retrieval.reranker import CrossEncoderReranker, LLMReranker, SimpleReranker
+        from rag_solution.retrieval.reranker import LLMReranker, SimpleReranker, get_cross_encoder_reranker
         from rag_solution.schemas.prompt_template_schema import PromptTemplateType
 
         if self.settings.reranker_type == "cross-encoder":
             try:
                 logger.debug("Creating cross-encoder reranker for user %s", user_id)
-                reranker = CrossEncoderReranker(model_name=self.settings.cross_encoder_model)
+                reranker = get_cross_encoder_reranker(self.settings)
                 logger.debug("Cross-encoder reranker created successfully for user %s", user_id)
                 return reranker
             except Exception as e:  # pylint: disable=broad-exception-caught
@@ -361,6 +366,7 @@ class PipelineService:
             processed_documents = await self.collection_service.ingest_documents(
                 file_paths, self.document_store.collection_name, document_ids
             )
+            self.collection_service.record_ingested_chunk_counts(collection.id, processed_documents)
 
             logger.info(
                 "Loaded %d documents into collection: %s", len(processed_documents), self.document_store.collection_name
@@ -410,7 +416,9 @@ class PipelineService:
             Optional[PipelineConfigOutput]: Default pipeline configuration if found
         """
         try:
-            return self.pipeline_repository.get_user_default(user_id)
+            return cached_config(
+                PIPELINE, f"user_default:{user_id}", lambda: self.pipeline_repository.get_user_default(user_id)
+            )
         except Exception as e:  # pylint: disable=broad-exception-caught
             # Justification: Return None as fallback for any failure when fetching default pipeline
             logger.error("Failed to get default pipeline: %s", e)
@@ -450,11 +458,15 @@ class PipelineService:
 
     def get_pipeline_config(self, pipeline_id: UUID4) -> PipelineConfigOutput | None:
         """Retrieve pipeline configuration by ID."""
-        pipeline = self.pipeline_repository.get_by_id(pipeline_id)
+        pipeline = self._get_cached_pipeline(pipeline_id)
         if not pipeline:
             raise NotFoundError(resource_type="PipelineConfig", resource_id=str(pipeline_id))
         return PipelineConfigOutput.model_validate(pipeline) if pipeline else None
 
+    def _get_cached_pipeline(self, pipeline_id: UUID4) -> PipelineConfigOutput:
+        """Get a pipeline configuration by ID through the configuration cache (read-only use)."""
+        return cached_config(PIPELINE, f"id:{pipeline_id}", lambda: self.pipeline_repository.get_by_id(pipeline_id))
+
     def create_pipeline(self, config_input: PipelineConfigInput) -> PipelineConfigOutput:
         """Create a new pipeline configuration."""
         # Validate provider exists
@@ -576,11 +588,40 @@ class PipelineService:
         clean_query = re.sub(r"[\(\)]", "", clean_query)
         return clean_query.strip()
 
-    def _format_context(self, template_id: UUID4, query_results: list[QueryResult]) -> str:
-        """Format retrieved contexts using template's context strategy."""
+    def _format_context(self, template_id: UUID4, query_results: list[QueryResult], model_id: str | None = None) -> str:
+        """Format retrieved contexts using template's context strategy.
+
+        When context packing is enabled, chunks are first packed into the token budget
+        left after reserving room for the prompt and the answer, most relevant first
+        and without overlapping chunks. Tokens are counted with the tokenizer of
+        ``model_id`` (the generating model) when one is given.
+        """
+        # Filter out None chunks and extract text
+        results: list[QueryResult] = []
+        texts: list[str] = []
+        for result in query_results:
+            if result.chunk and result.chunk.text:
+                results.append(result)
+                texts.append(result.chunk.text)
         try:
-            # Filter out None chunks and extract text
-            texts: list[str] = [result.chunk.text for result in query_results if result.chunk and result.chunk.text]
+            if getattr(self.settings, "context_packing_enabled", False) is True and texts:
+                token_budget = (
+                    self.settings.max_context_length
+                    - self.settings.max_new_tokens
+                    - self.settings.context_prompt_reserve_tokens
+                )
+                packed = get_tokenizer_service().pack_context(
+                    texts, [result.score or 0.0 for result in results], max(token_budget, 0), model_id=model_id
+                )
+                logger.debug(
+                    "Packed %d/%d chunks into %d/%d tokens (%d duplicates skipped)",
+                    len(packed.chunks),
+                    len(texts),
+                    packed.token_count,
+                    token_budget,
+                    packed.duplicates_skipped,
+                )
+                texts = packed.chunks
             return self.prompt_template_service.apply_context_strategy(template_id, texts)
         except Exception as e:  # pylint: disable=broad-exception-caught
             logger.error("Error formatting context: %s", e)
@@ -605,7 +646,7 @@ class PipelineService:
         """
         logger.info("**** Validating configuration for user_id: %s", user_id)
         # Get pipeline configuration
-        pipeline_config = self.pipeline_repository.get_by_id(pipeline_id)
+        pipeline_config = self._get_cached_pipeline(pipeline_id)
         if not pipeline_config:
             raise NotFoundError(resource_type="PipelineConfig", resource_id=str(pipeline_id))
 
@@ -662,12 +703,19 @@ class PipelineService:
 
         return rag_template, eval_template
 
-    def _apply_hierarchical_retrieval(
-        self,
-        results: list[QueryResult],
-        collection_name: str,  # noqa: ARG002  # pylint: disable=unused-argument
-    ) -> list[QueryResult]:
-        """Apply hierarchical retrieval by replacing child chunks with parent chunks.
+    def _apply_hierarchical_retrieval(self, results: list[QueryResult], collection_name: str) -> list[QueryResult]:
+        """Apply hierarchical retrieval by adding or substituting parent chunks of retrieved children.
+
+        Parent chunks are fetched by ID in one batched vector store call
+        (one call per level for ``full_hierarchy``). Modes:
+
+        - ``child_only``: results are returned unchanged
+        - ``child_with_parent``: each child is followed by its parent
+        - ``parent_only``: each child is replaced by its parent
+        - ``full_hierarchy``: each child is followed by all of its ancestors
+
+        Parents shared by several children appear once, at the position of the
+        best ranked child, and inherit that child's score.
 
         Args:
             results: Query results containing child chunks
@@ -676,45 +724,102 @@ class PipelineService:
         Returns:
             Query results with parent chunks (if hierarchical mode enabled)
         """
-        # Check if hierarchical retrieval is enabled
         retrieval_mode = getattr(self.settings, "hierarchical_retrieval_mode", "child_only")
 
-        if retrieval_mode == "child_only" or not results:
+        if retrieval_mode not in ("child_with_parent", "parent_only", "full_hierarchy") or not results:
             return results
 
-        # Get all chunks from the vector store to find parents
-        try:
-            modified_results = []
-
-            for result in results:
-                if not result.chunk:
-                    modified_results.append(result)
-                    continue
-
-                chunk = result.chunk
-                parent_id = chunk.parent_chunk_id
-
-                if retrieval_mode == "child_with_parent" and parent_id:
-                    # FIXME: Implement parent chunk retrieval  # pylint: disable=fixme
-                    # Would need vector store method to fetch by chunk_id
-                    # For now, we'll keep the child and note the limitation
-                    logger.debug("Hierarchical retrieval: child %s has parent %s", chunk.chunk_id, parent_id)
-                    modified_results.append(result)
-
-                elif retrieval_mode == "parent_only" and parent_id:
-                    # FIXME: Implement parent-only retrieval by fetching parent chunk  # pylint: disable=fixme
-                    logger.debug("Parent-only mode: would replace child %s with parent %s", chunk.chunk_id, parent_id)
-                    modified_results.append(result)
-                else:
-                    modified_results.append(result)
-
-            return modified_results
+        parent_ids = [r.chunk.parent_chunk_id for r in results if r.chunk and r.chunk.parent_chunk_id]
+        if not parent_ids:
+            return results
 
+        try:
+            parents = self._fetch_parent_chunks(
+                collection_name, parent_ids, all_levels=retrieval_mode == "full_hierarchy"
+            )
         except Exception as e:  # pylint: disable=broad-exception-caught
+            # Justification: Parent lookup is an enhancement; fall back to the retrieved children
             logger.warning("Hierarchical retrieval failed: %s, returning original results", e)
             return results
 
-    def retrieve_documents_by_id(self, query: str, collection_id, top_k: int | None = None) -> list[QueryResult]:
+        modified_results: list[QueryResult] = []
+        seen: set[str] = set()
+
+        def emit(result: QueryResult) -> None:
+            chunk_id = result.chunk.chunk_id if result.chunk else None
+            if chunk_id is not None:
+                if chunk_id in seen:
+                    return
+                seen.add(chunk_id)
+            modified_results.append(result)
+
+        for result in results:
+            parent = (
+                parents.get(result.chunk.parent_chunk_id) if result.chunk and result.chunk.parent_chunk_id else None
+            )
+            if parent is None:
+                emit(result)
+                continue
+
+            if retrieval_mode != "parent_only":
+                emit(result)
+            while parent is not None:
+                emit(
+                    QueryResult(
+                        chunk=DocumentChunkWithScore(**parent.model_dump(), score=result.score),
+                        score=result.score,
+                        embeddings=[],
+                    )
+                )
+                if retrieval_mode != "full_hierarchy" or not parent.parent_chunk_id:
+                    break
+                parent = parents.get(parent.parent_chunk_id)
+
+        logger.debug(
+            "Hierarchical retrieval (%s): %d results -> %d results with %d parents",
+            retrieval_mode,
+            len(results),
+            len(modified_results),
+            len(parents),
+        )
+        return modified_results
+
+    def _fetch_parent_chunks(
+        self, collection_name: str, parent_ids: list[str], all_levels: bool = False
+    ) -> dict[str, DocumentChunk]:
+        """Fetch parent chunks by ID, optionally walking up to the root.
+
+        Args:
+            collection_name: Name of the collection
+            parent_ids: IDs of the parents to fetch
+            all_levels: Whether to also fetch the ancestors of the fetched parents
+
+        Returns:
+            Mapping of chunk ID to parent chunk
+        """
+        parents: dict[str, DocumentChunk] = {}
+        pending = list(dict.fromkeys(parent_ids))
+        requested: set[str] = set()
+        while pending:
+            requested.update(pending)
+            for chunk in self.vector_store.get_chunks_by_ids(collection_name, pending):
+                if chunk.chunk_id:
+                    parents[chunk.chunk_id] = chunk
+            if not all_levels:
+                break
+            # IDs already requested (fetched or missing) are not requested again
+            pending = list(
+                dict.fromkeys(
+                    c.parent_chunk_id
+                    for c in parents.values()
+                    if c.parent_chunk_id and c.parent_chunk_id not in requested
+                )
+            )
+        return parents
+
+    def retrieve_documents_by_id(
+        self, query: str, collection_id, top_k: int | None = None, db: Session | None = None
+    ) -> list[QueryResult]:
         """Retrieve documents using collection_id (modern pipeline interface).
 
         This is the preferred method for new code. It handles the collection_id
@@ -724,6 +829,8 @@ class PipelineService:
             query: The query text
             collection_id: UUID of the collection
             top_k: Number of documents to retrieve
+            db: Session for the collection lookup; callers on another thread must pass their
+                own, since the service's request session is not thread-safe
 
         Returns:
             List of query results
@@ -735,7 +842,7 @@ class PipelineService:
         from rag_solution.models.collection import Collection
 
         # Look up collection to get vector_db_name
-        collection = self.db.query(Collection).filter(Collection.id == collection_id).first()
+        collection = (db or self.db).query(Collection).filter(Collection.id == collection_id).first()
 
         if not collection:
             raise ValueError(f"Collection not found: {collection_id}")
@@ -842,25 +949,47 @@ class PipelineService:
             ) from e
 
     async def _evaluate_response(
-        self, query: str, answer: str, context: str, template: PromptTemplateOutput
+        self,
+        query: str,
+        answer: str,
+        context: str,
+        template: PromptTemplateOutput,
+        pipeline_id: UUID4 | None = None,
+        collection_id: UUID4 | None = None,
+        user_id: UUID4 | None = None,
     ) -> dict[str, Any] | None:
         """
-        Evaluate generated response if enabled.
+        Queue the generated response for background evaluation if enabled.
+
+        The LLM-as-judge scores are computed off the request path and stored per
+        search, so the returned dict only carries the queue status and search id.
 
         Args:
             query: The original query
             answer: The generated answer
             context: The context used
             template: The evaluation template
+            pipeline_id: Pipeline that produced the answer
+            collection_id: Collection that was searched
+            user_id: User who searched
 
         Returns:
-            Optional evaluation results
+            Optional evaluation status
         """
         try:
             self.prompt_template_service.format_prompt(
                 template.id, {"context": context, "question": query, "answer": answer}
             )
-            return await self.evaluator.evaluate(context=context, answer=answer, question_text=query)
+            return get_evaluation_queue(self.settings).submit(
+                EvaluationJob(
+                    question=query,
+                    answer=answer,
+                    context=context,
+                    pipeline_id=pipeline_id,
+                    collection_id=collection_id,
+                    user_id=user_id,
+                )
+            )
         except Exception as e:  # pylint: disable=broad-exception-caught
             logger.error("Evaluation failed: %s", e)
             return {"error": str(e)}
@@ -918,7 +1047,7 @@ class PipelineService:
                 top_k = search_input.config_metadata["top_k"]
                 logger.info("Using top_k=%d from config_metadata", top_k)
 
-            query_results = self._retrieve_documents(rewritten_query, collection_name, top_k)
+            query_results = await asyncio.to_thread(self._retrieve_documents, rewritten_query, collection_name, top_k)
 
             # DEBUG: Log retrieval results
             if query_results:
@@ -942,12 +1071,26 @@ class PipelineService:
                 generated_answer = "I apologize, but I couldn't find any relevant documents."
                 evaluation_result: dict[str, Any] | None = {"error": "No documents found"}
             else:
-                context_text = self._format_context(rag_template.id, query_results)
-                generated_answer = self._generate_answer(
-                    search_input.user_id, clean_query, context_text, provider, llm_parameters_input, rag_template
+                context_text = self._format_context(rag_template.id, query_results, model_id=provider.model_id)
+                generated_answer = await asyncio.to_thread(
+                    self._generate_answer,
+                    search_input.user_id,
+                    clean_query,
+                    context_text,
+                    provider,
+                    llm_parameters_input,
+                    rag_template,
                 )
                 evaluation_result = (
-                    await self._evaluate_response(clean_query, generated_answer, context_text, eval_template)
+                    await self._evaluate_response(
+                        clean_query,
+                        generated_answer,
+                        context_text,
+                        eval_template,
+                        pipeline_id=pipeline_id,
+                        collection_id=search_input.collection_id,
+                        user_id=search_input.user_id,
+                    )
                     if self.settings.runtime_eval and eval_template
                     else None
                 )
@@ -14,9 +14,12 @@ Orchestrates podcast generation from document collections:
    - Updates podcast status (COMPLETED/FAILED)
 """
 
+import asyncio
 import logging
+import re
 import time
 from enum import Enum
+from pathlib import Path
 from typing import Any, ClassVar
 
 from fastapi import BackgroundTasks, HTTPException
@@ -27,8 +30,12 @@ from core.config import get_settings
 from core.custom_exceptions import NotFoundError, PromptTemplateNotFoundError, ValidationError
 from core.identity_service import IdentityService
 from rag_solution.generation.audio.factory import AudioProviderFactory
+from rag_solution.generation.audio.segmented_output import SegmentedAudioWriter
+from rag_solution.generation.providers.base import LLMBase
 from rag_solution.generation.providers.factory import LLMProviderFactory
+from rag_solution.generation.providers.rate_limiting import LLMPriority, with_llm_priority
 from rag_solution.repository.podcast_repository import PodcastRepository
+from rag_solution.schemas.llm_parameters_schema import LLMParametersInput
 from rag_solution.schemas.podcast_schema import (
     AudioFormat,
     PodcastAudioGenerationInput,
@@ -44,7 +51,10 @@ from rag_solution.schemas.search_schema import SearchInput
 from rag_solution.services.collection_service import CollectionService
 from rag_solution.services.search_service import SearchService
 from rag_solution.services.storage.audio_storage import AudioStorageBase, LocalFileStorage
+from rag_solution.services.storage.tts_segment_cache import TTSSegmentCache, get_tts_segment_cache
+from rag_solution.services.websocket_hub import get_connection_hub
 from rag_solution.utils.podcast_script_parser import PodcastScriptParser as EnhancedScriptParser
+from rag_solution.utils.podcast_topic_planner import TopicSegment, plan_topic_segments, split_rag_results
 from rag_solution.utils.script_parser import PodcastScriptParser
 
 logger = logging.getLogger(__name__)
@@ -196,6 +206,46 @@ CRITICAL INSTRUCTION:
 3. Wrap your output in <script>...</script> XML tags
 4. Include ONLY the dialogue inside the tags - NO meta-information, NO word counts, NO instructions"""
 
+    # Outline prompt for map-reduce script generation (one title per topic segment)
+    PODCAST_OUTLINE_PROMPT = """You are planning a podcast about: {user_topic}
+
+The podcast is divided into {segment_count} consecutive segments. Each segment below lists its key terms and an excerpt of its source material:
+
+{segment_summaries}
+
+Write a short, descriptive title for each segment in {language} language.
+Output ONLY a numbered list with exactly {segment_count} lines in the form "1. Title". No other text."""
+
+    # Segment prompt for map-reduce script generation (one part of a longer dialogue)
+    PODCAST_SEGMENT_PROMPT = """You are a professional podcast script writer. Write ONE SEGMENT of a longer podcast dialogue between a HOST and an EXPERT in {language} language.
+
+SYSTEM RULES (DO NOT INCLUDE THESE IN YOUR OUTPUT):
+1. NEVER include meta-information like "Word count: X" or "Target: X words"
+2. NEVER include commentary about the script or segment headings
+3. NEVER use placeholders like [HOST NAME], [EXPERT NAME], or [INSERT NAME]
+4. Wrap ONLY the dialogue in <script>...</script> XML tags
+
+Podcast topic: {user_topic}
+Podcast outline:
+{outline}
+
+This segment: {segment_title}
+{position_instructions}
+
+Content for this segment:
+{rag_results}
+
+Length: approximately {word_count} words (between {min_word_count} and {max_word_count} words)
+
+**Podcast Style:** {podcast_style}
+**Target Audience:** {complexity_level}
+
+Use this exact format for each turn:
+HOST: [Question or transition]
+EXPERT: [Detailed answer with examples]
+
+Use ONLY information from the content above and write EVERYTHING in {language} language."""
+
     # Voice preview text for TTS samples
     VOICE_PREVIEW_TEXT = "Hello, you are listening to a preview of this voice."
 
@@ -353,6 +403,7 @@ CRITICAL INSTRUCTION:
             active_count,
         )
 
+    @with_llm_priority(LLMPriority.BACKGROUND)
     async def _process_podcast_generation(
         self,
         podcast_id: UUID4,
@@ -395,7 +446,7 @@ CRITICAL INSTRUCTION:
                     parsing_result.parsing_warnings,
                 )
 
-            # Step 4: Generate audio (50-90% with per-turn tracking)
+            # Step 4: Generate audio and stream it into storage (50-90% with per-turn tracking)
             await self._update_progress(
                 podcast_id,
                 progress=50,
@@ -405,29 +456,27 @@ CRITICAL INSTRUCTION:
                     "completed_turns": 0,
                 },
             )
-            audio_bytes = await self._generate_audio(podcast_id, podcast_script, podcast_input)
-
-            # Step 5: Store audio (90-95%)
-            await self._update_progress(podcast_id, progress=90, step="storing_audio")
-            audio_url = await self._store_audio(podcast_id, podcast_input.user_id, audio_bytes, podcast_input.format)
+            audio_url, audio_size = await self._generate_and_store_audio(
+                podcast_id, podcast_script, podcast_input, progress_range=(50, 90)
+            )
             audio_stored = True  # Mark audio as stored for cleanup if needed
 
-            # Step 6: Extract and serialize chapters
+            # Step 5: Extract and serialize chapters
             chapters_dict = self._serialize_chapters(podcast_script)
 
-            # Step 7: Mark complete (100%)
+            # Step 6: Mark complete (100%)
             self.repository.mark_completed(
                 podcast_id=podcast_id,
                 audio_url=audio_url,
                 transcript=script_text,
-                audio_size_bytes=len(audio_bytes),
+                audio_size_bytes=audio_size,
                 chapters=chapters_dict if chapters_dict else None,
             )
 
             logger.info(
                 "Completed podcast generation: %s, size=%d bytes, duration=%.1fs",
                 podcast_id,
-                len(audio_bytes),
+                audio_size,
                 podcast_script.total_duration,
             )
 
@@ -620,6 +669,14 @@ CRITICAL INSTRUCTION:
         min_word_count = int(word_count * 0.85)
         max_word_count = int(word_count * 1.15)
 
+        # Long scripts: generate topic segments concurrently instead of one huge LLM call
+        if getattr(self.settings, "podcast_script_map_reduce_enabled", False) is True:
+            segment_words = self.settings.podcast_script_segment_words
+            if word_count > segment_words:
+                segments = plan_topic_segments(split_rag_results(rag_results), word_count, segment_words)
+                if len(segments) > 1:
+                    return await self._generate_script_map_reduce(podcast_input, user_id, segments)
+
         # Get podcast template from database
         from rag_solution.schemas.prompt_template_schema import (
             PromptTemplateInput,
@@ -700,7 +757,6 @@ CRITICAL INSTRUCTION:
 
         # Override LLM parameters for podcast generation
         # We need much higher token limits for long-form content
-        from rag_solution.schemas.llm_parameters_schema import LLMParametersInput
 
         # Calculate max_new_tokens for podcast generation
         # Target word count * 1.5 (tokens per word) * 2 (buffer for formatting/structure)
@@ -751,9 +807,10 @@ CRITICAL INSTRUCTION:
                 if attempt > 0:
                     delay = base_delay * (2**attempt)
                     logger.info("Retry attempt %d: waiting %.1fs before retry", attempt + 1, delay)
-                    time.sleep(delay)
+                    await asyncio.sleep(delay)
 
-                script_text = llm_provider.generate_text(
+                script_text = await asyncio.to_thread(
+                    llm_provider.generate_text,
                     user_id=user_id,
                     prompt="",  # Empty - template contains full prompt
                     template=podcast_template,
@@ -810,7 +867,7 @@ CRITICAL INSTRUCTION:
                 # Add exponential backoff on errors as well
                 delay = base_delay * (2 ** (attempt + 1))
                 logger.info("Error recovery: waiting %.1fs before retry", delay)
-                time.sleep(delay)
+                await asyncio.sleep(delay)
 
         # If we exhausted retries, return best script with warning
         if best_script:
@@ -825,6 +882,265 @@ CRITICAL INSTRUCTION:
         logger.error("All parsing attempts failed, falling back to simple cleaning")
         return self._clean_llm_script(script_text)
 
+    async def _generate_script_map_reduce(
+        self,
+        podcast_input: PodcastGenerationInput,
+        user_id: UUID4,
+        segments: list[TopicSegment],
+    ) -> str:
+        """Generate a long script as concurrently written topic segments.
+
+        Map: after a short outline call, each segment's dialogue is generated from
+        its own chunks with its own word and token budget, at most
+        ``podcast_script_max_concurrency`` calls at a time. Reduce: segments are
+        joined in outline order; every segment after the first opens with a HOST
+        transition from the previous topic and only the last one concludes.
+
+        Args:
+            podcast_input: Podcast generation request input
+            user_id: Validated ID of the requesting user
+            segments: Planned topic segments in podcast order
+
+        Returns:
+            Generated podcast script text
+        """
+        factory = LLMProviderFactory(self.session, self.settings)
+        llm_provider = factory.get_provider(self.settings.llm_provider)
+
+        await self._outline_script_segments(llm_provider, podcast_input, user_id, segments)
+
+        logger.info(
+            "Generating script in %d segments: %s",
+            len(segments),
+            [(segment.label, segment.word_budget) for segment in segments],
+        )
+        semaphore = asyncio.Semaphore(max(self.settings.podcast_script_max_concurrency, 1))
+        start = time.monotonic()
+        segment_scripts = await asyncio.gather(
+            *(
+                self._generate_script_segment(llm_provider, podcast_input, user_id, segments, position, semaphore)
+                for position in range(len(segments))
+            )
+        )
+        logger.info("Generated %d script segments in %.1fs", len(segments), time.monotonic() - start)
+
+        return "\n\n".join(script.strip() for script in segment_scripts)
+
+    async def _outline_script_segments(
+        self,
+        llm_provider: LLMBase,
+        podcast_input: PodcastGenerationInput,
+        user_id: UUID4,
+        segments: list[TopicSegment],
+    ) -> None:
+        """Title the topic segments with one short LLM call.
+
+        Segments keep their keyword labels if the outline call fails or returns
+        an unusable list, so a bad outline never fails the podcast.
+        """
+        from rag_solution.schemas.prompt_template_schema import PromptTemplateInput, PromptTemplateType
+
+        template = PromptTemplateInput(
+            name="podcast_outline",
+            user_id=user_id,
+            template_type=PromptTemplateType.PODCAST_GENERATION,
+            system_prompt="You are a professional podcast producer.",
+            template_format=self.PODCAST_OUTLINE_PROMPT,
+            max_context_length=None,
+            input_variables={
+                "user_topic": "Topic or focus area for the podcast",
+                "segment_count": "Number of segments",
+                "segment_summaries": "Key terms and an excerpt of each segment",
+                "language": "Language for the titles",
+            },
+        )
+        variables = {
+            "user_topic": podcast_input.description or "General overview of the content",
+            "segment_count": len(segments),
+            "segment_summaries": "\n".join(
+                f"{segment.index + 1}. Key terms: {', '.join(segment.keywords) or 'none'}. "
+                f"Excerpt: {' '.join(segment.chunks[0].split())[:200]}"
+                for segment in segments
+            ),
+            "language": podcast_input.language,
+        }
+
+        try:
+            outline_text = await asyncio.to_thread(
+                llm_provider.generate_text,
+                user_id=user_id,
+                prompt="",
+                template=template,
+                variables=variables,
+                model_parameters=self._script_llm_parameters(
+                    user_id, "podcast_outline_params", 32 * len(segments) + 64
+                ),
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Justification: The outline only improves transitions; keyword labels are a valid fallback
+            logger.warning("Podcast outline generation failed, using segment keywords: %s", e)
+            return
+
+        if isinstance(outline_text, list):
+            outline_text = "\n".join(outline_text)
+        for match in re.finditer(r"^\s*(\d+)[.)]\s*(.+?)\s*$", outline_text, re.MULTILINE):
+            position = int(match.group(1)) - 1
+            if 0 <= position < len(segments):
+                segments[position].title = match.group(2).strip("*\"' ")[:120]
+
+    async def _generate_script_segment(
+        self,
+        llm_provider: LLMBase,
+        podcast_input: PodcastGenerationInput,
+        user_id: UUID4,
+        segments: list[TopicSegment],
+        position: int,
+        semaphore: asyncio.Semaphore,
+    ) -> str:
+        """Generate the dialogue of one topic segment.
+
+        Args:
+            llm_provider: LLM provider used for generation
+            podcast_input: Podcast generation request input
+            user_id: Validated ID of the requesting user
+            segments: All planned segments (used for the outline and transitions)
+            position: Index of the segment to generate
+            semaphore: Limits concurrent LLM calls across segments
+
+        Returns:
+            Segment dialogue text
+        """
+        from rag_solution.schemas.prompt_template_schema import PromptTemplateInput, PromptTemplateType
+
+        segment = segments[position]
+        is_last = position == len(segments) - 1
+
+        if position == 0:
+            position_instructions = (
+                "This is the OPENING segment. Start with a brief HOST introduction that welcomes the listeners "
+                "and previews the outline. Do NOT conclude the podcast."
+            )
+        else:
+            position_instructions = (
+                f"Start with a HOST line that transitions from the previous segment "
+                f'("{segments[position - 1].label}") to this one. Do NOT greet the listeners again.'
+            )
+            if is_last:
+                position_instructions += (
+                    " This is the FINAL segment: end with a HOST conclusion summarizing the key takeaways "
+                    "of the whole podcast."
+                )
+            else:
+                position_instructions += " Do NOT conclude the podcast."
+
+        word_count = segment.word_budget
+        min_word_count = int(word_count * 0.85)
+        max_word_count = int(word_count * 1.15)
+
+        template = PromptTemplateInput(
+            name="podcast_segment",
+            user_id=user_id,
+            template_type=PromptTemplateType.PODCAST_GENERATION,
+            system_prompt="You are a professional podcast script writer.",
+            template_format=self.PODCAST_SEGMENT_PROMPT,
+            max_context_length=None,
+            input_variables={
+                "user_topic": "Topic or focus area for the podcast",
+                "outline": "Numbered titles of all segments",
+                "segment_title": "Title of this segment",
+                "position_instructions": "How this segment opens and closes",
+                "rag_results": "Content from documents for this segment",
+                "word_count": "Target word count",
+                "min_word_count": "Minimum word count",
+                "max_word_count": "Maximum word count",
+                "podcast_style": "Style of podcast (conversational_interview, narrative, educational, discussion)",
+                "language": "Language for the podcast (en, es, fr, de, etc.)",
+                "complexity_level": "Target audience complexity (beginner, intermediate, advanced)",
+            },
+        )
+        variables = {
+            "user_topic": podcast_input.description or "General overview of the content",
+            "outline": "\n".join(f"{other.index + 1}. {other.label}" for other in segments),
+            "segment_title": f"{position + 1}. {segment.label}",
+            "position_instructions": position_instructions,
+            "rag_results": "\n\n".join(f"[Document {i + 1}]: {chunk}" for i, chunk in enumerate(segment.chunks)),
+            "word_count": word_count,
+            "min_word_count": min_word_count,
+            "max_word_count": max_word_count,
+            "podcast_style": podcast_input.podcast_style,
+            "language": podcast_input.language,
+            "complexity_level": podcast_input.complexity_level,
+        }
+        # Same tokens-per-word heuristic as the single-call path, but bounded by the segment budget
+        podcast_params = self._script_llm_parameters(user_id, "podcast_segment_params", max_word_count * 3)
+
+        enhanced_parser = EnhancedScriptParser(average_wpm=150)
+        max_retries = 2
+        min_quality_score = 0.6
+        base_delay = 1.0
+
+        best_script = None
+        best_quality = 0.0
+        script_text = ""
+
+        for attempt in range(max_retries):
+            try:
+                async with semaphore:
+                    generated = await asyncio.to_thread(
+                        llm_provider.generate_text,
+                        user_id=user_id,
+                        prompt="",
+                        template=template,
+                        variables=variables,
+                        model_parameters=podcast_params,
+                    )
+            except Exception as e:
+                logger.error("Error generating script segment %d on attempt %d: %s", position + 1, attempt + 1, e)
+                if attempt == max_retries - 1:
+                    raise
+                await asyncio.sleep(base_delay * (2 ** (attempt + 1)))
+                continue
+
+            script_text = "\n\n".join(generated) if isinstance(generated, list) else generated
+
+            parse_result = enhanced_parser.parse_script(script_text, expected_word_count=word_count)
+            logger.info(
+                "Script segment %d/%d (attempt %d): quality=%.2f, word_count=%d/%d",
+                position + 1,
+                len(segments),
+                attempt + 1,
+                parse_result.quality_score,
+                parse_result.word_count,
+                word_count,
+            )
+
+            if parse_result.quality_score > best_quality:
+                best_script = parse_result.script
+                best_quality = parse_result.quality_score
+            if parse_result.is_acceptable(min_quality_score):
+                return parse_result.script
+
+        if best_script:
+            logger.warning(
+                "Script segment %d below quality threshold (%.2f), using best attempt", position + 1, best_quality
+            )
+            return best_script
+        return self._clean_llm_script(script_text)
+
+    def _script_llm_parameters(self, user_id: UUID4, name: str, max_tokens: int) -> LLMParametersInput:
+        """Build LLM parameters for podcast script calls with the given token budget."""
+        return LLMParametersInput(
+            user_id=user_id,
+            name=name,
+            description="Parameters optimized for podcast script generation",
+            max_new_tokens=min(max_tokens, 200_000),
+            temperature=self.settings.temperature,
+            top_k=self.settings.top_k,
+            top_p=self.settings.top_p,
+            repetition_penalty=self.settings.repetition_penalty,
+            is_default=False,
+        )
+
     def _clean_llm_script(self, script_text: str) -> str:
         """
         Clean LLM-generated script by removing meta-commentary and duplicates.
@@ -946,40 +1262,131 @@ CRITICAL INSTRUCTION:
 
     async def _generate_audio(
         self,
-        _podcast_id: UUID4,
+        podcast_id: UUID4,
         podcast_script: Any,  # PodcastScript - keeping as Any for now as type is complex
         podcast_input: PodcastGenerationInput,
     ) -> bytes:
         """
-        Generate audio from parsed script with multi-provider support.
+        Generate audio from parsed script and return the encoded bytes.
+
+        Prefer ``_generate_and_store_audio`` for full podcasts: this renders through
+        a temporary file and then loads the whole track into memory.
+
+        Args:
+            podcast_id: Podcast ID for progress updates
+            podcast_script: Parsed PodcastScript with turns
+            podcast_input: Original podcast generation input with voice settings
+
+        Returns:
+            Audio bytes (MP3, WAV, etc.)
+
+        Raises:
+            AudioGenerationError: If audio generation fails
+            ValidationError: If voices are invalid
+        """
+        import tempfile
+
+        with tempfile.TemporaryDirectory(prefix="podcast-audio-") as tmp_dir:
+            output_path = Path(tmp_dir) / f"audio.{podcast_input.format.value}"
+            await self._generate_audio_to_file(podcast_id, podcast_script, podcast_input, output_path)
+            return output_path.read_bytes()
+
+    async def _generate_and_store_audio(
+        self,
+        podcast_id: UUID4,
+        podcast_script: Any,
+        podcast_input: PodcastGenerationInput,
+        progress_range: tuple[int, int] = (50, 90),
+    ) -> tuple[str, int]:
+        """
+        Generate audio and stream it into the storage backend.
+
+        The audio is encoded into a staging file provided by the storage backend
+        and then handed over as a file, so the complete podcast is never held in
+        memory. On local storage, fixed-length segments and an HLS playlist are
+        written alongside so playback can start while synthesis is running.
+
+        Args:
+            podcast_id: Podcast ID
+            podcast_script: Parsed PodcastScript with turns
+            podcast_input: Original podcast generation input with voice settings
+            progress_range: Progress percentages reported for the first and last turn
+
+        Returns:
+            Tuple of (audio URL, audio size in bytes)
+
+        Raises:
+            ValidationError: If user_id is not set in podcast_input
+            AudioGenerationError: If audio generation fails
+            AudioStorageError: If storing the audio fails
+        """
+        if not podcast_input.user_id:
+            raise ValidationError("user_id is required for podcast generation", field="user_id")
+        user_id: UUID4 = podcast_input.user_id
+
+        audio_format = podcast_input.format.value
+        staging_path = self.audio_storage.create_staging_path(podcast_id, user_id, audio_format)
+        segment_writer = self._create_segment_writer(podcast_id, user_id)
+        try:
+            audio_size = await self._generate_audio_to_file(
+                podcast_id, podcast_script, podcast_input, staging_path, progress_range, segment_writer
+            )
+            audio_url = await self.audio_storage.store_audio_file(
+                podcast_id=podcast_id,
+                user_id=user_id,
+                file_path=staging_path,
+                audio_format=audio_format,
+            )
+        finally:
+            staging_path.unlink(missing_ok=True)
+
+        return audio_url, audio_size
+
+    async def _generate_audio_to_file(
+        self,
+        podcast_id: UUID4,
+        podcast_script: Any,
+        podcast_input: PodcastGenerationInput,
+        output_path: str | Path,
+        progress_range: tuple[int, int] | None = None,
+        segment_writer: SegmentedAudioWriter | None = None,
+    ) -> int:
+        """
+        Synthesize the script concurrently with multi-provider support.
 
         This implements per-turn provider selection, allowing mixing of voices
         from different providers (e.g., custom ElevenLabs voice for host,
         OpenAI voice for expert).
 
         Strategy:
-        1. For each turn, resolve voice ID and determine its provider
-        2. Create provider instance if needed (cached to avoid recreation)
-        3. Generate audio segment using the appropriate provider
-        4. Combine all segments with pauses into final audio
+        1. Resolve both voice IDs and determine their providers
+        2. Create one provider instance per provider type
+        3. Reuse unchanged turns from the TTS segment cache; synthesize the rest
+           concurrently, bounded by PODCAST_TTS_MAX_CONCURRENCY and each provider's
+           own concurrency limit (and optional requests/minute)
+        4. Encode the segments in script order, with pauses, straight to ``output_path``
 
         Args:
-            _podcast_id: Podcast ID for progress updates (currently unused)
+            podcast_id: Podcast ID for progress updates
             podcast_script: Parsed PodcastScript with turns
             podcast_input: Original podcast generation input with voice settings
+            output_path: File the encoded audio is written to
+            progress_range: Progress percentages for the first and last turn; None disables updates
+            segment_writer: Optional writer producing progressive playback segments
 
         Returns:
-            Audio bytes (MP3, WAV, etc.)
+            Size of the encoded audio in bytes
 
         Raises:
             AudioGenerationError: If audio generation fails
             ValidationError: If voices are invalid
         """
-        import io
-
         from pydub import AudioSegment
 
-        from rag_solution.schemas.podcast_schema import Speaker
+        from rag_solution.generation.audio.base import AudioGenerationError, AudioProviderBase
+        from rag_solution.generation.audio.synthesis import StreamingAudioEncoder, synthesize_dialogue
+        from rag_solution.generation.providers.rate_limiting import TokenBucket, get_token_bucket
+        from rag_solution.schemas.podcast_schema import PodcastTurn, Speaker
 
         logger.info(
             "Generating audio with multi-provider support for %d turns (host=%s, expert=%s)",
@@ -1012,75 +1419,63 @@ CRITICAL INSTRUCTION:
             expert_provider_type,
         )
 
-        # Cache provider instances to avoid recreating them for each turn
-        from rag_solution.generation.audio.base import AudioProviderBase
-
-        provider_cache: dict[str, AudioProviderBase] = {}
-
-        def get_provider(provider_type: str) -> AudioProviderBase:
-            """Get or create audio provider instance."""
-            if provider_type not in provider_cache:
-                logger.debug("Creating %s audio provider", provider_type)
-                provider_cache[provider_type] = AudioProviderFactory.create_provider(
-                    provider_type=provider_type,
-                    settings=self.settings,
+        max_concurrency = getattr(self.settings, "podcast_tts_max_concurrency", 4)
+        requests_per_minute = getattr(self.settings, "podcast_tts_requests_per_minute", 0)
+        if not isinstance(max_concurrency, int):
+            max_concurrency = 4
+        if not isinstance(requests_per_minute, int | float):
+            requests_per_minute = 0
+
+        # One provider instance, concurrency limit and rate limit per provider type
+        providers: dict[str, AudioProviderBase] = {}
+        semaphores: dict[str, asyncio.Semaphore] = {}
+        buckets: dict[str, TokenBucket] = {}
+        for provider_type in dict.fromkeys([host_provider_type, expert_provider_type]):
+            logger.debug("Creating %s audio provider", provider_type)
+            provider = AudioProviderFactory.create_provider(provider_type=provider_type, settings=self.settings)
+            providers[provider_type] = provider
+            semaphores[provider_type] = asyncio.Semaphore(max(min(provider.max_concurrent_turns, max_concurrency), 1))
+            if requests_per_minute > 0:
+                buckets[provider_type] = get_token_bucket(
+                    f"tts:{provider_type}", rate=requests_per_minute / 60, capacity=max_concurrency
                 )
-            return provider_cache[provider_type]
 
-        # Generate audio segments for each turn
-        audio_segments = []
-        pause_duration_ms = 500  # Default pause between speakers
+        total_turns = len(podcast_script.turns)
+        segment_cache = self._get_segment_cache()
+        speed = getattr(podcast_input.voice_settings, "speed", 1.0)
 
-        for idx, turn in enumerate(podcast_script.turns):
-            # Determine voice and provider for this turn
+        async def synthesize_turn(idx: int, turn: PodcastTurn) -> AudioSegment:
             if turn.speaker == Speaker.HOST:
-                voice_id = host_voice_id
-                provider_type = host_provider_type
+                voice_id, provider_type = host_voice_id, host_provider_type
             else:
-                voice_id = expert_voice_id
-                provider_type = expert_provider_type
-
-            # Get provider instance
-            provider = get_provider(provider_type)
-
-            # Generate audio for this turn
-            try:
-                logger.debug(
-                    "Generating turn %d/%d: speaker=%s, provider=%s, voice=%s, text_len=%d",
-                    idx + 1,
-                    len(podcast_script.turns),
-                    turn.speaker.value,
-                    provider_type,
-                    voice_id,
-                    len(turn.text),
-                )
+                voice_id, provider_type = expert_voice_id, expert_provider_type
 
-                # Call provider's internal turn generation method
-                # pylint: disable=protected-access  # Intentional use of internal method for per-turn generation
-                segment = await provider._generate_turn_audio(
-                    text=turn.text,
-                    voice_id=voice_id,
-                    audio_format=podcast_input.format,
-                )
-
-                audio_segments.append(segment)
-
-                logger.debug(
-                    "Generated turn %d/%d successfully (%s, %d chars, %.1f sec)",
-                    idx + 1,
-                    len(podcast_script.turns),
-                    turn.speaker.value,
-                    len(turn.text),
-                    len(segment) / 1000.0,
+            provider = providers[provider_type]
+            cache_key = None
+            if segment_cache is not None:
+                cache_key = segment_cache.make_key(
+                    provider_type, provider.tts_model_key, voice_id, speed, podcast_input.format.value, turn.text
                 )
+                cached = await asyncio.to_thread(segment_cache.get, cache_key)
+                if cached is not None:
+                    logger.debug("Reusing cached audio for turn %d/%d", idx + 1, total_turns)
+                    return cached
 
+            try:
+                async with semaphores[provider_type]:
+                    if provider_type in buckets:
+                        await buckets[provider_type].acquire_async()
+                    # pylint: disable=protected-access  # Intentional use of internal method for per-turn generation
+                    segment = await provider._generate_turn_audio(
+                        text=turn.text,
+                        voice_id=voice_id,
+                        audio_format=podcast_input.format,
+                    )
             except Exception as e:
-                from rag_solution.generation.audio.base import AudioGenerationError
-
                 logger.error(
                     "Failed to generate audio for turn %d/%d (speaker=%s, provider=%s): %s",
                     idx + 1,
-                    len(podcast_script.turns),
+                    total_turns,
                     turn.speaker.value,
                     provider_type,
                     e,
@@ -1092,35 +1487,89 @@ CRITICAL INSTRUCTION:
                     original_error=e,
                 ) from e
 
-            # Add pause after turn (except last one)
-            if idx < len(podcast_script.turns) - 1:
-                pause = AudioSegment.silent(duration=pause_duration_ms)
-                audio_segments.append(pause)
+            logger.debug(
+                "Generated turn %d/%d successfully (%s, provider=%s, %d chars, %.1f sec)",
+                idx + 1,
+                total_turns,
+                turn.speaker.value,
+                provider_type,
+                len(turn.text),
+                len(segment) / 1000.0,
+            )
+            if segment_cache is not None and cache_key is not None:
+                await asyncio.to_thread(segment_cache.put, cache_key, segment)
+            return segment
+
+        async def report_progress(completed_turns: int, total: int) -> None:
+            if progress_range is None:
+                return
+            start, end = progress_range
+            await self._update_progress(
+                podcast_id,
+                progress=start + (end - start) * completed_turns // total,
+                step="generating_audio",
+                step_details={"total_turns": total, "completed_turns": completed_turns},
+            )
 
-        # Combine all segments into final audio
-        logger.info("Combining %d audio segments into final podcast", len(audio_segments))
+        encoder = StreamingAudioEncoder(output_path, podcast_input.format.value)
+        try:
+            await synthesize_dialogue(
+                podcast_script.turns,
+                synthesize_turn,
+                encoder,
+                max_concurrency=max_concurrency,
+                pause_duration_ms=500,  # Default pause between speakers
+                on_turn_complete=report_progress,
+                segment_writer=segment_writer,
+            )
+            audio_size = await asyncio.to_thread(encoder.close)
+            if segment_writer is not None:
+                await asyncio.to_thread(segment_writer.close)
+        except BaseException:
+            encoder.abort()
+            if segment_writer is not None:
+                segment_writer.abort()
+            raise
 
-        if not audio_segments:
-            raise ValueError("No audio segments generated")
+        logger.info(
+            "Generated complete podcast: %d turns, %d bytes, %.1f seconds, providers_used=%s",
+            total_turns,
+            audio_size,
+            encoder.duration_ms / 1000.0,
+            list(providers.keys()),
+        )
 
-        combined = AudioSegment.empty()
-        for segment in audio_segments:
-            combined += segment
+        return audio_size
 
-        # Export to bytes
-        buffer = io.BytesIO()
-        combined.export(buffer, format=podcast_input.format.value)
-        audio_bytes = buffer.getvalue()
+    def _create_segment_writer(self, podcast_id: UUID4, user_id: UUID4) -> SegmentedAudioWriter | None:
+        """
+        Create the writer for progressive playback segments, or None when disabled.
 
-        logger.info(
-            "Generated complete podcast: %d turns, %d bytes, %.1f seconds, providers_used=%s",
-            len(podcast_script.turns),
-            len(audio_bytes),
-            len(combined) / 1000.0,
-            list(provider_cache.keys()),
+        Segments are served from local audio storage only.
+        """
+        if getattr(self.settings, "podcast_segmented_output_enabled", False) is not True:
+            return None
+        if not isinstance(self.audio_storage, LocalFileStorage):
+            return None
+        return SegmentedAudioWriter(
+            self.audio_storage.get_segments_dir(podcast_id, user_id),
+            segment_seconds=self.settings.podcast_segment_seconds,
         )
 
-        return audio_bytes
+    def _get_segment_cache(self) -> TTSSegmentCache | None:
+        """
+        Return the TTS segment cache, or None when disabled.
+
+        Segments are cached on local audio storage only, next to the podcast files.
+        """
+        if getattr(self.settings, "podcast_tts_cache_enabled", False) is not True:
+            return None
+        if not isinstance(self.audio_storage, LocalFileStorage):
+            return None
+        return get_tts_segment_cache(
+            self.audio_storage.segment_cache_dir,
+            max_bytes=self.settings.podcast_tts_cache_max_mb * 1024 * 1024,
+        )
 
     async def _store_audio(
         self,
@@ -1168,7 +1617,7 @@ CRITICAL INSTRUCTION:
             status: Optional status update
             step_details: Optional step details
         """
-        self.repository.update_progress(
+        podcast = self.repository.update_progress(
             podcast_id=podcast_id,
             progress_percentage=progress,
             current_step=step,
@@ -1181,6 +1630,20 @@ CRITICAL INSTRUCTION:
                 status=status,
             )
 
+        # Push the update to the owner's open WebSocket connections on any worker
+        if podcast is not None:
+            await get_connection_hub().send_to_user(
+                str(podcast.user_id),
+                {
+                    "type": "podcast_progress",
+                    "podcast_id": str(podcast_id),
+                    "progress": progress,
+                    "step": step,
+                    "status": status.value if status else None,
+                    "step_details": step_details,
+                },
+            )
+
     def _serialize_chapters(self, podcast_script: PodcastScriptOutput) -> list[dict[str, Any]]:
         """
         Serialize podcast chapters from PodcastScriptOutput to dictionary format.
@@ -1505,6 +1968,7 @@ CRITICAL INSTRUCTION:
 
         return self.repository.to_schema(podcast_record)
 
+    @with_llm_priority(LLMPriority.BACKGROUND)
     async def _process_audio_from_script(
         self,
         podcast_id: UUID4,
@@ -1554,7 +2018,7 @@ CRITICAL INSTRUCTION:
             )
 
             # Step 3: Generate audio
-            # Convert audio_input to PodcastGenerationInput for _generate_audio compatibility
+            # Convert audio_input to PodcastGenerationInput for _generate_and_store_audio compatibility
             logger.info("Generating multi-voice audio")
             podcast_input_for_audio = PodcastGenerationInput(
                 user_id=audio_input.user_id,
@@ -1567,25 +2031,12 @@ CRITICAL INSTRUCTION:
                 title=audio_input.title,
             )
 
-            audio_bytes = await self._generate_audio(
+            # Step 4: Stream encoded audio into storage (30-80% with per-turn tracking)
+            audio_url, audio_size = await self._generate_and_store_audio(
                 podcast_id,
                 podcast_script,
                 podcast_input_for_audio,
-            )
-
-            await self._update_progress(
-                podcast_id,
-                progress=80,
-                step="storing_audio",
-            )
-
-            # Step 4: Store audio
-            logger.info("Storing audio file")
-            audio_url = await self._store_audio(
-                podcast_id=podcast_id,
-                user_id=audio_input.user_id,
-                audio_bytes=audio_bytes,
-                audio_format=audio_input.audio_format,
+                progress_range=(30, 80),
             )
 
             # Step 5: Extract and serialize chapters
@@ -1596,7 +2047,7 @@ CRITICAL INSTRUCTION:
                 podcast_id=podcast_id,
                 audio_url=audio_url,
                 transcript=audio_input.script_text,
-                audio_size_bytes=len(audio_bytes),
+                audio_size_bytes=audio_size,
                 chapters=chapters_dict if chapters_dict else None,
             )
 
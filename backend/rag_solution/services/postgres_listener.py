@@ -0,0 +1,106 @@
+"""Dedicated Postgres LISTEN connection shared by the cross-worker notifiers.
+
+The config cache invalidations and the WebSocket backplane both receive
+Postgres NOTIFY messages. PostgresListener holds one connection outside the
+pool in LISTEN mode, polls it from the default executor and reconnects after
+failures; subclasses handle the received payloads.
+"""
+
+import asyncio
+import contextlib
+import select
+import threading
+
+from sqlalchemy.engine import Engine
+
+from core.logging_utils import get_logger
+
+logger = get_logger("services.postgres_listener")
+
+
+def default_engine() -> Engine:
+    """Return the application's engine (imported lazily, like the session factory)."""
+    from rag_solution.file_management.database import engine  # pylint: disable=import-outside-toplevel
+
+    return engine
+
+
+class PostgresListener:
+    """Listens on a Postgres channel in the background and reconnects after failures.
+
+    Subclasses implement ``_on_notify`` and may extend ``_on_listen``, which runs
+    each time the LISTEN connection is (re)established.
+    """
+
+    listener_name = "postgres-listener"
+
+    def __init__(self, engine: Engine, channel: str, poll_seconds: float = 1.0, retry_seconds: float = 5.0) -> None:
+        """
+        Initialize the listener.
+
+        Args:
+            engine: Engine to open the listening connection from
+            channel: Channel to LISTEN on
+            poll_seconds: How often the listening thread checks for shutdown
+            retry_seconds: Delay before reconnecting after a connection failure
+        """
+        self.engine = engine
+        self.channel = channel
+        self.poll_seconds = poll_seconds
+        self.retry_seconds = retry_seconds
+        self._stop = threading.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def _start_listening(self) -> None:
+        """Start the listening task in the running event loop."""
+        self._stop.clear()
+        self._task = asyncio.get_running_loop().create_task(self._run(), name=self.listener_name)
+
+    async def stop(self) -> None:
+        """Stop the background task and close the listening connection."""
+        self._stop.set()
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    def listen(self) -> None:
+        """Listen until stopped (blocking)."""
+        connection = self.engine.raw_connection()
+        # The connection stays in LISTEN mode, so it must never return to the pool
+        connection.detach()
+        try:
+            dbapi_connection = connection.dbapi_connection
+            dbapi_connection.autocommit = True  # type: ignore[union-attr]
+            with dbapi_connection.cursor() as cursor:  # type: ignore[union-attr]
+                cursor.execute(f'LISTEN "{self.channel}"')
+            self._on_listen()
+
+            # Wait on the socket itself; select() needs a file descriptor, not the driver connection
+            socket_fd: int = dbapi_connection.fileno()  # type: ignore[union-attr]
+            while not self._stop.is_set():
+                if not select.select([socket_fd], [], [], self.poll_seconds)[0]:
+                    continue
+                dbapi_connection.poll()  # type: ignore[union-attr]
+                while dbapi_connection.notifies:  # type: ignore[union-attr]
+                    self._on_notify(dbapi_connection.notifies.pop(0).payload)  # type: ignore[union-attr]
+        finally:
+            connection.close()
+
+    def _on_listen(self) -> None:
+        """Called from the listening thread once LISTEN is in effect."""
+
+    def _on_notify(self, payload: str) -> None:
+        """Called from the listening thread for every received payload."""
+        raise NotImplementedError
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while not self._stop.is_set():
+            try:
+                await loop.run_in_executor(None, self.listen)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # Justification: The listener must keep reconnecting while the database is unavailable
+                logger.error("%s failed: %s", self.listener_name, e)
+                await asyncio.sleep(self.retry_seconds)
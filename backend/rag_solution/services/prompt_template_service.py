@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import UUID4
 from sqlalchemy.orm import Session
@@ -13,6 +13,10 @@ from rag_solution.schemas.prompt_template_schema import (
     PromptTemplateOutput,
     PromptTemplateType,
 )
+from rag_solution.services.config_cache import PROMPT_TEMPLATE, cached_config
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class PromptTemplateService:
@@ -23,8 +27,8 @@ class PromptTemplateService:
     and manages user-specific template access.
     """
 
-    def __init__(self: Any, db: Session) -> None:
-        self.repository = PromptTemplateRepository(db)
+    def __init__(self: Any, db: Session, async_db: "AsyncSession | None" = None) -> None:
+        self.repository = PromptTemplateRepository(db, async_db=async_db)
 
     def create_template(self, template: PromptTemplateInput) -> PromptTemplateOutput:
         try:
@@ -51,19 +55,40 @@ class PromptTemplateService:
             Optional[PromptTemplateOutput]: Template if found
         """
         try:
-            templates = self.repository.get_by_user_id_and_type(user_id, template_type)
-            if not templates:
-                return None
-            # Return the default template if exists, otherwise latest by creation date
-            default_template = next((t for t in templates if t.is_default), None)
-            if default_template:
-                return PromptTemplateOutput.model_validate(default_template)
-            # Get the latest template by creation date
-            latest_template = max(templates, key=lambda t: t.created_at if t.created_at is not None else datetime.min)
-            return PromptTemplateOutput.model_validate(latest_template)
+            return cached_config(
+                PROMPT_TEMPLATE,
+                f"type:{user_id}:{PromptTemplateType(template_type).value}",
+                lambda: self._load_by_type(user_id, template_type),
+            )
         except Exception as e:
             raise ValidationError(f"Failed to retrieve template: {e!s}") from e
 
+    def _load_by_type(self, user_id: UUID4, template_type: PromptTemplateType) -> PromptTemplateOutput | None:
+        templates = self.repository.get_by_user_id_and_type(user_id, template_type)
+        if not templates:
+            return None
+        # Return the default template if exists, otherwise latest by creation date
+        default_template = next((t for t in templates if t.is_default), None)
+        if default_template:
+            return PromptTemplateOutput.model_validate(default_template)
+        # Get the latest template by creation date
+        latest_template = max(templates, key=lambda t: t.created_at if t.created_at is not None else datetime.min)
+        return PromptTemplateOutput.model_validate(latest_template)
+
+    def _get_cached_template(self, template_id: UUID4) -> PromptTemplateOutput:
+        """Get a template by ID through the configuration cache (read-only use).
+
+        Raises:
+            NotFoundError: If template not found
+        """
+        return cached_config(PROMPT_TEMPLATE, f"id:{template_id}", lambda: self._load_template(template_id))
+
+    def _load_template(self, template_id: UUID4) -> PromptTemplateOutput:
+        template = self.repository.get_by_id(template_id)
+        if not template:
+            raise NotFoundError(resource_type="PromptTemplate", resource_id=str(template_id))
+        return PromptTemplateOutput.model_validate(template)
+
     def get_rag_template(self, user_id: UUID4) -> PromptTemplateOutput:
         """Get RAG query template for user.
 
@@ -124,6 +149,16 @@ class PromptTemplateService:
         except Exception as e:
             raise ValidationError(f"Failed to retrieve templates by type: {e!s}") from e
 
+    async def get_templates_by_type_async(
+        self, user_id: UUID4, template_type: PromptTemplateType
+    ) -> list[PromptTemplateOutput]:
+        """Async variant of :meth:`get_templates_by_type`, read through the repository's async session."""
+        try:
+            templates = await self.repository.get_by_user_id_and_type_async(user_id, template_type)
+            return [PromptTemplateOutput.model_validate(t) for t in templates]
+        except Exception as e:
+            raise ValidationError(f"Failed to retrieve templates by type: {e!s}") from e
+
     def delete_template(self, user_id: UUID4, template_id: UUID4) -> bool:
         try:
             self.repository.delete_user_template(user_id, template_id)
@@ -194,7 +229,7 @@ class PromptTemplateService:
             ValidationError: If formatting fails
         """
         try:
-            template = self.repository.get_by_id(template_id)
+            template = self._get_cached_template(template_id)
             if not template:
                 raise PromptTemplateNotFoundError(template_id=str(template_id))
 
@@ -283,7 +318,7 @@ class PromptTemplateService:
 
     def apply_context_strategy(self, template_id: UUID4, contexts: list[str]) -> str:
         """Apply context strategy to format contexts based on template settings."""
-        template = self.repository.get_by_id(template_id)
+        template = self._get_cached_template(template_id)
         if not template:
             raise NotFoundError(resource_type="PromptTemplate", resource_id=str(template_id))
 
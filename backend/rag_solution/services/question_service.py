@@ -16,6 +16,7 @@ from core.config import Settings
 from core.custom_exceptions import NotFoundError, ValidationError
 from core.logging_utils import get_logger
 from rag_solution.generation.providers.factory import LLMProviderFactory
+from rag_solution.generation.providers.rate_limiting import LLMPriority, with_llm_priority
 from rag_solution.models.question import SuggestedQuestion
 from rag_solution.repository.question_repository import QuestionRepository
 from rag_solution.schemas.llm_parameters_schema import LLMParametersInput
@@ -300,6 +301,7 @@ class QuestionService:
 
         return combined_texts
 
+    @with_llm_priority(LLMPriority.BACKGROUND)
     async def suggest_questions(
         self,
         texts: list[str],
@@ -425,7 +427,8 @@ class QuestionService:
                 # Generate standard questions
                 standard_variables = {"num_questions": str(questions_per_chunk)}
 
-                responses = provider.generate_text(
+                responses = await asyncio.to_thread(
+                    provider.generate_text,
                     user_id=user_id,
                     prompt=batch,
                     model_parameters=parameters,
@@ -513,7 +516,8 @@ class QuestionService:
                     variables = {"context": full_context, "instruction": cot_prompt}
 
                     # Generate CoT questions
-                    response = provider.generate_text(
+                    response = await asyncio.to_thread(
+                        provider.generate_text,
                         user_id=user_id,
                         prompt=[full_context],  # Single comprehensive context
                         model_parameters=parameters,
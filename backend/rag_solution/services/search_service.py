@@ -15,6 +15,7 @@ from sqlalchemy.orm import Session
 from core.config import Settings
 from core.custom_exceptions import ConfigurationError, LLMProviderError, NotFoundError, ValidationError
 from core.logging_utils import get_logger
+from rag_solution.generation.providers.rate_limiting import LLMPriority, with_llm_priority
 from rag_solution.schemas.chain_of_thought_schema import ChainOfThoughtInput
 from rag_solution.schemas.collection_schema import CollectionStatus
 from rag_solution.schemas.llm_usage_schema import TokenWarning
@@ -26,6 +27,7 @@ from rag_solution.services.pipeline.cot_detection import should_use_cot
 from rag_solution.services.pipeline.pipeline_executor import PipelineExecutor
 from rag_solution.services.pipeline.search_context import SearchContext
 from rag_solution.services.pipeline.stages import (
+    DiversityStage,
     GenerationStage,
     PipelineResolutionStage,
     QueryEnhancementStage,
@@ -35,6 +37,7 @@ from rag_solution.services.pipeline.stages import (
 )
 from rag_solution.services.pipeline_service import PipelineService
 from rag_solution.services.token_tracking_service import TokenTrackingService
+from rag_solution.services.tokenizer_service import get_tokenizer_service
 from vectordbs.data_types import DocumentMetadata, QueryResult
 
 # pylint: disable=wrong-import-position
@@ -421,9 +424,13 @@ class SearchService:
             raise ValidationError("Query cannot be empty")
 
     def _validate_collection_access(self, collection_id: UUID4, user_id: UUID4 | None) -> None:
-        """Validate collection access."""
+        """Validate collection access.
+
+        Uses the cached per-user access decision, so the check does not load the
+        user's collections and stays constant-time for users with many collections.
+        """
         try:
-            collection = self.collection_service.get_collection(collection_id)
+            collection = self.collection_service.get_collection_access(collection_id, user_id)
             if not collection:
                 raise NotFoundError(
                     resource_type="Collection",
@@ -449,14 +456,12 @@ class SearchService:
                     f"Collection {collection_id} is not ready for search (status: {collection.status})."
                 )
 
-            if user_id and collection.is_private:
-                user_collections = self.collection_service.get_user_collections(user_id)
-                if collection.id not in [c.id for c in user_collections]:
-                    raise NotFoundError(
-                        resource_type="Collection",
-                        resource_id=str(collection_id),
-                        message="Collection not found or access denied",
-                    )
+            if user_id and collection.is_private and not collection.is_member:
+                raise NotFoundError(
+                    resource_type="Collection",
+                    resource_id=str(collection_id),
+                    message="Collection not found or access denied",
+                )
         except HTTPException as e:
             # Convert HTTPException to NotFoundError to ensure consistent error handling
             if e.status_code == 404:
@@ -517,7 +522,9 @@ class SearchService:
             logger.error("Failed to create pipeline for user %s: %s", user_id, e)
             raise ConfigurationError(f"Failed to create default pipeline for user {user_id}: {e}") from e
 
+    # Interactive unless invoked on behalf of a background job (e.g. podcast retrieval)
     @handle_search_errors
+    @with_llm_priority(LLMPriority.INTERACTIVE, override=False)
     async def search(self, search_input: SearchInput) -> SearchOutput:
         """Process a search query using modern pipeline architecture."""
         logger.info("🔍 Processing search query: %s", search_input.question)
@@ -535,9 +542,10 @@ class SearchService:
         1. PipelineResolutionStage - Resolve user's default pipeline
         2. QueryEnhancementStage - Enhance/rewrite query
         3. RetrievalStage - Retrieve documents from vector DB
-        4. RerankingStage - Rerank results for relevance
-        5. ReasoningStage - Apply Chain of Thought if needed
-        6. GenerationStage - Generate final answer
+        4. DiversityStage - Drop near-duplicates and order candidates by MMR
+        5. RerankingStage - Rerank results for relevance
+        6. ReasoningStage - Apply Chain of Thought if needed
+        7. GenerationStage - Generate final answer
 
         Each stage is independent, testable, and modifiable without affecting
         others. This enables easier maintenance, testing, and feature addition.
@@ -560,7 +568,7 @@ class SearchService:
         executor = PipelineExecutor(stages=[])
 
         # Add stages in execution order (Week 4 implementation uses all stages)
-        logger.debug("Configuring pipeline with all 6 stages")
+        logger.debug("Configuring pipeline with all 7 stages")
 
         # Stage 1: Pipeline Resolution - Get user's default pipeline configuration
         executor.add_stage(PipelineResolutionStage(self.pipeline_service))
@@ -571,13 +579,16 @@ class SearchService:
         # Stage 3: Retrieval - Get documents from vector DB
         executor.add_stage(RetrievalStage(self.pipeline_service))
 
-        # Stage 4: Reranking - Rerank results for better relevance
+        # Stage 4: Diversity - Drop near-duplicates and order candidates by MMR
+        executor.add_stage(DiversityStage(self.pipeline_service))
+
+        # Stage 5: Reranking - Rerank results for better relevance
         executor.add_stage(RerankingStage(self.pipeline_service))
 
-        # Stage 5: Reasoning - Apply Chain of Thought if needed
+        # Stage 6: Reasoning - Apply Chain of Thought if needed
         executor.add_stage(ReasoningStage(self.chain_of_thought_service))
 
-        # Stage 6: Generation - Generate final answer from context
+        # Stage 7: Generation - Generate final answer from context
         executor.add_stage(GenerationStage(self.pipeline_service))
 
         # Execute pipeline
@@ -634,16 +645,12 @@ class SearchService:
         return search_output
 
     def _estimate_token_usage(self, question: str, answer: str) -> int:
-        """Estimate token usage based on text length.
+        """Estimate token usage of a question and its answer.
 
-        Uses a rough approximation of 4 characters per token as a baseline.
-        This provides a reasonable estimate when actual token counts aren't available.
+        Counts tokens with the shared tokenizer service. This provides a reasonable
+        estimate when actual token counts aren't available.
         """
-        # Combine question and answer text
-        total_text = f"{question} {answer}"
-
-        # Rough estimation: ~4 characters per token
-        estimated_tokens = len(total_text) // 4
+        estimated_tokens = sum(get_tokenizer_service().count_tokens_batch([question, answer]))
 
         # Add some baseline tokens for processing overhead
         estimated_tokens += 50
@@ -5,9 +5,12 @@ from rag_solution.services.storage.audio_storage import (
     AudioStorageError,
     LocalFileStorage,
 )
+from rag_solution.services.storage.tts_segment_cache import TTSSegmentCache, get_tts_segment_cache
 
 __all__ = [
     "AudioStorageBase",
     "AudioStorageError",
     "LocalFileStorage",
+    "TTSSegmentCache",
+    "get_tts_segment_cache",
 ]
@@ -6,6 +6,9 @@ storage backends (local filesystem, MinIO, S3, Cloudflare R2).
 """
 
 import logging
+import os
+import shutil
+import tempfile
 from abc import ABC, abstractmethod
 from pathlib import Path
 from uuid import UUID
@@ -89,6 +92,54 @@ class AudioStorageBase(ABC):
             True if file exists, False otherwise
         """
 
+    def create_staging_path(self, podcast_id: UUID, user_id: UUID, audio_format: str) -> Path:
+        """
+        Return a path where audio can be encoded before it is stored.
+
+        The default is a temporary file; backends that keep files on local disk
+        override this so that ``store_audio_file`` can move the file into place.
+
+        Args:
+            podcast_id: Podcast identifier
+            user_id: User identifier
+            audio_format: Audio format extension
+
+        Returns:
+            Path of a not yet existing file
+        """
+        fd, path = tempfile.mkstemp(prefix=f"podcast-{user_id}-{podcast_id}-", suffix=f".{audio_format}")
+        os.close(fd)
+        return Path(path)
+
+    async def store_audio_file(
+        self,
+        podcast_id: UUID,
+        user_id: UUID,
+        file_path: Path,
+        audio_format: str,
+    ) -> str:
+        """
+        Store an already encoded audio file and remove the source file.
+
+        The default implementation reads the file and delegates to ``store_audio``.
+
+        Args:
+            podcast_id: Unique podcast identifier
+            user_id: User who owns the podcast
+            file_path: Encoded audio file, usually from ``create_staging_path``
+            audio_format: Audio format (mp3, wav, etc.)
+
+        Returns:
+            URL or path to access the stored audio
+
+        Raises:
+            AudioStorageError: If storage operation fails
+        """
+        try:
+            return await self.store_audio(podcast_id, user_id, file_path.read_bytes(), audio_format)
+        finally:
+            file_path.unlink(missing_ok=True)
+
 
 class LocalFileStorage(AudioStorageBase):
     """Local filesystem storage for podcast audio files (development)."""
@@ -104,6 +155,11 @@ class LocalFileStorage(AudioStorageBase):
         self.base_path.mkdir(parents=True, exist_ok=True)
         logger.info("Initialized LocalFileStorage at %s", self.base_path.absolute())
 
+    @property
+    def segment_cache_dir(self) -> Path:
+        """Directory for cached TTS segments, kept apart from per-user podcast files."""
+        return self.base_path / "_tts_segments"
+
     def _get_audio_path(self, podcast_id: UUID, user_id: UUID, audio_format: str = "mp3") -> Path:
         """
         Get path for audio file.
@@ -169,6 +225,74 @@ class LocalFileStorage(AudioStorageBase):
             logger.error(error_msg)
             raise AudioStorageError(error_msg) from e
 
+    def get_segments_dir(self, podcast_id: UUID, user_id: UUID) -> Path:
+        """
+        Get the directory holding progressive playback segments and their playlist.
+
+        Structure: {base_path}/{user_id}/{podcast_id}/segments/
+
+        Args:
+            podcast_id: Podcast identifier
+            user_id: User identifier
+
+        Returns:
+            Path object for the segments directory
+        """
+        return self._get_audio_path(podcast_id, user_id).parent / "segments"
+
+    def create_staging_path(self, podcast_id: UUID, user_id: UUID, audio_format: str) -> Path:
+        """
+        Return a partial file next to the final audio path.
+
+        Staging in the podcast directory keeps the final move on one filesystem,
+        so ``store_audio_file`` is a rename.
+        """
+        audio_path = self._get_audio_path(podcast_id, user_id, audio_format)
+        audio_path.parent.mkdir(parents=True, exist_ok=True)
+        return audio_path.with_name(f"{audio_path.name}.partial")
+
+    async def store_audio_file(
+        self,
+        podcast_id: UUID,
+        user_id: UUID,
+        file_path: Path,
+        audio_format: str,
+    ) -> str:
+        """
+        Move an encoded audio file into place without reading it into memory.
+
+        Args:
+            podcast_id: Podcast identifier
+            user_id: User identifier
+            file_path: Encoded audio file
+            audio_format: Audio format (mp3, wav, etc.)
+
+        Returns:
+            Relative file path as URL
+
+        Raises:
+            AudioStorageError: If the move fails
+        """
+        try:
+            audio_path = self._get_audio_path(podcast_id, user_id, audio_format)
+            audio_path.parent.mkdir(parents=True, exist_ok=True)
+            # A rename when staged by create_staging_path, a copy across filesystems otherwise
+            shutil.move(file_path, audio_path)
+
+            logger.info(
+                "Stored audio for podcast %s at %s (%d bytes)",
+                podcast_id,
+                audio_path,
+                audio_path.stat().st_size,
+            )
+
+            return f"/api/podcasts/{podcast_id}/audio"
+
+        except OSError as e:
+            error_msg = f"Failed to store audio for podcast {podcast_id}: {e}"
+            logger.error(error_msg)
+            raise AudioStorageError(error_msg) from e
+
     async def retrieve_audio(self, podcast_id: UUID, user_id: UUID) -> bytes:
         """
         Retrieve audio file from local filesystem.
@@ -234,6 +358,13 @@ class LocalFileStorage(AudioStorageBase):
                     deleted = True
                     logger.info("Deleted audio file: %s", audio_path)
 
+            # Remove progressive playback segments
+            segments_dir = self.get_segments_dir(podcast_id, user_id)
+            if segments_dir.exists():
+                shutil.rmtree(segments_dir)
+                deleted = True
+                logger.info("Deleted audio segments: %s", segments_dir)
+
             # Try to remove empty directories
             if deleted:
                 podcast_dir = audio_path.parent
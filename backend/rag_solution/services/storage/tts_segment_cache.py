@@ -0,0 +1,205 @@
+"""
+Content-addressed cache of synthesized TTS segments.
+
+Regenerating audio from an edited script used to re-synthesize every turn even
+when only one line changed. Segments are cached on the local audio storage
+backend, keyed by a hash of everything that determines the synthesized audio:
+provider, model (including voice settings), voice ID, speed, output format and
+the normalized turn text. Unchanged turns are read back from disk and only
+edited turns are sent to the TTS provider.
+
+Segments are stored as uncompressed WAV so that a cached turn decodes to exactly
+the samples the provider produced. The cache is bounded by total size and evicts
+the least recently used segments first.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+
+from pydub import AudioSegment
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_SUFFIX = ".wav"
+
+
+def normalize_text(text: str) -> str:
+    """Normalize turn text so whitespace and Unicode form differences do not miss the cache."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class TTSSegmentCache:
+    """Thread-safe, size-bounded LRU cache of TTS segments on local disk."""
+
+    def __init__(self, cache_dir: str | Path, max_bytes: int = 2 * 1024**3) -> None:
+        """
+        Initialize the cache, indexing segments left by previous runs.
+
+        Args:
+            cache_dir: Directory holding cached segments
+            max_bytes: Maximum total size of cached segments
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+
+        # Rebuild the LRU order from file access times
+        existing = sorted(self.cache_dir.glob(f"*/*{SEGMENT_SUFFIX}"), key=lambda path: path.stat().st_mtime)
+        for path in existing:
+            size = path.stat().st_size
+            self._entries[path.stem] = size
+            self._total_bytes += size
+        self._evict_locked()
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        voice_id: str,
+        speed: float,
+        audio_format: str,
+        text: str,
+    ) -> str:
+        """
+        Build the content address of a segment.
+
+        Args:
+            provider: Audio provider name
+            model: Provider model identity, including settings that affect the audio
+            voice_id: Provider voice ID
+            speed: Speech speed multiplier
+            audio_format: Format requested from the provider
+            text: Turn text (normalized before hashing)
+
+        Returns:
+            Hex digest identifying the segment
+        """
+        text_hash = hashlib.sha256(normalize_text(text).encode()).hexdigest()
+        identity = f"{provider}|{model}|{voice_id}|{speed:g}|{audio_format}|{text_hash}"
+        return hashlib.sha256(identity.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{SEGMENT_SUFFIX}"
+
+    def get(self, key: str) -> AudioSegment | None:
+        """
+        Return a cached segment, or None on a miss.
+
+        Args:
+            key: Key from ``make_key``
+
+        Returns:
+            Cached AudioSegment or None
+        """
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+
+        path = self._path(key)
+        try:
+            segment = AudioSegment.from_wav(str(path))
+            os.utime(path)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Justification: Evicted, removed or truncated segments are treated as a miss
+            logger.debug("TTS segment %s unreadable: %s", key, e)
+            self._forget(key)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return segment
+
+    def put(self, key: str, segment: AudioSegment) -> None:
+        """
+        Store a segment and evict least recently used ones if over budget.
+
+        Args:
+            key: Key from ``make_key``
+            segment: Synthesized segment
+        """
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                segment.export(f, format="wav")
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        size = path.stat().st_size
+        with self._lock:
+            self._total_bytes += size - self._entries.get(key, 0)
+            self._entries[key] = size
+            self._entries.move_to_end(key)
+            self._evict_locked()
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            self._total_bytes -= self._entries.pop(key, 0)
+
+    def _evict_locked(self) -> None:
+        while self._total_bytes > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self._path(key).unlink(missing_ok=True)
+            logger.debug("Evicted TTS segment %s (%d bytes)", key, size)
+
+    def stats(self) -> dict[str, int]:
+        """Return cache statistics for diagnostics."""
+        with self._lock:
+            return {
+                "segments": len(self._entries),
+                "bytes": self._total_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_segment_caches: dict[Path, TTSSegmentCache] = {}
+_segment_caches_lock = threading.Lock()
+
+
+def get_tts_segment_cache(cache_dir: str | Path, max_bytes: int) -> TTSSegmentCache:
+    """
+    Return the process-wide segment cache for a directory.
+
+    Args:
+        cache_dir: Directory holding cached segments
+        max_bytes: Maximum total size of cached segments
+
+    Returns:
+        Shared TTSSegmentCache instance
+    """
+    path = Path(cache_dir).absolute()
+    with _segment_caches_lock:
+        cache = _segment_caches.get(path)
+        if cache is None:
+            cache = TTSSegmentCache(path, max_bytes=max_bytes)
+            _segment_caches[path] = cache
+        cache.max_bytes = max_bytes
+        return cache
+
+
+def reset_tts_segment_caches() -> None:
+    """Discard all process-wide segment caches (used by tests)."""
+    with _segment_caches_lock:
+        _segment_caches.clear()
@@ -12,6 +12,7 @@ from pydantic import UUID4
 from sqlalchemy.orm import Session
 
 from core.config import Settings
+from rag_solution.repository.llm_usage_repository import LLMUsageRepository
 from rag_solution.repository.token_warning_repository import TokenWarningRepository
 from rag_solution.schemas.llm_usage_schema import (
     LLMUsage,
@@ -20,6 +21,7 @@ from rag_solution.schemas.llm_usage_schema import (
     TokenWarningType,
 )
 from rag_solution.services.llm_model_service import LLMModelService
+from rag_solution.services.usage_accounting import UsageBucket, UsageCounter, get_usage_accountant, usage_stats
 
 
 class TokenTrackingService:
@@ -37,6 +39,7 @@ class TokenTrackingService:
         settings: Application settings
         llm_model_service: Service for retrieving model configurations
         token_warning_repository: Repository for token warning data access
+        llm_usage_repository: Repository for persisted token usage totals
     """
 
     def __init__(self, db: Session, settings: Settings, llm_model_service: LLMModelService | None = None) -> None:
@@ -50,6 +53,7 @@ class TokenTrackingService:
         self.db = db
         self.settings = settings
         self.token_warning_repository = TokenWarningRepository(db)
+        self.llm_usage_repository = LLMUsageRepository(db)
 
         # Lazy initialization for LLM model service
         self._llm_model_service: LLMModelService | None = llm_model_service
@@ -311,17 +315,27 @@ class TokenTrackingService:
     async def get_user_token_stats(self, user_id: UUID4) -> TokenUsageStats:
         """Get token usage statistics for a user.
 
+        Combines the persisted running totals with the usage this worker has
+        not flushed yet.
+
         Args:
             user_id: User ID
 
         Returns:
             Token usage statistics
         """
-        stats = self.token_warning_repository.get_warning_stats_by_user(user_id)
-        return TokenUsageStats(
-            total_tokens=0,  # Would need to implement actual token tracking
-            total_calls=0,  # Would need to implement actual call tracking
-            by_service={},  # Would need to implement service-level tracking
-            by_model={},  # Would need to implement model-level tracking
-            **stats,
-        )
+        counters: dict[UsageBucket, UsageCounter] = {}
+        for row in self.llm_usage_repository.get_totals_by_user(user_id):
+            counters[(row.model_name, row.service_type)] = UsageCounter(
+                prompt_tokens=row.prompt_tokens,
+                completion_tokens=row.completion_tokens,
+                total_tokens=row.total_tokens,
+                calls=row.calls,
+            )
+
+        accountant = get_usage_accountant(self.settings)
+        if accountant is not None:
+            for bucket, pending in accountant.pending_for_user(UUID(str(user_id))).items():
+                counters.setdefault(bucket, UsageCounter()).merge(pending)
+
+        return usage_stats(counters)
@@ -0,0 +1,324 @@
+"""Shared token counting and token-budgeted context packing.
+
+Token counts used to be estimated differently in every service (words * 1.3,
+characters / 4, a fresh tiktoken encoding per call), and retrieved context was
+truncated by characters. This module provides one process-wide service that:
+
+- loads a tokenizer once per model and keeps it cached (HuggingFace tokenizer
+  for hub model ids, tiktoken otherwise, a character heuristic as last resort)
+- counts tokens for batches of texts in one call
+- packs scored chunks into an exact token budget, most relevant first, skipping
+  chunks that mostly repeat already selected text
+"""
+
+import math
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from core.logging_utils import get_logger
+
+logger = get_logger("services.tokenizer")
+
+# Try to import tiktoken for accurate token counting
+try:
+    import tiktoken
+
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+    logger.warning("tiktoken not available, using fallback token estimation")
+
+# Encoding used when a model has no tiktoken mapping
+DEFAULT_ENCODING = "cl100k_base"
+
+# Average English: ~4.7 chars/word, ~1.3 tokens/word = ~3.6 chars/token
+CHARS_PER_TOKEN = 3.6
+
+# Word n-gram size used to detect overlapping chunks
+SHINGLE_SIZE = 5
+
+# Smallest remainder worth filling with a truncated chunk
+MIN_TRUNCATED_TOKENS = 32
+
+_WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+class Tokenizer(ABC):
+    """Token counting interface shared by all tokenizer backends."""
+
+    name = "tokenizer"
+
+    @abstractmethod
+    def count_batch(self, texts: Sequence[str]) -> list[int]:
+        """Return the number of tokens of each text."""
+
+    @abstractmethod
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Return the longest prefix of text with at most max_tokens tokens."""
+
+
+class TiktokenTokenizer(Tokenizer):
+    """Tokenizer backed by a tiktoken encoding."""
+
+    def __init__(self, encoding: Any) -> None:
+        self.encoding = encoding
+        self.name = f"tiktoken:{encoding.name}"
+
+    def count_batch(self, texts: Sequence[str]) -> list[int]:
+        return [len(tokens) for tokens in self.encoding.encode_ordinary_batch(list(texts))]
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        tokens = self.encoding.encode_ordinary(text)
+        return text if len(tokens) <= max_tokens else self.encoding.decode(tokens[: max(max_tokens, 0)])
+
+
+class HuggingFaceTokenizer(Tokenizer):
+    """Tokenizer backed by a HuggingFace ``PreTrainedTokenizer``."""
+
+    def __init__(self, tokenizer: Any, model_id: str) -> None:
+        self.tokenizer = tokenizer
+        self.name = f"hf:{model_id}"
+
+    def count_batch(self, texts: Sequence[str]) -> list[int]:
+        if not texts:
+            return []
+        encoded = self.tokenizer(list(texts), add_special_tokens=False)["input_ids"]
+        return [len(ids) for ids in encoded]
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        ids = self.tokenizer(text, add_special_tokens=False)["input_ids"]
+        return text if len(ids) <= max_tokens else self.tokenizer.decode(ids[: max(max_tokens, 0)])
+
+
+class HeuristicTokenizer(Tokenizer):
+    """Character-based estimate used when no real tokenizer can be loaded."""
+
+    name = "heuristic"
+
+    def count_batch(self, texts: Sequence[str]) -> list[int]:
+        return [math.ceil(len(text) / CHARS_PER_TOKEN) for text in texts]
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        return text[: int(max(max_tokens, 0) * CHARS_PER_TOKEN)]
+
+
+@dataclass
+class PackedContext:
+    """Result of packing chunks into a token budget."""
+
+    chunks: list[str] = field(default_factory=list)
+    indices: list[int] = field(default_factory=list)
+    token_count: int = 0
+    duplicates_skipped: int = 0
+    truncated: bool = False
+
+
+def _shingles(text: str) -> set[tuple[str, ...]]:
+    words = _WORD_PATTERN.findall(text.lower())
+    if len(words) < SHINGLE_SIZE:
+        return {tuple(words)} if words else set()
+    return {tuple(words[i : i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+
+
+def pack_context(
+    tokenizer: Tokenizer,
+    texts: Sequence[str],
+    scores: Sequence[float] | None,
+    token_budget: int,
+    separator: str = "\n\n",
+    overlap_threshold: float = 0.8,
+) -> PackedContext:
+    """
+    Greedily fill a token budget with the highest scoring chunks.
+
+    Chunks are taken in descending score order. A chunk whose word n-grams are
+    mostly (``overlap_threshold``) already covered by selected chunks is skipped,
+    which removes duplicates and the overlap between neighbouring chunks. Chunks
+    that do not fit are passed over in favour of smaller ones, and any remainder
+    is filled with a truncated prefix of the best chunk that did not fit.
+
+    Args:
+        tokenizer: Tokenizer used for counting
+        texts: Chunk texts
+        scores: Relevance score of each chunk (None keeps the given order)
+        token_budget: Maximum number of tokens of the joined context
+        separator: Separator placed between chunks
+        overlap_threshold: Share of covered n-grams above which a chunk is a duplicate
+
+    Returns:
+        Selected chunks in descending score order with their token count
+    """
+    packed = PackedContext()
+    if not texts or token_budget <= 0:
+        return packed
+
+    order = sorted(range(len(texts)), key=lambda i: (-(scores[i] or 0.0) if scores else 0.0, i))
+    counts = tokenizer.count_batch([*texts, separator])
+    separator_tokens = counts.pop()
+
+    covered: set[tuple[str, ...]] = set()
+    overflow: int | None = None
+    for i in order:
+        remaining = token_budget - packed.token_count
+        if remaining <= 0:
+            break
+        shingles = _shingles(texts[i])
+        if not shingles or len(shingles & covered) / len(shingles) >= overlap_threshold:
+            packed.duplicates_skipped += 1
+            continue
+
+        cost = counts[i] + (separator_tokens if packed.chunks else 0)
+        if cost > remaining:
+            if overflow is None:
+                overflow = i
+            continue
+
+        packed.chunks.append(texts[i])
+        packed.indices.append(i)
+        packed.token_count += cost
+        covered |= shingles
+
+    remaining = token_budget - packed.token_count - (separator_tokens if packed.chunks else 0)
+    if overflow is not None and remaining >= MIN_TRUNCATED_TOKENS:
+        prefix = tokenizer.truncate(texts[overflow], remaining)
+        if prefix.strip():
+            packed.chunks.append(prefix)
+            packed.indices.append(overflow)
+            packed.truncated = True
+
+    # Token boundaries can shift when chunks are joined; re-count the final text and trim
+    if packed.chunks:
+        packed.token_count = tokenizer.count_batch([separator.join(packed.chunks)])[0]
+        while packed.token_count > token_budget and packed.chunks:
+            excess = packed.token_count - token_budget
+            last_tokens = tokenizer.count_batch([packed.chunks[-1]])[0]
+            if last_tokens - excess < MIN_TRUNCATED_TOKENS:
+                packed.chunks.pop()
+                packed.indices.pop()
+            else:
+                shortened = tokenizer.truncate(packed.chunks[-1], last_tokens - excess)
+                if shortened == packed.chunks[-1]:
+                    packed.chunks.pop()
+                    packed.indices.pop()
+                else:
+                    packed.chunks[-1] = shortened
+                    packed.truncated = True
+            packed.token_count = tokenizer.count_batch([separator.join(packed.chunks)])[0] if packed.chunks else 0
+
+    return packed
+
+
+class TokenizerService:
+    """Process-wide tokenizer registry with batched counting and context packing."""
+
+    def __init__(self, max_tokenizers: int = 16) -> None:
+        """
+        Initialize the service.
+
+        Args:
+            max_tokenizers: Maximum number of tokenizers kept loaded
+        """
+        self.max_tokenizers = max_tokenizers
+        self._tokenizers: OrderedDict[str, Tokenizer] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_tokenizer(self, model_id: str | None = None) -> Tokenizer:
+        """
+        Return the cached tokenizer of a model, loading it on first use.
+
+        Args:
+            model_id: Model identifier (HuggingFace hub id or OpenAI model name); None for the default
+
+        Returns:
+            Tokenizer for the model
+        """
+        key = model_id or ""
+        with self._lock:
+            tokenizer = self._tokenizers.get(key)
+            if tokenizer is not None:
+                self._tokenizers.move_to_end(key)
+                return tokenizer
+
+        tokenizer = self._load(model_id)
+        with self._lock:
+            tokenizer = self._tokenizers.setdefault(key, tokenizer)
+            self._tokenizers.move_to_end(key)
+            while len(self._tokenizers) > self.max_tokenizers:
+                self._tokenizers.popitem(last=False)
+        return tokenizer
+
+    def _load(self, model_id: str | None) -> Tokenizer:
+        if model_id and "/" in model_id:
+            try:
+                from transformers import AutoTokenizer  # pylint: disable=import-outside-toplevel
+
+                tokenizer = HuggingFaceTokenizer(AutoTokenizer.from_pretrained(model_id), model_id)
+                logger.info("Loaded HuggingFace tokenizer for %s", model_id)
+                return tokenizer
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # Justification: Unknown, gated or offline models fall back to tiktoken
+                logger.debug("No HuggingFace tokenizer for %s: %s", model_id, e)
+
+        if TIKTOKEN_AVAILABLE:
+            try:
+                try:
+                    encoding = (
+                        tiktoken.encoding_for_model(model_id) if model_id else tiktoken.get_encoding(DEFAULT_ENCODING)
+                    )
+                except KeyError:
+                    encoding = tiktoken.get_encoding(DEFAULT_ENCODING)
+                return TiktokenTokenizer(encoding)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # Justification: Encodings are downloaded on first use and may be unavailable offline
+                logger.warning("tiktoken encoding unavailable, using fallback estimation: %s", e)
+
+        return HeuristicTokenizer()
+
+    def count_tokens(self, text: str, model_id: str | None = None) -> int:
+        """Return the number of tokens of a text."""
+        return self.get_tokenizer(model_id).count_batch([text])[0]
+
+    def count_tokens_batch(self, texts: Sequence[str], model_id: str | None = None) -> list[int]:
+        """Return the number of tokens of each text, counted in one batch."""
+        return self.get_tokenizer(model_id).count_batch(texts)
+
+    def truncate(self, text: str, max_tokens: int, model_id: str | None = None) -> str:
+        """Return the longest prefix of a text with at most max_tokens tokens."""
+        return self.get_tokenizer(model_id).truncate(text, max_tokens)
+
+    def pack_context(
+        self,
+        texts: Sequence[str],
+        scores: Sequence[float] | None,
+        token_budget: int,
+        model_id: str | None = None,
+        separator: str = "\n\n",
+    ) -> PackedContext:
+        """Pack scored chunks into a token budget (see ``pack_context``)."""
+        return pack_context(self.get_tokenizer(model_id), texts, scores, token_budget, separator=separator)
+
+
+_tokenizer_service: TokenizerService | None = None
+_tokenizer_service_lock = threading.Lock()
+
+
+def get_tokenizer_service() -> TokenizerService:
+    """Return the process-wide tokenizer service."""
+    global _tokenizer_service  # pylint: disable=global-statement
+    if _tokenizer_service is None:
+        with _tokenizer_service_lock:
+            if _tokenizer_service is None:
+                _tokenizer_service = TokenizerService()
+    return _tokenizer_service
+
+
+def reset_tokenizer_service() -> None:
+    """Discard the process-wide tokenizer service (used by tests)."""
+    global _tokenizer_service  # pylint: disable=global-statement
+    with _tokenizer_service_lock:
+        _tokenizer_service = None
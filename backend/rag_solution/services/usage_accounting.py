@@ -0,0 +1,328 @@
+"""Bounded, process-wide LLM token usage accounting.
+
+Every LLM call reports an LLMUsage. Instead of keeping every record, usage is
+folded into fixed-size structures as it is reported:
+
+1. running counters per (user, model, service type), a bounded LRU
+2. a ring buffer of the most recent events
+3. per-user deltas not yet persisted, flushed in batches to the
+   ``llm_usage_totals`` table by UsageFlusher
+
+Recording is O(1) per call. A user's totals are read from the persisted rows
+plus the deltas this worker has not flushed yet, so they survive restarts.
+Usage without a (valid) user ID is counted in process only.
+"""
+
+import asyncio
+import threading
+import uuid
+from collections import OrderedDict, deque
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from core.config import Settings, get_settings
+from core.logging_utils import get_logger
+from rag_solution.repository.llm_usage_repository import LLMUsageRepository
+from rag_solution.schemas.llm_usage_schema import LLMUsage, ServiceType, TokenUsageStats
+from rag_solution.services.background_tasks import PeriodicTask, default_session_factory
+
+logger = get_logger("services.usage_accounting")
+
+# (model name, service type)
+UsageBucket = tuple[str, str]
+# (user ID, model name, service type)
+UsageKey = tuple[str | None, str, str]
+PendingKey = tuple[uuid.UUID, str, str]
+
+
+@dataclass
+class UsageCounter:
+    """Running token counts of one usage bucket."""
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+    calls: int = 0
+
+    def add(self, usage: LLMUsage) -> None:
+        """Count one LLM call."""
+        self.prompt_tokens += usage.prompt_tokens
+        self.completion_tokens += usage.completion_tokens
+        self.total_tokens += usage.total_tokens
+        self.calls += 1
+
+    def merge(self, other: "UsageCounter") -> None:
+        """Add the counts of another counter."""
+        self.prompt_tokens += other.prompt_tokens
+        self.completion_tokens += other.completion_tokens
+        self.total_tokens += other.total_tokens
+        self.calls += other.calls
+
+
+def usage_bucket(usage: LLMUsage) -> UsageBucket:
+    """Return the (model, service type) bucket of a usage record."""
+    service = usage.service_type
+    return usage.model_name, service.value if isinstance(service, ServiceType) else str(service)
+
+
+def usage_stats(counters: Mapping[UsageBucket, UsageCounter]) -> TokenUsageStats:
+    """Build usage statistics from per-bucket counters.
+
+    Args:
+        counters: Counters keyed by (model, service type)
+
+    Returns:
+        Aggregated token usage statistics
+    """
+    total = UsageCounter()
+    by_service: dict[ServiceType | str, int] = {}
+    by_model: dict[str, int] = {}
+    for (model_name, service_type), counter in counters.items():
+        total.merge(counter)
+        by_service[service_type] = by_service.get(service_type, 0) + counter.total_tokens
+        by_model[model_name] = by_model.get(model_name, 0) + counter.total_tokens
+
+    return TokenUsageStats(
+        total_prompt_tokens=total.prompt_tokens,
+        total_completion_tokens=total.completion_tokens,
+        total_tokens=total.total_tokens,
+        total_calls=total.calls,
+        average_tokens_per_call=total.total_tokens / total.calls if total.calls else 0.0,
+        by_service=by_service,
+        by_model=by_model,
+    )
+
+
+class UsageAccountant:
+    """Thread-safe usage counters shared by every provider instance in the process."""
+
+    def __init__(self, max_keys: int = 10000, recent_events: int = 1000, persist: bool = True) -> None:
+        """Initialize the accountant.
+
+        Args:
+            max_keys: Maximum number of (user, model, service type) counters, and of unflushed deltas
+            recent_events: Number of recent usage records kept
+            persist: Whether per-user deltas are kept for flush()
+        """
+        self.max_keys = max_keys
+        self.persist = persist
+        self._counters: OrderedDict[UsageKey, UsageCounter] = OrderedDict()
+        self._pending: dict[PendingKey, UsageCounter] = {}
+        self._recent: deque[LLMUsage] = deque(maxlen=recent_events)
+        self._lock = threading.Lock()
+
+        self.recorded = 0
+        self.dropped = 0
+
+    def record(self, usage: LLMUsage) -> None:
+        """Count one LLM call.
+
+        Args:
+            usage: Token usage reported by the provider
+        """
+        bucket = usage_bucket(usage)
+        key: UsageKey = (usage.user_id, *bucket)
+        user_uuid = _parse_user_id(usage.user_id) if self.persist else None
+        with self._lock:
+            self.recorded += 1
+            self._recent.append(usage)
+
+            counter = self._counters.get(key)
+            if counter is None:
+                counter = self._counters[key] = UsageCounter()
+                while len(self._counters) > self.max_keys:
+                    self._counters.popitem(last=False)
+            else:
+                self._counters.move_to_end(key)
+            counter.add(usage)
+
+            if user_uuid is None:
+                return
+            pending_key: PendingKey = (user_uuid, *bucket)
+            pending = self._pending.get(pending_key)
+            if pending is None:
+                if len(self._pending) >= self.max_keys:
+                    # Only reachable while flushes keep failing
+                    self.dropped += 1
+                    return
+                pending = self._pending[pending_key] = UsageCounter()
+            pending.add(usage)
+
+    def recent(self, limit: int = 10) -> list[LLMUsage]:
+        """Return the most recent usage records, oldest first."""
+        with self._lock:
+            return list(self._recent)[-limit:] if limit > 0 else []
+
+    def totals(self, user_id: str | None = None) -> TokenUsageStats:
+        """Return the usage counted by this process since it started.
+
+        Args:
+            user_id: Only count this user's usage
+
+        Returns:
+            Aggregated token usage statistics
+        """
+        counters: dict[UsageBucket, UsageCounter] = {}
+        with self._lock:
+            for (key_user, model_name, service_type), counter in self._counters.items():
+                if user_id is None or key_user == user_id:
+                    counters.setdefault((model_name, service_type), UsageCounter()).merge(counter)
+        return usage_stats(counters)
+
+    def pending_for_user(self, user_id: uuid.UUID) -> dict[UsageBucket, UsageCounter]:
+        """Return a user's usage that has not been flushed yet."""
+        with self._lock:
+            return {
+                (model_name, service_type): UsageCounter(**vars(counter))
+                for (key_user, model_name, service_type), counter in self._pending.items()
+                if key_user == user_id
+            }
+
+    def flush(self, db: Session) -> int:
+        """Persist the unflushed deltas in one batch.
+
+        Deltas that fail to persist are kept and retried on the next flush.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of (user, model, service type) rows written
+        """
+        with self._lock:
+            batch, self._pending = self._pending, {}
+        if not batch:
+            return 0
+
+        rows = [
+            {
+                "user_id": user_id,
+                "model_name": model_name,
+                "service_type": service_type,
+                **vars(counter),
+            }
+            for (user_id, model_name, service_type), counter in batch.items()
+        ]
+        try:
+            return LLMUsageRepository(db).add_usage(rows)
+        except Exception:
+            with self._lock:
+                for key, counter in batch.items():
+                    self._pending.setdefault(key, UsageCounter()).merge(counter)
+            raise
+
+    def stats(self) -> dict[str, Any]:
+        """Return accountant statistics for diagnostics."""
+        with self._lock:
+            return {
+                "counters": len(self._counters),
+                "pending": len(self._pending),
+                "recorded": self.recorded,
+                "dropped": self.dropped,
+            }
+
+
+def _parse_user_id(user_id: str | None) -> uuid.UUID | None:
+    if user_id is None:
+        return None
+    try:
+        return uuid.UUID(str(user_id))
+    except ValueError:
+        return None
+
+
+_usage_accountant: UsageAccountant | None = None
+_usage_accountant_lock = threading.Lock()
+
+
+def get_usage_accountant(settings: Settings | None = None) -> UsageAccountant | None:
+    """Return the process-wide usage accountant, or None when disabled.
+
+    Args:
+        settings: Application settings (defaults to get_settings())
+
+    Returns:
+        The shared accountant, or None if usage accounting is disabled
+    """
+    global _usage_accountant  # pylint: disable=global-statement
+    settings = settings or get_settings()
+    if getattr(settings, "llm_usage_accounting_enabled", False) is not True:
+        return None
+    if _usage_accountant is None:
+        with _usage_accountant_lock:
+            if _usage_accountant is None:
+                _usage_accountant = UsageAccountant(
+                    max_keys=settings.llm_usage_max_keys,
+                    recent_events=settings.llm_usage_recent_events,
+                    persist=settings.llm_usage_flush_interval_seconds > 0,
+                )
+    return _usage_accountant
+
+
+def reset_usage_accountant() -> None:
+    """Discard the process-wide accountant (used by tests)."""
+    global _usage_accountant  # pylint: disable=global-statement
+    with _usage_accountant_lock:
+        _usage_accountant = None
+
+
+class UsageFlusher(PeriodicTask):
+    """Periodically persists unflushed usage deltas, and once more at shutdown."""
+
+    task_name = "usage-flusher"
+
+    def __init__(
+        self,
+        settings: Settings,
+        interval_seconds: float,
+        session_factory: Callable[[], Session] | None = None,
+    ) -> None:
+        """
+        Initialize the flusher.
+
+        Args:
+            settings: Configuration settings
+            interval_seconds: Time between flushes
+            session_factory: Creates database sessions for each flush
+        """
+        super().__init__(interval_seconds)
+        self.settings = settings
+        self.session_factory = session_factory or default_session_factory
+
+    def start(self) -> bool:
+        """Start flushing in the background of the running event loop."""
+        if get_usage_accountant(self.settings) is None:
+            return False
+        started = super().start()
+        if started:
+            logger.info("LLM usage totals flushed every %ss", self.interval_seconds)
+        return started
+
+    async def stop(self) -> None:
+        """Stop the background task and flush the remaining deltas."""
+        if self._task is None:
+            return
+        await super().stop()
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, self.flush)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Justification: Shutdown must not fail because the database is unavailable
+            logger.error("Final LLM usage flush failed: %s", e)
+
+    def flush(self) -> int:
+        """Flush the unflushed deltas once (blocking)."""
+        accountant = _usage_accountant
+        if accountant is None:
+            return 0
+        db = self.session_factory()
+        try:
+            return accountant.flush(db)
+        finally:
+            db.close()
+
+    def run_once(self) -> int:
+        """Run one flush (blocking); failed deltas are kept and retried."""
+        return self.flush()
@@ -1,30 +1,42 @@
 """User collection service for managing user-collection relationships."""
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import UUID4
 from sqlalchemy.orm import Session
 
+from core.config import Settings
 from core.logging_utils import get_logger
+from rag_solution.core.collection_access_cache import get_collection_access_cache
 from rag_solution.core.exceptions import NotFoundError
 from rag_solution.models.collection import Collection
+from rag_solution.repository.collection_repository import CollectionRepository
 from rag_solution.repository.user_collection_repository import UserCollectionRepository
-from rag_solution.schemas.collection_schema import CollectionOutput
+from rag_solution.schemas.collection_schema import CollectionAccess, CollectionOutput
 from rag_solution.schemas.user_collection_schema import UserCollectionOutput
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
 logger = get_logger(__name__)
 
 
 class UserCollectionService:
     """Service for managing user-collection relationships."""
 
-    def __init__(self: Any, db: Session) -> None:
+    def __init__(
+        self: Any, db: Session, settings: Settings | None = None, async_db: "AsyncSession | None" = None
+    ) -> None:
         """Initialize the UserCollectionService.
 
         Args:
             db (Session): The database session.
+            settings (Settings | None): Application settings, enables the access cache.
+            async_db (AsyncSession | None): Async session for the non-blocking collection listing.
         """
         self.db = db
+        self.settings = settings
+        self.async_db = async_db
         self.user_collection_repository = UserCollectionRepository(db)
 
     def get_user_collections(self, user_id: UUID4) -> list[CollectionOutput]:
@@ -54,6 +66,39 @@ class UserCollectionService:
             collections.append(CollectionOutput.model_validate(collection_data))
         return collections
 
+    async def get_user_collections_async(self, user_id: UUID4) -> list[CollectionOutput]:
+        """Async variant of :meth:`get_user_collections`, read through ``async_db``.
+
+        Args:
+            user_id: The UUID of the user
+
+        Returns:
+            List of CollectionOutput objects for the user
+        """
+        return await CollectionRepository(self.db, async_db=self.async_db).get_user_collections_async(user_id)
+
+    def get_collection_access(self, user_id: UUID4 | None, collection_id: UUID4) -> CollectionAccess | None:
+        """Get whether a user belongs to a collection along with its privacy and status.
+
+        Served from the process-wide access cache when enabled, otherwise from a
+        single primary-key query.
+
+        Args:
+            user_id: The UUID of the user, or None for anonymous checks
+            collection_id: The UUID of the collection
+
+        Returns:
+            CollectionAccess, or None if the collection doesn't exist
+        """
+        cache = get_collection_access_cache(self.settings) if self.settings is not None else None
+        if cache is None:
+            return self.user_collection_repository.get_collection_access(user_id, collection_id)
+        return cache.get_or_load(
+            collection_id,
+            user_id,
+            lambda: self.user_collection_repository.get_collection_access(user_id, collection_id),
+        )
+
     def add_user_to_collection(self, user_id: UUID4, collection_id: UUID4) -> bool:
         """Add a user to a collection.
 
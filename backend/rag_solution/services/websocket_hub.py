@@ -0,0 +1,413 @@
+"""Process-wide hub of WebSocket connections with an optional cross-worker backplane.
+
+Each connection gets a bounded send queue drained by its own sender task, so
+fan-out never waits on a slow client: a connection whose queue overflows, or
+whose send times out, is closed and removed. A user may hold any number of
+connections (one per tab or device).
+
+Messages addressed to a user are delivered to the connections of this worker
+and published on the backplane, which delivers them on every other worker.
+The default backplane uses Postgres LISTEN/NOTIFY; WEBSOCKET_BACKPLANE selects
+``none``, ``postgres`` or a custom ``package.module:ClassName`` implementing
+Backplane.
+"""
+
+import asyncio
+import contextlib
+import importlib
+import json
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from fastapi import WebSocket
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from core.config import Settings, get_settings
+from core.logging_utils import get_logger
+from rag_solution.services.postgres_listener import PostgresListener, default_engine
+
+logger = get_logger("services.websocket_hub")
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more; envelopes are ASCII JSON
+_MAX_FRAGMENT_CHARS = 7900
+_MAX_PARTIAL_MESSAGES = 256
+
+
+class Backplane(ABC):
+    """Carries hub messages between workers."""
+
+    @abstractmethod
+    async def start(self, deliver: Callable[[str], None]) -> None:
+        """Start receiving; ``deliver`` is called on the event loop with each payload published by any worker."""
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Stop receiving and release resources."""
+
+    @abstractmethod
+    async def publish(self, payload: str) -> None:
+        """Publish a payload to every worker."""
+
+
+class PostgresBackplane(Backplane, PostgresListener):
+    """Backplane over Postgres LISTEN/NOTIFY.
+
+    Payloads larger than a NOTIFY allows are split into fragments and
+    reassembled by the receivers. Messages published while a worker is
+    disconnected from Postgres are lost for that worker.
+    """
+
+    listener_name = "websocket-backplane"
+
+    def __init__(
+        self,
+        settings: Settings,
+        engine: Engine | None = None,
+        poll_seconds: float = 1.0,
+        retry_seconds: float = 5.0,
+    ) -> None:
+        """
+        Initialize the backplane.
+
+        Args:
+            settings: Configuration settings
+            engine: Engine to publish and listen with
+            poll_seconds: How often the listening thread checks for shutdown
+            retry_seconds: Delay before reconnecting after a connection failure
+        """
+        PostgresListener.__init__(
+            self, engine or default_engine(), settings.websocket_backplane_channel, poll_seconds, retry_seconds
+        )
+        self._deliver: Callable[[str], None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._partial: OrderedDict[str, list[str | None]] = OrderedDict()
+
+    async def start(self, deliver: Callable[[str], None]) -> None:
+        """Start listening in the background of the running event loop."""
+        if self.engine.dialect.name != "postgresql":
+            logger.warning("WebSocket backplane requires Postgres; messages stay on this worker")
+            return
+        self._deliver = deliver
+        self._loop = asyncio.get_running_loop()
+        self._start_listening()
+        logger.info("WebSocket backplane listening on %s", self.channel)
+
+    async def stop(self) -> None:
+        """Stop the background task and close the listening connection."""
+        await PostgresListener.stop(self)
+
+    async def publish(self, payload: str) -> None:
+        """Publish a payload, split into NOTIFY-sized fragments."""
+        if self._task is None:
+            return
+        message_id = uuid.uuid4().hex[:12]
+        chunks = [payload[i : i + _MAX_FRAGMENT_CHARS] for i in range(0, len(payload), _MAX_FRAGMENT_CHARS)] or [""]
+        fragments = [f"{message_id}:{index}:{len(chunks)}:{chunk}" for index, chunk in enumerate(chunks)]
+        await asyncio.get_running_loop().run_in_executor(None, self._notify, fragments)
+
+    def _notify(self, fragments: list[str]) -> None:
+        with self.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            for fragment in fragments:
+                connection.execute(
+                    text("SELECT pg_notify(:channel, :payload)"), {"channel": self.channel, "payload": fragment}
+                )
+
+    def receive(self, fragment: str) -> None:
+        """Reassemble one received fragment and deliver the payload once complete."""
+        try:
+            message_id, index, count, chunk = fragment.split(":", 3)
+            position, total = int(index), int(count)
+        except ValueError:
+            logger.warning("Ignoring malformed WebSocket backplane payload")
+            return
+        if total == 1:
+            payload = chunk
+        else:
+            parts = self._partial.get(message_id)
+            if parts is None:
+                parts = self._partial[message_id] = [None] * total
+                while len(self._partial) > _MAX_PARTIAL_MESSAGES:
+                    self._partial.popitem(last=False)
+            parts[position] = chunk
+            if any(part is None for part in parts):
+                return
+            del self._partial[message_id]
+            payload = "".join(parts)  # type: ignore[arg-type]
+        if self._deliver is not None:
+            self._deliver(payload)
+
+    def _on_notify(self, payload: str) -> None:
+        # Fragments are reassembled on the event loop, which owns the partial messages
+        self._loop.call_soon_threadsafe(self.receive, payload)  # type: ignore[union-attr]
+
+
+def create_backplane(settings: Settings) -> Backplane | None:
+    """Create the backplane selected by WEBSOCKET_BACKPLANE.
+
+    Args:
+        settings: Configuration settings
+
+    Returns:
+        The backplane, or None when messages stay on this worker
+    """
+    name = (getattr(settings, "websocket_backplane", None) or "none").strip()
+    if name.lower() == "none":
+        return None
+    if name.lower() == "postgres":
+        return PostgresBackplane(settings)
+    module_name, _, class_name = name.partition(":")
+    backplane_class = getattr(importlib.import_module(module_name), class_name)
+    return backplane_class(settings)  # type: ignore[no-any-return]
+
+
+@dataclass(eq=False)
+class _Connection:
+    id: str
+    user_id: str
+    websocket: WebSocket
+    queue: asyncio.Queue[str]
+    sender: asyncio.Task[None] | None = field(default=None, repr=False)
+
+
+class ConnectionHub:
+    """WebSocket connections of this worker, addressed by connection or by user."""
+
+    def __init__(
+        self,
+        queue_size: int = 100,
+        send_timeout_seconds: float = 10.0,
+        backplane: Backplane | None = None,
+    ) -> None:
+        """Initialize the hub.
+
+        Args:
+            queue_size: Maximum number of unsent messages per connection before it is closed
+            send_timeout_seconds: Maximum time for one send before the connection is closed
+            backplane: Carries messages to the other workers
+        """
+        self.queue_size = queue_size
+        self.send_timeout_seconds = send_timeout_seconds
+        self.backplane = backplane
+        self._origin = uuid.uuid4().hex
+        self._connections: dict[str, _Connection] = {}
+        self._by_user: dict[str, set[str]] = {}
+        self._backplane_started = False
+
+        self.evictions = 0
+
+    async def start(self) -> None:
+        """Start receiving messages from the other workers."""
+        if self.backplane is not None and not self._backplane_started:
+            await self.backplane.start(self._receive)
+            self._backplane_started = True
+
+    async def stop(self) -> None:
+        """Stop the backplane and every sender task."""
+        if self.backplane is not None and self._backplane_started:
+            self._backplane_started = False
+            await self.backplane.stop()
+        for connection_id in list(self._connections):
+            await self.disconnect(connection_id)
+
+    async def connect(self, websocket: WebSocket, user_id: str) -> str:
+        """Accept a WebSocket connection and register it.
+
+        Args:
+            websocket: The WebSocket connection
+            user_id: The user ID for this connection
+
+        Returns:
+            ID of the registered connection
+        """
+        await websocket.accept()
+        connection = _Connection(uuid.uuid4().hex, str(user_id), websocket, asyncio.Queue(maxsize=self.queue_size))
+        connection.sender = asyncio.get_running_loop().create_task(
+            self._send_loop(connection), name=f"websocket-sender-{connection.id}"
+        )
+        self._connections[connection.id] = connection
+        self._by_user.setdefault(connection.user_id, set()).add(connection.id)
+        logger.info("WebSocket connection %s established for user %s", connection.id, connection.user_id)
+        return connection.id
+
+    async def disconnect(self, connection_id: str) -> None:
+        """Unregister a connection and stop its sender task (idempotent).
+
+        Args:
+            connection_id: ID returned by connect()
+        """
+        connection = self._remove(connection_id)
+        if connection is None or connection.sender is None or connection.sender is asyncio.current_task():
+            return
+        connection.sender.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await connection.sender
+
+    def send(self, connection_id: str, message: str | dict[str, Any]) -> bool:
+        """Queue a message for one connection of this worker.
+
+        Args:
+            connection_id: ID returned by connect()
+            message: Text or JSON-serializable message
+
+        Returns:
+            Whether the message was queued
+        """
+        connection = self._connections.get(connection_id)
+        if connection is None:
+            return False
+        return self._enqueue(connection, _encode(message))
+
+    async def send_to_user(self, user_id: str, message: str | dict[str, Any]) -> int:
+        """Send a message to every connection of a user on every worker.
+
+        Args:
+            user_id: Target user ID
+            message: Text or JSON-serializable message
+
+        Returns:
+            Number of connections on this worker the message was queued for
+        """
+        payload = _encode(message)
+        delivered = self._deliver_local(str(user_id), payload)
+        await self._publish(str(user_id), payload)
+        return delivered
+
+    async def broadcast(self, message: str | dict[str, Any]) -> int:
+        """Send a message to every connection on every worker.
+
+        Args:
+            message: Text or JSON-serializable message
+
+        Returns:
+            Number of connections on this worker the message was queued for
+        """
+        payload = _encode(message)
+        delivered = self._deliver_local(None, payload)
+        await self._publish(None, payload)
+        return delivered
+
+    def connection_count(self, user_id: str | None = None) -> int:
+        """Return the number of connections on this worker, optionally of one user."""
+        if user_id is None:
+            return len(self._connections)
+        return len(self._by_user.get(str(user_id), ()))
+
+    def _deliver_local(self, user_id: str | None, payload: str) -> int:
+        connection_ids = list(self._connections) if user_id is None else list(self._by_user.get(user_id, ()))
+        delivered = 0
+        for connection_id in connection_ids:
+            connection = self._connections.get(connection_id)
+            if connection is not None and self._enqueue(connection, payload):
+                delivered += 1
+        return delivered
+
+    def _enqueue(self, connection: _Connection, payload: str) -> bool:
+        try:
+            connection.queue.put_nowait(payload)
+            return True
+        except asyncio.QueueFull:
+            self._evict(connection, "send queue full")
+            return False
+
+    async def _publish(self, user_id: str | None, payload: str) -> None:
+        if self.backplane is None or not self._backplane_started:
+            return
+        envelope = json.dumps({"origin": self._origin, "user_id": user_id, "message": payload})
+        try:
+            await self.backplane.publish(envelope)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Justification: Local connections already have the message; other workers miss it
+            logger.warning("Failed to publish WebSocket message to other workers: %s", e)
+
+    def _receive(self, envelope: str) -> None:
+        try:
+            data = json.loads(envelope)
+        except json.JSONDecodeError:
+            logger.warning("Ignoring malformed WebSocket backplane message")
+            return
+        if data.get("origin") == self._origin:
+            return
+        self._deliver_local(data.get("user_id"), data.get("message", ""))
+
+    async def _send_loop(self, connection: _Connection) -> None:
+        while True:
+            payload = await connection.queue.get()
+            try:
+                await asyncio.wait_for(connection.websocket.send_text(payload), timeout=self.send_timeout_seconds)
+            except TimeoutError:
+                self._evict(connection, "send timed out")
+                return
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # Justification: Any send failure means the socket is gone
+                logger.info("WebSocket connection %s closed: %s", connection.id, e)
+                self._remove(connection.id)
+                return
+
+    def _evict(self, connection: _Connection, reason: str) -> None:
+        """Drop a slow consumer and close its socket in the background."""
+        if self._remove(connection.id) is None:
+            return
+        self.evictions += 1
+        logger.warning("Closing slow WebSocket connection %s of user %s: %s", connection.id, connection.user_id, reason)
+        if connection.sender is not None and connection.sender is not asyncio.current_task():
+            connection.sender.cancel()
+        asyncio.get_running_loop().create_task(self._close(connection.websocket, reason))
+
+    @staticmethod
+    async def _close(websocket: WebSocket, reason: str) -> None:
+        with contextlib.suppress(Exception):
+            await websocket.close(code=1013, reason=reason)
+
+    def _remove(self, connection_id: str) -> _Connection | None:
+        connection = self._connections.pop(connection_id, None)
+        if connection is None:
+            return None
+        user_connections = self._by_user.get(connection.user_id)
+        if user_connections is not None:
+            user_connections.discard(connection_id)
+            if not user_connections:
+                del self._by_user[connection.user_id]
+        return connection
+
+
+def _encode(message: str | dict[str, Any]) -> str:
+    return message if isinstance(message, str) else json.dumps(message)
+
+
+_connection_hub: ConnectionHub | None = None
+_connection_hub_lock = threading.Lock()
+
+
+def get_connection_hub(settings: Settings | None = None) -> ConnectionHub:
+    """Return the process-wide connection hub.
+
+    Args:
+        settings: Application settings (defaults to get_settings())
+
+    Returns:
+        The shared hub
+    """
+    global _connection_hub  # pylint: disable=global-statement
+    if _connection_hub is None:
+        with _connection_hub_lock:
+            if _connection_hub is None:
+                settings = settings or get_settings()
+                _connection_hub = ConnectionHub(
+                    queue_size=settings.websocket_send_queue_size,
+                    send_timeout_seconds=settings.websocket_send_timeout_seconds,
+                    backplane=create_backplane(settings),
+                )
+    return _connection_hub
+
+
+def reset_connection_hub() -> None:
+    """Discard the process-wide hub (used by tests)."""
+    global _connection_hub  # pylint: disable=global-statement
+    with _connection_hub_lock:
+        _connection_hub = None
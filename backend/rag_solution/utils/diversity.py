@@ -0,0 +1,150 @@
+"""
+Near-duplicate suppression and maximal marginal relevance for retrieved chunks.
+
+Retrieval frequently returns the same passage several times (overlapping
+chunks, documents ingested twice, boilerplate repeated on every page), which
+wastes reranking work and context tokens. This module provides the vectorized
+building blocks of the diversity stage:
+
+1. 64-bit SimHash fingerprints of each chunk's word shingles
+2. Near-duplicate detection by pairwise Hamming distance of the fingerprints
+3. Maximal marginal relevance (MMR) selection over chunk vectors
+
+Everything here is pure computation over the candidate set; the pipeline
+wiring lives in DiversityStage.
+"""
+
+import hashlib
+import re
+from collections.abc import Sequence
+
+import numpy as np
+
+# Number of bits of a SimHash fingerprint
+SIMHASH_BITS = 64
+
+# Word n-gram size hashed into the fingerprint
+SHINGLE_SIZE = 3
+
+_WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def _shingle_hashes(text: str) -> np.ndarray:
+    words = _WORD_PATTERN.findall(text.lower())
+    if len(words) >= SHINGLE_SIZE:
+        shingles = [" ".join(words[i : i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+    else:
+        shingles = [" ".join(words)] if words else []
+    digests = b"".join(hashlib.blake2b(shingle.encode(), digest_size=8).digest() for shingle in shingles)
+    return np.frombuffer(digests, dtype=np.uint8).reshape(-1, 8)
+
+
+def simhash_fingerprints(texts: Sequence[str]) -> np.ndarray:
+    """
+    Compute SimHash fingerprints of texts.
+
+    Each word shingle is hashed to 64 bits; a fingerprint bit is set when the
+    majority of the text's shingles have it set, so texts sharing most of their
+    shingles get fingerprints with a small Hamming distance.
+
+    Args:
+        texts: Texts to fingerprint
+
+    Returns:
+        Boolean matrix of shape ``(len(texts), SIMHASH_BITS)`` (all False for empty texts)
+    """
+    fingerprints = np.zeros((len(texts), SIMHASH_BITS), dtype=bool)
+    for row, text in enumerate(texts):
+        hashes = _shingle_hashes(text)
+        if len(hashes):
+            bits = np.unpackbits(hashes, axis=1).astype(np.int32)
+            fingerprints[row] = 2 * bits.sum(axis=0) > len(hashes)
+    return fingerprints
+
+
+def hamming_distances(fingerprints: np.ndarray) -> np.ndarray:
+    """Pairwise Hamming distances between fingerprints, shape ``(n, n)``."""
+    packed = np.packbits(fingerprints, axis=1)
+    differing = np.bitwise_xor(packed[:, None, :], packed[None, :, :])
+    return np.unpackbits(differing, axis=2).sum(axis=2)
+
+
+def near_duplicate_mask(texts: Sequence[str], max_distance: int = 3) -> np.ndarray:
+    """
+    Flag texts that nearly duplicate an earlier text.
+
+    Texts are expected in relevance order, so the first occurrence of each
+    group of near-duplicates is kept. Empty texts are never flagged.
+
+    Args:
+        texts: Texts in relevance order
+        max_distance: Maximum Hamming distance between fingerprints of near-duplicates
+
+    Returns:
+        Boolean array, True for texts to drop
+    """
+    count = len(texts)
+    if count < 2:
+        return np.zeros(count, dtype=bool)
+
+    fingerprints = simhash_fingerprints(texts)
+    empty = np.array([_WORD_PATTERN.search(text) is None for text in texts])
+    close = hamming_distances(fingerprints) <= max_distance
+    close[empty, :] = False
+    close[:, empty] = False
+    # Only earlier texts can make a later one a duplicate
+    close &= np.tri(count, k=-1, dtype=bool)
+
+    duplicate = np.zeros(count, dtype=bool)
+    for row in range(1, count):
+        duplicate[row] = bool((close[row] & ~duplicate).any())
+    return duplicate
+
+
+def mmr_select(
+    vectors: np.ndarray,
+    relevance: Sequence[float],
+    lambda_mult: float = 0.7,
+    top_k: int | None = None,
+) -> list[int]:
+    """
+    Order candidates by maximal marginal relevance.
+
+    Each step picks the candidate maximizing
+    ``lambda_mult * relevance - (1 - lambda_mult) * max similarity to the picked ones``.
+    Relevance is min-max scaled to [0, 1] so it is comparable to cosine similarity.
+
+    Args:
+        vectors: Candidate vectors, shape ``(n, dim)``
+        relevance: Relevance score of each candidate
+        lambda_mult: Trade-off between relevance (1.0) and diversity (0.0)
+        top_k: Number of candidates to select (None selects all)
+
+    Returns:
+        Indices of the selected candidates in selection order
+    """
+    count = len(vectors)
+    if count == 0:
+        return []
+    top_k = count if top_k is None else max(0, min(top_k, count))
+
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    unit = vectors / norms
+    similarity = unit @ unit.T
+
+    scores = np.asarray(relevance, dtype=np.float64)
+    spread = scores.max() - scores.min()
+    scores = (scores - scores.min()) / spread if spread > 0 else np.ones(count)
+
+    selected: list[int] = []
+    available = np.ones(count, dtype=bool)
+    max_similarity = np.full(count, -np.inf)
+    for _ in range(top_k):
+        penalty = np.where(np.isfinite(max_similarity), max_similarity, 0.0)
+        objective = np.where(available, lambda_mult * scores - (1.0 - lambda_mult) * penalty, -np.inf)
+        pick = int(np.argmax(objective))
+        selected.append(pick)
+        available[pick] = False
+        max_similarity = np.maximum(max_similarity, similarity[:, pick])
+    return selected
@@ -0,0 +1,171 @@
+"""
+Topic planning for map-reduce podcast script generation.
+
+Long podcasts used to be generated with a single LLM call covering every
+retrieved chunk. This module splits the retrieved content into topic segments
+so each segment's dialogue can be generated independently and concurrently:
+
+1. Chunks are embedded as hashed TF-IDF term vectors (or provided embeddings)
+2. Deterministic spherical k-means groups them into one cluster per segment
+3. Segments are ordered by the retrieval rank of their most relevant chunk
+4. The target word count is distributed over the segments
+
+Everything here is pure computation; the LLM calls live in PodcastService.
+"""
+
+import math
+import re
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from rag_solution.utils.term_vectors import normalize_rows, term_vectors, tokenize
+
+# Maximum k-means refinement iterations
+KMEANS_ITERATIONS = 20
+
+# Share of each segment's word budget that is split evenly rather than by content size
+EVEN_BUDGET_SHARE = 0.5
+
+_DOCUMENT_PATTERN = re.compile(r"^\[Document \d+\]: ", re.MULTILINE)
+
+
+@dataclass
+class TopicSegment:
+    """A group of related chunks covered by one part of the podcast."""
+
+    index: int
+    chunks: list[str]
+    keywords: list[str]
+    word_budget: int
+    title: str = field(default="")
+
+    @property
+    def label(self) -> str:
+        """Title of the segment, falling back to its keywords."""
+        return self.title or ", ".join(self.keywords[:3]) or f"Part {self.index + 1}"
+
+
+def split_rag_results(rag_results: str) -> list[str]:
+    """
+    Split formatted RAG results back into chunk texts.
+
+    Args:
+        rag_results: Results formatted as ``[Document N]: text`` blocks
+
+    Returns:
+        Chunk texts in retrieval order (the whole input if it has no markers)
+    """
+    parts = [part.strip() for part in _DOCUMENT_PATTERN.split(rag_results)]
+    return [part for part in parts if part]
+
+
+def cluster_chunks(vectors: np.ndarray, num_clusters: int) -> list[list[int]]:
+    """
+    Group chunk vectors with deterministic spherical k-means.
+
+    Centroids are seeded farthest-first starting from the most relevant chunk,
+    so the same input always produces the same clusters.
+
+    Args:
+        vectors: L2-normalized chunk vectors in retrieval order
+        num_clusters: Number of clusters to produce
+
+    Returns:
+        Non-empty clusters of chunk indices, ordered by their best-ranked chunk
+    """
+    count = len(vectors)
+    num_clusters = max(1, min(num_clusters, count))
+    if num_clusters == 1:
+        return [list(range(count))]
+
+    seeds = [0]
+    distance = 1.0 - vectors @ vectors[0]
+    while len(seeds) < num_clusters:
+        candidate = int(np.argmax(distance))
+        seeds.append(candidate)
+        distance = np.minimum(distance, 1.0 - vectors @ vectors[candidate])
+    centroids = vectors[seeds].copy()
+
+    assignment = np.full(count, -1)
+    for _ in range(KMEANS_ITERATIONS):
+        new_assignment = np.argmax(vectors @ centroids.T, axis=1)
+        if np.array_equal(new_assignment, assignment):
+            break
+        assignment = new_assignment
+        for cluster in range(num_clusters):
+            members = vectors[assignment == cluster]
+            if len(members):
+                centroids[cluster] = members.sum(axis=0)
+        centroids = normalize_rows(centroids)
+
+    clusters = [sorted(np.flatnonzero(assignment == cluster).tolist()) for cluster in range(num_clusters)]
+    return sorted((cluster for cluster in clusters if cluster), key=lambda members: members[0])
+
+
+def top_keywords(chunks: Sequence[str], limit: int = 5) -> list[str]:
+    """Most frequent content words of a group of chunks."""
+    counts = Counter(token for chunk in chunks for token in set(tokenize(chunk)))
+    return [token for token, _ in counts.most_common(limit)]
+
+
+def allocate_word_budgets(sizes: Sequence[int], total_words: int) -> list[int]:
+    """
+    Split a word count over segments, half evenly and half by content size.
+
+    Args:
+        sizes: Content size of each segment (e.g. characters)
+        total_words: Target word count of the whole script
+
+    Returns:
+        Word budget of each segment, summing to ``total_words``
+    """
+    if not sizes:
+        return []
+    total_size = sum(sizes) or 1
+    shares = [EVEN_BUDGET_SHARE / len(sizes) + (1 - EVEN_BUDGET_SHARE) * size / total_size for size in sizes]
+    budgets = [int(total_words * share) for share in shares]
+    budgets[0] += total_words - sum(budgets)
+    return budgets
+
+
+def plan_topic_segments(
+    chunks: Sequence[str],
+    total_words: int,
+    segment_words: int,
+    embeddings: Sequence[Sequence[float]] | None = None,
+) -> list[TopicSegment]:
+    """
+    Plan the topic segments of a podcast script.
+
+    Args:
+        chunks: Retrieved chunk texts in retrieval order
+        total_words: Target word count of the whole script
+        segment_words: Target word count of one segment
+        embeddings: Optional chunk embeddings used instead of term vectors
+
+    Returns:
+        Segments in podcast order (a single segment for short scripts)
+    """
+    if not chunks:
+        return []
+
+    num_segments = max(1, min(math.ceil(total_words / max(segment_words, 1)), len(chunks)))
+    if embeddings is not None and len(embeddings) == len(chunks):
+        vectors = normalize_rows(np.asarray(embeddings, dtype=np.float32))
+    else:
+        vectors = term_vectors(chunks)
+
+    clusters = cluster_chunks(vectors, num_segments)
+    budgets = allocate_word_budgets([sum(len(chunks[i]) for i in members) for members in clusters], total_words)
+    return [
+        TopicSegment(
+            index=position,
+            chunks=[chunks[i] for i in members],
+            keywords=top_keywords([chunks[i] for i in members]),
+            word_budget=budget,
+        )
+        for position, (members, budget) in enumerate(zip(clusters, budgets, strict=True))
+    ]
@@ -0,0 +1,66 @@
+"""
+Hashed TF-IDF term vectors for short texts.
+
+A dependency-free stand-in for embeddings when chunk vectors are not
+available: podcast topic planning clusters chunks with them, and the
+diversity stage falls back to them for MMR when the vector store returned
+no stored vectors.
+"""
+
+import hashlib
+import math
+import re
+from collections import Counter
+from collections.abc import Sequence
+
+import numpy as np
+
+# Dimension of the hashed term vectors
+HASH_FEATURES = 2048
+
+_TOKEN_PATTERN = re.compile(r"[^\W\d_]{3,}", re.UNICODE)
+
+_STOPWORDS_TEXT = (
+    "the and for are but not you all any can had her was one our out has him his how its may new now old "
+    "see two way who did get let put say she too use that with have this will your from they know want "
+    "been good much some time very when come here just like long make many more only over such take than "
+    "them well were what which their there these those into also about would could should other after "
+    "first where while because between through during before under each most both being does"
+)
+_STOPWORDS = frozenset(_STOPWORDS_TEXT.split())
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens without stopwords and very short words."""
+    return [token for token in _TOKEN_PATTERN.findall(text.lower()) if token not in _STOPWORDS]
+
+
+def _feature(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode(), digest_size=4).digest(), "little") % HASH_FEATURES
+
+
+def term_vectors(chunks: Sequence[str]) -> np.ndarray:
+    """
+    Build L2-normalized hashed TF-IDF vectors for chunks.
+
+    Args:
+        chunks: Chunk texts
+
+    Returns:
+        Matrix of shape ``(len(chunks), HASH_FEATURES)``
+    """
+    counts = [Counter(tokenize(chunk)) for chunk in chunks]
+    document_frequency = Counter(token for count in counts for token in count)
+    vectors = np.zeros((len(chunks), HASH_FEATURES), dtype=np.float32)
+    for row, count in enumerate(counts):
+        for token, tf in count.items():
+            idf = math.log((1 + len(chunks)) / (1 + document_frequency[token])) + 1.0
+            vectors[row, _feature(token)] += (1.0 + math.log(tf)) * idf
+    return normalize_rows(vectors)
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """Scale each row to unit L2 norm, leaving all-zero rows unchanged."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
@@ -27,6 +27,7 @@ from .data_types import (
     Source,
     VectorDBResponse,
     VectorSearchRequest,
+    has_embeddings,
 )
 from .error_types import CollectionError, DocumentError, VectorStoreError
 from .utils.embeddings import get_embeddings_for_vector_store
@@ -160,9 +161,15 @@ class ChromaDBStore(VectorStore):
             for chunk in chunks:
                 docs.append(chunk.text)
                 embeddings.append(chunk.embeddings)  # EmbeddedChunk ensures embeddings are present
+                parent_chunk_id = chunk.parent_chunk_id or (chunk.metadata.parent_chunk_id if chunk.metadata else None)
                 metadata: MetadataType = {
-                    "source": str(chunk.metadata.source) if chunk.metadata and chunk.metadata.source else "OTHER",
+                    # Store the enum value so _convert_to_chunk can parse it back into a Source
+                    "source": Source(chunk.metadata.source).value
+                    if chunk.metadata and chunk.metadata.source
+                    else Source.OTHER.value,
                     "document_id": chunk.document_id or "",
+                    # ChromaDB metadata values cannot be None, so the key is only set for child chunks
+                    **({"parent_chunk_id": parent_chunk_id} if parent_chunk_id else {}),
                 }
                 metadatas.append(metadata)
                 ids.append(chunk.chunk_id)
@@ -199,7 +206,7 @@ class ChromaDBStore(VectorStore):
             for document in documents:
                 for chunk in document.chunks:
                     # Only add chunks that have embeddings
-                    if chunk.embeddings:
+                    if chunk.embeddings is not None and has_embeddings(chunk.embeddings):
                         embedded_chunk = EmbeddedChunk(
                             chunk_id=chunk.chunk_id,
                             text=chunk.text,
@@ -253,7 +260,7 @@ class ChromaDBStore(VectorStore):
             collection = self._client.get_collection(request.collection_id)
 
             # Get query vector (either from request or generate from text)
-            if request.query_vector:
+            if request.query_vector is not None and has_embeddings(request.query_vector):
                 query_embedding = request.query_vector
             elif request.query_text:
                 embeddings_list = get_embeddings_for_vector_store(request.query_text, settings=self.settings)
@@ -310,9 +317,15 @@ class ChromaDBStore(VectorStore):
             logging.error("Failed to query ChromaDB collection '%s': %s", collection_name, str(e))
             raise DocumentError(f"Failed to query ChromaDB collection '{collection_name}': {e}") from e
 
-    def delete_collection(self, collection_name: str) -> None:
-        """Deletes a collection from the vector store."""
+    def _delete_collection_impl(self, collection_name: str) -> None:
+        """Implementation-specific collection deletion for ChromaDB.
+
+        Args:
+            collection_name: Name of collection to delete
 
+        Raises:
+            CollectionError: If deletion fails
+        """
         try:
             self._client.delete_collection(collection_name)
             logging.info("Deleted collection '%s'", collection_name)
@@ -320,6 +333,10 @@ class ChromaDBStore(VectorStore):
             logging.error("Failed to delete ChromaDB collection: %s", str(e))
             raise CollectionError(f"Failed to delete ChromaDB collection: {e}") from e
 
+    def delete_collection(self, collection_name: str) -> None:
+        """Deletes a collection from the vector store."""
+        self._delete_collection_impl(collection_name)
+
     def delete_documents_with_response(
         self, collection_name: str, document_ids: list[str]
     ) -> VectorDBResponse[dict[str, Any]]:
@@ -408,10 +425,44 @@ class ChromaDBStore(VectorStore):
                 f"Failed to count chunks for document '{document_id}' in collection '{collection_name}': {e}"
             ) from e
 
+    def get_chunks_by_ids(self, collection_name: str, chunk_ids: list[str]) -> list[DocumentChunk]:
+        """Fetch chunks by chunk ID with a single ``collection.get(ids=...)`` call.
+
+        Args:
+            collection_name: Name of the collection to fetch from
+            chunk_ids: IDs of the chunks to fetch
+
+        Returns:
+            The chunks found (missing IDs are skipped)
+
+        Raises:
+            CollectionError: If collection doesn't exist
+            DocumentError: If the lookup fails
+        """
+        if not chunk_ids:
+            return []
+        try:
+            collection = self._client.get_collection(collection_name)
+            response = collection.get(ids=list(dict.fromkeys(chunk_ids)), include=["documents", "metadatas"])
+        except (ValueError, KeyError, AttributeError) as e:
+            logging.warning("Collection '%s' not found or error accessing: %s", collection_name, str(e))
+            raise CollectionError(f"Collection '{collection_name}' not found: {e}") from e
+        except Exception as e:
+            logging.warning("Error fetching chunks by ID from collection %s: %s", collection_name, str(e))
+            raise DocumentError(f"Failed to fetch chunks by ID from collection '{collection_name}': {e}") from e
+
+        documents = response.get("documents") or []
+        metadatas = response.get("metadatas") or []
+        return [
+            self._convert_to_chunk(chunk_id=chunk_id, text=documents[i], embeddings=None, metadata=metadatas[i])
+            for i, chunk_id in enumerate(response.get("ids", []))
+        ]
+
     def _convert_to_chunk(
-        self, chunk_id: str, text: str, embeddings: list[float] | None, metadata: dict
+        self, chunk_id: str, text: str, embeddings: list[float] | None, metadata: Mapping[str, Any]
     ) -> DocumentChunk:
         """Convert ChromaDB response data to DocumentChunk."""
+        parent_chunk_id = metadata.get("parent_chunk_id")
         return DocumentChunk(
             chunk_id=chunk_id,
             text=text,
@@ -419,8 +470,10 @@ class ChromaDBStore(VectorStore):
             metadata=DocumentChunkMetadata(
                 source=Source(metadata["source"]) if metadata["source"] else Source.OTHER,
                 document_id=metadata["document_id"],
+                parent_chunk_id=parent_chunk_id,
             ),
             document_id=metadata["document_id"],
+            parent_chunk_id=parent_chunk_id,
         )
 
     def _process_search_results(self, response: Any, collection_name: str) -> list[QueryResult]:  # noqa: ARG002
@@ -444,6 +497,7 @@ class ChromaDBStore(VectorStore):
                 embeddings=base_chunk.embeddings,
                 metadata=base_chunk.metadata,
                 document_id=base_chunk.document_id,
+                parent_chunk_id=base_chunk.parent_chunk_id,
                 score=1.0 - distances[i],
             )
             results.append(QueryResult(chunk=chunk, score=1.0 - distances[i], embeddings=[]))
@@ -2,16 +2,122 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import datetime
 from enum import Enum
-from typing import Any, TypeVar
-
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Annotated, Any, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PlainSerializer,
+    PlainValidator,
+    TypeAdapter,
+    WithJsonSchema,
+    field_validator,
+)
 
 # Simplified embedding type
 Embedding = float
 Embeddings = list[float]
 EmbeddingsList = list[Embeddings]  # List of embeddings
+EmbeddingArray = npt.NDArray[np.float32]  # Compact float32 embedding buffer
+EmbeddingLike = EmbeddingArray | Sequence[float]  # Any embedding accepted by the helpers below
+
+_FLOAT_LIST_ADAPTER: TypeAdapter[list[float]] = TypeAdapter(list[float])
+
+
+def _validate_embedding_vector(value: Any) -> Embeddings | EmbeddingArray:
+    """Validate an embedding given as a float list or a 1-D NumPy array.
+
+    Lists are validated element by element as before. Arrays are kept as compact
+    float32 buffers (3 KB for a 768-dim vector instead of ~25 KB of boxed floats)
+    and are not copied when they already have the right dtype, so rows of a batch
+    matrix stay views into one contiguous allocation.
+    """
+    if isinstance(value, np.ndarray):
+        if value.ndim != 1:
+            raise ValueError(f"Embedding array must be 1-D, got shape {value.shape}")
+        return value.astype(np.float32, copy=False)
+    return _FLOAT_LIST_ADAPTER.validate_python(value)
+
+
+def embedding_to_list(value: EmbeddingLike) -> Embeddings:
+    """Return an embedding as a plain float list for JSON-based vector DB clients."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return value if isinstance(value, list) else list(value)
+
+
+# Field type for embeddings on models: accepts list[float] or float32 np.ndarray
+EmbeddingVector = Annotated[
+    Embeddings | EmbeddingArray,
+    PlainValidator(_validate_embedding_vector),
+    PlainSerializer(embedding_to_list),
+    WithJsonSchema({"type": "array", "items": {"type": "number"}}),
+]
+
+
+def has_embeddings(value: EmbeddingLike | None) -> bool:
+    """Return True if an embedding is present and non-empty.
+
+    Use instead of plain truthiness, which is ambiguous for NumPy arrays.
+    """
+    return value is not None and len(value) > 0
+
+
+def to_embedding_matrix(embeddings: Sequence[EmbeddingLike] | EmbeddingArray) -> EmbeddingArray:
+    """Pack embeddings into one contiguous 2-D float32 matrix.
+
+    Args:
+        embeddings: Embedding vectors (lists, arrays or an existing matrix)
+
+    Returns:
+        C-contiguous float32 array of shape (n, dim)
+
+    Raises:
+        ValueError: If the vectors are empty or have inconsistent dimensions
+    """
+    if isinstance(embeddings, np.ndarray):
+        matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+    else:
+        if any(not has_embeddings(vector) for vector in embeddings):
+            raise ValueError("Embeddings cannot be empty")
+        try:
+            matrix = np.asarray(embeddings, dtype=np.float32)
+        except ValueError as e:
+            raise ValueError(f"Embeddings have inconsistent dimensions: {e}") from e
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1) if matrix.size else matrix.reshape(0, 0)
+    if matrix.ndim != 2:
+        raise ValueError(f"Embedding matrix must be 2-D, got shape {matrix.shape}")
+    return matrix
+
+
+def cosine_similarity_matrix(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Compute pairwise cosine similarities between the rows of two matrices.
+
+    Zero-norm rows get a similarity of 0.0 instead of NaN.
+
+    Args:
+        left: Array of shape (n, dim)
+        right: Array of shape (m, dim)
+
+    Returns:
+        Array of shape (n, m)
+    """
+    left = to_embedding_matrix(left)
+    right = to_embedding_matrix(right)
+    if left.shape[1] != right.shape[1]:
+        raise ValueError(f"Vectors must have same length: {left.shape[1]} != {right.shape[1]}")
+    left_norms = np.linalg.norm(left, axis=1, keepdims=True)
+    right_norms = np.linalg.norm(right, axis=1, keepdims=True)
+    left_unit = np.divide(left, left_norms, out=np.zeros_like(left), where=left_norms > 0)
+    right_unit = np.divide(right, right_norms, out=np.zeros_like(right), where=right_norms > 0)
+    return left_unit @ right_unit.T
 
 
 class Source(str, Enum):
@@ -136,8 +242,8 @@ class DocumentChunk(BaseModel):
 
     chunk_id: str | None = None
     text: str | None = None
-    embeddings: Embeddings | None = None
-    vectors: Embeddings | None = None  # Alias for embeddings
+    embeddings: EmbeddingVector | None = None
+    vectors: EmbeddingVector | None = None  # Alias for embeddings
     metadata: DocumentChunkMetadata | None = None
     document_id: str | None = None
     parent_chunk_id: str | None = None  # Hierarchical chunking support
@@ -243,7 +349,7 @@ class VectorQuery(BaseModel):
     """
 
     text: str
-    embeddings: Embeddings | None = None  # Pre-computed if available
+    embeddings: EmbeddingVector | None = None  # Pre-computed if available
     metadata_filter: DocumentMetadataFilter | None = None
     number_of_results: int = 10  # Default to 10 results
 
@@ -262,7 +368,7 @@ class QueryResult(BaseModel):
 
     chunk: DocumentChunkWithScore | None = None
     score: float | None = None
-    embeddings: Embeddings | None = None
+    embeddings: EmbeddingVector | None = None
 
     @property
     def data(self) -> list[DocumentChunkWithScore]:
@@ -300,17 +406,17 @@ class QueryWithEmbedding(BaseModel):
     """
 
     text: str
-    embeddings: Embeddings
+    embeddings: EmbeddingVector
 
     model_config = ConfigDict(from_attributes=True)
 
     @property
-    def vectors(self) -> Embeddings:
+    def vectors(self) -> Embeddings | EmbeddingArray:
         """Alias for embeddings."""
         return self.embeddings
 
     @vectors.setter
-    def vectors(self, value: Embeddings) -> None:
+    def vectors(self, value: Embeddings | EmbeddingArray) -> None:
         """Set vectors (updates embeddings)."""
         self.embeddings = value
 
@@ -326,18 +432,18 @@ class EmbeddedChunk(DocumentChunk):
         All other attributes inherited from DocumentChunk
     """
 
-    embeddings: Embeddings = Field(..., description="Required vector embedding for this chunk")
+    embeddings: EmbeddingVector = Field(..., description="Required vector embedding for this chunk")
 
     @field_validator("embeddings")
     @classmethod
-    def validate_embeddings_not_empty(cls, v: Embeddings) -> Embeddings:
+    def validate_embeddings_not_empty(cls, v: Embeddings | EmbeddingArray) -> Embeddings | EmbeddingArray:
         """Ensure embeddings list is not empty."""
-        if not v:
+        if not has_embeddings(v):
             raise ValueError("Embeddings cannot be empty")
         return v
 
     @classmethod
-    def from_chunk(cls, chunk: DocumentChunk, embeddings: Embeddings | None = None) -> EmbeddedChunk:
+    def from_chunk(cls, chunk: DocumentChunk, embeddings: Embeddings | EmbeddingArray | None = None) -> EmbeddedChunk:
         """Convert a DocumentChunk to an EmbeddedChunk.
 
         Args:
@@ -350,8 +456,8 @@ class EmbeddedChunk(DocumentChunk):
         Raises:
             ValueError: If embeddings are not available
         """
-        emb = embeddings or chunk.embeddings
-        if not emb:
+        emb = embeddings if has_embeddings(embeddings) else chunk.embeddings
+        if emb is None or not has_embeddings(emb):
             raise ValueError("Cannot create EmbeddedChunk without embeddings")
 
         return cls(
@@ -432,7 +538,7 @@ class DocumentIngestionRequest(BaseModel):
         """
         embedded_chunks = []
         for chunk in self.chunks:
-            if chunk.embeddings:
+            if has_embeddings(chunk.embeddings):
                 embedded_chunks.append(EmbeddedChunk.from_chunk(chunk))
         return embedded_chunks
 
@@ -464,7 +570,7 @@ class VectorSearchRequest(BaseModel):
     """
 
     query_text: str | None = Field(default=None, description="Text query to search for")
-    query_vector: Embeddings | None = Field(default=None, description="Pre-computed query embedding")
+    query_vector: EmbeddingVector | None = Field(default=None, description="Pre-computed query embedding")
     collection_id: str = Field(..., description="Collection to search in")
     top_k: int = Field(default=10, ge=1, le=100, description="Number of results to return")
     metadata_filter: DocumentMetadataFilter | None = Field(default=None, description="Optional metadata filtering")
@@ -482,7 +588,7 @@ class VectorSearchRequest(BaseModel):
 
     def model_post_init(self, __context: Any) -> None:
         """Validate that at least one query type is provided."""
-        if not self.query_text and not self.query_vector:
+        if not self.query_text and not has_embeddings(self.query_vector):
             raise ValueError("Either query_text or query_vector must be provided")
 
     def to_vector_query(self) -> VectorQuery:
@@ -15,6 +15,7 @@ from core.config import Settings, get_settings
 from .data_types import (
     CollectionConfig,
     Document,
+    DocumentChunk,
     DocumentChunkMetadata,
     DocumentChunkWithScore,
     DocumentMetadataFilter,
@@ -24,6 +25,8 @@ from .data_types import (
     Source,
     VectorDBResponse,
     VectorSearchRequest,
+    embedding_to_list,
+    has_embeddings,
 )
 from .error_types import CollectionError, DocumentError, VectorStoreError
 from .utils.embeddings import get_embeddings_for_vector_store
@@ -184,13 +187,15 @@ class ElasticSearchStore(VectorStore):
             for chunk in chunks:
                 doc_body = {
                     "text": chunk.text,
-                    "embeddings": chunk.embeddings,  # EmbeddedChunk ensures embeddings are present
+                    "embeddings": embedding_to_list(chunk.embeddings),  # EmbeddedChunk ensures embeddings are present
                     "metadata": {
                         "source": str(chunk.metadata.source) if chunk.metadata and chunk.metadata.source else "OTHER",
                         "document_id": chunk.document_id or "",
                     },
                     "document_id": chunk.document_id,
                     "chunk_id": chunk.chunk_id,
+                    "parent_chunk_id": chunk.parent_chunk_id
+                    or (chunk.metadata.parent_chunk_id if chunk.metadata else None),
                 }
 
                 try:
@@ -227,7 +232,7 @@ class ElasticSearchStore(VectorStore):
             for document in documents:
                 for chunk in document.chunks:
                     # Only add chunks that have embeddings
-                    if chunk.embeddings:
+                    if chunk.embeddings is not None and has_embeddings(chunk.embeddings):
                         embedded_chunk = EmbeddedChunk(
                             chunk_id=chunk.chunk_id,
                             text=chunk.text,
@@ -286,7 +291,7 @@ class ElasticSearchStore(VectorStore):
         """
         try:
             # Get query vector (either from request or generate from text)
-            if request.query_vector:
+            if request.query_vector is not None and has_embeddings(request.query_vector):
                 query_embedding = request.query_vector
             elif request.query_text:
                 embeddings_list = get_embeddings_for_vector_store(request.query_text, settings=self.settings)
@@ -303,7 +308,7 @@ class ElasticSearchStore(VectorStore):
                         "query": {"match_all": {}},
                         "script": {
                             "source": "cosineSimilarity(params.query_vector, 'embeddings') + 1.0",
-                            "params": {"query_vector": query_embedding},
+                            "params": {"query_vector": embedding_to_list(query_embedding)},
                         },
                     }
                 },
@@ -460,6 +465,33 @@ class ElasticSearchStore(VectorStore):
                 f"Failed to count chunks for document '{document_id}' in collection '{collection_name}': {e}"
             ) from e
 
+    def get_chunks_by_ids(self, collection_name: str, chunk_ids: list[str]) -> list[DocumentChunk]:
+        """Fetch chunks by chunk ID (the document ``_id``) with a single multi-get request.
+
+        Args:
+            collection_name: Name of the collection to fetch from
+            chunk_ids: IDs of the chunks to fetch
+
+        Returns:
+            The chunks found (missing IDs are skipped)
+
+        Raises:
+            CollectionError: If collection doesn't exist
+            DocumentError: If the lookup fails
+        """
+        if not chunk_ids:
+            return []
+        try:
+            response = self.client.mget(index=collection_name, body={"ids": list(dict.fromkeys(chunk_ids))})
+        except NotFoundError as e:
+            logging.warning("Collection '%s' not found", collection_name)
+            raise CollectionError(f"Collection '{collection_name}' not found") from e
+        except Exception as e:
+            logging.warning("Error fetching chunks by ID from collection %s: %s", collection_name, str(e))
+            raise DocumentError(f"Failed to fetch chunks by ID from collection '{collection_name}': {e}") from e
+
+        return [self._convert_to_chunk(doc["_source"]) for doc in response.get("docs", []) if doc.get("found")]
+
     def _create_collection_if_not_exists(self, collection_name: str) -> None:
         """Create a collection if it doesn't exist."""
         try:
@@ -475,20 +507,27 @@ class ElasticSearchStore(VectorStore):
         for hit in hits:
             source = hit["_source"]
             score = hit["_score"]
+            chunk = self._convert_to_chunk(source)
 
-            # Create DocumentChunkWithScore
-            chunk = DocumentChunkWithScore(
-                chunk_id=source["chunk_id"],
-                text=source["text"],
-                embeddings=source["embeddings"],
-                metadata=DocumentChunkMetadata(
-                    source=Source(source["metadata"]["source"]) if source["metadata"]["source"] else Source.OTHER,
-                    document_id=source["metadata"]["document_id"],
-                ),
-                document_id=source["document_id"],
-                score=score,
+            results.append(
+                QueryResult(chunk=DocumentChunkWithScore(**chunk.model_dump(), score=score), score=score, embeddings=[])
             )
 
-            results.append(QueryResult(chunk=chunk, score=score, embeddings=[]))
-
         return results
+
+    @staticmethod
+    def _convert_to_chunk(source: dict[str, Any]) -> DocumentChunk:
+        """Convert an Elasticsearch document source to DocumentChunk."""
+        parent_chunk_id = source.get("parent_chunk_id")
+        return DocumentChunk(
+            chunk_id=source["chunk_id"],
+            text=source["text"],
+            embeddings=source["embeddings"],
+            metadata=DocumentChunkMetadata(
+                source=Source(source["metadata"]["source"]) if source["metadata"]["source"] else Source.OTHER,
+                document_id=source["metadata"]["document_id"],
+                parent_chunk_id=parent_chunk_id,
+            ),
+            document_id=source["document_id"],
+            parent_chunk_id=parent_chunk_id,
+        )
@@ -9,6 +9,7 @@ import logging
 import time
 from typing import Any
 
+import numpy as np
 from pymilvus import Collection, CollectionSchema, DataType, FieldSchema, MilvusException, connections, utility
 
 from core.config import Settings, get_settings
@@ -16,6 +17,7 @@ from core.config import Settings, get_settings
 from .data_types import (
     CollectionConfig,
     Document,
+    DocumentChunk,
     DocumentChunkMetadata,
     DocumentChunkWithScore,
     DocumentMetadataFilter,
@@ -25,15 +27,27 @@ from .data_types import (
     Source,
     VectorDBResponse,
     VectorSearchRequest,
+    has_embeddings,
+    to_embedding_matrix,
 )
 from .error_types import CollectionError, DocumentError, VectorStoreError
 from .utils.embeddings import get_embeddings_for_vector_store
+from .utils.retrieval_cache import get_retrieval_cache
 from .vector_store import VectorStore
 
 logger = logging.getLogger(__name__)
 
 # Remove module-level constants - use dependency injection instead
 
+# Scalar field holding the parent chunk ID of hierarchical chunks
+PARENT_CHUNK_FIELD = "parent_chunk_id"
+
+# Rows fetched per page when counting chunks with a query iterator
+COUNT_BATCH_SIZE = 1000
+
+# Output fields returned for every chunk
+CHUNK_OUTPUT_FIELDS = ["document_id", "text", "chunk_id", "source", "page_number", "chunk_number", "document_name"]
+
 
 def _create_schema(settings: Settings) -> list[FieldSchema]:
     """Create the schema for Milvus collection with injected settings."""
@@ -49,9 +63,19 @@ def _create_schema(settings: Settings) -> list[FieldSchema]:
         FieldSchema(name="source", dtype=DataType.VARCHAR, max_length=20),
         FieldSchema(name="page_number", dtype=DataType.INT64),
         FieldSchema(name="chunk_number", dtype=DataType.INT64),
+        # Hierarchical chunking: lets retrieval resolve a child's parent chunk by ID
+        FieldSchema(name=PARENT_CHUNK_FIELD, dtype=DataType.VARCHAR, max_length=100),
     ]
 
 
+def _has_parent_field(collection: Collection) -> bool:
+    """Whether a collection stores parent chunk IDs (collections created before the field was added do not)."""
+    try:
+        return any(field.name == PARENT_CHUNK_FIELD for field in collection.schema.fields)
+    except (AttributeError, TypeError):
+        return False
+
+
 class MilvusStore(VectorStore):
     """Milvus implementation of the VectorStore interface.
 
@@ -73,6 +97,14 @@ class MilvusStore(VectorStore):
         self.index_params = {"metric_type": "COSINE", "index_type": "IVF_FLAT", "params": {"nlist": 1024}}
         self.search_params = {"metric_type": "COSINE", "params": {"nprobe": 10}}
 
+        # Process-wide retrieval cache (None when disabled)
+        self.retrieval_cache = get_retrieval_cache(self.settings)
+
+    def _invalidate_retrieval_cache(self, collection_name: str) -> None:
+        """Bump the collection version so cached search results are no longer served."""
+        if self.retrieval_cache is not None:
+            self.retrieval_cache.bump_version(collection_name)
+
     def _connect(self, attempts: int = 3) -> None:
         """Connect to Milvus with retry logic and connection reuse.
 
@@ -247,6 +279,7 @@ class MilvusStore(VectorStore):
             page_numbers = []
             chunk_numbers = []
             document_names = []
+            parent_chunk_ids = []
 
             for chunk in chunks:
                 document_ids.append(chunk.document_id or "")
@@ -262,23 +295,28 @@ class MilvusStore(VectorStore):
                 )
                 # Extract document name from metadata if available
                 document_names.append(getattr(chunk.metadata, "title", "") if chunk.metadata else "")
+                parent_chunk_ids.append(
+                    chunk.parent_chunk_id or (chunk.metadata.parent_chunk_id if chunk.metadata else None) or ""
+                )
 
-            # Insert data
-            collection.insert(
-                [
-                    document_ids,
-                    embeddings,
-                    texts,
-                    chunk_ids,
-                    document_names,
-                    sources,
-                    page_numbers,
-                    chunk_numbers,
-                ]
-            )
+            # Insert data; vectors go to pymilvus as one contiguous float32 matrix
+            columns = [
+                document_ids,
+                to_embedding_matrix(embeddings),
+                texts,
+                chunk_ids,
+                document_names,
+                sources,
+                page_numbers,
+                chunk_numbers,
+            ]
+            if _has_parent_field(collection):
+                columns.append(parent_chunk_ids)
+            collection.insert(columns)
 
             # Flush to ensure data is written
             collection.flush()
+            self._invalidate_retrieval_cache(collection_name)
 
             logging.info("Successfully added %d chunks to collection '%s'", len(chunks), collection_name)
             return chunk_ids
@@ -305,7 +343,7 @@ class MilvusStore(VectorStore):
             for document in documents:
                 for chunk in document.chunks:
                     # Only add chunks that have embeddings
-                    if chunk.embeddings:
+                    if chunk.embeddings is not None and has_embeddings(chunk.embeddings):
                         embedded_chunk = EmbeddedChunk(
                             chunk_id=chunk.chunk_id,
                             text=chunk.text,
@@ -394,7 +432,7 @@ class MilvusStore(VectorStore):
             collection = self._get_collection(request.collection_id)
 
             # Get query vector (either from request or generate from text)
-            if request.query_vector:
+            if request.query_vector is not None and has_embeddings(request.query_vector):
                 query_embedding = request.query_vector
             elif request.query_text:
                 embeddings_list = get_embeddings_for_vector_store(request.query_text, settings=self.settings)
@@ -404,6 +442,21 @@ class MilvusStore(VectorStore):
             else:
                 raise ValueError("Either query_text or query_vector must be provided")
 
+            # Serve repeated searches from the retrieval cache without a Milvus round trip
+            cache_key = None
+            if self.retrieval_cache is not None:
+                cache_key = self.retrieval_cache.make_key(
+                    request.collection_id,
+                    query_embedding,
+                    request.top_k,
+                    request.metadata_filter,
+                    include_vectors=request.include_vectors,
+                )
+                cached = self.retrieval_cache.get(cache_key, request.collection_id)
+                if cached is not None:
+                    logger.debug("Retrieval cache hit for collection '%s'", request.collection_id)
+                    return cached
+
             # Perform search
             results = collection.search(
                 data=[query_embedding],
@@ -411,13 +464,9 @@ class MilvusStore(VectorStore):
                 param=self.search_params,
                 limit=request.top_k,
                 output_fields=[
-                    "document_id",
-                    "text",
-                    "chunk_id",
-                    "source",
-                    "page_number",
-                    "chunk_number",
-                    "document_name",
+                    *CHUNK_OUTPUT_FIELDS,
+                    *([PARENT_CHUNK_FIELD] if _has_parent_field(collection) else []),
+                    *([self.settings.embedding_field] if request.include_vectors else []),
                 ],
             )
 
@@ -431,7 +480,12 @@ class MilvusStore(VectorStore):
             else:
                 logger.debug("Milvus search returned results (non-list type)")
 
-            return self._process_search_results(results, request.collection_id)
+            query_results = self._process_search_results(
+                results, request.collection_id, include_vectors=request.include_vectors
+            )
+            if self.retrieval_cache is not None and cache_key is not None:
+                self.retrieval_cache.put(cache_key, request.collection_id, query_results)
+            return query_results
         except Exception as e:
             logging.error("Failed to search Milvus collection '%s': %s", request.collection_id, str(e))
             raise VectorStoreError(f"Failed to search Milvus collection '{request.collection_id}': {e}") from e
@@ -466,7 +520,8 @@ class MilvusStore(VectorStore):
                 top_k=number_of_results,
                 metadata_filter=metadata_filter,
                 include_metadata=True,
-                include_vectors=False,
+                # Stored vectors let the diversity stage compare chunks without re-embedding them
+                include_vectors=getattr(self.settings, "diversity_enabled", False) is True,
             )
 
             # Use Pydantic-based implementation
@@ -487,6 +542,7 @@ class MilvusStore(VectorStore):
         try:
             if utility.has_collection(collection_name):
                 utility.drop_collection(collection_name)
+                self._invalidate_retrieval_cache(collection_name)
                 logging.info("Deleted collection '%s'", collection_name)
         except Exception as e:
             logging.error("Failed to delete Milvus collection: %s", str(e))
@@ -547,6 +603,7 @@ class MilvusStore(VectorStore):
 
             # Flush to ensure deletion is applied
             collection.flush()
+            self._invalidate_retrieval_cache(collection_name)
 
             elapsed = time.time() - start_time
             logging.info(
@@ -608,14 +665,10 @@ class MilvusStore(VectorStore):
             # Use JSON encoding for proper string escaping
             escaped_doc_id = json.dumps(document_id)
 
-            # Query with expression filter for document_id
-            results = collection.query(
-                expr=f"document_id == {escaped_doc_id}",
-                output_fields=["id"],  # Only need count, minimal fields
-                limit=10000,  # Max chunks per document
-            )
+            # count(*) is evaluated server side, so large documents are not truncated by a query limit
+            results = collection.query(expr=f"document_id == {escaped_doc_id}", output_fields=["count(*)"])
 
-            chunk_count = len(results) if results else 0
+            chunk_count = int(results[0]["count(*)"]) if results else 0
             logging.debug("Found %d chunks for document %s in collection %s", chunk_count, document_id, collection_name)
             return chunk_count
 
@@ -630,7 +683,116 @@ class MilvusStore(VectorStore):
                 f"Failed to count chunks for document '{document_id}' in collection '{collection_name}': {e}"
             ) from e
 
-    def _process_search_results(self, results: Any, collection_name: str) -> list[QueryResult]:  # noqa: ARG002
+    def count_chunks_by_document(self, collection_name: str, document_ids: list[str]) -> dict[str, int]:
+        """Count the chunks of several documents in one pass over the collection.
+
+        Pages through the ``document_id`` field of the requested documents with a
+        query iterator, so the collection is queried once instead of once per
+        document and no query result limit applies.
+
+        Args:
+            collection_name: Name of the collection to count in
+            document_ids: The document IDs to count chunks for
+
+        Returns:
+            Number of chunks per requested document ID (0 for documents without chunks)
+
+        Raises:
+            CollectionError: If collection doesn't exist
+            DocumentError: If counting fails
+        """
+        counts = dict.fromkeys(document_ids, 0)
+        if not counts:
+            return counts
+        try:
+            collection = self._get_collection(collection_name)
+            iterator = collection.query_iterator(
+                batch_size=COUNT_BATCH_SIZE,
+                # JSON encoding escapes the IDs and yields a valid Milvus list literal
+                expr=f"document_id in {json.dumps(list(counts))}",
+                output_fields=["document_id"],
+            )
+            try:
+                while batch := iterator.next():
+                    for row in batch:
+                        document_id = row.get("document_id")
+                        if document_id in counts:
+                            counts[document_id] += 1
+            finally:
+                iterator.close()
+            logging.debug(
+                "Counted %d chunks for %d documents in collection %s",
+                sum(counts.values()),
+                len(counts),
+                collection_name,
+            )
+            return counts
+
+        except CollectionError:
+            raise
+        except Exception as e:
+            logging.warning("Error counting chunks in collection %s: %s", collection_name, str(e))
+            raise DocumentError(f"Failed to count chunks in collection '{collection_name}': {e}") from e
+
+    def get_chunks_by_ids(self, collection_name: str, chunk_ids: list[str]) -> list[DocumentChunk]:
+        """Fetch chunks by chunk ID with a single ``chunk_id in [...]`` query.
+
+        Args:
+            collection_name: Name of the collection to fetch from
+            chunk_ids: IDs of the chunks to fetch
+
+        Returns:
+            The chunks found (missing IDs are skipped)
+
+        Raises:
+            CollectionError: If collection doesn't exist
+            DocumentError: If the lookup fails
+        """
+        if not chunk_ids:
+            return []
+        try:
+            collection = self._get_collection(collection_name)
+            has_parent = _has_parent_field(collection)
+
+            # JSON encoding escapes the IDs inside the filter expression
+            rows = collection.query(
+                expr=f"chunk_id in {json.dumps(list(dict.fromkeys(chunk_ids)))}",
+                output_fields=[*CHUNK_OUTPUT_FIELDS, *([PARENT_CHUNK_FIELD] if has_parent else [])],
+            )
+
+            chunks = []
+            for row in rows or []:
+                source = row.get("source") or "other"
+                parent_chunk_id = row.get(PARENT_CHUNK_FIELD) or None
+                chunks.append(
+                    DocumentChunk(
+                        chunk_id=row.get("chunk_id"),
+                        text=row.get("text", ""),
+                        metadata=DocumentChunkMetadata(
+                            source=Source(source.lower().replace("source.", "")),
+                            document_id=row.get("document_id"),
+                            page_number=row.get("page_number"),
+                            chunk_number=row.get("chunk_number"),
+                            parent_chunk_id=parent_chunk_id,
+                        ),
+                        document_id=row.get("document_id"),
+                        parent_chunk_id=parent_chunk_id,
+                    )
+                )
+            logging.debug("Fetched %d of %d chunks from collection %s", len(chunks), len(chunk_ids), collection_name)
+            return chunks
+        except CollectionError:
+            raise
+        except Exception as e:
+            logging.warning("Error fetching chunks by ID from collection %s: %s", collection_name, str(e))
+            raise DocumentError(f"Failed to fetch chunks by ID from collection '{collection_name}': {e}") from e
+
+    def _process_search_results(
+        self,
+        results: Any,
+        collection_name: str,  # noqa: ARG002
+        include_vectors: bool = False,
+    ) -> list[QueryResult]:
         """Process Milvus search results into QueryResult objects."""
         query_results = []
 
@@ -647,23 +809,33 @@ class MilvusStore(VectorStore):
             source = getattr(entity, "source", "OTHER")
             page_number = getattr(entity, "page_number", 0)
             chunk_number = getattr(entity, "chunk_number", 0)
+            parent_chunk_id = getattr(entity, PARENT_CHUNK_FIELD, None)
+            parent_chunk_id = parent_chunk_id if isinstance(parent_chunk_id, str) and parent_chunk_id else None
+            vector = getattr(entity, self.settings.embedding_field, None) if include_vectors else None
+            embeddings = np.asarray(vector, dtype=np.float32) if vector is not None else None
 
             # Create DocumentChunkWithScore
             chunk = DocumentChunkWithScore(
                 chunk_id=chunk_id,
                 text=text,
-                embeddings=None,  # Milvus doesn't return embeddings in search results
+                embeddings=embeddings,  # Only returned when the request includes vectors
                 metadata=DocumentChunkMetadata(
                     source=Source(source.lower().replace("source.", "") if source else "other"),
                     document_id=document_id,
                     page_number=page_number,
                     chunk_number=chunk_number,
+                    parent_chunk_id=parent_chunk_id,
                 ),
                 document_id=document_id,
+                parent_chunk_id=parent_chunk_id,
                 score=float(hit.score),
             )
 
-            query_results.append(QueryResult(chunk=chunk, score=float(hit.score), embeddings=[]))
+            query_results.append(
+                QueryResult(
+                    chunk=chunk, score=float(hit.score), embeddings=embeddings if embeddings is not None else []
+                )
+            )
 
             # DEBUG: Log each processed result (first 3 only)
             if idx <= 3:
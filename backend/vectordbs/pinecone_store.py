@@ -15,6 +15,7 @@ from core.config import Settings, get_settings
 from .data_types import (
     CollectionConfig,
     Document,
+    DocumentChunk,
     DocumentChunkMetadata,
     DocumentChunkWithScore,
     DocumentMetadataFilter,
@@ -24,6 +25,8 @@ from .data_types import (
     Source,
     VectorDBResponse,
     VectorSearchRequest,
+    embedding_to_list,
+    has_embeddings,
 )
 from .error_types import CollectionError, DocumentError, VectorStoreError
 from .utils.embeddings import get_embeddings_for_vector_store
@@ -148,10 +151,11 @@ class PineconeStore(VectorStore):
             chunk_ids = []
 
             for chunk in chunks:
+                parent_chunk_id = chunk.parent_chunk_id or (chunk.metadata.parent_chunk_id if chunk.metadata else None)
                 vectors.append(
                     {
                         "id": chunk.chunk_id,
-                        "values": chunk.embeddings,  # EmbeddedChunk ensures embeddings are present
+                        "values": embedding_to_list(chunk.embeddings),  # EmbeddedChunk ensures embeddings are present
                         "metadata": {
                             "text": chunk.text,
                             "document_id": chunk.document_id or "",
@@ -160,6 +164,8 @@ class PineconeStore(VectorStore):
                             else "OTHER",
                             "page_number": chunk.metadata.page_number if chunk.metadata else 0,
                             "chunk_number": chunk.metadata.chunk_number if chunk.metadata else 0,
+                            # Pinecone metadata values cannot be null, so the key is only set for child chunks
+                            **({"parent_chunk_id": parent_chunk_id} if parent_chunk_id else {}),
                         },
                     }
                 )
@@ -193,7 +199,7 @@ class PineconeStore(VectorStore):
             for document in documents:
                 for chunk in document.chunks:
                     # Only add chunks that have embeddings
-                    if chunk.embeddings:
+                    if chunk.embeddings is not None and has_embeddings(chunk.embeddings):
                         embedded_chunk = EmbeddedChunk(
                             chunk_id=chunk.chunk_id,
                             text=chunk.text,
@@ -256,7 +262,7 @@ class PineconeStore(VectorStore):
             index = self.pc.Index(request.collection_id)
 
             # Get query vector (either from request or generate from text)
-            if request.query_vector:
+            if request.query_vector is not None and has_embeddings(request.query_vector):
                 query_embedding = request.query_vector
             elif request.query_text:
                 embeddings_list = get_embeddings_for_vector_store(request.query_text, settings=self.settings)
@@ -267,7 +273,7 @@ class PineconeStore(VectorStore):
                 raise ValueError("Either query_text or query_vector must be provided")
 
             # Perform query
-            results = index.query(vector=query_embedding, top_k=request.top_k, include_metadata=True)
+            results = index.query(vector=embedding_to_list(query_embedding), top_k=request.top_k, include_metadata=True)
 
             logging.info("Pinecone search complete for collection '%s'", request.collection_id)
             return self._process_search_results(results, request.collection_id)
@@ -443,28 +449,61 @@ class PineconeStore(VectorStore):
                 f"Failed to count chunks for document '{document_id}' in collection '{collection_name}': {e}"
             ) from e
 
+    def get_chunks_by_ids(self, collection_name: str, chunk_ids: list[str]) -> list[DocumentChunk]:
+        """Fetch chunks by chunk ID (the vector ID) with a single fetch request.
+
+        Args:
+            collection_name: Name of the collection to fetch from
+            chunk_ids: IDs of the chunks to fetch
+
+        Returns:
+            The chunks found (missing IDs are skipped)
+
+        Raises:
+            DocumentError: If the lookup fails
+        """
+        if not chunk_ids:
+            return []
+        try:
+            index = self.pc.Index(collection_name)
+            response = index.fetch(ids=list(dict.fromkeys(chunk_ids)))
+            vectors = response["vectors"]
+            return [
+                self._convert_to_chunk(chunk_id, vector.get("metadata") or {}) for chunk_id, vector in vectors.items()
+            ]
+        except Exception as e:
+            logging.warning("Error fetching chunks by ID from collection %s: %s", collection_name, str(e))
+            raise DocumentError(f"Failed to fetch chunks by ID from collection '{collection_name}': {e}") from e
+
     def _process_search_results(self, results: Any, collection_name: str) -> list[QueryResult]:  # noqa: ARG002
         """Process Pinecone search results into QueryResult objects."""
         query_results = []
 
         for match in results["matches"]:
-            metadata = match.get("metadata", {})
-
-            # Create DocumentChunkWithScore
-            chunk = DocumentChunkWithScore(
-                chunk_id=match["id"],
-                text=metadata.get("text", ""),
-                embeddings=None,  # Pinecone doesn't return embeddings in search results
-                metadata=DocumentChunkMetadata(
-                    source=Source(metadata.get("source", "OTHER")),
-                    document_id=metadata.get("document_id", ""),
-                    page_number=metadata.get("page_number", 0),
-                    chunk_number=metadata.get("chunk_number", 0),
-                ),
-                document_id=metadata.get("document_id", ""),
-                score=float(match["score"]),
-            )
+            chunk = self._convert_to_chunk(match["id"], match.get("metadata", {}))
+            score = float(match["score"])
 
-            query_results.append(QueryResult(chunk=chunk, score=float(match["score"]), embeddings=[]))
+            # Pinecone doesn't return embeddings in search results
+            query_results.append(
+                QueryResult(chunk=DocumentChunkWithScore(**chunk.model_dump(), score=score), score=score, embeddings=[])
+            )
 
         return query_results
+
+    @staticmethod
+    def _convert_to_chunk(chunk_id: str, metadata: dict[str, Any]) -> DocumentChunk:
+        """Convert a Pinecone vector ID and metadata to DocumentChunk."""
+        parent_chunk_id = metadata.get("parent_chunk_id")
+        return DocumentChunk(
+            chunk_id=chunk_id,
+            text=metadata.get("text", ""),
+            metadata=DocumentChunkMetadata(
+                source=Source(metadata.get("source", "OTHER")),
+                document_id=metadata.get("document_id", ""),
+                page_number=metadata.get("page_number", 0),
+                chunk_number=metadata.get("chunk_number", 0),
+                parent_chunk_id=parent_chunk_id,
+            ),
+            document_id=metadata.get("document_id", ""),
+            parent_chunk_id=parent_chunk_id,
+        )
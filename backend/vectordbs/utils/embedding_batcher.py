@@ -0,0 +1,126 @@
+"""Cross-request micro-batching for embedding calls.
+
+Each search embeds its query with a separate remote call, so N concurrent
+searches pay N round trips. ``EmbeddingBatcher`` collects requests that arrive
+within a short window (or until ``max_batch_size`` texts are pending), sends
+them to the provider as one batched call and hands each caller its own slice
+of the result.
+
+The batcher is leader-based and needs no background thread: the first caller
+to find no batch in progress waits for the window to close, makes the call on
+behalf of everybody that joined, and the others simply block on their futures.
+Every caller blocks its thread, so async code reaches it through worker threads
+(the retrieval stage runs retrieval with ``asyncio.to_thread``).
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+
+from vectordbs.data_types import EmbeddingsList
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingBatcher:
+    """Thread-safe micro-batcher in front of an embedding function."""
+
+    def __init__(
+        self,
+        embed_fn: Callable[[list[str]], EmbeddingsList],
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            embed_fn: Function embedding a list of texts in one call
+            max_batch_size: Number of pending texts that triggers an immediate flush
+            max_wait_ms: Maximum time a request waits for others to join its batch
+        """
+        self.embed_fn = embed_fn
+        self.max_batch_size = max(max_batch_size, 1)
+        self.max_wait_seconds = max_wait_ms / 1000
+
+        self._cond = threading.Condition()
+        self._pending: list[tuple[list[str], Future[EmbeddingsList]]] = []
+        self._pending_texts = 0
+        self._collecting = False
+
+        self.calls = 0
+        self.requests = 0
+
+    def embed(self, texts: list[str]) -> EmbeddingsList:
+        """Embed texts, sharing a provider call with concurrent requests.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One embedding per input text, in order
+
+        Raises:
+            Exception: Whatever the embedding function raised for the shared batch
+        """
+        future: Future[EmbeddingsList] = Future()
+        with self._cond:
+            self._pending.append((texts, future))
+            self._pending_texts += len(texts)
+            self.requests += 1
+            is_leader = not self._collecting
+            if is_leader:
+                self._collecting = True
+            elif self._pending_texts >= self.max_batch_size:
+                self._cond.notify_all()
+
+        if is_leader:
+            self._collect_and_run()
+        return future.result()
+
+    def _collect_and_run(self) -> None:
+        """Wait for the batching window, then embed everything that joined."""
+        batch: list[tuple[list[str], Future[EmbeddingsList]]] = []
+        try:
+            deadline = time.monotonic() + self.max_wait_seconds
+            with self._cond:
+                try:
+                    while self._pending_texts < self.max_batch_size:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                finally:
+                    batch, self._pending, self._pending_texts = self._pending, [], 0
+                    # The next request starts a new batch while this one is in flight
+                    self._collecting = False
+                    self.calls += 1
+
+            self._run_batch(batch)
+        finally:
+            # A leader interrupted by a BaseException (e.g. cancellation) must not strand its followers
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError("Embedding batch was interrupted before completing"))
+
+    def _run_batch(self, batch: list[tuple[list[str], Future[EmbeddingsList]]]) -> None:
+        """Embed a collected batch and hand each caller its slice."""
+        all_texts = [text for texts, _ in batch for text in texts]
+        try:
+            embeddings = self.embed_fn(all_texts)
+            if len(embeddings) != len(all_texts):
+                raise ValueError(f"Expected {len(all_texts)} embeddings, got {len(embeddings)}")
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Justification: Every caller of the shared batch gets the original error
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        if len(batch) > 1:
+            logger.debug("Embedded %d requests (%d texts) in one call", len(batch), len(all_texts))
+
+        offset = 0
+        for texts, future in batch:
+            future.set_result(embeddings[offset : offset + len(texts)])
+            offset += len(texts)
@@ -5,6 +5,10 @@ eliminating code duplication and ensuring consistent behavior.
 """
 
 import logging
+import threading
+from collections import OrderedDict
+from functools import partial
+from typing import Any
 
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -12,10 +16,20 @@ from core.config import Settings
 from core.custom_exceptions import LLMProviderError
 from rag_solution.file_management.database import create_session_factory
 from rag_solution.generation.providers.factory import LLMProviderFactory
+from vectordbs.utils.embedding_batcher import EmbeddingBatcher
 
 logger = logging.getLogger(__name__)
 
 
+# Settings that change how a batcher embeds; Settings objects that agree on them share a batcher
+_BATCHER_SETTINGS = ("embedding_model", "embedding_batch_size", "embedding_micro_batch_wait_ms")
+# Upper bound on distinct provider configurations kept, least recently used first out
+MAX_EMBEDDING_BATCHERS = 8
+
+_batchers: OrderedDict[tuple[Any, ...], EmbeddingBatcher] = OrderedDict()
+_batchers_lock = threading.Lock()
+
+
 def get_embeddings_for_vector_store(
     text: str | list[str], settings: Settings, provider_name: str | None = None
 ) -> list[list[float]]:
@@ -25,6 +39,12 @@ def get_embeddings_for_vector_store(
     This is a utility function for vector stores to access embedding functionality
     without requiring complex dependency injection.
 
+    Small requests such as search queries go through a process-wide micro-batcher
+    (when ``embedding_micro_batch_enabled`` is set) so concurrent searches share a
+    single provider call. Large requests are sent directly. The batcher blocks the
+    calling thread for up to ``embedding_micro_batch_wait_ms``, so async callers
+    must call this from a worker thread (e.g. ``asyncio.to_thread``).
+
     Args:
         text: Single text string or list of text strings to embed
         settings: Settings object containing configuration
@@ -38,6 +58,47 @@ def get_embeddings_for_vector_store(
         SQLAlchemyError: If database-related errors occur
         Exception: If other unexpected errors occur
     """
+    # Use provided provider name, fall back to settings, default to watsonx
+    provider_name = provider_name or getattr(settings, "llm_provider_name", None) or "watsonx"
+
+    batcher = _get_batcher(settings, provider_name)
+    texts = [text] if isinstance(text, str) else text
+    if batcher is not None and texts and len(texts) < batcher.max_batch_size:
+        return batcher.embed(texts)
+
+    return _embed_with_provider(text, settings, provider_name)
+
+
+def _get_batcher(settings: Settings, provider_name: str) -> EmbeddingBatcher | None:
+    """Return the shared micro-batcher for a provider configuration, or None when disabled."""
+    if getattr(settings, "embedding_micro_batch_enabled", False) is not True:
+        return None
+    key = (provider_name, *(getattr(settings, name, None) for name in _BATCHER_SETTINGS))
+    with _batchers_lock:
+        batcher = _batchers.get(key)
+        if batcher is not None:
+            _batchers.move_to_end(key)
+            return batcher
+        batcher = EmbeddingBatcher(
+            partial(_embed_with_provider, settings=settings, provider_name=provider_name),
+            max_batch_size=settings.embedding_batch_size,
+            max_wait_ms=settings.embedding_micro_batch_wait_ms,
+        )
+        _batchers[key] = batcher
+        while len(_batchers) > MAX_EMBEDDING_BATCHERS:
+            # Requests already waiting on an evicted batcher still complete through it
+            _batchers.popitem(last=False)
+        return batcher
+
+
+def reset_embedding_batchers() -> None:
+    """Discard the shared micro-batchers (used by tests)."""
+    with _batchers_lock:
+        _batchers.clear()
+
+
+def _embed_with_provider(text: str | list[str], settings: Settings, provider_name: str) -> list[list[float]]:
+    """Embed text with a single provider call."""
     # Create session and get embeddings in one clean flow
     session_factory = create_session_factory()
     db = None  # Initialize to None to prevent NameError in finally block
@@ -45,8 +106,7 @@ def get_embeddings_for_vector_store(
     try:
         db = session_factory()
         factory = LLMProviderFactory(db, settings)
-        # Use provided provider name, fall back to settings, default to watsonx
-        provider = factory.get_provider(provider_name or getattr(settings, "llm_provider_name", "watsonx"))
+        provider = factory.get_provider(provider_name)
         return provider.get_embeddings(text)
     except LLMProviderError as e:
         logger.error("LLM provider error during embedding generation: %s", e)
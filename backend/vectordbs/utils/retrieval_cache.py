@@ -0,0 +1,211 @@
+"""In-process retrieval result cache shared by vector store implementations.
+
+The same chunks are frequently retrieved more than once: within one request
+(podcast multi-strategy retrieval, CoT sub-questions, reranking) and across
+requests (conversation follow-ups). This module keeps two bounded LRU maps:
+
+- a *result* cache mapping ``(collection, top_k, filter, include_vectors, quantized
+  query vector)`` to the ordered ``(chunk_id, score, embeddings)`` triples returned
+  by the vector store; embeddings are only kept for searches that asked for them
+- a *chunk* cache mapping ``(collection, chunk_id)`` to the chunk text and metadata
+
+Entries are tagged with a per-collection version counter. Any ingest or delete
+against a collection bumps its version, which makes every cached result for that
+collection unreachable without having to scan the cache.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any
+
+import numpy as np
+
+from core.config import Settings
+from core.versioned_cache import MISSING, VersionedTTLCache
+from vectordbs.data_types import (
+    DocumentChunkWithScore,
+    DocumentMetadataFilter,
+    EmbeddingArray,
+    EmbeddingLike,
+    Embeddings,
+    QueryResult,
+)
+
+# Query vectors are quantized to this many steps per unit before hashing so that
+# float noise between two embeddings of the same text does not defeat the cache.
+DEFAULT_QUANTIZATION_STEPS = 1024
+
+
+class RetrievalCache(VersionedTTLCache[list[tuple[str, float, Embeddings | EmbeddingArray]]]):
+    """Bounded, thread-safe cache of vector search results and chunk payloads.
+
+    Scopes are collection names. Results are stored in the versioned LRU of the
+    base class; chunk payloads are kept in a separate LRU shared by all results.
+    """
+
+    cache_name = "Retrieval cache"
+
+    def __init__(
+        self,
+        max_results: int = 1024,
+        max_chunks: int = 16384,
+        ttl_seconds: float = 300.0,
+        quantization_steps: int = DEFAULT_QUANTIZATION_STEPS,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_results: Maximum number of cached search results
+            max_chunks: Maximum number of cached chunk payloads
+            ttl_seconds: Lifetime of a cached search result (0 disables expiry)
+            quantization_steps: Quantization resolution for query vectors
+        """
+        super().__init__(max_results, ttl_seconds)
+        self.max_results = max_results
+        self.max_chunks = max_chunks
+        self.quantization_steps = quantization_steps
+
+        self._chunks: OrderedDict[tuple[str, str], DocumentChunkWithScore] = OrderedDict()
+
+    def _on_bump(self, scope: str) -> None:
+        # Deleted chunk ids may be reused on re-ingestion, so the collection's payloads go too
+        for key in [key for key in self._chunks if key[0] == scope]:
+            del self._chunks[key]
+
+    # Keys
+
+    def make_key(
+        self,
+        collection_name: str,
+        query_vector: EmbeddingLike,
+        top_k: int,
+        metadata_filter: DocumentMetadataFilter | None = None,
+        include_vectors: bool = False,
+    ) -> str:
+        """Build a cache key for a vector search.
+
+        Args:
+            collection_name: Collection being searched
+            query_vector: Query embedding
+            top_k: Number of requested results
+            metadata_filter: Optional metadata filter applied to the search
+            include_vectors: Whether the search returns chunk vectors
+
+        Returns:
+            Hex digest identifying the search at the collection's current version
+        """
+        quantized = np.rint(np.asarray(query_vector, dtype=np.float32) * self.quantization_steps).astype(np.int32)
+        digest = hashlib.blake2b(quantized.tobytes(), digest_size=16)
+        filter_part = metadata_filter.model_dump_json() if metadata_filter else ""
+        version = self.get_version(collection_name)
+        digest.update(f"|{collection_name}|{top_k}|{filter_part}|{int(include_vectors)}|{version}".encode())
+        return digest.hexdigest()
+
+    # Lookups
+
+    def get(self, key: str, collection_name: str) -> list[QueryResult] | None:
+        """Return cached results for a key, or None on a miss.
+
+        A result only counts as a hit when every referenced chunk payload is still
+        cached; otherwise the caller has to go back to the vector store anyway.
+        """
+        cache_key = (collection_name, key)
+        with self._lock:
+            entries = self._lookup(cache_key, self._versions.get(collection_name, 0))
+            if entries is MISSING:
+                self.misses += 1
+                return None
+
+            results: list[QueryResult] = []
+            for chunk_id, score, embeddings in entries:
+                chunk = self._chunks.get((collection_name, chunk_id))
+                if chunk is None:
+                    del self._entries[cache_key]
+                    self.misses += 1
+                    return None
+                self._chunks.move_to_end((collection_name, chunk_id))
+                results.append(
+                    QueryResult(chunk=chunk.model_copy(update={"score": score}), score=score, embeddings=embeddings)
+                )
+
+            self.hits += 1
+            return results
+
+    def put(self, key: str, collection_name: str, results: list[QueryResult]) -> None:
+        """Store search results and their chunk payloads."""
+        chunks = [result.chunk for result in results]
+        if any(chunk is None or not chunk.chunk_id for chunk in chunks):
+            # Results without a stable id cannot be reassembled from the chunk cache
+            return
+
+        entries: list[tuple[str, float, Embeddings | EmbeddingArray]] = []
+        with self._lock:
+            for result in results:
+                chunk_id = str(result.chunk.chunk_id)  # type: ignore[union-attr]
+                embeddings = result.embeddings if result.embeddings is not None else []
+                entries.append((chunk_id, float(result.score or 0.0), embeddings))
+                self._chunks[(collection_name, chunk_id)] = result.chunk  # type: ignore[assignment]
+                self._chunks.move_to_end((collection_name, chunk_id))
+
+            self._store((collection_name, key), self._versions.get(collection_name, 0), entries)
+            while len(self._chunks) > self.max_chunks:
+                self._chunks.popitem(last=False)
+
+    def get_chunk(self, collection_name: str, chunk_id: str) -> DocumentChunkWithScore | None:
+        """Return a cached chunk payload by id."""
+        with self._lock:
+            chunk = self._chunks.get((collection_name, chunk_id))
+            if chunk is not None:
+                self._chunks.move_to_end((collection_name, chunk_id))
+            return chunk
+
+    def clear(self) -> None:
+        """Drop all cached results and chunks (versions are preserved)."""
+        with self._lock:
+            self._entries.clear()
+            self._chunks.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache statistics for diagnostics."""
+        with self._lock:
+            return {
+                "results": len(self._entries),
+                "chunks": len(self._chunks),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_retrieval_cache: RetrievalCache | None = None
+_retrieval_cache_lock = threading.Lock()
+
+
+def get_retrieval_cache(settings: Settings) -> RetrievalCache | None:
+    """Return the process-wide retrieval cache, or None when disabled.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Shared RetrievalCache instance, or None if caching is disabled
+    """
+    global _retrieval_cache  # pylint: disable=global-statement
+    if getattr(settings, "retrieval_cache_enabled", False) is not True:
+        return None
+    if _retrieval_cache is None:
+        with _retrieval_cache_lock:
+            if _retrieval_cache is None:
+                _retrieval_cache = RetrievalCache(
+                    max_results=settings.retrieval_cache_max_results,
+                    max_chunks=settings.retrieval_cache_max_chunks,
+                    ttl_seconds=settings.retrieval_cache_ttl_seconds,
+                )
+    return _retrieval_cache
+
+
+def reset_retrieval_cache() -> None:
+    """Discard the process-wide retrieval cache (used by tests)."""
+    global _retrieval_cache  # pylint: disable=global-statement
+    with _retrieval_cache_lock:
+        _retrieval_cache = None
@@ -21,6 +21,7 @@ from tenacity import (
 )
 
 from core.config import Settings, get_settings
+from rag_solution.generation.providers.rate_limiting import estimate_tokens, get_admission_controller
 from vectordbs.data_types import EmbeddingsList
 
 # Configure logging
@@ -440,8 +441,12 @@ async def agenerate_responses(
     if wx_model is None:
         wx_model = get_model(settings=settings)
 
+    # concurrency_level bounds this batch; the shared admission controller bounds all
+    # watsonx calls in the process and enforces the rate budgets
+    controller = get_admission_controller("watsonx", settings)
+
     async def throttled_agenerate(prompt: str, semaphore: asyncio.Semaphore, wx_mdl: ModelInference) -> str:
-        async with semaphore:
+        async with semaphore, controller.admit_async(tokens=estimate_tokens(prompt)):
             response = await wx_mdl.agenerate(prompt=prompt)
             return response.get("results")[0].get("generated_text").strip()  # type: ignore[no-any-return]
 
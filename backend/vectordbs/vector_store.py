@@ -18,6 +18,7 @@ from .data_types import (
     CollectionConfig,
     CollectionStatsResponse,
     Document,
+    DocumentChunk,
     DocumentMetadataFilter,
     EmbeddedChunk,
     HealthCheckResponse,
@@ -757,3 +758,37 @@ class VectorStore(ABC):
         Returns:
             Number of chunks found for the document.
         """
+
+    def count_chunks_by_document(self, collection_name: str, document_ids: list[str]) -> dict[str, int]:
+        """Count the chunks of several documents.
+
+        Backends override this with a single grouped query; the default counts
+        each document separately.
+
+        Args:
+            collection_name: Name of the collection to count in.
+            document_ids: The document IDs to count chunks for.
+
+        Returns:
+            Number of chunks per requested document ID.
+        """
+        return {document_id: self.count_document_chunks(collection_name, document_id) for document_id in document_ids}
+
+    def get_chunks_by_ids(self, collection_name: str, chunk_ids: list[str]) -> list[DocumentChunk]:
+        """Fetch chunks by their chunk IDs in a single batched lookup.
+
+        Used by hierarchical retrieval to resolve parent chunks of retrieved
+        children in one round trip. Backends override this with their native
+        fetch-by-id operation.
+
+        Args:
+            collection_name: Name of the collection to fetch from.
+            chunk_ids: IDs of the chunks to fetch.
+
+        Returns:
+            The chunks found, in no particular order (missing IDs are skipped).
+
+        Raises:
+            NotImplementedError: If the backend does not support fetching by ID.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support fetching chunks by ID")
@@ -17,6 +17,7 @@ from core.config import Settings, get_settings
 from .data_types import (
     CollectionConfig,
     Document,
+    DocumentChunk,
     DocumentChunkMetadata,
     DocumentChunkWithScore,
     DocumentMetadataFilter,
@@ -26,6 +27,8 @@ from .data_types import (
     Source,
     VectorDBResponse,
     VectorSearchRequest,
+    embedding_to_list,
+    has_embeddings,
 )
 from .error_types import CollectionError, DocumentError, VectorStoreError
 from .utils.embeddings import get_embeddings_for_vector_store
@@ -33,6 +36,9 @@ from .vector_store import VectorStore
 
 logger = logging.getLogger(__name__)
 
+# Properties returned for every chunk
+CHUNK_PROPERTIES = ["text", "document_id", "chunk_id", "source", "page_number", "chunk_number", "parent_chunk_id"]
+
 
 class WeaviateDataStore(VectorStore):
     """Weaviate implementation of the VectorStore interface.
@@ -99,6 +105,11 @@ class WeaviateDataStore(VectorStore):
                     "dataType": ["int"],
                     "description": "The number of the chunk within the document",
                 },
+                {
+                    "name": "parent_chunk_id",
+                    "dataType": ["string"],
+                    "description": "The ID of the parent chunk (hierarchical chunking)",
+                },
             ],
         }
 
@@ -195,11 +206,14 @@ class WeaviateDataStore(VectorStore):
                     "source": str(chunk.metadata.source) if chunk.metadata and chunk.metadata.source else "OTHER",
                     "page_number": chunk.metadata.page_number if chunk.metadata else 0,
                     "chunk_number": chunk.metadata.chunk_number if chunk.metadata else 0,
+                    "parent_chunk_id": chunk.parent_chunk_id
+                    or (chunk.metadata.parent_chunk_id if chunk.metadata else None)
+                    or "",
                 }
 
                 # Add to Weaviate with vector
                 self.client.data_object.create(  # type: ignore[attr-defined]
-                    data_object=data_object, class_name=collection_name, vector=chunk.embeddings
+                    data_object=data_object, class_name=collection_name, vector=embedding_to_list(chunk.embeddings)
                 )
 
                 chunk_ids.append(chunk.chunk_id)
@@ -229,7 +243,7 @@ class WeaviateDataStore(VectorStore):
             for document in documents:
                 for chunk in document.chunks:
                     # Only add chunks that have embeddings
-                    if chunk.embeddings:
+                    if chunk.embeddings is not None and has_embeddings(chunk.embeddings):
                         embedded_chunk = EmbeddedChunk(
                             chunk_id=chunk.chunk_id,
                             text=chunk.text,
@@ -290,7 +304,7 @@ class WeaviateDataStore(VectorStore):
         """
         try:
             # Get query vector (either from request or generate from text)
-            if request.query_vector:
+            if request.query_vector is not None and has_embeddings(request.query_vector):
                 query_embedding = request.query_vector
             elif request.query_text:
                 embeddings_list = get_embeddings_for_vector_store(request.query_text, settings=self.settings)
@@ -304,9 +318,9 @@ class WeaviateDataStore(VectorStore):
             results = (
                 self.client.query.get(  # type: ignore[attr-defined]
                     class_name=request.collection_id,
-                    properties=["text", "document_id", "chunk_id", "source", "page_number", "chunk_number"],
+                    properties=CHUNK_PROPERTIES,
                 )
-                .with_near_vector({"vector": query_embedding})
+                .with_near_vector({"vector": embedding_to_list(query_embedding)})
                 .with_limit(request.top_k)
                 .do()
             )
@@ -482,26 +496,73 @@ class WeaviateDataStore(VectorStore):
                 f"Failed to count chunks for document '{document_id}' in collection '{collection_name}': {e}"
             ) from e
 
+    def get_chunks_by_ids(self, collection_name: str, chunk_ids: list[str]) -> list[DocumentChunk]:
+        """Fetch chunks by chunk ID with a single filtered ``Get`` query.
+
+        Args:
+            collection_name: Name of the collection to fetch from
+            chunk_ids: IDs of the chunks to fetch
+
+        Returns:
+            The chunks found (missing IDs are skipped)
+
+        Raises:
+            DocumentError: If the lookup fails
+        """
+        unique_ids = list(dict.fromkeys(chunk_ids))
+        if not unique_ids:
+            return []
+        try:
+            results = (
+                self.client.query.get(  # type: ignore[attr-defined]
+                    class_name=collection_name, properties=CHUNK_PROPERTIES
+                )
+                .with_where(
+                    {
+                        "operator": "Or",
+                        "operands": [
+                            {"path": ["chunk_id"], "operator": "Equal", "valueString": chunk_id}
+                            for chunk_id in unique_ids
+                        ],
+                    }
+                )
+                .with_limit(len(unique_ids))
+                .do()
+            )
+            return [self._convert_to_chunk(obj) for obj in results["data"]["Get"][collection_name]]
+        except Exception as e:
+            logging.warning("Error fetching chunks by ID from collection %s: %s", collection_name, str(e))
+            raise DocumentError(f"Failed to fetch chunks by ID from collection '{collection_name}': {e}") from e
+
     def _process_search_results(self, results: Any, collection_name: str) -> list[QueryResult]:
         """Process Weaviate search results into QueryResult objects."""
         query_results = []
 
         for obj in results["data"]["Get"][collection_name]:
-            # Create DocumentChunkWithScore
-            chunk = DocumentChunkWithScore(
-                chunk_id=obj["chunk_id"],
-                text=obj["text"],
-                embeddings=None,  # Weaviate doesn't return embeddings in search results
-                metadata=DocumentChunkMetadata(
-                    source=Source(obj["source"]),
-                    document_id=obj["document_id"],
-                    page_number=obj["page_number"],
-                    chunk_number=obj["chunk_number"],
-                ),
-                document_id=obj["document_id"],
-                score=float(obj["_additional"]["distance"]),  # Convert distance to score
-            )
+            # Weaviate doesn't return embeddings in search results
+            chunk = self._convert_to_chunk(obj)
+            score = float(obj["_additional"]["distance"])  # Convert distance to score
 
-            query_results.append(QueryResult(chunk=chunk, score=float(obj["_additional"]["distance"]), embeddings=[]))
+            query_results.append(
+                QueryResult(chunk=DocumentChunkWithScore(**chunk.model_dump(), score=score), score=score, embeddings=[])
+            )
 
         return query_results
+
+    @staticmethod
+    def _convert_to_chunk(obj: dict[str, Any]) -> DocumentChunk:
+        """Convert a Weaviate object to DocumentChunk."""
+        parent_chunk_id = obj.get("parent_chunk_id") or None
+        return DocumentChunk(
+            chunk_id=obj["chunk_id"],
+            text=obj["text"],
+            metadata=DocumentChunkMetadata(
+                source=Source(obj["source"]),
+                document_id=obj["document_id"],
+                page_number=obj["page_number"],
+                chunk_number=obj["chunk_number"],
+                parent_chunk_id=parent_chunk_id,
+            ),
+            document_id=obj["document_id"],
+            parent_chunk_id=parent_chunk_id,
+        )
@@ -0,0 +1,30 @@
+-- Migration: Materialize per-document chunk counts and collection stats
+-- Description: Store chunk counts in Postgres at ingest/delete time so collection
+--              reads and search access checks no longer count chunks in the vector store
+
+-- Per-document chunk count
+ALTER TABLE files
+ADD COLUMN IF NOT EXISTS chunk_count INTEGER NOT NULL DEFAULT 0;
+
+-- Collection totals, refreshed in the same transaction as files.chunk_count
+ALTER TABLE collections
+ADD COLUMN IF NOT EXISTS document_count INTEGER NOT NULL DEFAULT 0,
+ADD COLUMN IF NOT EXISTS chunk_count INTEGER NOT NULL DEFAULT 0,
+ADD COLUMN IF NOT EXISTS stats_updated_at TIMESTAMP WITH TIME ZONE,
+ADD COLUMN IF NOT EXISTS stats_reconciled_at TIMESTAMP WITH TIME ZONE;
+
+-- Stats are recomputed per collection from its files
+CREATE INDEX IF NOT EXISTS ix_files_collection_id ON files (collection_id);
+
+COMMENT ON COLUMN files.chunk_count IS 'Number of chunks of this document in the vector store';
+COMMENT ON COLUMN collections.chunk_count IS 'Total chunks in the vector store (sum of files.chunk_count)';
+COMMENT ON COLUMN collections.stats_reconciled_at IS 'When the chunk counts were last recounted from the vector store';
+
+-- Existing collections start at zero; POST /api/collections/reconcile-stats (or the
+-- periodic reconciliation job) backfills their counts from the vector store.
+
+-- Verify the columns were added
+SELECT table_name, column_name, data_type, column_default
+FROM information_schema.columns
+WHERE (table_name = 'files' AND column_name = 'chunk_count')
+   OR (table_name = 'collections' AND column_name IN ('document_count', 'chunk_count', 'stats_updated_at', 'stats_reconciled_at'));
@@ -0,0 +1,17 @@
+-- Migration: Keyset pagination indexes for conversation listings
+-- Description: Let session and message listings seek straight to (created_at, id) after
+--              the previous page instead of scanning and discarding OFFSET rows, and let
+--              per-session message counts be answered from the index alone
+
+-- CONCURRENTLY avoids blocking writes while the indexes build; run this file outside a
+-- transaction block (psql runs each statement on its own by default).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_conversation_messages_session_created_id
+    ON conversation_messages (session_id, created_at, id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_conversation_sessions_user_created_id
+    ON conversation_sessions (user_id, created_at, id);
+
+-- Verify the indexes were created
+SELECT tablename, indexname, indexdef
+FROM pg_indexes
+WHERE indexname IN ('ix_conversation_messages_session_created_id', 'ix_conversation_sessions_user_created_id');
@@ -0,0 +1,33 @@
+-- Migration: Add evaluation_results table for background LLM-as-judge scores
+--
+-- With RUNTIME_EVAL enabled, search answers are judged off the request path by
+-- the evaluation queue and one row per search is stored here. The dashboard
+-- aggregates the scores per pipeline (GET /api/dashboard/quality).
+
+CREATE TABLE IF NOT EXISTS evaluation_results (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    search_id UUID UNIQUE NOT NULL,
+    pipeline_id UUID,
+    collection_id UUID,
+    user_id UUID,
+    question TEXT NOT NULL,
+    faithfulness DOUBLE PRECISION,
+    answer_relevance DOUBLE PRECISION,
+    context_relevance DOUBLE PRECISION,
+    overall_score DOUBLE PRECISION,
+    details JSON,
+    judge_model VARCHAR(255),
+    error VARCHAR(1000),
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE evaluation_results IS 'LLM-as-judge scores of search answers from runtime evaluation';
+COMMENT ON COLUMN evaluation_results.search_id IS 'Search ID returned in the evaluation field of the search response';
+COMMENT ON COLUMN evaluation_results.overall_score IS 'Average of the available judge scores (0-1)';
+COMMENT ON COLUMN evaluation_results.error IS 'Judge failure message; failed rows are excluded from dashboard averages';
+
+-- search_id needs no separate index: its UNIQUE constraint is backed by one
+CREATE INDEX IF NOT EXISTS ix_evaluation_results_collection_id ON evaluation_results(collection_id);
+CREATE INDEX IF NOT EXISTS ix_evaluation_results_user_id ON evaluation_results(user_id);
+CREATE INDEX IF NOT EXISTS ix_evaluation_results_created_at ON evaluation_results(created_at);
+CREATE INDEX IF NOT EXISTS ix_evaluation_results_pipeline_created ON evaluation_results(pipeline_id, created_at);
@@ -0,0 +1,24 @@
+-- Migration: Persist running LLM token usage totals
+-- Description: One row per (user, model, service type), incremented in batches by the
+--              usage accounting flusher instead of keeping every call in memory
+
+CREATE TABLE IF NOT EXISTS llm_usage_totals (
+    user_id UUID NOT NULL,
+    model_name VARCHAR(255) NOT NULL,
+    service_type VARCHAR(50) NOT NULL,
+    prompt_tokens BIGINT NOT NULL DEFAULT 0,
+    completion_tokens BIGINT NOT NULL DEFAULT 0,
+    total_tokens BIGINT NOT NULL DEFAULT 0,
+    calls BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (user_id, model_name, service_type)
+);
+
+COMMENT ON TABLE llm_usage_totals IS 'Running LLM token usage per user, model and service type';
+COMMENT ON COLUMN llm_usage_totals.calls IS 'Number of LLM calls counted in the totals';
+
+-- Verify the table was created
+SELECT column_name, data_type, column_default
+FROM information_schema.columns
+WHERE table_name = 'llm_usage_totals'
+ORDER BY ordinal_position;
@@ -63,6 +63,7 @@ class TestSearchPipelineResolutionIntegration:
         mock_collection.status = "completed"
         mock_collection.is_private = False
         mock_collection_service.get_collection.return_value = mock_collection
+        mock_collection_service.get_collection_access.return_value = mock_collection
         mock_collection_service_class.return_value = mock_collection_service
 
         # Mock PipelineService for pipeline resolution
@@ -174,6 +175,7 @@ class TestSearchPipelineResolutionIntegration:
         mock_collection.status = "completed"
         mock_collection.is_private = False
         mock_collection_service.get_collection.return_value = mock_collection
+        mock_collection_service.get_collection_access.return_value = mock_collection
         mock_collection_service_class.return_value = mock_collection_service
 
         # Mock PipelineService - no default pipeline exists
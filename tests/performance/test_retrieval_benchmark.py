@@ -0,0 +1,101 @@
+"""Performance benchmarks for the retrieval and rerank stages.
+
+Runs a synthetic labeled query set through the offline benchmark harness
+(in-process Chroma, deterministic hashing embedder) so timings and quality
+only move when retrieval code changes.
+
+Run with pytest-benchmark to track stage latency across commits:
+    pytest tests/performance/test_retrieval_benchmark.py --benchmark-json=benchmarks/retrieval.json
+
+Set RETRIEVAL_BENCHMARK_REPORT to also write the harness report (quality,
+p50/p95 latency, QPS and memory per stage) for the current commit.
+"""
+
+import importlib.util
+import os
+import random
+
+import pytest
+
+from rag_solution.evaluation.benchmark import (
+    BenchmarkDataset,
+    BenchmarkDocument,
+    BenchmarkQuery,
+    RetrievalBenchmark,
+    write_report,
+)
+
+requires_pytest_benchmark = pytest.mark.skipif(
+    importlib.util.find_spec("pytest_benchmark") is None, reason="pytest-benchmark is not installed"
+)
+
+TOPICS = 50
+DOCUMENTS_PER_TOPIC = 20
+TOP_K = 10
+
+# Minimum quality of the synthetic set; a drop means retrieval or reranking regressed
+MIN_RECALL = 0.9
+MIN_NDCG = 0.7
+
+
+def build_dataset(seed: int = 42) -> BenchmarkDataset:
+    """Build a labeled corpus where each topic has one relevant document among noisy neighbours."""
+    rng = random.Random(seed)
+    vocabulary = [f"term{i}" for i in range(2000)]
+    documents: list[BenchmarkDocument] = []
+    queries: list[BenchmarkQuery] = []
+    for topic in range(TOPICS):
+        keywords = [f"topic{topic}key{i}" for i in range(4)]
+        for position in range(DOCUMENTS_PER_TOPIC):
+            # The first document of a topic holds all keywords, the others only one
+            words = keywords if position == 0 else [keywords[position % len(keywords)]]
+            text = " ".join(words + rng.sample(vocabulary, 30))
+            documents.append(BenchmarkDocument(id=f"t{topic}d{position}", text=text))
+        queries.append(BenchmarkQuery(query=" ".join(keywords), relevant_ids=[f"t{topic}d0"]))
+    return BenchmarkDataset(name="synthetic", documents=documents, queries=queries)
+
+
+@pytest.fixture(scope="module")
+def retrieval_benchmark():
+    """Index the synthetic corpus once for all benchmarks."""
+    benchmark = RetrievalBenchmark(build_dataset(), top_k=TOP_K)
+    benchmark.index()
+    yield benchmark
+    benchmark.close()
+
+
+@pytest.mark.performance
+def test_retrieval_quality_and_latency_report(retrieval_benchmark):
+    """Test the synthetic set meets its quality floor and the report covers every stage."""
+    report = retrieval_benchmark.run(repeat=3)
+
+    if os.getenv("RETRIEVAL_BENCHMARK_REPORT"):
+        write_report(report, os.environ["RETRIEVAL_BENCHMARK_REPORT"])
+
+    assert report["quality"][f"recall@{TOP_K}"] >= MIN_RECALL
+    assert report["quality"][f"ndcg@{TOP_K}"] >= MIN_NDCG
+    for stage in ("embed", "retrieve", "rerank", "total"):
+        assert report["stages"][stage]["calls"] == TOPICS * 3
+    assert report["throughput"]["qps"] > 0
+
+
+@pytest.mark.performance
+@requires_pytest_benchmark
+def test_benchmark_query_end_to_end(benchmark, retrieval_benchmark):
+    """Benchmark one query through embed, retrieve and rerank."""
+    query = retrieval_benchmark.dataset.queries[0]
+
+    ranking = benchmark(retrieval_benchmark.search, query.query)
+
+    assert query.relevant_ids[0] in ranking
+
+
+@pytest.mark.performance
+@requires_pytest_benchmark
+def test_benchmark_embed(benchmark, retrieval_benchmark):
+    """Benchmark embedding a query."""
+    text = retrieval_benchmark.dataset.queries[0].query
+
+    vectors = benchmark(retrieval_benchmark.embedder.embed, [text])
+
+    assert len(vectors[0]) == retrieval_benchmark.embedder.dimension
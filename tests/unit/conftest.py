@@ -15,6 +15,46 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent / "atomic"))
 
 
+@pytest.fixture(autouse=True)
+def reset_config_cache():
+    """Start every test with a fresh process-wide configuration cache."""
+    from rag_solution.services.config_cache import reset_config_cache as reset
+
+    reset()
+    yield
+    reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_client_pool():
+    """Start every test with an empty provider client pool."""
+    from rag_solution.generation.providers.client_pool import reset_client_pool as reset
+
+    reset()
+    yield
+    reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_usage_accountant():
+    """Start every test with a fresh usage accountant."""
+    from rag_solution.services.usage_accounting import reset_usage_accountant as reset
+
+    reset()
+    yield
+    reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_connection_hub():
+    """Start every test with a fresh WebSocket connection hub."""
+    from rag_solution.services.websocket_hub import reset_connection_hub as reset
+
+    reset()
+    yield
+    reset()
+
+
 @pytest.fixture
 def mock_user_service():
     """Create a mocked user service for unit tests."""
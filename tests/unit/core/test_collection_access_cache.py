@@ -0,0 +1,129 @@
+"""Unit tests for the in-process collection access cache."""
+
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+from rag_solution.core.collection_access_cache import (
+    CollectionAccessCache,
+    get_collection_access_cache,
+    invalidate_collection_access,
+    reset_collection_access_cache,
+)
+from rag_solution.schemas.collection_schema import CollectionAccess, CollectionStatus
+
+
+def _access(collection_id, user_id, is_member: bool = True) -> CollectionAccess:
+    return CollectionAccess(
+        id=collection_id, user_id=user_id, is_private=True, status=CollectionStatus.COMPLETED, is_member=is_member
+    )
+
+
+@pytest.mark.unit
+class TestCollectionAccessCache:
+    """Tests for CollectionAccessCache hits, invalidation and bounds."""
+
+    def setup_method(self) -> None:
+        self.cache = CollectionAccessCache(max_entries=2, ttl_seconds=0)
+        self.collection_id = uuid4()
+        self.user_id = uuid4()
+
+    def test_loads_once_per_user_and_collection(self) -> None:
+        loader = Mock(return_value=_access(self.collection_id, self.user_id))
+
+        first = self.cache.get_or_load(self.collection_id, self.user_id, loader)
+        second = self.cache.get_or_load(self.collection_id, self.user_id, loader)
+
+        assert first == second
+        loader.assert_called_once()
+        assert self.cache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+    def test_missing_collection_is_cached(self) -> None:
+        loader = Mock(return_value=None)
+
+        assert self.cache.get_or_load(self.collection_id, self.user_id, loader) is None
+        assert self.cache.get_or_load(self.collection_id, self.user_id, loader) is None
+        loader.assert_called_once()
+
+    def test_invalidate_reloads_every_user_of_collection(self) -> None:
+        other_user = uuid4()
+        self.cache.get_or_load(self.collection_id, self.user_id, lambda: _access(self.collection_id, self.user_id))
+        self.cache.get_or_load(self.collection_id, other_user, lambda: _access(self.collection_id, other_user))
+
+        self.cache.invalidate(self.collection_id)
+
+        revoked = _access(self.collection_id, self.user_id, is_member=False)
+        assert self.cache.get_or_load(self.collection_id, self.user_id, lambda: revoked) is revoked
+        assert self.cache.stats()["misses"] == 3
+
+    def test_decision_loaded_during_invalidation_is_not_served(self) -> None:
+        def stale_loader() -> CollectionAccess:
+            # The membership changes while the old row is being read
+            self.cache.invalidate(self.collection_id)
+            return _access(self.collection_id, self.user_id)
+
+        self.cache.get_or_load(self.collection_id, self.user_id, stale_loader)
+        fresh = _access(self.collection_id, self.user_id, is_member=False)
+
+        assert self.cache.get_or_load(self.collection_id, self.user_id, lambda: fresh) is fresh
+
+    def test_evicts_least_recently_used(self) -> None:
+        for _ in range(3):
+            collection_id = uuid4()
+            self.cache.get_or_load(collection_id, self.user_id, lambda c=collection_id: _access(c, self.user_id))
+
+        assert self.cache.stats()["entries"] == 2
+
+    def test_expired_entries_are_reloaded(self) -> None:
+        cache = CollectionAccessCache(ttl_seconds=1)
+        loader = Mock(return_value=_access(self.collection_id, self.user_id))
+        cache.get_or_load(self.collection_id, self.user_id, loader)
+        key = next(iter(cache._entries))
+        stored_at, version, access = cache._entries[key]
+        cache._entries[key] = (stored_at - 5, version, access)
+
+        cache.get_or_load(self.collection_id, self.user_id, loader)
+
+        assert loader.call_count == 2
+
+
+@pytest.mark.unit
+class TestCollectionAccessCacheSingleton:
+    """Tests for the process-wide cache accessor."""
+
+    def setup_method(self) -> None:
+        reset_collection_access_cache()
+
+    def teardown_method(self) -> None:
+        reset_collection_access_cache()
+
+    def test_disabled_returns_none(self) -> None:
+        assert get_collection_access_cache(Mock(collection_access_cache_enabled=False)) is None
+
+    def test_enabled_returns_shared_instance(self) -> None:
+        settings = Mock(
+            collection_access_cache_enabled=True,
+            collection_access_cache_max_entries=5,
+            collection_access_cache_ttl_seconds=10.0,
+        )
+
+        cache = get_collection_access_cache(settings)
+
+        assert cache is get_collection_access_cache(settings)
+        assert cache.max_entries == 5
+
+    def test_invalidate_without_cache_is_noop(self) -> None:
+        invalidate_collection_access(uuid4())
+
+    def test_invalidate_bumps_shared_cache(self) -> None:
+        settings = Mock(
+            collection_access_cache_enabled=True,
+            collection_access_cache_max_entries=5,
+            collection_access_cache_ttl_seconds=10.0,
+        )
+        cache = get_collection_access_cache(settings)
+        collection_id = uuid4()
+
+        invalidate_collection_access(collection_id)
+
+        assert cache.get_version(collection_id) == 1
@@ -0,0 +1,118 @@
+"""Unit tests for the indexed in-memory log store."""
+
+import asyncio
+import logging
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from core.enhanced_logging import StorageHandler
+from core.log_storage_service import LogEntry, LogLevel, LogStorageService
+
+
+def _at(seconds: int) -> datetime:
+    return datetime(2026, 1, 1, tzinfo=UTC) + timedelta(seconds=seconds)
+
+
+@pytest.mark.unit
+class TestLogStorageService:
+    """Tests for eviction, indexed queries and the submission queue."""
+
+    async def test_eviction_keeps_indices_consistent(self) -> None:
+        storage = LogStorageService(max_size_mb=1)
+        storage._max_size_bytes = LogEntry(message="0" * 100, request_id="req_0")._size * 3
+
+        for index in range(10):
+            await storage.add_log(LogLevel.INFO, f"{index:0100d}", request_id=f"req_{index % 2}")
+
+        stats = storage.get_stats()
+        assert stats["total_logs"] == 3
+        assert stats["level_distribution"] == {"info": 3}
+        assert [log["message"][-1] for log in await storage.get_logs(request_id="req_1")] == ["9", "7"]
+        assert [log["message"][-1] for log in await storage.get_logs(request_id="req_0")] == ["8"]
+
+    async def test_time_range_is_inclusive(self) -> None:
+        storage = LogStorageService(max_size_mb=1)
+        for second in range(5):
+            storage.submit(timestamp=_at(second), level=LogLevel.INFO, message=f"Log {second}")
+
+        logs = await storage.get_logs(start_time=_at(1), end_time=_at(3), order="asc")
+
+        assert [log["message"] for log in logs] == ["Log 1", "Log 2", "Log 3"]
+
+    async def test_filters_combine_with_order_and_pagination(self) -> None:
+        storage = LogStorageService(max_size_mb=1)
+        for index in range(6):
+            await storage.add_log(
+                LogLevel.ERROR if index % 2 else LogLevel.INFO,
+                f"Log {index}",
+                entity_type="collection",
+                entity_id="coll_1",
+                request_id="req_1",
+            )
+        await storage.add_log(LogLevel.ERROR, "Other", entity_type="collection", entity_id="coll_2", request_id="req_1")
+
+        logs = await storage.get_logs(
+            entity_type="collection", entity_id="coll_1", request_id="req_1", level=LogLevel.ERROR, offset=1, limit=1
+        )
+
+        assert [log["message"] for log in logs] == ["Log 3"]
+        assert await storage.get_logs(entity_id="coll_1", pipeline_stage="missing") == []
+
+    async def test_out_of_order_timestamps_are_kept_sorted(self) -> None:
+        storage = LogStorageService(max_size_mb=1)
+        storage.submit(timestamp=_at(10), level=LogLevel.INFO, message="late clock")
+        storage.submit(timestamp=_at(5), level=LogLevel.INFO, message="early clock")
+
+        logs = await storage.get_logs(order="asc")
+
+        assert [log["seq"] for log in logs] == [1, 2]
+        assert logs[1]["timestamp"] == _at(10).isoformat()
+
+    async def test_background_drain_notifies_subscribers(self) -> None:
+        storage = LogStorageService(max_size_mb=1, drain_interval_seconds=0.01)
+        storage.start()
+        subscription = storage.subscribe()
+        next_event = asyncio.ensure_future(anext(subscription))
+        await asyncio.sleep(0)
+
+        storage.submit(level=LogLevel.WARNING, message="queued")
+        event = await asyncio.wait_for(next_event, timeout=1)
+        await subscription.aclose()
+        await storage.stop()
+
+        assert event["data"]["message"] == "queued"
+
+    async def test_to_dict_is_built_once(self) -> None:
+        storage = LogStorageService(max_size_mb=1)
+        entry = await storage.add_log(LogLevel.INFO, "cached")
+
+        assert entry.to_dict() is entry.to_dict()
+        assert (await storage.get_logs())[0] is entry.to_dict()
+
+    async def test_clear_resets_indices_and_counts(self) -> None:
+        storage = LogStorageService(max_size_mb=1)
+        await storage.add_log(LogLevel.INFO, "Log", entity_id="coll_1", pipeline_stage="retrieval")
+        storage.submit(level=LogLevel.INFO, message="pending")
+
+        assert storage.clear() == 2
+        stats = storage.get_stats()
+        assert stats["unique_entities"] == 0
+        assert stats["pipeline_stage_distribution"] == {}
+
+
+@pytest.mark.unit
+class TestStorageHandler:
+    """Tests for handing log records to the storage service."""
+
+    async def test_emit_queues_record_without_an_event_loop_call(self) -> None:
+        storage = LogStorageService(max_size_mb=1)
+        handler = StorageHandler(storage)
+        record = logging.LogRecord("rag.search", logging.ERROR, __file__, 1, "Search failed", None, None)
+
+        handler.emit(record)
+
+        assert len(storage._pending) == 1
+        logs = await storage.get_logs()
+        assert logs[0]["message"] == "Search failed"
+        assert logs[0]["level"] == "error"
+        assert logs[0]["timestamp"] == datetime.fromtimestamp(record.created, UTC).isoformat()
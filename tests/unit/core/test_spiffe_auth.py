@@ -14,15 +14,20 @@ import os
 from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, patch
 
+import jwt as pyjwt
 import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from spiffe import JwtBundle, JwtBundleSet, TrustDomain
 
 from core.spiffe_auth import (
     AGENT_TYPE_CAPABILITIES,
     AgentCapability,
     AgentPrincipal,
     AgentType,
+    JwtBundleCache,
     SPIFFEAuthenticator,
     SPIFFEConfig,
+    VerifiedTokenCache,
     build_spiffe_id,
     get_agent_principal_from_request,
     is_spiffe_jwt_svid,
@@ -770,3 +775,150 @@ class TestAgentTypeCapabilities:
         """Test custom agents have no default capabilities."""
         caps = AGENT_TYPE_CAPABILITIES[AgentType.CUSTOM]
         assert caps == []
+
+
+TRUST_DOMAIN = "rag-modulo.example.com"
+AGENT_SPIFFE_ID = f"spiffe://{TRUST_DOMAIN}/agent/search-enricher/agent-001"
+
+
+def _signing_key() -> rsa.RSAPrivateKey:
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def _bundle_set(keys: dict[str, rsa.RSAPrivateKey]) -> JwtBundleSet:
+    trust_domain = TrustDomain(TRUST_DOMAIN)
+    bundle = JwtBundle(trust_domain, {kid: key.public_key() for kid, key in keys.items()})
+    return JwtBundleSet({trust_domain: bundle})
+
+
+def _svid(key: rsa.RSAPrivateKey, kid: str = "key-1", lifetime: timedelta = timedelta(hours=1)) -> str:
+    now = datetime.now(UTC)
+    claims = {"sub": AGENT_SPIFFE_ID, "aud": ["backend-api"], "iat": now, "exp": now + lifetime}
+    return pyjwt.encode(claims, key, algorithm="RS256", headers={"kid": kid})
+
+
+class FakeWorkloadApiClient:
+    """Workload API client pushing a fixed bundle set through the streaming watch."""
+
+    def __init__(self, streamed: JwtBundleSet, fetched: JwtBundleSet | None = None) -> None:
+        self.streamed = streamed
+        self.fetched = fetched or streamed
+        self.fetch_calls = 0
+        self.cancel_handler = MagicMock()
+
+    def stream_jwt_bundles(self, on_success, on_error):  # noqa: ANN001, ANN201
+        on_success(self.streamed)
+        return self.cancel_handler
+
+    def fetch_jwt_bundles(self) -> JwtBundleSet:
+        self.fetch_calls += 1
+        return self.fetched
+
+
+def _authenticator(client: FakeWorkloadApiClient, **config: object) -> SPIFFEAuthenticator:
+    authenticator = SPIFFEAuthenticator(SPIFFEConfig(enabled=True, trust_domain=TRUST_DOMAIN, **config))
+    authenticator._bundle_cache = JwtBundleCache(client, authenticator.config.bundle_refresh_seconds)
+    authenticator._bundle_cache.start()
+    authenticator._initialized = True
+    authenticator._spire_available = True
+    return authenticator
+
+
+class TestJWTSVIDSignatureValidation:
+    """Tests for JWT-SVID validation against cached trust bundles."""
+
+    def test_validates_signature_without_calling_workload_api(self) -> None:
+        """Test signatures are verified against streamed bundles, not fetched per request."""
+        key = _signing_key()
+        client = FakeWorkloadApiClient(_bundle_set({"key-1": key}))
+        authenticator = _authenticator(client)
+
+        principal = authenticator.validate_jwt_svid(_svid(key), required_audience="backend-api")
+
+        assert principal is not None
+        assert principal.spiffe_id == AGENT_SPIFFE_ID
+        assert principal.metadata["signature_validated"] is True
+        assert client.fetch_calls == 0
+
+    def test_verified_token_is_served_from_cache(self) -> None:
+        """Test a repeated token is not decoded or verified again."""
+        key = _signing_key()
+        authenticator = _authenticator(FakeWorkloadApiClient(_bundle_set({"key-1": key})))
+        token = _svid(key)
+        first = authenticator.validate_jwt_svid(token)
+
+        with patch.object(authenticator, "_verify_signature") as verify:
+            second = authenticator.validate_jwt_svid(token)
+
+        verify.assert_not_called()
+        assert second is first
+
+    def test_cached_token_still_checks_required_audience(self) -> None:
+        """Test a cache hit is rejected when the required audience is missing."""
+        key = _signing_key()
+        authenticator = _authenticator(FakeWorkloadApiClient(_bundle_set({"key-1": key})))
+        token = _svid(key)
+        authenticator.validate_jwt_svid(token)
+
+        assert authenticator.validate_jwt_svid(token, required_audience="mcp-gateway") is None
+
+    def test_rejects_token_signed_by_unknown_key(self) -> None:
+        """Test a forged signature is rejected and never cached."""
+        trusted, forged = _signing_key(), _signing_key()
+        authenticator = _authenticator(FakeWorkloadApiClient(_bundle_set({"key-1": trusted})))
+        token = _svid(forged)
+
+        assert authenticator.validate_jwt_svid(token) is None
+        assert len(authenticator._token_cache) == 0
+
+    def test_rejects_expired_token(self) -> None:
+        """Test expired SVIDs are rejected by the verified decode."""
+        key = _signing_key()
+        authenticator = _authenticator(FakeWorkloadApiClient(_bundle_set({"key-1": key})))
+
+        assert authenticator.validate_jwt_svid(_svid(key, lifetime=timedelta(seconds=-5))) is None
+
+    def test_unknown_key_id_refreshes_bundles_once(self) -> None:
+        """Test a rotated key is fetched on demand, rate limited across requests."""
+        old_key, new_key = _signing_key(), _signing_key()
+        client = FakeWorkloadApiClient(
+            _bundle_set({"key-1": old_key}), fetched=_bundle_set({"key-1": old_key, "key-2": new_key})
+        )
+        authenticator = _authenticator(client, bundle_refresh_seconds=60.0)
+
+        assert authenticator.validate_jwt_svid(_svid(new_key, kid="key-2")) is not None
+        assert authenticator.validate_jwt_svid(_svid(old_key, kid="key-3")) is None
+        assert client.fetch_calls == 1
+
+
+class TestVerifiedTokenCache:
+    """Tests for the bounded verified-token cache."""
+
+    @staticmethod
+    def _principal(expires_in: timedelta) -> AgentPrincipal:
+        return AgentPrincipal.from_spiffe_id(AGENT_SPIFFE_ID, expires_at=datetime.now(UTC) + expires_in)
+
+    def test_expired_entries_are_dropped(self) -> None:
+        """Test entries are only served until the token expires."""
+        cache = VerifiedTokenCache()
+        cache.put("token", self._principal(timedelta(seconds=-1)))
+
+        assert cache.get("token") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test the cache stays within its size bound."""
+        cache = VerifiedTokenCache(max_entries=2)
+        for token in ("a", "b", "c"):
+            cache.put(token, self._principal(timedelta(hours=1)))
+
+        assert len(cache) == 2
+        assert cache.get("a") is None
+        assert cache.get("c") is not None
+
+    def test_tokens_without_expiry_are_not_cached(self) -> None:
+        """Test tokens without an exp claim are never cached."""
+        cache = VerifiedTokenCache()
+        cache.put("token", AgentPrincipal.from_spiffe_id(AGENT_SPIFFE_ID))
+
+        assert cache.get("token") is None
@@ -0,0 +1,53 @@
+"""Unit tests for the shared versioned TTL cache."""
+
+from unittest.mock import Mock
+
+import pytest
+from core.versioned_cache import VersionedTTLCache
+
+
+@pytest.mark.unit
+class TestVersionedTTLCache:
+    """Tests for VersionedTTLCache versioning, expiry and bounds."""
+
+    def setup_method(self) -> None:
+        self.cache: VersionedTTLCache[str | None] = VersionedTTLCache(max_entries=2, ttl_seconds=0)
+
+    def test_bump_invalidates_only_that_scope(self) -> None:
+        first = Mock(return_value="a")
+        other = Mock(return_value="b")
+        self.cache.get_or_load("s1", "k", first)
+        self.cache.get_or_load("s2", "k", other)
+
+        assert self.cache.bump_version("s1") == 1
+        self.cache.get_or_load("s1", "k", first)
+        self.cache.get_or_load("s2", "k", other)
+
+        assert first.call_count == 2
+        other.assert_called_once()
+
+    def test_none_is_not_cached_when_disabled(self) -> None:
+        loader = Mock(return_value=None)
+
+        self.cache.get_or_load("s", "k", loader, cache_none=False)
+        self.cache.get_or_load("s", "k", loader, cache_none=False)
+
+        assert loader.call_count == 2
+        assert self.cache.stats()["entries"] == 0
+
+    def test_expired_entries_are_dropped(self) -> None:
+        cache: VersionedTTLCache[str] = VersionedTTLCache(max_entries=2, ttl_seconds=1)
+        loader = Mock(return_value="a")
+        cache.get_or_load("s", "k", loader)
+        stored_at, version, value = cache._entries[("s", "k")]
+        cache._entries[("s", "k")] = (stored_at - 5, version, value)
+
+        cache.get_or_load("s", "k", loader)
+
+        assert loader.call_count == 2
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        for key in ("a", "b", "c"):
+            self.cache.get_or_load("s", key, Mock(return_value=key))
+
+        assert list(self.cache._entries) == [("s", "b"), ("s", "c")]
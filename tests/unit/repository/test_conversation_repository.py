@@ -11,7 +11,7 @@ This test suite ensures 90%+ coverage of the unified ConversationRepository.
 """
 
 from datetime import UTC, datetime
-from unittest.mock import MagicMock, Mock
+from unittest.mock import AsyncMock, MagicMock, Mock
 from uuid import uuid4
 
 import pytest
@@ -31,6 +31,7 @@ from rag_solution.schemas.conversation_schema import (
     ConversationSummaryOutput,
     MessageRole,
     MessageType,
+    PageCursor,
     SessionStatus,
     SummarizationStrategy,
 )
@@ -193,36 +194,23 @@ class TestSessionOperations:
         mock_session.session_metadata = {}
         mock_session.created_at = datetime.now(UTC)
         mock_session.updated_at = datetime.now(UTC)
-        mock_session.messages = []
-
-        # Mock query chain
-        mock_query = Mock(spec=Query)
-        mock_db.query.return_value = mock_query
-        mock_query_with_options = Mock(spec=Query)
-        mock_query.options.return_value = mock_query_with_options
-        mock_query_with_filter = Mock(spec=Query)
-        mock_query_with_options.filter.return_value = mock_query_with_filter
-        mock_query_with_filter.first.return_value = mock_session
+        mock_db.execute.return_value.first.return_value = (mock_session, 3)
 
         # Act
         result = repository.get_session_by_id(sample_session_id)
 
         # Assert
         assert isinstance(result, ConversationSessionOutput)
-        mock_query.options.assert_called_once()  # Verify eager loading
+        assert result.message_count == 3
+        mock_db.execute.assert_called_once()  # Session and message count in one query
+        mock_db.query.assert_not_called()
 
     def test_get_session_by_id_not_found(
         self, repository: ConversationRepository, mock_db: MagicMock, sample_session_id: UUID4
     ) -> None:
         """Test session retrieval when session not found."""
         # Arrange
-        mock_query = Mock(spec=Query)
-        mock_db.query.return_value = mock_query
-        mock_query_with_options = Mock(spec=Query)
-        mock_query.options.return_value = mock_query_with_options
-        mock_query_with_filter = Mock(spec=Query)
-        mock_query_with_options.filter.return_value = mock_query_with_filter
-        mock_query_with_filter.first.return_value = None
+        mock_db.execute.return_value.first.return_value = None
 
         # Act & Assert
         with pytest.raises(NotFoundError):
@@ -244,30 +232,32 @@ class TestSessionOperations:
         mock_session.session_metadata = {}
         mock_session.created_at = datetime.now(UTC)
         mock_session.updated_at = datetime.now(UTC)
-        mock_session.messages = []
-
-        # Mock query chain
-        mock_query = Mock(spec=Query)
-        mock_db.query.return_value = mock_query
-        mock_query_with_options = Mock(spec=Query)
-        mock_query.options.return_value = mock_query_with_options
-        mock_query_with_filter = Mock(spec=Query)
-        mock_query_with_options.filter.return_value = mock_query_with_filter
-        mock_query_with_order = Mock(spec=Query)
-        mock_query_with_filter.order_by.return_value = mock_query_with_order
-        mock_query_with_limit = Mock(spec=Query)
-        mock_query_with_order.limit.return_value = mock_query_with_limit
-        mock_query_with_offset = Mock(spec=Query)
-        mock_query_with_limit.offset.return_value = mock_query_with_offset
-        mock_query_with_offset.all.return_value = [mock_session]
+        mock_db.execute.return_value.all.return_value = [(mock_session, 12)]
 
         # Act
         result = repository.get_sessions_by_user(sample_user_id, limit=50, offset=0)
 
         # Assert
         assert isinstance(result, list)
-        assert len(result) == 1
-        mock_query.options.assert_called_once()  # Verify eager loading
+        assert [session.message_count for session in result] == [12]
+        mock_db.execute.assert_called_once()  # Sessions and message counts in one query
+        mock_db.query.assert_not_called()
+
+    def test_get_sessions_by_user_keyset_page(
+        self, repository: ConversationRepository, mock_db: MagicMock, sample_user_id: UUID4
+    ) -> None:
+        """Test the next page seeks past the cursor instead of using OFFSET."""
+        mock_db.execute.return_value.all.return_value = []
+        cursor = PageCursor(created_at=datetime(2026, 1, 1), id=uuid4())
+        collection_id = uuid4()
+
+        repository.get_sessions_by_user(sample_user_id, limit=20, after=cursor, collection_id=collection_id)
+
+        sql = str(mock_db.execute.call_args.args[0])
+        assert "(conversation_sessions.created_at, conversation_sessions.id) <" in sql
+        assert "conversation_sessions.collection_id =" in sql
+        assert "ORDER BY conversation_sessions.created_at DESC, conversation_sessions.id DESC" in sql
+        assert "OFFSET" not in sql
 
     def test_get_sessions_by_collection_success(
         self, repository: ConversationRepository, mock_db: MagicMock, sample_collection_id: UUID4
@@ -497,18 +487,7 @@ class TestMessageOperations:
         mock_message = MagicMock(spec=ConversationMessage)
         mock_message.id = uuid4()
         mock_message.session_id = sample_session_id
-
-        mock_query = Mock(spec=Query)
-        mock_db.query.return_value = mock_query
-        mock_query_with_filter = Mock(spec=Query)
-        mock_query.filter.return_value = mock_query_with_filter
-        mock_query_with_order = Mock(spec=Query)
-        mock_query_with_filter.order_by.return_value = mock_query_with_order
-        mock_query_with_limit = Mock(spec=Query)
-        mock_query_with_order.limit.return_value = mock_query_with_limit
-        mock_query_with_offset = Mock(spec=Query)
-        mock_query_with_limit.offset.return_value = mock_query_with_offset
-        mock_query_with_offset.all.return_value = [mock_message]
+        mock_db.execute.return_value.scalars.return_value.all.return_value = [mock_message]
 
         # Act
         result = repository.get_messages_by_session(sample_session_id, limit=50, offset=0)
@@ -517,6 +496,32 @@ class TestMessageOperations:
         assert isinstance(result, list)
         assert len(result) == 1
 
+    def test_get_messages_by_session_projection_leaves_out_metadata(
+        self, repository: ConversationRepository, mock_db: MagicMock, sample_session_id: UUID4
+    ) -> None:
+        """Test list views read only the light columns, after the cursor."""
+        row = Mock(spec=["id", "session_id", "content", "role", "message_type", "created_at", "token_count"])
+        mock_db.execute.return_value.all.return_value = [row]
+        cursor = PageCursor(created_at=datetime(2026, 1, 1), id=uuid4())
+
+        result = repository.get_messages_by_session(sample_session_id, limit=50, after=cursor, include_metadata=False)
+
+        sql = str(mock_db.execute.call_args.args[0])
+        assert result == [row]
+        assert "message_metadata" not in sql
+        assert "(conversation_messages.created_at, conversation_messages.id) >" in sql
+        assert "OFFSET" not in sql
+
+    def test_iter_messages_pages_with_keyset(
+        self, repository: ConversationRepository, mock_db: MagicMock, sample_session_id: UUID4
+    ) -> None:
+        """Test export iteration fetches pages until a short one."""
+        messages = [Mock(id=uuid4(), created_at=datetime(2026, 1, 1, 0, 0, index)) for index in range(5)]
+        mock_db.execute.return_value.scalars.return_value.all.side_effect = [messages[:2], messages[2:4], messages[4:]]
+
+        assert list(repository.iter_messages(sample_session_id, batch_size=2)) == messages
+        assert mock_db.execute.call_count == 3
+
     def test_get_recent_messages_success(
         self, repository: ConversationRepository, mock_db: MagicMock, sample_session_id: UUID4
     ) -> None:
@@ -1028,30 +1033,20 @@ class TestSummaryOperations:
 class TestEagerLoading:
     """Test suite for eager loading and N+1 query prevention."""
 
-    def test_get_sessions_by_user_uses_joinedload(
+    def test_get_sessions_by_user_counts_messages_without_loading_them(
         self, repository: ConversationRepository, mock_db: MagicMock, sample_user_id: UUID4
     ) -> None:
-        """Test that get_sessions_by_user uses joinedload for eager loading."""
+        """Test that get_sessions_by_user counts messages in SQL instead of joining them in."""
         # Arrange
-        mock_query = Mock(spec=Query)
-        mock_db.query.return_value = mock_query
-        mock_query_with_options = Mock(spec=Query)
-        mock_query.options.return_value = mock_query_with_options
-        mock_query_with_filter = Mock(spec=Query)
-        mock_query_with_options.filter.return_value = mock_query_with_filter
-        mock_query_with_order = Mock(spec=Query)
-        mock_query_with_filter.order_by.return_value = mock_query_with_order
-        mock_query_with_limit = Mock(spec=Query)
-        mock_query_with_order.limit.return_value = mock_query_with_limit
-        mock_query_with_offset = Mock(spec=Query)
-        mock_query_with_limit.offset.return_value = mock_query_with_offset
-        mock_query_with_offset.all.return_value = []
+        mock_db.execute.return_value.all.return_value = []
 
         # Act
         repository.get_sessions_by_user(sample_user_id)
 
         # Assert
-        mock_query.options.assert_called_once()  # Verify eager loading is used
+        sql = str(mock_db.execute.call_args.args[0])
+        assert "count(conversation_messages.id)" in sql
+        assert "JOIN" not in sql
 
     def test_get_sessions_by_collection_uses_joinedload(
         self, repository: ConversationRepository, mock_db: MagicMock, sample_collection_id: UUID4
@@ -1078,25 +1073,21 @@ class TestEagerLoading:
         # Assert
         mock_query.options.assert_called_once()  # Verify eager loading is used
 
-    def test_get_session_by_id_uses_joinedload(
+    def test_get_session_by_id_counts_messages_without_loading_them(
         self, repository: ConversationRepository, mock_db: MagicMock, sample_session_id: UUID4
     ) -> None:
-        """Test that get_session_by_id uses joinedload for eager loading."""
+        """Test that get_session_by_id counts messages in SQL instead of joining them in."""
         # Arrange
-        mock_query = Mock(spec=Query)
-        mock_db.query.return_value = mock_query
-        mock_query_with_options = Mock(spec=Query)
-        mock_query.options.return_value = mock_query_with_options
-        mock_query_with_filter = Mock(spec=Query)
-        mock_query_with_options.filter.return_value = mock_query_with_filter
-        mock_query_with_filter.first.return_value = None
+        mock_db.execute.return_value.first.return_value = None
 
         # Act & Assert (will raise NotFoundError, but we're just testing query building)
         with pytest.raises(NotFoundError):
             repository.get_session_by_id(sample_session_id)
 
         # Assert
-        mock_query.options.assert_called_once()  # Verify eager loading is used
+        sql = str(mock_db.execute.call_args.args[0])
+        assert "count(conversation_messages.id)" in sql
+        assert "JOIN" not in sql
 
 
 # =============================================================================
@@ -1142,3 +1133,89 @@ class TestErrorHandling:
         with pytest.raises(RepositoryError):
             repository.create_summary(sample_summary_input)
         mock_db.rollback.assert_called_once()
+
+
+# =============================================================================
+# ASYNC READ OPERATION TESTS
+# =============================================================================
+
+
+class TestAsyncReadOperations:
+    """Test the AsyncSession-backed read methods."""
+
+    @pytest.fixture
+    def async_db(self) -> MagicMock:
+        """Create mock async database session."""
+        db = MagicMock()
+        db.execute = AsyncMock()
+        return db
+
+    async def test_get_sessions_by_user_async_counts_without_loading_messages(
+        self, mock_db: MagicMock, async_db: MagicMock, sample_user_id: UUID4
+    ) -> None:
+        """Test sessions are listed with a message count from the same query."""
+        mock_session = MagicMock(spec=ConversationSession)
+        mock_session.id = uuid4()
+        mock_session.user_id = sample_user_id
+        mock_session.collection_id = uuid4()
+        mock_session.session_name = "Test Session"
+        mock_session.status = "active"
+        mock_session.context_window_size = 4096
+        mock_session.max_messages = 100
+        mock_session.is_archived = False
+        mock_session.is_pinned = False
+        mock_session.session_metadata = {}
+        mock_session.created_at = datetime.now(UTC)
+        mock_session.updated_at = datetime.now(UTC)
+        async_db.execute.return_value = MagicMock(all=Mock(return_value=[(mock_session, 7)]))
+        repository = ConversationRepository(mock_db, async_db=async_db)
+
+        result = await repository.get_sessions_by_user_async(sample_user_id)
+
+        assert [session.message_count for session in result] == [7]
+        async_db.execute.assert_awaited_once()
+        mock_db.query.assert_not_called()
+
+    async def test_get_session_by_id_async_not_found(
+        self, mock_db: MagicMock, async_db: MagicMock, sample_session_id: UUID4
+    ) -> None:
+        """Test NotFoundError when the session does not exist."""
+        async_db.execute.return_value = MagicMock(first=Mock(return_value=None))
+        repository = ConversationRepository(mock_db, async_db=async_db)
+
+        with pytest.raises(NotFoundError):
+            await repository.get_session_by_id_async(sample_session_id)
+
+    async def test_iter_messages_async_pages_with_keyset(
+        self, mock_db: MagicMock, async_db: MagicMock, sample_session_id: UUID4
+    ) -> None:
+        """Test async export iteration fetches pages until a short one."""
+        messages = [Mock(id=uuid4(), created_at=datetime(2026, 1, 1, 0, 0, index)) for index in range(5)]
+        async_db.execute.side_effect = [
+            MagicMock(scalars=Mock(return_value=Mock(all=Mock(return_value=page))))
+            for page in (messages[:2], messages[2:4], messages[4:])
+        ]
+        repository = ConversationRepository(mock_db, async_db=async_db)
+
+        assert [
+            message async for message in repository.iter_messages_async(sample_session_id, batch_size=2)
+        ] == messages
+        assert async_db.execute.await_count == 3
+        mock_db.execute.assert_not_called()
+
+    async def test_get_messages_by_session_async_error(
+        self, mock_db: MagicMock, async_db: MagicMock, sample_session_id: UUID4
+    ) -> None:
+        """Test database errors are wrapped in RepositoryError."""
+        async_db.execute.side_effect = SQLAlchemyError("Database error")
+        repository = ConversationRepository(mock_db, async_db=async_db)
+
+        with pytest.raises(RepositoryError):
+            await repository.get_messages_by_session_async(sample_session_id)
+
+    async def test_async_methods_require_async_session(
+        self, repository: ConversationRepository, sample_session_id: UUID4
+    ) -> None:
+        """Test a repository built without an async session fails clearly."""
+        with pytest.raises(RepositoryError, match="async session"):
+            await repository.get_messages_by_session_async(sample_session_id)
@@ -0,0 +1,112 @@
+"""Unit tests for shared database engines and session factories."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from core.config import get_settings
+from core.custom_exceptions import RepositoryError
+from rag_solution.file_management import database
+from rag_solution.file_management.database import (
+    create_async_database_url,
+    create_session_factory,
+    engine_options,
+    require_async_session,
+)
+from rag_solution.repository.collection_repository import CollectionRepository
+from rag_solution.repository.prompt_template_repository import PromptTemplateRepository
+from rag_solution.schemas.prompt_template_schema import PromptTemplateType
+
+
+@pytest.mark.unit
+class TestSessionFactories:
+    """Tests for reusing one engine and pool per database."""
+
+    def test_default_database_reuses_session_local(self) -> None:
+        with patch.object(database, "_default_database_url", database.create_database_url()):
+            assert create_session_factory() is database.SessionLocal
+
+    def test_other_database_engine_is_created_once(self) -> None:
+        settings = get_settings().model_copy(update={"collectiondb_name": f"other_{uuid4().hex}"})
+
+        with patch.object(database, "create_engine") as create_engine:
+            first = create_session_factory(settings)
+            second = create_session_factory(settings)
+
+        assert first is second
+        create_engine.assert_called_once()
+        assert create_engine.call_args.kwargs["pool_pre_ping"] is True
+
+    def test_engine_options_come_from_settings(self) -> None:
+        settings = get_settings().model_copy(update={"db_pool_size": 3, "db_max_overflow": 1, "db_echo": True})
+
+        options = engine_options(settings)
+
+        assert options["pool_size"] == 3
+        assert options["max_overflow"] == 1
+        assert options["echo"] is True
+
+    def test_async_url_uses_asyncpg_with_statement_cache(self) -> None:
+        settings = get_settings().model_copy(update={"db_statement_cache_size": 0})
+
+        url = create_async_database_url(settings)
+
+        assert url.drivername == "postgresql+asyncpg"
+        assert url.query["prepared_statement_cache_size"] == "0"
+
+
+@pytest.mark.unit
+class TestAsyncRepositoryMethods:
+    """Tests for the AsyncSession-backed repository reads."""
+
+    def test_require_async_session(self) -> None:
+        session = MagicMock()
+
+        assert require_async_session(session) is session
+        with pytest.raises(RepositoryError):
+            require_async_session(None)
+
+    async def test_collection_get_user_collections_async(self) -> None:
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = []
+        async_db = MagicMock()
+        async_db.execute = AsyncMock(return_value=result)
+        db = MagicMock()
+        repository = CollectionRepository(db, async_db=async_db)
+
+        assert await repository.get_user_collections_async(uuid4()) == []
+        async_db.execute.assert_awaited_once()
+        db.query.assert_not_called()
+
+    async def test_prompt_template_get_by_user_id_and_type_async(self) -> None:
+        template = MagicMock()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = [template]
+        async_db = MagicMock()
+        async_db.execute = AsyncMock(return_value=result)
+        repository = PromptTemplateRepository(MagicMock(), async_db=async_db)
+
+        assert await repository.get_by_user_id_and_type_async(uuid4(), PromptTemplateType.RAG_QUERY) == [template]
+
+
+@pytest.mark.unit
+class TestAsyncSessionFactory:
+    """Tests for the process-wide async session factory."""
+
+    def test_factory_is_created_once_under_the_engine_lock(self) -> None:
+        async_sessionmaker = MagicMock()
+        asyncio_module = MagicMock(async_sessionmaker=async_sessionmaker)
+        lock = MagicMock()
+
+        with (
+            patch.dict("sys.modules", {"sqlalchemy.ext.asyncio": asyncio_module}),
+            patch.object(database, "get_async_engine", return_value="engine"),
+            patch.object(database, "_async_engine_lock", lock),
+            patch.object(database, "_async_session_factory", None),
+        ):
+            first = database.get_async_session_factory()
+            second = database.get_async_session_factory()
+
+        assert first is second
+        async_sessionmaker.assert_called_once_with("engine", autoflush=False, expire_on_commit=False)
+        assert lock.__enter__.call_count == 2
@@ -18,7 +18,11 @@ from unittest.mock import Mock, patch
 import numpy as np
 import pytest
 
-from rag_solution.retrieval.reranker import CrossEncoderReranker
+from rag_solution.retrieval.reranker import (
+    CrossEncoderReranker,
+    get_cross_encoder_reranker,
+    reset_cross_encoder_rerankers,
+)
 from vectordbs.data_types import DocumentChunkMetadata, DocumentChunkWithScore, QueryResult, Source
 
 # ============================================================================
@@ -947,3 +951,222 @@ class TestCrossEncoderRerankerQueryResultIntegration:
         # Assert
         assert len(reranked_results) == 1
         assert reranked_results[0].score is not None
+
+
+# ============================================================================
+# UNIT TESTS: Production Features
+# ============================================================================
+
+
+@pytest.mark.unit
+class TestCrossEncoderRerankerScoreCache:
+    """Test the (query hash, chunk id) score cache."""
+
+    def test_repeated_query_is_served_from_cache(self, mock_cross_encoder, sample_query_results):
+        """
+        Given: Score cache enabled
+        When: The same query reranks the same chunks twice
+        Then: The model is only called once and scores are identical
+        """
+        reranker = CrossEncoderReranker(score_cache_size=100)
+
+        first = reranker.rerank("machine learning", sample_query_results)
+        second = reranker.rerank("machine learning", sample_query_results)
+
+        reranker.model.predict.assert_called_once()
+        assert [r.chunk.chunk_id for r in first] == [r.chunk.chunk_id for r in second]
+        assert [r.score for r in first] == [r.score for r in second]
+        assert reranker.cache_hits == 5
+
+    def test_only_uncached_chunks_are_scored(self, mock_cross_encoder, sample_query_results):
+        """
+        Given: Scores cached for the first three chunks
+        When: All five chunks are reranked for the same query
+        Then: Only the two new chunks are sent to the model
+        """
+        reranker = CrossEncoderReranker(score_cache_size=100)
+        reranker.rerank("query", sample_query_results[:3])
+
+        reranker.rerank("query", sample_query_results)
+
+        last_pairs = reranker.model.predict.call_args[0][0]
+        assert len(last_pairs) == 2
+
+    def test_different_query_misses_cache(self, mock_cross_encoder, sample_query_results):
+        """Scores are keyed by query, so a new query runs the model again."""
+        reranker = CrossEncoderReranker(score_cache_size=100)
+
+        reranker.rerank("query one", sample_query_results)
+        reranker.rerank("query two", sample_query_results)
+
+        assert reranker.model.predict.call_count == 2
+
+    def test_cache_is_bounded(self, mock_cross_encoder, sample_query_results):
+        """The score cache evicts least recently used entries beyond its size."""
+        reranker = CrossEncoderReranker(score_cache_size=3)
+
+        reranker.rerank("query", sample_query_results)
+
+        assert len(reranker._score_cache) == 3
+
+    def test_cache_disabled_by_default(self, mock_cross_encoder, sample_query_results):
+        """Without a cache size every call runs the model."""
+        reranker = CrossEncoderReranker()
+
+        reranker.rerank("query", sample_query_results)
+        reranker.rerank("query", sample_query_results)
+
+        assert reranker.model.predict.call_count == 2
+
+
+@pytest.mark.unit
+class TestCrossEncoderRerankerTokenBudget:
+    """Test max-length truncation."""
+
+    def test_max_length_passed_to_model(self, mock_cross_encoder):
+        """The token budget is forwarded to the CrossEncoder."""
+        CrossEncoderReranker(max_length=256)
+
+        mock_cross_encoder.assert_called_once_with("cross-encoder/ms-marco-MiniLM-L-6-v2", max_length=256)
+
+    def test_long_documents_are_trimmed_before_tokenization(self, mock_cross_encoder, single_query_result):
+        """Documents far beyond the token budget are trimmed before prediction."""
+        reranker = CrossEncoderReranker(max_length=8)
+        single_query_result[0].chunk.text = "x" * 10_000
+
+        reranker.rerank("query", single_query_result)
+
+        pairs = reranker.model.predict.call_args[0][0]
+        assert len(pairs[0][1]) == 32
+
+
+@pytest.mark.unit
+class TestCrossEncoderRerankerQuantization:
+    """Test quantized model loading."""
+
+    def test_quantize_prefers_onnx_backend(self, mock_cross_encoder):
+        """With quantization enabled the int8 ONNX export is loaded."""
+        reranker = CrossEncoderReranker(quantize=True)
+
+        assert reranker.backend == "onnx-int8"
+        kwargs = mock_cross_encoder.call_args.kwargs
+        assert kwargs["backend"] == "onnx"
+        assert kwargs["model_kwargs"]["file_name"].endswith(".onnx")
+
+    def test_quantize_falls_back_to_torch_when_onnx_unavailable(self, sample_query_results):
+        """A missing ONNX runtime falls back to the PyTorch model."""
+        with patch("sentence_transformers.CrossEncoder") as mock_ce:
+            torch_model = Mock()
+            torch_model.predict = Mock(return_value=np.array([0.1, 0.5, 0.9, 0.3, 0.2]))
+
+            def load(model_name, **kwargs):
+                if kwargs.get("backend") == "onnx":
+                    raise ImportError("optimum is not installed")
+                return torch_model
+
+            mock_ce.side_effect = load
+
+            reranker = CrossEncoderReranker(quantize=True)
+            results = reranker.rerank("query", sample_query_results)
+
+        assert reranker.model is torch_model
+        assert reranker.backend == "torch"
+        assert results[0].chunk.chunk_id == "chunk_2"
+
+
+@pytest.mark.unit
+class TestCrossEncoderRerankerDynamicBatching:
+    """Test coalescing of concurrent async rerank calls."""
+
+    async def test_concurrent_calls_share_one_forward_pass(self, mock_cross_encoder, sample_query_results):
+        """
+        Given: Three concurrent rerank_async calls
+        When: They arrive within the batching window
+        Then: The model is called once with all pairs and each caller gets its own results
+        """
+        reranker = CrossEncoderReranker(batch_wait_ms=20)
+
+        results_list = await asyncio.gather(
+            *[reranker.rerank_async(q, sample_query_results, top_k=5) for q in ["q1", "q2", "q3"]]
+        )
+
+        reranker.model.predict.assert_called_once()
+        assert len(reranker.model.predict.call_args[0][0]) == 15
+        for results in results_list:
+            assert len(results) == 5
+            assert {r.chunk.chunk_id for r in results} == {r.chunk.chunk_id for r in sample_query_results}
+
+    async def test_full_batch_is_flushed_immediately(self, mock_cross_encoder, sample_query_results):
+        """A batch reaching max_batch_pairs does not wait for the window."""
+        reranker = CrossEncoderReranker(max_batch_pairs=5, batch_wait_ms=10_000)
+
+        results = await asyncio.wait_for(reranker.rerank_async("query", sample_query_results), timeout=5)
+
+        assert len(results) == 5
+
+    async def test_calls_on_another_loop_do_not_orphan_pending_batch(self, mock_cross_encoder, sample_query_results):
+        """A call from a second event loop keeps its own batch and leaves this loop's waiters intact."""
+        reranker = CrossEncoderReranker(batch_wait_ms=50)
+
+        waiting = asyncio.ensure_future(reranker.rerank_async("q1", sample_query_results))
+        await asyncio.sleep(0)
+        other_loop_results = await asyncio.to_thread(asyncio.run, reranker.rerank_async("q2", sample_query_results))
+        results = await asyncio.wait_for(waiting, timeout=5)
+
+        assert len(results) == 5
+        assert len(other_loop_results) == 5
+
+    async def test_batch_failure_propagates_to_all_callers(self, sample_query_results):
+        """A model error fails every caller of the coalesced batch."""
+        with patch("sentence_transformers.CrossEncoder") as mock_ce:
+            mock_instance = Mock()
+            mock_instance.predict = Mock(side_effect=RuntimeError("boom"))
+            mock_ce.return_value = mock_instance
+            reranker = CrossEncoderReranker(batch_wait_ms=20)
+
+            outcomes = await asyncio.gather(
+                reranker.rerank_async("q1", sample_query_results),
+                reranker.rerank_async("q2", sample_query_results),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+        mock_instance.predict.assert_called_once()
+
+
+@pytest.mark.unit
+class TestGetCrossEncoderReranker:
+    """Test the process-wide shared reranker."""
+
+    def teardown_method(self):
+        reset_cross_encoder_rerankers()
+
+    @staticmethod
+    def _settings(model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2") -> Mock:
+        settings = Mock()
+        settings.cross_encoder_model = model_name
+        settings.cross_encoder_max_length = 512
+        settings.cross_encoder_quantize = False
+        settings.cross_encoder_onnx_file = "onnx/model_quint8_avx2.onnx"
+        settings.cross_encoder_score_cache_size = 100
+        settings.cross_encoder_max_batch_pairs = 256
+        settings.cross_encoder_batch_wait_ms = 2.0
+        return settings
+
+    def test_model_is_loaded_once_per_process(self, mock_cross_encoder):
+        """Repeated lookups return the same instance without reloading the model."""
+        settings = self._settings()
+
+        first = get_cross_encoder_reranker(settings)
+        second = get_cross_encoder_reranker(settings)
+
+        assert first is second
+        mock_cross_encoder.assert_called_once()
+
+    def test_different_models_get_separate_instances(self, mock_cross_encoder):
+        """Each model configuration gets its own shared instance."""
+        first = get_cross_encoder_reranker(self._settings())
+        second = get_cross_encoder_reranker(self._settings("cross-encoder/ms-marco-TinyBERT-L-2-v2"))
+
+        assert first is not second
+        assert second.model_name == "cross-encoder/ms-marco-TinyBERT-L-2-v2"
@@ -0,0 +1,149 @@
+"""Unit tests for the offline retrieval benchmark harness and its ranking metrics."""
+
+import json
+
+import numpy as np
+import pytest
+
+from rag_solution.cli.main import main_cli
+from rag_solution.evaluation.benchmark import (
+    BenchmarkDataset,
+    HashingEmbedder,
+    RetrievalBenchmark,
+    load_dataset,
+    write_report,
+)
+from rag_solution.evaluation.metrics import NDCG, Recall
+
+DATASET = {
+    "name": "unit",
+    "documents": [
+        {"id": "milvus", "text": "Milvus is an open source vector database for similarity search"},
+        {"id": "chroma", "text": "Chroma stores embeddings locally for retrieval augmented generation"},
+        {"id": "cats", "text": "Cats sleep most of the day and hunt at night"},
+        {"id": "bread", "text": "Bake bread with flour water salt and yeast"},
+    ],
+    "queries": [
+        {"query": "vector database similarity search", "relevant_ids": ["milvus"]},
+        {"query": "when do cats hunt", "relevant_ids": ["cats"]},
+        {"query": "how to bake bread", "relevant_ids": ["bread"]},
+    ],
+}
+
+
+@pytest.fixture
+def dataset_file(tmp_path):
+    """Write the labeled query set to a JSON file."""
+    path = tmp_path / "dataset.json"
+    path.write_text(json.dumps(DATASET))
+    return path
+
+
+@pytest.mark.unit
+class TestRankingMetrics:
+    """Test cases for the recall@k and nDCG@k metrics."""
+
+    def test_recall_counts_expected_ids_within_cutoff(self) -> None:
+        """Test recall only counts expected ids ranked within top k."""
+        recall = Recall(top_k=2)
+
+        result = recall.compute(expected_ids=["a", "c"], retrieved_ids=["a", "b", "c"])
+
+        assert result.score == 0.5
+
+    def test_ndcg_rewards_higher_ranks(self) -> None:
+        """Test nDCG is 1 for an ideal ranking and lower when the hit is ranked later."""
+        ndcg = NDCG(top_k=3)
+
+        ideal = ndcg.compute(expected_ids=["a"], retrieved_ids=["a", "b", "c"])
+        late = ndcg.compute(expected_ids=["a"], retrieved_ids=["b", "c", "a"])
+
+        assert ideal.score == pytest.approx(1.0)
+        assert late.score == pytest.approx(1 / np.log2(4))
+
+    def test_metrics_require_ids(self) -> None:
+        """Test metrics reject missing ids like the existing metrics."""
+        with pytest.raises(ValueError):
+            NDCG().compute(expected_ids=["a"])
+
+
+@pytest.mark.unit
+class TestHashingEmbedder:
+    """Test cases for the deterministic benchmark embedder."""
+
+    def test_embeddings_are_deterministic_and_normalized(self) -> None:
+        """Test the same text always maps to the same unit vector."""
+        embedder = HashingEmbedder(dimension=64)
+
+        first, second, empty = embedder.embed(["vector search", "vector search", ""])
+
+        assert first == second
+        assert np.linalg.norm(first) == pytest.approx(1.0, abs=1e-6)
+        assert not any(empty)
+
+    def test_shared_tokens_are_similar(self) -> None:
+        """Test texts sharing tokens are closer than unrelated texts."""
+        query, related, unrelated = np.array(HashingEmbedder().embed(["cats hunt", "cats hunt at night", "bake bread"]))
+
+        assert query @ related > query @ unrelated
+
+
+@pytest.mark.unit
+class TestRetrievalBenchmark:
+    """Test cases for RetrievalBenchmark against an in-process Chroma collection."""
+
+    def test_report_contains_quality_latency_and_throughput(self) -> None:
+        """Test a run scores every query and reports per-stage latency and memory."""
+        benchmark = RetrievalBenchmark(BenchmarkDataset.model_validate(DATASET), top_k=2)
+        try:
+            report = benchmark.run(repeat=2)
+        finally:
+            benchmark.close()
+
+        assert report["quality"] == {"recall@2": 1.0, "mrr": 1.0, "ndcg@2": 1.0, "hit_rate@2": 1.0}
+        assert set(report["stages"]) == {"embed", "retrieve", "rerank", "total"}
+        assert report["stages"]["retrieve"]["calls"] == 6
+        assert report["stages"]["retrieve"]["p95_ms"] >= report["stages"]["retrieve"]["p50_ms"] > 0
+        assert report["stages"]["embed"]["peak_memory_kb"] > 0
+        assert report["throughput"]["qps"] > 0
+        assert report["config"]["retrieve_k"] == 8
+
+    def test_write_report_into_directory_uses_commit(self, tmp_path) -> None:
+        """Test reports written to a directory are named after the commit."""
+        path = write_report({"commit": "0123456789abcdef", "quality": {}}, tmp_path)
+
+        assert path == tmp_path / "0123456789ab.json"
+        assert json.loads(path.read_text())["commit"] == "0123456789abcdef"
+
+    def test_load_dataset_rejects_unlabeled_queries(self, tmp_path) -> None:
+        """Test queries without relevant ids are rejected."""
+        path = tmp_path / "dataset.json"
+        path.write_text(json.dumps({**DATASET, "queries": [{"query": "q", "relevant_ids": []}]}))
+
+        with pytest.raises(ValueError):
+            load_dataset(path)
+
+
+@pytest.mark.unit
+class TestBenchmarkCommand:
+    """Test cases for the ``benchmark run`` CLI subcommand."""
+
+    def test_run_writes_json_report(self, dataset_file, tmp_path) -> None:
+        """Test the command runs offline and writes the report."""
+        report_path = tmp_path / "report.json"
+
+        result = main_cli(
+            ["--output", "json", "benchmark", "run", str(dataset_file), "--top-k", "2", "--report", str(report_path)]
+        )
+
+        assert result.exit_code == 0
+        report = json.loads(report_path.read_text())
+        assert report["dataset"] == "unit"
+        assert report["quality"]["recall@2"] == 1.0
+
+    def test_invalid_dataset_fails(self, tmp_path) -> None:
+        """Test a missing dataset file returns an error exit code."""
+        result = main_cli(["benchmark", "run", str(tmp_path / "missing.json")])
+
+        assert result.exit_code == 1
+        assert "Invalid benchmark dataset" in result.error
@@ -0,0 +1,126 @@
+"""Unit tests for progressive podcast playback endpoints."""
+
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from rag_solution.generation.audio.segmented_output import PLAYLIST_NAME
+from rag_solution.router.podcast_router import _iter_live_segments, router
+from rag_solution.schemas.podcast_schema import PodcastStatus
+
+
+class TestPodcastSegmentEndpoints:
+    """Test playlist, segment and progressive audio endpoints."""
+
+    @pytest.fixture
+    def user_id(self):
+        """User owning the podcast."""
+        return uuid4()
+
+    @pytest.fixture
+    def podcast_id(self):
+        """Podcast being generated."""
+        return uuid4()
+
+    @pytest.fixture
+    def segments_dir(self, tmp_path, user_id, podcast_id):
+        """Segments directory with two segments and an open playlist."""
+        directory = tmp_path / str(user_id) / str(podcast_id) / "segments"
+        directory.mkdir(parents=True)
+        (directory / "segment_00000.mp3").write_bytes(b"first")
+        (directory / "segment_00001.mp3").write_bytes(b"second")
+        (directory / PLAYLIST_NAME).write_text(
+            "#EXTM3U\n#EXTINF:6.000,\nsegments/segment_00000.mp3\n#EXTINF:6.000,\nsegments/segment_00001.mp3\n"
+        )
+        return directory
+
+    @pytest.fixture
+    def mock_podcast_service(self):
+        """Podcast service returning a podcast that is still generating."""
+        service = Mock()
+        service.get_podcast = AsyncMock(return_value=Mock(status=PodcastStatus.GENERATING, audio_url=None))
+        return service
+
+    @pytest.fixture
+    def client(self, tmp_path, user_id, mock_podcast_service):
+        """Test client with mocked dependencies."""
+        from core.config import get_settings
+        from rag_solution.core.dependencies import get_current_user, get_podcast_service
+
+        settings = Mock()
+        settings.podcast_local_storage_path = str(tmp_path)
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_settings] = lambda: settings
+        app.dependency_overrides[get_podcast_service] = lambda: mock_podcast_service
+        app.dependency_overrides[get_current_user] = lambda: {"uuid": str(user_id)}
+        return TestClient(app)
+
+    def test_playlist_served_while_generating(self, client, podcast_id, segments_dir):
+        """The playlist is available before the podcast is completed."""
+        response = client.get(f"/api/podcasts/{podcast_id}/playlist.m3u8")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/vnd.apple.mpegurl")
+        assert "segments/segment_00001.mp3" in response.text
+
+    def test_playlist_missing(self, client, podcast_id):
+        """404 when no segments were written."""
+        response = client.get(f"/api/podcasts/{podcast_id}/playlist.m3u8")
+
+        assert response.status_code == 404
+
+    def test_segment_served(self, client, podcast_id, segments_dir):
+        """Segments referenced by the playlist are served."""
+        response = client.get(f"/api/podcasts/{podcast_id}/segments/segment_00001.mp3")
+
+        assert response.status_code == 200
+        assert response.content == b"second"
+        assert response.headers["content-type"] == "audio/mpeg"
+
+    def test_segment_name_is_validated(self, client, podcast_id, segments_dir, mock_podcast_service):
+        """Names not produced by the segment writer are rejected without touching the service."""
+        response = client.get(f"/api/podcasts/{podcast_id}/segments/{PLAYLIST_NAME}")
+
+        assert response.status_code == 404
+        mock_podcast_service.get_podcast.assert_not_called()
+
+    def test_audio_endpoint_streams_segments_while_generating(self, client, podcast_id, segments_dir):
+        """The audio endpoint streams the segments written so far, in order."""
+        playlist = segments_dir / PLAYLIST_NAME
+        playlist.write_text(playlist.read_text() + "#EXT-X-ENDLIST\n")
+
+        response = client.get(f"/api/podcasts/{podcast_id}/audio")
+
+        assert response.status_code == 200
+        assert response.content == b"firstsecond"
+
+    def test_audio_endpoint_not_ready_without_segments(self, client, podcast_id):
+        """Without segments an unfinished podcast is still reported as not ready."""
+        response = client.get(f"/api/podcasts/{podcast_id}/audio")
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_live_stream_waits_for_new_segments(self, segments_dir):
+        """Segments appended after streaming started are picked up until the playlist ends."""
+        stream = _iter_live_segments(segments_dir, poll_interval=0.01)
+        received = [await anext(stream), await anext(stream)]
+
+        (segments_dir / "segment_00002.mp3").write_bytes(b"third")
+        playlist = segments_dir / PLAYLIST_NAME
+        playlist.write_text(playlist.read_text() + "#EXTINF:6.000,\nsegments/segment_00002.mp3\n#EXT-X-ENDLIST\n")
+        received.extend([chunk async for chunk in stream])
+
+        assert received == [b"first", b"second", b"third"]
+
+    @pytest.mark.asyncio
+    async def test_live_stream_gives_up_when_idle(self, segments_dir):
+        """A stalled generation ends the stream after the idle timeout."""
+        chunks = [chunk async for chunk in _iter_live_segments(segments_dir, poll_interval=0.01, idle_timeout=0.05)]
+
+        assert chunks == [b"first", b"second"]
@@ -0,0 +1,179 @@
+"""
+Unit tests for DiversityStage.
+
+Tests near-duplicate removal and MMR ordering of retrieved documents including:
+- Conditional execution (enable/disable)
+- Stored vectors and term vector fallback
+- Error handling
+"""
+
+from unittest.mock import Mock
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from rag_solution.schemas.search_schema import SearchInput
+from rag_solution.services.pipeline.search_context import SearchContext
+from rag_solution.services.pipeline.stages.diversity_stage import DiversityStage
+from vectordbs.data_types import DocumentChunkWithScore, QueryResult
+
+SOLAR = "Solar panels convert sunlight into electricity using photovoltaic cells on the roof of the house."
+SOLAR_EFFICIENCY = "Photovoltaic solar panels convert less sunlight into electricity at high temperatures."
+REEFS = "Coral reefs host marine biodiversity and protect coastlines from storms and erosion."
+
+
+def make_result(text: str, score: float, embeddings: list[float] | np.ndarray | None = None) -> QueryResult:
+    """Create a query result for a chunk text."""
+    chunk = DocumentChunkWithScore(chunk_id=str(uuid4()), text=text, score=score)
+    return QueryResult(chunk=chunk, score=score, embeddings=embeddings if embeddings is not None else [])
+
+
+@pytest.fixture
+def mock_pipeline_service() -> Mock:
+    """Create mock pipeline service with diversity enabled."""
+    service = Mock()
+    service.settings = Mock()
+    service.settings.diversity_enabled = True
+    service.settings.diversity_mmr_lambda = 0.5
+    service.settings.diversity_duplicate_distance = 3
+    return service
+
+
+@pytest.fixture
+def search_context() -> SearchContext:
+    """Create search context for testing."""
+    user_id = uuid4()
+    collection_id = uuid4()
+    search_input = SearchInput(user_id=user_id, collection_id=collection_id, question="Test question?")
+    context = SearchContext(search_input=search_input, user_id=user_id, collection_id=collection_id)
+    context.rewritten_query = "enhanced test question"
+    return context
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestDiversityStage:
+    """Test suite for DiversityStage."""
+
+    async def test_stage_initialization(self, mock_pipeline_service: Mock) -> None:
+        """Test that stage initializes correctly."""
+        stage = DiversityStage(mock_pipeline_service)
+        assert stage.stage_name == "Diversity"
+        assert stage.pipeline_service == mock_pipeline_service
+
+    async def test_removes_near_duplicates(self, mock_pipeline_service: Mock, search_context: SearchContext) -> None:
+        """Test that repeated chunks are dropped, keeping the best scored copy."""
+        best = make_result(SOLAR, 0.9)
+        search_context.query_results = [make_result(SOLAR, 0.7), best, make_result(REEFS, 0.5)]
+
+        stage = DiversityStage(mock_pipeline_service)
+        result = await stage.execute(search_context)
+
+        assert result.success is True
+        assert result.context.query_results[0] is best
+        assert [r.chunk.text for r in result.context.query_results] == [SOLAR, REEFS]
+        metadata = result.context.metadata["diversity"]
+        assert metadata["original_count"] == 3
+        assert metadata["duplicates_removed"] == 1
+        assert metadata["vectors"] == "term"
+
+    async def test_mmr_uses_stored_vectors(self, mock_pipeline_service: Mock, search_context: SearchContext) -> None:
+        """Test that stored vectors promote a different topic over a redundant one."""
+        search_context.query_results = [
+            make_result(SOLAR, 0.9, [1.0, 0.0]),
+            make_result(SOLAR_EFFICIENCY, 0.85, [0.98, 0.2]),
+            make_result(REEFS, 0.7, [0.0, 1.0]),
+        ]
+
+        stage = DiversityStage(mock_pipeline_service)
+        result = await stage.execute(search_context)
+
+        assert result.success is True
+        assert [r.chunk.text for r in result.context.query_results] == [SOLAR, REEFS, SOLAR_EFFICIENCY]
+        assert result.context.metadata["diversity"]["vectors"] == "stored"
+
+    async def test_mmr_uses_stored_ndarray_vectors(
+        self, mock_pipeline_service: Mock, search_context: SearchContext
+    ) -> None:
+        """Test that float32 ndarray vectors from the vector store are used as stored vectors."""
+        search_context.query_results = [
+            make_result(SOLAR, 0.9, np.array([1.0, 0.0], dtype=np.float32)),
+            make_result(SOLAR_EFFICIENCY, 0.85, np.array([0.98, 0.2], dtype=np.float32)),
+            make_result(REEFS, 0.7, np.array([0.0, 1.0], dtype=np.float32)),
+        ]
+
+        stage = DiversityStage(mock_pipeline_service)
+        result = await stage.execute(search_context)
+
+        assert [r.chunk.text for r in result.context.query_results] == [SOLAR, REEFS, SOLAR_EFFICIENCY]
+        assert result.context.metadata["diversity"]["vectors"] == "stored"
+
+    async def test_falls_back_to_term_vectors_when_a_chunk_has_no_vector(
+        self, mock_pipeline_service: Mock, search_context: SearchContext
+    ) -> None:
+        """Test that a candidate without stored vectors switches MMR to term vectors."""
+        unembedded = DocumentChunkWithScore(chunk_id=str(uuid4()), text=REEFS, score=0.7)
+        search_context.query_results = [
+            make_result(SOLAR, 0.9, [1.0, 0.0]),
+            make_result(SOLAR_EFFICIENCY, 0.85, [0.98, 0.2]),
+            QueryResult(chunk=unembedded, score=0.7, embeddings=None),
+        ]
+
+        stage = DiversityStage(mock_pipeline_service)
+        result = await stage.execute(search_context)
+
+        assert result.success is True
+        assert len(result.context.query_results) == 3
+        assert result.context.metadata["diversity"]["vectors"] == "term"
+
+    async def test_top_k_from_config_metadata(self, mock_pipeline_service: Mock, search_context: SearchContext) -> None:
+        """Test that top_k_diversity limits the number of kept documents."""
+        search_context.search_input.config_metadata = {"top_k_diversity": 2, "mmr_lambda": 1.0}
+        search_context.query_results = [
+            make_result(REEFS, 0.5),
+            make_result(SOLAR, 0.9),
+            make_result(SOLAR_EFFICIENCY, 0.8),
+        ]
+
+        stage = DiversityStage(mock_pipeline_service)
+        result = await stage.execute(search_context)
+
+        assert [r.chunk.text for r in result.context.query_results] == [SOLAR, SOLAR_EFFICIENCY]
+
+    async def test_disabled_via_settings(self, mock_pipeline_service: Mock, search_context: SearchContext) -> None:
+        """Test that the stage is skipped when disabled in settings."""
+        mock_pipeline_service.settings.diversity_enabled = False
+        results = [make_result(SOLAR, 0.9), make_result(SOLAR, 0.8)]
+        search_context.query_results = results
+
+        stage = DiversityStage(mock_pipeline_service)
+        result = await stage.execute(search_context)
+
+        assert result.success is True
+        assert result.context.query_results == results
+        assert "diversity" not in result.context.metadata
+
+    async def test_disabled_via_config_metadata(
+        self, mock_pipeline_service: Mock, search_context: SearchContext
+    ) -> None:
+        """Test that the stage is skipped when disabled via config_metadata."""
+        search_context.search_input.config_metadata = {"disable_diversity": True}
+        results = [make_result(SOLAR, 0.9), make_result(SOLAR, 0.8)]
+        search_context.query_results = results
+
+        stage = DiversityStage(mock_pipeline_service)
+        result = await stage.execute(search_context)
+
+        assert result.context.query_results == results
+        assert "diversity" not in result.context.metadata
+
+    async def test_missing_query_results(self, mock_pipeline_service: Mock, search_context: SearchContext) -> None:
+        """Test error handling when query results are missing."""
+        search_context.query_results = None
+
+        stage = DiversityStage(mock_pipeline_service)
+        result = await stage.execute(search_context)
+
+        assert result.success is False
+        assert "Query results not set" in result.error
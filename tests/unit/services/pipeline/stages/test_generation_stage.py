@@ -8,11 +8,14 @@ Tests the answer generation functionality including:
 - Error handling
 """
 
-from unittest.mock import Mock
+import asyncio
+import threading
+from unittest.mock import Mock, patch
 from uuid import uuid4
 
 import pytest
 
+from rag_solution.generation.providers.rate_limiting import AdmissionController
 from rag_solution.schemas.chain_of_thought_schema import ChainOfThoughtOutput, ReasoningStep
 from rag_solution.schemas.llm_usage_schema import LLMUsage, ServiceType
 from rag_solution.schemas.search_schema import SearchInput
@@ -156,6 +159,22 @@ class TestGenerationStage:
 
         mock_pipeline_service._generate_answer.assert_called_once()
 
+    async def test_generation_runs_off_the_event_loop(
+        self, mock_pipeline_service: Mock, search_context_without_cot: SearchContext
+    ) -> None:
+        """The blocking provider call runs in a worker thread, not on the event loop."""
+        mock_pipeline_service._validate_configuration.return_value = (None, Mock(), Mock())
+        mock_pipeline_service._get_templates.return_value = (Mock(id=uuid4()), None)
+        calling_threads: list[threading.Thread] = []
+        mock_pipeline_service._generate_answer.side_effect = lambda *_: (
+            calling_threads.append(threading.current_thread()) or "Generated answer"
+        )
+
+        result = await GenerationStage(mock_pipeline_service).execute(search_context_without_cot)
+
+        assert result.context.generated_answer == "Generated answer"
+        assert calling_threads and calling_threads[0] is not threading.current_thread()
+
     async def test_generation_with_cot(
         self, mock_pipeline_service: Mock, search_context_with_cot: SearchContext
     ) -> None:
@@ -332,6 +351,40 @@ class TestGenerationStage:
         mock_provider.generate_structured_output.assert_called_once()
         mock_provider.track_usage.assert_called_once()
 
+    async def test_structured_output_waits_for_a_saturated_controller_off_the_event_loop(
+        self, mock_pipeline_service: Mock, search_context_with_structured_output: SearchContext
+    ) -> None:
+        """A structured call queued behind async slot holders must not block the loop they release on."""
+        controller = AdmissionController("test", max_concurrency=1)
+        loop_thread = threading.current_thread()
+        structured_answer = StructuredAnswer(answer="Admitted answer", confidence=0.9, citations=[])
+
+        def generate_structured_output(**_kwargs: object) -> tuple[StructuredAnswer, Mock]:
+            assert threading.current_thread() is not loop_thread, "admit() would block the event loop"
+            with controller.admit():
+                return structured_answer, Mock(total_tokens=10)
+
+        mock_provider = Mock()
+        mock_provider.generate_structured_output = Mock(side_effect=generate_structured_output)
+        mock_pipeline_service._validate_configuration.return_value = (None, Mock(), mock_provider)
+        mock_pipeline_service._get_templates.return_value = (Mock(id=uuid4()), None)
+
+        async def hold_slot() -> None:
+            async with controller.admit_async():
+                await asyncio.sleep(0.05)
+
+        holder = asyncio.create_task(hold_slot())
+        await asyncio.sleep(0)
+        assert controller.in_flight == 1
+
+        result = await asyncio.wait_for(
+            GenerationStage(mock_pipeline_service).execute(search_context_with_structured_output), 5
+        )
+        await holder
+
+        assert result.context.structured_answer is structured_answer
+        assert controller.in_flight == 0
+
     async def test_structured_output_fallback_on_not_implemented(
         self, mock_pipeline_service: Mock, search_context_with_structured_output: SearchContext
     ) -> None:
@@ -377,3 +430,45 @@ class TestGenerationStage:
         assert result.context.generated_answer == "Fallback answer after error"
         assert result.context.structured_answer is None
         mock_pipeline_service._generate_answer.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGenerationStageEvaluation:
+    """Test suite for queueing runtime evaluation from GenerationStage."""
+
+    async def test_answer_queued_for_evaluation(
+        self, mock_pipeline_service: Mock, search_context_without_cot: SearchContext
+    ) -> None:
+        """Test the answer is queued for background evaluation when runtime_eval is enabled."""
+        mock_pipeline_service.settings.runtime_eval = True
+        mock_pipeline_service._validate_configuration.return_value = (None, Mock(), Mock())
+        mock_pipeline_service._get_templates.return_value = (Mock(id=uuid4()), None)
+        mock_pipeline_service._generate_answer.return_value = "Generated answer from LLM"
+        queue = Mock()
+        queue.submit.return_value = {"status": "queued", "search_id": "search-1"}
+
+        stage = GenerationStage(mock_pipeline_service)
+        with patch("rag_solution.services.pipeline.stages.generation_stage.get_evaluation_queue", return_value=queue):
+            result = await stage.execute(search_context_without_cot)
+
+        assert result.context.evaluation == {"status": "queued", "search_id": "search-1"}
+        job = queue.submit.call_args.args[0]
+        assert job.answer == "Generated answer from LLM"
+        assert job.context == "Test document 1"
+        assert job.pipeline_id == search_context_without_cot.pipeline_id
+
+    async def test_no_evaluation_by_default(
+        self, mock_pipeline_service: Mock, search_context_without_cot: SearchContext
+    ) -> None:
+        """Test nothing is queued unless runtime_eval is enabled."""
+        mock_pipeline_service._validate_configuration.return_value = (None, Mock(), Mock())
+        mock_pipeline_service._get_templates.return_value = (Mock(id=uuid4()), None)
+        mock_pipeline_service._generate_answer.return_value = "Generated answer from LLM"
+
+        stage = GenerationStage(mock_pipeline_service)
+        with patch("rag_solution.services.pipeline.stages.generation_stage.get_evaluation_queue") as get_queue:
+            result = await stage.execute(search_context_without_cot)
+
+        assert result.context.evaluation is None
+        get_queue.assert_not_called()
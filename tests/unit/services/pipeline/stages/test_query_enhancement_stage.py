@@ -7,7 +7,7 @@ Tests the query enhancement functionality including:
 - Error handling
 """
 
-from unittest.mock import Mock
+from unittest.mock import ANY, Mock
 from uuid import uuid4
 
 import pytest
@@ -138,3 +138,33 @@ class TestQueryEnhancementStage:
 
         assert result.success is True
         assert result.context.rewritten_query == "enhanced what is ml"
+
+    async def test_speculative_retrieval_started(
+        self, mock_pipeline_service: Mock, search_context: SearchContext
+    ) -> None:
+        """Test retrieval on the cleaned query starts before the rewrite when enabled."""
+        mock_pipeline_service.settings.speculative_retrieval_enabled = True
+        mock_pipeline_service.settings.number_of_results = 7
+        mock_pipeline_service.retrieve_documents_by_id = Mock(return_value=["result"])
+
+        stage = QueryEnhancementStage(mock_pipeline_service)
+        result = await stage.execute(search_context)
+
+        assert result.success is True
+        assert result.context.speculative_query == "what is ml?"
+        assert await result.context.speculative_retrieval == ["result"]
+        mock_pipeline_service.retrieve_documents_by_id.assert_called_once_with(
+            query="what is ml?", collection_id=search_context.collection_id, top_k=7, db=ANY
+        )
+        # The worker thread must not share the request's session
+        assert mock_pipeline_service.retrieve_documents_by_id.call_args.kwargs["db"] is not mock_pipeline_service.db
+
+    async def test_speculative_retrieval_disabled_by_default(
+        self, mock_pipeline_service: Mock, search_context: SearchContext
+    ) -> None:
+        """Test no speculative retrieval is started unless enabled in settings."""
+        stage = QueryEnhancementStage(mock_pipeline_service)
+        result = await stage.execute(search_context)
+
+        assert result.context.speculative_retrieval is None
+        mock_pipeline_service.retrieve_documents_by_id.assert_not_called()
@@ -7,14 +7,32 @@ Tests the document retrieval functionality including:
 - Error handling
 """
 
-from unittest.mock import MagicMock, Mock
+import asyncio
+import threading
+from unittest.mock import MagicMock, Mock, patch
 from uuid import uuid4
 
 import pytest
 
+from core.config import Settings
 from rag_solution.schemas.search_schema import SearchInput
 from rag_solution.services.pipeline.search_context import SearchContext
-from rag_solution.services.pipeline.stages.retrieval_stage import RetrievalStage
+from rag_solution.services.pipeline.stages.retrieval_stage import RetrievalStage, merge_query_results
+from vectordbs.data_types import DocumentChunkWithScore, QueryResult
+from vectordbs.utils.embeddings import get_embeddings_for_vector_store, reset_embedding_batchers
+
+
+def make_result(chunk_id: str, score: float) -> QueryResult:
+    """Create a query result for a chunk."""
+    return QueryResult(chunk=DocumentChunkWithScore(chunk_id=chunk_id, text=chunk_id, score=score), score=score)
+
+
+def speculate(context: SearchContext, query: str, results: list[QueryResult]) -> None:
+    """Attach a completed speculative retrieval to the context."""
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(results)
+    context.speculative_query = query
+    context.speculative_retrieval = future
 
 
 @pytest.fixture
@@ -166,3 +184,138 @@ class TestRetrievalStage:
 
         assert result.success is True
         assert result.context.metadata["retrieval"]["collection_id"] == str(collection_id)
+
+    async def test_speculative_results_reused_for_unchanged_query(
+        self, mock_pipeline_service: Mock, search_context: SearchContext
+    ) -> None:
+        """Test the speculative results are used when the rewrite did not change the query."""
+        speculative = [make_result("a", 0.9)]
+        speculate(search_context, "enhanced test question", speculative)
+
+        stage = RetrievalStage(mock_pipeline_service)
+        result = await stage.execute(search_context)
+
+        assert result.success is True
+        assert result.context.query_results == speculative
+        assert result.context.speculative_retrieval is None
+        assert result.context.metadata["retrieval"]["speculative"]["outcome"] == "reused"
+        mock_pipeline_service.retrieve_documents_by_id.assert_not_called()
+
+    async def test_speculative_results_reused_for_minor_rewrite(
+        self, mock_pipeline_service: Mock, search_context: SearchContext
+    ) -> None:
+        """Test a rewrite above the similarity threshold keeps the speculative results."""
+        mock_pipeline_service.settings.speculative_retrieval_similarity = 0.9
+        speculative = [make_result("a", 0.9)]
+        speculate(search_context, "test question", speculative)
+
+        stage = RetrievalStage(mock_pipeline_service)
+        with patch(
+            "rag_solution.services.pipeline.stages.retrieval_stage.get_embeddings_for_vector_store",
+            return_value=[[1.0, 0.0], [0.99, 0.1]],
+        ):
+            result = await stage.execute(search_context)
+
+        assert result.context.query_results == speculative
+        assert result.context.metadata["retrieval"]["speculative"]["similarity"] > 0.9
+        mock_pipeline_service.retrieve_documents_by_id.assert_not_called()
+
+    async def test_query_similarity_embeds_off_the_event_loop(
+        self, mock_pipeline_service: Mock, search_context: SearchContext
+    ) -> None:
+        """Test the blocking embedding call for the similarity check runs in a worker thread."""
+        mock_pipeline_service.settings.speculative_retrieval_similarity = 0.9
+        speculate(search_context, "test question", [make_result("a", 0.9)])
+        embedding_threads: list[threading.Thread] = []
+
+        def embed(*_args, **_kwargs):
+            embedding_threads.append(threading.current_thread())
+            return [[1.0, 0.0], [1.0, 0.0]]
+
+        stage = RetrievalStage(mock_pipeline_service)
+        with patch(
+            "rag_solution.services.pipeline.stages.retrieval_stage.get_embeddings_for_vector_store", side_effect=embed
+        ):
+            await stage.execute(search_context)
+
+        assert embedding_threads and embedding_threads[0] is not threading.current_thread()
+
+    async def test_concurrent_retrievals_share_one_embedding_call(
+        self, mock_pipeline_service: Mock, search_context: SearchContext
+    ) -> None:
+        """Test retrieval runs in worker threads, so concurrent searches join one embedding micro-batch."""
+        settings = Mock(spec=Settings)
+        settings.llm_provider_name = "watsonx"
+        settings.embedding_micro_batch_enabled = True
+        settings.embedding_micro_batch_wait_ms = 2000.0
+        settings.embedding_batch_size = 2
+        mock_pipeline_service.retrieve_documents_by_id.side_effect = lambda **kwargs: [
+            make_result(kwargs["query"], get_embeddings_for_vector_store(kwargs["query"], settings)[0][0])
+        ]
+        other_context = SearchContext(
+            search_input=search_context.search_input,
+            user_id=search_context.user_id,
+            collection_id=search_context.collection_id,
+        )
+        other_context.rewritten_query = "another question"
+        stage = RetrievalStage(mock_pipeline_service)
+
+        try:
+            with patch("vectordbs.utils.embeddings._embed_with_provider", return_value=[[0.5], [0.5]]) as embed:
+                results = await asyncio.wait_for(
+                    asyncio.gather(stage.execute(search_context), stage.execute(other_context)), 5
+                )
+        finally:
+            reset_embedding_batchers()
+
+        embed.assert_called_once()
+        assert sorted(embed.call_args[0][0]) == ["another question", "enhanced test question"]
+        assert all(result.success for result in results)
+
+    async def test_speculative_results_merged_for_major_rewrite(
+        self, mock_pipeline_service: Mock, search_context: SearchContext
+    ) -> None:
+        """Test a rewrite below the threshold triggers a second retrieval that is merged."""
+        mock_pipeline_service.settings.speculative_retrieval_similarity = 0.9
+        speculate(search_context, "test question", [make_result("a", 0.5), make_result("b", 0.7)])
+        mock_pipeline_service.retrieve_documents_by_id.return_value = [make_result("a", 0.8), make_result("c", 0.6)]
+
+        stage = RetrievalStage(mock_pipeline_service)
+        with patch(
+            "rag_solution.services.pipeline.stages.retrieval_stage.get_embeddings_for_vector_store",
+            return_value=[[1.0, 0.0], [0.0, 1.0]],
+        ):
+            result = await stage.execute(search_context)
+
+        assert [(r.chunk.chunk_id, r.score) for r in result.context.query_results] == [
+            ("a", 0.8),
+            ("b", 0.7),
+            ("c", 0.6),
+        ]
+        assert result.context.metadata["retrieval"]["speculative"]["outcome"] == "merged"
+        mock_pipeline_service.retrieve_documents_by_id.assert_called_once_with(
+            query="enhanced test question", collection_id=search_context.collection_id, top_k=10
+        )
+
+    async def test_failed_speculation_falls_back(
+        self, mock_pipeline_service: Mock, search_context: SearchContext
+    ) -> None:
+        """Test a failed speculative retrieval falls back to retrieving with the rewritten query."""
+        future = asyncio.get_running_loop().create_future()
+        future.set_exception(RuntimeError("vector store down"))
+        search_context.speculative_query = "test question"
+        search_context.speculative_retrieval = future
+        mock_pipeline_service.retrieve_documents_by_id.return_value = [make_result("a", 0.8)]
+
+        stage = RetrievalStage(mock_pipeline_service)
+        result = await stage.execute(search_context)
+
+        assert result.success is True
+        assert len(result.context.query_results) == 1
+        assert result.context.metadata["retrieval"]["speculative"]["outcome"] == "failed"
+
+    async def test_merge_query_results_limits_top_k(self) -> None:
+        """Test merging keeps the best score per chunk and at most top_k results."""
+        merged = merge_query_results([make_result("a", 0.2), make_result("b", 0.9)], [make_result("a", 0.5)], top_k=1)
+
+        assert [(r.chunk.chunk_id, r.score) for r in merged] == [("b", 0.9)]
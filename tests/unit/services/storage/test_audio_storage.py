@@ -851,3 +851,81 @@ class TestLocalFileStorageIntegration:
             # Retrieve finds first available format
             retrieved = await storage.retrieve_audio(podcast_id, user_id)
             assert retrieved == audio_data
+
+
+@pytest.mark.unit
+class TestStoreAudioFile:
+    """Unit tests for storing pre-encoded audio files."""
+
+    @pytest.mark.asyncio
+    async def test_local_staging_path_is_next_to_final_path(self) -> None:
+        """Unit: Staging file lives in the podcast directory and is not served."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = LocalFileStorage(base_path=tmpdir)
+            user_id = uuid4()
+            podcast_id = uuid4()
+
+            staging_path = storage.create_staging_path(podcast_id, user_id, "mp3")
+            staging_path.write_bytes(b"partial")
+
+            assert staging_path.parent == storage._get_audio_path(podcast_id, user_id, "mp3").parent
+            assert staging_path.parent.exists()
+            assert await storage.exists(podcast_id, user_id) is False
+
+    @pytest.mark.asyncio
+    async def test_local_store_audio_file_moves_file(self) -> None:
+        """Unit: store_audio_file moves the staged file into place."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = LocalFileStorage(base_path=tmpdir)
+            user_id = uuid4()
+            podcast_id = uuid4()
+            staging_path = storage.create_staging_path(podcast_id, user_id, "mp3")
+            staging_path.write_bytes(b"encoded_audio")
+
+            url = await storage.store_audio_file(podcast_id, user_id, staging_path, "mp3")
+
+            assert url == f"/api/podcasts/{podcast_id}/audio"
+            assert not staging_path.exists()
+            assert await storage.retrieve_audio(podcast_id, user_id) == b"encoded_audio"
+
+    @pytest.mark.asyncio
+    async def test_local_store_audio_file_missing_source(self) -> None:
+        """Unit: store_audio_file raises AudioStorageError when the file is missing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = LocalFileStorage(base_path=tmpdir)
+
+            with pytest.raises(AudioStorageError, match="Failed to store audio"):
+                await storage.store_audio_file(uuid4(), uuid4(), Path(tmpdir) / "missing.mp3", "mp3")
+
+    @pytest.mark.asyncio
+    async def test_default_store_audio_file_delegates_to_store_audio(self) -> None:
+        """Unit: Base implementation reads the file, calls store_audio and removes the file."""
+
+        class BytesOnlyStorage(AudioStorageBase):
+            def __init__(self) -> None:
+                self.stored: dict[tuple, bytes] = {}
+
+            async def store_audio(self, podcast_id, user_id, audio_data, audio_format):  # type: ignore[no-untyped-def]
+                self.stored[(podcast_id, user_id, audio_format)] = audio_data
+                return "stored"
+
+            async def retrieve_audio(self, podcast_id, user_id):  # type: ignore[no-untyped-def]
+                return b""
+
+            async def delete_audio(self, podcast_id, user_id):  # type: ignore[no-untyped-def]
+                return False
+
+            async def exists(self, podcast_id, user_id):  # type: ignore[no-untyped-def]
+                return False
+
+        storage = BytesOnlyStorage()
+        user_id = uuid4()
+        podcast_id = uuid4()
+        staging_path = storage.create_staging_path(podcast_id, user_id, "wav")
+        staging_path.write_bytes(b"wav_bytes")
+
+        url = await storage.store_audio_file(podcast_id, user_id, staging_path, "wav")
+
+        assert url == "stored"
+        assert storage.stored == {(podcast_id, user_id, "wav"): b"wav_bytes"}
+        assert not staging_path.exists()
@@ -0,0 +1,133 @@
+"""Unit tests for the content-addressed TTS segment cache."""
+
+import os
+from pathlib import Path
+
+import pytest
+from pydub import AudioSegment
+from pydub.generators import Sine
+
+from rag_solution.services.storage.tts_segment_cache import (
+    TTSSegmentCache,
+    get_tts_segment_cache,
+    normalize_text,
+    reset_tts_segment_caches,
+)
+
+
+def _segment(duration_ms: int = 200, freq: float = 440.0) -> AudioSegment:
+    return Sine(freq).to_audio_segment(duration=duration_ms).set_frame_rate(24000).set_channels(1)
+
+
+def _key(text: str, **overrides: object) -> str:
+    params: dict = {
+        "provider": "openai",
+        "model": "tts-1-hd",
+        "voice_id": "alloy",
+        "speed": 1.0,
+        "audio_format": "mp3",
+        "text": text,
+    }
+    params.update(overrides)
+    return TTSSegmentCache.make_key(**params)
+
+
+@pytest.mark.unit
+class TestSegmentKeys:
+    """Tests for segment content addressing."""
+
+    def test_whitespace_and_unicode_form_are_normalized(self) -> None:
+        """Reflowed text hashes to the same key."""
+        assert normalize_text("  Hello\n  world ") == "Hello world"
+        assert _key("Café time") == _key("Café   time")
+
+    @pytest.mark.parametrize(
+        "override",
+        [
+            {"provider": "elevenlabs"},
+            {"model": "tts-1"},
+            {"voice_id": "onyx"},
+            {"speed": 1.25},
+            {"audio_format": "wav"},
+            {"text": "Hello world!"},
+        ],
+    )
+    def test_every_component_changes_the_key(self, override: dict) -> None:
+        """Any change that affects the audio produces a different key."""
+        assert _key("Hello world") != _key(**{"text": "Hello world", **override})
+
+
+@pytest.mark.unit
+class TestTTSSegmentCache:
+    """Tests for TTSSegmentCache storage and eviction."""
+
+    def test_round_trip_is_sample_exact(self, tmp_path: Path) -> None:
+        """A cached segment decodes to exactly the stored samples."""
+        cache = TTSSegmentCache(tmp_path)
+        segment = _segment()
+
+        cache.put("a" * 64, segment)
+        cached = cache.get("a" * 64)
+
+        assert cached is not None
+        assert cached.raw_data == segment.raw_data
+        assert cached.frame_rate == segment.frame_rate
+        assert cache.stats()["hits"] == 1
+
+    def test_miss_returns_none(self, tmp_path: Path) -> None:
+        """Unknown keys are misses."""
+        cache = TTSSegmentCache(tmp_path)
+
+        assert cache.get("b" * 64) is None
+        assert cache.stats()["misses"] == 1
+
+    def test_lru_eviction_by_size(self, tmp_path: Path) -> None:
+        """The least recently used segment is evicted when over budget."""
+        cache = TTSSegmentCache(tmp_path)
+        cache.put("a" * 64, _segment())
+        segment_size = cache.stats()["bytes"]
+        cache.max_bytes = segment_size * 2
+
+        cache.put("b" * 64, _segment())
+        cache.get("a" * 64)  # "b" is now least recently used
+        cache.put("c" * 64, _segment())
+
+        assert cache.get("b" * 64) is None
+        assert cache.get("a" * 64) is not None
+        assert cache.get("c" * 64) is not None
+        assert cache.stats()["bytes"] == segment_size * 2
+        assert not (tmp_path / "bb" / f"{'b' * 64}.wav").exists()
+
+    def test_existing_segments_are_indexed_on_startup(self, tmp_path: Path) -> None:
+        """Segments written by an earlier process are reused and evicted oldest first."""
+        first = TTSSegmentCache(tmp_path)
+        first.put("a" * 64, _segment())
+        first.put("b" * 64, _segment())
+        old = tmp_path / "aa" / f"{'a' * 64}.wav"
+        os.utime(old, (1, 1))
+
+        second = TTSSegmentCache(tmp_path, max_bytes=first.stats()["bytes"] // 2)
+
+        assert second.get("a" * 64) is None
+        assert second.get("b" * 64) is not None
+
+    def test_removed_file_is_a_miss(self, tmp_path: Path) -> None:
+        """A segment deleted behind the cache's back is treated as a miss."""
+        cache = TTSSegmentCache(tmp_path)
+        cache.put("a" * 64, _segment())
+        (tmp_path / "aa" / f"{'a' * 64}.wav").unlink()
+
+        assert cache.get("a" * 64) is None
+        assert cache.stats()["segments"] == 0
+
+    def test_shared_cache_per_directory(self, tmp_path: Path) -> None:
+        """get_tts_segment_cache returns one instance per directory."""
+        reset_tts_segment_caches()
+        try:
+            first = get_tts_segment_cache(tmp_path, max_bytes=1024)
+            second = get_tts_segment_cache(tmp_path, max_bytes=2048)
+
+            assert first is second
+            assert second.max_bytes == 2048
+        finally:
+            reset_tts_segment_caches()
@@ -0,0 +1,230 @@
+"""Unit tests for the per-provider LLM admission controller."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from rag_solution.generation.providers.rate_limiting import (
+    AdmissionController,
+    LLMPriority,
+    get_admission_controller,
+    get_llm_priority,
+    is_rate_limit_error,
+    llm_priority,
+    reset_admission_controllers,
+    with_llm_priority,
+)
+
+
+class RateLimitError(Exception):
+    """Stand-in for an SDK error carrying an HTTP status code."""
+
+    status_code = 429
+
+
+@pytest.mark.unit
+class TestAIMD:
+    """Tests for adaptive concurrency."""
+
+    def test_rate_limit_halves_limit(self) -> None:
+        controller = AdmissionController("test", max_concurrency=8)
+
+        with pytest.raises(RateLimitError), controller.admit():
+            raise RateLimitError("too many requests")
+
+        assert controller.concurrency_limit == 4
+        assert controller.rate_limited == 1
+        assert controller.in_flight == 0
+
+    def test_limit_never_drops_below_minimum(self) -> None:
+        controller = AdmissionController("test", min_concurrency=2, max_concurrency=8)
+
+        for _ in range(10):
+            controller.record_rate_limited()
+
+        assert controller.concurrency_limit == 2
+
+    def test_success_grows_limit_back(self) -> None:
+        controller = AdmissionController("test", max_concurrency=4)
+        controller.record_rate_limited()
+        assert controller.concurrency_limit == 2
+
+        for _ in range(10):
+            with controller.admit():
+                pass
+
+        assert controller.concurrency_limit == 4
+
+    def test_slow_call_shrinks_limit(self) -> None:
+        controller = AdmissionController("test", max_concurrency=8, target_latency_seconds=0.001)
+
+        with controller.admit():
+            time.sleep(0.01)
+
+        assert controller.concurrency_limit == 4
+
+    def test_other_errors_do_not_change_limit(self) -> None:
+        controller = AdmissionController("test", max_concurrency=8)
+
+        with pytest.raises(ValueError), controller.admit():
+            raise ValueError("bad prompt")
+
+        assert controller.concurrency_limit == 8
+
+    def test_is_rate_limit_error(self) -> None:
+        assert is_rate_limit_error(RateLimitError())
+        assert is_rate_limit_error(Exception("Error 429: rate_limit_reached_requests"))
+        assert not is_rate_limit_error(Exception("500 internal error"))
+
+
+@pytest.mark.unit
+class TestAdmission:
+    """Tests for slot accounting and priority ordering."""
+
+    def test_batch_slots_are_capped_at_limit(self) -> None:
+        controller = AdmissionController("test", max_concurrency=4)
+
+        with controller.admit(slots=20) as slots:
+            assert slots == 4
+            assert controller.in_flight == 4
+
+        assert controller.in_flight == 0
+
+    def test_waiters_are_admitted_by_priority(self) -> None:
+        controller = AdmissionController("test", max_concurrency=1)
+        order: list[str] = []
+        release = threading.Event()
+
+        def holder() -> None:
+            with controller.admit():
+                release.wait(timeout=5)
+
+        def caller(name: str, priority: LLMPriority) -> None:
+            with controller.admit(priority=priority):
+                order.append(name)
+
+        first = threading.Thread(target=holder)
+        first.start()
+        while controller.in_flight == 0:
+            time.sleep(0.001)
+
+        background = threading.Thread(target=caller, args=("background", LLMPriority.BACKGROUND))
+        background.start()
+        time.sleep(0.02)
+        interactive = threading.Thread(target=caller, args=("interactive", LLMPriority.INTERACTIVE))
+        interactive.start()
+        time.sleep(0.02)
+
+        release.set()
+        for thread in (first, background, interactive):
+            thread.join(timeout=5)
+
+        assert order == ["interactive", "background"]
+
+    async def test_async_admission_limits_concurrency(self) -> None:
+        controller = AdmissionController("test", max_concurrency=2)
+        active = 0
+        peak = 0
+
+        async def call() -> None:
+            nonlocal active, peak
+            async with controller.admit_async():
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*[call() for _ in range(6)])
+
+        assert peak == 2
+        assert controller.in_flight == 0
+
+    async def test_cancelled_waiter_releases_nothing(self) -> None:
+        controller = AdmissionController("test", max_concurrency=1)
+
+        async def hold() -> None:
+            async with controller.admit_async():
+                await asyncio.sleep(0.05)
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(hold())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        await asyncio.gather(holder, waiter, return_exceptions=True)
+
+        assert controller.in_flight == 0
+        async with controller.admit_async():
+            assert controller.in_flight == 1
+
+    def test_request_budget_paces_calls(self) -> None:
+        controller = AdmissionController("test", requests_per_minute=600)  # 10/s, burst of 100
+        controller.requests._tokens = 0
+
+        start = time.monotonic()
+        with controller.admit():
+            pass
+
+        assert time.monotonic() - start >= 0.05
+
+
+@pytest.mark.unit
+class TestPriorityContext:
+    """Tests for the priority context helpers."""
+
+    def test_default_is_normal(self) -> None:
+        assert get_llm_priority() == LLMPriority.NORMAL
+
+    def test_context_manager_sets_and_restores(self) -> None:
+        with llm_priority(LLMPriority.BACKGROUND):
+            assert get_llm_priority() == LLMPriority.BACKGROUND
+        assert get_llm_priority() == LLMPriority.NORMAL
+
+    def test_non_overriding_priority_keeps_outer_choice(self) -> None:
+        with llm_priority(LLMPriority.BACKGROUND), llm_priority(LLMPriority.INTERACTIVE, override=False):
+            assert get_llm_priority() == LLMPriority.BACKGROUND
+
+        with llm_priority(LLMPriority.INTERACTIVE, override=False):
+            assert get_llm_priority() == LLMPriority.INTERACTIVE
+
+    async def test_decorator_on_coroutine(self) -> None:
+        @with_llm_priority(LLMPriority.BACKGROUND)
+        async def job() -> LLMPriority:
+            return get_llm_priority()
+
+        assert await job() == LLMPriority.BACKGROUND
+        assert get_llm_priority() == LLMPriority.NORMAL
+
+
+@pytest.mark.unit
+class TestGetAdmissionController:
+    """Tests for the process-wide controller registry."""
+
+    def teardown_method(self) -> None:
+        reset_admission_controllers()
+
+    @staticmethod
+    def _settings(concurrency: int = 8) -> Mock:
+        settings = Mock()
+        settings.llm_requests_per_minute = 0
+        settings.llm_tokens_per_minute = 0
+        settings.llm_min_concurrency = 1
+        settings.llm_concurrency = concurrency
+        settings.llm_target_latency_seconds = 0
+        return settings
+
+    def test_shared_per_provider(self) -> None:
+        settings = self._settings()
+
+        assert get_admission_controller("watsonx", settings) is get_admission_controller("watsonx", settings)
+        assert get_admission_controller("watsonx", settings) is not get_admission_controller("openai", settings)
+
+    def test_replaced_when_limits_change(self) -> None:
+        first = get_admission_controller("watsonx", self._settings(8))
+        second = get_admission_controller("watsonx", self._settings(4))
+
+        assert first is not second
+        assert second.max_concurrency == 4
@@ -0,0 +1,44 @@
+"""Unit tests for the shared background task helpers."""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from rag_solution.services.background_tasks import PeriodicTask
+
+
+class _CountingTask(PeriodicTask):
+    task_name = "counting-task"
+
+    def __init__(self, interval_seconds: float, job: Mock) -> None:
+        super().__init__(interval_seconds)
+        self.job = job
+
+    def run_once(self) -> None:
+        self.job()
+
+
+@pytest.mark.unit
+class TestPeriodicTask:
+    """Test cases for PeriodicTask."""
+
+    async def test_start_is_idempotent(self) -> None:
+        """Test a running task is not started twice."""
+        task = _CountingTask(60, Mock())
+
+        assert task.start() is True
+        assert task.start() is False
+        await task.stop()
+
+        assert task._task is None
+
+    async def test_failed_runs_do_not_stop_the_task(self) -> None:
+        """Test the job keeps running after an exception."""
+        job = Mock(side_effect=[RuntimeError("database unavailable"), None, None, None, None, None])
+        task = _CountingTask(0.01, job)
+
+        task.start()
+        await asyncio.sleep(0.1)
+        await task.stop()
+
+        assert job.call_count >= 2
@@ -21,6 +21,7 @@ from rag_solution.schemas.collection_schema import CollectionInput, CollectionSt
 from rag_solution.schemas.file_schema import FileOutput
 from rag_solution.schemas.llm_parameters_schema import LLMParametersInput
 from rag_solution.services.collection_service import CollectionService
+from vectordbs.data_types import Document, DocumentChunk
 from fastapi import BackgroundTasks, UploadFile
 from sqlalchemy.orm import Session
 
@@ -556,9 +557,12 @@ class TestCollectionService:
 
     @pytest.mark.asyncio
     async def test_process_and_ingest_documents_success(self, collection_service):
-        """Test successful process and ingest documents."""
+        """Test successful process and ingest documents records the chunk count of each document."""
         collection_id = uuid4()
-        documents = [Mock(), Mock()]
+        documents = [
+            Document(document_id="doc1", chunks=[DocumentChunk(chunk_id="c1"), DocumentChunk(chunk_id="c2")]),
+            Document(document_id="doc2", chunks=[DocumentChunk(chunk_id="c3")]),
+        ]
         vector_db_name = "test_db"
         document_ids = ["doc1", "doc2"]
         file_paths = ["/path/to/file1.pdf", "/path/to/file2.pdf"] # Must be a list of strings
@@ -575,6 +579,9 @@ class TestCollectionService:
         # Assert
         assert result == documents
         # FIX: Removed file_management_service.get_files_by_collection assertion
+        collection_service.collection_repository.record_chunk_counts.assert_called_once_with(
+            collection_id, {"doc1": 2, "doc2": 1}
+        )
 
     @pytest.mark.asyncio
     async def test_process_and_ingest_documents_error(self, collection_service):
@@ -707,3 +714,56 @@ class TestCollectionService:
             await collection_service.process_documents(
                 file_paths, collection_id, vector_db_name, document_ids, user_id
             )
+
+    def test_get_collection_reads_chunk_counts_from_repository(self, collection_service):
+        """Test collection reads do not count chunks in the vector store."""
+        collection_id = uuid4()
+
+        collection_service.get_collection(collection_id)
+
+        collection_service.collection_repository.get.assert_called_once_with(collection_id)
+        collection_service.vector_store.count_document_chunks.assert_not_called()
+
+    def test_get_collection_summary(self, collection_service):
+        """Test the summary comes from the collection row alone."""
+        collection_id = uuid4()
+        summary = Mock()
+        collection_service.collection_repository.get_summary.return_value = summary
+
+        assert collection_service.get_collection_summary(collection_id) is summary
+        collection_service.collection_repository.get.assert_not_called()
+
+    def test_reconcile_chunk_stats_recounts_from_vector_store(self, collection_service):
+        """Test reconciliation replaces the stored counts with the vector store counts."""
+        collection_id = uuid4()
+        collection_service.collection_repository.get_summary.return_value = Mock(vector_db_name="test_db")
+        collection_service.file_management_service.get_files_by_collection.return_value = [
+            Mock(document_id="doc1"),
+            Mock(document_id=None),
+            Mock(document_id="doc2"),
+        ]
+        collection_service.vector_store.count_chunks_by_document.return_value = {"doc1": 4, "doc2": 0}
+
+        collection_service.reconcile_chunk_stats(collection_id)
+
+        collection_service.vector_store.count_chunks_by_document.assert_called_once_with("test_db", ["doc1", "doc2"])
+        collection_service.collection_repository.record_chunk_counts.assert_called_once_with(
+            collection_id, {"doc1": 4, "doc2": 0}, replace=True, reconciled=True
+        )
+
+    def test_reconcile_all_chunk_stats_skips_unfinished_and_collects_errors(self, collection_service):
+        """Test one failing collection does not stop reconciliation of the others."""
+        completed, failing, processing = (
+            Mock(id=uuid4(), status=CollectionStatus.COMPLETED),
+            Mock(id=uuid4(), status=CollectionStatus.COMPLETED),
+            Mock(id=uuid4(), status=CollectionStatus.PROCESSING),
+        )
+        collection_service.collection_repository.get_all_collections.return_value = [completed, failing, processing]
+        collection_service.reconcile_chunk_stats = Mock(side_effect=[None, RuntimeError("milvus down")])
+
+        summary = collection_service.reconcile_all_chunk_stats()
+
+        assert summary["reconciled"] == 1
+        assert len(summary["errors"]) == 1
+        assert "milvus down" in summary["errors"][0]
+        assert collection_service.reconcile_chunk_stats.call_count == 2
@@ -0,0 +1,45 @@
+"""Unit tests for the background collection chunk stats reconciliation."""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+from rag_solution.services.collection_stats_reconciler import CollectionStatsReconciler
+
+
+@pytest.mark.unit
+class TestCollectionStatsReconciler:
+    """Test cases for CollectionStatsReconciler."""
+
+    def test_reconcile_uses_fresh_session(self) -> None:
+        """Test each run reconciles with its own session and closes it."""
+        session = Mock()
+        reconciler = CollectionStatsReconciler(Mock(), 60, session_factory=lambda: session)
+
+        with patch("rag_solution.services.collection_service.CollectionService") as service_class:
+            service_class.return_value.reconcile_all_chunk_stats.return_value = {"reconciled": 2, "errors": []}
+            summary = reconciler.reconcile()
+
+        assert summary["reconciled"] == 2
+        service_class.assert_called_once_with(session, reconciler.settings)
+        session.close.assert_called_once()
+
+    async def test_disabled_interval_does_not_start(self) -> None:
+        """Test an interval of zero disables the background job."""
+        reconciler = CollectionStatsReconciler(Mock(), 0, session_factory=Mock())
+
+        reconciler.start()
+
+        assert reconciler._task is None
+
+    async def test_runs_periodically_until_stopped(self) -> None:
+        """Test the job keeps running after a failed run and stops cleanly."""
+        reconciler = CollectionStatsReconciler(Mock(), 0.01, session_factory=Mock())
+        reconciler.reconcile = Mock(side_effect=[RuntimeError("database unavailable"), {}, {}, {}, {}, {}])
+
+        reconciler.start()
+        await asyncio.sleep(0.1)
+        await reconciler.stop()
+
+        assert reconciler.reconcile.call_count >= 2
+        assert reconciler._task is None
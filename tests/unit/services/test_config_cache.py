@@ -1,101 +1,212 @@
-"""Unit tests for ConfigCache service.
+"""Unit tests for the two-tier configuration cache."""
 
-Tests request-scoped caching behavior for read-mostly configuration data.
-"""
-
-import uuid
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import MagicMock, Mock, patch
+from uuid import uuid4
 
 import pytest
 
-from rag_solution.services.config_cache import ConfigCache
+from core.request_context import RequestContext
+from rag_solution.services import config_cache
+from rag_solution.services.config_cache import (
+    LLM_PROVIDER,
+    PIPELINE,
+    PROMPT_TEMPLATE,
+    ConfigCache,
+    ConfigCacheListener,
+    cached_config,
+    get_config_cache,
+    invalidate_config,
+)
+
+
+def _settings(**overrides) -> Mock:
+    values = {
+        "config_cache_enabled": True,
+        "config_cache_max_entries": 10,
+        "config_cache_ttl_seconds": 60.0,
+        "config_cache_notify_enabled": True,
+        "config_cache_notify_channel": "rag_config_cache",
+    }
+    values.update(overrides)
+    return Mock(**values)
 
 
 @pytest.mark.unit
 class TestConfigCache:
-    """Tests for ConfigCache per-request caching."""
+    """Tests for ConfigCache hits, namespace invalidation and bounds."""
 
     def setup_method(self) -> None:
-        self.mock_db = MagicMock()
-        self.cache = ConfigCache(self.mock_db)
-
-    @patch("rag_solution.services.llm_provider_service.LLMProviderService")
-    def test_caches_on_second_call(self, mock_provider_cls: MagicMock) -> None:
-        """Second call returns cached value without querying the service again."""
-        mock_service = MagicMock()
-        mock_service.get_default_provider.return_value = {"name": "watsonx"}
-        mock_provider_cls.return_value = mock_service
-
-        result1 = self.cache.get_default_provider()
-        result2 = self.cache.get_default_provider()
-
-        assert result1 == {"name": "watsonx"}
-        assert result2 == {"name": "watsonx"}
-        # Service constructor called only once (first call), not on the cached second call
-        mock_provider_cls.assert_called_once_with(self.mock_db)
-        mock_service.get_default_provider.assert_called_once()
-
-    @patch("rag_solution.services.llm_provider_service.LLMProviderService")
-    def test_different_users_separate_entries(self, mock_provider_cls: MagicMock) -> None:
-        """Different user IDs result in separate cache entries, both queried."""
-        user_a = uuid.uuid4()
-        user_b = uuid.uuid4()
-        mock_service = MagicMock()
-        mock_service.get_user_provider.side_effect = [
-            {"provider": "a"},
-            {"provider": "b"},
-        ]
-        mock_provider_cls.return_value = mock_service
-
-        result_a = self.cache.get_user_provider(user_a)
-        result_b = self.cache.get_user_provider(user_b)
-
-        assert result_a == {"provider": "a"}
-        assert result_b == {"provider": "b"}
-        assert mock_service.get_user_provider.call_count == 2
-
-    @patch("rag_solution.services.llm_provider_service.LLMProviderService")
-    def test_invalidate_clears_all(self, mock_provider_cls: MagicMock) -> None:
-        """invalidate() with no key clears entire cache, forcing re-query."""
-        mock_service = MagicMock()
-        mock_service.get_default_provider.side_effect = [
-            {"name": "watsonx"},
-            {"name": "watsonx-v2"},
-        ]
-        mock_provider_cls.return_value = mock_service
-
-        result1 = self.cache.get_default_provider()
-        assert result1 == {"name": "watsonx"}
-
-        self.cache.invalidate()
-
-        result2 = self.cache.get_default_provider()
-        assert result2 == {"name": "watsonx-v2"}
-        assert mock_service.get_default_provider.call_count == 2
-
-    @patch("rag_solution.services.llm_provider_service.LLMProviderService")
-    def test_invalidate_specific_key(self, mock_provider_cls: MagicMock) -> None:
-        """invalidate(key) clears only that key; other cached entries remain."""
-        user_a = uuid.uuid4()
-        user_b = uuid.uuid4()
-        mock_service = MagicMock()
-        mock_service.get_user_provider.side_effect = [
-            {"provider": "a"},
-            {"provider": "b"},
-            {"provider": "a-refreshed"},
-        ]
-        mock_provider_cls.return_value = mock_service
-
-        self.cache.get_user_provider(user_a)
-        self.cache.get_user_provider(user_b)
-
-        # Invalidate only user_a's entry
-        self.cache.invalidate(f"provider:{user_a}")
-
-        result_a = self.cache.get_user_provider(user_a)
-        result_b = self.cache.get_user_provider(user_b)
-
-        # user_a was re-queried, user_b still cached
-        assert result_a == {"provider": "a-refreshed"}
-        assert result_b == {"provider": "b"}
-        assert mock_service.get_user_provider.call_count == 3
+        self.cache = ConfigCache(max_entries=2, ttl_seconds=0)
+
+    def test_loads_once_per_key(self) -> None:
+        loader = Mock(return_value={"name": "watsonx"})
+
+        first = self.cache.get_or_load(LLM_PROVIDER, "default", loader)
+        second = self.cache.get_or_load(LLM_PROVIDER, "default", loader)
+
+        assert first is second
+        loader.assert_called_once()
+        assert self.cache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+    def test_none_is_cached_unless_disabled(self) -> None:
+        loader = Mock(return_value=None)
+
+        self.cache.get_or_load(PIPELINE, "a", loader)
+        self.cache.get_or_load(PIPELINE, "a", loader)
+        self.cache.get_or_load(PIPELINE, "b", loader, cache_none=False)
+        self.cache.get_or_load(PIPELINE, "b", loader, cache_none=False)
+
+        assert loader.call_count == 3
+
+    def test_loader_errors_are_not_cached(self) -> None:
+        loader = Mock(side_effect=[RuntimeError("database unavailable"), "value"])
+
+        with pytest.raises(RuntimeError):
+            self.cache.get_or_load(PIPELINE, "a", loader)
+
+        assert self.cache.get_or_load(PIPELINE, "a", loader) == "value"
+
+    def test_invalidate_only_reloads_namespace(self) -> None:
+        self.cache.get_or_load(PIPELINE, "a", lambda: "old pipeline")
+        self.cache.get_or_load(LLM_PROVIDER, "a", lambda: "provider")
+
+        self.cache.invalidate(PIPELINE)
+
+        assert self.cache.get_or_load(PIPELINE, "a", lambda: "new pipeline") == "new pipeline"
+        assert self.cache.get_or_load(LLM_PROVIDER, "a", lambda: "reloaded") == "provider"
+
+    def test_value_loaded_during_invalidation_is_not_served(self) -> None:
+        def stale_loader() -> str:
+            self.cache.invalidate(PIPELINE)
+            return "stale"
+
+        self.cache.get_or_load(PIPELINE, "a", stale_loader)
+
+        assert self.cache.get_or_load(PIPELINE, "a", lambda: "fresh") == "fresh"
+
+    def test_evicts_least_recently_used(self) -> None:
+        for key in ("a", "b", "c"):
+            self.cache.get_or_load(PIPELINE, key, lambda key=key: key)
+
+        assert self.cache.stats()["entries"] == 2
+
+    def test_expired_entries_are_reloaded(self) -> None:
+        cache = ConfigCache(ttl_seconds=1)
+        loader = Mock(return_value="value")
+        cache.get_or_load(PIPELINE, "a", loader)
+        key = next(iter(cache._entries))
+        stored_at, version, value = cache._entries[key]
+        cache._entries[key] = (stored_at - 5, version, value)
+
+        cache.get_or_load(PIPELINE, "a", loader)
+
+        assert loader.call_count == 2
+
+
+@pytest.mark.unit
+class TestCachedConfig:
+    """Tests for reads through the request and process tiers."""
+
+    def teardown_method(self) -> None:
+        RequestContext.clear()
+
+    def test_disabled_cache_always_loads(self) -> None:
+        loader = Mock(return_value="value")
+
+        with patch.object(config_cache, "get_settings", return_value=_settings(config_cache_enabled=False)):
+            cached_config(PIPELINE, "a", loader)
+            cached_config(PIPELINE, "a", loader)
+
+        assert loader.call_count == 2
+        assert get_config_cache(_settings(config_cache_enabled=False)) is None
+
+    def test_process_tier_is_shared_across_requests(self) -> None:
+        loader = Mock(return_value="value")
+
+        with patch.object(config_cache, "get_settings", return_value=_settings()):
+            for _ in range(2):
+                RequestContext.set_user({"id": str(uuid4())})
+                cached_config(PIPELINE, "a", loader)
+                RequestContext.clear()
+
+        loader.assert_called_once()
+
+    def test_request_tier_keeps_value_until_namespace_changes(self) -> None:
+        RequestContext.set_user({"id": str(uuid4())})
+
+        with patch.object(config_cache, "get_settings", return_value=_settings()):
+            cache = get_config_cache()
+            assert cached_config(PROMPT_TEMPLATE, "a", lambda: "v1") == "v1"
+            cache.clear()
+            assert cached_config(PROMPT_TEMPLATE, "a", lambda: "v2") == "v1"
+
+            invalidate_config(PROMPT_TEMPLATE)
+
+            assert cached_config(PROMPT_TEMPLATE, "a", lambda: "v3") == "v3"
+
+    def test_invalidate_publishes_on_postgres(self) -> None:
+        db = MagicMock()
+        db.get_bind.return_value.dialect.name = "postgresql"
+        connection = db.get_bind.return_value.engine.connect.return_value.execution_options.return_value
+
+        with patch.object(config_cache, "get_settings", return_value=_settings()):
+            invalidate_config(PIPELINE, LLM_PROVIDER, db=db)
+
+        statement, params = connection.__enter__.return_value.execute.call_args.args
+        assert "pg_notify" in str(statement)
+        assert params["channel"] == "rag_config_cache"
+        assert params["payload"].endswith(":pipeline,llm_provider")
+
+    def test_invalidate_skips_notify_on_other_databases(self) -> None:
+        db = Mock()
+        db.get_bind.return_value.dialect.name = "sqlite"
+
+        with patch.object(config_cache, "get_settings", return_value=_settings()):
+            invalidate_config(PIPELINE, db=db)
+
+        db.get_bind.return_value.engine.connect.assert_not_called()
+
+
+@pytest.mark.unit
+class TestConfigCacheListener:
+    """Tests for applying invalidations from other workers."""
+
+    def _listener(self, dialect: str = "postgresql") -> ConfigCacheListener:
+        engine = Mock()
+        engine.dialect.name = dialect
+        return ConfigCacheListener(_settings(), engine, poll_seconds=0.01, retry_seconds=0.01)
+
+    def test_handle_bumps_namespaces_from_other_workers(self) -> None:
+        cache = get_config_cache(_settings())
+
+        self._listener().handle("other-worker:pipeline,prompt_template")
+
+        assert cache.get_version(PIPELINE) == 1
+        assert cache.get_version(PROMPT_TEMPLATE) == 1
+        assert cache.get_version(LLM_PROVIDER) == 0
+
+    def test_handle_ignores_own_notifications(self) -> None:
+        cache = get_config_cache(_settings())
+
+        self._listener().handle(f"{config_cache._ORIGIN}:pipeline")
+
+        assert cache.get_version(PIPELINE) == 0
+
+    async def test_does_not_start_without_postgres(self) -> None:
+        listener = self._listener(dialect="sqlite")
+
+        listener.start()
+
+        assert listener._task is None
+
+    async def test_reconnects_after_failure_and_stops(self) -> None:
+        listener = self._listener()
+        listener.listen = Mock(side_effect=[RuntimeError("connection refused"), None, None, None, None, None])
+
+        listener.start()
+        await asyncio.sleep(0.1)
+        await listener.stop()
+
+        assert listener.listen.call_count >= 2
+        assert listener._task is None
@@ -3,16 +3,23 @@
 # pylint: disable=import-error
 # Justification: import-error is false positive when pylint runs standalone
 
-from unittest.mock import Mock
+import json
+import threading
+from collections.abc import AsyncIterator, Iterator
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
 
 import pytest
 from pydantic import ValidationError as PydanticValidationError
 
 from core.config import Settings, get_settings
-from rag_solution.core.exceptions import ValidationError
+from rag_solution.core.exceptions import NotFoundError, ValidationError
+from rag_solution.repository.conversation_repository import ConversationRepository
 from rag_solution.schemas.conversation_schema import (
     ConversationSessionInput,
+    ConversationSessionOutput,
+    PageCursor,
 )
 from rag_solution.services.conversation_service import ConversationService
 
@@ -71,6 +78,153 @@ class TestConversationServiceSimple:
         with pytest.raises(ValidationError, match="Unsupported export format"):
             await service.export_session(session_id, user_id, "unsupported_format")
 
+    @pytest.mark.asyncio
+    async def test_export_session_stream_writes_session_then_messages(
+        self, service: ConversationService, mock_conversation_repository: Mock
+    ) -> None:
+        """Test NDJSON export yields the session line followed by one line per message."""
+        user_id, session_id = uuid4(), uuid4()
+        mock_conversation_repository.get_session_by_id.return_value = ConversationSessionOutput(
+            id=session_id,
+            user_id=user_id,
+            collection_id=uuid4(),
+            session_name="Export",
+            context_window_size=4000,
+            max_messages=50,
+        )
+        mock_conversation_repository.iter_messages.return_value = iter(
+            [
+                Mock(
+                    id=uuid4(),
+                    session_id=session_id,
+                    content=f"message {index}",
+                    role="user",
+                    message_type="question",
+                    created_at=datetime.now(UTC),
+                    message_metadata={},
+                    token_count=None,
+                    execution_time=None,
+                )
+                for index in range(2)
+            ]
+        )
+
+        lines = [json.loads(line) async for line in await service.export_session_stream(session_id, user_id)]
+
+        assert [line["type"] for line in lines] == ["session", "message", "message"]
+        assert lines[0]["data"]["session_name"] == "Export"
+        assert lines[2]["data"]["content"] == "message 1"
+
+    @pytest.mark.asyncio
+    async def test_export_session_stream_reads_pages_off_the_event_loop(
+        self, service: ConversationService, mock_conversation_repository: Mock
+    ) -> None:
+        """Test the blocking keyset pages of a sync repository are fetched in the threadpool."""
+        user_id = uuid4()
+        mock_conversation_repository.get_session_by_id.return_value = ConversationSessionOutput(
+            user_id=user_id, collection_id=uuid4(), session_name="Export", context_window_size=4000, max_messages=50
+        )
+        reading_threads: list[threading.Thread] = []
+
+        def iter_messages(*_args: object, **_kwargs: object) -> Iterator[Mock]:
+            reading_threads.append(threading.current_thread())
+            yield from ()
+
+        mock_conversation_repository.iter_messages.side_effect = iter_messages
+
+        lines = [line async for line in await service.export_session_stream(uuid4(), user_id)]
+
+        assert len(lines) == 1
+        assert reading_threads and reading_threads[0] is not threading.current_thread()
+
+    @pytest.mark.asyncio
+    async def test_export_session_stream_uses_the_async_session_when_available(
+        self, mock_db: Mock, mock_settings: Settings, mock_question_service: Mock
+    ) -> None:
+        """Test export pages are awaited on the repository's async session."""
+        user_id, session_id = uuid4(), uuid4()
+        repository = Mock(spec=ConversationRepository)
+        repository.async_db = Mock()
+        repository.get_session_by_id_async = AsyncMock(
+            return_value=ConversationSessionOutput(
+                user_id=user_id, collection_id=uuid4(), session_name="Export", context_window_size=4000, max_messages=50
+            )
+        )
+
+        async def iter_messages_async(*_args: object, **_kwargs: object) -> AsyncIterator[Mock]:
+            for _ in ():
+                yield Mock()
+
+        repository.iter_messages_async = Mock(side_effect=iter_messages_async)
+        service = ConversationService(mock_db, mock_settings, repository, mock_question_service)
+
+        lines = [line async for line in await service.export_session_stream(session_id, user_id, batch_size=10)]
+
+        assert len(lines) == 1
+        repository.iter_messages_async.assert_called_once_with(session_id, batch_size=10)
+        repository.iter_messages.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_export_session_stream_checks_access_before_streaming(
+        self, service: ConversationService, mock_conversation_repository: Mock
+    ) -> None:
+        """Test another user's session fails before any line is produced."""
+        mock_conversation_repository.get_session_by_id.return_value = ConversationSessionOutput(
+            user_id=uuid4(), collection_id=uuid4(), session_name="Private", context_window_size=4000, max_messages=50
+        )
+
+        with pytest.raises(NotFoundError):
+            await service.export_session_stream(uuid4(), uuid4())
+        mock_conversation_repository.iter_messages.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_list_sessions_pages_in_the_repository(
+        self, service: ConversationService, mock_conversation_repository: Mock
+    ) -> None:
+        """Test collection filtering and the cursor are applied in the query, not after it."""
+        user_id, collection_id = uuid4(), uuid4()
+        cursor = PageCursor(created_at=datetime.now(UTC), id=uuid4())
+
+        await service.list_sessions(user_id, collection_id=collection_id, limit=10, cursor=cursor)
+
+        mock_conversation_repository.get_sessions_by_user.assert_called_once_with(
+            user_id, limit=10, after=cursor, collection_id=collection_id
+        )
+
+    @pytest.mark.asyncio
+    async def test_reads_use_the_async_session_when_available(
+        self, mock_db: Mock, mock_settings: Settings, mock_question_service: Mock
+    ) -> None:
+        """Test session and message reads are awaited on the repository's async session."""
+        user_id, session_id = uuid4(), uuid4()
+        repository = Mock(spec=ConversationRepository)
+        repository.async_db = Mock()
+        repository.get_session_by_id_async = AsyncMock(return_value=Mock(user_id=user_id))
+        repository.get_sessions_by_user_async = AsyncMock(return_value=[])
+        repository.get_messages_by_session_async = AsyncMock(return_value=[])
+        service = ConversationService(mock_db, mock_settings, repository, mock_question_service)
+
+        assert await service.list_sessions(user_id) == []
+        assert await service.get_messages(session_id, user_id, include_metadata=False) == []
+
+        repository.get_session_by_id_async.assert_awaited_once_with(session_id)
+        repository.get_messages_by_session_async.assert_awaited_once_with(
+            session_id, limit=50, offset=0, after=None, include_metadata=False
+        )
+        repository.get_sessions_by_user.assert_not_called()
+        repository.get_messages_by_session.assert_not_called()
+
+    def test_page_cursor_round_trip(self) -> None:
+        """Test cursors survive encoding and malformed tokens are rejected."""
+        cursor = PageCursor(created_at=datetime.now(UTC), id=uuid4())
+        items = [Mock(created_at=cursor.created_at, id=cursor.id)]
+
+        assert PageCursor.decode(cursor.encode()) == cursor
+        assert PageCursor.next_token(items, limit=1) == cursor.encode()
+        assert PageCursor.next_token(items, limit=2) is None
+        with pytest.raises(ValueError, match="Invalid page cursor"):
+            PageCursor.decode("not-a-cursor")
+
     def test_cleanup_expired_sessions_returns_int(self, service: ConversationService) -> None:
         """Test cleanup_expired_sessions returns integer."""
         # Mock the database query to return empty list
@@ -5,6 +5,7 @@ from uuid import uuid4
 import pytest
 from rag_solution.schemas.conversation_schema import MessageRole, MessageType, SummarizationConfigInput
 from rag_solution.services.conversation_summarization_service import ConversationSummarizationService
+from rag_solution.services.tokenizer_service import get_tokenizer_service
 
 
 @pytest.fixture
@@ -1056,9 +1057,10 @@ async def test_estimate_tokens(conversation_summarization_service):
     text = "This is a test message with approximately twenty characters"
     result = await conversation_summarization_service._estimate_tokens(text)
 
-    # Should estimate ~4 characters per token
-    expected = len(text) // 4
+    # Should use the shared tokenizer service
+    expected = get_tokenizer_service().count_tokens(text)
     assert result == expected
+    assert 0 < result < len(text)
 
 
 @pytest.mark.asyncio
@@ -2,12 +2,14 @@
 
 from datetime import UTC, datetime, timedelta
 from unittest.mock import Mock, patch
+from uuid import uuid4
 
 import pytest
 from rag_solution.schemas.dashboard_schema import (
     ActivityStatus,
     ActivityType,
     DashboardStats,
+    QualityMetrics,
     QuickStat,
     QuickStatistics,
     RecentActivity,
@@ -600,3 +602,22 @@ class TestDashboardService:
             # Success rate should never exceed 1.0
             assert result.success_rate <= 1.0
             assert result.success_rate >= 0.0
+
+    def test_get_quality_metrics(self, dashboard_service: DashboardService) -> None:
+        """Test quality metrics are aggregated per pipeline, best overall score first."""
+        mock_query = Mock()
+        dashboard_service.db.query.return_value = mock_query
+        mock_query.filter.return_value = mock_query
+        mock_query.group_by.return_value = mock_query
+        evaluated_at = datetime(2026, 1, 1)
+        mock_query.all.return_value = [
+            (uuid4(), 3, 0.5, 0.5, 0.5, 0.5, evaluated_at),
+            (uuid4(), 2, 1.0, 0.5, 1.0, 0.8333, evaluated_at),
+        ]
+
+        result = dashboard_service.get_quality_metrics(hours=12)
+
+        assert isinstance(result, QualityMetrics)
+        assert result.period_hours == 12
+        assert [pipeline.evaluations for pipeline in result.pipelines] == [2, 3]
+        assert result.pipelines[0].faithfulness == 1.0
@@ -0,0 +1,206 @@
+"""Unit tests for concurrent, order-preserving dialogue synthesis."""
+
+import asyncio
+import wave
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from pydub import AudioSegment
+
+from rag_solution.generation.audio.base import AudioGenerationError
+from rag_solution.generation.audio.openai_audio import OpenAIAudioProvider
+from rag_solution.generation.audio.synthesis import StreamingAudioEncoder, synthesize_dialogue
+from rag_solution.schemas.podcast_schema import AudioFormat, PodcastScript, PodcastTurn, Speaker
+
+
+def _tone(duration_ms: int, frame_rate: int = 24000) -> AudioSegment:
+    """Silent segment with a recognisable length."""
+    return AudioSegment.silent(duration=duration_ms, frame_rate=frame_rate)
+
+
+def _wav_duration_ms(path: Path) -> int:
+    with wave.open(str(path), "rb") as wav:
+        return round(wav.getnframes() * 1000 / wav.getframerate())
+
+
+@pytest.mark.unit
+class TestSynthesizeDialogue:
+    """Tests for synthesize_dialogue."""
+
+    @pytest.mark.asyncio
+    async def test_segments_written_in_script_order(self) -> None:
+        """Turns finishing out of order are still encoded in script order."""
+        written: list[int] = []
+        encoder = Mock()
+        encoder.write.side_effect = lambda segment: written.append(len(segment))
+
+        async def synthesize(idx: int, _turn: str) -> AudioSegment:
+            # Later turns finish first
+            await asyncio.sleep(0.01 * (5 - idx))
+            return _tone(100 * (idx + 1))
+
+        await synthesize_dialogue(["a", "b", "c", "d", "e"], synthesize, encoder, max_concurrency=5)
+
+        assert written == [100, 200, 300, 400, 500]
+        assert encoder.write_silence.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self) -> None:
+        """No more than max_concurrency turns are synthesized at once."""
+        active = 0
+        peak = 0
+
+        async def synthesize(_idx: int, _turn: str) -> AudioSegment:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return _tone(10)
+
+        await synthesize_dialogue(list(range(12)), synthesize, Mock(), max_concurrency=3)
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_progress_reported_per_turn(self) -> None:
+        """on_turn_complete is awaited once per encoded turn."""
+        progress: list[tuple[int, int]] = []
+
+        async def synthesize(_idx: int, _turn: str) -> AudioSegment:
+            return _tone(10)
+
+        async def on_turn_complete(completed: int, total: int) -> None:
+            progress.append((completed, total))
+
+        await synthesize_dialogue(["a", "b", "c"], synthesize, Mock(), on_turn_complete=on_turn_complete)
+
+        assert progress == [(1, 3), (2, 3), (3, 3)]
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_outstanding_turns(self) -> None:
+        """The first failure propagates and pending turns are cancelled."""
+        cancelled = 0
+
+        async def synthesize(idx: int, _turn: str) -> AudioSegment:
+            nonlocal cancelled
+            if idx == 0:
+                raise RuntimeError("tts down")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled += 1
+                raise
+            return _tone(10)
+
+        with pytest.raises(RuntimeError, match="tts down"):
+            await synthesize_dialogue(list(range(4)), synthesize, Mock(), max_concurrency=4)
+
+        assert cancelled == 3
+
+
+@pytest.mark.unit
+class TestStreamingAudioEncoder:
+    """Tests for StreamingAudioEncoder."""
+
+    def test_wav_output_contains_all_segments(self, tmp_path: Path) -> None:
+        """WAV output is written incrementally with pauses between turns."""
+        output = tmp_path / "out.wav"
+        encoder = StreamingAudioEncoder(output, "wav")
+
+        encoder.write(_tone(300))
+        encoder.write_silence(100)
+        encoder.write(_tone(200, frame_rate=16000))  # Resampled to the first segment's rate
+        size = encoder.close()
+
+        assert size == output.stat().st_size
+        assert encoder.duration_ms == 600
+        assert _wav_duration_ms(output) == 600
+
+    def test_close_without_segments_raises(self, tmp_path: Path) -> None:
+        """Closing an encoder that never received audio is an error."""
+        encoder = StreamingAudioEncoder(tmp_path / "out.mp3", "mp3")
+
+        with pytest.raises(ValueError, match="No audio segments"):
+            encoder.close()
+
+    def test_abort_removes_partial_file(self, tmp_path: Path) -> None:
+        """abort() deletes the partially written output."""
+        output = tmp_path / "out.wav"
+        encoder = StreamingAudioEncoder(output, "wav")
+        encoder.write(_tone(100))
+
+        encoder.abort()
+
+        assert not output.exists()
+
+    def test_compressed_formats_pipe_pcm_to_ffmpeg(self, tmp_path: Path) -> None:
+        """Non-WAV formats stream raw PCM into a single ffmpeg process."""
+        output = tmp_path / "out.mp3"
+        encoder = StreamingAudioEncoder(output, "mp3")
+        process = Mock(returncode=0)
+        process.communicate.return_value = (b"", b"")
+
+        with patch("rag_solution.generation.audio.synthesis.subprocess.Popen", return_value=process) as popen:
+            encoder.write(_tone(100))
+            encoder.write(_tone(100))
+            output.write_bytes(b"mp3")
+            encoder.close()
+
+        popen.assert_called_once()
+        command = popen.call_args.args[0]
+        assert command[command.index("-f", 5) + 1] == "mp3"
+        assert command[-1] == str(output)
+        assert process.stdin.write.call_count == 2
+
+
+@pytest.mark.unit
+class TestProviderDialogueAudio:
+    """Tests for AudioProviderBase.generate_dialogue_audio_to_file."""
+
+    @pytest.mark.asyncio
+    async def test_openai_dialogue_uses_concurrent_engine(self, tmp_path: Path) -> None:
+        """Turns are synthesized with the right voices and encoded to the output file."""
+        provider = OpenAIAudioProvider(api_key="test-key")
+        voices: list[str] = []
+
+        async def generate_turn(text: str, voice_id: str, audio_format: AudioFormat) -> AudioSegment:
+            voices.append(voice_id)
+            return _tone(200)
+
+        script = PodcastScript(
+            turns=[
+                PodcastTurn(speaker=Speaker.HOST, text="Welcome", estimated_duration=1.0),
+                PodcastTurn(speaker=Speaker.EXPERT, text="Thanks", estimated_duration=1.0),
+            ],
+            total_duration=2.0,
+            total_words=2,
+        )
+        output = tmp_path / "dialogue.wav"
+
+        with patch.object(provider, "_generate_turn_audio", side_effect=generate_turn):
+            size = await provider.generate_dialogue_audio_to_file(script, "alloy", "onyx", output, AudioFormat.WAV)
+
+        assert sorted(voices) == ["alloy", "onyx"]
+        assert size == output.stat().st_size
+        assert _wav_duration_ms(output) == 200 + provider.pause_duration_ms + 200
+
+    @pytest.mark.asyncio
+    async def test_turn_failure_is_wrapped(self, tmp_path: Path) -> None:
+        """A failing turn raises AudioGenerationError naming the turn and removes the output."""
+        provider = OpenAIAudioProvider(api_key="test-key")
+        script = PodcastScript(
+            turns=[PodcastTurn(speaker=Speaker.HOST, text="Welcome", estimated_duration=1.0)],
+            total_duration=1.0,
+            total_words=1,
+        )
+        output = tmp_path / "dialogue.wav"
+
+        with patch.object(provider, "_generate_turn_audio", side_effect=RuntimeError("boom")):
+            with pytest.raises(AudioGenerationError, match="turn 1") as exc_info:
+                await provider.generate_dialogue_audio_to_file(script, "alloy", "onyx", output, AudioFormat.WAV)
+
+        assert exc_info.value.provider == "openai"
+        assert exc_info.value.error_type == "turn_generation_failed"
+        assert not output.exists()
@@ -0,0 +1,126 @@
+"""Unit tests for the background LLM-as-judge evaluation queue."""
+
+import json
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+from rag_solution.evaluation.evaluation_queue import EvaluationJob, EvaluationQueue
+from rag_solution.evaluation.llm_as_judge_evals import FaithfulnessEvaluator
+
+JUDGEMENTS = [
+    json.dumps({"faithfulness_rate": "High"}),
+    json.dumps({"answer_relevance_rate": "Medium"}),
+    json.dumps({"context_relevance_rate": "Low"}),
+]
+
+
+def judge_responses(prompts: list[str], **_: object) -> list[str]:
+    """Return one judgement per prompt in judge order."""
+    return [JUDGEMENTS[i % len(JUDGEMENTS)] for i in range(len(prompts))]
+
+
+@pytest.fixture
+def repository() -> Mock:
+    """Patch the repository the queue stores results with."""
+    with (
+        patch("rag_solution.evaluation.evaluation_queue.EvaluationResultRepository") as repository_class,
+        patch("rag_solution.evaluation.evaluation_queue.get_judge_llm"),
+        patch("rag_solution.evaluation.llm_as_judge_evals.get_judge_llm"),
+    ):
+        yield repository_class.return_value
+
+
+def make_job(question: str = "What is ML?") -> EvaluationJob:
+    """Create an evaluation job."""
+    return EvaluationJob(
+        question=question, answer="ML is learning from data.", context="ML context", pipeline_id=uuid4()
+    )
+
+
+@pytest.mark.unit
+class TestEvaluationQueue:
+    """Test cases for EvaluationQueue."""
+
+    async def test_jobs_are_batched_into_one_judge_round(self, repository: Mock) -> None:
+        """Test searches submitted together are judged with one concurrent round of prompts."""
+        queue = EvaluationQueue(batch_size=8, max_wait_seconds=0.05, session_factory=Mock())
+        generate = AsyncMock(side_effect=judge_responses)
+        with patch("rag_solution.evaluation.evaluation_queue.agenerate_responses", generate):
+            statuses = [queue.submit(make_job(f"question {i}")) for i in range(3)]
+            await queue.join()
+        await queue.stop()
+
+        assert [status["status"] for status in statuses] == ["queued"] * 3
+        generate.assert_awaited_once()
+        assert len(generate.await_args.args[0]) == 9
+        records = repository.create_many.call_args.args[0]
+        assert [str(record["search_id"]) for record in records] == [status["search_id"] for status in statuses]
+
+    async def test_scores_are_recorded_per_search(self, repository: Mock) -> None:
+        """Test each stored row carries the judge scores and their average."""
+        queue = EvaluationQueue(max_wait_seconds=0, session_factory=Mock())
+        job = make_job()
+        with patch(
+            "rag_solution.evaluation.evaluation_queue.agenerate_responses", AsyncMock(side_effect=judge_responses)
+        ):
+            queue.submit(job)
+            await queue.join()
+        await queue.stop()
+
+        (record,) = repository.create_many.call_args.args[0]
+        assert record["pipeline_id"] == job.pipeline_id
+        assert record["faithfulness"] == 1.0
+        assert record["answer_relevance"] == 0.5
+        assert record["context_relevance"] == 0.0
+        assert record["overall_score"] == pytest.approx(0.5)
+        assert record["error"] is None
+
+    async def test_judge_failure_is_recorded(self, repository: Mock) -> None:
+        """Test a failed judge round stores the error instead of stopping the worker."""
+        queue = EvaluationQueue(max_wait_seconds=0, session_factory=Mock())
+        generate = AsyncMock(side_effect=[RuntimeError("judge unavailable"), judge_responses(["p"] * 3)])
+        with patch("rag_solution.evaluation.evaluation_queue.agenerate_responses", generate):
+            queue.submit(make_job())
+            await queue.join()
+            queue.submit(make_job())
+            await queue.join()
+        await queue.stop()
+
+        failed, succeeded = (call.args[0][0] for call in repository.create_many.call_args_list)
+        assert failed["error"] == "judge unavailable"
+        assert "faithfulness" not in failed
+        assert succeeded["overall_score"] == pytest.approx(0.5)
+
+    async def test_full_queue_drops_job(self, repository: Mock) -> None:
+        """Test submissions beyond the pending limit are dropped without blocking the search."""
+        queue = EvaluationQueue(max_pending=1, session_factory=Mock())
+
+        first = queue.submit(make_job())
+        second = queue.submit(make_job())
+        await queue.stop()
+
+        assert first["status"] == "queued"
+        assert second["status"] == "dropped"
+
+
+@pytest.mark.unit
+class TestJudgeOutputParsing:
+    """Test cases for parsing judge outputs."""
+
+    def test_parse_output_adds_score(self) -> None:
+        """Test the judge's rating is converted to its numeric score."""
+        with patch("rag_solution.evaluation.llm_as_judge_evals.get_judge_llm"):
+            judge = FaithfulnessEvaluator()
+
+        assert judge.parse_output('{"faithfulness_rate": "Medium"}')["score"] == 0.5
+
+    def test_parse_output_falls_back_to_empty_schema(self) -> None:
+        """Test malformed output yields the empty schema with a zero score."""
+        with patch("rag_solution.evaluation.llm_as_judge_evals.get_judge_llm"):
+            judge = FaithfulnessEvaluator()
+
+        result = judge.parse_output("not json")
+
+        assert result["faithfulness_rate"] is None
+        assert result["score"] == 0
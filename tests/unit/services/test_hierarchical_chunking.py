@@ -7,6 +7,7 @@
 import pytest
 from rag_solution.data_ingestion.hierarchical_chunking import (
     HierarchicalChunk,
+    build_chunk_index,
     create_hierarchical_chunks,
     create_sentence_based_hierarchical_chunks,
     get_child_chunks,
@@ -301,6 +302,26 @@ class TestHelperFunctions:
             siblings = [c for c in hierarchy if c.level == child.level and c.chunk_id != child.chunk_id]
             assert len(siblings) > 0
 
+    def test_lookups_with_chunk_index(self, sample_text: str) -> None:
+        """Test parent lookups give the same results with a prebuilt chunk index."""
+        all_chunks = create_hierarchical_chunks(sample_text, levels=3)
+        index = build_chunk_index(all_chunks)
+        children = [c for c in all_chunks if c.level == 2]
+
+        assert len(index) == len(all_chunks)
+        for child in children:
+            assert get_parent_for_chunk(child.chunk_id, index) == get_parent_for_chunk(child.chunk_id, all_chunks)
+            assert get_chunk_with_parents(child.chunk_id, index) == get_chunk_with_parents(child.chunk_id, all_chunks)
+
+    def test_get_chunk_with_parents_stops_on_cycle(self) -> None:
+        """Test the parent walk terminates on malformed cyclic input."""
+        chunks = [
+            HierarchicalChunk(chunk_id="a", text="a", parent_id="b"),
+            HierarchicalChunk(chunk_id="b", text="b", parent_id="a"),
+        ]
+
+        assert [c.chunk_id for c in get_chunk_with_parents("a", chunks)] == ["a", "b"]
+
     def test_get_chunk_with_parents_empty(self, sample_text: str) -> None:
         """Test get_chunk_with_parents with non-existent chunk."""
         all_chunks = create_hierarchical_chunks(sample_text, levels=2)
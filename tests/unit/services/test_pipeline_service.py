@@ -5,7 +5,7 @@ Generated on: 2025-10-18
 Coverage: Unit tests for pipeline management, configuration, and execution
 """
 
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 
 import pytest
@@ -27,7 +27,7 @@ from rag_solution.schemas.pipeline_schema import (
 )
 from rag_solution.schemas.search_schema import SearchInput
 from rag_solution.services.pipeline_service import PipelineService
-from vectordbs.data_types import DocumentChunk, DocumentChunkMetadata, QueryResult, Source
+from vectordbs.data_types import DocumentChunk, DocumentChunkMetadata, DocumentChunkWithScore, QueryResult, Source
 from sqlalchemy.orm import Session
 
 # ============================================================================
@@ -876,6 +876,125 @@ class TestPipelineServiceExecution:
         assert result == "Formatted context"
         pipeline_service._prompt_template_service.apply_context_strategy.assert_called_once()
 
+    def test_format_context_packs_token_budget(self, pipeline_service, mock_settings):
+        """Test contexts are packed by score into the budget left for context"""
+        from rag_solution.services.tokenizer_service import HeuristicTokenizer, TokenizerService
+
+        mock_settings.context_packing_enabled = True
+        mock_settings.max_context_length = 400
+        mock_settings.max_new_tokens = 200
+        mock_settings.context_prompt_reserve_tokens = 100
+
+        def make_result(chunk_id, text, score):
+            chunk = DocumentChunk(
+                chunk_id=chunk_id, text=text, vectors=[0.1], metadata=DocumentChunkMetadata(source=Source.OTHER)
+            )
+            return QueryResult(chunk=chunk, score=score, document_id=f"doc-{chunk_id}")
+
+        relevant = "relevant " + "alpha beta gamma delta " * 8
+        query_results = [
+            make_result("1", "filler " + "lorem ipsum dolor sit " * 20, 0.2),
+            make_result("2", relevant, 0.9),
+            make_result("3", relevant, 0.8),
+        ]
+        tokenizer_service = TokenizerService()
+        tokenizer_service._tokenizers[""] = HeuristicTokenizer()
+        pipeline_service._prompt_template_service.apply_context_strategy.side_effect = lambda _, texts: "\n\n".join(
+            texts
+        )
+
+        with patch("rag_solution.services.pipeline_service.get_tokenizer_service", return_value=tokenizer_service):
+            result = pipeline_service._format_context(uuid4(), query_results)
+
+        # The duplicate is skipped and the filler only fills what is left of the 100 token budget
+        assert result.startswith(relevant)
+        assert result.count("relevant") == 1
+        assert "filler lorem" in result
+        assert tokenizer_service.count_tokens(result) <= 100
+
+    def test_format_context_counts_with_generating_model_tokenizer(self, pipeline_service, mock_settings):
+        """Test packing uses the tokenizer of the model that generates the answer"""
+        mock_settings.context_packing_enabled = True
+        mock_settings.max_context_length = 400
+        mock_settings.max_new_tokens = 200
+        mock_settings.context_prompt_reserve_tokens = 100
+        chunk = DocumentChunk(
+            chunk_id="1", text="Text 1", vectors=[0.1], metadata=DocumentChunkMetadata(source=Source.OTHER)
+        )
+        tokenizer_service = Mock()
+        tokenizer_service.pack_context.return_value.chunks = ["Text 1"]
+
+        with patch("rag_solution.services.pipeline_service.get_tokenizer_service", return_value=tokenizer_service):
+            pipeline_service._format_context(
+                uuid4(), [QueryResult(chunk=chunk, score=0.9)], model_id="ibm/granite-3-8b-instruct"
+            )
+
+        assert tokenizer_service.pack_context.call_args.kwargs["model_id"] == "ibm/granite-3-8b-instruct"
+
+    @staticmethod
+    def _hierarchical_results():
+        """Two children of the same parent and one chunk without parent"""
+
+        def make_result(chunk_id, parent_id, score):
+            chunk = DocumentChunkWithScore(
+                chunk_id=chunk_id,
+                text=f"text {chunk_id}",
+                parent_chunk_id=parent_id,
+                metadata=DocumentChunkMetadata(source=Source.OTHER),
+                score=score,
+            )
+            return QueryResult(chunk=chunk, score=score)
+
+        parents = [
+            DocumentChunk(chunk_id="p1", text="parent p1", parent_chunk_id="root"),
+            DocumentChunk(chunk_id="root", text="root text"),
+        ]
+        results = [make_result("c1", "p1", 0.9), make_result("c2", "p1", 0.8), make_result("x", None, 0.7)]
+        return results, parents
+
+    @pytest.mark.parametrize(
+        ("mode", "expected", "fetch_calls"),
+        [
+            ("child_with_parent", ["c1", "p1", "c2", "x"], 1),
+            ("parent_only", ["p1", "x"], 1),
+            ("full_hierarchy", ["c1", "p1", "root", "c2", "x"], 2),
+        ],
+    )
+    def test_apply_hierarchical_retrieval_modes(self, pipeline_service, mock_settings, mode, expected, fetch_calls):
+        """Test parents are fetched by ID in one batch per level and deduplicated"""
+        mock_settings.hierarchical_retrieval_mode = mode
+        results, parents = self._hierarchical_results()
+        by_id = {chunk.chunk_id: chunk for chunk in parents}
+        pipeline_service.vector_store.get_chunks_by_ids = Mock(
+            side_effect=lambda _, ids: [by_id[chunk_id] for chunk_id in ids if chunk_id in by_id]
+        )
+
+        output = pipeline_service._apply_hierarchical_retrieval(results, "collection")
+
+        assert [r.chunk.chunk_id for r in output] == expected
+        assert pipeline_service.vector_store.get_chunks_by_ids.call_count == fetch_calls
+        pipeline_service.vector_store.get_chunks_by_ids.assert_any_call("collection", ["p1"])
+        parent = next(r for r in output if r.chunk.chunk_id == "p1")
+        assert parent.score == 0.9
+        assert parent.chunk.text == "parent p1"
+
+    def test_apply_hierarchical_retrieval_falls_back_without_fetch_support(self, pipeline_service, mock_settings):
+        """Test children are returned unchanged when the store cannot fetch by ID"""
+        mock_settings.hierarchical_retrieval_mode = "parent_only"
+        results, _ = self._hierarchical_results()
+        pipeline_service.vector_store.get_chunks_by_ids = Mock(side_effect=NotImplementedError)
+
+        assert pipeline_service._apply_hierarchical_retrieval(results, "collection") == results
+
+    def test_apply_hierarchical_retrieval_child_only(self, pipeline_service, mock_settings):
+        """Test child_only mode does not query the vector store"""
+        mock_settings.hierarchical_retrieval_mode = "child_only"
+        results, _ = self._hierarchical_results()
+        pipeline_service.vector_store.get_chunks_by_ids = Mock()
+
+        assert pipeline_service._apply_hierarchical_retrieval(results, "collection") == results
+        pipeline_service.vector_store.get_chunks_by_ids.assert_not_called()
+
 
 # ============================================================================
 # UNIT TESTS - PIPELINE INITIALIZATION
@@ -930,6 +1049,24 @@ class TestPipelineServiceInitialize:
         # Verify it was attempted
         pipeline_service.vector_store.collection_exists.assert_called_once_with(collection_name)
 
+    @pytest.mark.asyncio
+    async def test_load_documents_records_chunk_counts(self, pipeline_service):
+        """Test documents ingested by the pipeline update the stored chunk counts"""
+        collection_id = uuid4()
+        collection = Mock(id=collection_id)
+        processed_documents = [Mock()]
+        pipeline_service.collection_service.get_collection.return_value = collection
+        pipeline_service.file_management_service.get_files_by_collection.return_value = [
+            Mock(file_path="/tmp/doc.pdf", document_id="doc1")
+        ]
+        pipeline_service.collection_service.ingest_documents = AsyncMock(return_value=processed_documents)
+
+        await pipeline_service._load_documents(collection_id)
+
+        pipeline_service.collection_service.record_ingested_chunk_counts.assert_called_once_with(
+            collection_id, processed_documents
+        )
+
 
 # ============================================================================
 # UNIT TESTS - PIPELINE TESTING
@@ -490,6 +490,67 @@ class TestScriptGenerationUnit:
                 assert isinstance(result, str)
                 assert len(result) > 0
 
+    @pytest.mark.asyncio
+    async def test_generate_script_map_reduce_for_long_podcasts(self, service, valid_podcast_input):
+        """Test long scripts are generated as concurrent topic segments and stitched in outline order"""
+        service.settings.podcast_script_map_reduce_enabled = True
+        service.settings.podcast_script_segment_words = 1500
+        service.settings.podcast_script_max_concurrency = 4
+        podcast_input = valid_podcast_input.model_copy(update={"duration": PodcastDuration.LONG})
+        rag_results = "\n\n".join(
+            [
+                "[Document 1]: Solar panels convert sunlight into electricity using photovoltaic cells.",
+                "[Document 2]: Coral reefs host marine biodiversity and protect coastlines.",
+                "[Document 3]: Photovoltaic solar cells lose efficiency at high temperatures.",
+                "[Document 4]: Bleaching threatens coral reefs when ocean water warms.",
+                "[Document 5]: Quantum computers use qubits and superposition.",
+                "[Document 6]: Qubits in quantum computers need error correction.",
+            ]
+        )
+
+        def generate_text(user_id, prompt, template, variables, model_parameters):
+            if template.name == "podcast_outline":
+                return "1. Solar Power\n2. Coral Reefs\n3. Quantum Computing"
+            answer = " ".join(["detail"] * 100)
+            turns = [f"HOST: Now {variables['segment_title']}."]
+            turns += [f"EXPERT: {answer}\nHOST: Tell me more." for _ in range(variables["word_count"] // 103)]
+            return "<script>\n" + "\n".join(turns) + "\n</script>"
+
+        with patch("rag_solution.services.podcast_service.LLMProviderFactory") as mock_factory:
+            mock_provider = Mock()
+            mock_provider.generate_text = Mock(side_effect=generate_text)
+            mock_factory.return_value.get_provider.return_value = mock_provider
+
+            result = await service._generate_script(podcast_input, rag_results)
+
+        calls = mock_provider.generate_text.call_args_list
+        segment_calls = [call for call in calls if call.kwargs["template"].name == "podcast_segment"]
+        assert len(calls) == 4
+        assert len(segment_calls) == 3
+
+        # Related chunks are grouped into the same segment
+        solar_call = next(call for call in segment_calls if "1. Solar Power" in call.kwargs["variables"]["segment_title"])
+        assert "Photovoltaic solar cells" in solar_call.kwargs["variables"]["rag_results"]
+        assert "Coral" not in solar_call.kwargs["variables"]["rag_results"]
+
+        # Each segment gets its share of the word and token budget
+        word_counts = [call.kwargs["variables"]["word_count"] for call in segment_calls]
+        assert sum(word_counts) == 30 * 150
+        for call in segment_calls:
+            max_words = call.kwargs["variables"]["max_word_count"]
+            assert call.kwargs["model_parameters"].max_new_tokens == max_words * 3
+
+        # Only the opening segment introduces, later ones transition from the previous topic
+        instructions = {
+            call.kwargs["variables"]["segment_title"]: call.kwargs["variables"]["position_instructions"]
+            for call in segment_calls
+        }
+        assert "OPENING" in instructions["1. Solar Power"]
+        assert '"Solar Power"' in instructions["2. Coral Reefs"]
+        assert "FINAL" in instructions["3. Quantum Computing"]
+
+        assert result.index("Now 1. Solar Power") < result.index("Now 2. Coral Reefs") < result.index("Now 3. Quantum")
+
     @pytest.mark.asyncio
     async def test_generate_script_missing_user_id(self, service, valid_podcast_input):
         """Test script generation fails without user_id"""
@@ -635,6 +696,109 @@ class TestFileManagementUnit:
         assert result is not None
         assert len(mock_audio_storage.store_audio.call_args.kwargs["audio_data"]) == 10 * 1024 * 1024
 
+    @pytest.mark.asyncio
+    async def test_generate_and_store_audio_streams_to_storage(
+        self, service, mock_repository, mock_audio_storage, valid_podcast_input, tmp_path
+    ):
+        """Test audio is encoded to a staging file, handed to storage and progress is tracked per turn"""
+        from pydub import AudioSegment
+
+        podcast_id = uuid4()
+        podcast_input = valid_podcast_input.model_copy(update={"format": AudioFormat.WAV})
+        script = PodcastScript(
+            turns=[
+                PodcastTurn(speaker=Speaker.HOST, text="Welcome", estimated_duration=1.0),
+                PodcastTurn(speaker=Speaker.EXPERT, text="Thanks", estimated_duration=1.0),
+                PodcastTurn(speaker=Speaker.HOST, text="Bye", estimated_duration=1.0),
+            ],
+            total_duration=3.0,
+            total_words=3,
+        )
+        staging_path = tmp_path / "audio.wav.partial"
+        stored_sizes = []
+
+        async def store_audio_file(podcast_id, user_id, file_path, audio_format):
+            stored_sizes.append(file_path.stat().st_size)
+            return f"/api/podcasts/{podcast_id}/audio"
+
+        mock_audio_storage.create_staging_path = Mock(return_value=staging_path)
+        mock_audio_storage.store_audio_file = AsyncMock(side_effect=store_audio_file)
+        provider = Mock(max_concurrent_turns=4)
+        provider._generate_turn_audio = AsyncMock(return_value=AudioSegment.silent(duration=100, frame_rate=24000))
+        service._resolve_voice_id = AsyncMock(side_effect=lambda voice_id, user_id: (voice_id, "openai"))
+
+        with patch(
+            "rag_solution.services.podcast_service.AudioProviderFactory.create_provider", return_value=provider
+        ):
+            audio_url, audio_size = await service._generate_and_store_audio(
+                podcast_id, script, podcast_input, progress_range=(50, 90)
+            )
+
+        assert audio_url == f"/api/podcasts/{podcast_id}/audio"
+        assert stored_sizes == [audio_size]
+        assert provider._generate_turn_audio.await_count == 3
+        progress = [call.kwargs["progress_percentage"] for call in mock_repository.update_progress.call_args_list]
+        assert progress == [63, 76, 90]
+        assert mock_repository.update_progress.call_args.kwargs["step_details"] == {
+            "total_turns": 3,
+            "completed_turns": 3,
+        }
+        assert not staging_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_generate_and_store_audio_requires_user_id(self, service, mock_audio_storage, valid_podcast_input):
+        """Test audio storage is not touched for a request without a user id"""
+        podcast_input = valid_podcast_input.model_copy(update={"user_id": None})
+        mock_audio_storage.create_staging_path = Mock()
+
+        with pytest.raises(ValidationError):
+            await service._generate_and_store_audio(uuid4(), Mock(), podcast_input)
+
+        mock_audio_storage.create_staging_path.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_regeneration_only_synthesizes_edited_turns(self, service, valid_podcast_input, tmp_path):
+        """Test unchanged turns are reused from the TTS segment cache on regeneration"""
+        from pydub import AudioSegment
+
+        from rag_solution.services.storage.audio_storage import LocalFileStorage
+        from rag_solution.services.storage.tts_segment_cache import reset_tts_segment_caches
+
+        reset_tts_segment_caches()
+        service.settings.podcast_tts_cache_enabled = True
+        service.settings.podcast_tts_cache_max_mb = 64
+        service.audio_storage = LocalFileStorage(base_path=str(tmp_path))
+        podcast_input = valid_podcast_input.model_copy(update={"format": AudioFormat.WAV})
+        provider = Mock(max_concurrent_turns=4, tts_model_key="tts-1-hd")
+        provider._generate_turn_audio = AsyncMock(return_value=AudioSegment.silent(duration=100, frame_rate=24000))
+        service._resolve_voice_id = AsyncMock(side_effect=lambda voice_id, user_id: (voice_id, "openai"))
+
+        def make_script(last_line):
+            return PodcastScript(
+                turns=[
+                    PodcastTurn(speaker=Speaker.HOST, text="Welcome", estimated_duration=1.0),
+                    PodcastTurn(speaker=Speaker.EXPERT, text="Thanks", estimated_duration=1.0),
+                    PodcastTurn(speaker=Speaker.HOST, text=last_line, estimated_duration=1.0),
+                ],
+                total_duration=3.0,
+                total_words=3,
+            )
+
+        try:
+            with patch(
+                "rag_solution.services.podcast_service.AudioProviderFactory.create_provider", return_value=provider
+            ):
+                first = await service._generate_audio(uuid4(), make_script("Goodbye"), podcast_input)
+                assert provider._generate_turn_audio.await_count == 3
+
+                second = await service._generate_audio(uuid4(), make_script("Goodbye!"), podcast_input)
+        finally:
+            reset_tts_segment_caches()
+
+        assert provider._generate_turn_audio.await_count == 4
+        assert provider._generate_turn_audio.await_args.kwargs["text"] == "Goodbye!"
+        assert first == second
+
     @pytest.mark.asyncio
     async def test_delete_podcast_success(self, service, mock_repository, mock_audio_storage):
         """Test successful podcast deletion"""
@@ -758,6 +922,23 @@ class TestProgressTrackingUnit:
             status=PodcastStatus.COMPLETED
         )
 
+    @pytest.mark.asyncio
+    async def test_update_progress_notifies_owner(self, service, mock_repository):
+        """Test progress update is pushed to the owner's WebSocket connections"""
+        podcast_id = uuid4()
+        user_id = uuid4()
+        mock_repository.update_progress.return_value = Mock(user_id=user_id)
+        hub = Mock(send_to_user=AsyncMock())
+
+        with patch("rag_solution.services.podcast_service.get_connection_hub", return_value=hub):
+            await service._update_progress(podcast_id=podcast_id, progress=40, step="parsing_turns")
+
+        target, event = hub.send_to_user.call_args.args
+        assert target == str(user_id)
+        assert event["type"] == "podcast_progress"
+        assert event["podcast_id"] == str(podcast_id)
+        assert event["progress"] == 40
+
 
 # ============================================================================
 # UNIT TESTS - PODCAST RETRIEVAL
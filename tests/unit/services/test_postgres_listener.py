@@ -0,0 +1,63 @@
+"""Unit tests for the shared Postgres LISTEN helper."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from rag_solution.services.postgres_listener import PostgresListener
+
+
+class _RecordingListener(PostgresListener):
+    listener_name = "recording-listener"
+
+    def __init__(self, engine: MagicMock, **kwargs: float) -> None:
+        super().__init__(engine, "rag_test", **kwargs)
+        self.connected = 0
+        self.payloads: list[str] = []
+
+    def _on_listen(self) -> None:
+        self.connected += 1
+
+    def _on_notify(self, payload: str) -> None:
+        self.payloads.append(payload)
+        self._stop.set()
+
+
+@pytest.mark.unit
+class TestPostgresListener:
+    """Test cases for PostgresListener."""
+
+    def test_listen_delivers_notifications_on_a_detached_connection(self) -> None:
+        """Test LISTEN runs on a connection kept out of the pool and payloads reach the hook."""
+        engine = MagicMock()
+        connection = engine.raw_connection.return_value
+        dbapi_connection = connection.dbapi_connection
+        dbapi_connection.notifies = []
+        dbapi_connection.poll.side_effect = lambda: dbapi_connection.notifies.append(SimpleNamespace(payload="hello"))
+        listener = _RecordingListener(engine, poll_seconds=0.01)
+
+        dbapi_connection.fileno.return_value = 7
+
+        with patch("rag_solution.services.postgres_listener.select.select", return_value=([7], [], [])) as wait:
+            listener.listen()
+
+        connection.detach.assert_called_once()
+        cursor = dbapi_connection.cursor.return_value.__enter__.return_value
+        cursor.execute.assert_called_once_with('LISTEN "rag_test"')
+        assert listener.connected == 1
+        assert listener.payloads == ["hello"]
+        assert wait.call_args.args[0] == [7]
+        connection.close.assert_called_once()
+
+    async def test_reconnects_after_failure_and_stops(self) -> None:
+        """Test a failed connection is retried until the listener is stopped."""
+        listener = _RecordingListener(MagicMock(), poll_seconds=0.01, retry_seconds=0.01)
+        listener.listen = Mock(side_effect=[RuntimeError("connection refused"), None, None, None, None, None])
+
+        listener._start_listening()
+        await asyncio.sleep(0.05)
+        await listener.stop()
+
+        assert listener.listen.call_count >= 2
+        assert listener._task is None
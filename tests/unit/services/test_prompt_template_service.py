@@ -6,7 +6,7 @@ Coverage: Unit tests with mocked dependencies
 """
 
 from datetime import datetime
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
 
 import pytest
@@ -491,6 +491,18 @@ class TestPromptBoundary:
 
         assert "Failed to retrieve templates by type" in str(exc_info.value)
 
+    async def test_get_templates_by_type_async(self, service, mock_repository):
+        """Test the async listing reads through the repository's async session."""
+        user_id = uuid4()
+        template_type = PromptTemplateType.CUSTOM
+        mock_repository.get_by_user_id_and_type_async = AsyncMock(return_value=[create_mock_template()])
+
+        result = await service.get_templates_by_type_async(user_id, template_type)
+
+        assert len(result) == 1
+        mock_repository.get_by_user_id_and_type_async.assert_awaited_once_with(user_id, template_type)
+        mock_repository.get_by_user_id_and_type.assert_not_called()
+
     # ============================================================================
     # UPDATE OPERATIONS
     # ============================================================================
@@ -686,9 +698,10 @@ class TestPromptBoundary:
         """Test formatting prompt using template ID."""
         template_id = uuid4()
 
-        template = Mock()
+        template = create_mock_template()
         template.system_prompt = "You are a helpful assistant."
         template.template_format = "Context: {context}\n\nQuestion: {question}"
+        template.input_variables = {"context": "Retrieved context", "question": "User question"}
 
         mock_repository.get_by_id.return_value = template
 
@@ -704,9 +717,10 @@ class TestPromptBoundary:
         """Test formatting prompt when no system prompt exists."""
         template_id = uuid4()
 
-        template = Mock()
+        template = create_mock_template()
         template.system_prompt = None
         template.template_format = "Question: {question}"
+        template.input_variables = {"question": "User question"}
 
         mock_repository.get_by_id.return_value = template
 
@@ -731,7 +745,7 @@ class TestPromptBoundary:
         """Test formatting prompt with missing variable."""
         template_id = uuid4()
 
-        template = Mock()
+        template = create_mock_template()
         template.system_prompt = "System prompt"
         template.template_format = "Question: {question}\nContext: {context}"
 
@@ -769,7 +783,7 @@ class TestPromptBoundary:
         """Test legacy format_prompt method with UUID."""
         template_id = uuid4()
 
-        template = Mock()
+        template = create_mock_template()
         template.system_prompt = "System"
         template.template_format = "Query: {query}"
 
@@ -807,7 +821,7 @@ class TestPromptBoundary:
         """Test applying default context strategy (simple join)."""
         template_id = uuid4()
 
-        template = Mock()
+        template = create_mock_template()
         template.context_strategy = None
         template.max_context_length = None
 
@@ -823,7 +837,7 @@ class TestPromptBoundary:
         """Test applying context strategy with max_chunks limit."""
         template_id = uuid4()
 
-        template = Mock()
+        template = create_mock_template()
         template.context_strategy = {"max_chunks": 2}
         template.max_context_length = None
 
@@ -842,7 +856,7 @@ class TestPromptBoundary:
         """Test applying context strategy with custom separator."""
         template_id = uuid4()
 
-        template = Mock()
+        template = create_mock_template()
         template.context_strategy = {"chunk_separator": " | "}
         template.max_context_length = None
 
@@ -858,7 +872,7 @@ class TestPromptBoundary:
         """Test context truncation at end."""
         template_id = uuid4()
 
-        template = Mock()
+        template = create_mock_template()
         template.context_strategy = {"truncation": "end"}
         template.max_context_length = 10
 
@@ -875,7 +889,7 @@ class TestPromptBoundary:
         """Test context truncation at start."""
         template_id = uuid4()
 
-        template = Mock()
+        template = create_mock_template()
         template.context_strategy = {"truncation": "start"}
         template.max_context_length = 10
 
@@ -892,7 +906,7 @@ class TestPromptBoundary:
         """Test context truncation in middle."""
         template_id = uuid4()
 
-        template = Mock()
+        template = create_mock_template()
         template.context_strategy = {"truncation": "middle"}
         template.max_context_length = 20
 
@@ -909,7 +923,7 @@ class TestPromptBoundary:
         """Test context strategy with combined settings."""
         template_id = uuid4()
 
-        template = Mock()
+        template = create_mock_template()
         template.context_strategy = {
             "max_chunks": 2,
             "chunk_separator": " || ",
@@ -987,7 +1001,7 @@ class TestPromptBoundary:
         """Test template with special characters."""
         template_id = uuid4()
 
-        template = Mock()
+        template = create_mock_template()
         template.system_prompt = "System: @#$%"
         template.template_format = "Query: {query}\nSpecial: !@#$%^&*()"
 
@@ -1004,7 +1018,7 @@ class TestPromptBoundary:
         """Test template with unicode characters."""
         template_id = uuid4()
 
-        template = Mock()
+        template = create_mock_template()
         template.system_prompt = "System: 你好"
         template.template_format = "Query: {query}\nUnicode: émojis 🚀"
 
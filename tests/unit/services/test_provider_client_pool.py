@@ -0,0 +1,193 @@
+"""Unit tests for the process-wide LLM provider client pool."""
+
+import threading
+import time
+from datetime import datetime
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+import pytest
+from pydantic import SecretStr
+
+from core.custom_exceptions import LLMProviderError
+from rag_solution.generation.providers.client_pool import (
+    ProviderClientPool,
+    credentials_version,
+    get_client_pool,
+    reset_client_pool,
+)
+from rag_solution.generation.providers.factory import LLMProviderFactory
+from rag_solution.schemas.llm_provider_schema import LLMProviderConfig
+
+
+def _provider_config(api_key: str = "key") -> LLMProviderConfig:
+    return LLMProviderConfig(
+        id=uuid4(),
+        name="openai",
+        base_url="https://api.openai.com",
+        api_key=SecretStr(api_key),
+        is_active=True,
+        is_default=True,
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+
+
+@pytest.mark.unit
+class TestProviderClientPool:
+    """Tests for ProviderClientPool reuse, rotation and eviction."""
+
+    def setup_method(self) -> None:
+        self.pool = ProviderClientPool(health_check_seconds=0)
+
+    def test_reuses_client_for_same_key(self) -> None:
+        create = Mock(side_effect=lambda: object())
+
+        first = self.pool.get("OpenAI", "sync", "v1", create)
+        second = self.pool.get("openai", "sync", "v1", create)
+
+        assert first is second
+        create.assert_called_once()
+        assert self.pool.stats() == {"clients": 1, "hits": 1, "misses": 1, "evictions": 0}
+
+    def test_credentials_version_tracks_rotation(self) -> None:
+        assert credentials_version(_provider_config("a")) == credentials_version(_provider_config("a"))
+        assert credentials_version(_provider_config("a")) != credentials_version(_provider_config("b"))
+
+    def test_rotated_credentials_replace_old_client(self) -> None:
+        close = Mock()
+        old = self.pool.get("openai", "sync", "v1", object, close=close)
+
+        new = self.pool.get("openai", "sync", "v2", object, close=close)
+
+        assert new is not old
+        assert self.pool.stats()["clients"] == 1
+        # The old client may still serve in-flight calls
+        close.assert_not_called()
+
+    def test_unhealthy_client_is_rebuilt(self) -> None:
+        close = Mock()
+        health_check = Mock(side_effect=[RuntimeError("token expired"), None])
+        first = self.pool.get("watsonx", "api", "v1", object, health_check=health_check, close=close)
+
+        second = self.pool.get("watsonx", "api", "v1", object, health_check=health_check, close=close)
+        third = self.pool.get("watsonx", "api", "v1", object, health_check=health_check, close=close)
+
+        assert second is not first
+        assert third is second
+        # Provider instances built before the failure may still hold the old client
+        close.assert_not_called()
+        assert self.pool.stats()["evictions"] == 1
+
+    def test_health_check_is_rate_limited(self) -> None:
+        pool = ProviderClientPool(health_check_seconds=60)
+        health_check = Mock()
+        pool.get("watsonx", "api", "v1", object, health_check=health_check)
+
+        pool.get("watsonx", "api", "v1", object, health_check=health_check)
+
+        health_check.assert_not_called()
+
+    def test_evict_removes_provider_clients_without_closing(self) -> None:
+        close = Mock()
+        evicted = self.pool.get("openai", "sync", "v1", object, close=close)
+        self.pool.get("openai", "async", "v1", object)
+        self.pool.get("anthropic", "sync", "v1", object)
+
+        assert self.pool.evict("openai") == 2
+
+        # Live providers may still share the evicted client
+        close.assert_not_called()
+        assert self.pool.stats()["clients"] == 1
+        assert self.pool.get("openai", "sync", "v1", object, close=close) is not evicted
+
+    def test_concurrent_callers_build_client_once(self) -> None:
+        def slow_create() -> object:
+            time.sleep(0.05)
+            return object()
+
+        create = Mock(side_effect=slow_create)
+        results: list[object] = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.pool.get("watsonx", "api", "v1", create)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        create.assert_called_once()
+        assert len({id(client) for client in results}) == 1
+
+    def test_reset_closes_shared_pool(self) -> None:
+        close = Mock()
+        get_client_pool().get("openai", "sync", "v1", object, close=close)
+
+        reset_client_pool()
+
+        close.assert_called_once()
+        assert get_client_pool().stats()["clients"] == 0
+
+
+@pytest.mark.unit
+class TestLLMProviderFactoryPooling:
+    """Tests for provider factories sharing pooled clients."""
+
+    def _factory(self) -> LLMProviderFactory:
+        with (
+            patch("rag_solution.generation.providers.factory.LLMProviderService"),
+            patch("rag_solution.generation.providers.factory.LLMParametersService"),
+            patch("rag_solution.generation.providers.factory.PromptTemplateService"),
+            patch("rag_solution.generation.providers.factory.LLMModelService"),
+        ):
+            return LLMProviderFactory(Mock(), Mock())
+
+    def test_failed_validation_evicts_pooled_clients(self) -> None:
+        provider_class = Mock()
+        provider_class.return_value.validate_client.side_effect = ValueError("invalid client")
+        get_client_pool().get("fake", "sync", "v1", object)
+
+        with patch.dict(LLMProviderFactory._providers, {"fake": provider_class}):
+            with pytest.raises(LLMProviderError):
+                self._factory().get_provider("fake")
+
+        assert get_client_pool().stats()["clients"] == 0
+
+    def test_warm_up_creates_active_registered_providers(self) -> None:
+        factory = self._factory()
+        registered, unregistered = Mock(), Mock()
+        registered.name, unregistered.name = "Fake", "unregistered"
+        factory._llm_provider_service.get_all_providers.return_value = [registered, unregistered]
+        provider_class = Mock()
+
+        with patch.dict(LLMProviderFactory._providers, {"fake": provider_class}):
+            warmed = factory.warm_up()
+
+        assert warmed == ["fake"]
+        provider_class.assert_called_once()
+
+    def test_watsonx_embeddings_client_follows_rebuilt_api_client(self) -> None:
+        from rag_solution.generation.providers.watsonx import WatsonXLLM
+        from rag_solution.schemas.llm_model_schema import ModelType
+
+        provider = WatsonXLLM.__new__(WatsonXLLM)
+        provider._provider = _provider_config()
+        provider._provider_name = "watsonx"
+        provider._models = [Mock(model_type=ModelType.EMBEDDING, model_id="ibm/slate")]
+
+        with patch("rag_solution.generation.providers.watsonx.wx_Embeddings") as embeddings_class:
+            embeddings_class.side_effect = lambda **kwargs: Mock(api_client=kwargs["api_client"])
+            provider.client = Mock()
+            provider._initialize_embeddings_client()
+            first = provider.embeddings_client
+            provider._initialize_embeddings_client()
+            assert provider.embeddings_client is first
+
+            # The pooled API client was rebuilt, e.g. after a failed health check
+            provider.client = Mock()
+            provider._initialize_embeddings_client()
+
+        assert provider.embeddings_client is not first
+        assert provider.embeddings_client.api_client is provider.client
+        assert get_client_pool().stats()["clients"] == 1
@@ -0,0 +1,64 @@
+"""Unit tests for the provider token bucket rate limiter."""
+
+import time
+
+import pytest
+
+from rag_solution.generation.providers.rate_limiting import TokenBucket, get_token_bucket, reset_token_buckets
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    """Tests for TokenBucket pacing."""
+
+    def test_burst_does_not_wait(self) -> None:
+        bucket = TokenBucket(rate=1.0, capacity=3)
+
+        waits = [bucket.acquire() for _ in range(3)]
+
+        assert waits == [0.0, 0.0, 0.0]
+
+    def test_waits_once_burst_is_exhausted(self) -> None:
+        bucket = TokenBucket(rate=50.0, capacity=1)
+        bucket.acquire()
+
+        start = time.monotonic()
+        waited = bucket.acquire()
+
+        assert waited > 0
+        assert time.monotonic() - start >= waited * 0.9
+
+    def test_try_acquire(self) -> None:
+        bucket = TokenBucket(rate=0.001, capacity=1)
+
+        assert bucket.try_acquire() is True
+        assert bucket.try_acquire() is False
+
+    def test_zero_rate_disables_limiting(self) -> None:
+        bucket = TokenBucket(rate=0.0, capacity=1)
+
+        assert [bucket.acquire() for _ in range(5)] == [0.0] * 5
+
+    async def test_acquire_async(self) -> None:
+        bucket = TokenBucket(rate=100.0, capacity=1)
+
+        assert await bucket.acquire_async() == 0.0
+        assert await bucket.acquire_async() > 0
+
+
+@pytest.mark.unit
+class TestGetTokenBucket:
+    """Tests for the process-wide bucket registry."""
+
+    def teardown_method(self) -> None:
+        reset_token_buckets()
+
+    def test_same_name_returns_shared_bucket(self) -> None:
+        assert get_token_bucket("watsonx:embeddings", 2.0, 4) is get_token_bucket("watsonx:embeddings", 2.0, 4)
+
+    def test_changed_configuration_replaces_bucket(self) -> None:
+        first = get_token_bucket("watsonx:embeddings", 2.0, 4)
+        second = get_token_bucket("watsonx:embeddings", 5.0, 4)
+
+        assert first is not second
+        assert second.rate == 5.0
@@ -230,8 +230,7 @@ class TestSearchServiceBasicSearch:
         search_service = mock_pipeline_stage_methods
 
         # Mock collection service
-        search_service.collection_service.get_collection.return_value = sample_collection
-        search_service.collection_service.get_user_collections.return_value = [sample_collection]
+        search_service.collection_service.get_collection_access.return_value = sample_collection
 
         # Mock file service for metadata
         mock_file1 = Mock()
@@ -286,7 +285,7 @@ class TestSearchServiceBasicSearch:
     @pytest.mark.asyncio
     async def test_search_collection_not_found(self, search_service, sample_search_input):
         """Test search with non-existent collection."""
-        search_service.collection_service.get_collection.return_value = None
+        search_service.collection_service.get_collection_access.return_value = None
 
         with pytest.raises(HTTPException) as exc_info:
             await search_service.search(sample_search_input)
@@ -294,13 +293,27 @@ class TestSearchServiceBasicSearch:
         assert exc_info.value.status_code == 404
         assert "Collection" in str(exc_info.value.detail)
 
+    def test_validate_collection_access_uses_cached_access(
+        self, search_service, sample_collection, test_collection_id, test_user_id
+    ):
+        """Test access checks use the per-user access lookup instead of listing the user's collections."""
+        sample_collection.is_private = True
+        sample_collection.is_member = True
+        search_service.collection_service.get_collection_access.return_value = sample_collection
+
+        search_service._validate_collection_access(test_collection_id, test_user_id)
+
+        search_service.collection_service.get_collection_access.assert_called_once_with(test_collection_id, test_user_id)
+        search_service.collection_service.get_user_collections.assert_not_called()
+        search_service.collection_service.get_collection.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_search_with_processing_collection_fails(
         self, search_service, sample_search_input, sample_collection
     ):
         """Test that search fails on collections still processing."""
         sample_collection.status = CollectionStatus.PROCESSING
-        search_service.collection_service.get_collection.return_value = sample_collection
+        search_service.collection_service.get_collection_access.return_value = sample_collection
 
         with pytest.raises(HTTPException) as exc_info:
             await search_service.search(sample_search_input)
@@ -314,7 +327,7 @@ class TestSearchServiceBasicSearch:
     ):
         """Test that search fails on newly created collections with no documents."""
         sample_collection.status = CollectionStatus.CREATED
-        search_service.collection_service.get_collection.return_value = sample_collection
+        search_service.collection_service.get_collection_access.return_value = sample_collection
 
         with pytest.raises(HTTPException) as exc_info:
             await search_service.search(sample_search_input)
@@ -328,7 +341,7 @@ class TestSearchServiceBasicSearch:
     ):
         """Test that search fails on collections with errors."""
         sample_collection.status = CollectionStatus.ERROR
-        search_service.collection_service.get_collection.return_value = sample_collection
+        search_service.collection_service.get_collection_access.return_value = sample_collection
 
         with pytest.raises(HTTPException) as exc_info:
             await search_service.search(sample_search_input)
@@ -342,8 +355,8 @@ class TestSearchServiceBasicSearch:
     ):
         """Test that private collection access is denied to unauthorized users."""
         sample_collection.is_private = True
-        search_service.collection_service.get_collection.return_value = sample_collection
-        search_service.collection_service.get_user_collections.return_value = []  # User has no access
+        sample_collection.is_member = False  # User has no access
+        search_service.collection_service.get_collection_access.return_value = sample_collection
 
         with pytest.raises(HTTPException) as exc_info:
             await search_service.search(sample_search_input)
@@ -360,8 +373,8 @@ class TestSearchServiceBasicSearch:
         search_service = mock_pipeline_stage_methods
 
         sample_collection.is_private = True
-        search_service.collection_service.get_collection.return_value = sample_collection
-        search_service.collection_service.get_user_collections.return_value = [sample_collection]
+        sample_collection.is_member = True
+        search_service.collection_service.get_collection_access.return_value = sample_collection
 
         # Mock file service
         mock_file1 = Mock()
@@ -997,8 +1010,7 @@ class TestSearchServiceEdgeCases:
         search_service = mock_pipeline_stage_methods
         sample_search_input.question = "What is ML? @#$%^&*()"
 
-        search_service.collection_service.get_collection.return_value = sample_collection
-        search_service.collection_service.get_user_collections.return_value = [sample_collection]
+        search_service.collection_service.get_collection_access.return_value = sample_collection
         search_service.file_service.get_files_by_collection.return_value = []
         search_service.token_tracking_service.check_usage_warning = AsyncMock(return_value=None)
 
@@ -1016,8 +1028,7 @@ class TestSearchServiceEdgeCases:
         search_service = mock_pipeline_stage_methods
         sample_search_input.question = "What is machine learning? " * 100  # ~2500 chars
 
-        search_service.collection_service.get_collection.return_value = sample_collection
-        search_service.collection_service.get_user_collections.return_value = [sample_collection]
+        search_service.collection_service.get_collection_access.return_value = sample_collection
         search_service.file_service.get_files_by_collection.return_value = []
         search_service.token_tracking_service.check_usage_warning = AsyncMock(return_value=None)
 
@@ -1034,8 +1045,7 @@ class TestSearchServiceEdgeCases:
         """Test search handles case where no results are found."""
         search_service = mock_pipeline_stage_methods
 
-        search_service.collection_service.get_collection.return_value = sample_collection
-        search_service.collection_service.get_user_collections.return_value = [sample_collection]
+        search_service.collection_service.get_collection_access.return_value = sample_collection
         search_service.file_service.get_files_by_collection.return_value = []
         search_service.token_tracking_service.check_usage_warning = AsyncMock(return_value=None)
 
@@ -0,0 +1,72 @@
+"""Unit tests for segmented audio output and HLS playlists."""
+
+from pathlib import Path
+
+import pytest
+from pydub import AudioSegment
+
+from rag_solution.generation.audio.segmented_output import (
+    ENDLIST_TAG,
+    PLAYLIST_NAME,
+    SegmentedAudioWriter,
+    read_playlist,
+)
+
+
+def _audio(duration_ms: int) -> AudioSegment:
+    return AudioSegment.silent(duration=duration_ms, frame_rate=24000)
+
+
+@pytest.mark.unit
+class TestSegmentedAudioWriter:
+    """Tests for SegmentedAudioWriter."""
+
+    def test_segments_land_while_writing(self, tmp_path: Path) -> None:
+        """Complete segments and playlist entries appear before the writer is closed."""
+        writer = SegmentedAudioWriter(tmp_path / "segments", segment_seconds=1, segment_format="wav")
+
+        writer.write(_audio(2500))
+
+        names, complete = read_playlist(writer.playlist_path)
+        assert names == ["segment_00000.wav", "segment_00001.wav"]
+        assert complete is False
+        assert all((writer.output_dir / name).exists() for name in names)
+
+    def test_close_flushes_remainder_and_ends_playlist(self, tmp_path: Path) -> None:
+        """The last partial segment is flushed and the playlist marked complete."""
+        writer = SegmentedAudioWriter(tmp_path / "segments", segment_seconds=1, segment_format="wav")
+        writer.write(_audio(700))
+        writer.write_silence(800)
+
+        count = writer.close()
+
+        names, complete = read_playlist(writer.playlist_path)
+        assert count == 2
+        assert complete is True
+        playlist = writer.playlist_path.read_text()
+        assert "#EXT-X-PLAYLIST-TYPE:EVENT" in playlist
+        assert "#EXTINF:1.000," in playlist
+        assert "#EXTINF:0.500," in playlist
+        assert "segments/segment_00001.wav" in playlist
+        assert playlist.rstrip().endswith(ENDLIST_TAG)
+        assert len(AudioSegment.from_wav(str(writer.output_dir / names[1]))) == 500
+
+    def test_abort_removes_segments(self, tmp_path: Path) -> None:
+        """Aborting removes the playlist so live listeners stop waiting."""
+        writer = SegmentedAudioWriter(tmp_path / "segments", segment_seconds=1, segment_format="wav")
+        writer.write(_audio(1500))
+
+        writer.abort()
+
+        assert not writer.output_dir.exists()
+        assert read_playlist(writer.playlist_path) == ([], True)
+
+    def test_previous_attempt_is_cleared(self, tmp_path: Path) -> None:
+        """Segments from an earlier attempt are removed when a new writer starts."""
+        output_dir = tmp_path / "segments"
+        output_dir.mkdir()
+        (output_dir / PLAYLIST_NAME).write_text("#EXTM3U\nsegments/segment_00000.mp3\n#EXT-X-ENDLIST\n")
+
+        SegmentedAudioWriter(output_dir, segment_format="wav")
+
+        assert not (output_dir / PLAYLIST_NAME).exists()
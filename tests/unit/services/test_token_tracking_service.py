@@ -13,6 +13,7 @@ from rag_solution.schemas.llm_usage_schema import (
     TokenWarningType,
 )
 from rag_solution.services.token_tracking_service import TokenTrackingService
+from rag_solution.services.usage_accounting import get_usage_accountant
 
 
 class TestTokenTrackingService:
@@ -34,8 +35,9 @@ class TestTokenTrackingService:
     def service(self, mock_db: Mock, mock_settings: Mock) -> TokenTrackingService:
         """Create a TokenTrackingService instance with mocked dependencies."""
         service = TokenTrackingService(mock_db, mock_settings)
-        # Mock the repository
+        # Mock the repositories
         service.token_warning_repository = Mock()
+        service.llm_usage_repository = Mock()
         return service
 
     @pytest.fixture
@@ -480,13 +482,7 @@ class TestTokenTrackingService:
     async def test_get_user_token_stats(self, service: TokenTrackingService) -> None:
         """Test get_user_token_stats method."""
         user_id = uuid4()
-        mock_stats = {
-            "total_warnings": 10,
-            "critical_warnings": 2,
-            "warning_warnings": 5,
-            "info_warnings": 3
-        }
-        service.token_warning_repository.get_warning_stats_by_user.return_value = mock_stats
+        service.llm_usage_repository.get_totals_by_user.return_value = []
 
         result = await service.get_user_token_stats(user_id)
 
@@ -495,4 +491,37 @@ class TestTokenTrackingService:
         assert result.total_calls == 0  # Default value
         assert result.by_service == {}  # Default value
         assert result.by_model == {}  # Default value
-        service.token_warning_repository.get_warning_stats_by_user.assert_called_once_with(user_id)
+        service.llm_usage_repository.get_totals_by_user.assert_called_once_with(user_id)
+
+    @pytest.mark.asyncio
+    async def test_get_user_token_stats_includes_unflushed_usage(
+        self, service: TokenTrackingService, sample_llm_usage: LLMUsage
+    ) -> None:
+        """Test get_user_token_stats combines persisted totals with unflushed usage."""
+        user_id = uuid4()
+        service.llm_usage_repository.get_totals_by_user.return_value = [
+            Mock(
+                model_name="test-model",
+                service_type="search",
+                prompt_tokens=2000,
+                completion_tokens=400,
+                total_tokens=2400,
+                calls=2,
+            )
+        ]
+        service.settings = Mock(
+            llm_usage_accounting_enabled=True,
+            llm_usage_max_keys=100,
+            llm_usage_recent_events=10,
+            llm_usage_flush_interval_seconds=10.0,
+        )
+        sample_llm_usage.user_id = str(user_id)
+        get_usage_accountant(service.settings).record(sample_llm_usage)
+
+        result = await service.get_user_token_stats(user_id)
+
+        assert result.total_tokens == 3600
+        assert result.total_calls == 3
+        assert result.average_tokens_per_call == 1200
+        assert result.by_model == {"test-model": 3600}
+        assert result.by_service == {"search": 3600}
@@ -0,0 +1,149 @@
+"""
+Unit tests for the tokenizer service and token-budgeted context packing.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from rag_solution.services.tokenizer_service import (
+    HeuristicTokenizer,
+    Tokenizer,
+    TokenizerService,
+    get_tokenizer_service,
+    pack_context,
+    reset_tokenizer_service,
+)
+
+
+class WordTokenizer(Tokenizer):
+    """Deterministic tokenizer counting whitespace separated words."""
+
+    name = "words"
+
+    def count_batch(self, texts):
+        return [len(text.split()) for text in texts]
+
+    def truncate(self, text, max_tokens):
+        return " ".join(text.split()[:max_tokens])
+
+
+def words(prefix, count):
+    return " ".join(f"{prefix}{i}" for i in range(count))
+
+
+@pytest.fixture
+def tokenizer():
+    return WordTokenizer()
+
+
+class TestTokenizerService:
+    """Test tokenizer caching and counting."""
+
+    def test_tokenizer_is_loaded_once_per_model(self):
+        """Test tokenizers are cached per model id."""
+        service = TokenizerService()
+
+        with patch.object(service, "_load", return_value=HeuristicTokenizer()) as mock_load:
+            first = service.get_tokenizer("gpt-4o")
+            second = service.get_tokenizer("gpt-4o")
+            service.get_tokenizer("ibm/granite-3-8b-instruct")
+
+        assert first is second
+        assert mock_load.call_count == 2
+
+    def test_cache_is_bounded(self):
+        """Test least recently used tokenizers are evicted."""
+        service = TokenizerService(max_tokenizers=2)
+
+        with patch.object(service, "_load", side_effect=lambda _: HeuristicTokenizer()) as mock_load:
+            service.get_tokenizer("a")
+            service.get_tokenizer("b")
+            service.get_tokenizer("c")
+            service.get_tokenizer("a")
+
+        assert mock_load.call_count == 4
+
+    def test_count_tokens_batch(self, tokenizer):
+        """Test batch counting returns one count per text."""
+        service = TokenizerService()
+
+        with patch.object(service, "_load", return_value=tokenizer):
+            assert service.count_tokens_batch(["one two", "three", ""]) == [2, 1, 0]
+            assert service.count_tokens("one two three") == 3
+
+    def test_unavailable_tokenizers_fall_back_to_heuristic(self):
+        """Test counting still works when no tokenizer can be loaded."""
+        service = TokenizerService()
+
+        with patch("rag_solution.services.tokenizer_service.TIKTOKEN_AVAILABLE", False):
+            tokenizer = service.get_tokenizer()
+
+        assert isinstance(tokenizer, HeuristicTokenizer)
+        assert service.count_tokens("x" * 36) == 10
+
+    def test_process_wide_service(self):
+        """Test the accessor returns a shared instance until reset."""
+        reset_tokenizer_service()
+        try:
+            assert get_tokenizer_service() is get_tokenizer_service()
+        finally:
+            reset_tokenizer_service()
+
+
+class TestPackContext:
+    """Test packing scored chunks into a token budget."""
+
+    def test_selects_by_score_within_budget(self, tokenizer):
+        """Test the highest scoring chunks that fit are selected in score order."""
+        texts = [words("low", 40), words("high", 40), words("mid", 40)]
+
+        packed = pack_context(tokenizer, texts, [0.1, 0.9, 0.5], token_budget=85, separator=" ")
+
+        assert packed.indices == [1, 2]
+        assert packed.token_count == 80
+        assert packed.token_count <= 85
+
+    def test_fills_remainder_with_truncated_chunk(self, tokenizer):
+        """Test leftover budget is filled with a prefix of the best chunk that did not fit."""
+        texts = [words("a", 50), words("b", 100)]
+
+        packed = pack_context(tokenizer, texts, [0.9, 0.8], token_budget=100, separator=" ")
+
+        assert packed.indices == [0, 1]
+        assert packed.truncated is True
+        assert packed.token_count == 100
+        assert packed.chunks[1] == words("b", 50)
+
+    def test_skips_smaller_chunks_when_large_one_does_not_fit(self, tokenizer):
+        """Test a chunk that does not fit is passed over in favour of a smaller one."""
+        texts = [words("a", 60), words("b", 80), words("c", 30)]
+
+        packed = pack_context(tokenizer, texts, [0.9, 0.8, 0.7], token_budget=100, separator=" ")
+
+        assert packed.indices[:2] == [0, 2]
+        assert packed.token_count <= 100
+
+    def test_skips_overlapping_chunks(self, tokenizer):
+        """Test duplicate and mostly overlapping chunks are not packed twice."""
+        base = words("w", 50)
+        overlapping = " ".join([*base.split()[5:], "extra1", "extra2"])
+        texts = [base, base, overlapping, words("other", 20)]
+
+        packed = pack_context(tokenizer, texts, [0.9, 0.8, 0.7, 0.6], token_budget=500, separator=" ")
+
+        assert packed.indices == [0, 3]
+        assert packed.duplicates_skipped == 2
+
+    def test_empty_input_or_budget(self, tokenizer):
+        """Test nothing is packed without chunks or budget."""
+        assert pack_context(tokenizer, [], None, 100).chunks == []
+        assert pack_context(tokenizer, ["text"], None, 0).chunks == []
+
+    def test_final_count_never_exceeds_budget(self):
+        """Test the joined context respects the budget with the heuristic tokenizer."""
+        texts = [f"chunk {i} " + "lorem ipsum dolor sit amet " * (10 + i) for i in range(10)]
+
+        packed = pack_context(HeuristicTokenizer(), texts, list(range(10)), token_budget=300)
+
+        assert 0 < packed.token_count <= 300
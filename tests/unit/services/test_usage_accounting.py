@@ -0,0 +1,166 @@
+"""Unit tests for bounded LLM usage accounting."""
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+import pytest
+from rag_solution.schemas.llm_usage_schema import LLMUsage, ServiceType
+from rag_solution.services import usage_accounting
+from rag_solution.services.usage_accounting import (
+    UsageAccountant,
+    UsageCounter,
+    UsageFlusher,
+    get_usage_accountant,
+    usage_stats,
+)
+
+
+def _usage(user_id: str | None = None, model: str = "granite", service: ServiceType = ServiceType.SEARCH) -> LLMUsage:
+    return LLMUsage(
+        prompt_tokens=100,
+        completion_tokens=20,
+        total_tokens=120,
+        model_name=model,
+        service_type=service,
+        timestamp=datetime.now(UTC),
+        user_id=user_id,
+    )
+
+
+def _settings(**overrides) -> Mock:
+    values = {
+        "llm_usage_accounting_enabled": True,
+        "llm_usage_max_keys": 100,
+        "llm_usage_recent_events": 10,
+        "llm_usage_flush_interval_seconds": 10.0,
+    }
+    values.update(overrides)
+    return Mock(**values)
+
+
+@pytest.mark.unit
+class TestUsageAccountant:
+    """Tests for running counters, the recent-events ring buffer and flushing."""
+
+    def setup_method(self) -> None:
+        self.accountant = UsageAccountant(max_keys=2, recent_events=3)
+        self.user_uuid = uuid4()
+        self.user_id = str(self.user_uuid)
+
+    def test_counters_aggregate_per_model_and_service(self) -> None:
+        self.accountant.record(_usage(self.user_id))
+        self.accountant.record(_usage(self.user_id))
+        self.accountant.record(_usage(self.user_id, service=ServiceType.CONVERSATION))
+
+        stats = self.accountant.totals(self.user_id)
+
+        assert stats.total_tokens == 360
+        assert stats.total_calls == 3
+        assert stats.by_service == {"search": 240, "conversation": 120}
+        assert stats.by_model == {"granite": 360}
+        assert self.accountant.totals(str(uuid4())).total_calls == 0
+
+    def test_memory_is_bounded(self) -> None:
+        for index in range(10):
+            self.accountant.record(_usage(model=f"model-{index}"))
+
+        assert len(self.accountant.recent(limit=100)) == 3
+        assert self.accountant.recent(limit=1)[0].model_name == "model-9"
+        assert self.accountant.stats()["counters"] == 2
+
+    def test_anonymous_usage_is_not_persisted(self) -> None:
+        self.accountant.record(_usage(None))
+        self.accountant.record(_usage("not-a-uuid"))
+
+        assert self.accountant.stats()["pending"] == 0
+        assert self.accountant.totals().total_calls == 2
+
+    def test_flush_writes_one_row_per_bucket(self) -> None:
+        self.accountant.record(_usage(self.user_id))
+        self.accountant.record(_usage(self.user_id))
+
+        with patch.object(usage_accounting, "LLMUsageRepository") as repository:
+            repository.return_value.add_usage.return_value = 1
+            assert self.accountant.flush(Mock()) == 1
+
+        (rows,) = repository.return_value.add_usage.call_args.args
+        assert rows == [
+            {
+                "user_id": self.user_uuid,
+                "model_name": "granite",
+                "service_type": "search",
+                "prompt_tokens": 200,
+                "completion_tokens": 40,
+                "total_tokens": 240,
+                "calls": 2,
+            }
+        ]
+        assert self.accountant.stats()["pending"] == 0
+
+    def test_failed_flush_keeps_deltas(self) -> None:
+        self.accountant.record(_usage(self.user_id))
+
+        with patch.object(usage_accounting, "LLMUsageRepository") as repository:
+            repository.return_value.add_usage.side_effect = RuntimeError("database unavailable")
+            with pytest.raises(RuntimeError):
+                self.accountant.flush(Mock())
+        self.accountant.record(_usage(self.user_id))
+
+        pending = self.accountant.pending_for_user(self.user_uuid)
+        assert pending == {("granite", "search"): UsageCounter(200, 40, 240, 2)}
+
+    def test_deltas_are_not_kept_without_persistence(self) -> None:
+        accountant = UsageAccountant(persist=False)
+
+        accountant.record(_usage(self.user_id))
+
+        assert accountant.stats()["pending"] == 0
+        assert accountant.totals(self.user_id).total_calls == 1
+
+
+@pytest.mark.unit
+class TestUsageAccountingHelpers:
+    """Tests for the shared accountant and statistics helpers."""
+
+    def test_disabled_returns_none(self) -> None:
+        assert get_usage_accountant(_settings(llm_usage_accounting_enabled=False)) is None
+
+    def test_enabled_returns_shared_instance(self) -> None:
+        accountant = get_usage_accountant(_settings())
+
+        assert accountant is get_usage_accountant(_settings())
+        assert accountant.max_keys == 100
+
+    def test_usage_stats_of_no_counters(self) -> None:
+        stats = usage_stats({})
+
+        assert stats.total_calls == 0
+        assert stats.average_tokens_per_call == 0.0
+
+
+@pytest.mark.unit
+class TestUsageFlusher:
+    """Tests for the background flusher."""
+
+    async def test_does_not_start_when_disabled(self) -> None:
+        flusher = UsageFlusher(_settings(), interval_seconds=0)
+
+        flusher.start()
+
+        assert flusher._task is None
+
+    async def test_flushes_periodically_and_at_shutdown(self) -> None:
+        accountant = get_usage_accountant(_settings())
+        session = Mock()
+        flusher = UsageFlusher(_settings(), interval_seconds=0.01, session_factory=lambda: session)
+
+        with patch.object(accountant, "flush", side_effect=RuntimeError("database unavailable")) as flush:
+            flusher.start()
+            await asyncio.sleep(0.05)
+            await flusher.stop()
+
+        assert flush.call_count >= 2
+        assert flusher._task is None
+        session.close.assert_called()
@@ -1,12 +1,14 @@
 """Unit tests for UserCollectionService."""
 
 from datetime import UTC, datetime
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 
 import pytest
+from rag_solution.core.collection_access_cache import invalidate_collection_access, reset_collection_access_cache
 from rag_solution.core.exceptions import NotFoundError
-from rag_solution.schemas.collection_schema import CollectionOutput, CollectionStatus
+from rag_solution.repository.collection_repository import CollectionRepository
+from rag_solution.schemas.collection_schema import CollectionAccess, CollectionOutput, CollectionStatus
 from rag_solution.schemas.user_collection_schema import UserCollectionOutput
 from rag_solution.services.user_collection_service import UserCollectionService
 from pydantic import UUID4
@@ -82,6 +84,18 @@ class TestUserCollectionService:
         assert result[0].status == CollectionStatus.COMPLETED
         mock_user_collection_repository.get_user_collections.assert_called_once_with(sample_user_id)
 
+    async def test_get_user_collections_async(self, mock_db: Mock, sample_user_id: UUID4) -> None:
+        """Test the async listing reads through the collection repository's async session."""
+        async_db = Mock()
+        service = UserCollectionService(mock_db, async_db=async_db)
+        get_async = AsyncMock(return_value=[])
+
+        with patch.object(CollectionRepository, "get_user_collections_async", get_async):
+            assert await service.get_user_collections_async(sample_user_id) == []
+
+        get_async.assert_awaited_once_with(sample_user_id)
+        mock_db.query.assert_not_called()
+
     def test_get_user_collections_empty(self, service: UserCollectionService, sample_user_id: UUID4, mock_user_collection_repository: Mock) -> None:
         """Test get_user_collections with empty result."""
         mock_user_collection_repository.get_user_collections.return_value = []
@@ -352,3 +366,33 @@ class TestUserCollectionService:
             service.remove_user_from_collection(sample_user_id, sample_collection_id)
 
         assert "Failed to remove user" in str(exc_info.value)
+
+    def test_get_collection_access_without_settings_queries_repository(self, service: UserCollectionService, sample_user_id: UUID4, sample_collection_id: UUID4, mock_user_collection_repository: Mock) -> None:
+        """Test get_collection_access goes to the repository when no settings are given."""
+        service.get_collection_access(sample_user_id, sample_collection_id)
+        service.get_collection_access(sample_user_id, sample_collection_id)
+
+        assert mock_user_collection_repository.get_collection_access.call_count == 2
+        mock_user_collection_repository.get_collection_access.assert_called_with(sample_user_id, sample_collection_id)
+
+    def test_get_collection_access_is_cached_until_membership_changes(self, mock_db: Mock, mock_user_collection_repository: Mock, sample_user_id: UUID4, sample_collection_id: UUID4) -> None:
+        """Test access decisions are cached and reloaded after a membership change."""
+        reset_collection_access_cache()
+        settings = Mock(collection_access_cache_enabled=True, collection_access_cache_max_entries=10, collection_access_cache_ttl_seconds=30.0)
+        service = UserCollectionService(mock_db, settings)
+        service.user_collection_repository = mock_user_collection_repository
+        mock_user_collection_repository.get_collection_access.return_value = CollectionAccess(
+            id=sample_collection_id, user_id=sample_user_id, is_private=True, status=CollectionStatus.COMPLETED, is_member=True
+        )
+
+        try:
+            assert service.get_collection_access(sample_user_id, sample_collection_id).is_member
+            assert service.get_collection_access(sample_user_id, sample_collection_id).is_member
+            assert mock_user_collection_repository.get_collection_access.call_count == 1
+
+            invalidate_collection_access(sample_collection_id)
+            service.get_collection_access(sample_user_id, sample_collection_id)
+
+            assert mock_user_collection_repository.get_collection_access.call_count == 2
+        finally:
+            reset_collection_access_cache()
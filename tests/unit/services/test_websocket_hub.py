@@ -0,0 +1,211 @@
+"""Unit tests for the WebSocket connection hub and backplanes."""
+
+import asyncio
+import json
+from collections.abc import Callable
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from rag_solution.services import websocket_hub
+from rag_solution.services.websocket_hub import (
+    Backplane,
+    ConnectionHub,
+    PostgresBackplane,
+    create_backplane,
+)
+
+
+class FakeWebSocket:
+    """WebSocket double recording sent messages; sends block while ``blocked`` is set."""
+
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+        self.closed_with: int | None = None
+        self.blocked = False
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, data: str) -> None:
+        while self.blocked:
+            await asyncio.sleep(0.01)
+        self.sent.append(data)
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None:
+        self.closed_with = code
+
+
+class InMemoryBackplane(Backplane):
+    """Backplane connecting hubs in the same process, standing in for separate workers."""
+
+    def __init__(self, subscribers: list[Callable[[str], None]]) -> None:
+        self.subscribers = subscribers
+
+    async def start(self, deliver: Callable[[str], None]) -> None:
+        self.subscribers.append(deliver)
+
+    async def stop(self) -> None:
+        pass
+
+    async def publish(self, payload: str) -> None:
+        for deliver in self.subscribers:
+            deliver(payload)
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.unit
+class TestConnectionHub:
+    """Tests for per-user fan-out and slow-consumer eviction."""
+
+    async def test_user_receives_on_every_connection(self) -> None:
+        hub = ConnectionHub()
+        first, second, other = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+        await hub.connect(first, "user-1")
+        await hub.connect(second, "user-1")
+        await hub.connect(other, "user-2")
+
+        delivered = await hub.send_to_user("user-1", {"type": "podcast_progress", "progress": 50})
+        await _settle()
+
+        assert delivered == 2
+        assert first.sent == second.sent == [json.dumps({"type": "podcast_progress", "progress": 50})]
+        assert other.sent == []
+        await hub.stop()
+
+    async def test_send_targets_one_connection_in_order(self) -> None:
+        hub = ConnectionHub()
+        websocket = FakeWebSocket()
+        connection_id = await hub.connect(websocket, "user-1")
+
+        hub.send(connection_id, "first")
+        hub.send(connection_id, "second")
+        await _settle()
+
+        assert websocket.sent == ["first", "second"]
+        await hub.stop()
+
+    async def test_full_queue_evicts_slow_consumer(self) -> None:
+        hub = ConnectionHub(queue_size=1)
+        slow, fast = FakeWebSocket(), FakeWebSocket()
+        slow.blocked = True
+        await hub.connect(slow, "user-1")
+        await hub.connect(fast, "user-1")
+
+        for index in range(3):
+            await hub.send_to_user("user-1", f"message {index}")
+            await _settle()
+
+        assert hub.connection_count("user-1") == 1
+        assert hub.evictions == 1
+        assert slow.closed_with == 1013
+        assert fast.sent == ["message 0", "message 1", "message 2"]
+        await hub.stop()
+
+    async def test_send_timeout_evicts_connection(self) -> None:
+        hub = ConnectionHub(send_timeout_seconds=0.01)
+        websocket = FakeWebSocket()
+        websocket.blocked = True
+        connection_id = await hub.connect(websocket, "user-1")
+
+        hub.send(connection_id, "stuck")
+        await asyncio.sleep(0.05)
+
+        assert hub.connection_count() == 0
+        assert websocket.closed_with == 1013
+
+    async def test_disconnect_is_idempotent(self) -> None:
+        hub = ConnectionHub()
+        connection_id = await hub.connect(FakeWebSocket(), "user-1")
+
+        await hub.disconnect(connection_id)
+        await hub.disconnect(connection_id)
+
+        assert hub.connection_count() == 0
+        assert hub.send(connection_id, "gone") is False
+
+    async def test_backplane_reaches_other_workers_once(self) -> None:
+        subscribers: list[Callable[[str], None]] = []
+        worker_a = ConnectionHub(backplane=InMemoryBackplane(subscribers))
+        worker_b = ConnectionHub(backplane=InMemoryBackplane(subscribers))
+        await worker_a.start()
+        await worker_b.start()
+        on_a, on_b = FakeWebSocket(), FakeWebSocket()
+        await worker_a.connect(on_a, "user-1")
+        await worker_b.connect(on_b, "user-1")
+
+        await worker_a.send_to_user("user-1", "answer chunk")
+        await worker_b.broadcast("announcement")
+        await _settle()
+
+        assert on_a.sent == ["answer chunk", "announcement"]
+        assert on_b.sent == ["answer chunk", "announcement"]
+        await worker_a.stop()
+        await worker_b.stop()
+
+    async def test_publish_failure_keeps_local_delivery(self) -> None:
+        backplane = Mock(spec=Backplane)
+        backplane.publish.side_effect = RuntimeError("database unavailable")
+        hub = ConnectionHub(backplane=backplane)
+        await hub.start()
+        websocket = FakeWebSocket()
+        await hub.connect(websocket, "user-1")
+
+        assert await hub.send_to_user("user-1", "still delivered") == 1
+        await _settle()
+
+        assert websocket.sent == ["still delivered"]
+        await hub.stop()
+
+
+@pytest.mark.unit
+class TestPostgresBackplane:
+    """Tests for NOTIFY fragmentation and backplane selection."""
+
+    def _backplane(self) -> PostgresBackplane:
+        engine = MagicMock()
+        engine.dialect.name = "postgresql"
+        return PostgresBackplane(Mock(websocket_backplane_channel="rag_websocket"), engine)
+
+    async def test_large_payloads_are_fragmented_and_reassembled(self) -> None:
+        sender, receiver = self._backplane(), self._backplane()
+        received: list[str] = []
+        receiver._deliver = received.append
+        sender._task = Mock()
+        payload = json.dumps({"message": "x" * 20000})
+
+        await sender.publish(payload)
+
+        connection = sender.engine.connect.return_value.execution_options.return_value.__enter__.return_value
+        fragments = [call.args[1]["payload"] for call in connection.execute.call_args_list]
+        assert len(fragments) == 3
+        assert all(len(fragment) < 8000 for fragment in fragments)
+        for fragment in reversed(fragments):
+            receiver.receive(fragment)
+        assert received == [payload]
+
+    async def test_does_not_start_without_postgres(self) -> None:
+        backplane = self._backplane()
+        backplane.engine.dialect.name = "sqlite"
+
+        await backplane.start(Mock())
+
+        assert backplane._task is None
+
+    def test_create_backplane(self) -> None:
+        custom = f"{__name__}:InMemoryBackplane"
+
+        assert create_backplane(Mock(websocket_backplane="none")) is None
+        assert isinstance(create_backplane(Mock(websocket_backplane=custom)), InMemoryBackplane)
+
+    def test_shared_hub_uses_settings(self) -> None:
+        settings = Mock(websocket_send_queue_size=5, websocket_send_timeout_seconds=1.0, websocket_backplane="none")
+
+        hub = websocket_hub.get_connection_hub(settings)
+
+        assert hub is websocket_hub.get_connection_hub()
+        assert hub.queue_size == 5
+        assert hub.backplane is None
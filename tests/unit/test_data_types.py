@@ -1,5 +1,6 @@
 """Unit tests for vectordbs/data_types.py models."""
 
+import numpy as np
 import pytest
 from pydantic import ValidationError
 
@@ -17,6 +18,10 @@ from vectordbs.data_types import (
     VectorDBResponse,
     VectorDBSearchResponse,
     VectorSearchRequest,
+    cosine_similarity_matrix,
+    embedding_to_list,
+    has_embeddings,
+    to_embedding_matrix,
 )
 
 
@@ -653,6 +658,86 @@ class TestVectorDBResponseTypeAliases:
         assert response.data is True
 
 
+class TestCompactEmbeddings:
+    """Tests for NumPy-backed embeddings on models."""
+
+    def test_array_embeddings_kept_as_float32_view(self):
+        """Rows of a float32 batch matrix are stored without copying."""
+        matrix = np.arange(12, dtype=np.float32).reshape(3, 4)
+        chunk = EmbeddedChunk(chunk_id="c1", text="t", embeddings=matrix[1])
+
+        assert isinstance(chunk.embeddings, np.ndarray)
+        assert chunk.embeddings.dtype == np.float32
+        assert np.shares_memory(chunk.embeddings, matrix)
+
+    def test_array_embeddings_cast_to_float32(self):
+        """float64 arrays are converted to float32."""
+        chunk = DocumentChunk(chunk_id="c1", embeddings=np.ones(4, dtype=np.float64))
+        assert chunk.embeddings.dtype == np.float32
+
+    def test_list_embeddings_unchanged(self):
+        """Lists are still validated and stored as lists."""
+        chunk = DocumentChunk(chunk_id="c1", embeddings=[1, 2])
+        assert chunk.embeddings == [1.0, 2.0]
+
+    def test_array_embeddings_serialize_as_list(self):
+        """Arrays serialize to plain float lists."""
+        chunk = DocumentChunk(chunk_id="c1", embeddings=np.array([0.5, 0.25], dtype=np.float32))
+        assert chunk.model_dump()["embeddings"] == [0.5, 0.25]
+        assert '"embeddings":[0.5,0.25]' in chunk.model_dump_json()
+
+    def test_empty_array_rejected_for_embedded_chunk(self):
+        """Empty arrays are rejected like empty lists."""
+        with pytest.raises(ValidationError):
+            EmbeddedChunk(chunk_id="c1", text="t", embeddings=np.array([], dtype=np.float32))
+
+    def test_2d_array_rejected(self):
+        """Only 1-D arrays are valid embeddings."""
+        with pytest.raises(ValidationError):
+            DocumentChunk(chunk_id="c1", embeddings=np.ones((2, 2), dtype=np.float32))
+
+    def test_has_embeddings(self):
+        """has_embeddings works for lists, arrays and None."""
+        assert has_embeddings([0.1])
+        assert has_embeddings(np.ones(2))
+        assert not has_embeddings([])
+        assert not has_embeddings(np.array([]))
+        assert not has_embeddings(None)
+
+    def test_embedding_to_list(self):
+        """Arrays and other float sequences come back as plain lists."""
+        values = [0.5, 0.25]
+        assert embedding_to_list(values) is values
+        assert embedding_to_list((0.5, 0.25)) == values
+        assert embedding_to_list(np.array(values, dtype=np.float32)) == values
+
+    def test_to_embedding_matrix(self):
+        """Embeddings are packed into one contiguous float32 matrix."""
+        matrix = to_embedding_matrix([[1, 2], [3, 4], [5, 6]])
+        assert matrix.shape == (3, 2)
+        assert matrix.dtype == np.float32
+        assert matrix.flags["C_CONTIGUOUS"]
+
+    def test_to_embedding_matrix_rejects_ragged_and_empty(self):
+        """Inconsistent or empty vectors raise ValueError."""
+        with pytest.raises(ValueError):
+            to_embedding_matrix([[1, 2], [3]])
+        with pytest.raises(ValueError):
+            to_embedding_matrix([[1, 2], []])
+
+    def test_cosine_similarity_matrix(self):
+        """Pairwise similarities, with zero vectors mapped to 0.0."""
+        similarities = cosine_similarity_matrix(
+            np.array([[1, 0], [0, 0]], dtype=np.float32), np.array([[1, 0], [0, 1]], dtype=np.float32)
+        )
+        np.testing.assert_allclose(similarities, [[1.0, 0.0], [0.0, 0.0]])
+
+    def test_cosine_similarity_matrix_dimension_mismatch(self):
+        """Mismatched dimensions raise ValueError."""
+        with pytest.raises(ValueError, match="same length"):
+            cosine_similarity_matrix(np.ones((1, 2)), np.ones((1, 3)))
+
+
 class TestPerformance:
     """Performance tests for data models."""
 
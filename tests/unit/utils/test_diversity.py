@@ -0,0 +1,72 @@
+"""
+Unit tests for near-duplicate suppression and maximal marginal relevance.
+
+Tests SimHash fingerprints, near-duplicate detection in relevance order and
+MMR selection over candidate vectors.
+"""
+
+import numpy as np
+
+from rag_solution.utils.diversity import hamming_distances, mmr_select, near_duplicate_mask, simhash_fingerprints
+
+PASSAGE = (
+    "The retrieval augmented generation pipeline embeds each question, searches the vector store "
+    "for the most similar chunks and passes them to the language model as context for the answer."
+)
+
+
+class TestSimHash:
+    """Test SimHash fingerprints and their distances."""
+
+    def test_fingerprints_are_deterministic(self):
+        """Test the same text always gets the same fingerprint."""
+        first = simhash_fingerprints([PASSAGE])
+        second = simhash_fingerprints([PASSAGE])
+
+        assert first.shape == (1, 64)
+        assert np.array_equal(first, second)
+
+    def test_similar_texts_are_closer_than_unrelated(self):
+        """Test a lightly edited text is closer than an unrelated one."""
+        edited = PASSAGE.replace("answer.", "final answer.")
+        unrelated = "Coral reefs host marine biodiversity and protect coastlines from storms and erosion."
+
+        distances = hamming_distances(simhash_fingerprints([PASSAGE, edited, unrelated]))
+
+        assert distances[0, 0] == 0
+        assert distances[0, 1] < distances[0, 2]
+
+
+class TestNearDuplicateMask:
+    """Test near-duplicate detection."""
+
+    def test_later_copies_are_flagged(self):
+        """Test only the first occurrence of duplicated text is kept."""
+        texts = [PASSAGE, "Quantum computers use qubits and superposition.", PASSAGE.upper(), PASSAGE]
+
+        assert near_duplicate_mask(texts, max_distance=3).tolist() == [False, False, True, True]
+
+    def test_empty_texts_are_kept(self):
+        """Test empty texts are never treated as duplicates of each other."""
+        assert near_duplicate_mask(["", "", PASSAGE]).tolist() == [False, False, False]
+
+
+class TestMMRSelect:
+    """Test maximal marginal relevance selection."""
+
+    def test_pure_relevance_keeps_score_order(self):
+        """Test lambda 1.0 orders candidates by relevance."""
+        vectors = np.eye(3)
+
+        assert mmr_select(vectors, [0.2, 0.9, 0.5], lambda_mult=1.0) == [1, 2, 0]
+
+    def test_redundant_candidate_is_demoted(self):
+        """Test a candidate similar to the selected one is picked after a different one."""
+        vectors = np.array([[1.0, 0.0], [0.99, 0.1], [0.0, 1.0]])
+
+        assert mmr_select(vectors, [1.0, 0.95, 0.8], lambda_mult=0.5) == [0, 2, 1]
+
+    def test_top_k_limits_selection(self):
+        """Test top_k bounds the number of selected candidates."""
+        assert mmr_select(np.eye(4), [0.4, 0.3, 0.2, 0.1], top_k=2) == [0, 1]
+        assert mmr_select(np.zeros((0, 3)), []) == []
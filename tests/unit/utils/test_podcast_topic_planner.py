@@ -0,0 +1,97 @@
+"""
+Unit tests for podcast topic planning.
+
+Tests splitting of formatted RAG results, deterministic clustering of
+related chunks and word budget allocation.
+"""
+
+import numpy as np
+
+from rag_solution.utils.podcast_topic_planner import (
+    allocate_word_budgets,
+    cluster_chunks,
+    plan_topic_segments,
+    split_rag_results,
+)
+from rag_solution.utils.term_vectors import term_vectors
+
+CHUNKS = [
+    "Solar panels convert sunlight into electricity using photovoltaic cells.",
+    "Coral reefs host marine biodiversity and protect coastlines.",
+    "Quantum computers use qubits and superposition.",
+    "Photovoltaic solar cells lose efficiency at high temperatures.",
+    "Bleaching threatens coral reefs when ocean water warms.",
+    "Qubits in quantum computers need error correction.",
+]
+
+
+class TestSplitRagResults:
+    """Test recovering chunk texts from formatted RAG results."""
+
+    def test_split_formatted_results(self):
+        """Test chunks are split on document markers in order."""
+        rag_results = "[Document 1]: First chunk.\n\n[Document 2]: Second chunk\nwith two lines."
+
+        assert split_rag_results(rag_results) == ["First chunk.", "Second chunk\nwith two lines."]
+
+    def test_split_unformatted_text(self):
+        """Test text without markers is returned as a single chunk."""
+        assert split_rag_results("Plain content") == ["Plain content"]
+        assert split_rag_results("") == []
+
+
+class TestClustering:
+    """Test clustering of chunks into topic segments."""
+
+    def test_related_chunks_are_grouped(self):
+        """Test chunks sharing terms end up in the same cluster."""
+        clusters = cluster_chunks(term_vectors(CHUNKS), 3)
+
+        assert clusters == [[0, 3], [1, 4], [2, 5]]
+
+    def test_clustering_is_deterministic(self):
+        """Test the same input always produces the same clusters."""
+        vectors = term_vectors(CHUNKS)
+
+        assert cluster_chunks(vectors, 3) == cluster_chunks(vectors.copy(), 3)
+
+    def test_cluster_count_is_bounded_by_chunks(self):
+        """Test more clusters than chunks are never produced."""
+        clusters = cluster_chunks(term_vectors(CHUNKS[:2]), 5)
+
+        assert sorted(index for cluster in clusters for index in cluster) == [0, 1]
+        assert len(clusters) <= 2
+
+
+class TestPlanTopicSegments:
+    """Test planning of podcast segments."""
+
+    def test_budgets_sum_to_total(self):
+        """Test word budgets always add up to the target word count."""
+        budgets = allocate_word_budgets([100, 300, 50], 4500)
+
+        assert sum(budgets) == 4500
+        assert budgets[1] > budgets[0] > budgets[2]
+
+    def test_segment_count_follows_length(self):
+        """Test the number of segments grows with the target word count."""
+        assert len(plan_topic_segments(CHUNKS, 750, 1500)) == 1
+        assert len(plan_topic_segments(CHUNKS, 4500, 1500)) == 3
+
+    def test_segments_have_keywords_in_retrieval_order(self):
+        """Test segments are ordered by their most relevant chunk and labelled by keywords."""
+        segments = plan_topic_segments(CHUNKS, 4500, 1500)
+
+        assert [segment.index for segment in segments] == [0, 1, 2]
+        assert segments[0].chunks[0] == CHUNKS[0]
+        assert "solar" in segments[0].keywords
+        assert "coral" in segments[1].label
+
+    def test_embeddings_are_used_when_provided(self):
+        """Test provided embeddings replace term vectors."""
+        embeddings = np.array([[1, 0], [0, 1], [1, 0.1], [0.1, 1], [1, 0], [0, 1]], dtype=np.float32)
+
+        segments = plan_topic_segments(CHUNKS, 3000, 1500, embeddings=embeddings.tolist())
+
+        assert [len(segment.chunks) for segment in segments] == [3, 3]
+        assert segments[0].chunks == [CHUNKS[0], CHUNKS[2], CHUNKS[4]]
@@ -262,6 +262,42 @@ class TestDeleteDocumentsWithResponse:
         assert response.metadata["document_count"] == 1
 
 
+class TestGetChunksByIds:
+    """Test batched chunk lookup by ID."""
+
+    def test_get_chunks_by_ids_single_get(self, chroma_store):
+        """Test chunks are fetched with one collection.get call."""
+        mock_collection = MagicMock()
+        mock_collection.get.return_value = {
+            "ids": ["parent1"],
+            "documents": ["Parent text"],
+            "metadatas": [{"source": "pdf", "document_id": "doc1", "parent_chunk_id": "root"}],
+        }
+        chroma_store._client.get_collection.return_value = mock_collection
+
+        chunks = chroma_store.get_chunks_by_ids("test_collection", ["parent1", "missing", "parent1"])
+
+        assert [c.chunk_id for c in chunks] == ["parent1"]
+        assert chunks[0].text == "Parent text"
+        assert chunks[0].parent_chunk_id == "root"
+        mock_collection.get.assert_called_once_with(ids=["parent1", "missing"], include=["documents", "metadatas"])
+
+    def test_add_documents_impl_stores_parent_chunk_id(self, chroma_store):
+        """Test child chunks keep their parent ID in the ChromaDB metadata."""
+        mock_collection = MagicMock()
+        chroma_store._client.get_collection.return_value = mock_collection
+        chunks = [
+            EmbeddedChunk(chunk_id="child", text="Child", embeddings=[0.1] * 768, parent_chunk_id="parent1"),
+            EmbeddedChunk(chunk_id="parent1", text="Parent", embeddings=[0.2] * 768),
+        ]
+
+        chroma_store._add_documents_impl("test_collection", chunks)
+
+        metadatas = mock_collection.upsert.call_args[1]["metadatas"]
+        assert metadatas[0]["parent_chunk_id"] == "parent1"
+        assert "parent_chunk_id" not in metadatas[1]
+
+
 class TestBackwardCompatibility:
     """Test that backward compatibility wrappers work correctly."""
 
@@ -0,0 +1,139 @@
+"""Unit tests for cross-request embedding micro-batching."""
+
+import threading
+from unittest.mock import ANY, Mock, patch
+
+import pytest
+
+from core.config import Settings
+from vectordbs.utils import embeddings
+from vectordbs.utils.embedding_batcher import EmbeddingBatcher
+from vectordbs.utils.embeddings import get_embeddings_for_vector_store, reset_embedding_batchers
+
+
+def _fake_embed(texts: list[str]) -> list[list[float]]:
+    return [[float(len(text))] for text in texts]
+
+
+class _Interrupted(BaseException):
+    """Stands in for cancellation or interpreter shutdown inside the leader."""
+
+
+def _run_concurrently(batcher: EmbeddingBatcher, inputs: list[list[str]]) -> list[object]:
+    results: list[object] = [None] * len(inputs)
+    barrier = threading.Barrier(len(inputs))
+
+    def worker(i: int) -> None:
+        barrier.wait()
+        try:
+            results[i] = batcher.embed(inputs[i])
+        except BaseException as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(inputs))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results
+
+
+@pytest.mark.unit
+class TestEmbeddingBatcher:
+    """Tests for EmbeddingBatcher."""
+
+    def test_single_request(self) -> None:
+        embed_fn = Mock(side_effect=_fake_embed)
+        batcher = EmbeddingBatcher(embed_fn, max_batch_size=8, max_wait_ms=1)
+
+        assert batcher.embed(["abc"]) == [[3.0]]
+        embed_fn.assert_called_once_with(["abc"])
+
+    def test_concurrent_requests_share_one_call(self) -> None:
+        embed_fn = Mock(side_effect=_fake_embed)
+        batcher = EmbeddingBatcher(embed_fn, max_batch_size=4, max_wait_ms=2000)
+
+        results = _run_concurrently(batcher, [["a"], ["bb"], ["ccc"], ["dddd"]])
+
+        # The fourth text fills the batch, so nobody waits for the full window
+        assert embed_fn.call_count == 1
+        assert sorted(embed_fn.call_args[0][0]) == ["a", "bb", "ccc", "dddd"]
+        assert results == [[[1.0]], [[2.0]], [[3.0]], [[4.0]]]
+
+    def test_multi_text_requests_get_their_own_slice(self) -> None:
+        batcher = EmbeddingBatcher(_fake_embed, max_batch_size=4, max_wait_ms=2000)
+
+        results = _run_concurrently(batcher, [["a", "bb"], ["ccc", "dddd"]])
+
+        assert results == [[[1.0], [2.0]], [[3.0], [4.0]]]
+
+    def test_error_is_propagated_to_all_callers(self) -> None:
+        embed_fn = Mock(side_effect=RuntimeError("provider down"))
+        batcher = EmbeddingBatcher(embed_fn, max_batch_size=2, max_wait_ms=2000)
+
+        results = _run_concurrently(batcher, [["a"], ["b"]])
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        embed_fn.assert_called_once()
+
+    def test_interrupted_leader_fails_followers(self) -> None:
+        embed_fn = Mock(side_effect=_Interrupted())
+        batcher = EmbeddingBatcher(embed_fn, max_batch_size=3, max_wait_ms=2000)
+
+        results = _run_concurrently(batcher, [["a"], ["b"], ["c"]])
+
+        assert sum(isinstance(result, _Interrupted) for result in results) == 1
+        assert sum(isinstance(result, RuntimeError) for result in results) == 2
+
+    def test_wrong_number_of_embeddings_raises(self) -> None:
+        batcher = EmbeddingBatcher(Mock(return_value=[[0.0]]), max_batch_size=8, max_wait_ms=1)
+
+        with pytest.raises(ValueError, match="Expected 2 embeddings"):
+            batcher.embed(["a", "b"])
+
+
+@pytest.mark.unit
+class TestBatchedEmbeddingsForVectorStore:
+    """Tests for micro-batching in get_embeddings_for_vector_store."""
+
+    def teardown_method(self) -> None:
+        reset_embedding_batchers()
+
+    @staticmethod
+    def _settings() -> Mock:
+        settings = Mock(spec=Settings)
+        settings.llm_provider_name = "watsonx"
+        settings.embedding_micro_batch_enabled = True
+        settings.embedding_micro_batch_wait_ms = 1.0
+        settings.embedding_batch_size = 3
+        return settings
+
+    def test_query_goes_through_batcher(self) -> None:
+        with patch("vectordbs.utils.embeddings._embed_with_provider", side_effect=lambda text, **_: _fake_embed(text)):
+            result = get_embeddings_for_vector_store("query", self._settings())
+
+        assert result == [[5.0]]
+
+    def test_large_requests_bypass_batcher(self) -> None:
+        with patch("vectordbs.utils.embeddings._embed_with_provider", return_value=[[0.0]] * 3) as embed:
+            get_embeddings_for_vector_store(["a", "b", "c"], self._settings())
+
+        embed.assert_called_once_with(["a", "b", "c"], ANY, "watsonx")
+
+    def test_batchers_are_shared_by_equal_provider_config(self) -> None:
+        first, second = self._settings(), self._settings()
+        other_model = self._settings()
+        other_model.embedding_model = "other-model"
+
+        assert embeddings._get_batcher(first, "watsonx") is embeddings._get_batcher(second, "watsonx")
+        assert embeddings._get_batcher(first, "watsonx") is not embeddings._get_batcher(other_model, "watsonx")
+        assert embeddings._get_batcher(first, "watsonx") is not embeddings._get_batcher(first, "openai")
+
+    def test_batchers_are_bounded(self) -> None:
+        settings = self._settings()
+        first = embeddings._get_batcher(settings, "provider-0")
+        for i in range(1, embeddings.MAX_EMBEDDING_BATCHERS + 1):
+            embeddings._get_batcher(settings, f"provider-{i}")
+
+        assert len(embeddings._batchers) == embeddings.MAX_EMBEDDING_BATCHERS
+        assert embeddings._get_batcher(settings, "provider-0") is not first
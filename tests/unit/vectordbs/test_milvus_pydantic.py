@@ -6,6 +6,7 @@ type safety, validation, and correct integration with Pydantic models.
 
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 from pydantic import ValidationError
 
@@ -169,6 +170,25 @@ class TestSearchImpl:
                 assert isinstance(result, list)
                 mock_collection.search.assert_called_once()
 
+    def test_search_impl_with_ndarray_query_vector(self, milvus_store):
+        """Test search with a float32 ndarray query vector (no truthiness check on arrays)."""
+        query_vector = np.full(768, 0.5, dtype=np.float32)
+        request = VectorSearchRequest(query_vector=query_vector, collection_id="test_collection", top_k=5)
+
+        with patch.object(milvus_store, "_get_collection") as mock_get_collection:
+            mock_collection = MagicMock()
+            mock_get_collection.return_value = mock_collection
+            mock_collection.search.return_value = [[]]
+
+            with patch("backend.vectordbs.milvus_store.get_embeddings_for_vector_store") as mock_embed:
+                with patch.object(milvus_store, "_process_search_results", return_value=[]):
+                    result = milvus_store._search_impl(request)
+
+            assert result == []
+            mock_embed.assert_not_called()
+            searched = mock_collection.search.call_args.kwargs["data"][0]
+            np.testing.assert_array_equal(searched, query_vector)
+
     def test_search_impl_with_query_text(self, milvus_store):
         """Test search with query text (generates embeddings)."""
         request = VectorSearchRequest(
@@ -197,6 +217,24 @@ class TestSearchImpl:
             )
 
 
+class TestProcessSearchResults:
+    """Test conversion of raw Milvus hits."""
+
+    def test_vectors_are_kept_as_float32_arrays(self, milvus_store):
+        """Returned vectors stay float32 ndarrays instead of being copied into Python lists."""
+        entity = MagicMock(document_id="doc-1", text="text", chunk_id="c1", source="OTHER", page_number=1)
+        entity.chunk_number = 0
+        entity.parent_chunk_id = None
+        entity.embedding = [0.25, 0.5]
+        hit = MagicMock(entity=entity, score=0.9)
+
+        results = milvus_store._process_search_results([[hit]], "test_collection", include_vectors=True)
+
+        assert isinstance(results[0].embeddings, np.ndarray)
+        assert results[0].embeddings.dtype == np.float32
+        np.testing.assert_array_equal(results[0].embeddings, [0.25, 0.5])
+
+
 class TestDeleteDocumentsWithResponse:
     """Test delete_documents_with_response returning VectorDBResponse."""
 
@@ -223,6 +261,95 @@ class TestDeleteDocumentsWithResponse:
             assert "Failed to delete documents" in response.error
 
 
+class TestGetChunksByIds:
+    """Test batched chunk lookup by ID."""
+
+    def test_get_chunks_by_ids_single_query(self, milvus_store):
+        """Test chunks are fetched with one deduplicated ``chunk_id in`` query."""
+        with patch.object(milvus_store, "_get_collection") as mock_get_collection:
+            mock_collection = MagicMock()
+            mock_collection.schema.fields = [MagicMock(), MagicMock()]
+            mock_collection.schema.fields[1].name = "parent_chunk_id"
+            mock_collection.query.return_value = [
+                {
+                    "chunk_id": "parent1",
+                    "text": "Parent text",
+                    "document_id": "doc1",
+                    "source": "pdf",
+                    "page_number": 1,
+                    "chunk_number": 0,
+                    "parent_chunk_id": "root",
+                }
+            ]
+            mock_get_collection.return_value = mock_collection
+
+            chunks = milvus_store.get_chunks_by_ids("test_collection", ["parent1", "missing", "parent1"])
+
+            assert [c.chunk_id for c in chunks] == ["parent1"]
+            assert chunks[0].text == "Parent text"
+            assert chunks[0].parent_chunk_id == "root"
+            mock_collection.query.assert_called_once()
+            call_kwargs = mock_collection.query.call_args[1]
+            assert call_kwargs["expr"] == 'chunk_id in ["parent1", "missing"]'
+            assert "parent_chunk_id" in call_kwargs["output_fields"]
+
+    def test_get_chunks_by_ids_empty(self, milvus_store):
+        """Test no query is made for an empty ID list."""
+        with patch.object(milvus_store, "_get_collection") as mock_get_collection:
+            assert milvus_store.get_chunks_by_ids("test_collection", []) == []
+            mock_get_collection.assert_not_called()
+
+    def test_get_chunks_by_ids_error(self, milvus_store):
+        """Test query failures raise DocumentError."""
+        with patch.object(milvus_store, "_get_collection") as mock_get_collection:
+            mock_get_collection.return_value.query.side_effect = Exception("Milvus down")
+
+            with pytest.raises(DocumentError, match="Failed to fetch chunks by ID"):
+                milvus_store.get_chunks_by_ids("test_collection", ["chunk1"])
+
+
+class TestCountChunks:
+    """Test chunk counting is not bounded by a query result limit."""
+
+    def test_count_document_chunks_uses_server_side_count(self, milvus_store):
+        """Test a single document is counted with ``count(*)``."""
+        with patch.object(milvus_store, "_get_collection") as mock_get_collection:
+            mock_collection = mock_get_collection.return_value
+            mock_collection.query.return_value = [{"count(*)": 25000}]
+
+            assert milvus_store.count_document_chunks("test_collection", "doc1") == 25000
+            call_kwargs = mock_collection.query.call_args[1]
+            assert call_kwargs["output_fields"] == ["count(*)"]
+            assert "limit" not in call_kwargs
+
+    def test_count_chunks_by_document_pages_through_iterator(self, milvus_store):
+        """Test several documents are counted in one iterated query."""
+        with patch.object(milvus_store, "_get_collection") as mock_get_collection:
+            iterator = mock_get_collection.return_value.query_iterator.return_value
+            iterator.next.side_effect = [
+                [{"document_id": "doc1"}, {"document_id": "doc2"}],
+                [{"document_id": "doc1"}],
+                [],
+            ]
+
+            counts = milvus_store.count_chunks_by_document("test_collection", ["doc1", "doc2", "doc3"])
+
+            assert counts == {"doc1": 2, "doc2": 1, "doc3": 0}
+            call_kwargs = mock_get_collection.return_value.query_iterator.call_args[1]
+            assert call_kwargs["expr"] == 'document_id in ["doc1", "doc2", "doc3"]'
+            iterator.close.assert_called_once()
+
+    def test_count_chunks_by_document_error(self, milvus_store):
+        """Test iterator failures raise DocumentError and still close the iterator."""
+        with patch.object(milvus_store, "_get_collection") as mock_get_collection:
+            iterator = mock_get_collection.return_value.query_iterator.return_value
+            iterator.next.side_effect = Exception("Milvus down")
+
+            with pytest.raises(DocumentError, match="Failed to count chunks"):
+                milvus_store.count_chunks_by_document("test_collection", ["doc1"])
+            iterator.close.assert_called_once()
+
+
 class TestBackwardCompatibility:
     """Test that backward compatibility wrappers work correctly."""
 
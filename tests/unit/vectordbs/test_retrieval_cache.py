@@ -0,0 +1,124 @@
+"""Unit tests for the in-process retrieval result cache."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from vectordbs.data_types import DocumentChunkWithScore, DocumentMetadataFilter, QueryResult
+from vectordbs.utils.retrieval_cache import RetrievalCache, get_retrieval_cache, reset_retrieval_cache
+
+
+def _result(chunk_id: str, score: float) -> QueryResult:
+    chunk = DocumentChunkWithScore(chunk_id=chunk_id, text=f"text {chunk_id}", document_id="doc-1", score=score)
+    return QueryResult(chunk=chunk, score=score, embeddings=[])
+
+
+@pytest.mark.unit
+class TestRetrievalCache:
+    """Tests for RetrievalCache keys, hits and invalidation."""
+
+    def setup_method(self) -> None:
+        self.cache = RetrievalCache(max_results=2, max_chunks=10, ttl_seconds=0)
+        self.vector = [0.1, 0.2, 0.3]
+
+    def test_roundtrip_preserves_order_and_scores(self) -> None:
+        key = self.cache.make_key("coll", self.vector, top_k=2)
+        self.cache.put(key, "coll", [_result("a", 0.9), _result("b", 0.5)])
+
+        cached = self.cache.get(key, "coll")
+
+        assert cached is not None
+        assert [r.chunk.chunk_id for r in cached] == ["a", "b"]
+        assert [r.score for r in cached] == [0.9, 0.5]
+        assert cached[0].chunk.text == "text a"
+        assert self.cache.hits == 1
+
+    def test_nearly_identical_vectors_share_key(self) -> None:
+        key1 = self.cache.make_key("coll", self.vector, top_k=5)
+        key2 = self.cache.make_key("coll", [0.1 + 1e-6, 0.2, 0.3 - 1e-6], top_k=5)
+        assert key1 == key2
+
+    def test_key_depends_on_top_k_and_filter(self) -> None:
+        base = self.cache.make_key("coll", self.vector, top_k=5)
+        assert base != self.cache.make_key("coll", self.vector, top_k=10)
+        metadata_filter = DocumentMetadataFilter(field_name="document_id", operator="==", value="doc-1")
+        assert base != self.cache.make_key("coll", self.vector, top_k=5, metadata_filter=metadata_filter)
+
+    def test_key_depends_on_include_vectors(self) -> None:
+        without_vectors = self.cache.make_key("coll", self.vector, top_k=5)
+        assert without_vectors != self.cache.make_key("coll", self.vector, top_k=5, include_vectors=True)
+
+    def test_roundtrip_preserves_vectors(self) -> None:
+        key = self.cache.make_key("coll", self.vector, top_k=1, include_vectors=True)
+        result = _result("a", 0.9)
+        result.embeddings = [0.4, 0.5, 0.6]
+        self.cache.put(key, "coll", [result])
+
+        cached = self.cache.get(key, "coll")
+
+        assert cached is not None
+        assert list(cached[0].embeddings) == pytest.approx([0.4, 0.5, 0.6])
+
+    def test_bump_version_invalidates_collection(self) -> None:
+        key = self.cache.make_key("coll", self.vector, top_k=1)
+        self.cache.put(key, "coll", [_result("a", 0.9)])
+
+        self.cache.bump_version("coll")
+
+        assert self.cache.make_key("coll", self.vector, top_k=1) != key
+        assert self.cache.get(key, "coll") is None
+        assert self.cache.get_chunk("coll", "a") is None
+
+    def test_bump_version_does_not_affect_other_collections(self) -> None:
+        key = self.cache.make_key("other", self.vector, top_k=1)
+        self.cache.put(key, "other", [_result("a", 0.9)])
+
+        self.cache.bump_version("coll")
+
+        assert self.cache.get(key, "other") is not None
+
+    def test_result_lru_eviction(self) -> None:
+        keys = [self.cache.make_key("coll", [float(i)], top_k=1) for i in range(3)]
+        for i, key in enumerate(keys):
+            self.cache.put(key, "coll", [_result(str(i), 0.5)])
+
+        assert self.cache.get(keys[0], "coll") is None
+        assert self.cache.get(keys[2], "coll") is not None
+
+    def test_missing_chunk_payload_is_a_miss(self) -> None:
+        cache = RetrievalCache(max_results=10, max_chunks=1, ttl_seconds=0)
+        key = cache.make_key("coll", self.vector, top_k=2)
+        cache.put(key, "coll", [_result("a", 0.9), _result("b", 0.5)])
+
+        assert cache.get(key, "coll") is None
+
+    def test_results_without_chunk_ids_are_not_cached(self) -> None:
+        key = self.cache.make_key("coll", self.vector, top_k=1)
+        self.cache.put(key, "coll", [QueryResult(chunk=None, score=0.1, embeddings=[])])
+        assert self.cache.get(key, "coll") is None
+
+
+@pytest.mark.unit
+class TestGetRetrievalCache:
+    """Tests for the process-wide cache accessor."""
+
+    def teardown_method(self) -> None:
+        reset_retrieval_cache()
+
+    def test_disabled_returns_none(self) -> None:
+        settings = MagicMock()
+        settings.retrieval_cache_enabled = False
+        assert get_retrieval_cache(settings) is None
+
+    def test_enabled_returns_shared_instance(self) -> None:
+        settings = MagicMock()
+        settings.retrieval_cache_enabled = True
+        settings.retrieval_cache_max_results = 8
+        settings.retrieval_cache_max_chunks = 32
+        settings.retrieval_cache_ttl_seconds = 60.0
+
+        cache = get_retrieval_cache(settings)
+
+        assert cache is not None
+        assert cache is get_retrieval_cache(settings)
+        assert cache.max_results == 8
@@ -79,9 +79,8 @@ class TestCreateCollectionImpl:
                 call_args = mock_create.call_args[0][0]
                 assert call_args["class"] == "test_collection"
                 assert call_args["vectorizer"] == "none"
-                assert (
-                    len(call_args["properties"]) == 6
-                )  # text, document_id, chunk_id, source, page_number, chunk_number
+                # text, document_id, chunk_id, source, page_number, chunk_number, parent_chunk_id
+                assert len(call_args["properties"]) == 7
 
     def test_create_collection_impl_already_exists(self, weaviate_store):
         """Test that existing collection returns appropriate status."""